@@ -0,0 +1,169 @@
+"""会議ごとの発言数・発言者数を保持する集計テーブルの作成.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+会議一覧画面は会議ごとに全発言を読み込んで件数を数えていたため、
+会議数に比例してクエリが増えていた。発言の追加・削除・更新時にトリガーで
+集計値を更新するmeeting_conversation_statsテーブルを作成し、
+会議一覧を1クエリで取得できるようにする。
+
+トリガーは文単位（FOR EACH STATEMENT）で遷移テーブルを参照し、
+影響を受けた議事録の会議のみを再集計するため、
+一括INSERT/DELETEでも再集計は会議ごとに1回で済む。
+"""
+
+from alembic import op
+
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Create meeting_conversation_stats and its triggers."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS meeting_conversation_stats (
+            meeting_id INTEGER PRIMARY KEY
+                REFERENCES meetings(id) ON DELETE CASCADE,
+            conversation_count INTEGER NOT NULL DEFAULT 0,
+            speaker_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        COMMENT ON TABLE meeting_conversation_stats IS
+            '会議ごとの発言数・発言者数（conversationsのトリガーで更新）';
+        COMMENT ON COLUMN meeting_conversation_stats.speaker_count IS
+            '発言者が紐付いた発言のユニーク発言者数';
+    """)
+
+    # 指定した議事録が属する会議の集計値を再計算する
+    op.execute("""
+        CREATE OR REPLACE FUNCTION refresh_meeting_conversation_stats(
+            target_minutes_ids INTEGER[]
+        )
+        RETURNS VOID AS $$
+        BEGIN
+            INSERT INTO meeting_conversation_stats AS s (
+                meeting_id, conversation_count, speaker_count, updated_at
+            )
+            SELECT
+                mi.meeting_id,
+                COUNT(c.id),
+                COUNT(DISTINCT c.speaker_id),
+                CURRENT_TIMESTAMP
+            FROM minutes mi
+            LEFT JOIN conversations c ON c.minutes_id = mi.id
+            WHERE mi.meeting_id IN (
+                SELECT meeting_id FROM minutes WHERE id = ANY(target_minutes_ids)
+            )
+            GROUP BY mi.meeting_id
+            ON CONFLICT (meeting_id) DO UPDATE SET
+                conversation_count = EXCLUDED.conversation_count,
+                speaker_count = EXCLUDED.speaker_count,
+                updated_at = EXCLUDED.updated_at;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION conversations_after_insert_stats()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM refresh_meeting_conversation_stats(ARRAY(
+                SELECT DISTINCT minutes_id FROM new_rows
+                WHERE minutes_id IS NOT NULL
+            ));
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION conversations_after_delete_stats()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM refresh_meeting_conversation_stats(ARRAY(
+                SELECT DISTINCT minutes_id FROM old_rows
+                WHERE minutes_id IS NOT NULL
+            ));
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION conversations_after_update_stats()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM refresh_meeting_conversation_stats(ARRAY(
+                SELECT DISTINCT o.minutes_id
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE o.minutes_id IS DISTINCT FROM n.minutes_id
+                   OR o.speaker_id IS DISTINCT FROM n.speaker_id
+                UNION
+                SELECT DISTINCT n.minutes_id
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE o.minutes_id IS DISTINCT FROM n.minutes_id
+                   OR o.speaker_id IS DISTINCT FROM n.speaker_id
+            ));
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        DROP TRIGGER IF EXISTS trigger_conversations_insert_stats ON conversations;
+        CREATE TRIGGER trigger_conversations_insert_stats
+            AFTER INSERT ON conversations
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION conversations_after_insert_stats();
+
+        DROP TRIGGER IF EXISTS trigger_conversations_delete_stats ON conversations;
+        CREATE TRIGGER trigger_conversations_delete_stats
+            AFTER DELETE ON conversations
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION conversations_after_delete_stats();
+
+        DROP TRIGGER IF EXISTS trigger_conversations_update_stats ON conversations;
+        CREATE TRIGGER trigger_conversations_update_stats
+            AFTER UPDATE ON conversations
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION conversations_after_update_stats();
+    """)
+
+    # 既存データから集計値を初期化
+    op.execute("""
+        INSERT INTO meeting_conversation_stats (
+            meeting_id, conversation_count, speaker_count
+        )
+        SELECT
+            mi.meeting_id,
+            COUNT(c.id),
+            COUNT(DISTINCT c.speaker_id)
+        FROM minutes mi
+        LEFT JOIN conversations c ON c.minutes_id = mi.id
+        GROUP BY mi.meeting_id
+        ON CONFLICT (meeting_id) DO UPDATE SET
+            conversation_count = EXCLUDED.conversation_count,
+            speaker_count = EXCLUDED.speaker_count,
+            updated_at = CURRENT_TIMESTAMP;
+    """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Drop meeting_conversation_stats and its triggers."""
+    op.execute("""
+        DROP TRIGGER IF EXISTS trigger_conversations_insert_stats ON conversations;
+        DROP TRIGGER IF EXISTS trigger_conversations_delete_stats ON conversations;
+        DROP TRIGGER IF EXISTS trigger_conversations_update_stats ON conversations;
+        DROP FUNCTION IF EXISTS conversations_after_insert_stats();
+        DROP FUNCTION IF EXISTS conversations_after_delete_stats();
+        DROP FUNCTION IF EXISTS conversations_after_update_stats();
+        DROP FUNCTION IF EXISTS refresh_meeting_conversation_stats(INTEGER[]);
+        DROP TABLE IF EXISTS meeting_conversation_stats;
+    """)
@@ -0,0 +1,132 @@
+"""モニタリング用メトリクススナップショットと行数カウンタの作成.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+モニタリングダッシュボードは表示のたびにconversations・speakers・politicians・
+meetingsを全件スキャンするCOUNT(*)/COUNT(DISTINCT ...)を実行していた。
+以下の2つを追加し、対話的な表示では大きなテーブルをスキャンしないようにする。
+
+- metrics_snapshots: 定期的に計算したメトリクスをJSONで保持するテーブル。
+  `sagebase refresh-metrics` で再計算し、computed_atで鮮度を判定する。
+- table_row_counts: 大きなテーブルの行数をトリガーで差分更新するカウンタ。
+  文単位（FOR EACH STATEMENT）のトリガーで遷移テーブルの行数だけ加減算する。
+"""
+
+from alembic import op
+
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+COUNTED_TABLES = ("conversations", "speakers", "politicians", "meetings")
+
+
+def upgrade() -> None:
+    """Apply migration: Create metrics_snapshots and table_row_counts."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS metrics_snapshots (
+            metric_key VARCHAR(100) PRIMARY KEY,
+            payload TEXT NOT NULL,
+            computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+
+        COMMENT ON TABLE metrics_snapshots IS
+            '定期的に計算したモニタリング用メトリクス（refresh-metricsで更新）';
+        COMMENT ON COLUMN metrics_snapshots.payload IS 'メトリクスのJSON';
+        COMMENT ON COLUMN metrics_snapshots.computed_at IS 'メトリクスの計算日時';
+
+        CREATE TABLE IF NOT EXISTS table_row_counts (
+            table_name VARCHAR(100) PRIMARY KEY,
+            row_count BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        COMMENT ON TABLE table_row_counts IS
+            '大きなテーブルの行数（各テーブルのトリガーで差分更新）';
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION table_row_counts_after_insert()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE table_row_counts
+            SET row_count = row_count + (SELECT COUNT(*) FROM new_rows),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION table_row_counts_after_delete()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE table_row_counts
+            SET row_count = row_count - (SELECT COUNT(*) FROM old_rows),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION table_row_counts_after_truncate()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE table_row_counts
+            SET row_count = 0,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for table in COUNTED_TABLES:
+        op.execute(f"""
+            DROP TRIGGER IF EXISTS trigger_{table}_insert_row_count ON {table};
+            CREATE TRIGGER trigger_{table}_insert_row_count
+                AFTER INSERT ON {table}
+                REFERENCING NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION table_row_counts_after_insert();
+
+            DROP TRIGGER IF EXISTS trigger_{table}_delete_row_count ON {table};
+            CREATE TRIGGER trigger_{table}_delete_row_count
+                AFTER DELETE ON {table}
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION table_row_counts_after_delete();
+
+            DROP TRIGGER IF EXISTS trigger_{table}_truncate_row_count ON {table};
+            CREATE TRIGGER trigger_{table}_truncate_row_count
+                AFTER TRUNCATE ON {table}
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION table_row_counts_after_truncate();
+
+            INSERT INTO table_row_counts (table_name, row_count)
+            SELECT '{table}', COUNT(*) FROM {table}
+            ON CONFLICT (table_name) DO UPDATE SET
+                row_count = EXCLUDED.row_count,
+                updated_at = CURRENT_TIMESTAMP;
+        """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Drop metrics_snapshots and table_row_counts."""
+    for table in COUNTED_TABLES:
+        op.execute(f"""
+            DROP TRIGGER IF EXISTS trigger_{table}_insert_row_count ON {table};
+            DROP TRIGGER IF EXISTS trigger_{table}_delete_row_count ON {table};
+            DROP TRIGGER IF EXISTS trigger_{table}_truncate_row_count ON {table};
+        """)
+
+    op.execute("""
+        DROP FUNCTION IF EXISTS table_row_counts_after_insert();
+        DROP FUNCTION IF EXISTS table_row_counts_after_delete();
+        DROP FUNCTION IF EXISTS table_row_counts_after_truncate();
+        DROP TABLE IF EXISTS table_row_counts;
+        DROP TABLE IF EXISTS metrics_snapshots;
+    """)
@@ -0,0 +1,36 @@
+"""Add attendee_boundary to minutes table.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+出席者部分と発言部分の境界検出結果を議事録にキャッシュし、
+役職-人名マッピング抽出と発言抽出で境界検出を1回にまとめる。
+"""
+
+from alembic import op
+
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add attendee_boundary column to minutes."""
+    op.execute("""
+        ALTER TABLE minutes
+        ADD COLUMN IF NOT EXISTS attendee_boundary JSONB;
+
+        COMMENT ON COLUMN minutes.attendee_boundary
+            IS '出席者/発言境界の検出結果（テキストハッシュ・境界位置・検出方法）';
+    """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Remove attendee_boundary column from minutes."""
+    op.execute("""
+        ALTER TABLE minutes
+        DROP COLUMN IF EXISTS attendee_boundary;
+    """)
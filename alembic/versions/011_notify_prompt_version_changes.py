@@ -0,0 +1,47 @@
+"""Notify prompt_versions changes for cross-process cache invalidation.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+prompt_versionsの変更時にprompt_versions_changedチャンネルへNOTIFYし、
+各プロセスのプロンプトキャッシュ（PromptRegistry）を無効化する。
+"""
+
+from alembic import op
+
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Apply migration: Add NOTIFY trigger to prompt_versions."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_prompt_versions_changed()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('prompt_versions_changed', OLD.prompt_key);
+            ELSE
+                PERFORM pg_notify('prompt_versions_changed', NEW.prompt_key);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS prompt_versions_changed ON prompt_versions;
+        CREATE TRIGGER prompt_versions_changed
+            AFTER INSERT OR UPDATE OR DELETE ON prompt_versions
+            FOR EACH ROW EXECUTE FUNCTION notify_prompt_versions_changed();
+    """)
+
+
+def downgrade() -> None:
+    """Rollback migration: Remove NOTIFY trigger from prompt_versions."""
+    op.execute("""
+        DROP TRIGGER IF EXISTS prompt_versions_changed ON prompt_versions;
+        DROP FUNCTION IF EXISTS notify_prompt_versions_changed();
+    """)
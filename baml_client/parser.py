@@ -90,6 +90,12 @@ class LlmResponseParser:
         __result__ = self.__options.merge_options(baml_options).parse_response(function_name="MatchPolitician", llm_response=llm_response, mode="request")
         return typing.cast(types.PoliticianMatch, __result__)
 
+    def MatchPoliticiansBatch(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.BatchPoliticianMatch"]:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="MatchPoliticiansBatch", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List["types.BatchPoliticianMatch"], __result__)
+
     def NormalizeSpeakerNames(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> typing.List["types.NormalizedSpeaker"]:
@@ -176,6 +182,12 @@ class LlmStreamParser:
         __result__ = self.__options.merge_options(baml_options).parse_response(function_name="MatchPolitician", llm_response=llm_response, mode="stream")
         return typing.cast(stream_types.PoliticianMatch, __result__)
 
+    def MatchPoliticiansBatch(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["stream_types.BatchPoliticianMatch"]:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="MatchPoliticiansBatch", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List["stream_types.BatchPoliticianMatch"], __result__)
+
     def NormalizeSpeakerNames(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> typing.List["stream_types.NormalizedSpeaker"]:
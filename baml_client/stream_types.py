@@ -23,7 +23,7 @@ class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
     value: StreamStateValueT
     state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
 # #########################################################################
-# Generated classes (15)
+# Generated classes (17)
 # #########################################################################
 
 class AttendeesMapping(BaseModel):
@@ -31,6 +31,15 @@ class AttendeesMapping(BaseModel):
     regular_attendees: typing.List[str] = Field(description='出席者の人名リスト')
     confidence: typing.Optional[float] = Field(default=None, description='抽出の信頼度（0.0-1.0）')
 
+class BatchPoliticianMatch(BaseModel):
+    key: typing.Optional[str] = Field(default=None, description='入力のSpeakerToMatch.keyをそのまま返す')
+    matched: typing.Optional[bool] = Field(default=None, description='マッチングが成功したか')
+    politician_id: typing.Optional[int] = Field(default=None, description='マッチした政治家のID（マッチしない場合はnull）')
+    politician_name: typing.Optional[str] = Field(default=None, description='マッチした政治家の名前（マッチしない場合はnull）')
+    political_party_name: typing.Optional[str] = Field(default=None, description='所属政党名（マッチしない場合はnull）')
+    confidence: typing.Optional[float] = Field(default=None, description='マッチングの信頼度（0.0-1.0）')
+    reason: typing.Optional[str] = Field(default=None, description='マッチング判定の理由')
+
 class ExtractedMember(BaseModel):
     name: typing.Optional[str] = Field(default=None, description='議員名（フルネーム）')
     role: typing.Optional[str] = Field(default=None, description='役職（議長、副議長、委員長、委員など）')
@@ -115,6 +124,12 @@ class SpeakerAndSpeechContent(BaseModel):
     sub_chapter_number: typing.Optional[int] = Field(default=None, description='再分割した場合の文字列番号')
     speech_order: typing.Optional[int] = Field(default=None, description='発言順')
 
+class SpeakerToMatch(BaseModel):
+    key: typing.Optional[str] = Field(default=None, description='結果と対応付けるための識別子')
+    speaker_name: typing.Optional[str] = Field(default=None, description='発言者名')
+    speaker_type: typing.Optional[str] = Field(default=None, description='発言者の種別')
+    speaker_party: typing.Optional[str] = Field(default=None, description='発言者の所属政党')
+
 # #########################################################################
 # Generated type aliases (0)
 # #########################################################################
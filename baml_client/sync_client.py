@@ -248,6 +248,20 @@ class BamlSyncClient:
                 "speaker_name": speaker_name,"speaker_type": speaker_type,"speaker_party": speaker_party,"available_politicians": available_politicians,
             })
             return typing.cast(types.PoliticianMatch, __result__.cast_to(types, types, stream_types, False, __runtime__))
+    def MatchPoliticiansBatch(self, speakers: typing.List["types.SpeakerToMatch"],available_politicians: str,
+        baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.BatchPoliticianMatch"]:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            __stream__ = self.stream.MatchPoliticiansBatch(speakers=speakers,available_politicians=available_politicians,
+                baml_options=baml_options)
+            return __stream__.get_final_response()
+        else:
+            # Original non-streaming code
+            __result__ = self.__options.merge_options(baml_options).call_function_sync(function_name="MatchPoliticiansBatch", args={
+                "speakers": speakers,"available_politicians": available_politicians,
+            })
+            return typing.cast(typing.List["types.BatchPoliticianMatch"], __result__.cast_to(types, types, stream_types, False, __runtime__))
     def NormalizeSpeakerNames(self, speakers: typing.List[str],role_name_mappings: typing.Optional[typing.Dict[str, str]] = None,
         baml_options: BamlCallOptions = {},
     ) -> typing.List["types.NormalizedSpeaker"]:
@@ -417,6 +431,18 @@ class BamlStreamClient:
           lambda x: typing.cast(types.PoliticianMatch, x.cast_to(types, types, stream_types, False, __runtime__)),
           __ctx__,
         )
+    def MatchPoliticiansBatch(self, speakers: typing.List["types.SpeakerToMatch"],available_politicians: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[typing.List["stream_types.BatchPoliticianMatch"], typing.List["types.BatchPoliticianMatch"]]:
+        __ctx__, __result__ = self.__options.merge_options(baml_options).create_sync_stream(function_name="MatchPoliticiansBatch", args={
+            "speakers": speakers,"available_politicians": available_politicians,
+        })
+        return baml_py.BamlSyncStream[typing.List["stream_types.BatchPoliticianMatch"], typing.List["types.BatchPoliticianMatch"]](
+          __result__,
+          lambda x: typing.cast(typing.List["stream_types.BatchPoliticianMatch"], x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(typing.List["types.BatchPoliticianMatch"], x.cast_to(types, types, stream_types, False, __runtime__)),
+          __ctx__,
+        )
     def NormalizeSpeakerNames(self, speakers: typing.List[str],role_name_mappings: typing.Optional[typing.Dict[str, str]] = None,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[typing.List["stream_types.NormalizedSpeaker"], typing.List["types.NormalizedSpeaker"]]:
@@ -526,6 +552,13 @@ class BamlHttpRequestClient:
             "speaker_name": speaker_name,"speaker_type": speaker_type,"speaker_party": speaker_party,"available_politicians": available_politicians,
         }, mode="request")
         return __result__
+    def MatchPoliticiansBatch(self, speakers: typing.List["types.SpeakerToMatch"],available_politicians: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        __result__ = self.__options.merge_options(baml_options).create_http_request_sync(function_name="MatchPoliticiansBatch", args={
+            "speakers": speakers,"available_politicians": available_politicians,
+        }, mode="request")
+        return __result__
     def NormalizeSpeakerNames(self, speakers: typing.List[str],role_name_mappings: typing.Optional[typing.Dict[str, str]] = None,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -625,6 +658,13 @@ class BamlHttpStreamRequestClient:
             "speaker_name": speaker_name,"speaker_type": speaker_type,"speaker_party": speaker_party,"available_politicians": available_politicians,
         }, mode="stream")
         return __result__
+    def MatchPoliticiansBatch(self, speakers: typing.List["types.SpeakerToMatch"],available_politicians: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        __result__ = self.__options.merge_options(baml_options).create_http_request_sync(function_name="MatchPoliticiansBatch", args={
+            "speakers": speakers,"available_politicians": available_politicians,
+        }, mode="stream")
+        return __result__
     def NormalizeSpeakerNames(self, speakers: typing.List[str],role_name_mappings: typing.Optional[typing.Dict[str, str]] = None,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
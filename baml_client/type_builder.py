@@ -20,7 +20,7 @@ from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIM
 class TypeBuilder(type_builder.TypeBuilder):
     def __init__(self):
         super().__init__(classes=set(
-          ["AttendeesMapping","ExtractedMember","LinkClassification","MinutesBoundary","NormalizedSpeaker","PageClassification","ParliamentaryGroupMember","PoliticianMatch","RedividedSectionInfo","Resume","RoleNameMapping","RoleNameMappingResult","SectionInfo","SectionString","SpeakerAndSpeechContent",]
+          ["AttendeesMapping","BatchPoliticianMatch","ExtractedMember","LinkClassification","MinutesBoundary","NormalizedSpeaker","PageClassification","ParliamentaryGroupMember","PoliticianMatch","RedividedSectionInfo","Resume","RoleNameMapping","RoleNameMappingResult","SectionInfo","SectionString","SpeakerAndSpeechContent","SpeakerToMatch",]
         ), enums=set(
           []
         ), runtime=DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME)
@@ -31,13 +31,17 @@ class TypeBuilder(type_builder.TypeBuilder):
 
 
     # #########################################################################
-    # Generated classes 15
+    # Generated classes 17
     # #########################################################################
 
     @property
     def AttendeesMapping(self) -> "AttendeesMappingViewer":
         return AttendeesMappingViewer(self)
 
+    @property
+    def BatchPoliticianMatch(self) -> "BatchPoliticianMatchViewer":
+        return BatchPoliticianMatchViewer(self)
+
     @property
     def ExtractedMember(self) -> "ExtractedMemberViewer":
         return ExtractedMemberViewer(self)
@@ -94,6 +98,10 @@ class TypeBuilder(type_builder.TypeBuilder):
     def SpeakerAndSpeechContent(self) -> "SpeakerAndSpeechContentViewer":
         return SpeakerAndSpeechContentViewer(self)
 
+    @property
+    def SpeakerToMatch(self) -> "SpeakerToMatchViewer":
+        return SpeakerToMatchViewer(self)
+
 
 
 # #########################################################################
@@ -102,7 +110,7 @@ class TypeBuilder(type_builder.TypeBuilder):
 
 
 # #########################################################################
-# Generated classes 15
+# Generated classes 17
 # #########################################################################
 
 class AttendeesMappingAst:
@@ -152,6 +160,69 @@ class AttendeesMappingProperties:
 
 
 
+class BatchPoliticianMatchAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("BatchPoliticianMatch")
+        self._properties: typing.Set[str] = set([  "key",  "matched",  "politician_id",  "politician_name",  "political_party_name",  "confidence",  "reason",  ])
+        self._props = BatchPoliticianMatchProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "BatchPoliticianMatchProperties":
+        return self._props
+
+
+class BatchPoliticianMatchViewer(BatchPoliticianMatchAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+
+
+
+class BatchPoliticianMatchProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+
+
+    @property
+    def key(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("key"))
+
+    @property
+    def matched(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("matched"))
+
+    @property
+    def politician_id(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("politician_id"))
+
+    @property
+    def politician_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("politician_name"))
+
+    @property
+    def political_party_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("political_party_name"))
+
+    @property
+    def confidence(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("confidence"))
+
+    @property
+    def reason(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("reason"))
+
+
+
+
 class ExtractedMemberAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
@@ -862,3 +933,54 @@ class SpeakerAndSpeechContentProperties:
     @property
     def speech_order(self) -> type_builder.ClassPropertyViewer:
         return type_builder.ClassPropertyViewer(self.__bldr.property("speech_order"))
+
+
+
+
+class SpeakerToMatchAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("SpeakerToMatch")
+        self._properties: typing.Set[str] = set([  "key",  "speaker_name",  "speaker_type",  "speaker_party",  ])
+        self._props = SpeakerToMatchProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "SpeakerToMatchProperties":
+        return self._props
+
+
+class SpeakerToMatchViewer(SpeakerToMatchAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+
+
+
+class SpeakerToMatchProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+
+
+    @property
+    def key(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("key"))
+
+    @property
+    def speaker_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("speaker_name"))
+
+    @property
+    def speaker_type(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("speaker_type"))
+
+    @property
+    def speaker_party(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("speaker_party"))
@@ -19,6 +19,9 @@ type_map = {
     "types.AttendeesMapping": types.AttendeesMapping,
     "stream_types.AttendeesMapping": stream_types.AttendeesMapping,
 
+    "types.BatchPoliticianMatch": types.BatchPoliticianMatch,
+    "stream_types.BatchPoliticianMatch": stream_types.BatchPoliticianMatch,
+
     "types.ExtractedMember": types.ExtractedMember,
     "stream_types.ExtractedMember": stream_types.ExtractedMember,
 
@@ -61,5 +64,8 @@ type_map = {
     "types.SpeakerAndSpeechContent": types.SpeakerAndSpeechContent,
     "stream_types.SpeakerAndSpeechContent": stream_types.SpeakerAndSpeechContent,
 
+    "types.SpeakerToMatch": types.SpeakerToMatch,
+    "stream_types.SpeakerToMatch": stream_types.SpeakerToMatch,
+
 
 }
@@ -41,7 +41,7 @@ def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
 # #########################################################################
 
 # #########################################################################
-# Generated classes (15)
+# Generated classes (17)
 # #########################################################################
 
 class AttendeesMapping(BaseModel):
@@ -49,6 +49,15 @@ class AttendeesMapping(BaseModel):
     regular_attendees: typing.List[str] = Field(description='出席者の人名リスト')
     confidence: float = Field(description='抽出の信頼度（0.0-1.0）')
 
+class BatchPoliticianMatch(BaseModel):
+    key: str = Field(description='入力のSpeakerToMatch.keyをそのまま返す')
+    matched: bool = Field(description='マッチングが成功したか')
+    politician_id: typing.Optional[int] = Field(default=None, description='マッチした政治家のID（マッチしない場合はnull）')
+    politician_name: typing.Optional[str] = Field(default=None, description='マッチした政治家の名前（マッチしない場合はnull）')
+    political_party_name: typing.Optional[str] = Field(default=None, description='所属政党名（マッチしない場合はnull）')
+    confidence: float = Field(description='マッチングの信頼度（0.0-1.0）')
+    reason: str = Field(description='マッチング判定の理由')
+
 class ExtractedMember(BaseModel):
     name: str = Field(description='議員名（フルネーム）')
     role: typing.Optional[str] = Field(default=None, description='役職（議長、副議長、委員長、委員など）')
@@ -133,6 +142,12 @@ class SpeakerAndSpeechContent(BaseModel):
     sub_chapter_number: int = Field(description='再分割した場合の文字列番号')
     speech_order: int = Field(description='発言順')
 
+class SpeakerToMatch(BaseModel):
+    key: str = Field(description='結果と対応付けるための識別子')
+    speaker_name: str = Field(description='発言者名')
+    speaker_type: str = Field(description='発言者の種別')
+    speaker_party: str = Field(description='発言者の所属政党')
+
 # #########################################################################
 # Generated type aliases (0)
 # #########################################################################
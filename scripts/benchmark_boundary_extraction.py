@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""発言境界抽出のLLM呼び出し回数のベンチマークスクリプト.
+
+SpeechBoundaryExtractorで議事録ごとの境界を抽出し、LLM（DetectBoundary）の
+呼び出し回数を数えます。LLMは呼び出し回数を数えるだけのスタブに置き換えるため、
+APIキーやネットワークは不要です。
+
+比較対象の従来方式（ReActエージェント）は、システムプロンプトの推奨手順
+（validate_boundary_candidate → analyze_context → verify_boundary → 回答）を
+境界候補1件について1回たどる場合でも、ツール選択と回答にチャット呼び出しが4回、
+validate_boundary_candidateとverify_boundary内のDetectBoundaryが1〜2回かかります。
+実際にはLLMが候補ごとに手順を繰り返すため、これは下限です。
+
+使い方:
+    # 評価データセットと合成した議事録で計測
+    uv run python scripts/benchmark_boundary_extraction.py
+
+    # 議事録のテキストファイルを指定
+    uv run python scripts/benchmark_boundary_extraction.py path/to/minutes.txt ...
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import structlog
+
+
+# プロジェクトのルートディレクトリをPythonパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.external.minutes_divider.speech_boundary_extractor import (  # noqa: E402
+    SpeechBoundaryExtractor,
+)
+from src.minutes_divide_processor.models import MinutesBoundary  # noqa: E402
+
+
+DATASET_DIR = project_root / "data" / "evaluation" / "datasets" / "minutes_division"
+
+# 従来方式の境界候補1件あたりの呼び出し回数（推奨手順をたどる場合の下限）
+REACT_CHAT_CALLS = 4
+REACT_BAML_CALLS = (1, 2)
+
+_ATTENDEES = (
+    "令和5年第1回定例会会議録（第1日）\n"
+    "○出席議員（3名）\n1番 山田太郎君\n2番 鈴木花子君\n3番 佐藤一郎君\n"
+    "○説明のため出席した者\n市長 田中次郎君\n"
+)
+_SPEECHES = (
+    "○議長（山田太郎君） ただいまから本日の会議を開きます。\n"
+    "◆3番（佐藤一郎議員） 質問します。\n"
+    "○市長（田中次郎君） お答えします。\n"
+)
+
+
+def synthesized_minutes() -> dict[str, str]:
+    """境界の表記が異なる議事録を合成する."""
+    return {
+        "合成: 見出し+区切り線+開議時刻": (
+            _ATTENDEES + "――――――――――\n午前10時開議\n" + _SPEECHES
+        ),
+        "合成: 見出し+区切り線": _ATTENDEES + "――――――――――\n" + _SPEECHES,
+        "合成: 見出し+発言": _ATTENDEES + _SPEECHES,
+        "合成: 表題+発言": "本会議\n" + _SPEECHES,
+        "合成: 見出しのない長い前置き": "議事の経過について記録する。" * 20 + _SPEECHES,
+        "合成: 発言者表記なし": "本日の会議は中止となりました。",
+    }
+
+
+def load_minutes(paths: list[str]) -> dict[str, str]:
+    """指定されたファイル、または評価データセットと合成した議事録を読み込む."""
+    if paths:
+        return {path: Path(path).read_text(encoding="utf-8") for path in paths}
+
+    minutes: dict[str, str] = {}
+    for path in sorted(DATASET_DIR.glob("*.json")):
+        dataset = json.loads(path.read_text(encoding="utf-8"))
+        for test_case in dataset["test_cases"]:
+            minutes[f"{path.stem}/{test_case['id']}"] = test_case["input"]["text"]
+    minutes.update(synthesized_minutes())
+    return minutes
+
+
+async def count_llm_calls(minutes_text: str) -> tuple[int, str]:
+    """1件の議事録の境界抽出でのLLM呼び出し回数と採用された境界の種類を返す."""
+    divider = MagicMock()
+    divider.detect_attendee_boundary = AsyncMock(
+        return_value=MinutesBoundary(boundary_found=False, confidence=0.0)
+    )
+    result = await SpeechBoundaryExtractor(divider).extract_boundaries(minutes_text)
+    boundaries = result["verified_boundaries"]
+    boundary_type = boundaries[0]["boundary_type"] if boundaries else "none"
+    return divider.detect_attendee_boundary.await_count, boundary_type
+
+
+async def run(paths: list[str]) -> None:
+    """議事録ごとのLLM呼び出し回数を表示する."""
+    minutes = load_minutes(paths)
+    low, high = (REACT_CHAT_CALLS + calls for calls in REACT_BAML_CALLS)
+
+    print(f"{'議事録':<36} {'境界':<15} {'従来(下限)':>10} {'新方式':>6}")
+    total = 0
+    for name, text in minutes.items():
+        calls, boundary_type = await count_llm_calls(text)
+        total += calls
+        print(f"{name:<36} {boundary_type:<15} {f'{low}〜{high}':>10} {calls:>6}")
+
+    print(
+        f"\n議事録{len(minutes)}件: 従来 {low * len(minutes)}〜{high * len(minutes)}回"
+        f"以上 → 新方式 {total}回"
+        f"（1件あたり {total / len(minutes):.2f}回）"
+    )
+
+
+def main() -> None:
+    """メイン実行関数."""
+    parser = argparse.ArgumentParser(description="発言境界抽出のLLM呼び出し回数")
+    parser.add_argument("paths", nargs="*", help="議事録のテキストファイル")
+    args = parser.parse_args()
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    asyncio.run(run(args.paths))
+
+
+if __name__ == "__main__":
+    main()
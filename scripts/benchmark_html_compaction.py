@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""議員名簿HTMLの圧縮によるトークン削減率のベンチマークスクリプト.
+
+保存した議会ページをHtmlCompactorで圧縮し、LLMに渡す入力の見積もりトークン数を
+従来の入力と比較します。トークン数はレートリミッターと同じestimate_tokens()で
+見積もるため、APIキーやネットワークは不要です。
+
+- 従来（会議体）: 生のHTMLを50,000文字で切り詰めてExtractMembersに渡す
+- 従来（議員団）: テキスト5,000文字とHTML10,000文字を
+  ExtractParliamentaryGroupMembersに渡す
+- 新方式: 圧縮後のテキスト（長い場合は行単位のチャンクの合計）
+
+使い方:
+    # テスト用に保存した議会ページで計測
+    uv run python scripts/benchmark_html_compaction.py
+
+    # 保存したHTMLファイルを指定
+    uv run python scripts/benchmark_html_compaction.py path/to/page.html ...
+"""
+
+import argparse
+import sys
+
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+
+# プロジェクトのルートディレクトリをPythonパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.external.html_compactor import HtmlCompactor  # noqa: E402
+from src.infrastructure.resilience.rate_limiter import estimate_tokens  # noqa: E402
+
+
+FIXTURE_DIR = project_root / "tests" / "fixtures" / "council_pages"
+
+# 従来の切り詰め長
+LEGACY_MEMBER_HTML_LENGTH = 50000
+LEGACY_GROUP_TEXT_LENGTH = 5000
+LEGACY_GROUP_HTML_LENGTH = 10000
+
+
+def legacy_member_input(html: str) -> str:
+    """従来の会議体メンバー抽出でLLMに渡していた入力."""
+    return html[:LEGACY_MEMBER_HTML_LENGTH]
+
+
+def legacy_group_input(html: str) -> tuple[str, str]:
+    """従来の議員団メンバー抽出でLLMに渡していた（テキスト, HTML）."""
+    soup = BeautifulSoup(html, "html.parser")
+    for script in soup(["script", "style"]):
+        script.decompose()
+    lines = (line.strip() for line in soup.get_text().splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = "\n".join(chunk for chunk in chunks if chunk)
+    return text[:LEGACY_GROUP_TEXT_LENGTH], str(soup)[:LEGACY_GROUP_HTML_LENGTH]
+
+
+def main() -> None:
+    """メイン実行関数."""
+    parser = argparse.ArgumentParser(description="議員名簿HTMLのトークン削減率")
+    parser.add_argument("paths", nargs="*", help="保存したHTMLファイル")
+    args = parser.parse_args()
+
+    paths = [Path(path) for path in args.paths] or sorted(FIXTURE_DIR.glob("*.html"))
+    compactor = HtmlCompactor()
+
+    print(
+        f"{'ページ':<28} {'HTML':>8} {'会議体(従来)':>12} {'議員団(従来)':>12} "
+        f"{'圧縮後':>8} {'チャンク':>8}"
+    )
+    total_member = total_group = total_compact = 0
+    for path in paths:
+        html = path.read_text(encoding="utf-8")
+        member_tokens = estimate_tokens(legacy_member_input(html))
+        group_tokens = estimate_tokens(*legacy_group_input(html))
+        chunks = compactor.split(html)
+        compact_tokens = estimate_tokens(*chunks)
+
+        total_member += member_tokens
+        total_group += group_tokens
+        total_compact += compact_tokens
+        print(
+            f"{path.name:<28} {estimate_tokens(html):>8} {member_tokens:>12} "
+            f"{group_tokens:>12} {compact_tokens:>8} {len(chunks):>8}"
+        )
+
+    if not paths or not total_member or not total_group:
+        return
+    print(
+        f"\nページ{len(paths)}件の見積もりトークン数: "
+        f"会議体 {total_member} → {total_compact}"
+        f"（{(1 - total_compact / total_member) * 100:.1f}%削減）、"
+        f"議員団 {total_group} → {total_compact}"
+        f"（{(1 - total_compact / total_group) * 100:.1f}%削減）"
+    )
+
+
+if __name__ == "__main__":
+    main()
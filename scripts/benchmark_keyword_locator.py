@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""do_divideのキーワード検索のベンチマークスクリプト.
+
+キーワードごとにstr.findで議事録全体を走査する従来の方式と、
+KeywordLocator（Aho–Corasick法）で全キーワードを1回で検索する方式の処理時間を比較します。
+
+使い方:
+    # 議事録のテキストファイルを指定（最も長い議事録での計測を推奨）
+    uv run python scripts/benchmark_keyword_locator.py path/to/minutes.txt
+
+    # ファイルを指定しない場合は、合成した長い議事録で計測
+    uv run python scripts/benchmark_keyword_locator.py --speeches 5000
+
+キーワードは議事録中の発言者表記（○議長(山田太郎君)など）から作成し、
+--missing-ratioの割合で議事録に存在しないキーワードに置き換えます
+（LLMが議事録にないキーワードを返した場合の最悪ケース）。
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+
+# プロジェクトのルートディレクトリをPythonパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.external.minutes_divider.keyword_locator import (  # noqa: E402
+    KeywordLocator,
+    normalize_keyword_text,
+    normalize_with_offsets,
+)
+
+
+SPEAKER_PATTERN = re.compile(r"[○◆◎●][^○◆◎●()（）]{1,20}[(（][^()（）]{1,20}[)）]")
+
+
+def synthesize_minutes(speeches: int) -> str:
+    """発言者表記付きの長い議事録を合成する."""
+    rng = random.Random(0)
+    roles = ["議長", "市長", "副市長", "教育長", "部長"]
+    parts: list[str] = []
+    for index in range(speeches):
+        if index % 2:
+            speaker = f"◆{index}番(議員{index}君)"
+        else:
+            speaker = f"○{rng.choice(roles)}(説明員{index}君)"
+        parts.append(
+            speaker + "ただいまの件について申し上げます。" * rng.randint(3, 30)
+        )
+    return "".join(parts)
+
+
+def build_keywords(minutes: str, missing_ratio: float) -> list[str]:
+    """議事録の発言者表記からキーワードを作成する."""
+    rng = random.Random(1)
+    keywords = [match.group(0) for match in SPEAKER_PATTERN.finditer(minutes)]
+    return [
+        f"◆存在しない発言者{index}(該当なし君)"
+        if rng.random() < missing_ratio
+        else keyword
+        for index, keyword in enumerate(keywords)
+    ]
+
+
+def locate_with_find(minutes: str, keywords: list[str]) -> list[int]:
+    """従来のdo_divideと同じ方式でセクションの開始位置を求める."""
+    normalized_minutes = normalize_keyword_text(minutes)
+    starts: list[int] = []
+    start_index = max(0, normalized_minutes.find(normalize_keyword_text(keywords[0])))
+    i = 0
+    while i < len(keywords):
+        starts.append(start_index)
+        next_index = -1
+        j = i + 1
+        while j < len(keywords):
+            next_keyword = normalize_keyword_text(keywords[j])
+            next_index = normalized_minutes.find(next_keyword, start_index + 1)
+            if next_index == -1 and len(next_keyword) > 10:
+                next_index = normalized_minutes.find(next_keyword[:10], start_index + 1)
+            if next_index != -1:
+                break
+            j += 1
+        start_index = len(normalized_minutes) if next_index == -1 else next_index
+        i = j
+    return starts
+
+
+def locate_with_locator(minutes: str, keywords: list[str]) -> list[int]:
+    """KeywordLocatorでセクションの開始位置を求める."""
+    positions = KeywordLocator(keywords).locate(minutes)
+    first = positions.find(0)
+    start_index = first.start if first else 0
+    starts: list[int] = []
+    i = 0
+    while i < len(keywords):
+        starts.append(start_index)
+        next_match = None
+        j = i + 1
+        while j < len(keywords):
+            next_match = positions.find(j, start_index + 1)
+            if next_match is not None:
+                break
+            j += 1
+        start_index = (
+            len(positions.normalized.text) if next_match is None else next_match.start
+        )
+        i = j
+    return starts
+
+
+def measure(
+    label: str,
+    func: Callable[[str, list[str]], list[int]],
+    minutes: str,
+    keywords: list[str],
+) -> list[int]:
+    """処理時間を計測して表示する."""
+    started = time.perf_counter()
+    result = func(minutes, keywords)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<24} {elapsed * 1000:10.1f} ms ({len(result)} sections)")
+    return result
+
+
+def main() -> None:
+    """メイン実行関数."""
+    parser = argparse.ArgumentParser(
+        description="do_divideのキーワード検索のベンチマーク"
+    )
+    parser.add_argument("minutes_file", nargs="?", help="議事録のテキストファイル")
+    parser.add_argument("--speeches", type=int, default=3000)
+    parser.add_argument("--missing-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.minutes_file:
+        minutes = Path(args.minutes_file).read_text(encoding="utf-8")
+    else:
+        minutes = synthesize_minutes(args.speeches)
+    keywords = build_keywords(minutes, args.missing_ratio)
+    if not keywords:
+        print("発言者表記が見つからないため計測できません")
+        sys.exit(1)
+
+    # 正規化用のパターンの構築（プロセスごとに1回）は計測から除く
+    normalize_with_offsets("")
+
+    print(
+        f"議事録: {len(minutes):,}文字 / キーワード: {len(keywords):,}件 "
+        f"(存在しないキーワードの割合: {args.missing_ratio:.0%})"
+    )
+    expected = measure("str.find (従来方式)", locate_with_find, minutes, keywords)
+    actual = measure("KeywordLocator", locate_with_locator, minutes, keywords)
+    print(f"  結果の一致: {'OK' if expected == actual else 'NG'}")
+
+
+if __name__ == "__main__":
+    main()
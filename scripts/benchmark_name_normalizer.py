@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""NameNormalizerのマイクロベンチマークスクリプト.
+
+議事録の発言者名を想定した名前のリストを、従来の実装（敬称リストに対する
+str.replace/endswithの繰り返し、呼び出しごとの正規表現の実行）と
+NameNormalizerで正規化し、処理時間を比較します。
+
+使い方:
+    uv run python scripts/benchmark_name_normalizer.py --names 100000 --unique 2000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+
+# プロジェクトのルートディレクトリをPythonパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.domain.services.name_normalizer import NameNormalizer  # noqa: E402
+
+
+SURNAMES = ["山田", "田中", "髙橋", "渡邉", "佐藤", "鈴木", "山﨑", "齋藤"]
+GIVEN_NAMES = ["太郎", "花子", "一郎", "次郎", "三郎", "ﾀﾛｳ"]
+SUFFIXES = ["", "君", "議員", "委員長", "氏", "さん", "議員先生", "市長"]
+
+
+def build_names(count: int, unique: int) -> list[str]:
+    """発言者名のリストを作成する（unique種類の名前がcount件出現する）."""
+    rng = random.Random(0)
+    pool = [
+        f"{rng.choice(['', '○', '◆'])}{rng.choice(SURNAMES)}"
+        f"{rng.choice(['', '　'])}{rng.choice(GIVEN_NAMES)}{index % 7 or ''}"
+        f"{rng.choice(SUFFIXES)}"
+        for index in range(unique)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def legacy_normalize(name: str) -> str:
+    """従来の実装の組み合わせ（記号除去、敬称の繰り返し除去、空白の正規化）."""
+    cleaned = re.sub(r"^[○◆◇■□●◎△▲▽▼☆★]+", "", name).strip()
+    honorifics = [
+        "副委員長",
+        "委員長",
+        "副議長",
+        "議長",
+        "副市長",
+        "市長",
+        "議員",
+        "先生",
+        "氏",
+        "さん",
+        "君",
+        "様",
+    ]
+    changed = True
+    while changed:
+        changed = False
+        for honorific in honorifics:
+            if cleaned.endswith(honorific):
+                cleaned = cleaned[: -len(honorific)]
+                changed = True
+                break
+    return re.sub(r"\s+", "", cleaned)
+
+
+def measure(label: str, func: Callable[[], list[str]]) -> None:
+    """処理時間を計測して表示する."""
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    per_name = elapsed / len(result) * 1_000_000
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms ({per_name:.2f} µs/name)")
+
+
+def main() -> None:
+    """メイン実行関数."""
+    parser = argparse.ArgumentParser(description="NameNormalizerのベンチマーク")
+    parser.add_argument("--names", type=int, default=100_000)
+    parser.add_argument("--unique", type=int, default=2_000)
+    args = parser.parse_args()
+
+    names = build_names(args.names, args.unique)
+    print(f"名前: {len(names):,}件 (異なる名前: {args.unique:,}種類)")
+
+    measure("legacy (per call)", lambda: [legacy_normalize(n) for n in names])
+    measure(
+        "NameNormalizer (cold cache)",
+        lambda: NameNormalizer().normalize_many(names),
+    )
+    normalizer = NameNormalizer()
+    normalizer.normalize_many(names)
+    measure("NameNormalizer (warm cache)", lambda: normalizer.normalize_many(names))
+
+
+if __name__ == "__main__":
+    main()
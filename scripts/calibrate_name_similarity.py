@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""名前の類似度のしきい値の校正スクリプト.
+
+評価データセット（data/evaluation/datasets/conference_member_matching）の
+議員名と政治家候補の組み合わせについてNameSimilarityScorerの類似度を計算し、
+しきい値ごとの適合率・再現率を表示します。
+
+- 正例: 期待値でmatchedとされた議員と政治家の組み合わせ
+- 負例: それ以外の組み合わせのうち、正規化後の名前が異なるもの
+  （同姓同名の区別は政党などの文脈で行うため、文字列の類似度の校正からは除く）
+
+--benchmarkを指定すると、1名 × N候補の一括計算の処理時間も計測します。
+
+使い方:
+    uv run python scripts/calibrate_name_similarity.py
+    uv run python scripts/calibrate_name_similarity.py --benchmark 10000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from pathlib import Path
+
+
+# プロジェクトのルートディレクトリをPythonパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.domain.services.name_normalizer import get_name_normalizer  # noqa: E402
+from src.domain.services.name_similarity import (  # noqa: E402
+    NAME_MATCH_THRESHOLD,
+    NAME_REVIEW_THRESHOLD,
+    NameSimilarityScorer,
+)
+
+
+DATASET_DIR = (
+    project_root / "data" / "evaluation" / "datasets" / "conference_member_matching"
+)
+
+
+def load_pairs(
+    scorer: NameSimilarityScorer,
+) -> tuple[list[tuple[float, str, str]], list[tuple[float, str, str]]]:
+    """評価データセットから正例・負例の(類似度, 議員名, 政治家名)を作成する."""
+    normalizer = get_name_normalizer()
+    positives: dict[tuple[str, str], float] = {}
+    negatives: dict[tuple[str, str], float] = {}
+    for path in sorted(DATASET_DIR.glob("*.json")):
+        dataset = json.loads(path.read_text(encoding="utf-8"))
+        for test_case in dataset["test_cases"]:
+            politicians = test_case["input"]["politicians"]
+            expected = {
+                member["member_name"]: member
+                for member in test_case["expected_output"]["matched_members"]
+            }
+            for member in test_case["input"]["extracted_members"]:
+                name = member["name"]
+                scores = scorer.score_many(name, [p["name"] for p in politicians])
+                for politician, score in zip(politicians, scores, strict=True):
+                    answer = expected.get(name)
+                    key = (name, politician["name"])
+                    if (
+                        answer
+                        and answer["status"] == "matched"
+                        and answer["politician_id"] == politician["id"]
+                    ):
+                        positives[key] = score
+                    elif normalizer.normalize(name) != normalizer.normalize(
+                        politician["name"]
+                    ):
+                        negatives[key] = score
+    return (
+        sorted((score, *key) for key, score in positives.items()),
+        sorted((score, *key) for key, score in negatives.items()),
+    )
+
+
+def print_calibration(scorer: NameSimilarityScorer) -> None:
+    """しきい値ごとの適合率・再現率を表示する."""
+    positives, negatives = load_pairs(scorer)
+    print(f"正例: {len(positives)}組 / 負例: {len(negatives)}組")
+    print(f"{'しきい値':>8} {'TP':>4} {'FP':>4} {'適合率':>7} {'再現率':>7}")
+    for step in range(4, 21):
+        threshold = step * 0.05
+        true_positive = sum(score >= threshold for score, *_ in positives)
+        false_positive = sum(score >= threshold for score, *_ in negatives)
+        predicted = true_positive + false_positive
+        precision = true_positive / predicted if predicted else 1.0
+        recall = true_positive / len(positives) if positives else 0.0
+        print(
+            f"{threshold:8.2f} {true_positive:4d} {false_positive:4d} "
+            f"{precision:7.2f} {recall:7.2f}"
+        )
+
+    print("\n類似度が最も高い負例:")
+    for score, name, politician_name in negatives[-5:]:
+        print(f"  {score:.3f} {name} / {politician_name}")
+    print("類似度が最も低い正例（読み仮名の表記などは文字列では一致しない）:")
+    for score, name, politician_name in positives[:5]:
+        print(f"  {score:.3f} {name} / {politician_name}")
+    print(
+        f"\n現在のしきい値: NAME_MATCH_THRESHOLD={NAME_MATCH_THRESHOLD}, "
+        f"NAME_REVIEW_THRESHOLD={NAME_REVIEW_THRESHOLD}"
+    )
+
+
+def benchmark(scorer: NameSimilarityScorer, candidates: int) -> None:
+    """1名 × N候補の一括計算と1組ずつの計算の処理時間を比較する."""
+    rng = random.Random(0)
+    surnames = ["山田", "田中", "高橋", "渡辺", "佐藤", "鈴木", "山崎", "斎藤"]
+    given_names = ["太郎", "花子", "一郎", "次郎", "美咲", "由美", "健一", "誠"]
+    names = [
+        f"{rng.choice(surnames)}{rng.choice(given_names)}{index}"
+        for index in range(candidates)
+    ]
+    scorer.score_many("山田太郎", names)  # 正規化のキャッシュを温める
+
+    started = time.perf_counter()
+    scorer.score_many("山田太郎", names)
+    batched = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for name in names:
+        scorer.score("山田太郎", name)
+    pairwise = time.perf_counter() - started
+
+    print(f"\n1名 × {candidates:,}候補")
+    print(f"  score_many (一括)  {batched * 1000:9.1f} ms")
+    print(f"  score (1組ずつ)    {pairwise * 1000:9.1f} ms")
+
+
+def main() -> None:
+    """メイン実行関数."""
+    parser = argparse.ArgumentParser(description="名前の類似度のしきい値の校正")
+    parser.add_argument(
+        "--benchmark", type=int, default=0, help="一括計算の計測に使う候補数"
+    )
+    args = parser.parse_args()
+
+    scorer = NameSimilarityScorer()
+    print_calibration(scorer)
+    if args.benchmark:
+        benchmark(scorer, args.benchmark)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """議事録処理関連のDTO"""
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
 
 
 @dataclass
@@ -35,3 +35,52 @@ class MinutesProcessingResultDTO:
     processed_at: datetime
     errors: list[str] | None = None
     role_name_mappings: dict[str, str] | None = None
+
+
+@dataclass
+class BatchMinutesProcessingDTO:
+    """複数会議の議事録一括処理リクエストDTO
+
+    meeting_idsを指定した場合はそれを優先し、指定がない場合は
+    conference_idと日付範囲で対象会議を絞り込みます。
+    """
+
+    meeting_ids: list[int] | None = None
+    conference_id: int | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    force_reprocess: bool = False
+
+
+@dataclass
+class StageMetricsDTO:
+    """パイプラインステージごとの処理メトリクスDTO"""
+
+    stage: str
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """ステージ稼働時間あたりの処理件数（件/分）"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.processed / self.elapsed_seconds * 60
+
+
+@dataclass
+class BatchMinutesProcessingResultDTO:
+    """複数会議の議事録一括処理結果DTO"""
+
+    results: list[MinutesProcessingResultDTO] = field(default_factory=list)
+    failures: dict[int, str] = field(default_factory=dict)
+    stage_metrics: dict[str, StageMetricsDTO] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    @property
+    def total_meetings(self) -> int:
+        """処理対象となった会議数"""
+        return len(self.results) + len(self.failures)
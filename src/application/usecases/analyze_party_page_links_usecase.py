@@ -12,9 +12,11 @@ from src.domain.services.interfaces.html_link_extractor_service import (
 )
 from src.domain.services.interfaces.llm_link_classifier_service import (
     ILLMLinkClassifierService,
+    LinkClassificationResult,
     LinkType,
 )
 from src.domain.services.link_analysis_domain_service import LinkAnalysisDomainService
+from src.domain.services.link_heuristic_classifier import LinkHeuristicClassifier
 
 
 logger = logging.getLogger(__name__)
@@ -26,7 +28,7 @@ class AnalyzePartyPageLinksUseCase:
     This use case orchestrates the following workflow:
     1. Extract all links from HTML content
     2. Filter links to identify child pages
-    3. Classify links using LLM
+    3. Classify obvious links by rules and the rest using LLM
     4. Return structured results with classifications
     """
 
@@ -35,6 +37,7 @@ class AnalyzePartyPageLinksUseCase:
         html_extractor: IHtmlLinkExtractorService,
         link_classifier: ILLMLinkClassifierService,
         link_analysis_service: LinkAnalysisDomainService,
+        heuristic_classifier: LinkHeuristicClassifier | None = None,
     ):
         """Initialize the use case with required services.
 
@@ -42,10 +45,12 @@ class AnalyzePartyPageLinksUseCase:
             html_extractor: Service for extracting links from HTML
             link_classifier: Service for classifying links with LLM
             link_analysis_service: Domain service for link hierarchy analysis
+            heuristic_classifier: Rule-based classifier run before the LLM
         """
         self._html_extractor = html_extractor
         self._link_classifier = link_classifier
         self._link_analysis = link_analysis_service
+        self._heuristic_classifier = heuristic_classifier or LinkHeuristicClassifier()
 
     async def execute(self, input_dto: AnalyzeLinksInputDTO) -> AnalyzeLinksOutputDTO:
         """Execute the link analysis use case.
@@ -105,31 +110,27 @@ class AnalyzePartyPageLinksUseCase:
             f"{len(links_to_classify)} total to classify"
         )
 
-        # Step 3: Classify links if any exist
-        if links_to_classify:
-            classification_result = await self._link_classifier.classify_links(
-                links_to_classify,
+        # Step 3: Classify obvious links by rules and only the rest with LLM
+        classifications, residue = self._heuristic_classifier.partition(
+            links_to_classify
+        )
+        logger.info(
+            f"Classified {len(classifications)} links by rules, "
+            f"{len(residue)} left for LLM"
+        )
+        if residue:
+            llm_result = await self._link_classifier.classify_links(
+                residue,
                 party_name=input_dto.party_name,
                 context=input_dto.context,
             )
-            classifications_count = len(classification_result.classifications)
-            logger.debug(f"LLM classified {classifications_count} links")
-            # Show classification breakdown
-            from collections import Counter
-
-            type_counts = Counter(
-                c.link_type.value for c in classification_result.classifications
-            )
-            logger.debug(f"Classification breakdown = {dict(type_counts)}")
-        else:
-            # No links to classify
-            from src.domain.services.interfaces.llm_link_classifier_service import (
-                LinkClassificationResult,
-            )
+            logger.debug(f"LLM classified {len(llm_result.classifications)} links")
+            classifications.extend(llm_result.classifications)
 
-            classification_result = LinkClassificationResult(
-                classifications=[], summary={}
-            )
+        classification_result = LinkClassificationResult.from_classifications(
+            classifications
+        )
+        logger.debug(f"Classification breakdown = {classification_result.summary}")
 
         # Step 4: Convert to DTOs and extract specific URL lists
         classification_dtos = [
@@ -195,9 +195,14 @@ class BackfillRoleNameMappingsUseCase:
             logger.warning(f"GCSからのテキスト取得エラー: {e}")
             return False
 
-        # 境界検出で出席者部分を抽出
+        # 境界検出で出席者部分を抽出（議事録にキャッシュされた境界があれば再利用）
         attendee_text = text
-        if self.minutes_divider_service:
+        cached_boundary = minutes.attendee_boundary
+        if cached_boundary and cached_boundary.matches(text):
+            if cached_boundary.position:
+                attendee_text = text[: cached_boundary.position].strip()
+            logger.debug(f"キャッシュ済みの境界を使用: {len(attendee_text)}文字")
+        elif self.minutes_divider_service:
             try:
                 boundary = await self.minutes_divider_service.detect_attendee_boundary(
                     text
@@ -0,0 +1,357 @@
+"""議事録一括処理ユースケース
+
+複数の会議の議事録を、ステージ分割された並行パイプラインで処理するユースケース。
+
+ExecuteMinutesProcessingUseCaseは1会議を1つのUnit of Workで処理しますが、
+このユースケースは以下のステージを会議ごとに独立したUnit of Workで実行します。
+
+1. fetch: 会議情報の取得と議事録テキストのダウンロード（I/Oバウンド）
+2. analyze: 役職-人名マッピング抽出と発言分割（LLMバウンド）
+3. persist: Conversation/Speakerの保存とコミット（DBバウンド）
+
+ステージ間は上限付きキューで接続されるため、LLMステージが詰まると
+fetchステージは自動的に待機します（バックプレッシャー）。
+
+構造化された発言（国会会議録APIなど）をfetchステージで取得できた会議は、
+analyzeステージでLLMを呼び出さずにpersistステージへ渡します。
+"""
+
+import asyncio
+import time
+
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.application.dtos.minutes_processing_dto import (
+    BatchMinutesProcessingDTO,
+    BatchMinutesProcessingResultDTO,
+    MinutesProcessingResultDTO,
+    StageMetricsDTO,
+)
+from src.application.usecases.execute_minutes_processing_usecase import (
+    MINUTES_DIVIDER_PIPELINE_VERSION,
+    STRUCTURED_SOURCE_PIPELINE_VERSION,
+    ExecuteMinutesProcessingDTO,
+    ExecuteMinutesProcessingUseCase,
+)
+from src.common.logging import get_logger
+from src.domain.entities.meeting import Meeting
+from src.domain.entities.minutes import Minutes
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
+from src.domain.value_objects.speaker_speech import SpeakerSpeech
+
+
+logger = get_logger(__name__)
+
+MinutesProcessingScope = Callable[
+    [], AbstractAsyncContextManager[ExecuteMinutesProcessingUseCase]
+]
+"""独立したUnit of Workに束縛されたExecuteMinutesProcessingUseCaseを提供する関数"""
+
+FETCH_STAGE = "fetch"
+ANALYZE_STAGE = "analyze"
+PERSIST_STAGE = "persist"
+
+
+@dataclass
+class _MinutesWorkItem:
+    """パイプライン内を流れる1会議分の作業データ"""
+
+    meeting_id: int
+    started_at: datetime = field(default_factory=datetime.now)
+    meeting: Meeting | None = None
+    existing_minutes: Minutes | None = None
+    text: str = ""
+    role_name_mappings: dict[str, str] | None = None
+    speeches: list[SpeakerSpeech] = field(default_factory=list)
+    attendee_boundary: AttendeeBoundary | None = None
+    # 発言を構造化ソースから取得済み（LLMによる発言分割が不要）
+    structured: bool = False
+
+
+class BatchExecuteMinutesProcessingUseCase:
+    """議事録一括処理ユースケース
+
+    会議ごとに独立したUnit of Workを使用し、fetch → analyze → persist の
+    各ステージを個別の並行数で実行します。1会議の失敗は他の会議に影響しません。
+    """
+
+    def __init__(
+        self,
+        processing_scope: MinutesProcessingScope,
+        fetch_concurrency: int = 8,
+        llm_concurrency: int = 4,
+        persist_concurrency: int = 2,
+        queue_size_per_worker: int = 2,
+    ):
+        """ユースケースを初期化する
+
+        Args:
+            processing_scope: 新しいUnit of Workに束縛された
+                ExecuteMinutesProcessingUseCaseを返す非同期コンテキストマネージャの
+                ファクトリ。ステージごとに呼び出されます
+            fetch_concurrency: fetchステージの並行数
+            llm_concurrency: analyzeステージ（LLM呼び出し）の並行数
+            persist_concurrency: persistステージの並行数
+            queue_size_per_worker: 下流ワーカー1つあたりのキュー容量。
+                キューが満杯になると上流ステージは待機します
+        """
+        if min(fetch_concurrency, llm_concurrency, persist_concurrency) < 1:
+            raise ValueError("Concurrency must be at least 1 for every stage")
+        if queue_size_per_worker < 1:
+            raise ValueError("queue_size_per_worker must be at least 1")
+
+        self.processing_scope = processing_scope
+        self.fetch_concurrency = fetch_concurrency
+        self.llm_concurrency = llm_concurrency
+        self.persist_concurrency = persist_concurrency
+        self.queue_size_per_worker = queue_size_per_worker
+
+    async def execute(
+        self, request: BatchMinutesProcessingDTO
+    ) -> BatchMinutesProcessingResultDTO:
+        """複数会議の議事録処理を実行する
+
+        Args:
+            request: 一括処理リクエストDTO
+
+        Returns:
+            BatchMinutesProcessingResultDTO: 会議ごとの結果、失敗理由、
+                ステージごとのメトリクス
+        """
+        started = time.perf_counter()
+        meeting_ids = await self._resolve_meeting_ids(request)
+
+        result = BatchMinutesProcessingResultDTO(
+            stage_metrics={
+                stage: StageMetricsDTO(stage=stage)
+                for stage in (FETCH_STAGE, ANALYZE_STAGE, PERSIST_STAGE)
+            }
+        )
+        if not meeting_ids:
+            logger.info("No meetings to process")
+            return result
+
+        logger.info(
+            f"Starting batch minutes processing for {len(meeting_ids)} meetings",
+            fetch_concurrency=self.fetch_concurrency,
+            llm_concurrency=self.llm_concurrency,
+            persist_concurrency=self.persist_concurrency,
+        )
+
+        fetch_queue: asyncio.Queue[_MinutesWorkItem | None] = asyncio.Queue()
+        analyze_queue: asyncio.Queue[_MinutesWorkItem | None] = asyncio.Queue(
+            maxsize=self.llm_concurrency * self.queue_size_per_worker
+        )
+        persist_queue: asyncio.Queue[_MinutesWorkItem | None] = asyncio.Queue(
+            maxsize=self.persist_concurrency * self.queue_size_per_worker
+        )
+
+        for meeting_id in meeting_ids:
+            fetch_queue.put_nowait(_MinutesWorkItem(meeting_id=meeting_id))
+        for _ in range(self.fetch_concurrency):
+            fetch_queue.put_nowait(None)
+
+        async def fetch(item: _MinutesWorkItem) -> _MinutesWorkItem:
+            return await self._fetch(item, request.force_reprocess)
+
+        async def persist(item: _MinutesWorkItem) -> _MinutesWorkItem:
+            processing_result = await self._persist(item, request.force_reprocess)
+            result.results.append(processing_result)
+            return item
+
+        await asyncio.gather(
+            self._run_stage(
+                FETCH_STAGE,
+                fetch,
+                self.fetch_concurrency,
+                fetch_queue,
+                analyze_queue,
+                self.llm_concurrency,
+                result,
+            ),
+            self._run_stage(
+                ANALYZE_STAGE,
+                self._analyze,
+                self.llm_concurrency,
+                analyze_queue,
+                persist_queue,
+                self.persist_concurrency,
+                result,
+            ),
+            self._run_stage(
+                PERSIST_STAGE,
+                persist,
+                self.persist_concurrency,
+                persist_queue,
+                None,
+                0,
+                result,
+            ),
+        )
+
+        result.total_seconds = time.perf_counter() - started
+        logger.info(
+            f"Batch minutes processing completed: {len(result.results)} succeeded, "
+            f"{len(result.failures)} failed in {result.total_seconds:.1f}s"
+        )
+        return result
+
+    async def _resolve_meeting_ids(
+        self, request: BatchMinutesProcessingDTO
+    ) -> list[int]:
+        """リクエストから処理対象の会議IDリストを決定する"""
+        if request.meeting_ids:
+            # 順序を保ったまま重複を除去
+            return list(dict.fromkeys(request.meeting_ids))
+
+        if request.conference_id is None:
+            raise ValueError("Either meeting_ids or conference_id must be specified")
+
+        async with self.processing_scope() as usecase:
+            meetings = await usecase.uow.meeting_repository.get_by_conference(
+                request.conference_id
+            )
+
+        meeting_ids: list[int] = []
+        for meeting in meetings:
+            if meeting.id is None:
+                continue
+            if meeting.date and (
+                (request.start_date and meeting.date < request.start_date)
+                or (request.end_date and meeting.date > request.end_date)
+            ):
+                continue
+            meeting_ids.append(meeting.id)
+        return meeting_ids
+
+    async def _run_stage(
+        self,
+        stage: str,
+        handler: Callable[[_MinutesWorkItem], Awaitable[_MinutesWorkItem]],
+        concurrency: int,
+        inbox: asyncio.Queue[_MinutesWorkItem | None],
+        outbox: asyncio.Queue[_MinutesWorkItem | None] | None,
+        downstream_concurrency: int,
+        result: BatchMinutesProcessingResultDTO,
+    ) -> None:
+        """1ステージ分のワーカー群を実行する
+
+        各ワーカーは終端マーカー（None）を受け取るまでinboxから作業を取り出し、
+        成功した作業をoutboxに渡します。全ワーカー終了後、下流ワーカー数分の
+        終端マーカーをoutboxに送ります。
+        """
+        metrics = result.stage_metrics[stage]
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            while True:
+                item = await inbox.get()
+                if item is None:
+                    return
+
+                work_started = time.perf_counter()
+                try:
+                    processed = await handler(item)
+                except Exception as e:
+                    metrics.failed += 1
+                    result.failures[item.meeting_id] = f"{stage}: {e}"
+                    logger.warning(
+                        f"Minutes processing failed at {stage} stage: {e}",
+                        meeting_id=item.meeting_id,
+                    )
+                    continue
+                finally:
+                    metrics.busy_seconds += time.perf_counter() - work_started
+
+                metrics.processed += 1
+                if outbox is not None:
+                    wait_started = time.perf_counter()
+                    await outbox.put(processed)
+                    metrics.wait_seconds += time.perf_counter() - wait_started
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        metrics.elapsed_seconds = time.perf_counter() - started
+        if outbox is not None:
+            for _ in range(downstream_concurrency):
+                await outbox.put(None)
+
+        logger.info(
+            f"Stage {stage} completed",
+            processed=metrics.processed,
+            failed=metrics.failed,
+            busy_seconds=round(metrics.busy_seconds, 3),
+            backpressure_wait_seconds=round(metrics.wait_seconds, 3),
+            throughput_per_minute=round(metrics.throughput_per_minute, 2),
+        )
+
+    async def _fetch(
+        self, item: _MinutesWorkItem, force_reprocess: bool
+    ) -> _MinutesWorkItem:
+        """fetchステージ: 会議を検証し、構造化された発言か議事録テキストを取得する"""
+        async with self.processing_scope() as usecase:
+            item.meeting, item.existing_minutes = await usecase.prepare_meeting(
+                ExecuteMinutesProcessingDTO(
+                    meeting_id=item.meeting_id, force_reprocess=force_reprocess
+                )
+            )
+            speeches = await usecase.fetch_structured_speeches(item.meeting)
+            if speeches is not None:
+                item.speeches = speeches
+                item.structured = True
+            else:
+                item.text = await usecase.fetch_minutes_text(item.meeting)
+        return item
+
+    async def _analyze(self, item: _MinutesWorkItem) -> _MinutesWorkItem:
+        """analyzeステージ: 役職マッピング抽出と発言分割を行う
+
+        このステージはDBにアクセスしないため、スコープのセッションは
+        コネクションを取得しません。
+        """
+        if item.meeting is None:
+            raise ValueError(f"Meeting {item.meeting_id} was not fetched")
+        if item.structured:
+            return item
+
+        async with self.processing_scope() as usecase:
+            (
+                item.role_name_mappings,
+                item.speeches,
+                item.attendee_boundary,
+            ) = await usecase.analyze_minutes(
+                item.text, item.meeting, item.existing_minutes
+            )
+        # 以降のステージでは不要なテキストを解放する
+        item.text = ""
+        return item
+
+    async def _persist(
+        self, item: _MinutesWorkItem, force_reprocess: bool
+    ) -> MinutesProcessingResultDTO:
+        """persistステージ: 独立したUnit of Workで保存・コミットする"""
+        if item.meeting is None:
+            raise ValueError(f"Meeting {item.meeting_id} was not fetched")
+
+        async with self.processing_scope() as usecase:
+            try:
+                return await usecase.persist_results(
+                    item.meeting,
+                    item.existing_minutes,
+                    item.role_name_mappings,
+                    item.speeches,
+                    force_reprocess=force_reprocess,
+                    start_time=item.started_at,
+                    attendee_boundary=item.attendee_boundary,
+                    pipeline_version=(
+                        STRUCTURED_SOURCE_PIPELINE_VERSION
+                        if item.structured
+                        else MINUTES_DIVIDER_PIPELINE_VERSION
+                    ),
+                )
+            except Exception:
+                await usecase.uow.rollback()
+                raise
@@ -3,6 +3,9 @@
 議事録一覧画面から発言抽出処理を実行するためのユースケース。
 GCSまたはPDFから議事録テキストを取得し、MinutesProcessingServiceを使用して
 発言を抽出してデータベースに保存します。
+
+国会会議録のように発言単位の構造化レコードを公開している議事録は、
+IStructuredMinutesSourceから発言を取得し、LLMによる発言分割を行わずに保存します。
 """
 
 from dataclasses import dataclass
@@ -27,13 +30,24 @@ from src.domain.services.interfaces.minutes_processing_service import (
     IMinutesProcessingService,
 )
 from src.domain.services.interfaces.storage_service import IStorageService
+from src.domain.services.interfaces.structured_minutes_source import (
+    IStructuredMinutesSource,
+)
 from src.domain.services.interfaces.unit_of_work import IUnitOfWork
 from src.domain.services.speaker_domain_service import SpeakerDomainService
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 
 
 logger = get_logger(__name__)
 
+# 抽出ログに記録するパイプラインのバージョン
+MINUTES_DIVIDER_PIPELINE_VERSION = "minutes-divider-v1"
+STRUCTURED_SOURCE_PIPELINE_VERSION = "structured-source-v1"
+
+# 境界検出に失敗した結果のdetection_method（同じ処理では再検出せず、キャッシュもしない）
+_DETECTION_FAILED = "failed"
+
 
 @dataclass
 class ExecuteMinutesProcessingDTO:
@@ -59,6 +73,7 @@ class ExecuteMinutesProcessingUseCase:
         update_statement_usecase: UpdateStatementFromExtractionUseCase,
         role_name_mapping_service: IRoleNameMappingService | None = None,
         minutes_divider_service: IMinutesDividerService | None = None,
+        structured_minutes_source: IStructuredMinutesSource | None = None,
     ):
         """ユースケースを初期化する
 
@@ -70,6 +85,8 @@ class ExecuteMinutesProcessingUseCase:
             update_statement_usecase: Statement更新UseCase（抽出ログ統合）
             role_name_mapping_service: 役職-人名マッピング抽出サービス（オプション）
             minutes_divider_service: 議事録分割サービス（境界検出用、オプション）
+            structured_minutes_source: 発言単位のレコードを提供する議事録ソース
+                （オプション、対応する会議ではLLMによる発言分割を省略する）
         """
         self.speaker_service = speaker_domain_service
         self.minutes_processing_service = minutes_processing_service
@@ -78,6 +95,7 @@ class ExecuteMinutesProcessingUseCase:
         self.update_statement_usecase = update_statement_usecase
         self.role_name_mapping_service = role_name_mapping_service
         self.minutes_divider_service = minutes_divider_service
+        self.structured_minutes_source = structured_minutes_source
 
     async def execute(
         self, request: ExecuteMinutesProcessingDTO
@@ -96,116 +114,274 @@ class ExecuteMinutesProcessingUseCase:
             ProcessingError: 処理中にエラーが発生した場合
         """
         start_time = datetime.now()
-        errors: list[str] = []
 
         try:
-            # 会議情報を取得
-            meeting = await self.uow.meeting_repository.get_by_id(request.meeting_id)
-            if not meeting:
-                raise ValueError(f"Meeting {request.meeting_id} not found")
+            meeting, existing_minutes = await self.prepare_meeting(request)
+
+            # 構造化された発言を取得できる会議はLLMステージを省略する
+            speeches = await self.fetch_structured_speeches(meeting)
+            if speeches is not None:
+                return await self.persist_results(
+                    meeting,
+                    existing_minutes,
+                    None,
+                    speeches,
+                    force_reprocess=request.force_reprocess,
+                    start_time=start_time,
+                    pipeline_version=STRUCTURED_SOURCE_PIPELINE_VERSION,
+                )
 
-            # 既存の議事録をチェック
-            if meeting.id is None:
-                raise ValueError("Meeting must have an ID")
+            # 議事録テキストを取得
+            extracted_text = await self.fetch_minutes_text(meeting)
 
-            existing_minutes = await self.uow.minutes_repository.get_by_meeting(
-                meeting.id
+            # 役職-人名マッピング抽出と発言分割
+            role_name_mappings, results, attendee_boundary = await self.analyze_minutes(
+                extracted_text, meeting, existing_minutes
             )
 
-            # 既存のConversationsをチェック・削除
-            if existing_minutes and existing_minutes.id:
-                conversations = await self.uow.conversation_repository.get_by_minutes(
-                    existing_minutes.id
-                )
-                if conversations:
-                    if not request.force_reprocess:
-                        raise ValueError(
-                            f"Meeting {meeting.id} already has conversations"
-                        )
-                    else:
-                        # 強制再処理の場合は既存conversationsを削除
-                        logger.info(
-                            f"Deleting {len(conversations)} existing conversations "
-                            f"for force reprocessing"
-                        )
-                        for conv in conversations:
-                            if conv.id:
-                                await self.uow.conversation_repository.delete(conv.id)
-                        # Flush to ensure deletions are applied
-                        await self.uow.flush()
-                        logger.info("Existing conversations deleted")
+            return await self.persist_results(
+                meeting,
+                existing_minutes,
+                role_name_mappings,
+                results,
+                force_reprocess=request.force_reprocess,
+                start_time=start_time,
+                attendee_boundary=attendee_boundary,
+            )
 
-            # 議事録テキストを取得
-            extracted_text = await self._fetch_minutes_text(meeting)
+        except Exception as e:
+            logger.error(f"Minutes processing failed: {e}", exc_info=True)
+            # エラー時はロールバック
+            await self.uow.rollback()
+            logger.info("Transaction rolled back")
+            raise
 
-            # 役職-人名マッピングを抽出
-            role_name_mappings = await self._extract_role_name_mappings(extracted_text)
-
-            # Minutes レコードを作成または取得
-            if not existing_minutes:
-                minutes = Minutes(
-                    meeting_id=meeting.id,
-                    url=meeting.url,
-                    role_name_mappings=role_name_mappings,
-                )
-                minutes = await self.uow.minutes_repository.create(minutes)
-                # Flush to make foreign key available for conversations
-                await self.uow.flush()
-                logger.info(f"Minutes created and flushed: id={minutes.id}")
-            else:
-                minutes = existing_minutes
-                # 既存のMinutesの場合もマッピングを更新
-                if role_name_mappings and minutes.id:
-                    await self.uow.minutes_repository.update_role_name_mappings(
-                        minutes.id, role_name_mappings
-                    )
-                    logger.info(f"Updated role_name_mappings for minutes {minutes.id}")
+    async def prepare_meeting(
+        self, request: ExecuteMinutesProcessingDTO
+    ) -> tuple[Meeting, Minutes | None]:
+        """処理対象の会議と既存議事録を取得し、処理可否を検証する
 
-            # 議事録を処理（役職-人名マッピングを渡す: Issue #946）
-            results = await self._process_minutes(
-                extracted_text, meeting.id, role_name_mappings
-            )
+        このステージは読み取りのみで、既存Conversationの削除は
+        persist_resultsで行います。
 
-            # Conversationsを保存
-            if minutes.id is None:
-                raise ValueError("Minutes must have an ID")
+        Args:
+            request: 処理リクエストDTO
 
-            saved_conversations = await self._save_conversations(results, minutes.id)
+        Returns:
+            tuple[Meeting, Minutes | None]: 会議と既存の議事録（なければNone）
 
-            # Speakersを抽出・作成
-            unique_speakers = await self._extract_and_create_speakers(
-                saved_conversations
-            )
+        Raises:
+            ValueError: 会議が見つからない、または既に発言が存在する場合
+        """
+        # 会議情報を取得
+        meeting = await self.uow.meeting_repository.get_by_id(request.meeting_id)
+        if not meeting:
+            raise ValueError(f"Meeting {request.meeting_id} not found")
+
+        # 既存の議事録をチェック
+        if meeting.id is None:
+            raise ValueError("Meeting must have an ID")
 
-            # トランザクションをコミット（単一コミット）
-            await self.uow.commit()
-            logger.info("Transaction committed successfully")
-
-            # 処理完了時間を計算
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-
-            return MinutesProcessingResultDTO(
-                minutes_id=minutes.id if minutes.id is not None else 0,
-                meeting_id=meeting.id if meeting.id is not None else 0,
-                total_conversations=len(saved_conversations),
-                unique_speakers=unique_speakers,
-                processing_time_seconds=processing_time,
-                processed_at=end_time,
-                errors=errors if errors else None,
+        existing_minutes = await self.uow.minutes_repository.get_by_meeting(meeting.id)
+
+        # 既存のConversationsをチェック
+        if existing_minutes and existing_minutes.id and not request.force_reprocess:
+            if await self.uow.conversation_repository.exists_by_minutes(
+                existing_minutes.id
+            ):
+                raise ValueError(f"Meeting {meeting.id} already has conversations")
+
+        return meeting, existing_minutes
+
+    async def analyze_minutes(
+        self,
+        text: str,
+        meeting: Meeting,
+        existing_minutes: Minutes | None = None,
+    ) -> tuple[dict[str, str] | None, list[SpeakerSpeech], AttendeeBoundary | None]:
+        """役職-人名マッピングを抽出し、議事録を発言に分割する（LLMステージ）
+
+        データベースにはアクセスしないため、Unit of Workの外で実行できます。
+        出席者/発言境界は1回だけ検出し、マッピング抽出と発言抽出の両方で使います。
+        検出に失敗した場合も、その結果を渡して両方の段階で再検出しないようにします。
+
+        Args:
+            text: 議事録テキスト
+            meeting: 会議エンティティ
+            existing_minutes: 既存の議事録（キャッシュ済みの境界を再利用する）
+
+        Returns:
+            tuple: 役職-人名マッピング、抽出された発言リスト、
+                検出した境界（検出に失敗した場合はNone）
+        """
+        if meeting.id is None:
+            raise ValueError("Meeting must have an ID")
+
+        # 出席者/発言境界を検出（議事録にキャッシュがあれば再利用）
+        attendee_boundary = await self._detect_attendee_boundary(text, existing_minutes)
+
+        # 役職-人名マッピングを抽出
+        role_name_mappings = await self._extract_role_name_mappings(
+            text, attendee_boundary
+        )
+
+        # 議事録を処理（役職-人名マッピングを渡す: Issue #946）
+        results = await self._process_minutes(
+            text, meeting.id, role_name_mappings, attendee_boundary
+        )
+        if (
+            attendee_boundary
+            and attendee_boundary.detection_method == _DETECTION_FAILED
+        ):
+            attendee_boundary = None
+        return role_name_mappings, results, attendee_boundary
+
+    async def persist_results(
+        self,
+        meeting: Meeting,
+        existing_minutes: Minutes | None,
+        role_name_mappings: dict[str, str] | None,
+        results: list[SpeakerSpeech],
+        force_reprocess: bool = False,
+        start_time: datetime | None = None,
+        attendee_boundary: AttendeeBoundary | None = None,
+        pipeline_version: str = MINUTES_DIVIDER_PIPELINE_VERSION,
+    ) -> MinutesProcessingResultDTO:
+        """抽出結果を保存してコミットする（永続化ステージ）
+
+        ロールバックは呼び出し側の責務です。
+
+        Args:
+            meeting: 会議エンティティ
+            existing_minutes: 既存の議事録（なければNone）
+            role_name_mappings: 役職-人名マッピング
+            results: 抽出された発言リスト
+            force_reprocess: 既存Conversationを削除して再処理するか
+            start_time: 処理開始時刻（処理時間の計算に使用）
+            attendee_boundary: 検出した出席者/発言境界（議事録にキャッシュする）
+            pipeline_version: 抽出ログに記録するパイプラインのバージョン
+
+        Returns:
+            MinutesProcessingResultDTO: 処理結果
+        """
+        start_time = start_time or datetime.now()
+        if meeting.id is None:
+            raise ValueError("Meeting must have an ID")
+
+        # 強制再処理の場合は既存conversationsを削除
+        if force_reprocess and existing_minutes and existing_minutes.id:
+            await self._delete_existing_conversations(existing_minutes.id)
+
+        # Minutes レコードを作成または取得
+        if not existing_minutes:
+            minutes = Minutes(
+                meeting_id=meeting.id,
+                url=meeting.url,
                 role_name_mappings=role_name_mappings,
+                attendee_boundary=attendee_boundary,
+            )
+            minutes = await self.uow.minutes_repository.create(minutes)
+            # Flush to make foreign key available for conversations
+            await self.uow.flush()
+            logger.info(f"Minutes created and flushed: id={minutes.id}")
+        else:
+            minutes = existing_minutes
+            # 既存のMinutesの場合もマッピングを更新
+            if role_name_mappings and minutes.id:
+                await self.uow.minutes_repository.update_role_name_mappings(
+                    minutes.id, role_name_mappings
+                )
+                logger.info(f"Updated role_name_mappings for minutes {minutes.id}")
+            # 新しく検出した境界をキャッシュ
+            if (
+                attendee_boundary
+                and minutes.id
+                and attendee_boundary != minutes.attendee_boundary
+            ):
+                await self.uow.minutes_repository.update_attendee_boundary(
+                    minutes.id, attendee_boundary
+                )
+                logger.info(f"Cached attendee boundary for minutes {minutes.id}")
+
+        # Conversationsを保存
+        if minutes.id is None:
+            raise ValueError("Minutes must have an ID")
+
+        saved_conversations = await self._save_conversations(
+            results, minutes.id, pipeline_version
+        )
+
+        # Speakersを抽出・作成
+        unique_speakers = await self._extract_and_create_speakers(saved_conversations)
+
+        # トランザクションをコミット（単一コミット）
+        await self.uow.commit()
+        logger.info("Transaction committed successfully")
+
+        # 処理完了時間を計算
+        end_time = datetime.now()
+        processing_time = (end_time - start_time).total_seconds()
+
+        return MinutesProcessingResultDTO(
+            minutes_id=minutes.id if minutes.id is not None else 0,
+            meeting_id=meeting.id,
+            total_conversations=len(saved_conversations),
+            unique_speakers=unique_speakers,
+            processing_time_seconds=processing_time,
+            processed_at=end_time,
+            errors=None,
+            role_name_mappings=role_name_mappings,
+        )
+
+    async def _delete_existing_conversations(self, minutes_id: int) -> None:
+        """強制再処理のために既存のConversationsを削除する
+
+        Args:
+            minutes_id: 議事録ID
+        """
+        deleted_ids = await self.uow.conversation_repository.delete_by_minutes(
+            minutes_id
+        )
+        if deleted_ids:
+            logger.info(
+                f"Deleted {len(deleted_ids)} existing conversations "
+                f"for force reprocessing"
             )
 
+    async def fetch_structured_speeches(
+        self, meeting: Meeting
+    ) -> list[SpeakerSpeech] | None:
+        """構造化された議事録ソースから発言を取得する（I/Oステージ）
+
+        ソースが会議のURLに対応していない場合や取得に失敗した場合はNoneを返し、
+        呼び出し側は議事録テキストとLLMによる発言分割で処理します。
+
+        Args:
+            meeting: 会議エンティティ
+
+        Returns:
+            list[SpeakerSpeech] | None: 発言順の発言リスト。取得できない場合はNone
+        """
+        source = self.structured_minutes_source
+        if source is None or not meeting.url or not source.supports(meeting.url):
+            return None
+
+        try:
+            speeches = await source.fetch_speeches(meeting.url)
         except Exception as e:
-            errors.append(str(e))
-            logger.error(f"Minutes processing failed: {e}", exc_info=True)
-            # エラー時はロールバック
-            await self.uow.rollback()
-            logger.info("Transaction rolled back")
-            raise
+            logger.warning(
+                f"Failed to fetch structured speeches, falling back to text: {e}",
+                meeting_id=meeting.id,
+            )
+            return None
+
+        logger.info(
+            f"Fetched {len(speeches)} structured speeches", meeting_id=meeting.id
+        )
+        return speeches or None
 
-    async def _fetch_minutes_text(self, meeting: Meeting) -> str:
-        """議事録テキストを取得する
+    async def fetch_minutes_text(self, meeting: Meeting) -> str:
+        """議事録テキストを取得する（I/Oステージ）
 
         優先順位:
         1. GCSテキストURI
@@ -247,6 +423,7 @@ class ExecuteMinutesProcessingUseCase:
         text: str,
         meeting_id: int,
         role_name_mappings: dict[str, str] | None = None,
+        attendee_boundary: AttendeeBoundary | None = None,
     ) -> list[SpeakerSpeech]:
         """議事録を処理して発言を抽出する
 
@@ -255,6 +432,7 @@ class ExecuteMinutesProcessingUseCase:
             meeting_id: 会議ID
             role_name_mappings: 役職-人名マッピング辞書（例: {"議長": "伊藤条一"}）
                 発言者名が役職のみの場合に実名に変換（Issue #946）
+            attendee_boundary: 検出済みの出席者/発言境界（境界の再検出を省略する）
 
         Returns:
             list[SpeakerSpeech]: 抽出された発言リスト（ドメイン値オブジェクト）
@@ -266,14 +444,19 @@ class ExecuteMinutesProcessingUseCase:
 
         # 注入された議事録処理サービスを使用（マッピングを渡す: Issue #946）
         results = await self.minutes_processing_service.process_minutes(
-            text, role_name_mappings=role_name_mappings
+            text,
+            role_name_mappings=role_name_mappings,
+            attendee_boundary=attendee_boundary,
         )
 
         logger.info(f"Extracted {len(results)} conversations")
         return results
 
     async def _save_conversations(
-        self, results: list[SpeakerSpeech], minutes_id: int
+        self,
+        results: list[SpeakerSpeech],
+        minutes_id: int,
+        pipeline_version: str = MINUTES_DIVIDER_PIPELINE_VERSION,
     ) -> list[Conversation]:
         """発言をデータベースに保存する（抽出ログ統合版）
 
@@ -283,6 +466,7 @@ class ExecuteMinutesProcessingUseCase:
         Args:
             results: 抽出された発言データ（ドメイン値オブジェクト）
             minutes_id: 議事録ID
+            pipeline_version: 抽出ログに記録するパイプラインのバージョン
 
         Returns:
             list[Conversation]: 保存された発言エンティティリスト
@@ -345,7 +529,7 @@ class ExecuteMinutesProcessingUseCase:
                 await self.update_statement_usecase.execute(
                     entity_id=conv.id,
                     extraction_result=extraction_result,
-                    pipeline_version="minutes-divider-v1",
+                    pipeline_version=pipeline_version,
                 )
                 logger.debug(
                     f"Extraction log saved for conversation {conv.id}",
@@ -409,13 +593,72 @@ class ExecuteMinutesProcessingUseCase:
         logger.info(f"Created {created_count} new speakers")
         return created_count
 
+    async def _detect_attendee_boundary(
+        self, minutes_text: str, existing_minutes: Minutes | None = None
+    ) -> AttendeeBoundary | None:
+        """出席者部分と発言部分の境界を検出する
+
+        既存の議事録に同じテキストで検出した境界がキャッシュされていれば、
+        検出せずにそれを返します。検出に失敗した場合は、境界なし（全体が発言部分）
+        として検出方法を"failed"にした境界を返し、後続の段階で再検出させません。
+
+        Args:
+            minutes_text: 議事録テキスト
+            existing_minutes: 既存の議事録（なければNone）
+
+        Returns:
+            AttendeeBoundary | None: 検出した境界。境界検出サービスがない場合はNone
+        """
+        if not self.minutes_divider_service or not minutes_text:
+            return None
+
+        cached = existing_minutes.attendee_boundary if existing_minutes else None
+        if cached and cached.matches(minutes_text):
+            logger.info(
+                f"Using cached attendee boundary "
+                f"(position={cached.position}, method={cached.detection_method})"
+            )
+            return cached
+
+        try:
+            boundary = await self.minutes_divider_service.detect_attendee_boundary(
+                minutes_text
+            )
+        except Exception as e:
+            logger.warning(f"Failed to detect attendee boundary: {e}")
+            return self._failed_boundary(minutes_text)
+
+        if not boundary.boundary_found and boundary.confidence == 0.0:
+            logger.info(f"Attendee boundary not detected: {boundary.reason}")
+            return self._failed_boundary(minutes_text)
+
+        return AttendeeBoundary(
+            text_hash=AttendeeBoundary.compute_text_hash(minutes_text),
+            position=boundary.boundary_position if boundary.boundary_found else None,
+            boundary_type=boundary.boundary_type,
+            confidence=boundary.confidence,
+            detection_method=boundary.detection_method,
+        )
+
+    @staticmethod
+    def _failed_boundary(minutes_text: str) -> AttendeeBoundary:
+        """境界検出に失敗したことを表す境界（議事録にはキャッシュしない）"""
+        return AttendeeBoundary(
+            text_hash=AttendeeBoundary.compute_text_hash(minutes_text),
+            position=None,
+            detection_method=_DETECTION_FAILED,
+        )
+
     async def _extract_role_name_mappings(
-        self, minutes_text: str
+        self,
+        minutes_text: str,
+        attendee_boundary: AttendeeBoundary | None = None,
     ) -> dict[str, str] | None:
         """議事録テキストから役職-人名マッピングを抽出する
 
         Args:
             minutes_text: 議事録テキスト
+            attendee_boundary: 検出済みの出席者/発言境界（Noneの場合は検出する）
 
         Returns:
             dict[str, str] | None: 役職-人名マッピング、抽出できない場合はNone
@@ -430,21 +673,13 @@ class ExecuteMinutesProcessingUseCase:
             return None
 
         try:
-            # 境界検出で出席者部分を取得
+            # 境界で出席者部分を取得
+            if attendee_boundary is None:
+                attendee_boundary = await self._detect_attendee_boundary(minutes_text)
             attendee_text = minutes_text
-            if self.minutes_divider_service:
-                boundary = await self.minutes_divider_service.detect_attendee_boundary(
-                    minutes_text
-                )
-                if boundary.boundary_found and boundary.boundary_text:
-                    attendee_text, _ = (
-                        self.minutes_divider_service.split_minutes_by_boundary(
-                            minutes_text, boundary
-                        )
-                    )
-                    logger.info(
-                        f"Attendee section extracted: {len(attendee_text)} chars"
-                    )
+            if attendee_boundary and attendee_boundary.position:
+                attendee_text = minutes_text[: attendee_boundary.position].strip()
+                logger.info(f"Attendee section extracted: {len(attendee_text)} chars")
 
             # 役職-人名マッピングを抽出
             result = await self.role_name_mapping_service.extract_role_name_mapping(
@@ -1,9 +1,12 @@
 """Use case for extracting proposal judges from web pages."""
 
+import asyncio
 import logging
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, cast
 
+from src.application.dtos.base_dto import PoliticianBaseDTO
 from src.application.dtos.proposal_judge_dto import (
     CreateProposalJudgesInputDTO,
     CreateProposalJudgesOutputDTO,
@@ -16,19 +19,120 @@ from src.application.dtos.proposal_judge_dto import (
     ProposalJudgeDTO,
 )
 from src.domain.entities.extracted_proposal_judge import ExtractedProposalJudge
+from src.domain.entities.politician_affiliation import PoliticianAffiliation
 from src.domain.entities.proposal_judge import ProposalJudge
 from src.domain.repositories.extracted_proposal_judge_repository import (
     ExtractedProposalJudgeRepository,
 )
+from src.domain.repositories.meeting_repository import MeetingRepository
+from src.domain.repositories.politician_affiliation_repository import (
+    PoliticianAffiliationRepository,
+)
 from src.domain.repositories.politician_repository import PoliticianRepository
 from src.domain.repositories.proposal_judge_repository import ProposalJudgeRepository
 from src.domain.repositories.proposal_repository import ProposalRepository
 from src.domain.services.interfaces.llm_service import ILLMService
+from src.domain.services.interfaces.politician_matching_service import (
+    IPoliticianMatchingService,
+)
 from src.domain.services.interfaces.web_scraper_service import IWebScraperService
+from src.domain.services.name_normalizer import get_name_normalizer
+from src.domain.value_objects.politician_match import PoliticianMatchRequest
 
 
 logger = logging.getLogger(__name__)
 
+# マッチングステータスを決める信頼度の閾値
+MATCHED_THRESHOLD = 0.7
+NEEDS_REVIEW_THRESHOLD = 0.5
+
+# 名簿との照合で確定した場合の信頼度
+EXACT_MATCH_CONFIDENCE = 1.0
+NORMALIZED_MATCH_CONFIDENCE = 0.95
+
+
+class _Roster:
+    """照合対象の政治家名簿
+
+    名前と正規化した名前（敬称・空白・旧字体を統一）の索引を持ち、
+    賛否情報の議員名をメモリ上で照合します。
+    """
+
+    def __init__(self, politicians: list[dict[str, Any]]):
+        """
+        Args:
+            politicians: get_all_for_matching形式の政治家（id, name, party_name）
+        """
+        self.politicians = politicians
+        self._normalizer = get_name_normalizer()
+        self._normalized: list[tuple[str, dict[str, Any]]] = []
+        self._by_name: dict[str, list[dict[str, Any]]] = {}
+        self._by_normalized: dict[str, list[dict[str, Any]]] = {}
+        for politician in politicians:
+            name = politician["name"]
+            normalized = self._normalizer.normalize(name)
+            self._normalized.append((normalized, politician))
+            self._by_name.setdefault(name, []).append(politician)
+            self._by_normalized.setdefault(normalized, []).append(politician)
+
+    def find(
+        self, name: str, party_name: str | None = None
+    ) -> tuple[dict[str, Any], float, str] | None:
+        """名前が一致する政治家を1人に特定する
+
+        同姓同名が複数いる場合は政党名で絞り込み、それでも1人に
+        特定できなければNoneを返します。
+
+        Args:
+            name: 賛否情報の議員名
+            party_name: 賛否情報の政党名
+
+        Returns:
+            (政治家, 信頼度, 理由)。特定できない場合はNone
+        """
+        exact = self._pick(self._by_name.get(name.strip(), []), party_name)
+        if exact:
+            return exact, EXACT_MATCH_CONFIDENCE, "Exact name match in roster"
+
+        normalized = self._pick(
+            self._by_normalized.get(self._normalizer.normalize(name), []), party_name
+        )
+        if normalized:
+            return (
+                normalized,
+                NORMALIZED_MATCH_CONFIDENCE,
+                "Normalized name match in roster",
+            )
+        return None
+
+    def search(self, name: str) -> list[dict[str, Any]]:
+        """名前を部分的に含む政治家を候補として返す（姓のみの表記など）"""
+        key = self._normalizer.normalize(name)
+        if not key:
+            return []
+        return [
+            politician
+            for normalized, politician in self._normalized
+            if normalized and (key in normalized or normalized in key)
+        ]
+
+    def _pick(
+        self, candidates: list[dict[str, Any]], party_name: str | None
+    ) -> dict[str, Any] | None:
+        if len(candidates) == 1:
+            return candidates[0]
+        if len(candidates) > 1 and party_name:
+            party = self._normalizer.fold(party_name).strip()
+            same_party = [
+                c
+                for c in candidates
+                if c.get("party_name")
+                and self._normalizer.fold(c["party_name"]).strip() == party
+            ]
+            if len(same_party) == 1:
+                return same_party[0]
+        return None
+
 
 class ExtractProposalJudgesUseCase:
     """議案賛否情報抽出ユースケース
@@ -49,6 +153,9 @@ class ExtractProposalJudgesUseCase:
         judge_repo: 議案賛否リポジトリ
         scraper: Webスクレイピングサービス
         llm: LLMサービス
+        affiliation_repo: 政治家所属リポジトリ
+        politician_matching_service: 政治家の一括マッチングサービス
+        meeting_repo: 会議リポジトリ
     """
 
     def __init__(
@@ -59,6 +166,10 @@ class ExtractProposalJudgesUseCase:
         proposal_judge_repository: ProposalJudgeRepository,
         web_scraper_service: IWebScraperService,
         llm_service: ILLMService,
+        politician_affiliation_repository: PoliticianAffiliationRepository
+        | None = None,
+        politician_matching_service: IPoliticianMatchingService | None = None,
+        meeting_repository: MeetingRepository | None = None,
     ):
         """議案賛否情報抽出ユースケースを初期化する
 
@@ -69,6 +180,12 @@ class ExtractProposalJudgesUseCase:
             proposal_judge_repository: 議案賛否リポジトリの実装
             web_scraper_service: Webスクレイピングサービス
             llm_service: LLMサービス
+            politician_affiliation_repository: 会議体の名簿の取得に使用する
+                所属リポジトリ（省略時は全政治家と照合）
+            politician_matching_service: 名簿で確定しなかった賛否情報の一括
+                マッチングに使用するサービス（省略時は賛否情報ごとにLLMを呼び出す）
+            meeting_repository: 議案の会議の開催日の取得に使用する会議リポジトリ
+                （省略時は開催日で所属期間を絞り込まない）
         """
         self.proposal_repo = proposal_repository
         self.politician_repo = politician_repository
@@ -76,6 +193,9 @@ class ExtractProposalJudgesUseCase:
         self.judge_repo = proposal_judge_repository
         self.scraper = web_scraper_service
         self.llm = llm_service
+        self.affiliation_repo = politician_affiliation_repository
+        self.politician_matching_service = politician_matching_service
+        self.meeting_repo = meeting_repository
 
     async def extract_judges(
         self, request: ExtractProposalJudgesInputDTO
@@ -159,7 +279,10 @@ class ExtractProposalJudgesUseCase:
     ) -> MatchProposalJudgesOutputDTO:
         """抽出済み賛否情報と既存政治家をマッチングする
 
-        LLMを使用してファジーマッチングを行い、信頼度スコアを付与します。
+        議案の会議体の名簿を1回だけ読み込み、完全一致・正規化後の一致を
+        メモリ上で確定します。確定しなかった賛否情報だけをまとめてLLMで
+        ファジーマッチングし、結果は1回の一括更新で保存します。
+        会議体の名簿で特定できない議員は全政治家の名簿で照合し直します。
         - matched: 信頼度 ≥ 0.7
         - needs_review: 0.5 ≤ 信頼度 < 0.7
         - no_match: 信頼度 < 0.5
@@ -192,15 +315,70 @@ class ExtractProposalJudgesUseCase:
 
         logger.info(f"Found {len(judges)} judges to match")
 
-        results: list[JudgeMatchResultDTO] = []
-        for judge in judges:
-            match_result = await self._match_judge_to_politician(judge)
-            results.append(match_result)
+        results: list[JudgeMatchResultDTO | None] = [None] * len(judges)
+        if judges:
+            rosters, full_roster = await self._load_rosters(judges)
+
+            # 1. 会議体の名簿とメモリ上で照合（完全一致・正規化後の一致）
+            unresolved: list[int] = []
+            for index, judge in enumerate(judges):
+                if not judge.extracted_politician_name:
+                    results[index] = self._apply_match_result(
+                        judge, None, None, 0.0, "No name to match"
+                    )
+                    continue
+                roster = rosters[judge.proposal_id]
+                roster_match = roster.find(
+                    judge.extracted_politician_name, judge.extracted_party_name
+                )
+                if not roster_match and roster is not full_roster:
+                    roster_match = full_roster.find(
+                        judge.extracted_politician_name, judge.extracted_party_name
+                    )
+                if roster_match:
+                    politician, confidence, reason = roster_match
+                    results[index] = self._apply_match_result(
+                        judge, politician["id"], politician["name"], confidence, reason
+                    )
+                else:
+                    unresolved.append(index)
+
+            # 2. 名簿で確定しなかった賛否情報だけをまとめてLLMでマッチング
+            if unresolved:
+                logger.info(
+                    f"{len(judges) - len(unresolved)} judges matched by roster, "
+                    f"{len(unresolved)} sent to LLM matching"
+                )
+                try:
+                    llm_matches = await self._match_with_llm(
+                        [judges[index] for index in unresolved], rosters, full_roster
+                    )
+                except Exception as e:
+                    # 未確定の賛否情報はpendingのまま残し、再実行で再試行する
+                    logger.error(f"LLM matching failed for proposal judges: {e}")
+                    for index in unresolved:
+                        results[index] = self._to_match_result_dto(
+                            judges[index], None, "LLM matching failed"
+                        )
+                else:
+                    for index, llm_match in zip(unresolved, llm_matches, strict=True):
+                        results[index] = self._apply_match_result(
+                            judges[index], *llm_match
+                        )
+
+            # 3. マッチング結果を1回の一括更新で保存
+            await self.extracted_repo.bulk_update_matching_results(
+                [judge for judge in judges if judge.matching_status != "pending"]
+            )
+
+        match_results = [r for r in results if r is not None]
 
         # Count by status
-        matched_count = sum(1 for r in results if r.matching_status == "matched")
-        needs_review = sum(1 for r in results if r.matching_status == "needs_review")
-        no_match = sum(1 for r in results if r.matching_status == "no_match")
+        matched_count = sum(1 for r in match_results if r.matching_status == "matched")
+        needs_review = sum(
+            1 for r in match_results if r.matching_status == "needs_review"
+        )
+        no_match = sum(1 for r in match_results if r.matching_status == "no_match")
 
         logger.info(
             f"Matching complete: {matched_count} matched, "
@@ -211,7 +389,7 @@ class ExtractProposalJudgesUseCase:
             matched_count=matched_count,
             needs_review_count=needs_review,
             no_match_count=no_match,
-            results=results,
+            results=match_results,
         )
 
     async def create_judges(
@@ -319,88 +497,241 @@ class ExtractProposalJudgesUseCase:
             judges=created_judges,
         )
 
-    async def _match_judge_to_politician(
-        self, judge: ExtractedProposalJudge
-    ) -> JudgeMatchResultDTO:
-        """個別賛否情報と政治家のマッチングを実行する
+    async def _load_rosters(
+        self, judges: list[ExtractedProposalJudge]
+    ) -> tuple[dict[int, "_Roster"], "_Roster"]:
+        """賛否情報の議案ごとに照合対象の名簿を読み込む
+
+        政治家の一覧は1回だけ取得し、議案の会議体に所属する政治家に絞り込みます。
+        所属は終了したものも含めて取得し、議案の会議の開催日が分かる場合は
+        開催日に所属していた政治家だけを名簿とします。
+        会議体が不明な議案、所属情報がない会議体は全政治家を名簿とします。
 
         Args:
-            judge: 抽出済み賛否情報エンティティ
+            judges: 抽出済み賛否情報のリスト
 
         Returns:
-            マッチング結果DTO
+            (議案IDをキーとした名簿, 全政治家の名簿)
         """
-        # Search for politicians by name
-        name = judge.extracted_politician_name or ""
-        if not name:
-            # No name to match
-            judge.matching_status = "no_match"
-            judge.matching_confidence = 0.0
-            await self.extracted_repo.update_matching_result(
-                judge.id or 0,
-                politician_id=None,
-                confidence=0.0,
-                status="no_match",
+        politicians = await self.politician_repo.get_all_for_matching()
+        full_roster = _Roster(politicians)
+
+        proposal_ids = {judge.proposal_id for judge in judges}
+        proposals = await self.proposal_repo.get_by_ids(
+            sorted(proposal_id for proposal_id in proposal_ids if proposal_id)
+        )
+        proposals_by_id = {p.id: p for p in proposals}
+
+        meeting_dates: dict[int, date | None] = {}
+        meeting_ids = {p.meeting_id for p in proposals if p.meeting_id}
+        if self.meeting_repo and meeting_ids:
+            meetings = await self.meeting_repo.get_by_ids(sorted(meeting_ids))
+            meeting_dates = {m.id: m.date for m in meetings if m.id is not None}
+
+        # 議案ごとの(会議体ID, 会議の開催日)
+        roster_keys: dict[int, tuple[int, date | None] | None] = {}
+        for proposal_id in proposal_ids:
+            proposal = proposals_by_id.get(proposal_id)
+            if proposal is None or proposal.conference_id is None:
+                roster_keys[proposal_id] = None
+                continue
+            meeting_date = (
+                meeting_dates.get(proposal.meeting_id) if proposal.meeting_id else None
             )
+            roster_keys[proposal_id] = (proposal.conference_id, meeting_date)
+
+        conference_rosters: dict[tuple[int, date | None], _Roster] = {}
+        if self.affiliation_repo:
+            affiliations_by_conference: dict[int, list[PoliticianAffiliation]] = {}
+            for key in set(roster_keys.values()):
+                if key is None:
+                    continue
+                conference_id, meeting_date = key
+                if conference_id not in affiliations_by_conference:
+                    affiliations_by_conference[
+                        conference_id
+                    ] = await self.affiliation_repo.get_by_conference(
+                        conference_id, active_only=False
+                    )
+                member_ids = {
+                    a.politician_id
+                    for a in affiliations_by_conference[conference_id]
+                    if self._affiliation_covers(a, meeting_date)
+                }
+                members = [p for p in politicians if p["id"] in member_ids]
+                if members:
+                    conference_rosters[key] = _Roster(members)
+
+        rosters = {
+            proposal_id: (
+                conference_rosters.get(key, full_roster)
+                if key is not None
+                else full_roster
+            )
+            for proposal_id, key in roster_keys.items()
+        }
+        return rosters, full_roster
+
+    @staticmethod
+    def _affiliation_covers(
+        affiliation: PoliticianAffiliation, meeting_date: date | None
+    ) -> bool:
+        """所属期間が会議の開催日を含むか（開催日が不明な場合は常にTrue）"""
+        if meeting_date is None:
+            return True
+        return affiliation.start_date <= meeting_date and (
+            affiliation.end_date is None or affiliation.end_date >= meeting_date
+        )
+
+    async def _match_with_llm(
+        self,
+        judges: list[ExtractedProposalJudge],
+        rosters: dict[int, "_Roster"],
+        full_roster: "_Roster",
+    ) -> list[tuple[int | None, str | None, float, str]]:
+        """名簿で確定しなかった賛否情報をLLMでマッチングする
+
+        まず議案の会議体の名簿を候補にマッチングし、見つからなかった賛否情報
+        だけを全政治家の名簿でもう一度マッチングします。
+
+        Args:
+            judges: 名前のある未確定の賛否情報
+            rosters: 議案IDをキーとした名簿
+            full_roster: 全政治家の名簿
 
-            return JudgeMatchResultDTO(
-                judge_id=judge.id or 0,
-                judge_name="Unknown",
-                judgment=judge.extracted_judgment or "Unknown",
-                matched_politician_id=None,
-                matched_politician_name=None,
-                confidence_score=0.0,
-                matching_status="no_match",
-                matching_notes="No name to match",
+        Returns:
+            judgesと同じ順序の(politician_id, politician_name, confidence, reason)
+        """
+        judge_rosters = [rosters[judge.proposal_id] for judge in judges]
+        matches = await self._match_in_rosters(judges, judge_rosters)
+
+        fallback = [
+            index
+            for index, match in enumerate(matches)
+            if match[0] is None and judge_rosters[index] is not full_roster
+        ]
+        if fallback:
+            fallback_matches = await self._match_in_rosters(
+                [judges[index] for index in fallback], [full_roster] * len(fallback)
             )
+            for index, match in zip(fallback, fallback_matches, strict=True):
+                if match[0] is not None:
+                    matches[index] = match
+        return matches
 
-        candidates = await self.politician_repo.search_by_name(name)
+    async def _match_in_rosters(
+        self, judges: list[ExtractedProposalJudge], judge_rosters: list["_Roster"]
+    ) -> list[tuple[int | None, str | None, float, str]]:
+        """賛否情報をそれぞれの名簿の政治家を候補としてLLMでマッチングする
 
-        # Filter by party if available
-        if judge.extracted_party_name:
-            filtered = []
-            for candidate in candidates:
-                # Check if party name matches (this would need party info on politician)
-                # For now, just add all candidates
-                filtered.append(candidate)
-            candidates = filtered if filtered else candidates
+        政治家マッチングサービスが設定されていれば、同じ名簿（会議体）の
+        賛否情報ごとに1回の一括マッチングにまとめ、名簿の政治家だけを候補にします。
+        設定されていない場合は、名簿から部分一致で候補を絞り込み、
+        賛否情報ごとのLLM呼び出しを並行して実行します。
 
-        if not candidates:
-            # No candidates found
-            judge.matching_status = "no_match"
-            judge.matching_confidence = 0.0
-            await self.extracted_repo.update_matching_result(
-                judge.id or 0,
-                politician_id=None,
-                confidence=0.0,
-                status="no_match",
+        Args:
+            judges: 名前のある未確定の賛否情報
+            judge_rosters: judgesと同じ順序の照合対象の名簿
+
+        Returns:
+            judgesと同じ順序の(politician_id, politician_name, confidence, reason)
+        """
+        if self.politician_matching_service:
+            groups: dict[int, tuple[_Roster, list[int]]] = {}
+            for index, roster in enumerate(judge_rosters):
+                groups.setdefault(id(roster), (roster, []))[1].append(index)
+
+            group_matches = await asyncio.gather(
+                *(
+                    self._match_roster_judges(
+                        self.politician_matching_service,
+                        [judges[index] for index in indices],
+                        roster,
+                    )
+                    for roster, indices in groups.values()
+                )
+            )
+            matches: dict[int, tuple[int | None, str | None, float, str]] = {}
+            for (_, indices), group_match in zip(
+                groups.values(), group_matches, strict=True
+            ):
+                matches.update(zip(indices, group_match, strict=True))
+            return [matches[index] for index in range(len(judges))]
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self._match_judge_with_llm(judge, roster)
+                    for judge, roster in zip(judges, judge_rosters, strict=True)
+                )
             )
+        )
+
+    @staticmethod
+    async def _match_roster_judges(
+        matching_service: IPoliticianMatchingService,
+        judges: list[ExtractedProposalJudge],
+        roster: "_Roster",
+    ) -> list[tuple[int | None, str | None, float, str]]:
+        """同じ名簿の賛否情報を名簿の政治家を候補として一括マッチングする
 
-            return JudgeMatchResultDTO(
-                judge_id=judge.id or 0,
-                judge_name=name,
-                judgment=judge.extracted_judgment or "Unknown",
-                matched_politician_id=None,
-                matched_politician_name=None,
-                confidence_score=0.0,
-                matching_status="no_match",
-                matching_notes="No matching politicians found",
+        Args:
+            matching_service: 政治家の一括マッチングサービス
+            judges: 同じ名簿で照合する未確定の賛否情報
+            roster: 照合対象の名簿
+
+        Returns:
+            judgesと同じ順序の(politician_id, politician_name, confidence, reason)
+        """
+        matches = await matching_service.find_best_matches(
+            [
+                PoliticianMatchRequest(
+                    speaker_name=judge.extracted_politician_name or "",
+                    speaker_type="議員",
+                    speaker_party=judge.extracted_party_name,
+                )
+                for judge in judges
+            ],
+            available_politicians=roster.politicians,
+        )
+        return [
+            (
+                match.politician_id,
+                match.politician_name,
+                match.confidence,
+                match.reason,
             )
+            if match.matched and match.politician_id is not None
+            else (None, None, 0.0, match.reason or "LLM could not find a match")
+            for match in matches
+        ]
 
-        # Use LLM for fuzzy matching
-        from typing import cast
+    async def _match_judge_with_llm(
+        self, judge: ExtractedProposalJudge, roster: "_Roster"
+    ) -> tuple[int | None, str | None, float, str]:
+        """個別の賛否情報を名簿の候補からLLMでマッチングする
 
-        from src.application.dtos.base_dto import PoliticianBaseDTO
+        Args:
+            judge: 抽出済み賛否情報エンティティ
+            roster: 照合対象の名簿
+
+        Returns:
+            (politician_id, politician_name, confidence, reason)
+        """
+        name = judge.extracted_politician_name or ""
+        candidates = roster.search(name)
+        if not candidates:
+            return None, None, 0.0, "No matching politicians found"
 
         candidate_dtos = cast(
             list[PoliticianBaseDTO],
             [
                 {
-                    "id": c.id,
-                    "name": c.name,
-                    "party_id": c.political_party_id,
+                    "id": c["id"],
+                    "name": c["name"],
+                    "party_id": None,
                     "prefecture": None,
-                    "electoral_district": None,
+                    "electoral_district": c.get("district"),
                     "profile_url": None,
                     "image_url": None,
                     "created_at": datetime.now(),
@@ -418,61 +749,70 @@ class ExtractProposalJudgesUseCase:
         )
 
         if match_result and match_result["matched_id"]:
-            politician = await self.politician_repo.get_by_id(
-                match_result["matched_id"]
+            politician = next(
+                (c for c in candidates if c["id"] == match_result["matched_id"]), None
             )
             if politician:
-                confidence = match_result["confidence"]
-
-                # Determine status based on confidence
-                if confidence >= 0.7:
-                    status = "matched"
-                elif confidence >= 0.5:
-                    status = "needs_review"
-                else:
-                    status = "no_match"
-
-                # Update judge
-                judge.matched_politician_id = politician.id
-                judge.matching_confidence = confidence
-                judge.matching_status = status
-                await self.extracted_repo.update_matching_result(
-                    judge.id or 0,
-                    politician_id=judge.matched_politician_id,
-                    confidence=judge.matching_confidence,
-                    status=judge.matching_status,
+                return (
+                    politician["id"],
+                    politician["name"],
+                    match_result["confidence"],
+                    match_result.get("reason", ""),
                 )
 
-                return JudgeMatchResultDTO(
-                    judge_id=judge.id or 0,
-                    judge_name=name,
-                    judgment=judge.extracted_judgment or "Unknown",
-                    matched_politician_id=politician.id,
-                    matched_politician_name=politician.name,
-                    confidence_score=confidence,
-                    matching_status=status,
-                    matching_notes=match_result.get("reason", ""),
-                )
+        return None, None, 0.0, "LLM could not find a match"
 
-        # No match
-        judge.matching_status = "no_match"
-        judge.matching_confidence = 0.0
-        await self.extracted_repo.update_matching_result(
-            judge.id or 0,
-            politician_id=None,
-            confidence=0.0,
-            status="no_match",
-        )
+    def _apply_match_result(
+        self,
+        judge: ExtractedProposalJudge,
+        politician_id: int | None,
+        politician_name: str | None,
+        confidence: float,
+        notes: str,
+    ) -> JudgeMatchResultDTO:
+        """マッチング結果を賛否情報エンティティに反映する
 
+        Args:
+            judge: 抽出済み賛否情報エンティティ
+            politician_id: マッチした政治家ID（マッチなしの場合None）
+            politician_name: マッチした政治家名
+            confidence: 信頼度
+            notes: マッチングの理由
+
+        Returns:
+            マッチング結果DTO
+        """
+        if politician_id is None:
+            confidence = 0.0
+            status = "no_match"
+        elif confidence >= MATCHED_THRESHOLD:
+            status = "matched"
+        elif confidence >= NEEDS_REVIEW_THRESHOLD:
+            status = "needs_review"
+        else:
+            status = "no_match"
+
+        judge.matched_politician_id = politician_id
+        judge.matching_confidence = confidence
+        judge.matching_status = status
+        return self._to_match_result_dto(judge, politician_name, notes)
+
+    def _to_match_result_dto(
+        self,
+        judge: ExtractedProposalJudge,
+        politician_name: str | None,
+        notes: str,
+    ) -> JudgeMatchResultDTO:
+        """賛否情報エンティティをマッチング結果DTOに変換する"""
         return JudgeMatchResultDTO(
             judge_id=judge.id or 0,
-            judge_name=name,
+            judge_name=judge.extracted_politician_name or "Unknown",
             judgment=judge.extracted_judgment or "Unknown",
-            matched_politician_id=None,
-            matched_politician_name=None,
-            confidence_score=0.0,
-            matching_status="no_match",
-            matching_notes="LLM could not find a match",
+            matched_politician_id=judge.matched_politician_id,
+            matched_politician_name=politician_name,
+            confidence_score=judge.matching_confidence or 0.0,
+            matching_status=judge.matching_status,
+            matching_notes=notes,
         )
 
     def _to_extracted_dto(self, judge: ExtractedProposalJudge) -> ExtractedJudgeDTO:
@@ -5,8 +5,7 @@
 
 import logging
 
-from collections import defaultdict
-from datetime import date, datetime
+from datetime import datetime
 from uuid import UUID
 
 from src.application.dtos.user_statistics_dto import (
@@ -15,7 +14,9 @@ from src.application.dtos.user_statistics_dto import (
     UserStatisticsDTO,
 )
 from src.application.dtos.work_history_dto import WorkType
-from src.application.usecases.get_work_history_usecase import GetWorkHistoryUseCase
+from src.domain.repositories.work_statistics_repository import (
+    IWorkStatisticsRepository,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -24,17 +25,18 @@ logger = logging.getLogger(__name__)
 class GetUserStatisticsUseCase:
     """ユーザー統計取得ユースケース
 
-    作業履歴データを基に、ユーザー別の統計情報を集計します。
+    作業件数をデータベース側で集計し、ユーザー別の統計情報を提供します。
     時系列データや上位貢献者ランキングを含む包括的な統計を提供します。
+    集計結果のみを取得するため、作業履歴の蓄積量に関わらず処理コストは一定です。
     """
 
-    def __init__(self, work_history_usecase: GetWorkHistoryUseCase) -> None:
+    def __init__(self, work_statistics_repository: IWorkStatisticsRepository) -> None:
         """ユースケースを初期化する
 
         Args:
-            work_history_usecase: 作業履歴取得ユースケース
+            work_statistics_repository: 作業統計リポジトリ
         """
-        self.work_history_usecase = work_history_usecase
+        self.work_statistics_repo = work_statistics_repository
 
     async def execute(
         self,
@@ -56,85 +58,60 @@ class GetUserStatisticsUseCase:
         Returns:
             ユーザー統計情報のDTO
         """
+        work_type_values = (
+            [work_type.value for work_type in work_types]
+            if work_types is not None
+            else None
+        )
+        repo = self.work_statistics_repo
+
         try:
-            # すべての履歴を取得（limit を大きく設定）
-            histories = await self.work_history_usecase.execute(
-                user_id=user_id,
-                work_types=work_types,
-                start_date=start_date,
-                end_date=end_date,
-                limit=100000,  # 統計用に大量取得
+            # 作業タイプごとのカウント
+            work_type_counts = await repo.get_counts_by_work_type(
+                user_id, work_type_values, start_date, end_date
             )
+            total_count = sum(work_type_counts.values())
 
-            # 基本統計の集計
-            total_count = len(histories)
-            work_type_counts: dict[str, int] = {}
+            # ユーザーごとのカウント
             user_counts: dict[str, int] = {}
-            user_details: dict[str, tuple[str | None, str | None, dict[str, int]]] = {}
-
-            # 時系列データの集計用
-            timeline_by_date: dict[tuple[date, WorkType | None], int] = defaultdict(int)
-
-            for history in histories:
-                # 作業タイプごとのカウント
-                work_type = history.work_type.value
-                work_type_counts[work_type] = work_type_counts.get(work_type, 0) + 1
-
-                # ユーザーごとのカウント
+            for user_count in await repo.get_counts_by_user(
+                user_id, work_type_values, start_date, end_date
+            ):
                 user_key = (
-                    f"{history.user_name} ({history.user_email})"
-                    if history.user_name
-                    else str(history.user_id)
+                    f"{user_count['user_name']} ({user_count['user_email']})"
+                    if user_count["user_name"]
+                    else str(user_count["user_id"])
                 )
-                user_counts[user_key] = user_counts.get(user_key, 0) + 1
-
-                # ユーザー詳細情報の保存（ランキング用）
-                if user_key not in user_details:
-                    user_details[user_key] = (
-                        history.user_name,
-                        history.user_email,
-                        {},
-                    )
-
-                # 作業タイプ別内訳の更新
-                breakdown = user_details[user_key][2]
-                breakdown[work_type] = breakdown.get(work_type, 0) + 1
-
-                # 時系列データの集計（日別）
-                work_date = history.executed_at.date()
-                timeline_by_date[(work_date, None)] += 1
-                timeline_by_date[(work_date, history.work_type)] += 1
-
-            # 時系列データの作成
-            timeline_data = []
-            # 全タイプ集計のみを抽出（個別タイプは除外してシンプルに）
-            all_type_timeline = {
-                date_val: count
-                for (date_val, work_type), count in timeline_by_date.items()
-                if work_type is None
-            }
-            for date_val, count in sorted(all_type_timeline.items()):
-                timeline_data.append(
-                    TimelineDataPoint(date=date_val, count=count, work_type=None)
+                user_counts[user_key] = (
+                    user_counts.get(user_key, 0) + (user_count["total_count"])
                 )
 
+            # 時系列データの作成（日別、全タイプ集計）
+            timeline_data = [
+                TimelineDataPoint(
+                    date=daily["date"], count=daily["count"], work_type=None
+                )
+                for daily in await repo.get_daily_counts(
+                    user_id, work_type_values, start_date, end_date
+                )
+            ]
+
             # 上位貢献者ランキングの作成
-            top_contributors = []
-            sorted_users = sorted(
-                user_counts.items(), key=lambda x: x[1], reverse=True
-            )[:top_n]
-
-            for rank, (user_key, total_works) in enumerate(sorted_users, start=1):
-                user_name, user_email, breakdown = user_details[user_key]
-                top_contributors.append(
-                    ContributorRank(
-                        rank=rank,
-                        user_name=user_name,
-                        user_email=user_email,
-                        total_works=total_works,
-                        work_type_breakdown=breakdown,
-                    )
+            top_contributors = [
+                ContributorRank(
+                    rank=rank,
+                    user_name=contributor["user_name"],
+                    user_email=contributor["user_email"],
+                    total_works=contributor["total_count"],
+                    work_type_breakdown=contributor["by_type"],
+                )
+                for rank, contributor in enumerate(
+                    await repo.get_top_contributors(
+                        top_n, user_id, work_type_values, start_date, end_date
+                    ),
+                    start=1,
                 )
+            ]
 
             return UserStatisticsDTO(
                 total_count=total_count,
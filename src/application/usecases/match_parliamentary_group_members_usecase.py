@@ -66,15 +66,17 @@ class MatchParliamentaryGroupMembersUseCase:
         )
 
         results: list[dict[str, str | int | float | None]] = []
+        if not pending_members:
+            return results
 
-        for member in pending_members:
-            # マッチング処理を実行
-            (
-                matched_politician_id,
-                confidence,
-                reason,
-            ) = await self.matching_service.find_matching_politician(member)
+        # マッチング処理を一括で実行（未解決メンバーはまとめてLLMに問い合わせる）
+        match_results = await self.matching_service.find_matching_politicians(
+            pending_members
+        )
 
+        for member, (matched_politician_id, confidence, reason) in zip(
+            pending_members, match_results, strict=True
+        ):
             # ステータスを決定
             status = self.matching_service.determine_matching_status(confidence)
 
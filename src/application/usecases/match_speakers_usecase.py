@@ -16,9 +16,14 @@ from src.common.logging import get_logger
 from src.domain.entities.speaker import Speaker
 from src.domain.repositories.conversation_repository import ConversationRepository
 from src.domain.repositories.minutes_repository import MinutesRepository
+from src.domain.repositories.political_party_repository import (
+    PoliticalPartyRepository,
+)
 from src.domain.repositories.politician_repository import PoliticianRepository
 from src.domain.repositories.speaker_repository import SpeakerRepository
 from src.domain.services.interfaces.llm_service import ILLMService
+from src.domain.services.name_similarity import NAME_MATCH_THRESHOLD, adjust_for_party
+from src.domain.services.party_id_resolver import PartyIdResolver
 from src.domain.services.speaker_domain_service import SpeakerDomainService
 
 
@@ -65,6 +70,7 @@ class MatchSpeakersUseCase:
         update_speaker_usecase: UpdateSpeakerFromExtractionUseCase,
         baml_matching_service: IPoliticianMatchingService | None = None,
         minutes_repository: MinutesRepository | None = None,
+        political_party_repository: PoliticalPartyRepository | None = None,
     ):
         """発言者マッチングユースケースを初期化する
 
@@ -77,6 +83,8 @@ class MatchSpeakersUseCase:
             update_speaker_usecase: Speaker更新UseCase（抽出ログ統合）
             baml_matching_service: BAMLベースの政治家マッチングサービス（Issue #885）
             minutes_repository: 議事録リポジトリ（役職-人名マッピング取得用）
+            political_party_repository: 政党リポジトリ（政党名から政党IDの解決用。
+                省略時は政党による補正を行わない）
         """
         self.speaker_repo = speaker_repository
         self.politician_repo = politician_repository
@@ -86,6 +94,11 @@ class MatchSpeakersUseCase:
         self.update_speaker_usecase = update_speaker_usecase
         self.baml_matching_service = baml_matching_service
         self.minutes_repo = minutes_repository
+        self.party_id_resolver = (
+            PartyIdResolver(political_party_repository)
+            if political_party_repository is not None
+            else None
+        )
 
     async def execute(
         self,
@@ -200,7 +213,8 @@ class MatchSpeakersUseCase:
         """ルールベースの発言者マッチングを実行する
 
         名前の類似度と政党情報を使用してマッチングします。
-        類似度が0.8以上の場合にマッチとみなします。
+        所属政党が政党IDに解決でき、候補の政党と一致する場合は加点、
+        異なる場合は減点し、NAME_MATCH_THRESHOLD以上の場合にマッチとみなします。
 
         Args:
             speaker: マッチング対象の発言者
@@ -213,21 +227,28 @@ class MatchSpeakersUseCase:
 
         # Search for politicians with similar names
         candidates = await self.politician_repo.search_by_name(normalized_name)
+        if not candidates:
+            return None
+
+        party_id = (
+            await self.party_id_resolver.resolve(speaker.political_party_name)
+            if self.party_id_resolver is not None
+            else None
+        )
         best_match = None
         best_score = 0.0
 
         for candidate in candidates:
-            # Calculate similarity
-            score = self.speaker_service.calculate_name_similarity(
-                speaker.name, candidate.name
+            # Calculate similarity and adjust it by the resolved party
+            score = adjust_for_party(
+                self.speaker_service.calculate_name_similarity(
+                    speaker.name, candidate.name
+                ),
+                party_id,
+                candidate.political_party_id,
             )
 
-            # Boost score if party matches
-            if speaker.political_party_name and candidate.political_party_id:
-                # Would need to lookup party name
-                score += 0.1
-
-            if score > best_score and score >= 0.8:
+            if score > best_score and score >= NAME_MATCH_THRESHOLD:
                 best_match = candidate
                 best_score = score
 
@@ -290,6 +290,22 @@ class CommonMetrics:
             "1",
         )
 
+    @staticmethod
+    def llm_requests_coalesced():
+        return create_counter(
+            "llm_requests_coalesced_total",
+            "Number of LLM calls served by an identical in-flight request",
+            "1",
+        )
+
+    @staticmethod
+    def llm_rate_limit_wait():
+        return create_histogram(
+            "llm_rate_limit_wait_seconds",
+            "Time spent waiting in the LLM rate limiter queue",
+            "s",
+        )
+
 
 def record_error(error_type: str, operation: str) -> None:
     """エラーを記録する共通関数.
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from src.domain.entities.base import BaseEntity
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 
 
 class Minutes(BaseEntity):
@@ -14,6 +15,7 @@ class Minutes(BaseEntity):
         url: str | None = None,
         processed_at: datetime | None = None,
         role_name_mappings: dict[str, str] | None = None,
+        attendee_boundary: AttendeeBoundary | None = None,
         id: int | None = None,
     ) -> None:
         super().__init__(id)
@@ -21,6 +23,7 @@ class Minutes(BaseEntity):
         self.url = url
         self.processed_at = processed_at
         self.role_name_mappings = role_name_mappings
+        self.attendee_boundary = attendee_boundary
 
     def __str__(self) -> str:
         return f"Minutes for meeting #{self.meeting_id}"
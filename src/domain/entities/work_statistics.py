@@ -0,0 +1,43 @@
+"""Work statistics entities for contribution aggregation queries."""
+
+from datetime import date
+from typing import TypedDict
+from uuid import UUID
+
+
+class DailyWorkCount(TypedDict):
+    """Number of works executed on a single day.
+
+    Attributes:
+        date: Day the works were executed
+        count: Number of works on that day
+    """
+
+    date: date
+    count: int
+
+
+class UserWorkCount(TypedDict):
+    """Total number of works executed by a user.
+
+    Attributes:
+        user_id: ID of the user who executed the works
+        user_name: Display name of the user (None if not registered)
+        user_email: Email address of the user (None if not registered)
+        total_count: Total number of works
+    """
+
+    user_id: UUID
+    user_name: str | None
+    user_email: str | None
+    total_count: int
+
+
+class ContributorWorkStats(UserWorkCount):
+    """Work counts of a top contributor with a per-work-type breakdown.
+
+    Attributes:
+        by_type: Number of works keyed by work type value
+    """
+
+    by_type: dict[str, int]
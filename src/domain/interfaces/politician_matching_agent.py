@@ -13,16 +13,16 @@ class IPoliticianMatchingAgent(ABC):
     """政治家マッチングエージェントのインターフェース
 
     発言者と政治家のマッチング処理を行うエージェントの
-    抽象インターフェースです。LangGraphベースの実装など、
-    具体的な実装はインフラストラクチャ層で提供されます。
+    抽象インターフェースです。具体的な実装は
+    インフラストラクチャ層で提供されます。
 
     依存性逆転の原則に従い、このインターフェースを使用することで、
     アプリケーション層やユースケースは具体的な実装に依存せず、
     テスト時のモック注入が容易になります。
 
     特徴:
-        - ReActパターンによる反復的推論
-        - ルールベースマッチング（高速パス）との統合
+        - 候補検索・所属情報の取得・LLM判定を固定の手順で実行
+        - 名前が一意に一致する場合はLLMを呼び出さない（高速パス）
         - BAMLによるLLM通信の抽象化
     """
 
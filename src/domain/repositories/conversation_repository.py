@@ -17,6 +17,33 @@ class ConversationRepository(BaseRepository[Conversation]):
         """Get all conversations for a minutes record."""
         pass
 
+    @abstractmethod
+    async def exists_by_minutes(self, minutes_id: int) -> bool:
+        """Check whether any conversation exists for a minutes record."""
+        pass
+
+    @abstractmethod
+    async def count_by_minutes(self, minutes_id: int) -> int:
+        """Count conversations for a minutes record."""
+        pass
+
+    @abstractmethod
+    async def count_distinct_speakers_by_minutes(self, minutes_id: int) -> int:
+        """Count distinct linked speakers among a minutes record's conversations."""
+        pass
+
+    @abstractmethod
+    async def delete_by_minutes(self, minutes_id: int) -> list[int]:
+        """Delete all conversations for a minutes record in one statement.
+
+        Extraction logs recorded for the deleted conversations are removed
+        in the same statement.
+
+        Returns:
+            IDs of the deleted conversations
+        """
+        pass
+
     @abstractmethod
     async def get_by_meeting(
         self, meeting_id: int, limit: int | None = None
@@ -43,6 +43,20 @@ class ExtractedProposalJudgeRepository(BaseRepository[ExtractedProposalJudge]):
         """Update the matching result for a judge."""
         pass
 
+    @abstractmethod
+    async def bulk_update_matching_results(
+        self, judges: list[ExtractedProposalJudge]
+    ) -> int:
+        """Write the matching results of multiple judges in a single statement.
+
+        Each judge's matched_politician_id, matched_parliamentary_group_id,
+        matching_confidence and matching_status are stored.
+
+        Returns:
+            Number of updated rows
+        """
+        pass
+
     @abstractmethod
     async def get_by_proposal(self, proposal_id: int) -> list[ExtractedProposalJudge]:
         """Get all extracted judges for a proposal."""
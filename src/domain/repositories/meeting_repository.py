@@ -6,6 +6,7 @@ from typing import Any
 
 from src.domain.entities.meeting import Meeting
 from src.domain.repositories.base import BaseRepository
+from src.domain.value_objects.meeting_summary import MeetingSummary
 
 
 class MeetingRepository(BaseRepository[Meeting]):
@@ -25,6 +26,18 @@ class MeetingRepository(BaseRepository[Meeting]):
         """Get all meetings for a conference."""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, entity_ids: list[int]) -> list[Meeting]:
+        """Get meetings by IDs in a single query.
+
+        Args:
+            entity_ids: Meeting IDs to fetch
+
+        Returns:
+            List of the meetings found (IDs that do not exist are skipped)
+        """
+        pass
+
     @abstractmethod
     async def get_unprocessed(self, limit: int | None = None) -> list[Meeting]:
         """Get meetings that haven't been processed yet."""
@@ -61,3 +74,21 @@ class MeetingRepository(BaseRepository[Meeting]):
     ) -> dict[str, Any] | None:
         """Get meeting by ID with conference and governing body info."""
         pass
+
+    @abstractmethod
+    async def get_meeting_summaries(
+        self,
+        conference_id: int | None = None,
+        governing_body_id: int | None = None,
+        processing_status: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[MeetingSummary], int]:
+        """Get meeting summaries with counters, filters and pagination.
+
+        Filtering, counting and pagination are done in a single query.
+
+        Returns:
+            Tuple of (meeting summaries, total count matching the filters)
+        """
+        pass
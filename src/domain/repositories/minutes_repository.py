@@ -4,6 +4,7 @@ from abc import abstractmethod
 
 from src.domain.entities.minutes import Minutes
 from src.domain.repositories.base import BaseRepository
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 
 
 class MinutesRepository(BaseRepository[Minutes]):
@@ -44,6 +45,21 @@ class MinutesRepository(BaseRepository[Minutes]):
         """
         pass
 
+    @abstractmethod
+    async def update_attendee_boundary(
+        self, minutes_id: int, boundary: AttendeeBoundary
+    ) -> bool:
+        """議事録の出席者/発言境界のキャッシュを更新する
+
+        Args:
+            minutes_id: 議事録ID
+            boundary: 検出済みの境界
+
+        Returns:
+            bool: 更新成功の場合True
+        """
+        pass
+
     @abstractmethod
     async def get_all(
         self, limit: int | None = None, offset: int | None = None
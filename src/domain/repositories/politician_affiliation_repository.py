@@ -31,6 +31,13 @@ class PoliticianAffiliationRepository(BaseRepository[PoliticianAffiliation]):
         """Get all affiliations for a politician."""
         pass
 
+    @abstractmethod
+    async def get_by_politicians(
+        self, politician_ids: list[int], active_only: bool = True
+    ) -> list[PoliticianAffiliation]:
+        """Get affiliations for multiple politicians in a single query."""
+        pass
+
     @abstractmethod
     async def upsert(
         self,
@@ -9,6 +9,18 @@ from src.domain.repositories.base import BaseRepository
 class ProposalRepository(BaseRepository[Proposal]):
     """Proposal repository interface."""
 
+    @abstractmethod
+    async def get_by_ids(self, entity_ids: list[int]) -> list[Proposal]:
+        """Get proposals by IDs in a single query.
+
+        Args:
+            entity_ids: Proposal IDs to fetch
+
+        Returns:
+            List of the proposals found (IDs that do not exist are skipped)
+        """
+        pass
+
     @abstractmethod
     async def get_by_meeting_id(self, meeting_id: int) -> list[Proposal]:
         """Get proposals by meeting ID.
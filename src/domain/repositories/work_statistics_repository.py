@@ -0,0 +1,112 @@
+"""Repository interface for user work statistics."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.work_statistics import (
+    ContributorWorkStats,
+    DailyWorkCount,
+    UserWorkCount,
+)
+
+
+class IWorkStatisticsRepository(ABC):
+    """Repository interface for user work statistics.
+
+    Works are the speaker-politician matchings, parliamentary group membership
+    creations and politician/proposal operations executed by users. All
+    aggregation is performed in the database so that the cost does not grow
+    with the amount of accumulated history.
+
+    Work types are identified by their string values (e.g.
+    "speaker_politician_matching", "politician_create"). Passing ``None`` as
+    ``work_types`` includes every work type.
+    """
+
+    @abstractmethod
+    async def get_counts_by_work_type(
+        self,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, int]:
+        """Count works grouped by work type.
+
+        Args:
+            user_id: Filter by user ID (None for all users)
+            work_types: Filter by work type values (None for all types)
+            start_date: Include works executed at or after this time
+            end_date: Include works executed at or before this time
+
+        Returns:
+            dict[str, int]: Number of works keyed by work type value
+        """
+        pass
+
+    @abstractmethod
+    async def get_daily_counts(
+        self,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[DailyWorkCount]:
+        """Count works grouped by the day they were executed.
+
+        Args:
+            user_id: Filter by user ID (None for all users)
+            work_types: Filter by work type values (None for all types)
+            start_date: Include works executed at or after this time
+            end_date: Include works executed at or before this time
+
+        Returns:
+            list[DailyWorkCount]: Daily counts ordered by date
+        """
+        pass
+
+    @abstractmethod
+    async def get_counts_by_user(
+        self,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[UserWorkCount]:
+        """Count works grouped by user.
+
+        Args:
+            user_id: Filter by user ID (None for all users)
+            work_types: Filter by work type values (None for all types)
+            start_date: Include works executed at or after this time
+            end_date: Include works executed at or before this time
+
+        Returns:
+            list[UserWorkCount]: Per-user counts ordered by total count descending
+        """
+        pass
+
+    @abstractmethod
+    async def get_top_contributors(
+        self,
+        limit: int,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[ContributorWorkStats]:
+        """Get the users with the most works and their per-type breakdown.
+
+        Args:
+            limit: Maximum number of contributors to return
+            user_id: Filter by user ID (None for all users)
+            work_types: Filter by work type values (None for all types)
+            start_date: Include works executed at or after this time
+            end_date: Include works executed at or before this time
+
+        Returns:
+            list[ContributorWorkStats]: Contributors ordered by total count
+                descending
+        """
+        pass
@@ -13,6 +13,9 @@ from src.domain.services.interfaces.politician_matching_service import (
 from src.domain.services.interfaces.proposal_scraper_service import (
     IProposalScraperService,
 )
+from src.domain.services.interfaces.structured_minutes_source import (
+    IStructuredMinutesSource,
+)
 from src.domain.services.interfaces.web_scraper_service import IWebScraperService
 
 
@@ -22,5 +25,6 @@ __all__ = [
     "IPageClassifierService",
     "IPoliticianMatchingService",
     "IProposalScraperService",
+    "IStructuredMinutesSource",
     "IWebScraperService",
 ]
@@ -38,6 +38,24 @@ class LinkClassificationResult(BaseModel):
         default_factory=dict,
     )
 
+    @classmethod
+    def from_classifications(
+        cls, classifications: list[LinkClassification]
+    ) -> "LinkClassificationResult":
+        """Create a result whose summary counts the given classifications.
+
+        Args:
+            classifications: Link classifications to include
+
+        Returns:
+            LinkClassificationResult with summary by link type
+        """
+        summary: dict[str, int] = {}
+        for classification in classifications:
+            link_type = classification.link_type.value
+            summary[link_type] = summary.get(link_type, 0) + 1
+        return cls(classifications=classifications, summary=summary)
+
 
 class ILLMLinkClassifierService(ABC):
     """Interface for LLM-based link classification.
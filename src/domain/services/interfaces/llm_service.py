@@ -134,3 +134,14 @@ class ILLMService(Protocol):
             The response content from the LLM
         """
         ...
+
+    async def ainvoke_llm(self, messages: list[dict[str, str]]) -> str:
+        """Invoke the LLM asynchronously with messages and return the content.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+
+        Returns:
+            The response content from the LLM
+        """
+        ...
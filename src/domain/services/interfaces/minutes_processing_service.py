@@ -2,6 +2,7 @@
 
 from typing import Protocol
 
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 
 
@@ -17,6 +18,7 @@ class IMinutesProcessingService(Protocol):
         self,
         original_minutes: str,
         role_name_mappings: dict[str, str] | None = None,
+        attendee_boundary: AttendeeBoundary | None = None,
     ) -> list[SpeakerSpeech]:
         """Process meeting minutes text and extract speeches.
 
@@ -24,6 +26,8 @@ class IMinutesProcessingService(Protocol):
             original_minutes: Raw meeting minutes text content
             role_name_mappings: 役職-人名マッピング辞書（例: {"議長": "伊藤条一"}）
                 発言者名が役職のみの場合に実名に変換するために使用（Issue #946）
+            attendee_boundary: Already detected attendee/speech boundary of
+                original_minutes. When given, boundary detection is skipped.
 
         Returns:
             List of extracted speeches with speaker information
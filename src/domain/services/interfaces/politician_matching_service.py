@@ -4,9 +4,13 @@
 Domain層に配置され、Infrastructure層の実装から実装されます。
 """
 
-from typing import Protocol
+from collections.abc import Sequence
+from typing import Any, Protocol
 
-from src.domain.value_objects.politician_match import PoliticianMatch
+from src.domain.value_objects.politician_match import (
+    PoliticianMatch,
+    PoliticianMatchRequest,
+)
 
 
 class IPoliticianMatchingService(Protocol):
@@ -43,3 +47,27 @@ class IPoliticianMatchingService(Protocol):
                 （マッチの有無、政治家情報、信頼度、理由を含む）
         """
         ...
+
+    async def find_best_matches(
+        self,
+        requests: Sequence[PoliticianMatchRequest],
+        batch_size: int | None = None,
+        available_politicians: Sequence[dict[str, Any]] | None = None,
+    ) -> list[PoliticianMatch]:
+        """複数の発言者に最適な政治家マッチを一括で見つける
+
+        ルールベースで確定しなかった発言者を所属政党ごとにまとめ、
+        共通の候補リストに対して1回のLLM呼び出しで複数名をマッチングします。
+        結果は発言者ごとに検証され、不正な結果の発言者は個別呼び出しで再試行されます。
+
+        Args:
+            requests: マッチング要求のリスト
+            batch_size: 1回のLLM呼び出しでマッチングする最大人数
+                （省略時は実装のデフォルト）
+            available_politicians: 候補とする政治家（id, name, party_nameを持つ辞書）。
+                会議体の名簿などに候補を限定する場合に指定する（省略時は全政治家）
+
+        Returns:
+            list[PoliticianMatch]: requestsと同じ順序のマッチング結果
+        """
+        ...
@@ -0,0 +1,40 @@
+"""Structured minutes source interface definition for domain layer."""
+
+from typing import Protocol
+
+from src.domain.value_objects.speaker_speech import SpeakerSpeech
+
+
+class IStructuredMinutesSource(Protocol):
+    """Interface for minutes systems that publish per-speech records.
+
+    Some minutes systems (e.g. the National Diet minutes API) already record
+    each speech with its speaker and order. Speeches from such a source can be
+    saved as conversations directly, without dividing the minutes text with
+    an LLM.
+    """
+
+    def supports(self, url: str) -> bool:
+        """Return whether speeches for the minutes at url can be fetched.
+
+        Args:
+            url: Minutes URL of the meeting
+
+        Returns:
+            True if this source can provide the speeches
+        """
+        ...
+
+    async def fetch_speeches(self, url: str) -> list[SpeakerSpeech]:
+        """Fetch the speeches of the minutes at url in speaking order.
+
+        Args:
+            url: Minutes URL of the meeting
+
+        Returns:
+            Speeches with speech_order set to their position in the minutes
+
+        Raises:
+            ValueError: If url is not supported or has no speech records
+        """
+        ...
@@ -0,0 +1,257 @@
+"""Rule-based classification of obvious links on party member pages."""
+
+import re
+
+from urllib.parse import parse_qs, urlparse
+
+from src.domain.services.interfaces.llm_link_classifier_service import (
+    LinkClassification,
+    LinkType,
+)
+from src.domain.value_objects.link import Link
+
+
+# (Japanese name with suffix, romanized name) for the 47 prefectures
+PREFECTURES: tuple[tuple[str, str], ...] = (
+    ("北海道", "hokkaido"),
+    ("青森県", "aomori"),
+    ("岩手県", "iwate"),
+    ("宮城県", "miyagi"),
+    ("秋田県", "akita"),
+    ("山形県", "yamagata"),
+    ("福島県", "fukushima"),
+    ("茨城県", "ibaraki"),
+    ("栃木県", "tochigi"),
+    ("群馬県", "gunma"),
+    ("埼玉県", "saitama"),
+    ("千葉県", "chiba"),
+    ("東京都", "tokyo"),
+    ("神奈川県", "kanagawa"),
+    ("新潟県", "niigata"),
+    ("富山県", "toyama"),
+    ("石川県", "ishikawa"),
+    ("福井県", "fukui"),
+    ("山梨県", "yamanashi"),
+    ("長野県", "nagano"),
+    ("岐阜県", "gifu"),
+    ("静岡県", "shizuoka"),
+    ("愛知県", "aichi"),
+    ("三重県", "mie"),
+    ("滋賀県", "shiga"),
+    ("京都府", "kyoto"),
+    ("大阪府", "osaka"),
+    ("兵庫県", "hyogo"),
+    ("奈良県", "nara"),
+    ("和歌山県", "wakayama"),
+    ("鳥取県", "tottori"),
+    ("島根県", "shimane"),
+    ("岡山県", "okayama"),
+    ("広島県", "hiroshima"),
+    ("山口県", "yamaguchi"),
+    ("徳島県", "tokushima"),
+    ("香川県", "kagawa"),
+    ("愛媛県", "ehime"),
+    ("高知県", "kochi"),
+    ("福岡県", "fukuoka"),
+    ("佐賀県", "saga"),
+    ("長崎県", "nagasaki"),
+    ("熊本県", "kumamoto"),
+    ("大分県", "oita"),
+    ("宮崎県", "miyazaki"),
+    ("鹿児島県", "kagoshima"),
+    ("沖縄県", "okinawa"),
+)
+
+PREFECTURE_NAMES = frozenset(
+    name for full_name, _ in PREFECTURES for name in (full_name, full_name[:-1])
+) - {"北海"}
+PREFECTURE_SLUGS = frozenset(slug for _, slug in PREFECTURES)
+
+MEMBER_LIST_KEYWORDS = (
+    "議員一覧",
+    "議員名簿",
+    "議員紹介",
+    "所属議員",
+    "議員リスト",
+    "メンバー一覧",
+    "メンバー紹介",
+)
+
+PAGINATION_TEXTS = frozenset(
+    {"次へ", "前へ", "次のページ", "前のページ", "次", "前", "最初", "最後"}
+    | {"»", "«", "›", "‹", ">", "<", ">>", "<<"}
+)
+PAGINATION_QUERY_KEYS = frozenset({"page", "p", "pg", "paged"})
+
+SOCIAL_HOSTS = frozenset(
+    {
+        "twitter.com",
+        "x.com",
+        "facebook.com",
+        "instagram.com",
+        "youtube.com",
+        "youtu.be",
+        "line.me",
+        "tiktok.com",
+        "note.com",
+        "ameblo.jp",
+    }
+)
+DOCUMENT_EXTENSIONS = frozenset(
+    {
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".csv",
+        ".zip",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".svg",
+        ".mp4",
+    }
+)
+
+MEMBER_SEGMENTS = frozenset({"member", "members", "giin"})
+PROFILE_SEGMENTS = frozenset({"profile", "profiles"})
+LIST_PAGE_SEGMENTS = frozenset({"index.html", "index.htm", "index.php", "list"})
+
+_NUMERIC_ID_PATTERN = re.compile(r"^\d+(\.(html?|php))?$")
+_PAGE_NUMBER_PATTERN = re.compile(r"^\d{1,3}$")
+
+
+class LinkHeuristicClassifier:
+    """Classifies links whose type is obvious from the URL or anchor text.
+
+    Only confident matches are returned; links the rules cannot decide are
+    left for the LLM classifier. Rules are checked in order: non-page links
+    (mail, social, documents), pagination, prefecture lists, member list
+    keywords and finally member/profile URL paths.
+    """
+
+    def classify(self, link: Link) -> LinkClassification | None:
+        """Classify a link by rules.
+
+        Args:
+            link: Link to classify
+
+        Returns:
+            LinkClassification, or None if no rule applies
+        """
+        parts = urlparse(link.url)
+        host = parts.netloc.lower().split(":")[0].removeprefix("www.")
+        path = parts.path.lower()
+        segments = [s for s in path.split("/") if s]
+        text = link.text.strip()
+
+        if parts.scheme not in ("http", "https"):
+            return self._result(link, LinkType.OTHER, 0.99, "ページ以外へのリンク")
+        if host in SOCIAL_HOSTS or any(
+            host.endswith("." + social) for social in SOCIAL_HOSTS
+        ):
+            return self._result(link, LinkType.OTHER, 0.95, "SNSへのリンク")
+        if any(path.endswith(extension) for extension in DOCUMENT_EXTENSIONS):
+            return self._result(link, LinkType.OTHER, 0.95, "ファイルへのリンク")
+
+        if self._is_pagination(link, text, parts.query, segments):
+            return self._result(
+                link, LinkType.MEMBER_LIST, 0.8, "ページ送りリンク（一覧の続き）"
+            )
+
+        if text in PREFECTURE_NAMES:
+            return self._result(
+                link, LinkType.PREFECTURE_LIST, 0.9, f"「{text}」は都道府県名"
+            )
+        if segments and (
+            segments[-1].split(".")[0] in PREFECTURE_SLUGS
+            or self._is_prefecture_code(segments)
+        ):
+            return self._result(
+                link, LinkType.PREFECTURE_LIST, 0.85, "URLが都道府県を示す"
+            )
+
+        for keyword in MEMBER_LIST_KEYWORDS:
+            if keyword in text:
+                return self._result(
+                    link, LinkType.MEMBER_LIST, 0.9, f"「{keyword}」を含むリンク"
+                )
+
+        return self._classify_member_path(link, segments)
+
+    def partition(
+        self, links: list[Link]
+    ) -> tuple[list[LinkClassification], list[Link]]:
+        """Split links into rule-classified ones and the undecided residue.
+
+        Args:
+            links: Links to classify
+
+        Returns:
+            Tuple of (classifications by rules, links no rule applied to)
+        """
+        classifications: list[LinkClassification] = []
+        residue: list[Link] = []
+        for link in links:
+            classification = self.classify(link)
+            if classification is None:
+                residue.append(link)
+            else:
+                classifications.append(classification)
+        return classifications, residue
+
+    def _is_pagination(
+        self, link: Link, text: str, query: str, segments: list[str]
+    ) -> bool:
+        rel = link.rel.lower().split()
+        if "next" in rel or "prev" in rel:
+            return True
+        if text in PAGINATION_TEXTS:
+            return True
+        if not _PAGE_NUMBER_PATTERN.match(text):
+            return False
+        # A bare number is only a page link if the URL carries a page number
+        has_page_query = bool(PAGINATION_QUERY_KEYS & parse_qs(query).keys())
+        return has_page_query or "page" in segments[:-1]
+
+    def _is_prefecture_code(self, segments: list[str]) -> bool:
+        # e.g. /list/pref/13
+        if len(segments) < 2 or segments[-2] not in ("pref", "prefecture"):
+            return False
+        code = segments[-1].split(".")[0]
+        return code.isdigit() and 1 <= int(code) <= len(PREFECTURES)
+
+    def _classify_member_path(
+        self, link: Link, segments: list[str]
+    ) -> LinkClassification | None:
+        if not segments:
+            return None
+        last = segments[-1]
+        parent = segments[-2] if len(segments) > 1 else ""
+
+        if parent in PROFILE_SEGMENTS and last not in LIST_PAGE_SEGMENTS:
+            return self._result(
+                link, LinkType.MEMBER_PROFILE, 0.85, "URLがプロフィールページを示す"
+            )
+        if parent in MEMBER_SEGMENTS and _NUMERIC_ID_PATTERN.match(last):
+            return self._result(
+                link, LinkType.MEMBER_PROFILE, 0.85, "URLが議員個人のIDを含む"
+            )
+        if last in MEMBER_SEGMENTS or (
+            parent in MEMBER_SEGMENTS and last in LIST_PAGE_SEGMENTS
+        ):
+            return self._result(
+                link, LinkType.MEMBER_LIST, 0.8, "URLが議員一覧ページを示す"
+            )
+        return None
+
+    def _result(
+        self, link: Link, link_type: LinkType, confidence: float, reason: str
+    ) -> LinkClassification:
+        return LinkClassification(
+            url=link.url, link_type=link_type, confidence=confidence, reason=reason
+        )
@@ -53,8 +53,7 @@ class MeetingProcessingStatusService:
         # Check if minutes has conversations
         if minutes.id is None:
             return False
-        conversations = await self.conversation_repository.get_by_minutes(minutes.id)
-        return len(conversations) > 0
+        return await self.conversation_repository.exists_by_minutes(minutes.id)
 
     async def has_speakers(self, meeting_id: int) -> bool:
         """Check if a meeting has any speakers extracted.
@@ -77,13 +76,12 @@ class MeetingProcessingStatusService:
         # Check if minutes has conversations with speakers
         if minutes.id is None:
             return False
-        conversations = await self.conversation_repository.get_by_minutes(minutes.id)
-        # Check if any conversation has a speaker_id
-        for conversation in conversations:
-            if conversation.speaker_id is not None:
-                return True
-
-        return False
+        speaker_count = (
+            await self.conversation_repository.count_distinct_speakers_by_minutes(
+                minutes.id
+            )
+        )
+        return speaker_count > 0
 
     async def get_processing_status(self, meeting_id: int) -> ProcessingStatus:
         """Get comprehensive processing status for a meeting.
@@ -115,26 +113,26 @@ class MeetingProcessingStatusService:
 
         status["has_minutes"] = True
 
-        # Collect all conversations and speaker IDs
+        # Count conversations and unique speakers without loading rows
         if minutes.id is None:
             self._cache[meeting_id] = status
             return status
-        conversations = await self.conversation_repository.get_by_minutes(minutes.id)
-        speaker_ids: set[int] = set()
-
-        # Collect unique speaker IDs
-        for conversation in conversations:
-            if conversation.speaker_id is not None:
-                speaker_ids.add(conversation.speaker_id)
+        conversation_count = await self.conversation_repository.count_by_minutes(
+            minutes.id
+        )
+        speaker_count = 0
+        if conversation_count:
+            speaker_count = (
+                await self.conversation_repository.count_distinct_speakers_by_minutes(
+                    minutes.id
+                )
+            )
 
         # Update status
-        if conversations:
-            status["has_conversations"] = True
-            status["conversation_count"] = len(conversations)
-
-        if speaker_ids:
-            status["has_speakers"] = True
-            status["speaker_count"] = len(speaker_ids)
+        status["has_conversations"] = conversation_count > 0
+        status["conversation_count"] = conversation_count
+        status["has_speakers"] = speaker_count > 0
+        status["speaker_count"] = speaker_count
 
         # Cache the result
         self._cache[meeting_id] = status
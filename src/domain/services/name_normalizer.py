@@ -0,0 +1,248 @@
+"""Name normalization engine shared by speaker and politician matching.
+
+議事録の発言者名、議案の賛否一覧の議員名、国会会議録の発言者名などを
+同じ規則で正規化するためのエンジンです。敬称・役職は1つの正規表現に
+まとめてコンパイルし、正規化結果はLRUキャッシュで再利用します。
+"""
+
+import functools
+import re
+import unicodedata
+
+from collections.abc import Iterable
+
+
+# 敬称（名前の後ろに付くもの）
+HONORIFICS: tuple[str, ...] = (
+    "君",
+    "氏",
+    "議員",
+    "委員",
+    "参考人",
+    "証人",
+    "説明員",
+    "さん",
+    "様",
+    "殿",
+    "先生",
+)
+
+# 役職（名前の後ろに付く場合に除去するもの）
+TITLES: tuple[str, ...] = (
+    "副委員長",
+    "委員長",
+    "副議長",
+    "議長",
+    "副市長",
+    "市長",
+    "副町長",
+    "町長",
+    "副村長",
+    "村長",
+    "副区長",
+    "区長",
+    "副知事",
+    "知事",
+)
+
+# 発言者を示す記号
+SPEAKER_MARKERS = "○◯◆◇■□●◎△▲▽▼☆★"
+
+# 人名に使われる旧字体・異体字と新字体の対応
+# （CJK互換漢字はNFKCで統合されるため含めない）
+KANJI_VARIANTS: dict[str, str] = {
+    "髙": "高",
+    "﨑": "崎",
+    "嵜": "崎",
+    "邊": "辺",
+    "邉": "辺",
+    "濱": "浜",
+    "濵": "浜",
+    "澤": "沢",
+    "齋": "斎",
+    "齊": "斉",
+    "嶋": "島",
+    "嶌": "島",
+    "國": "国",
+    "櫻": "桜",
+    "廣": "広",
+    "惠": "恵",
+    "眞": "真",
+    "德": "徳",
+    "瀨": "瀬",
+    "槇": "槙",
+    "條": "条",
+    "藏": "蔵",
+    "實": "実",
+    "學": "学",
+    "榮": "栄",
+    "會": "会",
+    "關": "関",
+    "淺": "浅",
+    "圓": "円",
+    "壽": "寿",
+    "彌": "弥",
+    "豐": "豊",
+    "禮": "礼",
+    "冨": "富",
+    "黑": "黒",
+    "戶": "戸",
+    "將": "将",
+    "靜": "静",
+    "傳": "伝",
+    "增": "増",
+    "萬": "万",
+    "莊": "荘",
+    "驛": "駅",
+    "檜": "桧",
+}
+
+# 役職名のパターン（「議長 (西村義直)」形式の発言者名の判定に使用）
+_TITLE_PREFIX_PATTERN = re.compile(
+    r"^(?:議長|委員長|副議長|副委員長|委員|議員|理事|監事|会長|副会長|事務局長|局長"
+    r"|部長|課長|係長|主査|主任|主事"
+    r"|市長|副市長|町長|副町長|村長|副村長|知事|副知事"
+    r"|教育長|教育委員長|農業委員長|選挙管理委員長|監査委員)"
+)
+
+# スペース＋括弧内の人名（例: "議長 (西村義直)"）
+_NAME_IN_PARENTHESES_PATTERN = re.compile(r"^\S+\s+[（\(]([^）\)]+)[）\)]")
+
+# 括弧内が発言や注釈であることを示す表記
+_NON_NAME_MARKERS = ("呼ぶ者あり", "異議", "拍手", "する者あり")
+
+# 人以外の発言者（傍聴席の反応など）
+_NON_PERSON_PATTERN = re.compile(
+    r".*「.*」.*と.*呼ぶ者あり"  # 「異議なし」と呼ぶ者あり
+    r"|.*「.*」.*と.*する者あり"  # 「賛成」とする者あり
+    r"|.*拍手.*"  # 拍手
+    r"|^\(.*\)$"  # 括弧だけの場合
+    r"|.*発言する者あり.*"  # 発言する者あり
+    r"|.*異議なし.*"  # 異議なし（括弧なし）
+)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _suffix_pattern(words: Iterable[str]) -> re.Pattern[str]:
+    """末尾に連続する語にマッチする正規表現を作成する（長い語を優先）"""
+    alternatives = "|".join(
+        re.escape(word) for word in sorted(set(words), key=len, reverse=True)
+    )
+    return re.compile(f"(?:{alternatives})+$")
+
+
+class NameNormalizer:
+    """Compiled normalization rules for person names.
+
+    - normalize(): 照合用のキー（NFKC、旧字体の統一、記号・空白・敬称・役職の除去）
+    - strip_honorifics(): 表記を保ったまま末尾の敬称（と役職）だけを除去
+    """
+
+    def __init__(
+        self,
+        honorifics: Iterable[str] = HONORIFICS,
+        titles: Iterable[str] = TITLES,
+        kanji_variants: dict[str, str] | None = None,
+        cache_size: int = 8192,
+    ):
+        """
+        Args:
+            honorifics: 除去する敬称
+            titles: 除去する役職
+            kanji_variants: 旧字体・異体字から新字体への対応
+            cache_size: normalize()の結果を保持する件数
+        """
+        honorifics = tuple(honorifics)
+        self._honorific_pattern = _suffix_pattern(honorifics)
+        self._honorific_and_title_pattern = _suffix_pattern((*honorifics, *titles))
+        self._leading_marker_pattern = re.compile(f"^[{re.escape(SPEAKER_MARKERS)}]+")
+        self._variant_table = str.maketrans(
+            KANJI_VARIANTS if kanji_variants is None else kanji_variants
+        )
+        self._normalize_cached = functools.lru_cache(maxsize=cache_size)(
+            self._normalize
+        )
+
+    def normalize(self, name: str) -> str:
+        """照合用に名前を正規化する
+
+        NFKC正規化（全角英数・半角カナの統一）、旧字体・異体字の統一、
+        先頭の発言者記号・空白・末尾の敬称と役職の除去を行います。
+        敬称・役職だけの名前（「議長」など）はそのまま残します。
+
+        Args:
+            name: 名前
+
+        Returns:
+            正規化された名前
+        """
+        return self._normalize_cached(name)
+
+    def normalize_many(self, names: Iterable[str]) -> list[str]:
+        """複数の名前をまとめて正規化する"""
+        normalize = self._normalize_cached
+        return [normalize(name) for name in names]
+
+    def fold(self, text: str) -> str:
+        """NFKC正規化と旧字体・異体字の統一だけを行う"""
+        return unicodedata.normalize("NFKC", text).translate(self._variant_table)
+
+    def strip_honorifics(self, name: str, include_titles: bool = False) -> str:
+        """末尾の敬称を除去する（「議員先生」のように連続する場合も除去）
+
+        Args:
+            name: 名前
+            include_titles: 役職（委員長、市長など）も除去するかどうか
+
+        Returns:
+            敬称を除去した名前（前後の空白は除去）
+        """
+        pattern = (
+            self._honorific_and_title_pattern
+            if include_titles
+            else self._honorific_pattern
+        )
+        return pattern.sub("", name.strip()).strip()
+
+    def strip_speaker_markers(self, name: str) -> str:
+        """先頭の発言者記号（○◆◎など）を除去する"""
+        return self._leading_marker_pattern.sub("", name.strip()).strip()
+
+    def extract_person_name_from_title(self, speaker_name: str) -> str:
+        """「役職 (人名)」形式の発言者名から人名を取り出す
+
+        Examples:
+            "議長 (西村義直)" -> "西村義直"
+            "議長" -> "議長" (no change if no name found)
+            "(「異議なし」と呼ぶ者あり)" -> "(「異議なし」と呼ぶ者あり)"
+        """
+        match = _NAME_IN_PARENTHESES_PATTERN.search(speaker_name)
+        if match is None or not _TITLE_PREFIX_PATTERN.match(speaker_name):
+            return speaker_name
+
+        # 括弧内が人名らしい場合（発言や注釈は除外）
+        name_in_parentheses = match.group(1)
+        if (
+            not name_in_parentheses.startswith("「")
+            and not name_in_parentheses.endswith("」")
+            and not any(marker in name_in_parentheses for marker in _NON_NAME_MARKERS)
+            and len(name_in_parentheses) >= 2  # 最低2文字以上
+        ):
+            return name_in_parentheses
+        return speaker_name
+
+    def is_non_person(self, speaker_name: str) -> bool:
+        """人以外の発言者（「異議なし」と呼ぶ者ありなど）かどうかを判定する"""
+        return _NON_PERSON_PATTERN.match(speaker_name) is not None
+
+    def _normalize(self, name: str) -> str:
+        folded = self.strip_speaker_markers(self.fold(name))
+        compact = _WHITESPACE_PATTERN.sub("", folded)
+        return self._honorific_and_title_pattern.sub("", compact) or compact
+
+
+@functools.cache
+def get_name_normalizer() -> NameNormalizer:
+    """共有のNameNormalizerを取得する（キャッシュを呼び出し元の間で共有）"""
+    return NameNormalizer()
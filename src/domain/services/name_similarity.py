@@ -0,0 +1,417 @@
+"""String similarity scoring for rule-based name matching.
+
+発言者名・議員名と政治家名の類似度を、Jaro–Winkler類似度、正規化編集距離、
+文字バイグラムのJaccard係数の加重平均で計算します。
+1つの名前と多数の候補（1 × N）の組み合わせは、候補をコードポイントの行列に
+まとめてNumPyで一括計算します（候補ごとのPythonループを行いません）。
+候補が少ない場合はNumPyの呼び出しのオーバーヘッドの方が大きいため、
+1組ずつ計算する同じ結果の実装を使用します。
+
+名前はNameNormalizer.normalize()で正規化してから比較するため、
+敬称・役職・空白・旧字体の違いは類似度に影響しません。
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.domain.services.name_normalizer import NameNormalizer, get_name_normalizer
+
+
+# 評価データセット（data/evaluation/datasets/conference_member_matching）で
+# 校正したしきい値（scripts/calibrate_name_similarity.py で再計算できます）
+# ルールベースで一致とみなす類似度
+# （名前の異なる組み合わせの最大値0.56と、名の1文字違い「山田太郎/山田次郎」の
+# 0.62を上回る値）
+NAME_MATCH_THRESHOLD = 0.8
+# LLMでの検証・人手レビューの対象とする類似度
+# （読み仮名表記を除く正例の最小値。「田中はなこ/田中花子」が0.4）
+NAME_REVIEW_THRESHOLD = 0.4
+
+# 所属政党が一致する場合の加点・異なる場合の減点
+PARTY_MATCH_BONUS = 0.05
+PARTY_MISMATCH_PENALTY = 0.15
+
+# Jaro–Winkler類似度の共通接頭辞の重みと、接頭辞を考慮する最大文字数
+WINKLER_PREFIX_WEIGHT = 0.1
+WINKLER_MAX_PREFIX = 4
+# Jaro類似度がこの値を超える場合だけ共通接頭辞で補正する
+WINKLER_BOOST_THRESHOLD = 0.7
+
+# 各指標の重み（Jaro–Winkler, 編集距離, バイグラムJaccard）
+DEFAULT_WEIGHTS: tuple[float, float, float] = (0.3, 0.4, 0.3)
+
+# これ未満の候補数では1組ずつ計算する
+BATCH_MIN_CANDIDATES = 32
+
+# バイグラムを1つの整数で表すためのシフト幅（Unicodeのコードポイントは21ビット）
+_CODE_POINT_BITS = 21
+_PADDING = -1
+
+
+@dataclass(frozen=True)
+class NameSimilarity:
+    """名前の類似度の内訳
+
+    Attributes:
+        jaro_winkler: Jaro–Winkler類似度
+        edit: 正規化編集距離に基づく類似度（1 - 距離 / 長い方の文字数）
+        bigram_jaccard: 文字バイグラムのJaccard係数
+        score: 各指標の加重平均（正規化後の名前が一致する場合は1.0）
+    """
+
+    jaro_winkler: float
+    edit: float
+    bigram_jaccard: float
+    score: float
+
+
+def _encode(names: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """名前のリストをコードポイントの行列（不足分は_PADDING）と長さの配列に変換する"""
+    lengths = np.fromiter(
+        (len(name) for name in names), dtype=np.int64, count=len(names)
+    )
+    width = int(lengths.max()) if len(names) else 0
+    codes = np.full((len(names), max(width, 1)), _PADDING, dtype=np.int64)
+    if lengths.sum():
+        flat = np.frombuffer("".join(names).encode("utf-32-le"), dtype=np.uint32)
+        rows = np.repeat(np.arange(len(names)), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        codes[rows, np.arange(len(flat)) - starts] = flat
+    return codes, lengths
+
+
+def _query_codes(query: str) -> np.ndarray:
+    return np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+
+def jaro_winkler_similarities(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """queryと各候補のJaro–Winkler類似度を一括で計算する
+
+    Args:
+        query: 比較する名前
+        candidates: 候補の名前のリスト
+
+    Returns:
+        np.ndarray: 候補ごとの類似度（0.0〜1.0）
+    """
+    return _jaro_winkler(_query_codes(query), *_encode(candidates))
+
+
+def edit_similarities(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """queryと各候補の正規化編集距離に基づく類似度を一括で計算する
+
+    Returns:
+        np.ndarray: 候補ごとの 1 - レーベンシュタイン距離 / 長い方の文字数
+    """
+    return _edit_similarity(_query_codes(query), *_encode(candidates))
+
+
+def bigram_jaccard_similarities(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """queryと各候補の文字バイグラムのJaccard係数を一括で計算する
+
+    2文字未満の名前はバイグラムを持たないため、0.0になります。
+    """
+    return _bigram_jaccard(_query_codes(query), *_encode(candidates))
+
+
+def _jaro_winkler(
+    query: np.ndarray, codes: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    count, width = codes.shape
+    query_length = len(query)
+    if count == 0:
+        return np.zeros(0)
+    if query_length == 0:
+        return np.zeros(count)
+
+    # 一致とみなす文字の位置の範囲（候補ごと）
+    window = np.maximum(np.maximum(lengths, query_length) // 2 - 1, 0)
+    max_window = int(window.max())
+    matched_query = np.zeros((count, query_length), dtype=bool)
+    matched_candidate = np.zeros((count, width), dtype=bool)
+    for i in range(query_length):
+        low = np.maximum(i - window, 0)
+        high = np.minimum(i + window + 1, lengths)
+        found = np.zeros(count, dtype=bool)
+        for j in range(max(i - max_window, 0), min(i + max_window + 1, width)):
+            hit = (
+                (codes[:, j] == query[i])
+                & ~matched_candidate[:, j]
+                & ~found
+                & (low <= j)
+                & (j < high)
+            )
+            matched_candidate[:, j] |= hit
+            found |= hit
+        matched_query[:, i] = found
+
+    matches = matched_query.sum(axis=1)
+
+    # 一致した文字を出現順に並べ、順序が異なる文字の数から転置数を求める
+    slots = min(query_length, width)
+    query_order = np.full((count, slots), _PADDING, dtype=np.int64)
+    rows, columns = np.nonzero(matched_query)
+    query_order[rows, (np.cumsum(matched_query, axis=1) - 1)[rows, columns]] = query[
+        columns
+    ]
+    candidate_order = np.full((count, slots), _PADDING, dtype=np.int64)
+    rows, columns = np.nonzero(matched_candidate)
+    candidate_order[rows, (np.cumsum(matched_candidate, axis=1) - 1)[rows, columns]] = (
+        codes[rows, columns]
+    )
+    valid = np.arange(slots) < matches[:, None]
+    transpositions = ((query_order != candidate_order) & valid).sum(axis=1) // 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jaro = np.where(
+            matches > 0,
+            (
+                matches / query_length
+                + matches / np.maximum(lengths, 1)
+                + (matches - transpositions) / np.maximum(matches, 1)
+            )
+            / 3,
+            0.0,
+        )
+
+    # 共通接頭辞による補正
+    prefix_width = min(WINKLER_MAX_PREFIX, query_length, width)
+    prefix = np.cumprod(
+        codes[:, :prefix_width] == query[:prefix_width], axis=1, dtype=np.int64
+    ).sum(axis=1)
+    return np.where(
+        jaro > WINKLER_BOOST_THRESHOLD,
+        jaro + prefix * WINKLER_PREFIX_WEIGHT * (1 - jaro),
+        jaro,
+    )
+
+
+def _edit_similarity(
+    query: np.ndarray, codes: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    count, width = codes.shape
+    if count == 0:
+        return np.zeros(0)
+
+    # 動的計画法の行を候補ごとにまとめて更新する
+    # 挿入（同じ行の左からの遷移）は累積最小値で一度に計算する
+    columns = np.arange(width + 1)
+    previous = np.broadcast_to(columns, (count, width + 1)).copy()
+    for i, char in enumerate(query, start=1):
+        best = np.empty_like(previous)
+        best[:, 0] = i
+        best[:, 1:] = np.minimum(
+            previous[:, :-1] + (codes != char),  # 置換（一致する場合は0）
+            previous[:, 1:] + 1,  # 削除
+        )
+        previous = np.minimum.accumulate(best - columns, axis=1) + columns
+
+    distances = previous[np.arange(count), lengths]
+    longest = np.maximum(lengths, len(query))
+    return np.where(longest > 0, 1 - distances / np.maximum(longest, 1), 1.0)
+
+
+def _bigram_jaccard(
+    query: np.ndarray, codes: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    count, width = codes.shape
+    if count == 0:
+        return np.zeros(0)
+    query_bigrams = np.unique((query[:-1] << _CODE_POINT_BITS) | query[1:])
+    if width < 2 or len(query_bigrams) == 0:
+        return np.zeros(count)
+
+    bigrams = (codes[:, :-1] << _CODE_POINT_BITS) | codes[:, 1:]
+    bigrams = np.where(np.arange(width - 1) < (lengths - 1)[:, None], bigrams, _PADDING)
+    bigrams.sort(axis=1)
+    distinct = bigrams != _PADDING
+    distinct[:, 1:] &= bigrams[:, 1:] != bigrams[:, :-1]
+
+    intersection = (distinct & np.isin(bigrams, query_bigrams)).sum(axis=1)
+    union = len(query_bigrams) + distinct.sum(axis=1) - intersection
+    return np.where(union > 0, intersection / np.maximum(union, 1), 0.0)
+
+
+def _jaro_winkler_pair(query: str, candidate: str) -> float:
+    if not query or not candidate:
+        return 0.0
+    window = max(max(len(query), len(candidate)) // 2 - 1, 0)
+    matched_candidate = [False] * len(candidate)
+    query_chars: list[str] = []
+    for i, char in enumerate(query):
+        for j in range(max(i - window, 0), min(i + window + 1, len(candidate))):
+            if not matched_candidate[j] and candidate[j] == char:
+                matched_candidate[j] = True
+                query_chars.append(char)
+                break
+    matches = len(query_chars)
+    if matches == 0:
+        return 0.0
+    candidate_chars = [
+        char
+        for char, matched in zip(candidate, matched_candidate, strict=True)
+        if matched
+    ]
+    transpositions = (
+        sum(a != b for a, b in zip(query_chars, candidate_chars, strict=True)) // 2
+    )
+    jaro = (
+        matches / len(query)
+        + matches / len(candidate)
+        + (matches - transpositions) / matches
+    ) / 3
+    if jaro <= WINKLER_BOOST_THRESHOLD:
+        return jaro
+    prefix = 0
+    for a, b in zip(query[:WINKLER_MAX_PREFIX], candidate, strict=False):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * WINKLER_PREFIX_WEIGHT * (1 - jaro)
+
+
+def _edit_similarity_pair(query: str, candidate: str) -> float:
+    longest = max(len(query), len(candidate))
+    if longest == 0:
+        return 1.0
+    previous = list(range(len(candidate) + 1))
+    for i, char in enumerate(query, start=1):
+        current = [i]
+        for j, other in enumerate(candidate, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char != other),
+                )
+            )
+        previous = current
+    return 1 - previous[-1] / longest
+
+
+def _bigram_jaccard_pair(query: str, candidate: str) -> float:
+    query_bigrams = {query[i : i + 2] for i in range(len(query) - 1)}
+    candidate_bigrams = {candidate[i : i + 2] for i in range(len(candidate) - 1)}
+    if not query_bigrams or not candidate_bigrams:
+        return 0.0
+    return len(query_bigrams & candidate_bigrams) / len(
+        query_bigrams | candidate_bigrams
+    )
+
+
+def adjust_for_party(
+    score: float, party_id: int | None, candidate_party_id: int | None
+) -> float:
+    """所属政党の一致・不一致で類似度を補正する
+
+    どちらかの政党が不明な場合は補正しません。
+
+    Args:
+        score: 名前の類似度
+        party_id: 発言者・議員の政党ID（政党名から解決したもの）
+        candidate_party_id: 候補の政治家の政党ID
+
+    Returns:
+        float: 補正後のスコア（0.0〜1.0）
+    """
+    if party_id is None or candidate_party_id is None:
+        return score
+    if party_id == candidate_party_id:
+        return min(score + PARTY_MATCH_BONUS, 1.0)
+    return max(score - PARTY_MISMATCH_PENALTY, 0.0)
+
+
+class NameSimilarityScorer:
+    """Scores name similarity with Jaro–Winkler, edit distance and bigram Jaccard."""
+
+    def __init__(
+        self,
+        name_normalizer: NameNormalizer | None = None,
+        weights: tuple[float, float, float] = DEFAULT_WEIGHTS,
+    ):
+        """
+        Args:
+            name_normalizer: 名前の正規化に使用するNameNormalizer
+            weights: Jaro–Winkler、編集距離、バイグラムJaccardの重み
+        """
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("weights must have a positive sum")
+        self.name_normalizer = name_normalizer or get_name_normalizer()
+        self.weights = tuple(weight / total for weight in weights)
+
+    def score(self, name1: str, name2: str) -> float:
+        """2つの名前の類似度（0.0〜1.0）を計算する"""
+        return self.score_many(name1, [name2])[0]
+
+    def score_many(self, name: str, candidates: Sequence[str]) -> list[float]:
+        """1つの名前と候補のリストの類似度を一括で計算する
+
+        Args:
+            name: 比較する名前
+            candidates: 候補の名前のリスト
+
+        Returns:
+            list[float]: candidatesと同じ順序の類似度
+        """
+        return [similarity.score for similarity in self.details_many(name, candidates)]
+
+    def details_many(
+        self, name: str, candidates: Sequence[str]
+    ) -> list[NameSimilarity]:
+        """1つの名前と候補のリストの類似度を指標の内訳と共に計算する"""
+        if not candidates:
+            return []
+        normalizer = self.name_normalizer
+        query = normalizer.normalize(name)
+        normalized = normalizer.normalize_many(candidates)
+
+        if len(normalized) < BATCH_MIN_CANDIDATES:
+            components = [
+                (
+                    _jaro_winkler_pair(query, candidate),
+                    _edit_similarity_pair(query, candidate),
+                    _bigram_jaccard_pair(query, candidate),
+                )
+                for candidate in normalized
+            ]
+        else:
+            query_codes = _query_codes(query)
+            codes, lengths = _encode(normalized)
+            components = list(
+                zip(
+                    _jaro_winkler(query_codes, codes, lengths).tolist(),
+                    _edit_similarity(query_codes, codes, lengths).tolist(),
+                    _bigram_jaccard(query_codes, codes, lengths).tolist(),
+                    strict=True,
+                )
+            )
+
+        jaro_weight, edit_weight, bigram_weight = self.weights
+        similarities: list[NameSimilarity] = []
+        for candidate, (jaro_winkler, edit, bigram) in zip(
+            normalized, components, strict=True
+        ):
+            if query and candidate == query:
+                score = 1.0
+            else:
+                score = min(
+                    max(
+                        jaro_weight * jaro_winkler
+                        + edit_weight * edit
+                        + bigram_weight * bigram,
+                        0.0,
+                    ),
+                    1.0,
+                )
+            similarities.append(
+                NameSimilarity(
+                    jaro_winkler=jaro_winkler,
+                    edit=edit,
+                    bigram_jaccard=bigram,
+                    score=score,
+                )
+            )
+        return similarities
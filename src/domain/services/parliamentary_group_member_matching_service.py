@@ -1,5 +1,7 @@
 """Domain service for parliamentary group member matching logic."""
 
+from collections.abc import Sequence
+
 from src.application.dtos.base_dto import PoliticianBaseDTO
 from src.domain.entities.extracted_parliamentary_group_member import (
     ExtractedParliamentaryGroupMember,
@@ -7,8 +9,18 @@ from src.domain.entities.extracted_parliamentary_group_member import (
 from src.domain.entities.politician import Politician
 from src.domain.repositories.politician_repository import PoliticianRepository
 from src.domain.services.interfaces.llm_service import ILLMService
+from src.domain.services.interfaces.politician_matching_service import (
+    IPoliticianMatchingService,
+)
+from src.domain.services.name_similarity import (
+    NAME_MATCH_THRESHOLD,
+    NAME_REVIEW_THRESHOLD,
+    adjust_for_party,
+)
+from src.domain.services.party_id_resolver import PartyIdResolver
 from src.domain.services.speaker_domain_service import SpeakerDomainService
 from src.domain.types import LLMMatchResult
+from src.domain.value_objects.politician_match import PoliticianMatchRequest
 
 
 class ParliamentaryGroupMemberMatchingService:
@@ -23,6 +35,8 @@ class ParliamentaryGroupMemberMatchingService:
         politician_repository: PoliticianRepository,
         llm_service: ILLMService,
         speaker_service: SpeakerDomainService,
+        politician_matching_service: IPoliticianMatchingService | None = None,
+        party_id_resolver: PartyIdResolver | None = None,
     ):
         """Initialize the matching service.
 
@@ -30,10 +44,16 @@ class ParliamentaryGroupMemberMatchingService:
             politician_repository: 政治家リポジトリ
             llm_service: LLMサービス
             speaker_service: 発言者ドメインサービス（名前正規化等）
+            politician_matching_service: 一括マッチングに使用する政治家マッチング
+                サービス（省略時はメンバーごとにLLMを呼び出す）
+            party_id_resolver: 政党名から政党IDを解決するリゾルバ
+                （省略時は政党による補正を行わない）
         """
         self.politician_repo = politician_repository
         self.llm_service = llm_service
         self.speaker_service = speaker_service
+        self.politician_matching_service = politician_matching_service
+        self.party_id_resolver = party_id_resolver
 
     async def find_matching_politician(
         self, member: ExtractedParliamentaryGroupMember
@@ -53,7 +73,8 @@ class ParliamentaryGroupMemberMatchingService:
 
         # 1. ルールベースマッチング
         rule_match = await self._rule_based_matching(normalized_name, member)
-        if rule_match and rule_match[1] >= 0.8:  # 信頼度0.8以上ならルールベースで確定
+        # 信頼度がNAME_MATCH_THRESHOLD以上ならルールベースで確定
+        if rule_match and rule_match[1] >= NAME_MATCH_THRESHOLD:
             return rule_match
 
         # 2. LLMベースマッチング
@@ -64,6 +85,69 @@ class ParliamentaryGroupMemberMatchingService:
         # マッチなし
         return None, 0.0, "No matching politician found"
 
+    async def find_matching_politicians(
+        self, members: Sequence[ExtractedParliamentaryGroupMember]
+    ) -> list[tuple[int | None, float, str]]:
+        """複数の抽出メンバーにマッチする政治家を一括で検索する
+
+        ルールベースで確定しなかったメンバーは、政治家マッチングサービスが
+        設定されていれば1回の一括マッチングにまとめて問い合わせます。
+        設定されていない場合はメンバーごとにLLMベースマッチングを行います。
+
+        Args:
+            members: 抽出された議員団メンバーのリスト
+
+        Returns:
+            membersと同じ順序の(matched_politician_id, confidence_score,
+            matching_reason)のタプルのリスト
+        """
+        no_match: tuple[int | None, float, str] = (
+            None,
+            0.0,
+            "No matching politician found",
+        )
+        results: list[tuple[int | None, float, str]] = [no_match] * len(members)
+        unresolved: list[tuple[int, str]] = []
+
+        # 1. ルールベースマッチング
+        for index, member in enumerate(members):
+            normalized_name = self.speaker_service.normalize_speaker_name(
+                member.extracted_name
+            )
+            rule_match = await self._rule_based_matching(normalized_name, member)
+            if rule_match and rule_match[1] >= NAME_MATCH_THRESHOLD:
+                results[index] = rule_match
+            else:
+                unresolved.append((index, normalized_name))
+
+        if not unresolved:
+            return results
+
+        # 2. LLMベースマッチング
+        if self.politician_matching_service is None:
+            for index, normalized_name in unresolved:
+                llm_match = await self._llm_based_matching(
+                    members[index], normalized_name
+                )
+                if llm_match:
+                    results[index] = llm_match
+            return results
+
+        matches = await self.politician_matching_service.find_best_matches(
+            [
+                PoliticianMatchRequest(
+                    speaker_name=normalized_name,
+                    speaker_type="議員",
+                    speaker_party=members[index].extracted_party_name,
+                )
+                for index, normalized_name in unresolved
+            ]
+        )
+        for (index, _), match in zip(unresolved, matches, strict=True):
+            if match.matched and match.politician_id is not None:
+                results[index] = (match.politician_id, match.confidence, match.reason)
+        return results
+
     async def _rule_based_matching(
         self, normalized_name: str, member: ExtractedParliamentaryGroupMember
     ) -> tuple[int | None, float, str] | None:
@@ -82,27 +166,29 @@ class ParliamentaryGroupMemberMatchingService:
         if not candidates:
             return None
 
+        party_id = (
+            await self.party_id_resolver.resolve(member.extracted_party_name)
+            if self.party_id_resolver is not None
+            else None
+        )
         best_match: Politician | None = None
         best_score = 0.0
 
         for candidate in candidates:
-            # 名前の類似度を計算
-            score = self.speaker_service.calculate_name_similarity(
-                member.extracted_name, candidate.name
+            # 名前の類似度を計算し、解決した政党IDの一致・不一致で補正
+            score = adjust_for_party(
+                self.speaker_service.calculate_name_similarity(
+                    member.extracted_name, candidate.name
+                ),
+                party_id,
+                candidate.political_party_id,
             )
 
-            # 政党IDが一致する場合はスコアをブースト
-            # Note: 現在のPoliticianエンティティには政党名がないため、
-            # political_party_idの一致で判定
-            if member.extracted_party_name and candidate.political_party_id:
-                # 将来的には政党名のルックアップを実装
-                score += 0.15
-
             if score > best_score:
                 best_match = candidate
                 best_score = score
 
-        if best_match and best_score >= 0.7:
+        if best_match and best_score >= NAME_REVIEW_THRESHOLD:
             return (
                 best_match.id,
                 best_score,
@@ -0,0 +1,104 @@
+"""Political party name to ID resolution for rule-based matching."""
+
+import re
+
+from src.domain.repositories.political_party_repository import (
+    PoliticalPartyRepository,
+)
+from src.domain.services.name_normalizer import NameNormalizer, get_name_normalizer
+
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 略称として前方一致を試す最小の文字数
+MIN_ABBREVIATION_LENGTH = 2
+
+
+def party_name_key(
+    party_name: str, name_normalizer: NameNormalizer | None = None
+) -> str:
+    """政党名を照合用に正規化する（NFKC、旧字体の統一、空白の除去）"""
+    normalizer = name_normalizer or get_name_normalizer()
+    return _WHITESPACE_PATTERN.sub("", normalizer.fold(party_name))
+
+
+def is_same_party_name(
+    party_name: str, official_name: str, name_normalizer: NameNormalizer | None = None
+) -> bool:
+    """政党名が正式名称と一致するか（略称として前方一致する場合を含む）"""
+    key = party_name_key(party_name, name_normalizer)
+    official_key = party_name_key(official_name, name_normalizer)
+    if not key or not official_key:
+        return False
+    if key == official_key:
+        return True
+    return len(key) >= MIN_ABBREVIATION_LENGTH and official_key.startswith(key)
+
+
+class PartyIdResolver:
+    """Resolves political party names to IDs through a cached name map.
+
+    政党の一覧は最初の問い合わせ時に1回だけ取得し、正規化した政党名から
+    政党IDへの対応表として保持します。発言者や議員団メンバーごとに
+    政党リポジトリを検索しないため、一括マッチングでもDBアクセスは1回です。
+    """
+
+    def __init__(
+        self,
+        political_party_repository: PoliticalPartyRepository,
+        name_normalizer: NameNormalizer | None = None,
+    ):
+        """
+        Args:
+            political_party_repository: 政党リポジトリ
+            name_normalizer: 政党名の正規化に使用するNameNormalizer
+        """
+        self.political_party_repository = political_party_repository
+        self.name_normalizer = name_normalizer or get_name_normalizer()
+        self._party_ids: dict[str, int] | None = None
+
+    async def resolve(self, party_name: str | None) -> int | None:
+        """政党名から政党IDを求める
+
+        正規化（NFKC、旧字体の統一、空白の除去）した政党名の完全一致、
+        見つからない場合は略称（「立憲」→「立憲民主党」など）として
+        前方一致する政党が1つだけの場合にその政党を返します。
+
+        Args:
+            party_name: 政党名
+
+        Returns:
+            int | None: 政党ID。解決できない場合はNone
+        """
+        if not party_name:
+            return None
+        party_ids = await self._get_party_ids()
+        key = self._key(party_name)
+        if not key:
+            return None
+        if key in party_ids:
+            return party_ids[key]
+
+        if len(key) < MIN_ABBREVIATION_LENGTH:
+            return None
+        matched = {
+            party_id for name, party_id in party_ids.items() if name.startswith(key)
+        }
+        return matched.pop() if len(matched) == 1 else None
+
+    def invalidate(self) -> None:
+        """キャッシュした対応表を破棄する（次回の問い合わせで再取得）"""
+        self._party_ids = None
+
+    async def _get_party_ids(self) -> dict[str, int]:
+        if self._party_ids is None:
+            parties = await self.political_party_repository.get_all()
+            self._party_ids = {
+                self._key(party.name): party.id
+                for party in parties
+                if party.id is not None and party.name
+            }
+        return self._party_ids
+
+    def _key(self, party_name: str) -> str:
+        return party_name_key(party_name, self.name_normalizer)
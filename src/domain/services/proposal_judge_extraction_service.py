@@ -4,6 +4,8 @@ import re
 
 from typing import Any
 
+from src.domain.services.name_normalizer import get_name_normalizer
+
 
 class ProposalJudgeExtractionService:
     """議案賛否情報抽出ドメインサービス
@@ -45,35 +47,11 @@ class ProposalJudgeExtractionService:
         Returns:
             正規化された政治家名
         """
-        # Remove common honorifics and titles
-        # Note: Longer titles first to avoid partial matches
-        honorifics = [
-            "副委員長",
-            "委員長",
-            "副議長",
-            "議長",
-            "副市長",
-            "市長",
-            "副知事",
-            "知事",
-            "議員",
-            "先生",
-            "氏",
-            "さん",
-            "君",
-            "様",
-        ]
-
-        normalized = name.strip()
-
-        # Remove honorifics at the end
-        for honorific in honorifics:
-            if normalized.endswith(honorific):
-                normalized = normalized[: -len(honorific)].strip()
+        # Remove trailing honorifics and titles
+        normalized = get_name_normalizer().strip_honorifics(name, include_titles=True)
 
-        # Normalize spaces
+        # Normalize spaces (including full-width spaces)
         normalized = re.sub(r"\s+", " ", normalized)
-        normalized = normalized.replace("　", " ")  # Replace full-width space
 
         return normalized
 
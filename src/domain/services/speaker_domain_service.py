@@ -1,32 +1,46 @@
 """Speaker domain service for handling speaker-related business logic."""
 
+import re
+
 from typing import Any
 
 from src.domain.entities.politician import Politician
 from src.domain.entities.speaker import Speaker
+from src.domain.services.name_normalizer import NameNormalizer, get_name_normalizer
+from src.domain.services.name_similarity import (
+    NAME_MATCH_THRESHOLD,
+    NameSimilarityScorer,
+)
+
+
+# Pattern: "名前（党名）" or "名前（役職・党名）"
+_PARTY_IN_PARENTHESES_PATTERN = re.compile(r"（([^）]+)）")
 
 
 class SpeakerDomainService:
     """Domain service for speaker-related business logic."""
 
+    def __init__(
+        self,
+        name_normalizer: NameNormalizer | None = None,
+        name_similarity_scorer: NameSimilarityScorer | None = None,
+    ):
+        self.name_normalizer = name_normalizer or get_name_normalizer()
+        self.name_similarity_scorer = name_similarity_scorer or NameSimilarityScorer(
+            self.name_normalizer
+        )
+
     def normalize_speaker_name(self, name: str) -> str:
         """Normalize speaker name for matching."""
-        # Remove honorifics and extra spaces
-        honorifics = ["議員", "君", "さん", "氏", "先生", "委員長", "議長"]
-        normalized = name.strip()
-        for honorific in honorifics:
-            normalized = normalized.replace(honorific, "")
-        return normalized.strip()
+        # Remove trailing honorifics/titles and extra spaces
+        return self.name_normalizer.strip_honorifics(name, include_titles=True)
 
     def extract_party_from_name(self, speaker_name: str) -> tuple[str, str | None]:
         """Extract party name from speaker name if included."""
-        # Pattern: "名前（党名）" or "名前（役職・党名）"
-        import re
-
         # First extract actual person name from title if present
         speaker_name = self.extract_person_name_from_title(speaker_name)
 
-        match = re.search(r"（([^）]+)）", speaker_name)
+        match = _PARTY_IN_PARENTHESES_PATTERN.search(speaker_name)
         if match:
             content = match.group(1)
             # Clean the name
@@ -43,38 +57,7 @@ class SpeakerDomainService:
             "議長" -> "議長" (no change if no name found)
             "(「異議なし」と呼ぶ者あり)" -> "(「異議なし」と呼ぶ者あり)" (non-person)
         """
-        import re
-
-        # 役職名のパターン
-        title_patterns = [
-            r"^(議長|委員長|副議長|副委員長|委員|議員|理事|監事|会長|副会長|事務局長|局長|部長|課長|係長|主査|主任|主事)",
-            r"^(市長|副市長|町長|副町長|村長|副村長|知事|副知事)",
-            r"^(教育長|教育委員長|農業委員長|選挙管理委員長|監査委員)",
-        ]
-
-        # スペース＋括弧内の人名を探す (例: "議長 (西村義直)")
-        match = re.search(r"^\S+\s+[（\(]([^）\)]+)[）\)]", speaker_name)
-        if match:
-            name_in_parentheses = match.group(1)
-
-            # 役職名パターンにマッチする場合
-            for pattern in title_patterns:
-                if re.match(pattern, speaker_name):
-                    # 括弧内が人名らしい場合（発言や注釈は除外）
-                    if (
-                        not name_in_parentheses.startswith("「")
-                        and not name_in_parentheses.endswith("」")
-                        and "呼ぶ者あり" not in name_in_parentheses
-                        and "異議" not in name_in_parentheses
-                        and "拍手" not in name_in_parentheses
-                        and "する者あり" not in name_in_parentheses
-                        and len(name_in_parentheses) >= 2  # 最低2文字以上
-                    ):
-                        return name_in_parentheses
-                    break
-
-        # 変更なし
-        return speaker_name
+        return self.name_normalizer.extract_person_name_from_title(speaker_name)
 
     def resolve_speaker_with_attendees(
         self, speaker_name: str, attendees_mapping: dict[str, Any] | None
@@ -121,22 +104,7 @@ class SpeakerDomainService:
         Returns:
             True if the speaker is not a person, False otherwise
         """
-        non_person_patterns = [
-            r".*「.*」.*と.*呼ぶ者あり",  # 「異議なし」と呼ぶ者あり
-            r".*「.*」.*と.*する者あり",  # 「賛成」とする者あり
-            r".*拍手.*",  # 拍手
-            r"^\(.*\)$",  # 括弧だけの場合
-            r".*発言する者あり.*",  # 発言する者あり
-            r".*異議なし.*",  # 異議なし（括弧なし）
-        ]
-
-        import re
-
-        for pattern in non_person_patterns:
-            if re.match(pattern, speaker_name):
-                return True
-
-        return False
+        return self.name_normalizer.is_non_person(speaker_name)
 
     def is_likely_politician(self, speaker: Speaker) -> bool:
         """Determine if a speaker is likely a politician based on attributes."""
@@ -149,19 +117,18 @@ class SpeakerDomainService:
         return any(politician_indicators)
 
     def calculate_name_similarity(self, name1: str, name2: str) -> float:
-        """Calculate similarity between two names."""
-        norm1 = self.normalize_speaker_name(name1)
-        norm2 = self.normalize_speaker_name(name2)
+        """Calculate similarity between two names.
 
-        if norm1 == norm2:
-            return 1.0
-
-        # Simple character-based similarity
-        common_chars = set(norm1) & set(norm2)
-        if not common_chars:
-            return 0.0
+        Weighted Jaro-Winkler, normalized edit distance and character bigram
+        Jaccard similarity of the normalized names (1.0 for identical names).
+        """
+        return self.name_similarity_scorer.score(name1, name2)
 
-        return len(common_chars) / max(len(set(norm1)), len(set(norm2)))
+    def calculate_name_similarities(
+        self, name: str, candidate_names: list[str]
+    ) -> list[float]:
+        """Calculate similarities between a name and many candidates at once."""
+        return self.name_similarity_scorer.score_many(name, candidate_names)
 
     def merge_speaker_info(self, existing: Speaker, new_info: Speaker) -> Speaker:
         """Merge new speaker information with existing speaker."""
@@ -183,7 +150,7 @@ class SpeakerDomainService:
         """Validate if a speaker can be linked to a politician."""
         # Names should be similar
         similarity = self.calculate_name_similarity(speaker.name, politician.name)
-        if similarity < 0.7:
+        if similarity < NAME_MATCH_THRESHOLD:
             return False
 
         # If speaker has party info, it should match
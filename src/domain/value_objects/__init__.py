@@ -1,8 +1,13 @@
 """Domain value objects."""
 
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.domain.value_objects.judge_type import JudgeType
+from src.domain.value_objects.meeting_summary import MeetingSummary
 from src.domain.value_objects.page_classification import PageClassification, PageType
-from src.domain.value_objects.politician_match import PoliticianMatch
+from src.domain.value_objects.politician_match import (
+    PoliticianMatch,
+    PoliticianMatchRequest,
+)
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 from src.domain.value_objects.speaker_with_conversation_count import (
     SpeakerWithConversationCount,
@@ -12,10 +17,13 @@ from src.domain.value_objects.submitter_type import SubmitterType
 
 
 __all__ = [
+    "AttendeeBoundary",
     "JudgeType",
+    "MeetingSummary",
     "PageClassification",
     "PageType",
     "PoliticianMatch",
+    "PoliticianMatchRequest",
     "SpeakerSpeech",
     "SpeakerWithConversationCount",
     "SpeakerWithPolitician",
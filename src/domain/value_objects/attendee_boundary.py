@@ -0,0 +1,66 @@
+"""議事録の出席者部分と発言部分の境界を表すValue Object"""
+
+import hashlib
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class AttendeeBoundary:
+    """検出済みの出席者/発言境界
+
+    境界検出は議事録1件につき1回だけ行い、結果を議事録（Minutes）に
+    キャッシュします。境界位置は検出に使った議事録テキストに対する
+    文字位置なので、テキストのハッシュと一緒に保持し、
+    テキストが変わった場合はキャッシュを使わないようにします。
+
+    Attributes:
+        text_hash: 境界検出に使った議事録テキストのSHA-256ハッシュ
+        position: 発言部分の開始位置（文字インデックス）。
+            境界が見つからなかった場合（全体が発言部分）はNone
+        boundary_type: 境界の種類
+        confidence: 境界検出の信頼度（0.0-1.0）
+        detection_method: 検出方法（"rule_based" または "llm"）
+    """
+
+    text_hash: str
+    position: int | None
+    boundary_type: str = "none"
+    confidence: float = 0.0
+    detection_method: str = "llm"
+
+    @staticmethod
+    def compute_text_hash(text: str) -> str:
+        """議事録テキストのハッシュを計算する"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @property
+    def boundary_found(self) -> bool:
+        """出席者部分と発言部分の境界が見つかったかどうか"""
+        return self.position is not None
+
+    def matches(self, text: str) -> bool:
+        """境界検出に使ったテキストと同じテキストかどうかを判定する"""
+        return self.text_hash == self.compute_text_hash(text)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONとして保存するための辞書に変換する"""
+        return {
+            "text_hash": self.text_hash,
+            "position": self.position,
+            "boundary_type": self.boundary_type,
+            "confidence": self.confidence,
+            "detection_method": self.detection_method,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AttendeeBoundary":
+        """保存された辞書から復元する"""
+        return cls(
+            text_hash=data["text_hash"],
+            position=data.get("position"),
+            boundary_type=data.get("boundary_type", "none"),
+            confidence=float(data.get("confidence", 0.0)),
+            detection_method=data.get("detection_method", "llm"),
+        )
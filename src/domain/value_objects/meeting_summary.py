@@ -0,0 +1,59 @@
+"""会議一覧用の集計済み会議情報を表すValue Object"""
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class MeetingSummary:
+    """会議一覧の1行分を表すリードモデル
+
+    会議情報に、会議体・開催主体の名前と、発言数・発言者数・処理状況を
+    まとめて保持します。リポジトリが1回のクエリで組み立てて返します。
+
+    Attributes:
+        id: 会議ID
+        conference_id: 会議体ID
+        date: 開催日
+        url: 会議URL
+        name: 会議名
+        gcs_pdf_uri: GCS上のPDFのURI
+        gcs_text_uri: GCS上のテキストのURI
+        conference_name: 会議体名
+        governing_body_name: 開催主体名
+        governing_body_type: 開催主体の種別
+        conversation_count: 発言数
+        speaker_count: 発言者が紐付いた発言のユニーク発言者数
+        processing_status: 処理状況（PROCESSING_STATUSESのいずれか）
+    """
+
+    id: int
+    conference_id: int
+    date: date | None
+    url: str | None
+    name: str | None
+    gcs_pdf_uri: str | None
+    gcs_text_uri: str | None
+    conference_name: str
+    governing_body_name: str
+    governing_body_type: str | None
+    conversation_count: int
+    speaker_count: int
+    processing_status: str
+
+
+STATUS_NOT_PROCESSED = "not_processed"
+"""議事録が未作成"""
+STATUS_MINUTES_ONLY = "minutes_only"
+"""議事録はあるが発言が未抽出"""
+STATUS_CONVERSATIONS_EXTRACTED = "conversations_extracted"
+"""発言は抽出済みだが発言者が未紐付け"""
+STATUS_SPEAKERS_LINKED = "speakers_linked"
+"""発言者の紐付けまで完了"""
+
+PROCESSING_STATUSES: tuple[str, ...] = (
+    STATUS_NOT_PROCESSED,
+    STATUS_MINUTES_ONLY,
+    STATUS_CONVERSATIONS_EXTRACTED,
+    STATUS_SPEAKERS_LINKED,
+)
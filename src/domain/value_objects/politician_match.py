@@ -32,3 +32,23 @@ class PoliticianMatch(BaseModel):
     )
     confidence: float = Field(description="マッチングの信頼度 (0.0-1.0)", default=0.0)
     reason: str = Field(description="マッチング判定の理由", default="")
+
+
+class PoliticianMatchRequest(BaseModel):
+    """政治家マッチング要求のValue Object
+
+    一括マッチング（find_best_matches）で1件の発言者を表します。
+
+    Attributes:
+        speaker_name: マッチングする発言者名
+        speaker_type: 発言者の種別（例: "議員", "委員"など）
+        speaker_party: 発言者の所属政党（もしあれば）
+        role_name_mappings: 役職-人名マッピング辞書（役職のみの発言者名の解決用）
+    """
+
+    speaker_name: str = Field(description="マッチングする発言者名")
+    speaker_type: str | None = Field(description="発言者の種別", default=None)
+    speaker_party: str | None = Field(description="発言者の所属政党", default=None)
+    role_name_mappings: dict[str, str] | None = Field(
+        description="役職-人名マッピング辞書", default=None
+    )
@@ -15,12 +15,16 @@ class ScrapingConfig:
         recursion_limit: LangGraph recursion limit for state machine
         min_confidence_threshold: Minimum confidence for link classification
         max_pages: Maximum number of pages to visit (safety limit)
+        max_concurrency: Maximum number of pages fetched in parallel
+        per_host_concurrency: Maximum number of parallel fetches per host
     """
 
     max_depth: int = 2
     recursion_limit: int = 100  # Conservative default
     min_confidence_threshold: float = 0.7
     max_pages: int = 1000  # Safety limit
+    max_concurrency: int = 6
+    per_host_concurrency: int = 3  # Stay polite to a single party/council site
 
     def __post_init__(self) -> None:
         """Validate configuration values.
@@ -36,6 +40,10 @@ class ScrapingConfig:
             raise ValueError("min_confidence_threshold must be between 0.0 and 1.0")
         if self.max_pages < 1:
             raise ValueError("max_pages must be >= 1")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if self.per_host_concurrency < 1:
+            raise ValueError("per_host_concurrency must be >= 1")
 
     @classmethod
     def for_large_party(cls) -> "ScrapingConfig":
@@ -89,7 +89,7 @@ class EvaluationRunner:
         # Use real LLM services
         try:
             if task_type == "conference_member_matching":
-                return self._execute_conference_member_matching(test_case)
+                return await self._execute_conference_member_matching(test_case)
             else:
                 logger.error(f"Unknown task type: {task_type}")
                 return {}
@@ -97,7 +97,7 @@ class EvaluationRunner:
             logger.error(f"Error executing test case: {e}")
             return {}
 
-    def _execute_conference_member_matching(
+    async def _execute_conference_member_matching(
         self, test_case: dict[str, Any]
     ) -> dict[str, Any]:
         """Execute conference member matching using LLM
@@ -132,7 +132,7 @@ JSON形式で以下のような構造で返してください:
 
             # Use the LLM directly
             messages = [{"role": "user", "content": prompt}]
-            response = self.llm_service.invoke_llm(messages)
+            response = await self.llm_service.ainvoke_llm(messages)
 
             # Parse LLM response
             try:
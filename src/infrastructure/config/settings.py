@@ -72,6 +72,12 @@ class Settings:
                 f"Invalid temperature value: {str(e)}",
             ) from e
 
+        # LLM rate limits (shared per model across the process)
+        self.llm_rate_limit_rpm: float = float(os.getenv("LLM_RATE_LIMIT_RPM", "1000"))
+        self.llm_rate_limit_tpm: float = float(
+            os.getenv("LLM_RATE_LIMIT_TPM", "1000000")
+        )
+
         # GCS Configuration
         self.gcs_bucket_name: str = os.getenv(
             "GCS_BUCKET_NAME", "sagebase-scraped-minutes"
@@ -8,6 +8,9 @@ from dependency_injector import containers, providers
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from src.application.usecases.analyze_party_page_links_usecase import (
+    AnalyzePartyPageLinksUseCase,
+)
 from src.application.usecases.backfill_role_name_mappings_usecase import (
     BackfillRoleNameMappingsUseCase,
 )
@@ -51,14 +54,38 @@ from src.application.usecases.view_data_coverage_usecase import (
 )
 from src.domain.interfaces.minutes_divider_service import IMinutesDividerService
 from src.domain.interfaces.role_name_mapping_service import IRoleNameMappingService
+from src.domain.services.interfaces.html_link_extractor_service import (
+    IHtmlLinkExtractorService,
+)
+from src.domain.services.interfaces.llm_link_classifier_service import (
+    ILLMLinkClassifierService,
+)
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.services.interfaces.minutes_processing_service import (
     IMinutesProcessingService,
 )
 from src.domain.services.interfaces.storage_service import IStorageService
+from src.domain.services.interfaces.structured_minutes_source import (
+    IStructuredMinutesSource,
+)
+from src.domain.services.link_analysis_domain_service import LinkAnalysisDomainService
 from src.domain.services.politician_domain_service import PoliticianDomainService
 from src.domain.services.speaker_domain_service import SpeakerDomainService
+from src.infrastructure.external.cached_llm_service import (
+    CachedLLMService,
+    SingleFlight,
+)
 from src.infrastructure.external.gcs_storage_service import GCSStorageService
+from src.infrastructure.external.html_link_extractor_service import (
+    BeautifulSoupLinkExtractor,
+)
+from src.infrastructure.external.kokkai_speech_source import KokkaiSpeechSource
+from src.infrastructure.external.link_classification_cache import (
+    LinkClassificationCache,
+)
+from src.infrastructure.external.llm_link_classifier_service import (
+    LLMLinkClassifierService,
+)
 from src.infrastructure.external.llm_service import GeminiLLMService
 from src.infrastructure.external.minutes_divider.baml_minutes_divider import (
     BAMLMinutesDivider,
@@ -68,6 +95,7 @@ from src.infrastructure.external.minutes_processing_service import (
 )
 from src.infrastructure.external.politician_matching import (
     BAMLPoliticianMatchingService,
+    PoliticianMatchingPipeline,
 )
 from src.infrastructure.external.role_name_mapping.baml_role_name_mapping_service import (
     BAMLRoleNameMappingService,
@@ -147,6 +175,9 @@ from src.infrastructure.persistence.proposal_submitter_repository_impl import (
 from src.infrastructure.persistence.speaker_repository_impl import SpeakerRepositoryImpl
 from src.infrastructure.persistence.unit_of_work_impl import UnitOfWorkImpl
 from src.infrastructure.persistence.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.persistence.work_statistics_repository_impl import (
+    WorkStatisticsRepositoryImpl,
+)
 
 
 def _create_conference_member_extraction_agent():
@@ -162,36 +193,6 @@ def _create_conference_member_extraction_agent():
     return MemberExtractorFactory.create_agent()
 
 
-def _create_politician_matching_agent(
-    politician_repo: "PoliticianRepositoryImpl",
-    affiliation_repo: "PoliticianAffiliationRepositoryImpl",
-):
-    """政治家マッチングエージェントを作成するヘルパー関数
-
-    遅延インポートを使用して循環参照を回避します。
-    Issue #904: LangGraph+BAML統合（政治家マッチング）
-
-    Args:
-        politician_repo: PoliticianRepository（必須）
-        affiliation_repo: PoliticianAffiliationRepository（必須）
-    """
-    from langchain_google_genai import ChatGoogleGenerativeAI
-
-    from src.infrastructure.external.langgraph_politician_matching_agent import (
-        PoliticianMatchingAgent,
-    )
-
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        temperature=0.0,
-    )
-    return PoliticianMatchingAgent(
-        llm=llm,
-        politician_repo=politician_repo,
-        affiliation_repo=affiliation_repo,
-    )
-
-
 # Mock SQLAlchemy model classes for repositories that don't have them yet
 class MockSpeakerModel:
     """Mock SQLAlchemy model for Speaker entity."""
@@ -436,6 +437,11 @@ class RepositoryContainer(containers.DeclarativeContainer):
         session=database.async_session,
     )
 
+    work_statistics_repository = providers.Factory(
+        WorkStatisticsRepositoryImpl,
+        session=database.async_session,
+    )
+
     user_repository = providers.Factory(
         UserRepositoryImpl,
         session=database.async_session,
@@ -465,6 +471,12 @@ class ServiceContainer(containers.DeclarativeContainer):
         temperature=config.llm_temperature,
     )
 
+    # Cache and coalesce identical requests across async use cases
+    cached_llm_service: providers.Provider[ILLMService] = providers.Singleton(
+        CachedLLMService,
+        base_service=async_llm_service,
+    )
+
     # Wrap with adapter for synchronous use cases
     llm_service = providers.Factory(
         LLMServiceAdapter,
@@ -515,6 +527,26 @@ class ServiceContainer(containers.DeclarativeContainer):
         providers.Factory(BAMLMinutesDivider)
     )
 
+    # 国会会議録APIの発言レコード（APIへの同時リクエスト数の上限を全体で共有する）
+    structured_minutes_source: providers.Provider[IStructuredMinutesSource] = (
+        providers.Singleton(KokkaiSpeechSource)
+    )
+
+    # Party page link analysis
+    # 分類結果はドメイン・URL単位でファイルにキャッシュし、ページ・クロール間で再利用
+    html_link_extractor_service: providers.Provider[IHtmlLinkExtractorService] = (
+        providers.Factory(BeautifulSoupLinkExtractor)
+    )
+    link_classification_cache = providers.Singleton(LinkClassificationCache)
+    link_classifier_service: providers.Provider[ILLMLinkClassifierService] = (
+        providers.Factory(LLMLinkClassifierService, cache=link_classification_cache)
+    )
+    link_analysis_domain_service = providers.Factory(LinkAnalysisDomainService)
+
+    # 同時に実行中の同一の政治家マッチング要求を1回のLLM呼び出しにまとめる
+    # （ユースケースはFactoryのため、インスタンス間で共有するSingletonにする）
+    politician_matching_single_flight = providers.Singleton(SingleFlight)
+
 
 class UseCaseContainer(containers.DeclarativeContainer):
     """Container for use case implementations."""
@@ -564,6 +596,7 @@ class UseCaseContainer(containers.DeclarativeContainer):
         BAMLPoliticianMatchingService,
         llm_service=services.async_llm_service,
         politician_repository=repositories.politician_repository,
+        single_flight=services.politician_matching_single_flight,
     )
 
     match_speakers_usecase = providers.Factory(
@@ -575,6 +608,7 @@ class UseCaseContainer(containers.DeclarativeContainer):
         llm_service=services.async_llm_service,  # Use async service directly
         update_speaker_usecase=update_speaker_usecase,
         baml_matching_service=baml_politician_matching_service,  # Issue #885
+        political_party_repository=repositories.political_party_repository,
     )
 
     # Link Speaker to Politician UseCase (PR #957)
@@ -625,6 +659,7 @@ class UseCaseContainer(containers.DeclarativeContainer):
         update_statement_usecase=update_statement_usecase,
         role_name_mapping_service=services.role_name_mapping_service,
         minutes_divider_service=services.minutes_divider_service,
+        structured_minutes_source=services.structured_minutes_source,
     )
 
     extract_proposal_judges_usecase = providers.Factory(
@@ -634,7 +669,10 @@ class UseCaseContainer(containers.DeclarativeContainer):
         extracted_proposal_judge_repository=repositories.extracted_proposal_judge_repository,
         proposal_judge_repository=repositories.proposal_judge_repository,
         web_scraper_service=services.web_scraper_service,
-        llm_service=services.llm_service,
+        llm_service=services.cached_llm_service,
+        politician_affiliation_repository=repositories.politician_affiliation_repository,
+        politician_matching_service=baml_politician_matching_service,
+        meeting_repository=repositories.meeting_repository,
     )
 
     # Data coverage use cases
@@ -659,10 +697,10 @@ class UseCaseContainer(containers.DeclarativeContainer):
     )
 
     # Politician matching agent (Issue #904)
-    # LangGraph + BAMLの二層構造を持つエージェント
+    # 候補検索→所属情報の一括取得→BAML判定の固定手順で実行するパイプライン
     # リポジトリを注入してService Locatorパターンを回避
     politician_matching_agent = providers.Factory(
-        _create_politician_matching_agent,
+        PoliticianMatchingPipeline,
         politician_repo=repositories.politician_repository,
         affiliation_repo=repositories.politician_affiliation_repository,
     )
@@ -676,6 +714,14 @@ class UseCaseContainer(containers.DeclarativeContainer):
         minutes_divider_service=services.minutes_divider_service,
     )
 
+    # Analyze party page links (used by the link analysis LangGraph tool)
+    analyze_party_page_links_usecase = providers.Factory(
+        AnalyzePartyPageLinksUseCase,
+        html_extractor=services.html_link_extractor_service,
+        link_classifier=services.link_classifier_service,
+        link_analysis_service=services.link_analysis_domain_service,
+    )
+
     # Manage Parliamentary Group Judges UseCase (Issue #1007)
     # 会派/政治家賛否情報の手動管理用ユースケース
     manage_parliamentary_group_judges_usecase = providers.Factory(
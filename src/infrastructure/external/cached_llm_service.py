@@ -1,18 +1,30 @@
 """Cached LLM service implementation with deduplication and batching."""
 
+import asyncio
 import hashlib
 import json
+import logging
 
+from collections.abc import Callable, Coroutine
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 from src.application.dtos.base_dto import PoliticianBaseDTO
+from src.domain.entities.llm_processing_history import LLMProcessingHistory
+from src.domain.repositories.llm_processing_history_repository import (
+    LLMProcessingHistoryRepository,
+)
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.types.llm import (
     LLMExtractResult,
     LLMMatchResult,
 )
-from src.infrastructure.external.llm_service import GeminiLLMService
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 class LLMCache:
@@ -46,6 +58,10 @@ class LLMCache:
 
         return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
 
+    def key_for(self, prompt: str, context: Any = None) -> str:
+        """Get the cache key used for prompt and context."""
+        return self._generate_key(prompt, context)
+
     def get(self, prompt: str, context: Any = None) -> Any | None:
         """Get cached result if available and not expired."""
         key = self._generate_key(prompt, context)
@@ -84,12 +100,118 @@ class LLMCache:
         }
 
 
+@dataclass
+class SingleFlightKeyStats:
+    """Per-key statistics for single-flight request coalescing."""
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into one (single-flight).
+
+    The first caller for a key starts the work as a task. Callers arriving while
+    that task is still running await the same task instead of issuing their own
+    request. The entry is dropped once the task finishes, so later callers start
+    a fresh call (caching finished results is LLMCache's job).
+    """
+
+    def __init__(self, max_tracked_keys: int = 10_000):
+        """Initialize single-flight group.
+
+        Args:
+            max_tracked_keys: Maximum number of keys kept in per-key statistics
+        """
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._stats: dict[str, SingleFlightKeyStats] = {}
+        self._max_tracked_keys = max_tracked_keys
+
+    async def do(
+        self,
+        key: str,
+        factory: Callable[[], Coroutine[Any, Any, T]],
+        operation: str = "default",
+    ) -> T:
+        """Run factory once per key among concurrent callers.
+
+        Args:
+            key: Key identifying identical requests
+            factory: Callable creating the coroutine to run
+            operation: Operation name used as the metrics attribute
+
+        Returns:
+            Result of the shared call (exceptions are shared as well)
+        """
+        stats = self._key_stats(key)
+        stats.calls += 1
+
+        task = self._in_flight.get(key)
+        if task is None:
+            stats.executions += 1
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            stats.coalesced += 1
+            _record_coalesced_metric(operation)
+            logger.debug(f"Coalesced in-flight LLM request: {key}")
+
+        # One caller being cancelled must not cancel the request shared by others
+        return await asyncio.shield(task)
+
+    def _key_stats(self, key: str) -> SingleFlightKeyStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            if len(self._stats) >= self._max_tracked_keys:
+                # Drop the oldest tracked key
+                self._stats.pop(next(iter(self._stats)))
+            stats = self._stats[key] = SingleFlightKeyStats()
+        return stats
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        """Get coalescing statistics, overall and per key."""
+        calls = sum(s.calls for s in self._stats.values())
+        coalesced = sum(s.coalesced for s in self._stats.values())
+        return {
+            "calls": calls,
+            "executions": calls - coalesced,
+            "coalesced": coalesced,
+            "in_flight": len(self._in_flight),
+            "keys": {
+                key: asdict(key_stats)
+                for key, key_stats in self._stats.items()
+                if key_stats.coalesced > 0
+            },
+        }
+
+
+def _record_coalesced_metric(operation: str) -> None:
+    """Record a coalesced call to OpenTelemetry (no-op if metrics are not set up)."""
+    try:
+        from src.common.metrics import CommonMetrics
+
+        CommonMetrics.llm_requests_coalesced().add(
+            1, attributes={"operation": operation}
+        )
+    except RuntimeError:
+        pass
+
+
 class CachedLLMService(ILLMService):
     """LLM service with caching and batching capabilities."""
 
     def __init__(
         self,
-        base_service: GeminiLLMService,
+        base_service: ILLMService,
         cache_ttl_minutes: int = 60,
         enable_batching: bool = True,
     ):
@@ -102,9 +224,54 @@ class CachedLLMService(ILLMService):
         """
         self._base_service = base_service
         self._cache = LLMCache(ttl_minutes=cache_ttl_minutes)
+        self._single_flight = SingleFlight()
         self._enable_batching = enable_batching
         self._pending_batch: list[tuple[str, Any, Any]] = []
 
+    @property
+    def model_name(self) -> str:  # type: ignore[override]
+        """Get the model name of the underlying service."""
+        return self._base_service.model_name
+
+    @property
+    def temperature(self) -> float:  # type: ignore[override]
+        """Get the temperature of the underlying service."""
+        return self._base_service.temperature
+
+    async def _cached_call(
+        self,
+        operation: str,
+        cache_context: dict[str, Any],
+        call: Callable[[], Coroutine[Any, Any, T]],
+        label: str | None = None,
+    ) -> T:
+        """Return a cached result, joining an identical in-flight call if any.
+
+        Args:
+            operation: Operation name used as cache prompt and metrics attribute
+            cache_context: Context identifying the request
+            call: Callable invoking the base service
+            label: Human-readable part of the key shown in coalescing stats
+
+        Returns:
+            Result of the base service call
+        """
+        cached = self._cache.get(operation, cache_context)
+        if cached is not None:
+            return cached
+
+        cache_key = self._cache.key_for(operation, cache_context)
+        flight_key = ":".join(
+            part for part in (operation, label, cache_key) if part is not None
+        )
+
+        async def load() -> T:
+            result = await call()
+            self._cache.set(operation, cache_context, result)
+            return result
+
+        return await self._single_flight.do(flight_key, load, operation=operation)
+
     async def extract_party_members(
         self, html_content: str, party_id: int
     ) -> LLMExtractResult:
@@ -117,24 +284,18 @@ class CachedLLMService(ILLMService):
         Returns:
             Extraction result with member information
         """
-        # Check cache
         cache_context = {
             "html_hash": hashlib.md5(
                 html_content.encode(), usedforsecurity=False
             ).hexdigest(),
             "party_id": party_id,
         }
-        cached = self._cache.get("extract_members", cache_context)
-        if cached is not None:
-            return cached
-
-        # Call base service
-        result = await self._base_service.extract_party_members(html_content, party_id)
-
-        # Cache the result
-        self._cache.set("extract_members", cache_context, result)
-
-        return result
+        return await self._cached_call(
+            "extract_members",
+            cache_context,
+            lambda: self._base_service.extract_party_members(html_content, party_id),
+            label=str(party_id),
+        )
 
     async def match_conference_member(
         self,
@@ -152,7 +313,6 @@ class CachedLLMService(ILLMService):
         Returns:
             Match result or None if no match
         """
-        # Create cache context
         cache_context = {
             "member_name": member_name,
             "party_name": party_name,
@@ -161,22 +321,15 @@ class CachedLLMService(ILLMService):
                 p["name"] for p in candidates[:10]
             ],  # Sample for cache key
         }
-
-        # Check cache
-        cached = self._cache.get("match_conference_member", cache_context)
-        if cached is not None:
-            return cached
-
-        # Call base service
-        result = await self._base_service.match_conference_member(
-            member_name, party_name, candidates
+        return await self._cached_call(
+            "match_conference_member",
+            cache_context,
+            lambda: self._base_service.match_conference_member(
+                member_name, party_name, candidates
+            ),
+            label=member_name,
         )
 
-        # Cache the result
-        self._cache.set("match_conference_member", cache_context, result)
-
-        return result
-
     async def extract_speeches_from_text(self, text: str) -> list[dict[str, str]]:
         """Extract speeches with caching.
 
@@ -186,23 +339,49 @@ class CachedLLMService(ILLMService):
         Returns:
             List of extracted speeches
         """
-        # Create cache context
         cache_context = {
             "text_hash": hashlib.md5(text.encode(), usedforsecurity=False).hexdigest(),
         }
+        return await self._cached_call(
+            "extract_speeches",
+            cache_context,
+            lambda: self._base_service.extract_speeches_from_text(text),
+        )
 
-        # Check cache
-        cached = self._cache.get("extract_speeches", cache_context)
-        if cached is not None:
-            return cached
+    # Delegation methods for ILLMService compatibility
+    async def set_history_repository(
+        self, repository: LLMProcessingHistoryRepository | None
+    ) -> None:
+        """Delegate to wrapped LLM service."""
+        await self._base_service.set_history_repository(repository)
+
+    async def get_processing_history(
+        self, reference_type: str | None = None, reference_id: int | None = None
+    ) -> list[LLMProcessingHistory]:
+        """Delegate to wrapped LLM service."""
+        return await self._base_service.get_processing_history(
+            reference_type, reference_id
+        )
 
-        # Call base service
-        result = await self._base_service.extract_speeches_from_text(text)
+    def get_structured_llm(self, schema: Any) -> Any:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.get_structured_llm(schema)
 
-        # Cache the result
-        self._cache.set("extract_speeches", cache_context, result)
+    def get_prompt(self, prompt_name: str) -> Any:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.get_prompt(prompt_name)
 
-        return result
+    def invoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.invoke_with_retry(chain, inputs)
+
+    def invoke_llm(self, messages: list[dict[str, str]]) -> str:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.invoke_llm(messages)
+
+    async def ainvoke_llm(self, messages: list[dict[str, str]]) -> str:
+        """Delegate to wrapped LLM service."""
+        return await self._base_service.ainvoke_llm(messages)
 
     def clear_cache(self) -> None:
         """Clear the cache."""
@@ -211,3 +390,7 @@ class CachedLLMService(ILLMService):
     def get_cache_stats(self) -> dict[str, int]:
         """Get cache statistics."""
         return self._cache.stats()
+
+    def get_coalescing_stats(self) -> dict[str, Any]:
+        """Get single-flight statistics, including per-key coalesced counts."""
+        return self._single_flight.stats()
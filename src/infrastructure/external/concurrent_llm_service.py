@@ -11,13 +11,21 @@ from src.domain.types.llm import (
     LLMExtractResult,
     LLMMatchResult,
 )
+from src.infrastructure.resilience.rate_limiter import (
+    RateLimiterConfig,
+    TokenBucketRateLimiter,
+)
 
 
 T = TypeVar("T")
 
 
 class RateLimiter:
-    """Rate limiter for API calls."""
+    """Rate limiter for API calls.
+
+    Requests per second are enforced by a token bucket, so waiting callers
+    do not block each other while sleeping.
+    """
 
     def __init__(self, max_per_second: int = 5, max_concurrent: int = 10):
         """Initialize rate limiter.
@@ -28,27 +36,18 @@ class RateLimiter:
         """
         self._max_per_second = max_per_second
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._last_call_times: list[float] = []
-        self._lock = asyncio.Lock()
+        self._bucket = TokenBucketRateLimiter(
+            "concurrent_llm_service",
+            RateLimiterConfig(
+                requests_per_minute=max_per_second * 60,
+                tokens_per_minute=float("inf"),
+            ),
+        )
 
     async def acquire(self) -> None:
         """Acquire permission to make a request."""
         async with self._semaphore:
-            async with self._lock:
-                now = asyncio.get_event_loop().time()
-
-                # Remove old timestamps
-                cutoff = now - 1.0
-                self._last_call_times = [t for t in self._last_call_times if t > cutoff]
-
-                # Check if we need to wait
-                if len(self._last_call_times) >= self._max_per_second:
-                    wait_time = 1.0 - (now - self._last_call_times[0])
-                    if wait_time > 0:
-                        await asyncio.sleep(wait_time)
-                        now = asyncio.get_event_loop().time()
-
-                self._last_call_times.append(now)
+            await self._bucket.acquire()
 
 
 class ConcurrentLLMService(ILLMService):
@@ -10,6 +10,14 @@ from baml_client.async_client import b
 
 from src.application.dtos.conference_member_extraction_dto import ExtractedMemberDTO
 from src.domain.interfaces.member_extractor_service import IMemberExtractorService
+from src.infrastructure.external.html_compactor import (
+    HtmlCompactor,
+    extract_from_chunks,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +31,13 @@ class BAMLMemberExtractor(IMemberExtractorService):
     トークン効率とパース精度の向上を目指します。
     """
 
+    def __init__(self, html_compactor: HtmlCompactor | None = None):
+        """
+        Args:
+            html_compactor: LLM入力用にHTMLを圧縮・分割するコンパクター
+        """
+        self.html_compactor = html_compactor or HtmlCompactor()
+
     async def extract_members(
         self, html_content: str, conference_name: str
     ) -> list[ExtractedMemberDTO]:
@@ -36,9 +51,10 @@ class BAMLMemberExtractor(IMemberExtractorService):
             抽出されたメンバー情報のリスト（ExtractedMemberDTO）
 
         Note:
-            - HTMLが長すぎる場合は自動的に切り詰めます（50000文字）
+            - HTMLは表・リストを1行1件にした簡潔なテキストに圧縮してから渡します
+            - 圧縮後も長い場合は行単位のチャンクに分割して並行に抽出し、
+              名前で重複除去して結合します
             - エラー時は空のリストを返します
-            - BAML呼び出しは非同期で実行されます
         """
         try:
             logger.info(
@@ -46,36 +62,29 @@ class BAMLMemberExtractor(IMemberExtractorService):
                 f"(HTML size: {len(html_content)} chars)"
             )
 
-            # HTMLが長すぎる場合は切り詰める（既存実装と同じ制限）
-            max_length = 50000
-            original_length = len(html_content)
-            if original_length > max_length:
-                logger.warning(
-                    f"HTML content too long ({original_length} chars), "
-                    f"truncating to {max_length} chars "
-                    f"(reduction: {original_length - max_length} chars, "
-                    f"{(1 - max_length / original_length) * 100:.1f}%)"
-                )
-                html_content = html_content[:max_length] + "..."
-
-            # BAML関数を呼び出し
+            chunks = self.html_compactor.split(html_content)
+            compact_length = sum(len(chunk) for chunk in chunks)
             logger.info(
-                f"Calling BAML ExtractMembers for '{conference_name}' "
-                f"(input size: {len(html_content)} chars)"
+                f"Compacted HTML for '{conference_name}': "
+                f"{len(html_content)} -> {compact_length} chars "
+                f"in {len(chunks)} chunk(s)"
             )
-            result = await b.ExtractMembers(html_content, conference_name)
-            logger.debug(f"BAML returned {len(result)} raw results")
-
-            # DTOに変換して直接返す（型安全性向上）
-            members = [
-                ExtractedMemberDTO(
-                    name=m.name,
-                    role=m.role,
-                    party_name=m.party_name,
-                    additional_info=m.additional_info,
-                )
-                for m in result
-            ]
+
+            async def extract_chunk(chunk: str) -> list[ExtractedMemberDTO]:
+                async with llm_rate_limit(BAML_DEFAULT_MODEL, chunk):
+                    result = await b.ExtractMembers(chunk, conference_name)
+                logger.debug(f"BAML returned {len(result)} raw results")
+                return [
+                    ExtractedMemberDTO(
+                        name=m.name,
+                        role=m.role,
+                        party_name=m.party_name,
+                        additional_info=m.additional_info,
+                    )
+                    for m in result
+                ]
+
+            members = await extract_from_chunks(chunks, extract_chunk)
 
             logger.info(
                 f"BAML extraction completed: {len(members)} members extracted "
@@ -11,7 +11,6 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 
 from src.application.dtos.conference_member_extraction_dto import ExtractedMemberDTO
 from src.application.dtos.extraction_result.conference_member_extraction_result import (
@@ -21,6 +20,10 @@ from src.domain.entities.extracted_conference_member import ExtractedConferenceM
 from src.infrastructure.external.conference_member_extractor.factory import (
     MemberExtractorFactory,
 )
+from src.infrastructure.external.html_compactor import BOILERPLATE_TAGS
+from src.infrastructure.external.static_first_page_fetcher import (
+    StaticFirstPageFetcher,
+)
 from src.infrastructure.persistence.extracted_conference_member_repository_impl import (
     ExtractedConferenceMemberRepositoryImpl,
 )
@@ -50,36 +53,37 @@ class ConferenceMemberExtractor:
         update_usecase: UpdateExtractedConferenceMemberFromExtractionUseCase
         | None = None,
         agent: IConferenceMemberExtractionAgent | None = None,
+        page_fetcher: StaticFirstPageFetcher | None = None,
     ):
         """初期化する。
 
         Args:
             update_usecase: 抽出ログを記録するためのUseCase（オプション）
             agent: 会議体メンバー抽出エージェント（省略時はファクトリから作成）
+            page_fetcher: ページの取得に使うフェッチャー（省略時は作成し、
+                このインスタンスのすべての取得で使い回す）
         """
         # ファクトリーからLangGraphエージェントを作成
         self._agent = agent or MemberExtractorFactory.create_agent()
         self.repo = RepositoryAdapter(ExtractedConferenceMemberRepositoryImpl)
         self._update_usecase = update_usecase
+        self._page_fetcher = page_fetcher or StaticFirstPageFetcher()
         logger.info(
             f"ConferenceMemberExtractor initialized with {type(self._agent).__name__}"
         )
 
     async def fetch_html(self, url: str) -> str:
-        """URLからHTMLを取得"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-                await page.wait_for_timeout(2000)  # 動的コンテンツの読み込み待機
-                content = await page.content()
-                return content
-            except Exception as e:
-                logger.error(f"Error fetching {url}: {e}")
-                raise
-            finally:
-                await browser.close()
+        """URLからHTMLを取得
+
+        静的HTMLで取得できればブラウザは起動せず、
+        JavaScriptで組み立てるページの場合だけPlaywrightで描画する。
+        """
+        async with self._page_fetcher as fetcher:
+            page = await fetcher.fetch_single_page(url)
+        if page is None:
+            logger.error(f"Error fetching {url}")
+            raise RuntimeError(f"Failed to fetch {url}")
+        return page.html_content
 
     def clean_html(self, html_content: str) -> str:
         """HTMLをクリーニングして不要な要素を削除
@@ -96,29 +100,8 @@ class ConferenceMemberExtractor:
             soup = BeautifulSoup(html_content, "html.parser")
 
             # 不要なタグを削除
-            unwanted_tags = [
-                "script",
-                "style",
-                "nav",
-                "header",
-                "footer",
-                "aside",
-                "iframe",
-                "noscript",
-                "svg",
-                "canvas",
-                "video",
-                "audio",
-                "form",
-                "button",
-                "input",
-                "select",
-                "textarea",
-            ]
-
-            for tag in unwanted_tags:
-                for element in soup.find_all(tag):
-                    element.decompose()
+            for element in soup.find_all(list(BOILERPLATE_TAGS)):
+                element.decompose()
 
             # コメントを削除
             from bs4 import Comment
@@ -0,0 +1,18 @@
+"""階層的な議員ページ探索用のクローラー
+
+このパッケージには、議員ページを並列に探索するための実装が含まれます：
+- frontier: 優先度付きキュー・URL正規化による重複排除・深さ制限・状態の保存
+- concurrent_crawler: 1つのブラウザコンテキストで複数ページを並列に取得するクローラー
+"""
+
+from .concurrent_crawler import ConcurrentCrawler, CrawlResult, PageFetcher
+from .frontier import CrawlFrontier, CrawlRequest
+
+
+__all__ = [
+    "ConcurrentCrawler",
+    "CrawlFrontier",
+    "CrawlRequest",
+    "CrawlResult",
+    "PageFetcher",
+]
@@ -0,0 +1,195 @@
+"""並列クローラー
+
+CrawlFrontierからURLを取り出し、複数ページを並列に取得します。
+StaticFirstPageFetcherやHtmlPageFetcherを渡した場合、ブラウザは1つだけ起動して
+全ページで共有するため、ページごとにChromiumを起動しません。並列数は全体とホストごとに制限します。
+"""
+
+import asyncio
+import logging
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
+from src.domain.value_objects.scraping_config import ScrapingConfig
+from src.infrastructure.external.crawler.frontier import CrawlFrontier, CrawlRequest
+
+
+logger = logging.getLogger(__name__)
+
+# 何ページごとにクロール状態を保存するか
+DEFAULT_CHECKPOINT_INTERVAL = 20
+
+
+class PageFetcher(Protocol):
+    """1ページを取得するフェッチャー（HtmlPageFetcher等）"""
+
+    async def fetch_single_page(self, url: str) -> WebPageContentDTO | None: ...
+
+
+@dataclass(frozen=True)
+class CrawlResult:
+    """取得したページ
+
+    Attributes:
+        request: 取得したURLの情報（深さ・親URL）
+        page: 取得したページコンテンツ
+    """
+
+    request: CrawlRequest
+    page: WebPageContentDTO
+
+
+# 取得したページを処理し、次に辿る(URL, 優先度)のリストを返すコールバック
+PageHandler = Callable[
+    [CrawlRequest, WebPageContentDTO], Awaitable[Sequence[tuple[str, int]]]
+]
+
+
+class ConcurrentCrawler:
+    """フロンティアを使った並列クローラー
+
+    Example:
+        async with StaticFirstPageFetcher() as fetcher:
+            crawler = ConcurrentCrawler(fetcher, ScrapingConfig.for_large_party())
+            results = await crawler.crawl([party.members_list_url], handle_page)
+    """
+
+    def __init__(
+        self,
+        fetcher: PageFetcher,
+        config: ScrapingConfig | None = None,
+        state_path: str | Path | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        """
+        Args:
+            fetcher: ページの取得に使うフェッチャー（並列呼び出しに対応すること）
+            config: 深さ・ページ数・並列数の設定
+            state_path: クロール状態の保存先（指定時は保存した状態から再開する）
+            checkpoint_interval: 何ページごとにクロール状態を保存するか
+        """
+        self.fetcher = fetcher
+        self.config = config or ScrapingConfig()
+        self.state_path = Path(state_path) if state_path else None
+        self.checkpoint_interval = checkpoint_interval
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def crawl(
+        self, seed_urls: Sequence[str], handle_page: PageHandler
+    ) -> list[CrawlResult]:
+        """起点URLからクロールする
+
+        取得したページごとにhandle_pageを呼び、返されたURLを1つ深い階層として
+        フロンティアに追加します。取得待ちも取得中のURLもなくなったら終了します。
+
+        Args:
+            seed_urls: 起点URL（深さ0）
+            handle_page: ページを処理し、次に辿る(URL, 優先度)を返すコールバック
+
+        Returns:
+            取得できたページのリスト（取得が完了した順）
+        """
+        frontier = self._create_frontier()
+        for url in seed_urls:
+            frontier.add(url, depth=0)
+
+        results: list[CrawlResult] = []
+        condition = asyncio.Condition()
+        workers = [
+            asyncio.create_task(self._worker(frontier, condition, handle_page, results))
+            for _ in range(self.config.max_concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self._save_state(frontier)
+
+        logger.info(
+            f"Crawl finished: {len(results)} pages fetched, "
+            f"{frontier.done_count} URLs visited"
+        )
+        return results
+
+    async def _worker(
+        self,
+        frontier: CrawlFrontier,
+        condition: asyncio.Condition,
+        handle_page: PageHandler,
+        results: list[CrawlResult],
+    ) -> None:
+        while True:
+            async with condition:
+                request = frontier.pop()
+                while request is None:
+                    if frontier.is_finished:
+                        condition.notify_all()
+                        return
+                    # 取得中のページから新しいURLが見つかるのを待つ
+                    await condition.wait()
+                    request = frontier.pop()
+
+            page, next_urls = await self._process(request, handle_page)
+
+            async with condition:
+                if page is not None:
+                    results.append(CrawlResult(request=request, page=page))
+                for url, priority in next_urls:
+                    frontier.add(
+                        url,
+                        depth=request.depth + 1,
+                        priority=priority,
+                        parent_url=request.url,
+                    )
+                frontier.mark_done(request)
+                if frontier.done_count % self.checkpoint_interval == 0:
+                    self._save_state(frontier)
+                condition.notify_all()
+
+    async def _process(
+        self, request: CrawlRequest, handle_page: PageHandler
+    ) -> tuple[WebPageContentDTO | None, Sequence[tuple[str, int]]]:
+        """1ページを取得して処理する（失敗してもクロールは続ける）"""
+        try:
+            async with self._host_semaphore(request.host):
+                page = await self.fetcher.fetch_single_page(request.url)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {request.url}: {e}")
+            return None, []
+        if page is None:
+            return None, []
+
+        try:
+            return page, await handle_page(request, page)
+        except Exception as e:
+            logger.warning(f"Failed to process {request.url}: {e}", exc_info=True)
+            return page, []
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(
+                self.config.per_host_concurrency
+            )
+        return self._host_semaphores[host]
+
+    def _create_frontier(self) -> CrawlFrontier:
+        if self.state_path is None:
+            return CrawlFrontier.from_config(self.config)
+        return CrawlFrontier.load(
+            self.state_path,
+            max_depth=self.config.max_depth,
+            max_pages=self.config.max_pages,
+        )
+
+    def _save_state(self, frontier: CrawlFrontier) -> None:
+        if self.state_path is None:
+            return
+        try:
+            frontier.save(self.state_path)
+        except OSError as e:
+            logger.warning(f"Failed to save crawl state to {self.state_path}: {e}")
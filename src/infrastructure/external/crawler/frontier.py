@@ -0,0 +1,224 @@
+"""クロールフロンティア
+
+階層的な議員ページ探索（政党トップ → 都道府県 → 市区町村 → 議員）で、
+次に取得するURLを優先度付きキューで管理します。
+
+- URLは正規化してから重複を判定する（末尾スラッシュ・www・フラグメント等の違いを同一視）
+- 深さ・ページ数の上限を超えるURLは受け付けない
+- 訪問済み・未取得のURLをJSONに保存し、中断したクロールを再開できる
+"""
+
+import heapq
+import itertools
+import json
+import logging
+
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse
+
+from src.domain.value_objects.scraping_config import ScrapingConfig
+from src.infrastructure.external.url_normalizer import normalize_url
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CrawlRequest:
+    """取得待ちのURL
+
+    Attributes:
+        url: 取得するURL
+        depth: 起点ページからの深さ（起点は0）
+        priority: 優先度（小さいほど先に取得）
+        parent_url: このURLを見つけたページのURL
+    """
+
+    url: str
+    depth: int = 0
+    priority: int = 0
+    parent_url: str | None = None
+
+    @property
+    def host(self) -> str:
+        """URLのホスト名"""
+        return (urlparse(self.url).hostname or "").lower()
+
+
+class CrawlFrontier:
+    """優先度付きのクロールフロンティア
+
+    add()でURLを追加し、pop()で優先度の高い順に取り出します。
+    取り出したURLは取得が終わったらmark_done()で完了にします。
+    一度受け付けたURLは（正規化後に）二度と受け付けません。
+    """
+
+    def __init__(self, max_depth: int = 2, max_pages: int = 1000):
+        """
+        Args:
+            max_depth: 受け付ける最大の深さ
+            max_pages: 受け付けるURL数の上限
+        """
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self._queue: list[tuple[int, int, CrawlRequest]] = []
+        self._counter = itertools.count()
+        self._seen: set[str] = set()
+        self._in_flight: dict[str, CrawlRequest] = {}
+        self._done: set[str] = set()
+
+    @classmethod
+    def from_config(cls, config: ScrapingConfig) -> "CrawlFrontier":
+        """ScrapingConfigの上限でフロンティアを作成"""
+        return cls(max_depth=config.max_depth, max_pages=config.max_pages)
+
+    @property
+    def pending_count(self) -> int:
+        """取得待ちのURL数"""
+        return len(self._queue)
+
+    @property
+    def in_flight_count(self) -> int:
+        """取得中のURL数"""
+        return len(self._in_flight)
+
+    @property
+    def done_count(self) -> int:
+        """取得が完了したURL数"""
+        return len(self._done)
+
+    @property
+    def is_finished(self) -> bool:
+        """取得待ちも取得中のURLもないか"""
+        return not self._queue and not self._in_flight
+
+    def add(
+        self,
+        url: str,
+        depth: int = 0,
+        priority: int | None = None,
+        parent_url: str | None = None,
+    ) -> bool:
+        """URLを取得待ちに追加
+
+        Args:
+            url: 追加するURL
+            depth: 起点ページからの深さ
+            priority: 優先度（省略時は深さ＝幅優先）
+            parent_url: このURLを見つけたページのURL
+
+        Returns:
+            追加した場合はTrue、重複・上限超過・対象外の場合はFalse
+        """
+        if urlparse(url).scheme not in ("http", "https"):
+            return False
+        if depth > self.max_depth:
+            return False
+
+        key = normalize_url(url)[1]
+        if key in self._seen:
+            return False
+        if len(self._seen) >= self.max_pages:
+            logger.warning(f"Page limit ({self.max_pages}) reached, skipping {url}")
+            return False
+
+        request = CrawlRequest(
+            url=url,
+            depth=depth,
+            priority=depth if priority is None else priority,
+            parent_url=parent_url,
+        )
+        self._push(key, request)
+        return True
+
+    def pop(self) -> CrawlRequest | None:
+        """最も優先度の高いURLを取り出す（取得待ちがなければNone）"""
+        if not self._queue:
+            return None
+        _, _, request = heapq.heappop(self._queue)
+        self._in_flight[normalize_url(request.url)[1]] = request
+        return request
+
+    def mark_done(self, request: CrawlRequest) -> None:
+        """取り出したURLの取得を完了にする（失敗した場合も含む）"""
+        key = normalize_url(request.url)[1]
+        self._in_flight.pop(key, None)
+        self._done.add(key)
+
+    def is_done(self, url: str) -> bool:
+        """URLが取得済みか"""
+        return normalize_url(url)[1] in self._done
+
+    def save(self, path: str | Path) -> None:
+        """訪問済みURLと未取得のURLを保存
+
+        取得中のURLは未取得として保存し、再開時にもう一度取得します。
+
+        Args:
+            path: 保存先のJSONファイル
+        """
+        pending = [request for _, _, request in sorted(self._queue)]
+        pending.extend(self._in_flight.values())
+        state = {
+            "done": sorted(self._done),
+            "pending": [
+                {
+                    "url": request.url,
+                    "depth": request.depth,
+                    "priority": request.priority,
+                    "parent_url": request.parent_url,
+                }
+                for request in pending
+            ],
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 書きかけのファイルを読まないよう一時ファイル経由で置き換える
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), "utf-8")
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls, path: str | Path, max_depth: int = 2, max_pages: int = 1000
+    ) -> "CrawlFrontier":
+        """保存した状態からフロンティアを復元
+
+        Args:
+            path: save()で保存したJSONファイル
+            max_depth: 受け付ける最大の深さ
+            max_pages: 受け付けるURL数の上限
+
+        Returns:
+            復元したフロンティア（ファイルがなければ空のフロンティア）
+        """
+        frontier = cls(max_depth=max_depth, max_pages=max_pages)
+        path = Path(path)
+        if not path.exists():
+            return frontier
+
+        try:
+            state = json.loads(path.read_text("utf-8"))
+            for key in state["done"]:
+                frontier._seen.add(key)
+                frontier._done.add(key)
+            for item in state["pending"]:
+                request = CrawlRequest(**item)
+                key = normalize_url(request.url)[1]
+                if key not in frontier._seen:
+                    frontier._push(key, request)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load crawl state from {path}: {e}")
+            return cls(max_depth=max_depth, max_pages=max_pages)
+
+        logger.info(
+            f"Resumed crawl state: {frontier.done_count} done, "
+            f"{frontier.pending_count} pending"
+        )
+        return frontier
+
+    def _push(self, key: str, request: CrawlRequest) -> None:
+        self._seen.add(key)
+        # 同じ優先度では追加順に取り出す
+        heapq.heappush(self._queue, (request.priority, next(self._counter), request))
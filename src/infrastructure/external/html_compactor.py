@@ -0,0 +1,374 @@
+"""LLM入力用のHTMLの圧縮
+
+議員名簿などのHTMLを、構造を保った簡潔な行指向のテキストに変換します。
+
+- 表: 1行1レコード（セルを" | "で区切る）
+- リスト: 1項目1行（"- "で始める、入れ子はインデント）
+- 定義リスト: "用語: 説明"
+- 見出し: "## 見出し"（レベルに応じた"#"）
+
+属性・スクリプト・ナビゲーションなどの定型部分は捨てます。
+圧縮後も長い場合は行の途中で切らずにチャンクへ分割し、
+各チャンクの先頭には直前の見出しと表のヘッダー行を付け直します。
+"""
+
+import asyncio
+import logging
+import re
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from bs4 import BeautifulSoup, Tag
+from bs4.element import NavigableString
+
+from src.domain.services.name_normalizer import get_name_normalizer
+
+
+logger = logging.getLogger(__name__)
+
+# 定数定義
+DEFAULT_MAX_CHUNK_CHARS = 12000  # 1チャンク（LLM呼び出し1回）の最大文字数
+CELL_SEPARATOR = " | "
+
+# 本文ではない定型部分のタグ
+BOILERPLATE_TAGS = (
+    "script",
+    "style",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "iframe",
+    "noscript",
+    "svg",
+    "canvas",
+    "video",
+    "audio",
+    "form",
+    "button",
+    "input",
+    "select",
+    "textarea",
+)
+
+_DROPPED_TAGS = (*BOILERPLATE_TAGS, "head", "template", "object", "embed", "map")
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+_BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "blockquote",
+        "body",
+        "br",
+        "caption",
+        "center",
+        "dd",
+        "div",
+        "dt",
+        "figcaption",
+        "figure",
+        "hr",
+        "html",
+        "li",
+        "main",
+        "p",
+        "pre",
+        "section",
+        "td",
+        "th",
+        "tr",
+    }
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class CompactLine:
+    """圧縮後の1行
+
+    Attributes:
+        text: 行のテキスト
+        context: チャンクがこの行から始まる場合に先頭へ付け直す行
+            （上位の見出し、表のキャプションとヘッダー行）
+    """
+
+    text: str
+    context: tuple[str, ...] = ()
+
+
+def _collapse(text: str) -> str:
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def _text(element: Tag) -> str:
+    return _collapse(element.get_text(" "))
+
+
+def _own(elements: list[Tag], parent: Tag, parent_names: str | list[str]) -> list[Tag]:
+    """入れ子の同種要素を除き、parentに直接属する要素だけを返す"""
+    return [
+        element for element in elements if element.find_parent(parent_names) is parent
+    ]
+
+
+class _CompactWriter:
+    """HTMLの要素をたどってCompactLineを書き出す"""
+
+    def __init__(self) -> None:
+        self.lines: list[CompactLine] = []
+        self._buffer: list[str] = []
+        self._headings: list[tuple[int, str]] = []
+
+    def write(self, element: Tag) -> list[CompactLine]:
+        self._walk(element)
+        self._flush()
+        return self.lines
+
+    @property
+    def _heading_context(self) -> tuple[str, ...]:
+        return tuple(text for _, text in self._headings)
+
+    def _emit(self, text: str, context: tuple[str, ...]) -> None:
+        if text:
+            self.lines.append(CompactLine(text=text, context=context))
+
+    def _flush(self) -> None:
+        text = _collapse("".join(self._buffer))
+        self._buffer.clear()
+        self._emit(text, self._heading_context)
+
+    def _walk(self, element: Tag) -> None:
+        for child in element.children:
+            if isinstance(child, NavigableString):
+                # コメント・DOCTYPE・ルビなどのサブクラスは本文として扱わない
+                if type(child) is NavigableString:
+                    self._buffer.append(str(child))
+                continue
+            if not isinstance(child, Tag):
+                continue
+
+            name = child.name
+            if name in _HEADING_LEVELS:
+                self._flush()
+                self._heading(child, _HEADING_LEVELS[name])
+            elif name == "table":
+                self._flush()
+                self._table(child)
+            elif name in ("ul", "ol"):
+                self._flush()
+                self._list(child, depth=0)
+            elif name == "dl":
+                self._flush()
+                self._definition_list(child)
+            elif name in _BLOCK_TAGS:
+                self._flush()
+                self._walk(child)
+                self._flush()
+            else:
+                # インライン要素はテキストを連結する
+                self._walk(child)
+
+    def _heading(self, heading: Tag, level: int) -> None:
+        text = _text(heading)
+        if not text:
+            return
+        while self._headings and self._headings[-1][0] >= level:
+            self._headings.pop()
+        line = f"{'#' * level} {text}"
+        self._emit(line, self._heading_context)
+        self._headings.append((level, line))
+
+    def _table(self, table: Tag) -> None:
+        context = self._heading_context
+        caption = table.find("caption")
+        if isinstance(caption, Tag) and caption.find_parent("table") is table:
+            caption_text = _text(caption)
+            self._emit(caption_text, context)
+            if caption_text:
+                context = (*context, caption_text)
+
+        header: str | None = None
+        for row in _own(table.find_all("tr"), table, "table"):
+            cells = _own(row.find_all(["th", "td"]), row, "tr")
+            texts = [_text(cell) for cell in cells]
+            if not any(texts):
+                continue
+            line = CELL_SEPARATOR.join(texts).rstrip()
+            self._emit(line, context if header is None else (*context, header))
+            is_header_row = row.find_parent("thead") is not None or all(
+                cell.name == "th" for cell in cells
+            )
+            if header is None and is_header_row:
+                header = line
+
+    def _list(self, list_tag: Tag, depth: int) -> None:
+        context = self._heading_context
+        for item in _own(list_tag.find_all("li"), list_tag, ["ul", "ol"]):
+            nested_lists = _own(item.find_all(["ul", "ol"]), item, "li")
+            for nested_list in nested_lists:
+                nested_list.extract()
+            text = _text(item)
+            if text:
+                self._emit(f"{'  ' * depth}- {text}", context)
+            for nested_list in nested_lists:
+                self._list(nested_list, depth + 1)
+
+    def _definition_list(self, definition_list: Tag) -> None:
+        context = self._heading_context
+        term: str | None = None
+        term_described = False
+        for child in _own(
+            definition_list.find_all(["dt", "dd"]), definition_list, "dl"
+        ):
+            text = _text(child)
+            if child.name == "dt":
+                if term and not term_described:
+                    self._emit(term, context)
+                term, term_described = text, False
+            else:
+                self._emit(f"{term}: {text}" if term else text, context)
+                term_described = True
+        if term and not term_described:
+            self._emit(term, context)
+
+
+class HtmlCompactor:
+    """HTMLをLLM入力用の簡潔なテキストに変換するクラス
+
+    Attributes:
+        max_chunk_chars: 1チャンクの最大文字数
+    """
+
+    def __init__(self, max_chunk_chars: int = DEFAULT_MAX_CHUNK_CHARS):
+        """
+        Args:
+            max_chunk_chars: 1チャンクの最大文字数
+        """
+        if max_chunk_chars <= 0:
+            raise ValueError("max_chunk_chars must be positive")
+        self.max_chunk_chars = max_chunk_chars
+
+    def compact_lines(self, html_content: str) -> list[CompactLine]:
+        """HTMLを圧縮後の行のリストに変換する
+
+        mainタグがあればその中だけを対象にします。
+
+        Args:
+            html_content: HTMLコンテンツ
+
+        Returns:
+            圧縮後の行のリスト
+        """
+        soup = BeautifulSoup(html_content, "html.parser")
+        for element in soup.find_all(list(_DROPPED_TAGS)):
+            element.decompose()
+        # 顔写真などの画像は代替テキストだけを残す
+        for image in soup.find_all("img"):
+            alt = image.get("alt")
+            image.replace_with(f" {alt} " if isinstance(alt, str) else "")
+
+        root = soup.find("main") or soup.find("body") or soup
+        if not isinstance(root, Tag):
+            return []
+        return _CompactWriter().write(root)
+
+    def compact(self, html_content: str) -> str:
+        """HTMLを圧縮したテキストを返す
+
+        Args:
+            html_content: HTMLコンテンツ
+
+        Returns:
+            圧縮後のテキスト
+        """
+        return "\n".join(line.text for line in self.compact_lines(html_content))
+
+    def split(self, html_content: str) -> list[str]:
+        """HTMLを圧縮し、max_chunk_chars以下のチャンクに分割する
+
+        行（表の1行、リストの1項目など）の途中では分割しません。
+        2つ目以降のチャンクの先頭には、最初の行の見出しと表のヘッダー行を付け直します。
+        max_chunk_charsの半分を超える1行だけは、やむを得ず文字数で分割します。
+
+        Args:
+            html_content: HTMLコンテンツ
+
+        Returns:
+            チャンクのリスト（本文がなければ空）
+        """
+        return self.chunk_lines(self.compact_lines(html_content))
+
+    def chunk_lines(self, lines: Sequence[CompactLine]) -> list[str]:
+        """圧縮後の行をmax_chunk_chars以下のチャンクにまとめる
+
+        Args:
+            lines: 圧縮後の行のリスト
+
+        Returns:
+            チャンクのリスト
+        """
+        piece_length = max(1, self.max_chunk_chars // 2)
+        chunks: list[list[str]] = []
+        current: list[str] = []
+        size = 0
+        for line in lines:
+            for start in range(0, len(line.text), piece_length):
+                piece = line.text[start : start + piece_length]
+                if current and size + len(piece) + 1 > self.max_chunk_chars:
+                    chunks.append(current)
+                    current = [text for text in line.context if text != piece]
+                    size = sum(len(text) + 1 for text in current)
+                current.append(piece)
+                size += len(piece) + 1
+        if current:
+            chunks.append(current)
+        return ["\n".join(chunk) for chunk in chunks]
+
+
+class _NamedMember(Protocol):
+    name: str
+
+
+async def extract_from_chunks[MemberT: _NamedMember](
+    chunks: Sequence[str],
+    extract_chunk: Callable[[str], Awaitable[list[MemberT]]],
+) -> list[MemberT]:
+    """チャンクごとの抽出を並行実行し、結果を名前で重複除去して結合する
+
+    一部のチャンクが失敗しても残りの結果を返します。
+    すべてのチャンクが失敗した場合は最初の例外を送出します。
+
+    Args:
+        chunks: HtmlCompactor.split()で分割したチャンク
+        extract_chunk: 1チャンクからメンバーを抽出する関数
+
+    Returns:
+        ページ内の出現順に並んだメンバーのリスト（同名は最初の1件のみ）
+    """
+    results = await asyncio.gather(
+        *(extract_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    errors: list[BaseException] = []
+    members: list[MemberT] = []
+    seen_names: set[str] = set()
+    normalizer = get_name_normalizer()
+    for index, result in enumerate(results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                f"Extraction failed for chunk {index + 1}/{len(chunks)}: {result}"
+            )
+            errors.append(result)
+            continue
+        for member in result:
+            key = normalizer.normalize(member.name)
+            if key in seen_names:
+                continue
+            seen_names.add(key)
+            members.append(member)
+
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    return members
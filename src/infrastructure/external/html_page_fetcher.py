@@ -2,6 +2,7 @@
 
 Playwright を使用してWebページをフェッチし、ページネーションを処理します。
 元々は政党メンバーページ用でしたが、汎用的なHTMLフェッチャーとして使用できます。
+1つのブラウザコンテキストを共有するため、fetch_single_page は並列に呼び出せます。
 """
 
 import asyncio
@@ -10,7 +11,13 @@ import logging
 from types import TracebackType
 from typing import Any
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
 
 from src.application.dtos.web_page_content_dto import WebPageContentDTO
 from src.infrastructure.config.settings import get_settings
@@ -19,20 +26,34 @@ from src.infrastructure.config.settings import get_settings
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# 遅延読み込みされる一覧を表示するためのスクロールの最大回数と待ち時間
+MAX_SCROLL_ROUNDS = 3
+SCROLL_WAIT_SECONDS = 0.5
+
 
 class HtmlPageFetcher:
     """Webページを取得（ページネーション対応）
 
     Playwright を使用してJavaScriptをレンダリングした後のHTMLを取得します。
     ページネーションに対応し、複数ページを順番に取得できます。
+    fetch_single_page はページごとにタブを開くため、並列に呼び出せます。
     """
 
-    def __init__(self, proc_logger: Any = None):
+    def __init__(self, proc_logger: Any = None, headless: bool = True):
         """初期化
 
         Args:
             proc_logger: 処理ログ出力用のオプションロガー（Streamlit等で使用）
+            headless: ブラウザをヘッドレスモードで起動するか
         """
+        self.headless = headless
+        self.playwright: Playwright | None = None
         self.browser: Browser | None = None
         self.context: BrowserContext | None = None
         self.settings = get_settings()
@@ -41,21 +62,16 @@ class HtmlPageFetcher:
     async def __aenter__(self):
         try:
             playwright = await async_playwright().start()
+            self.playwright = playwright
             self.browser = await playwright.chromium.launch(
-                headless=True,
+                headless=self.headless,
                 args=[
                     "--no-sandbox",
                     "--disable-setuid-sandbox",
                     "--disable-dev-shm-usage",
                 ],
             )
-            self.context = await self.browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            )
+            self.context = await self.browser.new_context(user_agent=USER_AGENT)
             return self
         except Exception as e:
             logger.error(f"Failed to initialize browser: {e}")
@@ -72,6 +88,8 @@ class HtmlPageFetcher:
                 await self.context.close()
             if self.browser:
                 await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
         except Exception:
             pass
 
@@ -118,11 +136,7 @@ class HtmlPageFetcher:
                     timeout=self.settings.page_load_timeout * 1000,
                 )
 
-            await asyncio.sleep(2)
-
-            for _ in range(3):
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
+            await self._scroll_until_stable(page)
 
             current_page_num = 1
 
@@ -162,7 +176,7 @@ class HtmlPageFetcher:
                         await page.wait_for_load_state("networkidle", timeout=3000)
                     except Exception:
                         logger.debug("Network idle timeout on pagination, continuing")
-                    await asyncio.sleep(2)
+                    await self._scroll_until_stable(page)
                 except Exception as e:
                     logger.warning(f"Failed to navigate to next page: {e}")
                     break
@@ -181,6 +195,17 @@ class HtmlPageFetcher:
         finally:
             await page.close()
 
+    async def _scroll_until_stable(self, page: Page) -> None:
+        """遅延読み込みされる要素が出るまで、ページの高さが変わらなくなるまでスクロール"""
+        height = await page.evaluate("document.body.scrollHeight")
+        for _ in range(MAX_SCROLL_ROUNDS):
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await asyncio.sleep(SCROLL_WAIT_SECONDS)
+            new_height = await page.evaluate("document.body.scrollHeight")
+            if new_height == height:
+                break
+            height = new_height
+
     async def _find_next_page_link(self, page: Page):
         """次のページへのリンクを探す"""
         next_patterns = [
@@ -254,11 +279,7 @@ class HtmlPageFetcher:
                     wait_until="load",
                     timeout=self.settings.page_load_timeout * 1000,
                 )
-            await asyncio.sleep(2)
-
-            for _ in range(3):
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
+            await self._scroll_until_stable(page)
 
             content = await page.content()
             return WebPageContentDTO(url=url, html_content=content, page_number=1)
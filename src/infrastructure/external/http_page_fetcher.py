@@ -0,0 +1,198 @@
+"""静的HTMLのHTTPフェッチャー
+
+ブラウザを起動せずに、aiohttpでサーバーが返したHTMLをそのまま取得します。
+
+- 1つのセッションで接続をプールし、同じホストへの接続を再利用する
+- gzip/deflateで圧縮された応答を受け取る
+- 文字コードはBOM、Content-Type、<meta>の宣言、UTF-8/Shift_JIS/EUC-JPの順で判定する
+  （自治体サイトにはShift_JIS・EUC-JPのページが多い）
+"""
+
+import codecs
+import logging
+import re
+
+from dataclasses import dataclass
+from types import TracebackType
+
+import aiohttp
+
+from src.infrastructure.external.html_page_fetcher import USER_AGENT
+
+
+logger = logging.getLogger(__name__)
+
+# 定数定義
+DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_CONNECTION_LIMIT = 20
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 4
+META_SNIFF_BYTES = 4096  # <meta charset>を探す先頭のバイト数
+
+_CONTENT_TYPE_CHARSET_PATTERN = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_PATTERN = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE
+)
+
+# Shift_JISと宣言されたページは機種依存文字を含むことが多いためCP932で読む
+_CHARSET_ALIASES = {
+    "shift_jis": "cp932",
+    "shift-jis": "cp932",
+    "sjis": "cp932",
+    "x-sjis": "cp932",
+    "windows-31j": "cp932",
+    "ms932": "cp932",
+    "euc-jp": "euc_jp",
+    "x-euc-jp": "euc_jp",
+}
+_FALLBACK_ENCODINGS = ("utf-8", "cp932", "euc_jp")
+
+
+def detect_declared_charset(body: bytes, content_type: str = "") -> str | None:
+    """Content-Typeまたは<meta>で宣言された文字コードを取得
+
+    Args:
+        body: 応答本文
+        content_type: Content-Typeヘッダー
+
+    Returns:
+        Pythonのコーデック名（宣言がなければNone）
+    """
+    match = _CONTENT_TYPE_CHARSET_PATTERN.search(content_type)
+    if match:
+        charset = match.group(1)
+    else:
+        meta_match = _META_CHARSET_PATTERN.search(body[:META_SNIFF_BYTES])
+        if not meta_match:
+            return None
+        charset = meta_match.group(1).decode("ascii", errors="ignore")
+    charset = charset.lower()
+    return _CHARSET_ALIASES.get(charset, charset)
+
+
+def decode_html(body: bytes, content_type: str = "") -> str:
+    """応答本文を文字列にデコード
+
+    宣言された文字コードで読めない場合（宣言の誤りはよくある）は、
+    UTF-8・CP932・EUC-JPの順に厳密にデコードできるものを使います。
+
+    Args:
+        body: 応答本文
+        content_type: Content-Typeヘッダー
+
+    Returns:
+        デコードしたHTML
+    """
+    if body.startswith(codecs.BOM_UTF8):
+        return body[len(codecs.BOM_UTF8) :].decode("utf-8", errors="replace")
+
+    declared = detect_declared_charset(body, content_type)
+    candidates = [declared] if declared else []
+    candidates.extend(e for e in _FALLBACK_ENCODINGS if e != declared)
+    for encoding in candidates:
+        try:
+            return body.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return body.decode("utf-8", errors="replace")
+
+
+@dataclass(frozen=True)
+class HttpPage:
+    """HTTPで取得したページ
+
+    Attributes:
+        url: リダイレクト後の最終的なURL
+        status: HTTPステータスコード
+        content_type: Content-Typeヘッダー
+        html: デコードした本文
+    """
+
+    url: str
+    status: int
+    content_type: str
+    html: str
+
+    @property
+    def is_html(self) -> bool:
+        """本文がHTMLか（Content-Typeがない場合もHTMLとみなす）"""
+        media_type = self.content_type.split(";")[0].strip().lower()
+        return media_type in ("", "text/html", "application/xhtml+xml")
+
+
+class HttpPageFetcher:
+    """aiohttpによるHTMLフェッチャー
+
+    コンテキストマネージャーとして使用し、その間は接続を使い回します。
+    fetch は並列に呼び出せます。
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    ):
+        """
+        Args:
+            timeout_seconds: 1リクエストのタイムアウト（秒）
+            connection_limit: 同時接続数の上限
+            connection_limit_per_host: ホストごとの同時接続数の上限
+        """
+        self.timeout_seconds = timeout_seconds
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> "HttpPageFetcher":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=300,
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+                "Accept-Encoding": "gzip, deflate",
+                "Accept-Language": "ja,en;q=0.8",
+            },
+        )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def fetch(self, url: str) -> HttpPage:
+        """URLのHTMLを取得
+
+        Args:
+            url: 取得するURL
+
+        Returns:
+            取得したページ（4xx・5xxの場合もそのまま返す）
+
+        Raises:
+            RuntimeError: セッションが開始されていない場合
+            aiohttp.ClientError: 接続に失敗した場合
+            TimeoutError: タイムアウトした場合
+        """
+        if not self.session:
+            raise RuntimeError("HTTP session not initialized")
+
+        async with self.session.get(url, allow_redirects=True) as response:
+            body = await response.read()
+            content_type = response.headers.get("Content-Type", "")
+            return HttpPage(
+                url=str(response.url),
+                status=response.status,
+                content_type=content_type,
+                html=decode_html(body, content_type),
+            )
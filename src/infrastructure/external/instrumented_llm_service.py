@@ -414,6 +414,10 @@ class InstrumentedLLMService(ILLMService):
         """Delegate to wrapped LLM service."""
         return self._llm_service.invoke_llm(messages)
 
+    async def ainvoke_llm(self, messages: list[dict[str, str]]) -> str:
+        """Delegate to wrapped LLM service."""
+        return await self._llm_service.ainvoke_llm(messages)
+
     def __getattr__(self, name: str) -> Any:
         """Delegate unknown attributes to wrapped service."""
         return getattr(self._llm_service, name)
@@ -0,0 +1,336 @@
+"""国会会議録検索システムの発言APIクライアント
+
+国会会議録検索システム（kokkai.ndl.go.jp）の検索用API（/api/speech）から、
+会議録の発言を1件ずつの構造化レコード（発言者・役職・発言順・本文）として取得します。
+ブラウザでの描画やLLMによる発言分割を行わずに、発言の順序と区切りがそのまま得られます。
+
+- 1リクエストで取得できる件数（100件）ごとにページを分けて取得する
+- 1ページ目で総件数を確認し、残りのページは並列数を制限して取得する
+- 取得したページはJSONとして保存し、中断した取得は保存済みのページから再開する
+"""
+
+import asyncio
+import json
+import logging
+import re
+import shutil
+
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from src.infrastructure.exceptions import ExternalServiceException
+
+
+logger = logging.getLogger(__name__)
+
+# 定数定義
+API_BASE_URL = "https://kokkai.ndl.go.jp/api"
+MAX_RECORDS_PER_PAGE = 100  # 発言APIの1リクエストあたりの上限
+DEFAULT_MAX_CONCURRENCY = 3  # 公開APIのため同時リクエスト数は控えめにする
+DEFAULT_TIMEOUT_SECONDS = 60
+DEFAULT_STATE_DIR = "./cache/kokkai_api"
+
+SERVICE_NAME = "国会会議録検索システムAPI"
+
+# 会議録ID（issueID）: 例 121705253X00320250423
+_ISSUE_ID_PATTERN = re.compile(r"\d{9}[A-Z]\d{11}")
+
+# 発言本文の先頭にある発言者表記: 例「○安住委員長　」
+_SPEAKER_MARK_PATTERN = re.compile(r"^[○◯◎]\S*?[　 ]+")
+
+
+def extract_issue_id(url: str) -> str | None:
+    """URLから会議録ID（issueID）を取得
+
+    Args:
+        url: 国会会議録検索システムのURL（例: .../txt/121705253X00320250423/0,
+            ...?minId=121705253X00320250423）
+
+    Returns:
+        会議録ID（含まれていなければNone）
+    """
+    match = _ISSUE_ID_PATTERN.search(url)
+    return match.group(0) if match else None
+
+
+def _optional_str(value: Any) -> str | None:
+    return str(value) if value else None
+
+
+@dataclass(frozen=True)
+class KokkaiSpeechRecord:
+    """発言APIの1発言分のレコード
+
+    Attributes:
+        speech_id: 発言ID
+        speech_order: 会議録内の発言順（0は会議録情報）
+        speaker: 発言者名
+        speech: 発言本文（先頭に「○発言者表記　」を含む）
+        speaker_yomi: 発言者名の読み
+        speaker_group: 発言者の所属会派
+        speaker_position: 発言者の肩書き（例: 予算委員長）
+        speaker_role: 発言者の役割（例: 証人、参考人）
+        speech_url: 発言のURL
+    """
+
+    speech_id: str
+    speech_order: int
+    speaker: str
+    speech: str
+    speaker_yomi: str | None = None
+    speaker_group: str | None = None
+    speaker_position: str | None = None
+    speaker_role: str | None = None
+    speech_url: str | None = None
+
+    @classmethod
+    def from_api(cls, record: dict[str, Any]) -> "KokkaiSpeechRecord":
+        """APIのspeechRecordからレコードを作成"""
+        return cls(
+            speech_id=str(record["speechID"]),
+            speech_order=int(record["speechOrder"]),
+            speaker=str(record.get("speaker") or ""),
+            speech=str(record.get("speech") or ""),
+            speaker_yomi=_optional_str(record.get("speakerYomi")),
+            speaker_group=_optional_str(record.get("speakerGroup")),
+            speaker_position=_optional_str(record.get("speakerPosition")),
+            speaker_role=_optional_str(record.get("speakerRole")),
+            speech_url=_optional_str(record.get("speechURL")),
+        )
+
+    @property
+    def text(self) -> str:
+        """先頭の発言者表記を除いた発言内容"""
+        return _SPEAKER_MARK_PATTERN.sub("", self.speech.strip(), count=1).strip()
+
+
+@dataclass(frozen=True)
+class KokkaiMeetingRecord:
+    """1つの会議録と、その全発言
+
+    Attributes:
+        issue_id: 会議録ID
+        session: 国会回次
+        name_of_house: 院名（例: 衆議院）
+        name_of_meeting: 会議名（例: 予算委員会）
+        issue: 号数（例: 第3号）
+        date: 開催日
+        meeting_url: 会議録テキスト表示画面のURL
+        pdf_url: 会議録PDF表示画面のURL
+        speeches: 発言順に並べた発言（会議録情報を含む）
+    """
+
+    issue_id: str
+    session: int | None
+    name_of_house: str
+    name_of_meeting: str
+    issue: str
+    date: date | None
+    meeting_url: str | None
+    pdf_url: str | None
+    speeches: tuple[KokkaiSpeechRecord, ...]
+
+    @property
+    def title(self) -> str:
+        """会議録のタイトル（例: 第217回国会　衆議院　予算委員会　第3号）"""
+        parts = [
+            f"第{self.session}回国会" if self.session else "",
+            self.name_of_house,
+            self.name_of_meeting,
+            self.issue,
+        ]
+        return "　".join(part for part in parts if part)
+
+
+class KokkaiSpeechClient:
+    """発言APIから会議録の全発言を取得するクライアント
+
+    並列数の制限はクライアント単位のため、複数の会議録を並行して取得する場合も
+    1つのインスタンスを共有すれば、APIへの同時リクエスト数は上限を超えません。
+
+    Example:
+        client = KokkaiSpeechClient()
+        meeting = await client.fetch_meeting("121705253X00320250423")
+    """
+
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        records_per_page: int = MAX_RECORDS_PER_PAGE,
+        state_dir: str | Path | None = DEFAULT_STATE_DIR,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        """
+        Args:
+            base_url: APIのベースURL
+            max_concurrency: APIへの同時リクエスト数の上限
+            records_per_page: 1リクエストで取得する発言数（最大100）
+            state_dir: 取得済みページの保存先（Noneの場合は保存・再開しない）
+            timeout_seconds: 1リクエストのタイムアウト（秒）
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not 1 <= records_per_page <= MAX_RECORDS_PER_PAGE:
+            raise ValueError(
+                f"records_per_page must be between 1 and {MAX_RECORDS_PER_PAGE}"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.records_per_page = records_per_page
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.timeout_seconds = timeout_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_meeting(self, issue_id: str) -> KokkaiMeetingRecord:
+        """会議録の全発言を取得
+
+        途中のページで失敗した場合、取得済みのページは保存されたまま残り、
+        次回の呼び出しでは残りのページだけを取得します。
+
+        Args:
+            issue_id: 会議録ID
+
+        Returns:
+            会議録と発言順に並べた全発言
+
+        Raises:
+            ValueError: 会議録が見つからない場合
+            ExternalServiceException: APIがエラーを返した場合
+            aiohttp.ClientError: 接続に失敗した場合
+        """
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+        ) as session:
+            first_page = await self._get_page(session, issue_id, 1)
+            total = int(first_page.get("numberOfRecords") or 0)
+            if total == 0:
+                raise ValueError(f"No speech records found for minutes {issue_id}")
+
+            starts = range(1 + self.records_per_page, total + 1, self.records_per_page)
+            other_pages = await asyncio.gather(
+                *(self._get_page(session, issue_id, start) for start in starts)
+            )
+
+        records: dict[str, dict[str, Any]] = {}
+        for page in (first_page, *other_pages):
+            for record in page.get("speechRecord", []):
+                records[str(record["speechID"])] = record
+        if len(records) != total:
+            logger.warning(
+                f"Expected {total} speech records for {issue_id}, got {len(records)}"
+            )
+
+        meeting = self._build_meeting(issue_id, list(records.values()))
+        self._clear_state(issue_id)
+        logger.info(
+            f"Fetched {len(meeting.speeches)} speech records for {issue_id} "
+            f"({len(starts) + 1} pages)"
+        )
+        return meeting
+
+    async def _get_page(
+        self, session: aiohttp.ClientSession, issue_id: str, start: int
+    ) -> dict[str, Any]:
+        """1ページ分の発言を取得（保存済みのページがあればそれを使う）"""
+        saved = self._load_page(issue_id, start)
+        if saved is not None:
+            return saved
+
+        params = {
+            "issueID": issue_id,
+            "startRecord": str(start),
+            "maximumRecords": str(self.records_per_page),
+            "recordPacking": "json",
+        }
+        async with self._semaphore:
+            async with session.get(f"{self.base_url}/speech", params=params) as res:
+                body = await res.text()
+                if res.status != 200:
+                    raise ExternalServiceException(
+                        service=SERVICE_NAME,
+                        operation="発言取得",
+                        status_code=res.status,
+                        response_body=body,
+                    )
+
+        try:
+            page = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise ExternalServiceException(
+                service=SERVICE_NAME,
+                operation="発言取得",
+                response_body=body,
+                reason=f"JSONとして読めない応答: {e}",
+            ) from e
+        if "message" in page and "speechRecord" not in page:
+            # 検索条件の誤りなどはHTTP 200のままエラーメッセージが返る
+            raise ExternalServiceException(
+                service=SERVICE_NAME,
+                operation="発言取得",
+                response_body=body,
+                reason=str(page["message"]),
+            )
+
+        self._save_page(issue_id, start, page)
+        return page
+
+    def _build_meeting(
+        self, issue_id: str, records: list[dict[str, Any]]
+    ) -> KokkaiMeetingRecord:
+        # 会議の情報は各発言レコードに同じ値が入っている
+        head = records[0]
+        speeches = sorted(
+            (KokkaiSpeechRecord.from_api(record) for record in records),
+            key=lambda speech: speech.speech_order,
+        )
+        session = head.get("session")
+        return KokkaiMeetingRecord(
+            issue_id=issue_id,
+            session=int(session) if session else None,
+            name_of_house=str(head.get("nameOfHouse") or ""),
+            name_of_meeting=str(head.get("nameOfMeeting") or ""),
+            issue=str(head.get("issue") or ""),
+            date=date.fromisoformat(head["date"]) if head.get("date") else None,
+            meeting_url=_optional_str(head.get("meetingURL")),
+            pdf_url=_optional_str(head.get("pdfURL")),
+            speeches=tuple(speeches),
+        )
+
+    def _page_path(self, issue_id: str, start: int) -> Path | None:
+        if self.state_dir is None:
+            return None
+        return self.state_dir / issue_id / f"{start:06d}.json"
+
+    def _load_page(self, issue_id: str, start: int) -> dict[str, Any] | None:
+        path = self._page_path(issue_id, start)
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text("utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable saved page {path}: {e}")
+            return None
+
+    def _save_page(self, issue_id: str, start: int, page: dict[str, Any]) -> None:
+        path = self._page_path(issue_id, start)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 書きかけのファイルを読まないよう一時ファイル経由で置き換える
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(page, ensure_ascii=False), "utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to save page {start} of {issue_id}: {e}")
+
+    def _clear_state(self, issue_id: str) -> None:
+        """全ページを取得できた会議録の保存済みページを削除"""
+        if self.state_dir is None:
+            return
+        shutil.rmtree(self.state_dir / issue_id, ignore_errors=True)
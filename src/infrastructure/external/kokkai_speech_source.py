@@ -0,0 +1,88 @@
+"""国会会議録の構造化発言ソース
+
+国会会議録検索システムのURLを持つ会議について、発言APIのレコードを
+そのままSpeakerSpeechに変換します。議事録処理はこのソースから発言を得た場合、
+議事録テキストのLLMによる発言分割を行わずに発言を保存します。
+"""
+
+import logging
+
+from urllib.parse import urlparse
+
+from src.domain.value_objects.speaker_speech import SpeakerSpeech
+from src.infrastructure.external.kokkai_speech_client import (
+    KokkaiMeetingRecord,
+    KokkaiSpeechClient,
+    extract_issue_id,
+)
+
+
+logger = logging.getLogger(__name__)
+
+KOKKAI_HOST = "kokkai.ndl.go.jp"
+
+
+def to_speaker_speeches(meeting: KokkaiMeetingRecord) -> list[SpeakerSpeech]:
+    """会議録の発言レコードをSpeakerSpeechに変換
+
+    発言順0の会議録情報（出席者一覧など）と、発言者・本文のないレコードは除きます。
+
+    Args:
+        meeting: 発言APIから取得した会議録
+
+    Returns:
+        発言順のSpeakerSpeechのリスト
+    """
+    speeches: list[SpeakerSpeech] = []
+    for record in meeting.speeches:
+        text = record.text
+        if record.speech_order < 1 or not record.speaker or not text:
+            continue
+        speeches.append(
+            SpeakerSpeech(
+                speaker=record.speaker,
+                speech_content=text,
+                speech_order=record.speech_order,
+            )
+        )
+    return speeches
+
+
+class KokkaiSpeechSource:
+    """国会会議録検索システムの構造化発言ソース（IStructuredMinutesSourceの実装）"""
+
+    def __init__(self, client: KokkaiSpeechClient | None = None):
+        """
+        Args:
+            client: 発言APIクライアント（並列数の上限を共有するため使い回す）
+        """
+        self.client = client or KokkaiSpeechClient()
+
+    def supports(self, url: str) -> bool:
+        """URLが会議録IDを含む国会会議録検索システムのURLか"""
+        host = (urlparse(url).hostname or "").lower()
+        return host == KOKKAI_HOST and extract_issue_id(url) is not None
+
+    async def fetch_speeches(self, url: str) -> list[SpeakerSpeech]:
+        """会議録の発言を発言順に取得
+
+        Args:
+            url: 国会会議録検索システムの会議録URL
+
+        Returns:
+            発言順のSpeakerSpeechのリスト
+
+        Raises:
+            ValueError: 対応していないURL、または発言が見つからない場合
+        """
+        issue_id = extract_issue_id(url) if self.supports(url) else None
+        if issue_id is None:
+            raise ValueError(f"Not a Diet minutes URL: {url}")
+
+        meeting = await self.client.fetch_meeting(issue_id)
+        speeches = to_speaker_speeches(meeting)
+        if not speeches:
+            raise ValueError(f"No speeches found for minutes {issue_id}")
+
+        logger.info(f"Loaded {len(speeches)} speeches for {issue_id} from the API")
+        return speeches
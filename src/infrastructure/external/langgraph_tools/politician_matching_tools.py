@@ -1,7 +1,8 @@
 """LangGraph tools for politician matching.
 
-政治家マッチングエージェント用のLangGraphツール。
-ReActパターンによる反復的推論を支援するツールを提供します。
+政治家マッチングの各手順（候補検索・所属検証・BAML判定）を個別に実行する
+LangGraphツール。マッチング本体はPoliticianMatchingPipelineが固定の手順で
+実行し、これらのツールは各手順を単独で試すために使用します。
 """
 
 import json
@@ -18,6 +19,10 @@ from src.domain.repositories.politician_affiliation_repository import (
     PoliticianAffiliationRepository,
 )
 from src.domain.repositories.politician_repository import PoliticianRepository
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -96,6 +101,14 @@ def create_politician_matching_tools(
     if affiliation_repo is None:
         raise ValueError("affiliation_repo is required")
 
+    # 政治家一覧はツール間で共有し、最初の呼び出し時に1回だけ取得する
+    politicians_cache: list[dict[str, Any]] = []
+
+    async def load_politicians() -> list[dict[str, Any]]:
+        if not politicians_cache:
+            politicians_cache.extend(await politician_repo.get_all_for_matching())
+        return politicians_cache
+
     @tool
     async def search_politician_candidates(
         speaker_name: str,
@@ -148,7 +161,7 @@ def create_politician_matching_tools(
             speaker_name = speaker_name.strip()
 
             # 政治家一覧を取得
-            all_politicians = await politician_repo.get_all_for_matching()
+            all_politicians = await load_politicians()
 
             if not all_politicians:
                 return {
@@ -237,7 +250,7 @@ def create_politician_matching_tools(
         """
         try:
             # 政治家情報を取得
-            politicians = await politician_repo.get_all_for_matching()
+            politicians = await load_politicians()
             politician = next(
                 (p for p in politicians if p.get("id") == politician_id), None
             )
@@ -351,12 +364,13 @@ def create_politician_matching_tools(
 
             # BAML呼び出し
             logger.info(f"Calling BAML MatchPolitician for speaker='{speaker_name}'")
-            baml_result = await b.MatchPolitician(
-                speaker_name=speaker_name,
-                speaker_type=speaker_type or "不明",
-                speaker_party=speaker_party or "不明",
-                available_politicians=available_politicians,
-            )
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, available_politicians):
+                baml_result = await b.MatchPolitician(
+                    speaker_name=speaker_name,
+                    speaker_type=speaker_type or "不明",
+                    speaker_party=speaker_party or "不明",
+                    available_politicians=available_politicians,
+                )
 
             # 信頼度が低い場合はマッチなしとして扱う
             is_confident = baml_result.confidence >= CONFIDENCE_THRESHOLD
@@ -1,7 +1,8 @@
 """LangGraph tools for speech extraction from minutes.
 
 このモジュールは、議事録からの発言抽出に使用するLangGraphツールを提供します。
-発言抽出サブグラフで使用される境界検出・検証ツールを含みます。
+境界検出・検証ツールを含みます。MinutesProcessAgentの境界抽出は
+SpeechBoundaryExtractorが行い、これらのツールは使用しません。
 """
 
 import logging
@@ -13,6 +14,11 @@ from langchain_core.tools import tool
 
 from baml_client.async_client import b
 
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +110,8 @@ def create_speech_extraction_tools() -> list[Any]:
             boundary_text_with_marker = f"{context_before}｜境界｜{context_after}"
 
             # BAMLを使用して境界検出を実行
-            boundary_result = await b.DetectBoundary(boundary_text_with_marker)
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, boundary_text_with_marker):
+                boundary_result = await b.DetectBoundary(boundary_text_with_marker)
 
             # 結果を評価
             is_valid = (
@@ -0,0 +1,120 @@
+"""Persistent cache of link classifications keyed by domain and URL."""
+
+import json
+import logging
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.domain.services.interfaces.llm_link_classifier_service import (
+    LinkClassification,
+    LinkType,
+)
+from src.infrastructure.external.url_normalizer import normalize_url
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "./cache/link_classifications"
+DEFAULT_TTL_DAYS = 30
+
+
+class LinkClassificationCache:
+    """Stores link classifications as one JSON file per domain.
+
+    Party sites share navigation links across pages, so classifications are
+    reused across pages and crawl runs. Entries older than ttl_days are
+    ignored so that site redesigns are picked up again.
+    """
+
+    def __init__(
+        self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_days: int = DEFAULT_TTL_DAYS
+    ):
+        """Initialize link classification cache.
+
+        Args:
+            cache_dir: Directory to store the per-domain JSON files in
+            ttl_days: Days after which a cached classification is ignored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = timedelta(days=ttl_days)
+        self._domains: dict[str, dict[str, dict[str, Any]]] = {}
+        self._dirty: set[str] = set()
+
+    def get(self, url: str) -> LinkClassification | None:
+        """Get the cached classification of a URL.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            Classification with the given URL, or None if not cached
+        """
+        domain, normalized = normalize_url(url)
+        entry = self._load(domain).get(normalized)
+        if entry is None:
+            return None
+        try:
+            classified_at = datetime.fromisoformat(entry["classified_at"])
+            if datetime.now() - classified_at >= self.ttl:
+                return None
+            return LinkClassification(
+                url=url,
+                link_type=LinkType(entry["link_type"]),
+                confidence=entry["confidence"],
+                reason=entry["reason"],
+            )
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Ignoring invalid cached classification for {url}: {e}")
+            return None
+
+    def put(self, classification: LinkClassification) -> None:
+        """Cache a classification. Call flush() to persist it.
+
+        Args:
+            classification: Classification to cache
+        """
+        domain, normalized = normalize_url(classification.url)
+        self._load(domain)[normalized] = {
+            "link_type": classification.link_type.value,
+            "confidence": classification.confidence,
+            "reason": classification.reason,
+            "classified_at": datetime.now().isoformat(),
+        }
+        self._dirty.add(domain)
+
+    def flush(self) -> None:
+        """Write the domains changed since the last flush to disk."""
+        for domain in sorted(self._dirty):
+            cache_file = self._cache_file(domain)
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first so readers never see a
+                # partially written file
+                tmp_file = cache_file.with_suffix(".json.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._domains[domain], f, ensure_ascii=False, indent=2)
+                tmp_file.replace(cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to save link classifications for {domain}: {e}")
+        self._dirty.clear()
+
+    def _load(self, domain: str) -> dict[str, dict[str, Any]]:
+        if domain in self._domains:
+            return self._domains[domain]
+
+        entries: dict[str, dict[str, Any]] = {}
+        cache_file = self._cache_file(domain)
+        if cache_file.exists():
+            try:
+                with open(cache_file, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load link classifications for {domain}: {e}")
+        self._domains[domain] = entries
+        return entries
+
+    def _cache_file(self, domain: str) -> Path:
+        safe_domain = "".join(c if c.isalnum() or c in ".-" else "_" for c in domain)
+        return self.cache_dir / f"{safe_domain or '_'}.json"
@@ -1,5 +1,6 @@
 """LLM-based implementation of link classification service."""
 
+import asyncio
 import logging
 
 from baml_client.async_client import b
@@ -11,18 +12,45 @@ from src.domain.services.interfaces.llm_link_classifier_service import (
     LinkType,
 )
 from src.domain.value_objects.link import Link
+from src.infrastructure.external.link_classification_cache import (
+    LinkClassificationCache,
+)
+from src.infrastructure.external.url_normalizer import normalize_url
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Links per ClassifyLinks call; keeps each prompt and response bounded
+DEFAULT_CHUNK_SIZE = 40
+
 
 class LLMLinkClassifierService(ILLMLinkClassifierService):
     """LLM-based implementation of link classification using BAML.
 
     This infrastructure service uses BAML to classify links into different
-    types with type-safe structured output.
+    types with type-safe structured output. Links are sent in fixed-size
+    chunks that are classified concurrently, and results can be reused
+    across pages and crawls through a LinkClassificationCache.
     """
 
+    def __init__(
+        self,
+        cache: LinkClassificationCache | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """Initialize LLM link classifier service.
+
+        Args:
+            cache: Cache of previous classifications (no caching if None)
+            chunk_size: Maximum number of links per ClassifyLinks call
+        """
+        self.cache = cache
+        self.chunk_size = chunk_size
+
     async def classify_links(
         self,
         links: list[Link],
@@ -42,6 +70,40 @@ class LLMLinkClassifierService(ILLMLinkClassifierService):
         if not links:
             return LinkClassificationResult(classifications=[], summary={})
 
+        classifications: list[LinkClassification] = []
+        uncached: list[Link] = []
+        for link in links:
+            cached = self.cache.get(link.url) if self.cache else None
+            if cached is None:
+                uncached.append(link)
+            else:
+                classifications.append(cached)
+        if classifications:
+            logger.debug(f"Reused {len(classifications)} cached link classifications")
+
+        chunks = [
+            uncached[i : i + self.chunk_size]
+            for i in range(0, len(uncached), self.chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(self._classify_chunk(chunk, party_name, context) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Error classifying links with BAML: {result}")
+                continue
+            classifications.extend(result)
+
+        if self.cache:
+            self.cache.flush()
+
+        return LinkClassificationResult.from_classifications(classifications)
+
+    async def _classify_chunk(
+        self, links: list[Link], party_name: str, context: str
+    ) -> list[LinkClassification]:
+        """Classify one chunk of links with a single ClassifyLinks call."""
         # Prepare links for BAML prompt
         links_text = "\n".join(
             [
@@ -54,56 +116,45 @@ class LLMLinkClassifierService(ILLMLinkClassifierService):
             ]
         )
 
-        # Call BAML function
-        try:
+        async with llm_rate_limit(BAML_DEFAULT_MODEL, links_text):
             baml_results = await b.ClassifyLinks(
                 links=links_text,
                 party_name=party_name or "不明",
                 context=context or "コンテキスト情報なし",
             )
 
-            # Convert BAML results to domain model
-            classifications: list[LinkClassification] = []
-            for baml_result in baml_results:
+        requested = {normalize_url(link.url)[1]: link.url for link in links}
+
+        # Convert BAML results to domain model
+        classifications: list[LinkClassification] = []
+        for baml_result in baml_results:
+            try:
+                # Parse link_type as enum
+                link_type_str = baml_result.link_type
                 try:
-                    # Parse link_type as enum
-                    link_type_str = baml_result.link_type
-                    try:
-                        link_type = LinkType(link_type_str)
-                    except ValueError:
-                        logger.warning(
-                            f"Invalid link_type '{link_type_str}', using OTHER"
-                        )
-                        link_type = LinkType.OTHER
-
-                    classification = LinkClassification(
-                        url=baml_result.url,
-                        link_type=link_type,
-                        confidence=baml_result.confidence,
-                        reason=baml_result.reason,
-                    )
-                    classifications.append(classification)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to convert BAML result to domain model: {e}"
-                    )
-                    continue
-
-            # Create summary
-            summary: dict[str, int] = {}
-            for classification in classifications:
-                link_type = classification.link_type.value
-                summary[link_type] = summary.get(link_type, 0) + 1
-
-            return LinkClassificationResult(
-                classifications=classifications,
-                summary=summary,
-            )
+                    link_type = LinkType(link_type_str)
+                except ValueError:
+                    logger.warning(f"Invalid link_type '{link_type_str}', using OTHER")
+                    link_type = LinkType.OTHER
+
+                # Report the URL as requested even if the LLM reformatted it
+                request_url = requested.get(normalize_url(baml_result.url)[1])
+                classification = LinkClassification(
+                    url=request_url or baml_result.url,
+                    link_type=link_type,
+                    confidence=baml_result.confidence,
+                    reason=baml_result.reason,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to convert BAML result to domain model: {e}")
+                continue
 
-        except Exception as e:
-            logger.error(f"Error classifying links with BAML: {e}")
-            # Return empty result on error
-            return LinkClassificationResult(classifications=[], summary={})
+            classifications.append(classification)
+            # Only cache URLs that were actually asked about
+            if self.cache and request_url:
+                self.cache.put(classification)
+
+        return classifications
 
     def filter_by_type(
         self,
@@ -8,6 +8,10 @@ from src.domain.services.interfaces.page_classifier_service import (
     IPageClassifierService,
 )
 from src.domain.value_objects.page_classification import PageClassification, PageType
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -52,11 +56,12 @@ class LLMPageClassifierService(IPageClassifierService):
 
         # Call BAML function
         try:
-            baml_result = await b.ClassifyPage(
-                html_excerpt=html_excerpt,
-                current_url=current_url,
-                party_name=party_name or "不明",
-            )
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, html_excerpt):
+                baml_result = await b.ClassifyPage(
+                    html_excerpt=html_excerpt,
+                    current_url=current_url,
+                    party_name=party_name or "不明",
+                )
 
             # Convert BAML result to domain model
             page_type_str = baml_result.page_type
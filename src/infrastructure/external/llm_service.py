@@ -1,9 +1,11 @@
 """LLM service interface and implementation."""
 
+import asyncio
 import json
 import logging
 import os
 
+from collections.abc import Awaitable, Callable
 from typing import Any, cast
 
 from langchain_core.messages import BaseMessage
@@ -26,6 +28,17 @@ from src.infrastructure.exceptions import (
     ResponseParsingException,
 )
 from src.infrastructure.external.versioned_prompt_manager import VersionedPromptManager
+from src.infrastructure.resilience.circuit_breaker import (
+    CircuitBreakerConfig,
+    get_async_circuit_breaker,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    estimate_tokens,
+    get_llm_rate_limiter,
+    is_rate_limit_error,
+    llm_rate_limit,
+)
+from src.infrastructure.resilience.retry import is_transient_error, retry_async
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +53,8 @@ class GeminiLLMService(ILLMService):
         model_name: str = "gemini-2.0-flash",
         temperature: float = 0.1,
         prompt_manager: VersionedPromptManager | None = None,
+        request_timeout: float = 120.0,
+        max_attempts: int = 3,
     ):
         """Initialize Gemini LLM service.
 
@@ -48,6 +63,8 @@ class GeminiLLMService(ILLMService):
             model_name: Name of the Gemini model to use
             temperature: Temperature for generation
             prompt_manager: Optional prompt manager for versioned prompts
+            request_timeout: Timeout in seconds for a single async LLM request
+            max_attempts: Maximum attempts for async calls on transient errors
         """
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
@@ -57,6 +74,15 @@ class GeminiLLMService(ILLMService):
         self.temperature = temperature
         self._prompt_manager = prompt_manager
         self._history_repository: LLMProcessingHistoryRepository | None = None
+        self.request_timeout = request_timeout
+        self.max_attempts = max_attempts
+
+        # Shared per model so one failing upstream trips every caller at once
+        self._circuit_breaker = get_async_circuit_breaker(
+            f"llm:{model_name}",
+            CircuitBreakerConfig(failure_threshold=5, timeout=30),
+            is_failure=is_transient_error,
+        )
 
         # Initialize Gemini client
         self._llm = ChatGoogleGenerativeAI(
@@ -70,6 +96,33 @@ class GeminiLLMService(ILLMService):
         """Get the underlying LLM instance."""
         return self._llm
 
+    async def _ainvoke_resilient(
+        self, invoke: Callable[[], Awaitable[Any]], *prompt_texts: str | None
+    ) -> Any:
+        """Run an async LLM call through the circuit breaker, rate limiter and retry.
+
+        Transient failures (rate limits, timeouts, 5xx) are retried with jittered
+        backoff via asyncio.sleep, so waiting never blocks the event loop.
+
+        Args:
+            invoke: Zero-argument callable returning the LLM coroutine
+            *prompt_texts: Prompt inputs used to estimate token usage
+
+        Returns:
+            Result of the LLM call
+        """
+
+        async def limited_invoke() -> Any:
+            async with llm_rate_limit(self.model_name, *prompt_texts):
+                return await asyncio.wait_for(invoke(), timeout=self.request_timeout)
+
+        return await retry_async(
+            lambda: self._circuit_breaker.async_call(limited_invoke),
+            max_attempts=self.max_attempts,
+            base_delay=2.0,
+            max_delay=30.0,
+        )
+
     async def set_history_repository(
         self, repository: LLMProcessingHistoryRepository | None
     ) -> None:
@@ -198,7 +251,9 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
                 RunnableSerializable[dict[str, Any], BaseMessage],
                 prompt_template | self._llm,
             )
-            response = await chain.ainvoke({})
+            response = await self._ainvoke_resilient(
+                lambda: chain.ainvoke({}), full_prompt
+            )
 
             # Parse response
             if hasattr(response, "content"):
@@ -276,7 +331,7 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
                 RunnableSerializable[dict[str, Any], BaseMessage],
                 prompt_template | self._llm,
             )
-            response = await chain.ainvoke({})
+            response = await self._ainvoke_resilient(lambda: chain.ainvoke({}), prompt)
 
             # Parse response
             if hasattr(response, "content"):
@@ -335,7 +390,9 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
                 RunnableSerializable[dict[str, Any], BaseMessage],
                 prompt_template | self._llm,
             )
-            response = await chain.ainvoke({})
+            response = await self._ainvoke_resilient(
+                lambda: chain.ainvoke({}), full_prompt
+            )
 
             # Parse response
             if hasattr(response, "content"):
@@ -442,9 +499,15 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
         """
         # Simple implementation without actual retry logic
         # In production, you'd want to add proper retry logic with exponential backoff
+        limiter = get_llm_rate_limiter(self.model_name)
+        limiter.acquire_blocking()
         try:
-            return chain.invoke(inputs)
+            result = chain.invoke(inputs)
+            limiter.record_success()
+            return result
         except Exception as e:
+            if is_rate_limit_error(e):
+                limiter.record_rate_limited()
             logger.error(f"Chain invocation failed: {e}", exc_info=True)
             raise LLMServiceException(
                 operation="chain_invoke",
@@ -464,8 +527,13 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
         Raises:
             LLMServiceException: When LLM invocation fails
         """
+        limiter = get_llm_rate_limiter(self.model_name)
+        limiter.acquire_blocking(
+            estimate_tokens(*(message.get("content") for message in messages))
+        )
         try:
             response = self._llm.invoke(messages)
+            limiter.record_success()
             # Ensure we return a string
             content = response.content
             if isinstance(content, str):
@@ -474,9 +542,66 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
                 # Convert to string if necessary
                 return str(content)
         except Exception as e:
+            if is_rate_limit_error(e):
+                limiter.record_rate_limited()
             logger.error(f"LLM invocation failed: {e}", exc_info=True)
             raise LLMServiceException(
                 operation="invoke_llm",
                 reason=str(e),
                 model=self.model_name,
             ) from e
+
+    async def ainvoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Invoke an LLM chain asynchronously with retry logic.
+
+        Args:
+            chain: LangChain runnable to invoke
+            inputs: Input dictionary for the chain
+
+        Returns:
+            Result from the chain invocation
+
+        Raises:
+            LLMServiceException: When chain invocation fails
+        """
+        try:
+            return await self._ainvoke_resilient(
+                lambda: chain.ainvoke(inputs), *(str(v) for v in inputs.values())
+            )
+        except Exception as e:
+            logger.error(f"Async chain invocation failed: {e}", exc_info=True)
+            raise LLMServiceException(
+                operation="chain_ainvoke",
+                reason=str(e),
+                model=self.model_name,
+            ) from e
+
+    async def ainvoke_llm(self, messages: list[dict[str, str]]) -> str:
+        """Invoke the LLM asynchronously with messages and return the content.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys
+
+        Returns:
+            The response content from the LLM
+
+        Raises:
+            LLMServiceException: When LLM invocation fails
+        """
+        try:
+            response = await self._ainvoke_resilient(
+                lambda: self._llm.ainvoke(messages),
+                *(message.get("content") for message in messages),
+            )
+        except Exception as e:
+            logger.error(f"Async LLM invocation failed: {e}", exc_info=True)
+            raise LLMServiceException(
+                operation="ainvoke_llm",
+                reason=str(e),
+                model=self.model_name,
+            ) from e
+
+        content = response.content
+        if isinstance(content, str):
+            return content
+        return str(content)
@@ -16,6 +16,22 @@ from baml_client.async_client import b
 
 from src.domain.exceptions import ExternalServiceException
 from src.domain.interfaces.minutes_divider_service import IMinutesDividerService
+from src.infrastructure.external.minutes_divider.chunk_planner import ChunkPlanner
+from src.infrastructure.external.minutes_divider.keyword_locator import KeywordLocator
+from src.infrastructure.external.minutes_divider.rule_based_boundary_detector import (
+    DEFAULT_BOUNDARY_CONFIDENCE_THRESHOLD,
+    RuleBasedBoundaryDetector,
+)
+from src.infrastructure.external.minutes_divider.rule_based_speech_splitter import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    SPEAKER_MARKERS,
+    RuleBasedSpeechSplitter,
+    RuleBasedSplitResult,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 # 既存のPydanticモデルを使用（BAML結果をこれに変換）
 from src.minutes_divide_processor.models import (
@@ -36,6 +52,11 @@ from src.minutes_divide_processor.models import (
 
 logger = logging.getLogger(__name__)
 
+_SPEAKER_MARKER_PATTERN = re.compile(f"[{SPEAKER_MARKERS}]")
+
+# まとめたチャンクで発言の位置を探すときに使う発言内容の先頭の文字数
+_SPEECH_HEAD_LENGTH = 20
+
 
 class BAMLMinutesDivider(IMinutesDividerService):
     """BAML-based MinutesDivider
@@ -49,6 +70,9 @@ class BAMLMinutesDivider(IMinutesDividerService):
         self,
         llm_service: Any | None = None,  # BAML使用時は不要だが互換性のため
         k: int = 5,
+        rule_based_confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        boundary_confidence_threshold: float = DEFAULT_BOUNDARY_CONFIDENCE_THRESHOLD,
+        chunk_planner: ChunkPlanner | None = None,
     ):
         """
         Initialize BAMLMinutesDivider
@@ -56,8 +80,22 @@ class BAMLMinutesDivider(IMinutesDividerService):
         Args:
             llm_service: 互換性のためのパラメータ（BAML使用時は不要）
             k: Number of sections (default 5)
+            rule_based_confidence_threshold: ルールベース分割の結果を採用する
+                信頼度の下限。これを下回るセクションはLLMで分割する
+                （1.0より大きい値を指定するとルールベース分割を無効化）
+            boundary_confidence_threshold: ルールベースの境界検出結果を採用する
+                信頼度の下限。これを下回る場合はLLMで境界を検出する
+            chunk_planner: LLM呼び出しの単位をトークン数から決めるプランナー
+                （省略時はGemini2Flashの上限に合わせたデフォルト設定）
         """
         self.k = k
+        self.speech_splitter = RuleBasedSpeechSplitter()
+        self.rule_based_confidence_threshold = rule_based_confidence_threshold
+        self.boundary_detector = RuleBasedBoundaryDetector()
+        self.boundary_confidence_threshold = boundary_confidence_threshold
+        self.chunk_planner = chunk_planner or ChunkPlanner()
+        # plan_chunksで判定したルールベース分割の結果（speech_divide_runで再利用する）
+        self._rule_based_results: dict[tuple[int, int, str], RuleBasedSplitResult] = {}
         logger.info("BAMLMinutesDivider initialized")
 
     # ========================================
@@ -121,98 +159,58 @@ class BAMLMinutesDivider(IMinutesDividerService):
         else:
             section_info_list_data = section_info_list.section_info_list
 
-        # Unicode正規化（NFKC）と追加の正規化を適用
-        def normalize_text(text: str) -> str:
-            """テキストを正規化する関数"""
-            # NFKC正規化
-            normalized = unicodedata.normalize("NFKC", text)
-            # 議事録特有の記号の正規化
-            normalized = normalized.replace("◯", "○")
-            normalized = normalized.replace("●", "○")
-            # タブ文字をスペースに変換
-            normalized = normalized.replace("\t", " ")
-            # 連続するスペースを1つに統一
-            normalized = re.sub(r" +", " ", normalized)
-            return normalized
-
-        # 議事録全体を正規化
-        normalized_minutes = normalize_text(processed_minutes)
+        # 全キーワードの出現位置を1回の走査で求める
+        # （正規化したテキストで検索し、元のテキストでの位置に変換して分割する）
+        keyword_positions = KeywordLocator(
+            [section_info.keyword for section_info in section_info_list_data]
+        ).locate(processed_minutes)
+        normalized = keyword_positions.normalized
 
         split_minutes_list: list[SectionString] = []
         start_index = 0
-        skipped_keywords: list[str] = []
         i = 0
-        output_order = 1  # 出現順を記録する変数
 
         while i < len(section_info_list_data):
             section_info = section_info_list_data[i]
-            # キーワードも同様に正規化
-            keyword = normalize_text(section_info.keyword)
 
             # 最初のキーワードの場合、議事録の先頭から検索を開始
-            if i == 0 and start_index == 0:
-                start_index = normalized_minutes.find(keyword)
-                if start_index == -1:
-                    # 部分一致も試す（キーワードが長すぎる場合）
-                    if len(keyword) > 10:
-                        partial_keyword = keyword[:10]
-                        start_index = normalized_minutes.find(partial_keyword)
-                        if start_index != -1:
-                            logger.info(
-                                f"Found keyword using partial match: {partial_keyword}"
-                            )
-
-                    if start_index == -1:
-                        start_index = 0
-                        logger.warning(
-                            f"キーワード '{section_info.keyword}' が"
-                            "見つからないため、先頭から開始します"
+            if i == 0:
+                match = keyword_positions.find(0)
+                if match is None:
+                    logger.warning(
+                        f"キーワード '{section_info.keyword}' が"
+                        "見つからないため、先頭から開始します"
+                    )
+                else:
+                    if match.partial:
+                        logger.info(
+                            f"Found keyword using partial match: {section_info.keyword}"
                         )
-            # キーワードが見つからない場合はスキップ
-            if start_index == -1:
-                logger.warning(
-                    f"キーワード '{section_info.keyword}' が"
-                    "見つかりません。スキップします。"
-                )
-                skipped_keywords.append(section_info.keyword)
-                i += 1
-                continue
+                    start_index = match.start
+
             # 次のキーワードの開始位置を検索
-            next_keyword_index = -1
+            next_match = None
             j = i + 1
             while j < len(section_info_list_data):
                 next_section = section_info_list_data[j]
-                # 次のキーワードも正規化
-                next_keyword = normalize_text(next_section.keyword)
-                next_keyword_index = normalized_minutes.find(
-                    next_keyword, start_index + 1
-                )
-                if next_keyword_index == -1 and len(next_keyword) > 10:
-                    # 部分一致も試す
-                    partial_next = next_keyword[:10]
-                    next_keyword_index = normalized_minutes.find(
-                        partial_next, start_index + 1
-                    )
-                    if next_keyword_index != -1:
+                next_match = keyword_positions.find(j, start_index + 1)
+                if next_match is not None:
+                    if next_match.partial:
                         logger.info(
-                            f"Found next keyword using partial match: {partial_next}"
+                            "Found next keyword using partial match: "
+                            f"{next_section.keyword}"
                         )
-
-                if next_keyword_index != -1:
                     break
-                else:
-                    logger.warning(
-                        f"キーワード '{next_section.keyword}' が議事録に"
-                        "見つかりません。スキップします。"
-                    )
-                    skipped_keywords.append(next_section.keyword)
-                    j += 1
-            if next_keyword_index == -1:
-                end_index = len(normalized_minutes)
-            else:
-                end_index = next_keyword_index
+                logger.warning(
+                    f"キーワード '{next_section.keyword}' が議事録に"
+                    "見つかりません。スキップします。"
+                )
+                j += 1
+            end_index = len(normalized.text) if next_match is None else next_match.start
             # 分割された文字列を取得（元のテキストから取得）
-            split_text = processed_minutes[start_index:end_index].strip()
+            original_start = normalized.original_index(start_index)
+            original_end = normalized.original_index(end_index)
+            split_text = processed_minutes[original_start:original_end].strip()
             # SectionStringインスタンスを作成してlistにappend
             split_minutes_list.append(
                 SectionString(
@@ -223,9 +221,7 @@ class BAMLMinutesDivider(IMinutesDividerService):
             )
             # 次の検索開始位置を更新
             start_index = end_index
-            # インデックスと出現順を更新
             i = j
-            output_order += 1
         return SectionStringList(section_string_list=split_minutes_list)
 
     def check_length(
@@ -233,28 +229,139 @@ class BAMLMinutesDivider(IMinutesDividerService):
     ) -> RedivideSectionStringList:
         """セクションの長さをチェックし、長すぎるセクションを特定する
 
+        DivideSpeechの出力上限から逆算した入力トークン数を超えるセクションを、
+        上限内に収めるために必要な分割数と一緒に返します。
+
         Args:
             section_string_list: セクション文字列リスト
 
         Returns:
             再分割が必要なセクションのリスト
         """
+        max_tokens = self.chunk_planner.speech_chunk_tokens
         redivide_list: list[RedivideSectionString] = []
         for index, section_string in enumerate(section_string_list.section_string_list):
-            size_in_bytes = len(section_string.section_string.encode("utf-8"))
-            logger.debug(f"size_in_bytes: {size_in_bytes}")
-            if size_in_bytes > 6000:  # 6000文字より多いか確認
+            tokens = self.chunk_planner.estimate(section_string.section_string)
+            logger.debug(f"estimated_tokens: {tokens}")
+            if tokens > max_tokens:
+                divide_count = self.chunk_planner.pieces_needed(
+                    section_string.section_string, max_tokens
+                )
                 logger.info(
-                    "section_stringの文字数が6000文字を超えています。再分割します。"
+                    f"section_stringの見積もりトークン数({tokens})が"
+                    f"上限({max_tokens})を超えています。{divide_count}分割します。"
                 )
                 redivide_dict = RedivideSectionString(
                     original_index=index,
-                    redivide_section_string_bytes=size_in_bytes,
+                    redivide_section_string_bytes=len(
+                        section_string.section_string.encode("utf-8")
+                    ),
                     redivide_section_string=section_string,
+                    divide_count=divide_count,
                 )
                 redivide_list.append(redivide_dict)
         return RedivideSectionStringList(redivide_section_string_list=redivide_list)
 
+    def plan_chunks(self, section_string_list: SectionStringList) -> SectionStringList:
+        """DivideSpeechの呼び出し単位になるようにセクションを分割・結合する
+
+        見積もりトークン数が上限を超えるセクションは発言者記号の位置で分割し、
+        LLMで分割する小さなセクションが連続する場合は1回の呼び出しにまとめます。
+        ルールベースで分割できるセクションとスキップされるセクションは
+        LLMを呼び出さないため、まとめる対象にしません。
+
+        Args:
+            section_string_list: セクション文字列リスト
+
+        Returns:
+            計画後のセクション文字列リスト
+        """
+        self._rule_based_results.clear()
+        planned = self.chunk_planner.plan_sections(
+            section_string_list.section_string_list, needs_llm=self._needs_llm
+        )
+        logger.info(
+            f"チャンク計画: {len(section_string_list.section_string_list)}セクション"
+            f" → {len(planned)}チャンク"
+        )
+        return SectionStringList(section_string_list=planned)
+
+    def _needs_llm(self, section_string: SectionString) -> bool:
+        """speech_divide_runでLLMを呼び出すセクションかどうか"""
+        if self._is_skippable(section_string.section_string):
+            return False
+        rule_based_result = self.speech_splitter.split(section_string)
+        self._rule_based_results[self._rule_based_key(section_string)] = (
+            rule_based_result
+        )
+        return rule_based_result.confidence < self.rule_based_confidence_threshold
+
+    @staticmethod
+    def _is_skippable(section_text: str) -> bool:
+        """短く発言者記号も含まないため発言の分割を行わないセクションかどうか"""
+        return len(section_text) < 30 and not _SPEAKER_MARKER_PATTERN.search(
+            section_text
+        )
+
+    @staticmethod
+    def _rule_based_key(section_string: SectionString) -> tuple[int, int, str]:
+        return (
+            section_string.chapter_number,
+            section_string.sub_chapter_number,
+            section_string.section_string,
+        )
+
+    def _split_rule_based(self, section_string: SectionString) -> RuleBasedSplitResult:
+        """ルールベース分割を行う（plan_chunksで判定済みの結果があれば再利用する）"""
+        cached = self._rule_based_results.pop(
+            self._rule_based_key(section_string), None
+        )
+        if cached is not None:
+            return cached
+        return self.speech_splitter.split(section_string)
+
+    @staticmethod
+    def _assign_packed_sections(
+        section_string: SectionString,
+        speeches: list[SpeakerAndSpeechContent],
+    ) -> list[SpeakerAndSpeechContent]:
+        """まとめたチャンクの発言に元のセクションの番号を付け直す
+
+        発言内容の先頭をチャンク内で順に探し、その位置を含むセクションの番号を付ける。
+        先頭の文脈（直前のチャンクと重なる範囲）にある発言は直前のチャンクで
+        出力済みのため除外し、speech_orderはセクションごとに振り直す。
+        位置が見つからない発言は直前の発言と同じセクションとみなす。
+        """
+        text = section_string.section_string
+        packed_sections = section_string.packed_sections
+        cursor = 0
+        current = packed_sections[0]
+        assigned: list[SpeakerAndSpeechContent] = []
+        for speech in speeches:
+            head = speech.speech_content.strip()[:_SPEECH_HEAD_LENGTH]
+            position = text.find(head, cursor) if head else -1
+            if position >= 0:
+                cursor = position + len(head)
+                if position < section_string.context_length:
+                    continue
+                current = next(
+                    packed
+                    for packed in reversed(packed_sections)
+                    if packed.start <= position
+                )
+            else:
+                logger.debug(f"まとめたチャンク内で発言の位置が見つかりません: {head}")
+            speech.chapter_number = current.chapter_number
+            speech.sub_chapter_number = current.sub_chapter_number
+            assigned.append(speech)
+
+        speech_orders: dict[tuple[int, int], int] = {}
+        for speech in assigned:
+            key = (speech.chapter_number, speech.sub_chapter_number)
+            speech_orders[key] = speech_orders.get(key, 0) + 1
+            speech.speech_order = speech_orders[key]
+        return assigned
+
     def split_minutes_by_boundary(
         self, minutes_text: str, boundary: MinutesBoundary
     ) -> tuple[str, str]:
@@ -269,11 +376,50 @@ class BAMLMinutesDivider(IMinutesDividerService):
         """
         logger.info("=== split_minutes_by_boundary started ===")
 
-        if not boundary.boundary_found or not boundary.boundary_text:
+        split_index = self._find_boundary_index(minutes_text, boundary)
+        if split_index == -1:
             # 境界が見つからない場合は全体を発言部分として扱う
             logger.info("No boundary found, treating entire text as speech")
             return "", minutes_text
 
+        # テキストを分割
+        attendee_part = minutes_text[:split_index].strip()
+        speech_part = minutes_text[split_index:].strip()
+
+        logger.info(f"Split successful at index {split_index}")
+        logger.info(f"Attendee part length: {len(attendee_part)}")
+        logger.info(f"Speech part length: {len(speech_part)}")
+
+        return attendee_part, speech_part
+
+    def _find_boundary_index(self, minutes_text: str, boundary: MinutesBoundary) -> int:
+        """境界情報から元のテキスト上の発言部分の開始位置を特定する
+
+        boundary_positionが設定されている場合（ルールベース検出・キャッシュ）は
+        その位置を使い、そうでない場合はboundary_textの前後の文字列を
+        元のテキストから探します。
+
+        Args:
+            minutes_text: 議事録の全文
+            boundary: 境界検出結果
+
+        Returns:
+            int: 発言部分の開始位置。特定できない場合は-1
+        """
+        if not boundary.boundary_found:
+            return -1
+
+        if boundary.boundary_position is not None and (
+            0 <= boundary.boundary_position <= len(minutes_text)
+        ):
+            logger.info(
+                f"Using detected boundary position {boundary.boundary_position}"
+            )
+            return boundary.boundary_position
+
+        if not boundary.boundary_text:
+            return -1
+
         # boundary_textから境界マーカーを探す（複数のパターンに対応）
         boundary_markers = ["｜境界｜", "|境界|", "境界", "｜", "|"]
         boundary_marker = None
@@ -378,7 +524,7 @@ class BAMLMinutesDivider(IMinutesDividerService):
 
         if split_index == -1:
             logger.warning("Could not locate boundary in original text")
-            return "", minutes_text
+            return -1
 
         # 境界位置の妥当性を検証
         text_length = len(minutes_text)
@@ -390,17 +536,9 @@ class BAMLMinutesDivider(IMinutesDividerService):
                 f"(remaining: {remaining_length} chars). "
                 f"Treating entire text as speech content."
             )
-            return "", minutes_text
+            return -1
 
-        # テキストを分割
-        attendee_part = minutes_text[:split_index].strip()
-        speech_part = minutes_text[split_index:].strip()
-
-        logger.info(f"Split successful at index {split_index}")
-        logger.info(f"Attendee part length: {len(attendee_part)}")
-        logger.info(f"Speech part length: {len(speech_part)}")
-
-        return attendee_part, speech_part
+        return split_index
 
     # ========================================
     # BAML使用メソッド
@@ -409,6 +547,9 @@ class BAMLMinutesDivider(IMinutesDividerService):
     async def section_divide_run(self, minutes: str) -> SectionInfoList:
         """議事録を章に分割する（BAML使用）
 
+        議事録がキーワード抽出の上限トークン数を超える場合は、
+        発言者記号の位置でウィンドウに分けて呼び出し、結果を連結します。
+
         Args:
             minutes: 議事録
 
@@ -418,24 +559,37 @@ class BAMLMinutesDivider(IMinutesDividerService):
         Raises:
             ExternalServiceException: BAML呼び出しエラー（BamlValidationError以外）
         """
+        windows = self.chunk_planner.split_text(
+            minutes, self.chunk_planner.keyword_window_tokens
+        )
         try:
-            # BAMLを呼び出し
-            logger.info("Calling BAML DivideMinutesToKeywords")
-            baml_result = await b.DivideMinutesToKeywords(minutes)
+            section_info_list: list[SectionInfo] = []
+            for window_index, window in enumerate(windows, start=1):
+                # BAMLを呼び出し
+                logger.info(
+                    "Calling BAML DivideMinutesToKeywords "
+                    f"(window {window_index}/{len(windows)})"
+                )
+                async with llm_rate_limit(BAML_DEFAULT_MODEL, window):
+                    baml_result = await b.DivideMinutesToKeywords(window)
 
-            # BAML結果をPydanticモデルに変換
-            section_info_list = [
-                SectionInfo(chapter_number=item.chapter_number, keyword=item.keyword)
-                for item in baml_result
-            ]
+                # BAML結果をPydanticモデルに変換
+                section_info_list.extend(
+                    SectionInfo(
+                        chapter_number=item.chapter_number, keyword=item.keyword
+                    )
+                    for item in baml_result
+                )
 
             # chapter_numberが連番になっているか確認して修正
+            # （ウィンドウごとに1から振られるため、連結後に振り直す）
             last_chapter_number = 0
             for section_info in section_info_list:
                 if section_info.chapter_number != last_chapter_number + 1:
-                    logger.warning(
-                        "section_infoのchapter_numberが連番になっていません。"
-                    )
+                    if len(windows) == 1:
+                        logger.warning(
+                            "section_infoのchapter_numberが連番になっていません。"
+                        )
                     section_info.chapter_number = last_chapter_number + 1
                 last_chapter_number = section_info.chapter_number
 
@@ -478,10 +632,7 @@ class BAMLMinutesDivider(IMinutesDividerService):
         for (
             redivide_section_string
         ) in redivide_section_string_list.redivide_section_string_list:
-            divide_counter = (
-                redivide_section_string.redivide_section_string_bytes // 20000000
-            )
-            divide_counter = divide_counter + 2
+            divide_counter = redivide_section_string.divide_count
 
             try:
                 # BAMLを呼び出し
@@ -490,11 +641,15 @@ class BAMLMinutesDivider(IMinutesDividerService):
                     f"(divide_counter={divide_counter}, "
                     f"original_index={redivide_section_string.original_index})"
                 )
-                baml_result = await b.RedivideSection(
-                    redivide_section_string.redivide_section_string.section_string,
-                    divide_counter,
-                    redivide_section_string.original_index,
+                section_string = (
+                    redivide_section_string.redivide_section_string.section_string
                 )
+                async with llm_rate_limit(BAML_DEFAULT_MODEL, section_string):
+                    baml_result = await b.RedivideSection(
+                        section_string,
+                        divide_counter,
+                        redivide_section_string.original_index,
+                    )
 
                 # BAML結果をPydanticモデルに変換してリストに追加
                 for item in baml_result:
@@ -540,6 +695,10 @@ class BAMLMinutesDivider(IMinutesDividerService):
     async def detect_attendee_boundary(self, minutes_text: str) -> MinutesBoundary:
         """出席者情報と発言部分の境界を検出する（BAML使用）
 
+        まずルールベース検出（出席者の見出し・開議時刻・区切り線・発言者記号）を
+        試み、信頼度が閾値以上であればLLMを呼び出さずに返す。
+        信頼度が低い場合のみDetectBoundaryを呼び出す。
+
         Args:
             minutes_text: 議事録の全文
 
@@ -554,10 +713,26 @@ class BAMLMinutesDivider(IMinutesDividerService):
         logger.info("=== detect_attendee_boundary started ===")
         logger.info(f"Input text length: {len(minutes_text)}")
 
+        rule_based_result = self.boundary_detector.detect(minutes_text)
+        if rule_based_result.confidence >= self.boundary_confidence_threshold:
+            logger.info(
+                f"ルールベースで境界を検出: {rule_based_result.reason} "
+                f"(type={rule_based_result.boundary_type}, "
+                f"confidence={rule_based_result.confidence:.2f})"
+            )
+            return rule_based_result
+
+        logger.info(
+            f"ルールベースの境界検出の信頼度が低いためLLMで検出します: "
+            f"{rule_based_result.reason} "
+            f"(confidence={rule_based_result.confidence:.2f})"
+        )
+
         try:
             # BAMLを呼び出し
             logger.info("Calling BAML DetectBoundary")
-            baml_result = await b.DetectBoundary(minutes_text)
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, minutes_text):
+                baml_result = await b.DetectBoundary(minutes_text)
 
             # BAML結果をPydanticモデルに変換
             result = MinutesBoundary(
@@ -567,6 +742,10 @@ class BAMLMinutesDivider(IMinutesDividerService):
                 confidence=baml_result.confidence,
                 reason=baml_result.reason,
             )
+            # 発言部分の開始位置を確定させ、キャッシュや分割で再探索しないようにする
+            split_index = self._find_boundary_index(minutes_text, result)
+            if split_index != -1:
+                result.boundary_position = split_index
 
             logger.info("Boundary detection result details:")
             logger.info(f"  - boundary_found: {result.boundary_found}")
@@ -624,7 +803,8 @@ class BAMLMinutesDivider(IMinutesDividerService):
         try:
             # BAMLを呼び出し
             logger.info("Calling BAML ExtractAttendees")
-            baml_result = await b.ExtractAttendees(attendees_text)
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, attendees_text):
+                baml_result = await b.ExtractAttendees(attendees_text)
 
             # BAML結果をPydanticモデルに変換
             result = AttendeesMapping(
@@ -663,8 +843,10 @@ class BAMLMinutesDivider(IMinutesDividerService):
     ) -> SpeakerAndSpeechContentList:
         """発言者と発言内容に分割する（BAML使用）
 
-        セクション全体を直接DivideSpeechに渡す。
-        発言者マーカー（○議長（名前）など）はDivideSpeechプロンプトで認識される。
+        まずルールベース分割を試み、発言者マーカー（○議長（名前）など）で
+        機械的に分割できて信頼度が閾値以上のセクションはLLMを呼び出さずに返す。
+        構造検証に失敗したセクションのみ、セクション全体をDivideSpeechに渡す。
+        複数のセクションをまとめたチャンクは、発言ごとに元のセクションの番号を付け直す。
 
         Args:
             section_string: セクション文字列
@@ -677,25 +859,43 @@ class BAMLMinutesDivider(IMinutesDividerService):
         """
         section_text = section_string.section_string
 
-        # 発言パターンが含まれているかチェック
-        # ○◆◎●などの記号で始まる発言者マーカーがあるか確認
-        has_speech_pattern = bool(re.search(r"[○◆◎●]", section_text))
-
-        if len(section_text) < 30 and not has_speech_pattern:
+        if self._is_skippable(section_text):
             logger.debug("セクションが短く発言パターンもないためスキップ")
-            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
+            return SpeakerAndSpeechContentList(
+                speaker_and_speech_content_list=[], divide_method="skipped"
+            )
+
+        rule_based_result = self._split_rule_based(section_string)
+        if rule_based_result.confidence >= self.rule_based_confidence_threshold:
+            logger.debug(
+                f"ルールベースで分割: {rule_based_result.reason} "
+                f"(confidence={rule_based_result.confidence:.2f})"
+            )
+            speeches = rule_based_result.speeches
+            if section_string.packed_sections:
+                speeches = self._assign_packed_sections(section_string, speeches)
+            return SpeakerAndSpeechContentList(
+                speaker_and_speech_content_list=speeches,
+                divide_method="rule_based",
+            )
+        logger.debug(
+            f"ルールベース分割を採用せずLLMで分割: {rule_based_result.reason} "
+            f"(confidence={rule_based_result.confidence:.2f})"
+        )
 
         try:
             # BAMLを呼び出し（セクション全体を渡す）
-            baml_result = await b.DivideSpeech(section_text)
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, section_text):
+                baml_result = await b.DivideSpeech(section_text)
 
             # BAML結果をPydanticモデルに変換
+            # （章番号はLLMに1を出力させているため、分割したセクションの番号で更新する）
             speaker_and_speech_content_list = [
                 SpeakerAndSpeechContent(
                     speaker=item.speaker,
                     speech_content=item.speech_content,
-                    chapter_number=item.chapter_number,
-                    sub_chapter_number=item.sub_chapter_number,
+                    chapter_number=section_string.chapter_number,
+                    sub_chapter_number=section_string.sub_chapter_number,
                     speech_order=item.speech_order,
                 )
                 for item in baml_result
@@ -711,6 +911,11 @@ class BAMLMinutesDivider(IMinutesDividerService):
                     speaker_and_speech_content.speech_order = last_speech_order + 1
                 last_speech_order = speaker_and_speech_content.speech_order
 
+            if section_string.packed_sections:
+                speaker_and_speech_content_list = self._assign_packed_sections(
+                    section_string, speaker_and_speech_content_list
+                )
+
             logger.info(
                 f"BAML returned {len(speaker_and_speech_content_list)} speeches"
             )
@@ -0,0 +1,313 @@
+"""トークン数に基づく議事録のチャンク分割計画
+
+LLMに渡すテキストの大きさを、固定のバイト数ではなく見積もりトークン数と
+モデルの入力・出力の上限から決めます。
+
+- DivideSpeechは発言内容をそのまま出力し直すため、出力トークン数が
+  入力トークン数に比例する。入力の上限は出力上限から逆算する
+- DivideMinutesToKeywordsは各セクションの先頭キーワードだけを出力するため、
+  出力は小さいが、1回の呼び出しで得られるセクション数には限りがある。
+  長い議事録はウィンドウに分けて呼び出す
+
+分割は発言者記号（○◆◎●）の位置で行い、発言の途中では切りません。
+1つの発言が上限を超える場合のみ文末で分割し、続きのチャンクの先頭に
+発言者の表記を重ねて付けることで、発言者が失われないようにします。
+小さなセクションをまとめたチャンクは、元のセクションごとの番号と位置を保持します。
+"""
+
+import math
+import re
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.infrastructure.external.minutes_divider.rule_based_speech_splitter import (
+    SPEAKER_MARKERS,
+)
+from src.infrastructure.resilience.rate_limiter import estimate_tokens
+from src.minutes_divide_processor.models import PackedSection, SectionString
+
+
+_MARKER_PATTERN = re.compile(f"[{SPEAKER_MARKERS}]")
+
+# 発言冒頭の発言者表記: 例「○議長(山田太郎君)」
+_SPEAKER_HEADER_PATTERN = re.compile(
+    rf"[{SPEAKER_MARKERS}][^{SPEAKER_MARKERS}()（）]{{1,20}}[(（][^()（）]{{1,20}}[)）]"
+)
+
+# 文末
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[。！？!?])")
+
+
+@dataclass
+class ChunkPlannerConfig:
+    """チャンク分割計画の設定
+
+    デフォルト値はBAMLのGemini2Flashクライアント（gemini-2.5-flash）に合わせています。
+    """
+
+    # モデルの入力コンテキスト長（トークン）
+    context_window_tokens: int = 1_048_576
+
+    # 1回の応答で確実に出力できるトークン数
+    # （モデルの上限は65,536だが、APIのデフォルト値に合わせて保守的に設定）
+    max_output_tokens: int = 8_192
+
+    # プロンプトのテンプレート部分のトークン数
+    prompt_overhead_tokens: int = 1_500
+
+    # DivideSpeechの出力トークン数 / 入力トークン数（発言の再出力 + JSON）
+    speech_output_ratio: float = 1.3
+
+    # 見積もり誤差に対する安全率
+    safety_ratio: float = 0.8
+
+    # DivideMinutesToKeywordsに1回で渡す最大トークン数
+    # （5-30セクションへの分割を指示しているため、長すぎると粒度が粗くなる）
+    keyword_window_tokens: int = 32_000
+
+    # これより小さいセクションは隣接するセクションとまとめて1回で処理する
+    pack_threshold_tokens: int = 300
+
+    # まとめたセクションの合計の上限
+    pack_target_tokens: int = 1_500
+
+    # 文末が見つからない発言を強制的に分割するときに重ねる文字数
+    overlap_chars: int = 50
+
+
+class ChunkPlanner:
+    """見積もりトークン数に基づいてLLM呼び出しの単位を決めるクラス"""
+
+    def __init__(self, config: ChunkPlannerConfig | None = None):
+        """
+        Args:
+            config: 分割計画の設定（省略時はデフォルト）
+        """
+        self.config = config or ChunkPlannerConfig()
+
+    @property
+    def speech_chunk_tokens(self) -> int:
+        """DivideSpeechに1回で渡せる入力トークン数"""
+        config = self.config
+        by_output = config.max_output_tokens / config.speech_output_ratio
+        by_context = config.context_window_tokens - config.prompt_overhead_tokens
+        return max(1, int(min(by_output, by_context) * config.safety_ratio))
+
+    @property
+    def keyword_window_tokens(self) -> int:
+        """DivideMinutesToKeywordsに1回で渡す入力トークン数"""
+        config = self.config
+        by_context = config.context_window_tokens - config.prompt_overhead_tokens
+        return max(1, int(min(config.keyword_window_tokens, by_context)))
+
+    def estimate(self, text: str) -> int:
+        """テキストの見積もりトークン数"""
+        return estimate_tokens(text)
+
+    def pieces_needed(self, text: str, max_tokens: int | None = None) -> int:
+        """上限内に収めるために必要な分割数"""
+        max_tokens = max_tokens or self.speech_chunk_tokens
+        return max(1, math.ceil(self.estimate(text) / max_tokens))
+
+    def split_text(self, text: str, max_tokens: int) -> list[str]:
+        """テキストを発言者記号の位置で、上限内のチャンクに分割する
+
+        必要な分割数をトークン数から求め、各チャンクがほぼ同じ大きさに
+        なるように発言単位で詰めます。
+
+        Args:
+            text: 分割するテキスト
+            max_tokens: 1チャンクの最大トークン数
+
+        Returns:
+            list[str]: チャンクのリスト（連結すると元のテキストになる。
+                ただし1つの発言を分割した場合は発言者表記を重複して含む）
+        """
+        total_tokens = self.estimate(text)
+        if total_tokens <= max_tokens:
+            return [text]
+
+        target_tokens = total_tokens / math.ceil(total_tokens / max_tokens)
+        chunks: list[str] = []
+        current = ""
+        current_tokens = 0
+        for utterance in self._split_utterances(text):
+            utterance_tokens = self.estimate(utterance)
+            if utterance_tokens > max_tokens:
+                if current:
+                    chunks.append(current)
+                    current, current_tokens = "", 0
+                chunks.extend(self._split_long_utterance(utterance, max_tokens))
+                continue
+
+            if current and (
+                current_tokens + utterance_tokens > max_tokens
+                or current_tokens >= target_tokens
+            ):
+                chunks.append(current)
+                current, current_tokens = "", 0
+            current += utterance
+            current_tokens += utterance_tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def plan_sections(
+        self,
+        sections: list[SectionString],
+        needs_llm: Callable[[SectionString], bool] | None = None,
+    ) -> list[SectionString]:
+        """DivideSpeechの呼び出し単位になるようにセクションを分割・結合する
+
+        - 上限を超えるセクションは必要な数に分割し、sub_chapter_numberを振り直す
+        - LLMで処理する小さなセクションが連続する場合は1つにまとめる。
+          まとめたチャンクには元のセクションごとの番号と開始位置（packed_sections）を
+          持たせ、発言ごとに元のセクションの番号を付け直せるようにする
+        - まとめる上限に達して区切ったチャンクには、直前のチャンクの最後の発言を
+          文脈として先頭に付ける（context_length。この範囲の発言は出力しない）
+
+        Args:
+            sections: セクションのリスト（議事録の出現順）
+            needs_llm: LLMで処理するセクションかどうかを判定する関数。
+                LLMを使わないセクション（ルールベースで分割できるものなど）は
+                まとめる対象にしない。省略時はすべてLLMで処理するとみなす
+
+        Returns:
+            list[SectionString]: 計画後のセクションのリスト
+        """
+        max_tokens = self.speech_chunk_tokens
+        pack_limit = min(self.config.pack_target_tokens, max_tokens)
+        planned: list[SectionString] = []
+        pack: list[SectionString] = []
+        pack_tokens = 0
+        context = ""
+
+        def flush_pack() -> None:
+            nonlocal pack, pack_tokens, context
+            if len(pack) == 1 and not context:
+                planned.append(pack[0])
+            elif pack:
+                planned.append(self._pack_sections(pack, context))
+            pack, pack_tokens, context = [], 0, ""
+
+        for section in sections:
+            tokens = self.estimate(section.section_string)
+
+            if tokens > max_tokens:
+                flush_pack()
+                pieces = self.split_text(section.section_string, max_tokens)
+                planned.extend(
+                    SectionString(
+                        chapter_number=section.chapter_number,
+                        sub_chapter_number=sub_chapter_number,
+                        section_string=piece,
+                    )
+                    for sub_chapter_number, piece in enumerate(pieces, start=1)
+                )
+                continue
+
+            packable = tokens < self.config.pack_threshold_tokens and (
+                needs_llm is None or needs_llm(section)
+            )
+            if not packable:
+                flush_pack()
+                planned.append(section)
+                continue
+
+            if pack and pack_tokens + tokens > pack_limit:
+                # 上限で区切った境界の発言が文脈を失わないように、次のチャンクへ重ねる
+                next_context = self._context_tail(pack[-1].section_string)
+                flush_pack()
+                context = next_context
+                pack_tokens = self.estimate(context)
+            pack.append(section)
+            pack_tokens += tokens
+
+        flush_pack()
+        return planned
+
+    @staticmethod
+    def _pack_sections(pack: list[SectionString], context: str) -> SectionString:
+        """セクションを1つのチャンクにまとめる（元のセクションの番号と位置を保持）"""
+        packed_sections: list[PackedSection] = []
+        start = len(context)
+        for section in pack:
+            packed_sections.append(
+                PackedSection(
+                    chapter_number=section.chapter_number,
+                    sub_chapter_number=section.sub_chapter_number,
+                    start=start,
+                )
+            )
+            start += len(section.section_string)
+        return SectionString(
+            chapter_number=pack[0].chapter_number,
+            sub_chapter_number=pack[0].sub_chapter_number,
+            section_string=context + "".join(s.section_string for s in pack),
+            packed_sections=packed_sections,
+            context_length=len(context),
+        )
+
+    def _context_tail(self, text: str) -> str:
+        """テキストの最後の発言を文脈用に取り出す（長い場合は発言者表記と末尾だけ）"""
+        utterance = self._split_utterances(text)[-1]
+        if len(utterance) <= self.config.overlap_chars:
+            return utterance
+        header_match = _SPEAKER_HEADER_PATTERN.match(utterance)
+        header = header_match.group(0) if header_match else ""
+        return header + utterance[-self.config.overlap_chars :]
+
+    @staticmethod
+    def _split_utterances(text: str) -> list[str]:
+        """テキストを発言者記号の位置で発言単位に分ける（先頭の前置きを含む）"""
+        positions = [m.start() for m in _MARKER_PATTERN.finditer(text)]
+        if not positions or positions[0] != 0:
+            positions.insert(0, 0)
+        positions.append(len(text))
+        return [
+            text[start:end]
+            for start, end in zip(positions, positions[1:], strict=False)
+            if start < end
+        ]
+
+    def _split_long_utterance(self, utterance: str, max_tokens: int) -> list[str]:
+        """上限を超える1つの発言を文末で分割する
+
+        2つ目以降のチャンクの先頭には発言者表記を付け、
+        どの発言者の発言の続きかが分かるようにします。
+        """
+        header_match = _SPEAKER_HEADER_PATTERN.match(utterance)
+        header = header_match.group(0) if header_match else ""
+        body = utterance[len(header) :]
+        body_budget = max(1, max_tokens - self.estimate(header))
+
+        pieces: list[str] = []
+        current = ""
+        for sentence in self._split_sentences(body, body_budget):
+            if current and self.estimate(current + sentence) > body_budget:
+                pieces.append(current)
+                current = ""
+            current += sentence
+        if current:
+            pieces.append(current)
+
+        return [header + piece for piece in pieces]
+
+    def _split_sentences(self, text: str, max_tokens: int) -> list[str]:
+        """文末で分け、それでも上限を超える文は前後を重ねて強制的に分割する"""
+        sentences: list[str] = []
+        for sentence in _SENTENCE_END_PATTERN.split(text):
+            if not sentence:
+                continue
+            if self.estimate(sentence) <= max_tokens:
+                sentences.append(sentence)
+                continue
+
+            # 日本語は1文字1トークンと見積もるため、文字数で区切る
+            overlap = min(self.config.overlap_chars, max_tokens // 2)
+            step = max(1, max_tokens - overlap)
+            for start in range(0, len(sentence), step):
+                sentences.append(sentence[max(0, start - overlap) : start + step])
+        return sentences
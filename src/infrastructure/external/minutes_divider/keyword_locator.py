@@ -0,0 +1,337 @@
+"""議事録中のセクションキーワードの一括検索
+
+do_divideでは、DivideMinutesToKeywordsが返したキーワード（各セクションの先頭の文字列）の
+出現位置から議事録を分割します。キーワードごとに議事録全体をfindで走査すると、
+見つからないキーワードが多い長い議事録では処理時間がセクション数の2乗に比例して増えるため、
+このモジュールでは全キーワード（と長いキーワードの先頭部分）をAho–Corasick法で
+1回の走査で検索し、出現位置の一覧から二分探索で次の出現位置を求めます。
+
+検索は正規化（NFKC、記号・空白の統一）したテキストに対して行い、
+正規化前のテキストでの位置に戻すための対応表も作成します。
+"""
+
+import bisect
+import functools
+import re
+import unicodedata
+
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+# 長いキーワードが見つからない場合に部分一致を試す先頭の文字数
+PARTIAL_KEYWORD_LENGTH = 10
+
+_SPACES_PATTERN = re.compile(r" +")
+
+
+def normalize_keyword_text(text: str) -> str:
+    """キーワード検索用にテキストを正規化する"""
+    normalized = unicodedata.normalize("NFKC", text)
+    # 議事録特有の記号の正規化
+    normalized = normalized.replace("◯", "○").replace("●", "○")
+    # タブ文字をスペースに変換し、連続するスペースを1つに統一
+    normalized = normalized.replace("\t", " ")
+    return _SPACES_PATTERN.sub(" ", normalized)
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """正規化したテキストと、正規化前のテキストでの位置の対応表
+
+    Attributes:
+        text: 正規化したテキスト
+        offsets: 正規化したテキストの各位置に対応する正規化前の位置
+            （末尾に正規化前のテキストの長さを持つため、len(text) + 1 要素）
+    """
+
+    text: str
+    offsets: list[int]
+
+    def original_index(self, index: int) -> int:
+        """正規化したテキストでの位置を正規化前のテキストでの位置に変換する"""
+        return self.offsets[index]
+
+
+@functools.cache
+def _irregular_pattern() -> re.Pattern[str]:
+    """正規化で1文字が1文字にならない可能性がある箇所のパターン
+
+    - 直前の文字と合成される文字（濁点・半濁点などの結合文字、ハングルの字母）と
+      直前の文字
+    - 正規化で文字数が変わる文字（「㈱」→「(株)」など）
+    - 空白（連続する空白は1つに統一される）
+    - 基本多言語面以外の文字
+    """
+    # 正準分解が2文字になる文字の2文字目は、直前の文字と合成される
+    composing: set[str] = {chr(code_point) for code_point in range(0x1161, 0x11C3)}
+    for code_point in range(0x10000):
+        decomposition = unicodedata.decomposition(chr(code_point)).split()
+        if len(decomposition) == 2 and not decomposition[0].startswith("<"):
+            composing.add(chr(int(decomposition[1], 16)))
+
+    joining: list[str] = []
+    irregular: list[str] = []
+    for code_point in range(0x10000):
+        if 0xD800 <= code_point <= 0xDFFF:
+            continue
+        char = chr(code_point)
+        normalized = unicodedata.normalize("NFKC", char)
+        if len(normalized) == 1 and (
+            normalized in composing or unicodedata.combining(normalized)
+        ):
+            joining.append(re.escape(char))
+        elif len(normalized) != 1 or normalized.isspace():
+            irregular.append(re.escape(char))
+    joining_class = "".join(joining)
+    return re.compile(
+        rf"[^{joining_class}]?[{joining_class}]+"
+        rf"|[{''.join(irregular)}\U00010000-\U0010FFFF]",
+        re.DOTALL,
+    )
+
+
+def normalize_with_offsets(text: str) -> NormalizedText:
+    """normalize_keyword_textと同じ正規化を行い、位置の対応表を作成する
+
+    正規化で文字数が変わる可能性がある箇所だけを個別に正規化し、
+    それ以外の範囲はまとめて正規化する（1文字が1文字に対応する）ことで、
+    長い議事録でも文字ごとの処理を避けます。
+    """
+    pieces: list[str] = []
+    offsets: list[int] = []
+    previous_space = False
+    position = 0
+    for match in _irregular_pattern().finditer(text):
+        if match.start() > position:
+            piece = normalize_keyword_text(text[position : match.start()])
+            if len(piece) != match.start() - position:
+                return _normalize_by_segment(text)
+            pieces.append(piece)
+            offsets.extend(range(position, match.start()))
+            previous_space = False
+        for char in normalize_keyword_text(match.group(0)):
+            if char == " " and previous_space:
+                continue
+            pieces.append(char)
+            offsets.append(match.start())
+            previous_space = char == " "
+        position = match.end()
+    if position < len(text):
+        piece = normalize_keyword_text(text[position:])
+        if len(piece) != len(text) - position:
+            return _normalize_by_segment(text)
+        pieces.append(piece)
+        offsets.extend(range(position, len(text)))
+    offsets.append(len(text))
+    return NormalizedText(text="".join(pieces), offsets=offsets)
+
+
+def _normalize_by_segment(text: str) -> NormalizedText:
+    """1文字（と続く結合文字）ずつ正規化して位置の対応表を作成する"""
+    chars: list[str] = []
+    offsets: list[int] = []
+    index = 0
+    while index < len(text):
+        end = index + 1
+        while end < len(text) and unicodedata.combining(
+            unicodedata.normalize("NFKC", text[end])[:1] or " "
+        ):
+            end += 1
+        for char in normalize_keyword_text(text[index:end]):
+            if char == " " and chars and chars[-1] == " ":
+                continue
+            chars.append(char)
+            offsets.append(index)
+        index = end
+    offsets.append(len(text))
+    return NormalizedText(text="".join(chars), offsets=offsets)
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """キーワードの出現位置
+
+    Attributes:
+        start: 正規化したテキストでの開始位置
+        original_start: 正規化前のテキストでの開始位置
+        partial: キーワードの先頭部分だけが一致したかどうか
+    """
+
+    start: int
+    original_start: int
+    partial: bool = False
+
+
+class KeywordPositions:
+    """キーワードごとの出現位置の一覧"""
+
+    def __init__(
+        self,
+        normalized: NormalizedText,
+        full_positions: list[list[int]],
+        partial_positions: list[list[int]],
+    ):
+        self.normalized = normalized
+        self._full_positions = full_positions
+        self._partial_positions = partial_positions
+
+    def find(self, keyword_index: int, start: int = 0) -> KeywordMatch | None:
+        """キーワードのstart以降の最初の出現位置を返す
+
+        キーワード全体が見つからない場合は、先頭部分の出現位置を返します
+        （str.findでキーワード全体、先頭部分の順に検索するのと同じ結果）。
+
+        Args:
+            keyword_index: キーワードのインデックス
+            start: 検索を開始する位置（正規化したテキストでの位置）
+
+        Returns:
+            KeywordMatch | None: 出現位置。見つからない場合はNone
+        """
+        for positions, partial in (
+            (self._full_positions[keyword_index], False),
+            (self._partial_positions[keyword_index], True),
+        ):
+            found = bisect.bisect_left(positions, start)
+            if found < len(positions):
+                position = positions[found]
+                return KeywordMatch(
+                    start=position,
+                    original_start=self.normalized.original_index(position),
+                    partial=partial,
+                )
+        return None
+
+
+class KeywordLocator:
+    """複数のキーワードの出現位置を1回の走査で求めるクラス（Aho–Corasick法）
+
+    キーワードはnormalize_keyword_textで正規化してから登録します。
+    PARTIAL_KEYWORD_LENGTHより長いキーワードは、先頭部分も部分一致用に登録します。
+    """
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        partial_length: int = PARTIAL_KEYWORD_LENGTH,
+    ):
+        """
+        Args:
+            keywords: 検索するキーワードのリスト
+            partial_length: 部分一致に使う先頭の文字数
+        """
+        self.keyword_count = len(keywords)
+        # パターン -> (キーワードのインデックス, 部分一致かどうか) のリスト
+        self._patterns: list[str] = []
+        self._pattern_targets: list[list[tuple[int, bool]]] = []
+        pattern_ids: dict[str, int] = {}
+
+        def register(pattern: str, keyword_index: int, partial: bool) -> None:
+            if not pattern:
+                return
+            if pattern not in pattern_ids:
+                pattern_ids[pattern] = len(self._patterns)
+                self._patterns.append(pattern)
+                self._pattern_targets.append([])
+            self._pattern_targets[pattern_ids[pattern]].append((keyword_index, partial))
+
+        for keyword_index, keyword in enumerate(keywords):
+            normalized = normalize_keyword_text(keyword)
+            register(normalized, keyword_index, False)
+            if len(normalized) > partial_length:
+                register(normalized[:partial_length], keyword_index, True)
+
+        self._build_automaton()
+
+    def locate(self, text: str) -> KeywordPositions:
+        """テキスト中の全キーワードの出現位置を求める
+
+        Args:
+            text: 検索対象のテキスト（正規化前）
+
+        Returns:
+            KeywordPositions: キーワードごとの出現位置（昇順）
+        """
+        normalized = normalize_with_offsets(text)
+        full_positions: list[list[int]] = [[] for _ in range(self.keyword_count)]
+        partial_positions: list[list[int]] = [[] for _ in range(self.keyword_count)]
+
+        if not self._patterns:
+            return KeywordPositions(normalized, full_positions, partial_positions)
+
+        text = normalized.text
+        goto = self._goto
+        fail = self._fail
+        pattern_at = self._pattern_at
+        output_link = self._output_link
+        state = 0
+        index = 0
+        while index < len(text):
+            if state == 0:
+                # 初期状態ではパターンの先頭文字まで読み飛ばす
+                first_char = self._first_char_pattern.search(text, index)
+                if first_char is None:
+                    break
+                index = first_char.start()
+            char = text[index]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            # この位置で終わるパターン（接尾辞になっているパターンを含む）を記録する
+            matched = state if pattern_at[state] >= 0 else output_link[state]
+            while matched:
+                pattern_id = pattern_at[matched]
+                position = index - len(self._patterns[pattern_id]) + 1
+                for keyword_index, partial in self._pattern_targets[pattern_id]:
+                    target = partial_positions if partial else full_positions
+                    target[keyword_index].append(position)
+                matched = output_link[matched]
+            index += 1
+
+        return KeywordPositions(normalized, full_positions, partial_positions)
+
+    def _build_automaton(self) -> None:
+        """パターンからトライ木と失敗遷移を構築する"""
+        goto: list[dict[str, int]] = [{}]
+        # 状態で終わるパターンのID（パターンは重複しないため1つ）
+        pattern_at: list[int] = [-1]
+        for pattern_id, pattern in enumerate(self._patterns):
+            state = 0
+            for char in pattern:
+                transitions = goto[state]
+                next_state = transitions.get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    transitions[char] = next_state
+                    goto.append({})
+                    pattern_at.append(-1)
+                state = next_state
+            pattern_at[state] = pattern_id
+
+        # 失敗遷移と、失敗遷移をたどって最初に見つかるパターンの終端状態
+        fail = [0] * len(goto)
+        output_link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target
+                output_link[next_state] = (
+                    target if pattern_at[target] >= 0 else output_link[target]
+                )
+
+        self._goto = goto
+        self._fail = fail
+        self._pattern_at = pattern_at
+        self._output_link = output_link
+        self._first_char_pattern = re.compile(
+            "[" + "".join(re.escape(char) for char in goto[0]) + "]"
+        )
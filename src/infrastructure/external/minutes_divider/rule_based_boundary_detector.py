@@ -0,0 +1,205 @@
+"""ルールベースの出席者/発言境界検出
+
+議事録の冒頭には「出席議員」「説明のため出席した者」などの見出しが付いた
+出席者情報があり、その後に「午前10時開議」のような開議時刻や区切り線を挟んで
+「○議長（山田太郎君）」の形式の発言が始まります。
+このモジュールは、speech_extraction_toolsのanalyze_contextで使っている
+パターン（出席者の見出し、発言者記号、区切り線、時刻表記）を使って、
+LLMを使わずに出席者部分と発言部分の境界を検出します。
+"""
+
+import re
+
+from src.infrastructure.external.minutes_divider.rule_based_speech_splitter import (
+    SPEAKER_MARKERS,
+)
+from src.minutes_divide_processor.models import MinutesBoundary
+
+
+DEFAULT_BOUNDARY_CONFIDENCE_THRESHOLD = 0.8
+
+# 出席者情報の見出し
+_ATTENDEE_HEADER_PATTERN = re.compile(
+    r"出席議員|欠席議員|出席委員|欠席委員|出席者|欠席者|説明のため出席|"
+    r"職務のため出席|出席説明員|事務局職員|議事日程|本日の会議に付した事件"
+)
+
+# 記号 + 役職（名前）で始まる発言
+_SPEECH_START_PATTERN = re.compile(
+    rf"[{SPEAKER_MARKERS}][ 　]*"
+    rf"(?P<role>[^{SPEAKER_MARKERS}()（）\s]{{1,20}})"
+    r"[ 　]*[(（][ 　]*"
+    r"(?P<name>[^()（）\s]{1,20}?)"
+    r"[ 　]*[)）]"
+)
+
+# 「○出席議員（30名）」のような見出しの人数表記
+_HEADCOUNT_PATTERN = re.compile(r"^[0-9０-９]+名$")
+
+_NUMERAL = "0-9０-９一二三四五六七八九十〇"
+
+# 開議・開会の時刻表記: 例「午前10時開議」「（午後1時30分開会）」
+_OPENING_PATTERN = re.compile(
+    r"[［【〔(（]?[ 　]*"
+    rf"(?:午[前後][{_NUMERAL}]{{1,3}}時(?:[{_NUMERAL}]{{1,3}}分)?"
+    r"|[0-9０-９]{1,2}[:：][0-9０-９]{2})"
+    r"[ 　]*(?:開議|開会)"
+)
+
+# 区切り線: 例「――――」「----」「━━━━」
+_SEPARATOR_PATTERN = re.compile(r"[-─━―=＝]{3,}")
+
+# 見出しがない場合に、発言前のテキストを表題とみなす最大文字数
+_MAX_TITLE_LENGTH = 100
+
+# 境界前後としてboundary_textに含める文字数
+_CONTEXT_LENGTH = 50
+
+
+class RuleBasedBoundaryDetector:
+    """出席者部分と発言部分の境界をパターンで検出するクラス
+
+    信頼度は、境界の根拠となるパターンの組み合わせで決まります。
+
+    - 出席者の見出しの後に開議時刻がある: 0.95（time_marker）
+    - 出席者の見出しの後に区切り線がある: 0.9（separator_line）
+    - 出席者の見出しの後に発言が始まる: 0.85（speech_start）
+    - 見出しがなく、短い表題の直後から発言が始まる: 0.9（境界なし）
+    - 見出しがなく、発言前に長いテキストがある: 0.4（speech_start）
+    - 発言者の表記が見つからない: 0.0（境界なし）
+    """
+
+    def detect(self, minutes_text: str) -> MinutesBoundary:
+        """議事録テキストから出席者部分と発言部分の境界を検出する
+
+        Args:
+            minutes_text: 議事録の全文
+
+        Returns:
+            MinutesBoundary: 境界検出結果（boundary_positionに発言部分の開始位置）
+        """
+        candidates = self.find_candidates(minutes_text)
+        if not candidates:
+            return MinutesBoundary(
+                boundary_found=False,
+                boundary_type="none",
+                confidence=0.0,
+                reason="発言者の表記が見つかりません",
+                detection_method="rule_based",
+            )
+        return candidates[0]
+
+    def find_candidates(self, minutes_text: str) -> list[MinutesBoundary]:
+        """境界の候補をすべて列挙し、信頼度の高い順に返す
+
+        出席者の見出しがある場合は、開議時刻・区切り線・最初の発言のうち
+        見つかったものをすべて候補とします。見出しがない場合の候補は1件
+        （冒頭から発言が始まる「境界なし」または最初の発言）です。
+
+        Args:
+            minutes_text: 議事録の全文
+
+        Returns:
+            list[MinutesBoundary]: 信頼度の高い順の候補。発言者の表記が
+            見つからない場合は空リスト
+        """
+        speech_start = self._find_speech_start(minutes_text)
+        if speech_start is None:
+            return []
+
+        headers = list(_ATTENDEE_HEADER_PATTERN.finditer(minutes_text, 0, speech_start))
+        if not headers:
+            preamble = minutes_text[:speech_start].strip()
+            if len(preamble) <= _MAX_TITLE_LENGTH:
+                return [
+                    MinutesBoundary(
+                        boundary_found=False,
+                        boundary_type="none",
+                        confidence=0.9,
+                        reason="出席者の見出しがなく、冒頭から発言が始まっています",
+                        detection_method="rule_based",
+                    )
+                ]
+            return [
+                self._boundary(
+                    minutes_text,
+                    speech_start,
+                    "speech_start",
+                    0.4,
+                    "出席者の見出しがないまま発言前に長いテキストがあります",
+                )
+            ]
+
+        header_end = headers[-1].end()
+        candidates: list[MinutesBoundary] = []
+
+        opening = _OPENING_PATTERN.search(minutes_text, header_end, speech_start)
+        if opening:
+            candidates.append(
+                self._boundary(
+                    minutes_text,
+                    opening.start(),
+                    "time_marker",
+                    0.95,
+                    f"出席者の見出しの後に開議時刻「{opening.group(0).strip()}」",
+                )
+            )
+
+        separators = list(
+            _SEPARATOR_PATTERN.finditer(minutes_text, header_end, speech_start)
+        )
+        if separators:
+            position = separators[-1].end()
+            while position < speech_start and minutes_text[position].isspace():
+                position += 1
+            candidates.append(
+                self._boundary(
+                    minutes_text,
+                    position,
+                    "separator_line",
+                    0.9,
+                    "出席者の見出しの後に区切り線",
+                )
+            )
+
+        candidates.append(
+            self._boundary(
+                minutes_text,
+                speech_start,
+                "speech_start",
+                0.85,
+                "出席者の見出しの後に最初の発言",
+            )
+        )
+        return candidates
+
+    def _find_speech_start(self, minutes_text: str) -> int | None:
+        """最初の発言の開始位置を探す（見出しの記号は除く）"""
+        for match in _SPEECH_START_PATTERN.finditer(minutes_text):
+            if _ATTENDEE_HEADER_PATTERN.search(match.group("role")):
+                continue
+            if _HEADCOUNT_PATTERN.match(match.group("name")):
+                continue
+            return match.start()
+        return None
+
+    @staticmethod
+    def _boundary(
+        minutes_text: str,
+        position: int,
+        boundary_type: str,
+        confidence: float,
+        reason: str,
+    ) -> MinutesBoundary:
+        """境界位置からMinutesBoundaryを作成する"""
+        before = minutes_text[max(0, position - _CONTEXT_LENGTH) : position]
+        after = minutes_text[position : position + _CONTEXT_LENGTH]
+        return MinutesBoundary(
+            boundary_found=True,
+            boundary_text=f"{before}｜境界｜{after}",
+            boundary_type=boundary_type,  # type: ignore[arg-type]
+            confidence=confidence,
+            reason=reason,
+            boundary_position=position,
+            detection_method="rule_based",
+        )
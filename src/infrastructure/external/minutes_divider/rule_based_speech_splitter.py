@@ -0,0 +1,126 @@
+"""ルールベースの発言分割
+
+議事録検索システム（kaigiroku.netなど）の議事録は、発言者が
+「○議長（山田太郎君）」「◆３番（鈴木花子議員）」「◎市長（佐藤一郎君）」のように
+記号と「役職（名前）」の形式で機械的に示されています。
+このモジュールは、そのような整形済みのセクションをLLMを使わずに発言単位へ分割し、
+分割結果の構造的な妥当性から信頼度を算出します。
+
+前処理（BAMLMinutesDivider.pre_process）後のテキストは改行・空白が除去された
+1行の文字列になるため、web_scraperのSpeakerExtractorのような行単位のパターンではなく、
+記号の出現位置を区切りとして発言者を判定します。
+"""
+
+import re
+
+from dataclasses import dataclass, field
+
+from src.minutes_divide_processor.models import SectionString, SpeakerAndSpeechContent
+
+
+# 発言者を示す記号
+SPEAKER_MARKERS = "○◆◎●"
+
+_MARKER_PATTERN = re.compile(f"[{SPEAKER_MARKERS}]")
+
+# 記号 + 役職（名前）: 例「○議長(山田太郎君)」「◆3番(鈴木花子議員)」
+_SPEAKER_PATTERN = re.compile(
+    rf"[{SPEAKER_MARKERS}][ 　]*"
+    rf"(?P<role>[^{SPEAKER_MARKERS}()（）\s]{{1,20}})"
+    r"[ 　]*[(（][ 　]*"
+    r"(?P<name>[^()（）\s]{1,20}?)"
+    r"[ 　]*[)）]"
+)
+
+DEFAULT_CONFIDENCE_THRESHOLD = 0.9
+
+
+@dataclass
+class RuleBasedSplitResult:
+    """ルールベース分割の結果
+
+    Attributes:
+        speeches: 分割された発言リスト
+        confidence: 分割結果の信頼度（0.0-1.0）。構造検証に失敗した場合は0.0
+        reason: 信頼度の判定理由
+    """
+
+    speeches: list[SpeakerAndSpeechContent] = field(default_factory=list)
+    confidence: float = 0.0
+    reason: str = ""
+
+
+class RuleBasedSpeechSplitter:
+    """記号付きの発言者表記を使って発言を分割するクラス
+
+    以下の構造検証をすべて満たす場合のみ信頼度を付与します。
+
+    - 発言者記号が1つ以上ある
+    - すべての発言者記号が「役職（名前）」の形式で発言者を特定できる
+    - すべての発言に内容がある
+
+    信頼度は、セクション全体のうち発言として取り込まれた文字の割合です。
+    先頭に発言者のいない文章が多く残るセクションは信頼度が下がります。
+    """
+
+    def split(self, section_string: SectionString) -> RuleBasedSplitResult:
+        """セクションを発言者と発言内容に分割する
+
+        Args:
+            section_string: セクション文字列
+
+        Returns:
+            RuleBasedSplitResult: 分割結果と信頼度
+        """
+        text = section_string.section_string.strip()
+        marker_positions = [m.start() for m in _MARKER_PATTERN.finditer(text)]
+        if not marker_positions:
+            return RuleBasedSplitResult(reason="発言者記号がありません")
+
+        speaker_matches: list[re.Match[str]] = []
+        for position in marker_positions:
+            match = _SPEAKER_PATTERN.match(text, position)
+            if match is None:
+                return RuleBasedSplitResult(
+                    reason=f"発言者を特定できない記号があります: "
+                    f"{text[position : position + 20]}"
+                )
+            speaker_matches.append(match)
+
+        speeches: list[SpeakerAndSpeechContent] = []
+        for order, match in enumerate(speaker_matches, start=1):
+            end = (
+                speaker_matches[order].start()
+                if order < len(speaker_matches)
+                else len(text)
+            )
+            content = text[match.end() : end].strip()
+            if not content:
+                return RuleBasedSplitResult(
+                    reason=f"発言内容が空の発言者があります: {match.group(0)}"
+                )
+
+            speeches.append(
+                SpeakerAndSpeechContent(
+                    speaker=f"{match.group('role')}({match.group('name')})",
+                    speech_content=content,
+                    chapter_number=section_string.chapter_number,
+                    sub_chapter_number=section_string.sub_chapter_number,
+                    speech_order=order,
+                )
+            )
+
+        preamble = text[: speaker_matches[0].start()].strip()
+        confidence = 1.0 - len(preamble) / len(text)
+        return RuleBasedSplitResult(
+            speeches=speeches,
+            confidence=confidence,
+            reason=(
+                f"{len(speeches)}件の発言を検出"
+                + (
+                    f"（発言者のない先頭テキスト{len(preamble)}文字）"
+                    if preamble
+                    else ""
+                )
+            ),
+        )
@@ -0,0 +1,158 @@
+"""議事録の出席者/発言境界の抽出
+
+RuleBasedBoundaryDetectorで境界の候補を列挙・採点し、最も信頼度の高い候補が
+閾値に届かない曖昧な議事録に限って、LLMによる境界検出を1回だけ呼び出します。
+LLMがツール呼び出しを繰り返すReActエージェントとは異なり、
+議事録1件あたりのLLM呼び出しは0回または1回です。
+"""
+
+import structlog
+
+from typing_extensions import TypedDict
+
+from src.domain.interfaces.minutes_divider_service import IMinutesDividerService
+from src.infrastructure.external.minutes_divider.rule_based_boundary_detector import (
+    DEFAULT_BOUNDARY_CONFIDENCE_THRESHOLD,
+    RuleBasedBoundaryDetector,
+)
+from src.minutes_divide_processor.models import MinutesBoundary
+
+
+logger = structlog.get_logger(__name__)
+
+# 定数定義
+CONFIDENCE_THRESHOLD = 0.7  # 境界として採用する最小信頼度
+LLM_CONTEXT_LENGTH = 200  # LLMに渡す、最後の境界候補より後ろの文字数
+MAX_LLM_TEXT_LENGTH = 10000  # 境界候補がない場合にLLMに渡す冒頭の最大文字数
+
+
+class VerifiedBoundary(TypedDict):
+    """検証済み境界の型定義"""
+
+    position: int  # 境界位置（文字インデックス）
+    boundary_type: str  # 境界の種類（speech_start, separator_line等）
+    confidence: float  # 信頼度（0.0-1.0）
+
+
+class BoundaryExtractionResult(TypedDict):
+    """境界抽出結果の型定義"""
+
+    verified_boundaries: list[VerifiedBoundary]  # 検証済み境界のリスト
+    error_message: str | None  # エラーメッセージ（エラー時のみ）
+
+
+class SpeechBoundaryExtractor:
+    """議事録の出席者部分と発言部分の境界を抽出するクラス
+
+    1. 境界の候補（開議時刻・区切り線・最初の発言など）をパターンで列挙し、
+       ルールベースで信頼度を付ける
+    2. 最も信頼度の高い候補がambiguity_threshold以上ならLLMを呼び出さない
+    3. それ未満の場合のみ、最後の候補の少し後ろまでの冒頭部分について
+       detect_attendee_boundary（DetectBoundary）を1回呼び出す
+
+    Attributes:
+        minutes_divider: 曖昧な場合の境界検出に使用する議事録分割サービス
+        boundary_detector: 候補の列挙に使用するルールベース検出器
+        ambiguity_threshold: LLMを呼び出さずに確定する最小信頼度
+    """
+
+    def __init__(
+        self,
+        minutes_divider: IMinutesDividerService,
+        boundary_detector: RuleBasedBoundaryDetector | None = None,
+        ambiguity_threshold: float = DEFAULT_BOUNDARY_CONFIDENCE_THRESHOLD,
+    ):
+        """
+        Args:
+            minutes_divider: 議事録分割サービス
+            boundary_detector: ルールベースの境界検出器
+            ambiguity_threshold: LLMを呼び出さずに確定する最小信頼度
+        """
+        self.minutes_divider = minutes_divider
+        self.boundary_detector = boundary_detector or RuleBasedBoundaryDetector()
+        self.ambiguity_threshold = ambiguity_threshold
+
+    async def extract_boundaries(self, minutes_text: str) -> BoundaryExtractionResult:
+        """発言境界を抽出
+
+        Args:
+            minutes_text: 議事録テキスト
+
+        Returns:
+            抽出結果を含む辞書:
+            - verified_boundaries: 検証済み境界のリスト（信頼度の高い順）
+            - error_message: エラーメッセージ（エラー時のみ）
+        """
+        logger.info(
+            "Starting boundary extraction",
+            text_length=len(minutes_text),
+        )
+
+        try:
+            candidates = self.boundary_detector.find_candidates(minutes_text)
+            best_confidence = candidates[0].confidence if candidates else 0.0
+
+            if best_confidence < self.ambiguity_threshold:
+                llm_text = self._llm_text(minutes_text, candidates)
+                logger.info(
+                    "Boundary is ambiguous, detecting with LLM",
+                    best_confidence=best_confidence,
+                    llm_text_length=len(llm_text),
+                )
+                llm_boundary = await self.minutes_divider.detect_attendee_boundary(
+                    llm_text
+                )
+                candidates = [llm_boundary, *candidates]
+
+            verified_boundaries = sorted(
+                (
+                    VerifiedBoundary(
+                        position=candidate.boundary_position,
+                        boundary_type=candidate.boundary_type,
+                        confidence=candidate.confidence,
+                    )
+                    for candidate in candidates
+                    if candidate.boundary_found
+                    and candidate.boundary_position is not None
+                    and candidate.confidence >= CONFIDENCE_THRESHOLD
+                ),
+                key=lambda boundary: boundary["confidence"],
+                reverse=True,
+            )
+
+            logger.info(
+                "Boundary extraction completed",
+                boundary_count=len(verified_boundaries),
+                llm_called=best_confidence < self.ambiguity_threshold,
+            )
+            return BoundaryExtractionResult(
+                verified_boundaries=verified_boundaries,
+                error_message=None,
+            )
+
+        except Exception as e:
+            logger.error(
+                "Error during boundary extraction",
+                error=str(e),
+                exc_info=True,
+            )
+            return BoundaryExtractionResult(
+                verified_boundaries=[],
+                error_message=f"境界抽出中にエラーが発生しました: {str(e)}",
+            )
+
+    @staticmethod
+    def _llm_text(minutes_text: str, candidates: list[MinutesBoundary]) -> str:
+        """LLMに渡す冒頭部分を切り出す
+
+        境界は最初の発言より前にあるため、最後の候補の少し後ろまでで十分です。
+        冒頭からの切り出しなので、検出された位置は全文でもそのまま使えます。
+        """
+        positions = [
+            candidate.boundary_position
+            for candidate in candidates
+            if candidate.boundary_position is not None
+        ]
+        if positions:
+            return minutes_text[: max(positions) + LLM_CONTEXT_LENGTH]
+        return minutes_text[:MAX_LLM_TEXT_LENGTH]
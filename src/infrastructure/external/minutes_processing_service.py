@@ -6,8 +6,10 @@ from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.services.interfaces.minutes_processing_service import (
     IMinutesProcessingService,
 )
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 from src.minutes_divide_processor.minutes_process_agent import MinutesProcessAgent
+from src.minutes_divide_processor.models import MinutesBoundary
 
 
 logger = structlog.get_logger(__name__)
@@ -38,6 +40,7 @@ class MinutesProcessAgentService(IMinutesProcessingService):
         self,
         original_minutes: str,
         role_name_mappings: dict[str, str] | None = None,
+        attendee_boundary: AttendeeBoundary | None = None,
     ) -> list[SpeakerSpeech]:
         """Process meeting minutes text and extract speeches.
 
@@ -51,6 +54,8 @@ class MinutesProcessAgentService(IMinutesProcessingService):
             original_minutes: Raw meeting minutes text content
             role_name_mappings: 役職-人名マッピング辞書（例: {"議長": "伊藤条一"}）
                 発言者名が役職のみの場合に実名に変換するために使用（Issue #946）
+            attendee_boundary: Already detected attendee/speech boundary of
+                original_minutes. When given, the agent skips boundary detection.
 
         Returns:
             List of extracted speeches with speaker information as domain value objects.
@@ -76,6 +81,11 @@ class MinutesProcessAgentService(IMinutesProcessingService):
         infrastructure_results = await self.agent.run(
             original_minutes,
             role_name_mappings=role_name_mappings,
+            attendee_boundary=(
+                self._to_minutes_boundary(attendee_boundary)
+                if attendee_boundary
+                else None
+            ),
         )
 
         # Convert to domain value objects
@@ -117,3 +127,15 @@ class MinutesProcessAgentService(IMinutesProcessingService):
         )
 
         return domain_results
+
+    @staticmethod
+    def _to_minutes_boundary(boundary: AttendeeBoundary) -> MinutesBoundary:
+        """Convert a detected boundary to the model used by MinutesProcessAgent."""
+        return MinutesBoundary(
+            boundary_found=boundary.boundary_found,
+            boundary_type=boundary.boundary_type,  # type: ignore[arg-type]
+            confidence=boundary.confidence,
+            reason=f"検出済みの境界を使用（{boundary.detection_method}）",
+            boundary_position=boundary.position,
+            detection_method="cached",
+        )
@@ -8,8 +8,6 @@ import logging
 
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from baml_client.async_client import b
 
 from src.application.dtos.parliamentary_group_member_dto import (
@@ -19,7 +17,18 @@ from src.application.dtos.parliamentary_group_member_dto import (
 from src.domain.interfaces.parliamentary_group_member_extractor_service import (
     IParliamentaryGroupMemberExtractorService,
 )
-from src.infrastructure.external.html_page_fetcher import HtmlPageFetcher
+from src.infrastructure.external.crawler import PageFetcher
+from src.infrastructure.external.html_compactor import (
+    HtmlCompactor,
+    extract_from_chunks,
+)
+from src.infrastructure.external.static_first_page_fetcher import (
+    StaticFirstPageFetcher,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -34,13 +43,29 @@ class BAMLParliamentaryGroupMemberExtractor(IParliamentaryGroupMemberExtractorSe
     Issue #905: LangGraphエージェント用にextract_members_from_htmlメソッドを追加
     """
 
+    def __init__(
+        self,
+        html_compactor: HtmlCompactor | None = None,
+        page_fetcher: PageFetcher | None = None,
+    ):
+        """
+        Args:
+            html_compactor: LLM入力用にHTMLを圧縮・分割するコンパクター
+            page_fetcher: 起動済みのフェッチャー（指定時はブラウザを共有し、
+                URLごとにChromiumを起動しない）
+        """
+        self.html_compactor = html_compactor or HtmlCompactor()
+        self.page_fetcher = page_fetcher
+        # page_fetcherがない場合に使い回す、このインスタンスのフェッチャー
+        self._own_page_fetcher = StaticFirstPageFetcher()
+
     async def extract_members_from_html(
         self, html_content: str, parliamentary_group_name: str
     ) -> list[ExtractedParliamentaryGroupMemberDTO]:
         """HTMLコンテンツから議員団メンバーを抽出（LangGraphエージェント用）
 
         LangGraphエージェントから呼び出されることを想定したメソッドです。
-        HTMLコンテンツを解析してテキストを抽出し、BAMLで議員情報を抽出します。
+        HTMLコンテンツを簡潔なテキストに圧縮し、BAMLで議員情報を抽出します。
 
         Args:
             html_content: 解析対象のHTMLコンテンツ
@@ -55,21 +80,8 @@ class BAMLParliamentaryGroupMemberExtractor(IParliamentaryGroupMemberExtractorSe
                 f"'{parliamentary_group_name}' (HTML: {len(html_content)} chars)"
             )
 
-            # BeautifulSoupでHTMLを解析
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # スクリプトとスタイルを削除
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # テキストを抽出
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text_content = "\n".join(chunk for chunk in chunks if chunk)
-
             # LLMで議員情報を抽出（BAML使用）
-            return await self._extract_members_with_baml(text_content, str(soup))
+            return await self._extract_members_with_baml(html_content)
 
         except Exception as e:
             logger.error(
@@ -103,21 +115,8 @@ class BAMLParliamentaryGroupMemberExtractor(IParliamentaryGroupMemberExtractorSe
                     error="URLからコンテンツを取得できませんでした。URLが正しいか、またはPlaywrightが正しくインストールされているか確認してください。",
                 )
 
-            # BeautifulSoupでHTMLを解析
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # スクリプトとスタイルを削除
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # テキストを抽出
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text_content = "\n".join(chunk for chunk in chunks if chunk)
-
             # LLMで議員情報を抽出（BAML使用）
-            members_dto = await self._extract_members_with_baml(text_content, str(soup))
+            members_dto = await self._extract_members_with_baml(html_content)
 
             return ParliamentaryGroupMemberExtractionResultDTO(
                 parliamentary_group_id=parliamentary_group_id,
@@ -138,70 +137,48 @@ class BAMLParliamentaryGroupMemberExtractor(IParliamentaryGroupMemberExtractorSe
             )
 
     async def _extract_members_with_baml(
-        self, text_content: str, html_content: str
+        self, html_content: str
     ) -> list[ExtractedParliamentaryGroupMemberDTO]:
         """BAMLを使用して議員情報を抽出する
 
+        HTMLを表・リストを1行1件にした簡潔なテキストに圧縮し、
+        長い場合は行単位のチャンクに分割して並行に抽出します。
+        圧縮後のテキストに表やリストの構造が残るため、
+        BAMLのHTML引数には何も渡しません。
+
         Args:
-            text_content: テキストコンテンツ
             html_content: HTMLコンテンツ
 
         Returns:
             抽出された議員リスト（DTO）
         """
         try:
+            chunks = self.html_compactor.split(html_content)
             logger.info(
                 f"Starting BAML parliamentary group member extraction "
-                f"(Text size: {len(text_content)} chars, "
-                f"HTML size: {len(html_content)} chars)"
+                f"(HTML size: {len(html_content)} chars, "
+                f"compacted: {sum(len(chunk) for chunk in chunks)} chars "
+                f"in {len(chunks)} chunk(s))"
             )
 
-            # HTMLとテキストが長すぎる場合は切り詰める
-            max_text_length = 5000
-            max_html_length = 10000
-
-            original_text_length = len(text_content)
-            original_html_length = len(html_content)
-
-            if original_text_length > max_text_length:
-                logger.warning(
-                    f"Text content too long ({original_text_length} chars), "
-                    f"truncating to {max_text_length} chars "
-                    f"(reduction: {original_text_length - max_text_length} chars, "
-                    f"{(1 - max_text_length / original_text_length) * 100:.1f}%)"
-                )
-                text_content = text_content[:max_text_length]
-
-            if original_html_length > max_html_length:
-                logger.warning(
-                    f"HTML content too long ({original_html_length} chars), "
-                    f"truncating to {max_html_length} chars "
-                    f"(reduction: {original_html_length - max_html_length} chars, "
-                    f"{(1 - max_html_length / original_html_length) * 100:.1f}%)"
-                )
-                html_content = html_content[:max_html_length]
-
-            # BAML関数を呼び出し
-            logger.info(
-                f"Calling BAML ExtractParliamentaryGroupMembers "
-                f"(text: {len(text_content)} chars, html: {len(html_content)} chars)"
-            )
-            result = await b.ExtractParliamentaryGroupMembers(
-                html_content, text_content
-            )
-            logger.debug(f"BAML returned {len(result)} raw results")
-
-            # BAMLの結果をDTOに変換
-            members_dto = [
-                ExtractedParliamentaryGroupMemberDTO(
-                    name=m.name,
-                    role=m.role,
-                    party_name=m.party_name,
-                    district=m.district,
-                    additional_info=m.additional_info,
-                )
-                for m in result
-            ]
+            async def extract_chunk(
+                chunk: str,
+            ) -> list[ExtractedParliamentaryGroupMemberDTO]:
+                async with llm_rate_limit(BAML_DEFAULT_MODEL, chunk):
+                    result = await b.ExtractParliamentaryGroupMembers("", chunk)
+                logger.debug(f"BAML returned {len(result)} raw results")
+                return [
+                    ExtractedParliamentaryGroupMemberDTO(
+                        name=m.name,
+                        role=m.role,
+                        party_name=m.party_name,
+                        district=m.district,
+                        additional_info=m.additional_info,
+                    )
+                    for m in result
+                ]
+
+            members_dto = await extract_from_chunks(chunks, extract_chunk)
 
             logger.info(
                 f"BAML extraction completed: {len(members_dto)} members extracted"
@@ -230,12 +207,15 @@ class BAMLParliamentaryGroupMemberExtractor(IParliamentaryGroupMemberExtractorSe
             HTMLコンテンツ、エラー時はNone
         """
         try:
-            async with HtmlPageFetcher() as fetcher:
-                pages = await fetcher.fetch_all_pages(url, max_pages=1)
-                if pages:
-                    return pages[0].html_content
-                logger.warning(f"No pages fetched from URL: {url}")
-                return None
+            if self.page_fetcher:
+                page = await self.page_fetcher.fetch_single_page(url)
+            else:
+                async with self._own_page_fetcher as fetcher:
+                    page = await fetcher.fetch_single_page(url)
+            if page:
+                return page.html_content
+            logger.warning(f"No pages fetched from URL: {url}")
+            return None
         except Exception as e:
             logger.error(f"Error fetching HTML from {url}: {str(e)}")
             # より詳細なエラー情報を提供
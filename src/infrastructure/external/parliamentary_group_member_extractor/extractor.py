@@ -15,15 +15,18 @@ import logging
 from typing import TYPE_CHECKING
 
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 
 from src.application.dtos.parliamentary_group_member_dto import (
     ExtractedParliamentaryGroupMemberDTO,
     ParliamentaryGroupMemberAgentResultDTO,
 )
+from src.infrastructure.external.html_compactor import BOILERPLATE_TAGS
 from src.infrastructure.external.parliamentary_group_member_extractor.factory import (
     ParliamentaryGroupMemberExtractorFactory,
 )
+from src.infrastructure.external.static_first_page_fetcher import (
+    StaticFirstPageFetcher,
+)
 
 
 if TYPE_CHECKING:
@@ -36,8 +39,6 @@ logger = logging.getLogger(__name__)
 
 
 # 定数定義
-PAGE_LOAD_TIMEOUT_MS = 30000  # ページ読み込みタイムアウト（ミリ秒）
-DYNAMIC_CONTENT_WAIT_MS = 2000  # 動的コンテンツ読み込み待機時間（ミリ秒）
 MAX_HTML_LENGTH = 50000  # HTMLの最大長（メモリエラー回避用）
 
 
@@ -54,35 +55,34 @@ class ParliamentaryGroupMemberExtractor:
     def __init__(
         self,
         agent: IParliamentaryGroupMemberExtractionAgent | None = None,
+        page_fetcher: StaticFirstPageFetcher | None = None,
     ):
         """初期化する。
 
         Args:
             agent: 議員団メンバー抽出エージェント（省略時はファクトリから作成）
+            page_fetcher: ページの取得に使うフェッチャー（省略時は作成し、
+                このインスタンスのすべての取得で使い回す）
         """
         self._agent = agent or ParliamentaryGroupMemberExtractorFactory.create_agent()
+        self._page_fetcher = page_fetcher or StaticFirstPageFetcher()
         logger.info(
             f"ParliamentaryGroupMemberExtractor initialized "
             f"with {type(self._agent).__name__}"
         )
 
     async def fetch_html(self, url: str) -> str:
-        """URLからHTMLを取得"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
-                await page.goto(
-                    url, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT_MS
-                )
-                await page.wait_for_timeout(DYNAMIC_CONTENT_WAIT_MS)
-                content = await page.content()
-                return content
-            except Exception as e:
-                logger.error(f"Error fetching {url}: {e}")
-                raise
-            finally:
-                await browser.close()
+        """URLからHTMLを取得
+
+        静的HTMLで取得できればブラウザは起動せず、
+        JavaScriptで組み立てるページの場合だけPlaywrightで描画する。
+        """
+        async with self._page_fetcher as fetcher:
+            page = await fetcher.fetch_single_page(url)
+        if page is None:
+            logger.error(f"Error fetching {url}")
+            raise RuntimeError(f"Failed to fetch {url}")
+        return page.html_content
 
     def clean_html(self, html_content: str) -> str:
         """HTMLをクリーニングして不要な要素を削除
@@ -98,29 +98,8 @@ class ParliamentaryGroupMemberExtractor:
         try:
             soup = BeautifulSoup(html_content, "html.parser")
 
-            unwanted_tags = [
-                "script",
-                "style",
-                "nav",
-                "header",
-                "footer",
-                "aside",
-                "iframe",
-                "noscript",
-                "svg",
-                "canvas",
-                "video",
-                "audio",
-                "form",
-                "button",
-                "input",
-                "select",
-                "textarea",
-            ]
-
-            for tag in unwanted_tags:
-                for element in soup.find_all(tag):
-                    element.decompose()
+            for element in soup.find_all(list(BOILERPLATE_TAGS)):
+                element.decompose()
 
             from bs4 import Comment
 
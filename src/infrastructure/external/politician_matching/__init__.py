@@ -6,8 +6,12 @@
 from src.infrastructure.external.politician_matching.baml_politician_matching_service import (  # noqa: E501
     BAMLPoliticianMatchingService,
 )
+from src.infrastructure.external.politician_matching.politician_matching_pipeline import (  # noqa: E501
+    PoliticianMatchingPipeline,
+)
 
 
 __all__ = [
     "BAMLPoliticianMatchingService",
+    "PoliticianMatchingPipeline",
 ]
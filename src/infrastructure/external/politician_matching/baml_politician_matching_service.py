@@ -9,24 +9,46 @@ Clean Architecture準拠:
     - Domain層のValue Object（PoliticianMatch）を戻り値として使用
 """
 
+import asyncio
 import logging
 import re
 
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, NamedTuple
 
 from baml_py.errors import BamlValidationError
 
 from baml_client.async_client import b
+from baml_client.types import SpeakerToMatch
 
 from src.domain.exceptions import ExternalServiceException
 from src.domain.repositories.politician_repository import PoliticianRepository
 from src.domain.services.interfaces.llm_service import ILLMService
-from src.domain.value_objects.politician_match import PoliticianMatch
+from src.domain.services.name_normalizer import get_name_normalizer
+from src.domain.services.name_similarity import PARTY_MATCH_BONUS, NameSimilarityScorer
+from src.domain.services.party_id_resolver import is_same_party_name
+from src.domain.value_objects.politician_match import (
+    PoliticianMatch,
+    PoliticianMatchRequest,
+)
+from src.infrastructure.external.cached_llm_service import SingleFlight
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+class _BatchKey(NamedTuple):
+    """一括マッチングで同一視する発言者の単位"""
+
+    speaker_name: str
+    speaker_type: str | None
+    speaker_party: str | None
+
+
 class BAMLPoliticianMatchingService:
     """BAML-based 発言者-政治家マッチングサービス
 
@@ -36,12 +58,20 @@ class BAMLPoliticianMatchingService:
     特徴:
         - ルールベースマッチング（高速パス）とBAMLマッチングのハイブリッド
         - トークン効率とパース精度の向上
+        - 複数名を共通の候補リストで1回に問い合わせる一括マッチング
     """
 
+    # 一括マッチングで1回のBAML呼び出しに含める最大人数
+    DEFAULT_BATCH_SIZE = 10
+    # 一括マッチングで共有する候補リストの最大件数
+    MAX_BATCH_CANDIDATES = 60
+
     def __init__(
         self,
         llm_service: ILLMService,  # 互換性のため保持（BAML使用時は不要）
         politician_repository: PoliticianRepository,
+        name_similarity_scorer: NameSimilarityScorer | None = None,
+        single_flight: SingleFlight | None = None,
     ):
         """
         Initialize BAML politician matching service
@@ -49,9 +79,14 @@ class BAMLPoliticianMatchingService:
         Args:
             llm_service: 互換性のためのパラメータ（BAML使用時は不要）
             politician_repository: Politician repository instance (domain interface)
+            name_similarity_scorer: 候補の絞り込みに使用する名前の類似度スコアラー
+            single_flight: 同時に実行中の同一マッチングをまとめるSingleFlight
+                （インスタンス間で共有すると、ユースケースをまたいで重複を排除できる）
         """
         self.llm_service = llm_service
         self.politician_repository = politician_repository
+        self.name_similarity_scorer = name_similarity_scorer or NameSimilarityScorer()
+        self._single_flight = single_flight or SingleFlight()
         logger.info("BAMLPoliticianMatchingService 初期化完了")
 
     # 役職のみの発言者名パターン（個人を特定できないためマッチ対象外）
@@ -106,31 +141,32 @@ class BAMLPoliticianMatchingService:
             PoliticianMatch: マッチング結果
         """
         # 役職のみの発言者の場合、マッピングから実名解決を試みる
-        resolved_name = speaker_name
-        if self._is_title_only_speaker(speaker_name):
-            if role_name_mappings and speaker_name in role_name_mappings:
-                resolved_name = role_name_mappings[speaker_name]
-                logger.info(
-                    f"役職'{speaker_name}'を人名'{resolved_name}'に解決（マッピング使用）"
-                )
-            else:
-                # マッピングがない場合は早期リターン（BAML呼び出しをスキップ）
-                logger.debug(
-                    f"役職のみの発言者をスキップ（マッピングなし）: '{speaker_name}'"
-                )
-                return PoliticianMatch(
-                    matched=False,
-                    confidence=0.0,
-                    reason=f"役職名のみでマッピングなし: {speaker_name}",
-                )
+        resolved_name = self._resolve_speaker_name(speaker_name, role_name_mappings)
+        if resolved_name is None:
+            return self._title_only_result(speaker_name)
+
+        # 同じ発言者の同時マッチング（複数の議事録の並行処理など）は1回にまとめる
+        key = self._single_flight_key(resolved_name, speaker_type, speaker_party)
+        return await self._single_flight.do(
+            key,
+            lambda: self._find_best_match_resolved(
+                resolved_name, speaker_type, speaker_party
+            ),
+            operation="match_politician",
+        )
 
+    async def _find_best_match_resolved(
+        self,
+        resolved_name: str,
+        speaker_type: str | None,
+        speaker_party: str | None,
+    ) -> PoliticianMatch:
+        """役職名を解決済みの発言者に最適な政治家マッチを見つける"""
         # 既存の政治家リストを取得
         available_politicians = await self.politician_repository.get_all_for_matching()
 
         if not available_politicians:
-            return PoliticianMatch(
-                matched=False, confidence=0.0, reason="利用可能な政治家リストが空です"
-            )
+            return self._empty_candidates_result()
 
         # まず従来のルールベースマッチングを試行（高速パス）
         # 解決済みの名前を使用
@@ -142,6 +178,177 @@ class BAMLPoliticianMatchingService:
             return rule_based_match
 
         # BAMLによる高度なマッチング
+        return await self._match_with_baml(
+            resolved_name, speaker_type, speaker_party, available_politicians
+        )
+
+    async def find_best_matches(
+        self,
+        requests: Sequence[PoliticianMatchRequest],
+        batch_size: int | None = None,
+        available_politicians: Sequence[dict[str, Any]] | None = None,
+    ) -> list[PoliticianMatch]:
+        """
+        複数の発言者に最適な政治家マッチを一括で見つける
+
+        ルールベースで確定しなかった発言者を所属政党ごとにまとめ、
+        最大batch_size名ずつ共通の候補リストと共に1回のBAML呼び出しで
+        マッチングします。結果は発言者ごとに検証され、欠落・不正な結果の
+        発言者は個別のMatchPolitician呼び出しにフォールバックします。
+
+        Args:
+            requests: マッチング要求のリスト
+            batch_size: 1回のBAML呼び出しでマッチングする最大人数
+                （省略時はDEFAULT_BATCH_SIZE）
+            available_politicians: 候補とする政治家（get_all_for_matching形式）。
+                会議体の名簿などに候補を限定する場合に指定する（省略時は全政治家）
+
+        Returns:
+            list[PoliticianMatch]: requestsと同じ順序のマッチング結果
+        """
+        batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        results: list[PoliticianMatch | None] = [None] * len(requests)
+
+        # 役職名を解決し、BAMLが必要な発言者を重複排除してまとめる
+        resolved: dict[int, str] = {}
+        for index, request in enumerate(requests):
+            resolved_name = self._resolve_speaker_name(
+                request.speaker_name, request.role_name_mappings
+            )
+            if resolved_name is None:
+                results[index] = self._title_only_result(request.speaker_name)
+            else:
+                resolved[index] = resolved_name
+
+        if resolved:
+            available_politicians = (
+                list(available_politicians)
+                if available_politicians is not None
+                else await self.politician_repository.get_all_for_matching()
+            )
+            if not available_politicians:
+                for index in resolved:
+                    results[index] = self._empty_candidates_result()
+            else:
+                # 同名・同条件の発言者は1件にまとめてBAMLに問い合わせる
+                pending: dict[_BatchKey, list[int]] = {}
+                for index, resolved_name in resolved.items():
+                    request = requests[index]
+                    rule_based_match = self._rule_based_matching(
+                        resolved_name, request.speaker_party, available_politicians
+                    )
+                    if rule_based_match.matched and rule_based_match.confidence >= 0.9:
+                        results[index] = rule_based_match
+                        continue
+                    key = _BatchKey(
+                        resolved_name, request.speaker_type, request.speaker_party
+                    )
+                    pending.setdefault(key, []).append(index)
+
+                # 同じ政党の候補集合を共有する発言者ごとにグループ化して分割する
+                groups: dict[str | None, list[_BatchKey]] = {}
+                for key in pending:
+                    groups.setdefault(key.speaker_party, []).append(key)
+                chunks: list[list[_BatchKey]] = []
+                for keys in groups.values():
+                    chunks.extend(
+                        keys[i : i + batch_size]
+                        for i in range(0, len(keys), batch_size)
+                    )
+
+                chunk_results = await asyncio.gather(
+                    *(
+                        self._match_batch_with_baml(chunk, available_politicians)
+                        for chunk in chunks
+                    )
+                )
+                for chunk_result in chunk_results:
+                    for key, match_result in chunk_result.items():
+                        for index in pending[key]:
+                            results[index] = match_result
+
+        return [
+            result
+            if result is not None
+            else PoliticianMatch(matched=False, confidence=0.0, reason="結果なし")
+            for result in results
+        ]
+
+    @staticmethod
+    def _single_flight_key(
+        speaker_name: str, speaker_type: str | None, speaker_party: str | None
+    ) -> str:
+        """同一のマッチング要求とみなすキー（正規化した名前・種別・政党）"""
+        normalizer = get_name_normalizer()
+        party = normalizer.fold(speaker_party).strip() if speaker_party else ""
+        return "\x1f".join(
+            (
+                "match_politician",
+                normalizer.normalize(speaker_name),
+                speaker_type or "",
+                party,
+            )
+        )
+
+    def _resolve_speaker_name(
+        self, speaker_name: str, role_name_mappings: dict[str, str] | None
+    ) -> str | None:
+        """役職のみの発言者名を実名に解決する
+
+        Returns:
+            str | None: 解決済みの名前。役職のみでマッピングがない場合はNone
+        """
+        if not self._is_title_only_speaker(speaker_name):
+            return speaker_name
+        if role_name_mappings and speaker_name in role_name_mappings:
+            resolved_name = role_name_mappings[speaker_name]
+            logger.info(
+                f"役職'{speaker_name}'を人名'{resolved_name}'に解決（マッピング使用）"
+            )
+            return resolved_name
+        # マッピングがない場合はBAML呼び出しをスキップ
+        logger.debug(f"役職のみの発言者をスキップ（マッピングなし）: '{speaker_name}'")
+        return None
+
+    @staticmethod
+    def _title_only_result(speaker_name: str) -> PoliticianMatch:
+        return PoliticianMatch(
+            matched=False,
+            confidence=0.0,
+            reason=f"役職名のみでマッピングなし: {speaker_name}",
+        )
+
+    @staticmethod
+    def _empty_candidates_result() -> PoliticianMatch:
+        return PoliticianMatch(
+            matched=False, confidence=0.0, reason="利用可能な政治家リストが空です"
+        )
+
+    @staticmethod
+    def _apply_confidence_threshold(match_result: PoliticianMatch) -> PoliticianMatch:
+        """信頼度が低い場合はマッチしないとして扱う"""
+        if match_result.confidence >= 0.7:
+            return match_result
+        return PoliticianMatch(
+            matched=False,
+            politician_id=None,
+            politician_name=None,
+            political_party_name=None,
+            confidence=match_result.confidence,
+            reason=match_result.reason,
+        )
+
+    async def _match_with_baml(
+        self,
+        resolved_name: str,
+        speaker_type: str | None,
+        speaker_party: str | None,
+        available_politicians: list[dict[str, Any]],
+    ) -> PoliticianMatch:
+        """1名分のBAMLマッチング（MatchPolitician）を実行する"""
         try:
             # 候補を絞り込み（パフォーマンス向上のため）
             # 解決済みの名前を使用
@@ -150,35 +357,30 @@ class BAMLPoliticianMatchingService:
             )
 
             # BAML関数を呼び出し（解決済みの名前を使用）
-            baml_result = await b.MatchPolitician(
-                speaker_name=resolved_name,
-                speaker_type=speaker_type or "不明",
-                speaker_party=speaker_party or "不明",
-                available_politicians=self._format_politicians_for_llm(
-                    filtered_politicians
-                ),
+            formatted_politicians = self._format_politicians_for_llm(
+                filtered_politicians
             )
+            async with llm_rate_limit(
+                BAML_DEFAULT_MODEL, resolved_name, formatted_politicians
+            ):
+                baml_result = await b.MatchPolitician(
+                    speaker_name=resolved_name,
+                    speaker_type=speaker_type or "不明",
+                    speaker_party=speaker_party or "不明",
+                    available_politicians=formatted_politicians,
+                )
 
             # BAML結果をPoliticianMatchに変換
-            match_result = PoliticianMatch(
-                matched=baml_result.matched,
-                politician_id=baml_result.politician_id,
-                politician_name=baml_result.politician_name,
-                political_party_name=baml_result.political_party_name,
-                confidence=baml_result.confidence,
-                reason=baml_result.reason,
-            )
-
-            # 信頼度が低い場合はマッチしないとして扱う
-            if match_result.confidence < 0.7:
-                match_result = PoliticianMatch(
-                    matched=False,
-                    politician_id=None,
-                    politician_name=None,
-                    political_party_name=None,
-                    confidence=match_result.confidence,
-                    reason=match_result.reason,
+            match_result = self._apply_confidence_threshold(
+                PoliticianMatch(
+                    matched=baml_result.matched,
+                    politician_id=baml_result.politician_id,
+                    politician_name=baml_result.politician_name,
+                    political_party_name=baml_result.political_party_name,
+                    confidence=baml_result.confidence,
+                    reason=baml_result.reason,
                 )
+            )
 
             logger.info(
                 f"BAMLマッチング結果: '{resolved_name}' - "
@@ -210,6 +412,129 @@ class BAMLPoliticianMatchingService:
                 reason=f"政治家マッチング中にエラーが発生しました: {e}",
             ) from e
 
+    async def _match_batch_with_baml(
+        self,
+        keys: list[_BatchKey],
+        available_politicians: list[dict[str, Any]],
+    ) -> dict[_BatchKey, PoliticianMatch]:
+        """複数名分のBAMLマッチング（MatchPoliticiansBatch）を実行する
+
+        各発言者の絞り込み候補の和集合を共通の候補リストとして1回で問い合わせ、
+        発言者ごとに結果を検証します。検証に失敗した発言者、
+        またはバッチ呼び出し自体が失敗した場合は個別呼び出しにフォールバックします。
+        """
+        if len(keys) == 1:
+            key = keys[0]
+            return {
+                key: await self._match_with_baml(
+                    key.speaker_name,
+                    key.speaker_type,
+                    key.speaker_party,
+                    available_politicians,
+                )
+            }
+
+        candidates = self._merge_candidates(
+            [
+                self._filter_candidates(
+                    key.speaker_name, key.speaker_party, available_politicians
+                )
+                for key in keys
+            ]
+        )
+        candidate_ids = {candidate["id"] for candidate in candidates}
+        formatted_politicians = self._format_politicians_for_llm(candidates)
+        speakers = [
+            SpeakerToMatch(
+                key=str(position),
+                speaker_name=key.speaker_name,
+                speaker_type=key.speaker_type or "不明",
+                speaker_party=key.speaker_party or "不明",
+            )
+            for position, key in enumerate(keys)
+        ]
+
+        results: dict[_BatchKey, PoliticianMatch] = {}
+        try:
+            async with llm_rate_limit(
+                BAML_DEFAULT_MODEL,
+                *(key.speaker_name for key in keys),
+                formatted_politicians,
+            ):
+                batch_results = await b.MatchPoliticiansBatch(
+                    speakers=speakers, available_politicians=formatted_politicians
+                )
+        except Exception as e:
+            logger.warning(
+                f"BAML一括マッチング失敗（{len(keys)}名）: {e}. "
+                "個別マッチングにフォールバックします。"
+            )
+            batch_results = []
+
+        for batch_result in batch_results:
+            position = self._validate_batch_result(
+                batch_result, len(keys), candidate_ids
+            )
+            if position is None or keys[position] in results:
+                continue
+            results[keys[position]] = self._apply_confidence_threshold(
+                PoliticianMatch(
+                    matched=batch_result.matched,
+                    politician_id=batch_result.politician_id,
+                    politician_name=batch_result.politician_name,
+                    political_party_name=batch_result.political_party_name,
+                    confidence=batch_result.confidence,
+                    reason=batch_result.reason,
+                )
+            )
+
+        missing = [key for key in keys if key not in results]
+        logger.info(
+            f"BAML一括マッチング結果: {len(keys) - len(missing)}/{len(keys)}名を解決"
+        )
+        for key in missing:
+            results[key] = await self._match_with_baml(
+                key.speaker_name,
+                key.speaker_type,
+                key.speaker_party,
+                available_politicians,
+            )
+        return results
+
+    @staticmethod
+    def _validate_batch_result(
+        batch_result: Any, batch_length: int, candidate_ids: set[int]
+    ) -> int | None:
+        """一括マッチング結果1件を検証し、対応する発言者の位置を返す
+
+        Returns:
+            int | None: 有効な結果の場合は発言者の位置、無効な場合はNone
+        """
+        try:
+            position = int(batch_result.key)
+        except (TypeError, ValueError):
+            return None
+        if not 0 <= position < batch_length:
+            return None
+        if not 0.0 <= batch_result.confidence <= 1.0:
+            return None
+        if batch_result.matched and batch_result.politician_id not in candidate_ids:
+            return None
+        return position
+
+    def _merge_candidates(
+        self, candidate_lists: list[list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """発言者ごとの絞り込み候補を重複なく1つの候補リストにまとめる"""
+        merged: dict[int, dict[str, Any]] = {}
+        for candidates in candidate_lists:
+            for candidate in candidates:
+                existing = merged.get(candidate["id"])
+                if existing is None or candidate["score"] > existing["score"]:
+                    merged[candidate["id"]] = candidate
+        ordered = sorted(merged.values(), key=lambda x: x["score"], reverse=True)
+        return ordered[: self.MAX_BATCH_CANDIDATES]
+
     def _rule_based_matching(
         self,
         speaker_name: str,
@@ -272,45 +597,27 @@ class BAMLPoliticianMatchingService:
         available_politicians: list[dict[str, Any]],
         max_candidates: int = 20,
     ) -> list[dict[str, Any]]:
-        """候補を絞り込む（LLMの処理効率向上のため）"""
-        candidates: list[dict[str, Any]] = []
-
-        # 敬称を除去
-        cleaned_name = re.sub(r"(議員|氏|さん|様|先生)$", "", speaker_name)
-
-        for politician in available_politicians:
-            score = 0
-
-            # 完全一致
-            if politician["name"] == speaker_name:
-                score += 10
-
-            # 敬称除去後の一致
-            if politician["name"] == cleaned_name:
-                score += 8
+        """候補を絞り込む（LLMの処理効率向上のため）
 
-            # 部分一致
-            if politician["name"] in speaker_name or speaker_name in politician["name"]:
-                score += 5
-
-            # 政党一致
-            if speaker_party and politician["party_name"] == speaker_party:
-                score += 3
-
-            # 姓または名の一致（スペースで分割）
-            speaker_parts = speaker_name.split()
-            politician_parts = politician["name"].split()
-            for sp in speaker_parts:
-                if sp in politician_parts:
-                    score += 2
-
-            # 文字列長の類似性
-            len_diff = abs(len(politician["name"]) - len(speaker_name))
-            if len_diff <= 2:
-                score += 1
+        全候補との名前の類似度を一括で計算し、所属政党が一致する候補に
+        加点した上で、スコアの高い順にmax_candidates件を返します。
+        読み仮名の表記（「ヤマダタロウ」など）は文字列として類似しないため、
+        類似度が0の候補も除外せず、LLMの判断に委ねます。
+        """
+        scores = self.name_similarity_scorer.score_many(
+            speaker_name, [politician["name"] for politician in available_politicians]
+        )
 
-            if score > 0:
-                candidates.append({**politician, "score": score})
+        candidates: list[dict[str, Any]] = []
+        for politician, score in zip(available_politicians, scores, strict=True):
+            # 政党一致（略称を含む）
+            if (
+                speaker_party
+                and politician["party_name"]
+                and is_same_party_name(speaker_party, politician["party_name"])
+            ):
+                score += PARTY_MATCH_BONUS
+            candidates.append({**politician, "score": score})
 
         # スコア順にソート
         candidates.sort(key=lambda x: x["score"], reverse=True)
@@ -0,0 +1,393 @@
+"""Deterministic politician matching pipeline
+
+このモジュールは、発言者と政治家のマッチングを固定の手順で実行します。
+LLMにツール呼び出しを計画させるReActエージェントの代わりに、
+コードで決めた順序で候補検索・所属情報の取得・BAMLによる判定を行い、
+正規化後の名前が一致する候補が1名に定まる場合はLLMを呼び出しません。
+
+処理の流れ:
+    1. 役職名のみの発言者を除外
+    2. 候補検索（全政治家との名前の類似度を一括計算し、政党一致に加点）
+    3. 正規化後の名前が一致する候補が1名ならLLMなしで確定（早期終了）
+    4. 上位候補の所属情報を1回のクエリでまとめて取得
+    5. BAML（MatchPolitician）で最終判定
+"""
+
+import logging
+
+from typing import Any
+
+from baml_client.async_client import b
+
+from src.application.dtos.politician_matching_dto import PoliticianMatchingAgentResult
+from src.domain.entities.politician_affiliation import PoliticianAffiliation
+from src.domain.interfaces.politician_matching_agent import IPoliticianMatchingAgent
+from src.domain.repositories.politician_affiliation_repository import (
+    PoliticianAffiliationRepository,
+)
+from src.domain.repositories.politician_repository import PoliticianRepository
+from src.domain.services.name_similarity import PARTY_MATCH_BONUS, NameSimilarityScorer
+from src.domain.services.party_id_resolver import is_same_party_name
+from src.infrastructure.external.politician_matching.baml_politician_matching_service import (  # noqa: E501
+    BAMLPoliticianMatchingService,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# 信頼度閾値
+CONFIDENCE_THRESHOLD = 0.7
+
+# BAMLに渡す最大候補数
+MAX_CANDIDATES = 20
+
+# 早期終了時の信頼度（名前と政党が一致 / 名前のみ一致）
+EXACT_NAME_AND_PARTY_CONFIDENCE = 1.0
+EXACT_NAME_CONFIDENCE = 0.9
+
+
+class PoliticianMatchingPipeline(IPoliticianMatchingAgent):
+    """固定手順による政治家マッチングパイプライン
+
+    候補検索・所属情報の取得・BAMLによる判定を決まった順序で1回ずつ実行します。
+    LLMの呼び出しは最大1回（MatchPolitician）で、正規化後の名前が一致する
+    候補が1名に定まる場合は0回です。
+
+    政治家一覧はインスタンスごとに1回だけ取得して再利用し、
+    候補の所属情報は候補集合ごとに1回のクエリでまとめて取得します。
+
+    Attributes:
+        politician_repo: 政治家リポジトリ
+        affiliation_repo: 政治家所属リポジトリ
+        name_similarity_scorer: 候補検索に使用する名前の類似度スコアラー
+        max_candidates: BAMLに渡す最大候補数
+    """
+
+    def __init__(
+        self,
+        politician_repo: PoliticianRepository,
+        affiliation_repo: PoliticianAffiliationRepository,
+        name_similarity_scorer: NameSimilarityScorer | None = None,
+        max_candidates: int = MAX_CANDIDATES,
+    ):
+        """パイプラインを初期化
+
+        Args:
+            politician_repo: PoliticianRepository（必須）
+            affiliation_repo: PoliticianAffiliationRepository（必須）
+            name_similarity_scorer: 名前の類似度スコアラー
+            max_candidates: BAMLに渡す最大候補数
+
+        Raises:
+            ValueError: リポジトリがNoneの場合
+        """
+        if politician_repo is None:
+            raise ValueError("politician_repo is required")
+        if affiliation_repo is None:
+            raise ValueError("affiliation_repo is required")
+
+        self.politician_repo = politician_repo
+        self.affiliation_repo = affiliation_repo
+        self.name_similarity_scorer = name_similarity_scorer or NameSimilarityScorer()
+        self.max_candidates = max_candidates
+        self._politicians: list[dict[str, Any]] | None = None
+
+    async def match_politician(
+        self,
+        speaker_name: str,
+        speaker_type: str | None = None,
+        speaker_party: str | None = None,
+    ) -> PoliticianMatchingAgentResult:
+        """発言者と政治家をマッチング
+
+        Args:
+            speaker_name: マッチングする発言者名
+            speaker_type: 発言者の種別（例: "議員", "委員"など）
+            speaker_party: 発言者の所属政党（もしあれば）
+
+        Returns:
+            PoliticianMatchingAgentResult: マッチング結果
+        """
+        logger.info(
+            f"Starting politician matching for '{speaker_name}' "
+            f"(type={speaker_type}, party={speaker_party})"
+        )
+
+        speaker_name = (speaker_name or "").strip()
+        if not speaker_name:
+            return self._no_match("発言者名が空です")
+        if speaker_name in BAMLPoliticianMatchingService.TITLE_ONLY_PATTERNS:
+            return self._no_match(
+                f"役職名のみのため個人を特定できません: {speaker_name}"
+            )
+
+        try:
+            candidates = await self._search_candidates(speaker_name, speaker_party)
+            if not candidates:
+                return self._no_match("利用可能な政治家リストが空です")
+
+            exact_match = self._find_exact_match(
+                speaker_name, speaker_party, candidates
+            )
+            if exact_match is not None:
+                logger.info(f"Exact name match for '{speaker_name}' (LLM skipped)")
+                return exact_match
+
+            affiliations = await self._get_affiliations(
+                [candidate["id"] for candidate in candidates]
+            )
+            return await self._match_with_baml(
+                speaker_name,
+                speaker_type,
+                speaker_party,
+                candidates,
+                affiliations,
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Error during politician matching: {str(e)}",
+                exc_info=True,
+            )
+            return PoliticianMatchingAgentResult(
+                matched=False,
+                politician_id=None,
+                politician_name=None,
+                political_party_name=None,
+                confidence=0.0,
+                reason="",
+                error_message=f"マッチング中にエラーが発生しました: {str(e)}",
+            )
+
+    async def _get_politicians(self) -> list[dict[str, Any]]:
+        """政治家一覧を取得する（インスタンス内で1回だけ問い合わせる）"""
+        if self._politicians is None:
+            politicians = await self.politician_repo.get_all_for_matching()
+            self._politicians = [
+                politician
+                for politician in politicians
+                if politician.get("id") is not None and politician.get("name")
+            ]
+        return self._politicians
+
+    async def _search_candidates(
+        self, speaker_name: str, speaker_party: str | None
+    ) -> list[dict[str, Any]]:
+        """全政治家との名前の類似度を一括計算し、上位候補を返す
+
+        所属政党が一致する（略称を含む）候補に加点します。読み仮名の表記は
+        文字列として類似しないため、類似度が0の候補も除外せずBAMLの判断に委ねます。
+        各候補には類似度（score）と正規化後の名前の一致（exact）を付与します。
+        """
+        politicians = await self._get_politicians()
+        if not politicians:
+            return []
+
+        names = [politician["name"] for politician in politicians]
+        scores = self.name_similarity_scorer.score_many(speaker_name, names)
+        normalizer = self.name_similarity_scorer.name_normalizer
+        normalized_speaker = normalizer.normalize(speaker_name)
+        normalized_names = normalizer.normalize_many(names)
+
+        candidates: list[dict[str, Any]] = []
+        for politician, score, normalized_name in zip(
+            politicians, scores, normalized_names, strict=True
+        ):
+            party_matches = self._party_matches(speaker_party, politician)
+            if party_matches:
+                score += PARTY_MATCH_BONUS
+            candidates.append(
+                {
+                    **politician,
+                    "score": score,
+                    "exact": bool(normalized_speaker)
+                    and normalized_name == normalized_speaker,
+                    "party_matches": party_matches,
+                }
+            )
+
+        candidates.sort(key=lambda x: x["score"], reverse=True)
+        return candidates[: self.max_candidates]
+
+    def _find_exact_match(
+        self,
+        speaker_name: str,
+        speaker_party: str | None,
+        candidates: list[dict[str, Any]],
+    ) -> PoliticianMatchingAgentResult | None:
+        """正規化後の名前が一致する候補が1名に定まる場合はその候補で確定する
+
+        同姓同名の候補が複数いる場合は、所属政党が一致する候補が1名のときに限り
+        確定します。発言者の政党が分かっていて候補の政党と食い違う場合は
+        確定せず、BAMLの判定に委ねます。
+        """
+        exact = [candidate for candidate in candidates if candidate["exact"]]
+        if not exact:
+            return None
+
+        same_party = [candidate for candidate in exact if candidate["party_matches"]]
+        if len(same_party) == 1:
+            return self._matched(
+                same_party[0],
+                EXACT_NAME_AND_PARTY_CONFIDENCE,
+                f"名前と政党が一致: {speaker_name}",
+            )
+
+        if len(exact) == 1:
+            candidate = exact[0]
+            if speaker_party and candidate.get("party_name"):
+                # 政党が食い違う（移籍などの可能性があるためLLMで判定する）
+                return None
+            return self._matched(
+                candidate,
+                EXACT_NAME_CONFIDENCE,
+                f"名前が一致（唯一の候補）: {speaker_name}",
+            )
+
+        return None
+
+    async def _get_affiliations(
+        self, politician_ids: list[int]
+    ) -> dict[int, list[PoliticianAffiliation]]:
+        """候補全員の所属情報を1回のクエリで取得する
+
+        所属情報は判定の補助情報のため、取得に失敗した場合は所属情報なしで続行します。
+        """
+        grouped: dict[int, list[PoliticianAffiliation]] = {}
+        try:
+            affiliations = await self.affiliation_repo.get_by_politicians(
+                politician_ids
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get affiliation info: {e}")
+            return grouped
+
+        for affiliation in affiliations:
+            grouped.setdefault(affiliation.politician_id, []).append(affiliation)
+        return grouped
+
+    async def _match_with_baml(
+        self,
+        speaker_name: str,
+        speaker_type: str | None,
+        speaker_party: str | None,
+        candidates: list[dict[str, Any]],
+        affiliations: dict[int, list[PoliticianAffiliation]],
+    ) -> PoliticianMatchingAgentResult:
+        """BAML（MatchPolitician）で候補から1名を判定する
+
+        候補外の政治家IDが返された場合や信頼度が閾値未満の場合はマッチなしとします。
+        """
+        available_politicians = self._format_candidates(candidates, affiliations)
+
+        logger.info(f"Calling BAML MatchPolitician for speaker='{speaker_name}'")
+        async with llm_rate_limit(
+            BAML_DEFAULT_MODEL, speaker_name, available_politicians
+        ):
+            baml_result = await b.MatchPolitician(
+                speaker_name=speaker_name,
+                speaker_type=speaker_type or "不明",
+                speaker_party=speaker_party or "不明",
+                available_politicians=available_politicians,
+            )
+
+        if not baml_result.matched:
+            return self._no_match(baml_result.reason, baml_result.confidence)
+
+        candidate = next(
+            (c for c in candidates if c["id"] == baml_result.politician_id), None
+        )
+        if candidate is None:
+            logger.warning(
+                f"BAML returned a politician outside the candidates: "
+                f"{baml_result.politician_id}"
+            )
+            return self._no_match(
+                f"候補外の政治家が返されました: {baml_result.politician_id}",
+                baml_result.confidence,
+            )
+        if baml_result.confidence < CONFIDENCE_THRESHOLD:
+            return self._no_match(baml_result.reason, baml_result.confidence)
+
+        logger.info(
+            f"Politician matching completed successfully with "
+            f"confidence={baml_result.confidence}"
+        )
+        return self._matched(candidate, baml_result.confidence, baml_result.reason)
+
+    def _party_matches(
+        self, speaker_party: str | None, politician: dict[str, Any]
+    ) -> bool:
+        party_name = politician.get("party_name")
+        return bool(
+            speaker_party
+            and party_name
+            and is_same_party_name(
+                speaker_party, party_name, self.name_similarity_scorer.name_normalizer
+            )
+        )
+
+    @staticmethod
+    def _format_candidates(
+        candidates: list[dict[str, Any]],
+        affiliations: dict[int, list[PoliticianAffiliation]],
+    ) -> str:
+        """候補と所属情報をLLM用にフォーマット"""
+        formatted: list[str] = []
+        for candidate in candidates:
+            info = f"ID: {candidate['id']}, 名前: {candidate['name']}"
+            if candidate.get("party_name"):
+                info += f", 政党: {candidate['party_name']}"
+            if candidate.get("party_position"):
+                info += f", 役職: {candidate['party_position']}"
+            if candidate.get("district"):
+                info += f", 選挙区: {candidate['district']}"
+            candidate_affiliations = affiliations.get(candidate["id"], [])
+            if candidate_affiliations:
+                info += ", 所属会議体: " + "、".join(
+                    PoliticianMatchingPipeline._format_affiliation(affiliation)
+                    for affiliation in candidate_affiliations
+                )
+            formatted.append(info)
+        return "\n".join(formatted)
+
+    @staticmethod
+    def _format_affiliation(affiliation: PoliticianAffiliation) -> str:
+        details = [affiliation.role] if affiliation.role else []
+        if affiliation.start_date:
+            details.append(f"{affiliation.start_date.isoformat()}〜")
+        suffix = f"（{'、'.join(details)}）" if details else ""
+        return f"会議体ID {affiliation.conference_id}{suffix}"
+
+    @staticmethod
+    def _matched(
+        candidate: dict[str, Any], confidence: float, reason: str
+    ) -> PoliticianMatchingAgentResult:
+        return PoliticianMatchingAgentResult(
+            matched=True,
+            politician_id=candidate["id"],
+            politician_name=candidate["name"],
+            political_party_name=candidate.get("party_name"),
+            confidence=confidence,
+            reason=reason,
+            error_message=None,
+        )
+
+    @staticmethod
+    def _no_match(
+        reason: str = "マッチする政治家が見つかりませんでした",
+        confidence: float = 0.0,
+    ) -> PoliticianMatchingAgentResult:
+        return PoliticianMatchingAgentResult(
+            matched=False,
+            politician_id=None,
+            politician_name=None,
+            political_party_name=None,
+            confidence=confidence,
+            reason=reason,
+            error_message=None,
+        )
@@ -0,0 +1,215 @@
+"""In-process registry of active prompt versions."""
+
+import asyncio
+import logging
+import re
+import string
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from src.domain.entities.prompt_version import PromptVersion
+from src.domain.repositories.prompt_version_repository import PromptVersionRepository
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0  # Safety net when change notifications are missed
+RETRY_SECONDS = 30.0  # Wait before retrying a failed load
+
+_FIELD_ROOT_PATTERN = re.compile(r"[.\[]")
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """A prompt version whose template has been parsed once.
+
+    Attributes:
+        version: The active prompt version
+        required_variables: Top-level variable names referenced by the template
+    """
+
+    version: PromptVersion
+    required_variables: frozenset[str]
+
+    @classmethod
+    def compile(cls, version: PromptVersion) -> "CompiledPrompt":
+        """Parse the template's replacement fields.
+
+        Unlike PromptVersion.extract_variables(), escaped braces such as
+        ``{{"matched": true}}`` are not treated as variables.
+
+        Args:
+            version: Prompt version to compile
+
+        Returns:
+            Compiled prompt
+
+        Raises:
+            ValueError: If the template is not a valid format string
+        """
+        required = frozenset(
+            _FIELD_ROOT_PATTERN.split(field_name, maxsplit=1)[0]
+            for _, field_name, _, _ in string.Formatter().parse(version.template)
+            if field_name is not None
+        )
+        return cls(version=version, required_variables=required)
+
+    def format(self, variables: dict[str, Any]) -> str:
+        """Format the template with provided variables.
+
+        Args:
+            variables: Dictionary of variable names and values
+
+        Returns:
+            Formatted prompt string
+
+        Raises:
+            ValueError: If required variables are missing
+        """
+        missing = self.required_variables.difference(variables)
+        if missing:
+            raise ValueError(f"Missing required variables: {sorted(missing)}")
+        return self.version.template.format(**variables)
+
+
+class PromptChangeListener(Protocol):
+    """Invalidates a registry when active prompt versions change elsewhere."""
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether change notifications are currently being received."""
+        ...
+
+    async def start(self) -> None:
+        """Start receiving change notifications."""
+        ...
+
+
+class PromptRegistry:
+    """Caches all active prompt versions with a fetch-time TTL.
+
+    All active versions are loaded with a single repository call, so prompt
+    lookups do not touch the database until the cache expires or is
+    invalidated. Keys without an active version are cached as misses too.
+
+    If a change listener is given, it is started before the first load and
+    restarted before a reload whenever it is not listening, so changes made
+    by other processes invalidate the cache without waiting for the TTL.
+    """
+
+    def __init__(
+        self,
+        repository: PromptVersionRepository,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        change_listener_factory: Callable[["PromptRegistry"], PromptChangeListener]
+        | None = None,
+    ):
+        """Initialize prompt registry.
+
+        Args:
+            repository: Prompt version repository to load active versions from
+            ttl_seconds: Seconds after a load before the cache is reloaded
+            clock: Monotonic clock returning seconds
+            change_listener_factory: Creates the listener that invalidates this
+                registry on changes from other processes (TTL only if omitted)
+        """
+        self.repository = repository
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._prompts: dict[str, CompiledPrompt] = {}
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self.change_listener = (
+            change_listener_factory(self) if change_listener_factory else None
+        )
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the cache can be served without reloading."""
+        return self._clock() < self._expires_at
+
+    async def get(self, prompt_key: str) -> CompiledPrompt | None:
+        """Get the compiled active version of a prompt.
+
+        Args:
+            prompt_key: Key identifying the prompt
+
+        Returns:
+            Compiled prompt or None if the prompt has no active version
+        """
+        if not self.is_fresh:
+            async with self._lock:
+                # Another caller may have reloaded while we waited
+                if not self.is_fresh:
+                    await self._ensure_listening()
+                    await self.refresh()
+        return self._prompts.get(prompt_key)
+
+    async def _ensure_listening(self) -> None:
+        """Start the change listener if it is not listening.
+
+        On failure the registry keeps working and relies on the TTL.
+        """
+        if self.change_listener is None or self.change_listener.is_listening:
+            return
+        try:
+            await self.change_listener.start()
+        except Exception as e:
+            logger.warning(f"Failed to listen for prompt version changes: {e}")
+
+    async def refresh(self) -> None:
+        """Reload all active prompt versions from the repository.
+
+        On failure the previously loaded prompts are kept and the load is
+        retried after RETRY_SECONDS.
+        """
+        generation = self._generation
+        try:
+            versions = await self.repository.get_all_active_versions()
+        except Exception as e:
+            logger.error(f"Failed to load active prompt versions: {e}")
+            self._expires_at = self._clock() + min(self.ttl_seconds, RETRY_SECONDS)
+            return
+
+        prompts: dict[str, CompiledPrompt] = {}
+        for version in versions:
+            try:
+                prompts[version.prompt_key] = CompiledPrompt.compile(version)
+            except ValueError as e:
+                logger.error(
+                    f"Invalid template for prompt {version.prompt_key}:"
+                    f"{version.version}: {e}"
+                )
+        self._prompts = prompts
+
+        # An invalidation or put during the load may not be reflected in it
+        if generation == self._generation:
+            self._expires_at = self._clock() + self.ttl_seconds
+        logger.info(f"Loaded {len(prompts)} active prompt versions")
+
+    def put(self, version: PromptVersion) -> None:
+        """Register a version that has just been activated in this process.
+
+        A load already in flight may not include the version and would replace
+        it, so the cache is left stale after that load.
+
+        Args:
+            version: The newly active prompt version
+        """
+        self._generation += 1
+        self._prompts[version.prompt_key] = CompiledPrompt.compile(version)
+
+    def invalidate(self) -> None:
+        """Mark the cache stale so the next lookup reloads it."""
+        self._generation += 1
+        self._expires_at = 0.0
+
+    def clear(self) -> None:
+        """Drop all cached prompts and mark the cache stale."""
+        self._prompts = {}
+        self.invalidate()
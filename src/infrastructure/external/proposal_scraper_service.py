@@ -1,12 +1,10 @@
 """Implementation of proposal scraping service using LLM for flexible extraction."""
 
-import asyncio
 import json
 
 from typing import Any
 
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.services.interfaces.proposal_scraper_service import (
@@ -17,20 +15,31 @@ from src.infrastructure.constants.scraper_prompts import (
     PROPOSAL_EXTRACTION_PROMPT,
     PROPOSAL_EXTRACTION_SYSTEM_PROMPT,
 )
+from src.infrastructure.external.static_first_page_fetcher import (
+    StaticFirstPageFetcher,
+)
 
 
 class ProposalScraperService(IProposalScraperService):
     """Service for scraping proposal from Japanese government websites using LLM."""
 
-    def __init__(self, llm_service: ILLMService, headless: bool = True):
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        headless: bool = True,
+        page_fetcher: StaticFirstPageFetcher | None = None,
+    ):
         """Initialize the scraper service.
 
         Args:
             llm_service: LLM service for content extraction
             headless: Whether to run browser in headless mode
+            page_fetcher: Fetcher reused for every page this service scrapes
+                (created from headless when omitted)
         """
         self.llm_service = llm_service
         self.headless = headless
+        self.page_fetcher = page_fetcher or StaticFirstPageFetcher(headless=headless)
 
     def is_supported_url(self, url: str) -> bool:
         """Check if the given URL is supported by this scraper.
@@ -71,68 +80,59 @@ class ProposalScraperService(IProposalScraperService):
         Returns:
             Dictionary containing scraped proposal information
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            page = await browser.new_page()
-
+        try:
+            async with self.page_fetcher as fetcher:
+                page = await fetcher.fetch_single_page(url)
+            if page is None:
+                raise RuntimeError("page could not be fetched")
+            content = page.html_content
+
+            soup = BeautifulSoup(content, "html.parser")
+
+            # Get text content from the page
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
+
+            # Get text content
+            text_content = soup.get_text(separator="\n", strip=True)
+
+            # Limit text content to avoid token limits
+            max_chars = 10000
+            if len(text_content) > max_chars:
+                text_content = text_content[:max_chars] + "..."
+
+            # Use LLM to extract proposal information
+            extraction_prompt = PROPOSAL_EXTRACTION_PROMPT.format(
+                url=url, text_content=text_content
+            )
+
+            # Call LLM to extract information
+            messages = [
+                {"role": "system", "content": PROPOSAL_EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": extraction_prompt},
+            ]
+
+            llm_response = await self.llm_service.ainvoke_llm(messages)
+
+            # Parse the LLM response
+            extracted_data: dict[str, Any]
             try:
-                await page.goto(url, wait_until="networkidle")
-                await asyncio.sleep(1)  # Wait for dynamic content
-
-                # Get the page content
-                content = await page.content()
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Get text content from the page
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-
-                # Get text content
-                text_content = soup.get_text(separator="\n", strip=True)
-
-                # Limit text content to avoid token limits
-                max_chars = 10000
-                if len(text_content) > max_chars:
-                    text_content = text_content[:max_chars] + "..."
-
-                # Use LLM to extract proposal information
-                extraction_prompt = PROPOSAL_EXTRACTION_PROMPT.format(
-                    url=url, text_content=text_content
-                )
-
-                # Call LLM to extract information
-                messages = [
-                    {"role": "system", "content": PROPOSAL_EXTRACTION_SYSTEM_PROMPT},
-                    {"role": "user", "content": extraction_prompt},
-                ]
-
-                llm_response = self.llm_service.invoke_llm(messages)
-
-                # Parse the LLM response
-                extracted_data: dict[str, Any]
-                try:
-                    # Try to parse as JSON
-                    extracted_data = json.loads(llm_response)
-                except json.JSONDecodeError:
-                    # If not valid JSON, try to extract from the text response
-                    extracted_data = {"title": ""}
-                    # Simple fallback extraction from LLM text response
-                    if "title:" in llm_response:
-                        title_match = (
-                            llm_response.split("title:")[1].split("\n")[0].strip()
-                        )
-                        extracted_data["title"] = title_match.strip('"').strip()
-
-                # Build the proposal data
-                return ScrapedProposal(
-                    url=url,
-                    title=str(extracted_data.get("title", "")),
-                )
-
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to scrape proposal from {url}: {str(e)}"
-                ) from e
-            finally:
-                await browser.close()
+                # Try to parse as JSON
+                extracted_data = json.loads(llm_response)
+            except json.JSONDecodeError:
+                # If not valid JSON, try to extract from the text response
+                extracted_data = {"title": ""}
+                # Simple fallback extraction from LLM text response
+                if "title:" in llm_response:
+                    title_match = llm_response.split("title:")[1].split("\n")[0].strip()
+                    extracted_data["title"] = title_match.strip('"').strip()
+
+            # Build the proposal data
+            return ScrapedProposal(
+                url=url,
+                title=str(extracted_data.get("title", "")),
+            )
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to scrape proposal from {url}: {str(e)}") from e
@@ -18,6 +18,10 @@ from src.application.dtos.role_name_mapping_dto import (
     RoleNameMappingResultDTO,
 )
 from src.domain.interfaces.role_name_mapping_service import IRoleNameMappingService
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -77,7 +81,8 @@ class BAMLRoleNameMappingService(IRoleNameMappingService):
 
             # BAMLを呼び出し
             logger.info("Calling BAML ExtractRoleNameMapping")
-            baml_result = await b.ExtractRoleNameMapping(attendee_text)
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, attendee_text):
+                baml_result = await b.ExtractRoleNameMapping(attendee_text)
 
             # BAML結果をDTOに変換
             mappings = [
@@ -0,0 +1,224 @@
+"""静的HTML優先のページフェッチャー
+
+まずHTTPでHTMLを取得し、JavaScriptで本文を組み立てるページだと判定した場合だけ
+Playwrightで描画します。サーバーで描画済みのページ（議会・自治体サイトの大半）は
+ブラウザの起動・networkidleの待機・スクロールを省けます。
+
+描画が必要と判定したホストはプロセス内で共有するRenderHostRegistryに記憶し、
+同じホストの以降のページは、別のフェッチャーからの取得でも最初からブラウザで取得します。
+ブラウザは最初に必要になった時点で1つだけ起動し、全ページで共有します。
+"""
+
+import asyncio
+import functools
+import logging
+import re
+import threading
+
+from types import TracebackType
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
+from src.infrastructure.external.html_page_fetcher import HtmlPageFetcher
+from src.infrastructure.external.http_page_fetcher import HttpPageFetcher
+
+
+logger = logging.getLogger(__name__)
+
+# 本文がこの文字数（空白除く）未満のページは描画が必要な可能性がある
+MIN_TEXT_CHARS = 200
+
+# SPAフレームワークがマウントする空の要素のid
+SPA_ROOT_IDS = ("root", "app", "__next", "__nuxt", "q-app")
+
+# 存在しないページはブラウザで取得し直さない
+_NOT_FOUND_STATUSES = (404, 410)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def needs_rendering(html: str) -> bool:
+    """HTMLがJavaScriptで組み立てられるページかを判定
+
+    本文のテキストが十分にあれば描画不要とします。テキストが少ない場合は、
+    スクリプト・空のSPAルート要素・JavaScriptを有効にするよう求める<noscript>の
+    いずれかがあれば描画が必要と判定します。
+
+    Args:
+        html: HTTPで取得したHTML
+
+    Returns:
+        ブラウザでの描画が必要ならTrue
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    if soup.find("frameset"):
+        # フレームはブラウザで描画しても本文が得られない
+        return False
+
+    has_scripts = soup.find("script") is not None
+    noscript_text = " ".join(tag.get_text(" ") for tag in soup.find_all("noscript"))
+    has_empty_spa_root = any(
+        (root := soup.find(id=root_id)) is not None and not root.get_text(strip=True)
+        for root_id in SPA_ROOT_IDS
+    )
+
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+    body = soup.body or soup
+    text = _WHITESPACE_PATTERN.sub("", body.get_text())
+    if len(text) >= MIN_TEXT_CHARS:
+        return False
+
+    return has_scripts or has_empty_spa_root or "javascript" in noscript_text.lower()
+
+
+class RenderHostRegistry:
+    """描画が必要と判定したホストの記録
+
+    フェッチャーはURLや抽出処理ごとに作られるため、判定結果はフェッチャーではなく
+    このレジストリに持たせ、get_render_host_registry()でプロセス内で共有します。
+    Streamlitのように複数のスレッドから使われても安全です。
+    """
+
+    def __init__(self) -> None:
+        self._hosts: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, host: object) -> bool:
+        with self._lock:
+            return host in self._hosts
+
+    def add(self, host: str) -> None:
+        """描画が必要なホストとして記録する"""
+        with self._lock:
+            self._hosts.add(host)
+
+    @property
+    def hosts(self) -> frozenset[str]:
+        """記録したホスト"""
+        with self._lock:
+            return frozenset(self._hosts)
+
+
+@functools.cache
+def get_render_host_registry() -> RenderHostRegistry:
+    """プロセス内で共有するRenderHostRegistryを取得する"""
+    return RenderHostRegistry()
+
+
+class StaticFirstPageFetcher:
+    """静的HTMLを優先し、必要な場合だけブラウザで描画するフェッチャー
+
+    HtmlPageFetcherと同じ fetch_single_page を持つため、
+    ConcurrentCrawlerなどのフェッチャーとしてそのまま使えます。
+
+    同じインスタンスを繰り返し（並行しても）async withで使えます。
+    HTTPセッションとブラウザは最初のasync withで開き、最後の
+    async withを抜けた時点で閉じます。
+
+    Example:
+        async with StaticFirstPageFetcher() as fetcher:
+            page = await fetcher.fetch_single_page(url)
+    """
+
+    def __init__(
+        self,
+        http_fetcher: HttpPageFetcher | None = None,
+        browser_fetcher: HtmlPageFetcher | None = None,
+        headless: bool = True,
+        render_host_registry: RenderHostRegistry | None = None,
+    ):
+        """
+        Args:
+            http_fetcher: 静的HTMLの取得に使うフェッチャー
+            browser_fetcher: 起動済みのブラウザフェッチャー
+                （省略時は必要になった時点で起動し、終了時に閉じる）
+            headless: 起動するブラウザをヘッドレスモードにするか
+            render_host_registry: 描画が必要なホストの記録
+                （省略時はプロセス内で共有するレジストリ）
+        """
+        self.http_fetcher = http_fetcher or HttpPageFetcher()
+        self.headless = headless
+        self._browser_fetcher = browser_fetcher
+        self._owns_browser = False
+        self._browser_lock = asyncio.Lock()
+        self._render_host_registry = render_host_registry or get_render_host_registry()
+        self._active_contexts = 0
+
+    @property
+    def render_hosts(self) -> frozenset[str]:
+        """描画が必要と判定したホスト"""
+        return self._render_host_registry.hosts
+
+    async def __aenter__(self) -> "StaticFirstPageFetcher":
+        if self._active_contexts == 0:
+            # asyncio.run()ごとにイベントループが変わるため、ロックも作り直す
+            self._browser_lock = asyncio.Lock()
+            await self.http_fetcher.__aenter__()
+        self._active_contexts += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._active_contexts -= 1
+        if self._active_contexts > 0:
+            return
+        await self.http_fetcher.__aexit__(exc_type, exc_val, exc_tb)
+        if self._owns_browser and self._browser_fetcher:
+            await self._browser_fetcher.__aexit__(exc_type, exc_val, exc_tb)
+            self._browser_fetcher = None
+            self._owns_browser = False
+
+    async def fetch_single_page(self, url: str) -> WebPageContentDTO | None:
+        """単一ページを取得
+
+        Args:
+            url: 取得するURL
+
+        Returns:
+            取得したページ（存在しない・HTMLでない・取得に失敗した場合はNone）
+        """
+        host = (urlparse(url).hostname or "").lower()
+        if host not in self._render_host_registry:
+            try:
+                page = await self.http_fetcher.fetch(url)
+            except Exception as e:
+                logger.info(f"HTTP fetch failed for {url}, using browser: {e}")
+            else:
+                if page.status in _NOT_FOUND_STATUSES:
+                    logger.warning(f"Page not found ({page.status}): {url}")
+                    return None
+                if not page.is_html:
+                    logger.warning(f"Not an HTML page ({page.content_type}): {url}")
+                    return None
+                if page.status < 400:
+                    if not needs_rendering(page.html):
+                        return WebPageContentDTO(
+                            url=page.url, html_content=page.html, page_number=1
+                        )
+                    logger.info(
+                        f"{url} is built by JavaScript; "
+                        f"using browser for all pages on {host}"
+                    )
+                    self._render_host_registry.add(host)
+                else:
+                    # ボット対策などでブラウザなら取得できる場合がある
+                    logger.info(f"HTTP {page.status} for {url}, using browser")
+
+        browser = await self._get_browser_fetcher()
+        return await browser.fetch_single_page(url)
+
+    async def _get_browser_fetcher(self) -> HtmlPageFetcher:
+        async with self._browser_lock:
+            if self._browser_fetcher is None:
+                browser = HtmlPageFetcher(headless=self.headless)
+                await browser.__aenter__()
+                self._browser_fetcher = browser
+                self._owns_browser = True
+            return self._browser_fetcher
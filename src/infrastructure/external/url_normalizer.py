@@ -0,0 +1,41 @@
+"""URL canonicalization shared by link classification and crawling."""
+
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+
+# Query parameters that do not change the page a link points to
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "yclid"})
+
+
+def normalize_url(url: str) -> tuple[str, str]:
+    """Normalize a URL so that equivalent links compare equal.
+
+    Lowercases the scheme and host, drops default ports, the fragment,
+    trailing slashes and tracking parameters, and sorts the query.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Tuple of (domain, normalized URL)
+    """
+    parts = urlparse(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").removeprefix("www.")
+    try:
+        port = parts.port if parts.port not in (80, 443) else None
+    except ValueError:
+        port = None
+    netloc = f"{host}:{port}" if port else host
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+        )
+    )
+    normalized = f"{scheme}://{netloc}{path}"
+    if query:
+        normalized += f"?{query}"
+    return host, normalized
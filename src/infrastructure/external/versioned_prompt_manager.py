@@ -1,4 +1,9 @@
-"""Versioned prompt management with database backing."""
+"""Versioned prompt management with database backing.
+
+Active versions are served from a PromptRegistry, which loads them all at
+once and reloads after a fetch-time TTL, after activate_version(), or when
+another process changes them (see PromptVersionChangeListener).
+"""
 
 import logging
 
@@ -8,6 +13,10 @@ from typing import Any
 from src.domain.entities.prompt_version import PromptVersion
 from src.domain.repositories.prompt_version_repository import PromptVersionRepository
 from src.infrastructure.external.prompt_manager import PromptManager
+from src.infrastructure.external.prompt_registry import PromptRegistry
+from src.infrastructure.persistence.prompt_version_change_listener import (
+    PromptVersionChangeListener,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -16,16 +25,29 @@ logger = logging.getLogger(__name__)
 class VersionedPromptManager(PromptManager):
     """Extended prompt manager with version control capabilities."""
 
-    def __init__(self, repository: PromptVersionRepository | None = None):
+    def __init__(
+        self,
+        repository: PromptVersionRepository | None = None,
+        registry: PromptRegistry | None = None,
+    ):
         """Initialize versioned prompt manager.
 
         Args:
             repository: Optional prompt version repository. If not provided,
                        falls back to in-memory prompt management.
+            registry: Optional registry caching the active versions. Created
+                     from the repository if not provided, listening for
+                     changes from other processes on its first lookup.
         """
         super().__init__()
         self.repository = repository
-        self._version_cache: dict[str, PromptVersion] = {}
+        self.registry = registry or (
+            PromptRegistry(
+                repository, change_listener_factory=PromptVersionChangeListener
+            )
+            if repository
+            else None
+        )
 
     async def get_versioned_prompt(
         self, prompt_key: str, variables: dict[str, Any] | None = None
@@ -42,50 +64,17 @@ class VersionedPromptManager(PromptManager):
         Raises:
             ValueError: If prompt not found or variables are invalid
         """
-        # Try to get from repository first
-        if self.repository:
-            prompt_version = await self._get_active_version(prompt_key)
-            if prompt_version:
-                formatted = prompt_version.format_template(variables or {})
-                return formatted, prompt_version.version
+        # Try the registry of active versions first
+        if self.registry:
+            compiled = await self.registry.get(prompt_key)
+            if compiled:
+                return compiled.format(variables or {}), compiled.version.version
 
         # Fall back to parent implementation
         prompt_template = self.get_prompt(prompt_key)
         formatted = prompt_template.format(**(variables or {}))
         return formatted, "legacy"
 
-    async def _get_active_version(self, prompt_key: str) -> PromptVersion | None:
-        """Get active version from cache or repository.
-
-        Args:
-            prompt_key: Key identifying the prompt
-
-        Returns:
-            Active prompt version or None
-        """
-        if not self.repository:
-            return None
-
-        # Check cache first
-        if prompt_key in self._version_cache:
-            cached = self._version_cache[prompt_key]
-            # Simple cache invalidation after 5 minutes
-            if (
-                cached.updated_at
-                and (datetime.now() - cached.updated_at).total_seconds() < 300
-            ):
-                return cached
-
-        # Fetch from repository
-        try:
-            version = await self.repository.get_active_version(prompt_key)
-            if version:
-                self._version_cache[prompt_key] = version
-            return version
-        except Exception as e:
-            logger.error(f"Failed to fetch prompt version for {prompt_key}: {e}")
-            return None
-
     async def save_new_version(
         self,
         prompt_key: str,
@@ -132,9 +121,9 @@ class VersionedPromptManager(PromptManager):
                 activate=activate,
             )
 
-            # Update cache if activated
-            if activate:
-                self._version_cache[prompt_key] = prompt_version
+            # Serve the new version in this process right away
+            if activate and self.registry:
+                self.registry.put(prompt_version)
 
             logger.info(f"Saved prompt version {prompt_key}:{version}")
             return prompt_version
@@ -179,9 +168,9 @@ class VersionedPromptManager(PromptManager):
 
         try:
             success = await self.repository.activate_version(prompt_key, version)
-            if success:
-                # Invalidate cache
-                self._version_cache.pop(prompt_key, None)
+            if success and self.registry:
+                # Reload so the newly active version is served
+                self.registry.invalidate()
             return success
         except Exception as e:
             logger.error(f"Failed to activate prompt version: {e}")
@@ -272,5 +261,6 @@ class VersionedPromptManager(PromptManager):
 
     def clear_cache(self) -> None:
         """Clear the version cache."""
-        self._version_cache.clear()
+        if self.registry:
+            self.registry.clear()
         logger.info("Cleared prompt version cache")
@@ -177,6 +177,65 @@ class ConversationRepositoryImpl(
             # This should never happen as one session must exist
             return []
 
+    async def _execute(self, query: Any, params: dict[str, Any]) -> Any:
+        """Execute a query on the async session or session adapter."""
+        if self.async_session is not None:
+            return await self.async_session.execute(query, params)
+        if self.sync_session is not None:
+            # ISessionAdapter implementation - execute is always async
+            return await self.sync_session.execute(query, params)
+        raise RuntimeError("No database session available")
+
+    async def exists_by_minutes(self, minutes_id: int) -> bool:
+        """Check whether any conversation exists for a minutes record."""
+        query = text("""
+            SELECT EXISTS (
+                SELECT 1 FROM conversations WHERE minutes_id = :minutes_id
+            )
+        """)
+        result = await self._execute(query, {"minutes_id": minutes_id})
+        return bool(result.scalar())
+
+    async def count_by_minutes(self, minutes_id: int) -> int:
+        """Count conversations for a minutes record."""
+        query = text("""
+            SELECT COUNT(*) FROM conversations WHERE minutes_id = :minutes_id
+        """)
+        result = await self._execute(query, {"minutes_id": minutes_id})
+        return result.scalar() or 0
+
+    async def count_distinct_speakers_by_minutes(self, minutes_id: int) -> int:
+        """Count distinct linked speakers among a minutes record's conversations."""
+        query = text("""
+            SELECT COUNT(DISTINCT speaker_id) FROM conversations
+            WHERE minutes_id = :minutes_id
+        """)
+        result = await self._execute(query, {"minutes_id": minutes_id})
+        return result.scalar() or 0
+
+    async def delete_by_minutes(self, minutes_id: int) -> list[int]:
+        """Delete all conversations for a minutes record in one statement.
+
+        Extraction logs whose entity is one of the deleted conversations are
+        deleted in the same statement so that no orphaned statement logs
+        remain. latest_extraction_log_id only points from conversations to
+        extraction_logs, so both deletions can run together.
+        """
+        query = text("""
+            WITH deleted AS (
+                DELETE FROM conversations
+                WHERE minutes_id = :minutes_id
+                RETURNING id
+            ), deleted_logs AS (
+                DELETE FROM extraction_logs
+                WHERE entity_type = 'statement'
+                AND entity_id IN (SELECT id FROM deleted)
+            )
+            SELECT id FROM deleted
+        """)
+        result = await self._execute(query, {"minutes_id": minutes_id})
+        return [row.id for row in result.fetchall()]
+
     async def get_by_meeting(
         self, meeting_id: int, limit: int | None = None
     ) -> list[Conversation]:
@@ -302,6 +302,47 @@ class ExtractedProposalJudgeRepositoryImpl(
         # Return updated entity
         return await self.get_by_id(judge_id)
 
+    async def bulk_update_matching_results(
+        self, judges: list[ExtractedProposalJudge]
+    ) -> int:
+        """Write the matching results of multiple judges in a single statement."""
+        judges = [judge for judge in judges if judge.id is not None]
+        if not judges:
+            return 0
+
+        # Pass one array per column and join them back into rows with unnest
+        query = text("""
+            UPDATE extracted_proposal_judges AS e
+            SET matched_politician_id = v.pol_id,
+                matched_parliamentary_group_id = v.group_id,
+                matching_confidence = v.confidence,
+                matching_status = v.status,
+                matched_at = :matched_at
+            FROM unnest(
+                CAST(:judge_ids AS INTEGER[]),
+                CAST(:pol_ids AS INTEGER[]),
+                CAST(:group_ids AS INTEGER[]),
+                CAST(:confidences AS NUMERIC[]),
+                CAST(:statuses AS VARCHAR[])
+            ) AS v(judge_id, pol_id, group_id, confidence, status)
+            WHERE e.id = v.judge_id
+        """)
+
+        result = await self.session.execute(
+            query,
+            {
+                "judge_ids": [judge.id for judge in judges],
+                "pol_ids": [judge.matched_politician_id for judge in judges],
+                "group_ids": [judge.matched_parliamentary_group_id for judge in judges],
+                "confidences": [judge.matching_confidence for judge in judges],
+                "statuses": [judge.matching_status for judge in judges],
+                "matched_at": datetime.now(),
+            },
+        )
+        await self.session.commit()
+
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def get_by_proposal(self, proposal_id: int) -> list[ExtractedProposalJudge]:
         """Get all extracted judges for a proposal."""
         query = text("""
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from src.domain.entities.meeting import Meeting
 from src.domain.repositories.meeting_repository import MeetingRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
+from src.domain.value_objects.meeting_summary import MeetingSummary
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 
 
@@ -467,6 +468,118 @@ class MeetingRepositoryImpl(BaseRepositoryImpl[Meeting], MeetingRepository):
                 return dict(row._mapping) if row else None  # type: ignore
             return None
 
+    # 処理状況は集計テーブルと議事録の有無から導出する
+    _PROCESSING_STATUS_SQL = """
+        CASE
+            WHEN COALESCE(s.speaker_count, 0) > 0 THEN 'speakers_linked'
+            WHEN COALESCE(s.conversation_count, 0) > 0
+                THEN 'conversations_extracted'
+            WHEN EXISTS (SELECT 1 FROM minutes mi WHERE mi.meeting_id = m.id)
+                THEN 'minutes_only'
+            ELSE 'not_processed'
+        END
+    """
+
+    async def get_meeting_summaries(
+        self,
+        conference_id: int | None = None,
+        governing_body_id: int | None = None,
+        processing_status: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[MeetingSummary], int]:
+        """Get meeting summaries with counters, filters and pagination.
+
+        Conference/governing body names and the conversation counters kept in
+        meeting_conversation_stats are joined in one query, and the total count
+        is returned with the page via a window function.
+        """
+        filters = ""
+        params: dict[str, Any] = {"offset": offset}
+        if conference_id:
+            filters += " AND m.conference_id = :conference_id"
+            params["conference_id"] = conference_id
+        if governing_body_id:
+            filters += " AND c.governing_body_id = :governing_body_id"
+            params["governing_body_id"] = governing_body_id
+        if processing_status:
+            filters += f" AND ({self._PROCESSING_STATUS_SQL}) = :processing_status"
+            params["processing_status"] = processing_status
+
+        from_clause = f"""
+            FROM meetings m
+            JOIN conferences c ON m.conference_id = c.id
+            JOIN governing_bodies gb ON c.governing_body_id = gb.id
+            LEFT JOIN meeting_conversation_stats s ON s.meeting_id = m.id
+            WHERE 1=1{filters}
+        """
+        query = f"""
+            SELECT
+                m.id,
+                m.conference_id,
+                m.date,
+                m.url,
+                m.name,
+                m.gcs_pdf_uri,
+                m.gcs_text_uri,
+                c.name AS conference_name,
+                gb.name AS governing_body_name,
+                gb.type AS governing_body_type,
+                COALESCE(s.conversation_count, 0) AS conversation_count,
+                COALESCE(s.speaker_count, 0) AS speaker_count,
+                {self._PROCESSING_STATUS_SQL} AS processing_status,
+                COUNT(*) OVER () AS total_count
+            {from_clause}
+            ORDER BY m.date DESC, m.id DESC
+        """
+        if limit is not None:
+            query += " LIMIT :limit"
+            params["limit"] = limit
+        query += " OFFSET :offset"
+
+        result = await self._execute_raw(query, params)
+        rows = [dict(row._mapping) for row in result]  # type: ignore
+
+        if rows:
+            total_count = int(rows[0]["total_count"])
+        elif offset > 0:
+            # ページ範囲外の場合はウィンドウ関数で件数が取れないため別途数える
+            count_result = await self._execute_raw(
+                f"SELECT COUNT(*) {from_clause}", params
+            )
+            total_count = count_result.scalar() or 0
+        else:
+            total_count = 0
+
+        summaries = [
+            MeetingSummary(
+                id=row["id"],
+                conference_id=row["conference_id"],
+                date=row["date"],
+                url=row["url"],
+                name=row["name"],
+                gcs_pdf_uri=row["gcs_pdf_uri"],
+                gcs_text_uri=row["gcs_text_uri"],
+                conference_name=row["conference_name"],
+                governing_body_name=row["governing_body_name"],
+                governing_body_type=row["governing_body_type"],
+                conversation_count=int(row["conversation_count"]),
+                speaker_count=int(row["speaker_count"]),
+                processing_status=row["processing_status"],
+            )
+            for row in rows
+        ]
+        return summaries, total_count
+
+    async def _execute_raw(self, sql: str, params: dict[str, Any]) -> Any:
+        """Execute raw SQL on whichever session type this repository holds."""
+        async_executor = self._get_async_executor()
+        if async_executor:
+            return await async_executor.execute(text(sql), params)
+        if self.sync_session:
+            return self.sync_session.execute(text(sql), params)
+        raise RuntimeError("No database session available")
+
     # Override base methods to handle both async and sync
     async def create(self, entity: Meeting) -> Meeting:
         """Create a new meeting."""
@@ -693,6 +806,15 @@ class MeetingRepositoryImpl(BaseRepositoryImpl[Meeting], MeetingRepository):
                     return self._dict_to_entity(dict(row._mapping))  # type: ignore
             return None
 
+    async def get_by_ids(self, entity_ids: list[int]) -> list[Meeting]:
+        """Get meetings by IDs in a single query."""
+        if not entity_ids:
+            return []
+        result = await self._execute_raw(
+            "SELECT * FROM meetings WHERE id = ANY(:ids)", {"ids": list(entity_ids)}
+        )
+        return [self._dict_to_entity(dict(row._mapping)) for row in result]
+
     async def get_all(
         self, limit: int | None = None, offset: int | None = 0
     ) -> list[Meeting]:
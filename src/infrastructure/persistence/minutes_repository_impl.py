@@ -12,6 +12,7 @@ from sqlalchemy.orm import declarative_base
 from src.domain.entities.minutes import Minutes
 from src.domain.repositories.minutes_repository import MinutesRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 
 
@@ -28,6 +29,7 @@ class MinutesModel(Base):
     url = Column(String)
     processed_at = Column(DateTime)
     role_name_mappings = Column(JSONB)
+    attendee_boundary = Column(JSONB)
 
 
 class MinutesRepositoryImpl(BaseRepositoryImpl[Minutes], MinutesRepository):
@@ -94,6 +96,11 @@ class MinutesRepositoryImpl(BaseRepositoryImpl[Minutes], MinutesRepository):
             url=model.url,
             processed_at=model.processed_at,
             role_name_mappings=model.role_name_mappings,
+            attendee_boundary=(
+                AttendeeBoundary.from_dict(model.attendee_boundary)
+                if model.attendee_boundary
+                else None
+            ),
         )
 
     def _to_model(self, entity: Minutes) -> Any:
@@ -103,6 +110,9 @@ class MinutesRepositoryImpl(BaseRepositoryImpl[Minutes], MinutesRepository):
             "url": entity.url,
             "processed_at": entity.processed_at,
             "role_name_mappings": entity.role_name_mappings,
+            "attendee_boundary": (
+                entity.attendee_boundary.to_dict() if entity.attendee_boundary else None
+            ),
         }
         if entity.id:
             data["id"] = entity.id
@@ -114,6 +124,9 @@ class MinutesRepositoryImpl(BaseRepositoryImpl[Minutes], MinutesRepository):
         model.url = entity.url
         model.processed_at = entity.processed_at
         model.role_name_mappings = entity.role_name_mappings
+        model.attendee_boundary = (
+            entity.attendee_boundary.to_dict() if entity.attendee_boundary else None
+        )
 
     async def update_role_name_mappings(
         self, minutes_id: int, mappings: dict[str, str]
@@ -136,6 +149,27 @@ class MinutesRepositoryImpl(BaseRepositoryImpl[Minutes], MinutesRepository):
         result = await self.session.execute(stmt)
         return result.rowcount > 0
 
+    async def update_attendee_boundary(
+        self, minutes_id: int, boundary: AttendeeBoundary
+    ) -> bool:
+        """議事録の出席者/発言境界のキャッシュを更新する
+
+        Args:
+            minutes_id: 議事録ID
+            boundary: 検出済みの境界
+
+        Returns:
+            bool: 更新成功の場合True
+        """
+        stmt = (
+            update(MinutesModel)
+            .where(MinutesModel.id == minutes_id)
+            .values(attendee_boundary=boundary.to_dict())
+        )
+
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
     async def get_all(
         self, limit: int | None = None, offset: int | None = None
     ) -> list[Minutes]:
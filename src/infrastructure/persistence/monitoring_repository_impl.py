@@ -1,5 +1,8 @@
 """Monitoring repository implementation for Clean Architecture."""
 
+import json
+
+from datetime import datetime
 from typing import Any, TypedDict
 
 from sqlalchemy import text
@@ -89,12 +92,128 @@ class CommitteeType(TypedDict):
     governing_bodies: int
 
 
+class MetricsSnapshot(TypedDict):
+    """Type definition for a stored metrics snapshot."""
+
+    data: Any
+    computed_at: datetime
+
+
+OVERALL_METRICS_KEY = "overall_metrics"
+CONFERENCE_COVERAGE_KEY = "conference_coverage"
+PREFECTURE_DETAILED_COVERAGE_KEY = "prefecture_detailed_coverage"
+
+
 class MonitoringRepositoryImpl:
-    """Implementation of monitoring repository using AsyncSession."""
+    """Implementation of monitoring repository using AsyncSession.
+
+    The ``get_*`` aggregation methods scan the underlying tables and are meant
+    to be run by ``refresh_metrics_snapshot``. Interactive callers such as
+    dashboards should read the stored snapshots via the ``*_snapshot`` methods
+    and the trigger-maintained ``get_table_row_counts`` instead.
+    """
 
     def __init__(self, session: AsyncSession | ISessionAdapter):
         self.session = session
 
+    async def refresh_metrics_snapshot(self) -> datetime:
+        """Recompute the expensive metrics and store them as snapshots.
+
+        Returns:
+            datetime: Time the snapshots were computed
+        """
+        computed_at = datetime.now()
+        snapshots: dict[str, Any] = {
+            OVERALL_METRICS_KEY: await self.get_overall_metrics(),
+            CONFERENCE_COVERAGE_KEY: await self.get_conference_coverage(),
+            PREFECTURE_DETAILED_COVERAGE_KEY: (
+                await self.get_prefecture_detailed_coverage()
+            ),
+        }
+
+        query = text("""
+            INSERT INTO metrics_snapshots (metric_key, payload, computed_at)
+            VALUES (:metric_key, :payload, :computed_at)
+            ON CONFLICT (metric_key) DO UPDATE SET
+                payload = EXCLUDED.payload,
+                computed_at = EXCLUDED.computed_at
+        """)
+        for metric_key, data in snapshots.items():
+            await self.session.execute(
+                query,
+                {
+                    "metric_key": metric_key,
+                    "payload": json.dumps(data, ensure_ascii=False, default=str),
+                    "computed_at": computed_at,
+                },
+            )
+        await self.session.commit()
+
+        return computed_at
+
+    async def get_overall_metrics_snapshot(self) -> MetricsSnapshot | None:
+        """Get the stored overall metrics snapshot.
+
+        Returns:
+            MetricsSnapshot | None: Metrics in the format of
+                ``get_overall_metrics`` with their computation time, or None if
+                the snapshot has never been refreshed
+        """
+        return await self._get_snapshot(OVERALL_METRICS_KEY)
+
+    async def get_conference_coverage_snapshot(self) -> MetricsSnapshot | None:
+        """Get the stored conference coverage snapshot.
+
+        Returns:
+            MetricsSnapshot | None: Coverage in the format of
+                ``get_conference_coverage`` with its computation time, or None
+                if the snapshot has never been refreshed
+        """
+        return await self._get_snapshot(CONFERENCE_COVERAGE_KEY)
+
+    async def get_prefecture_detailed_coverage_snapshot(
+        self,
+    ) -> MetricsSnapshot | None:
+        """Get the stored prefecture detailed coverage snapshot.
+
+        Returns:
+            MetricsSnapshot | None: Coverage in the format of
+                ``get_prefecture_detailed_coverage`` with its computation time,
+                or None if the snapshot has never been refreshed
+        """
+        return await self._get_snapshot(PREFECTURE_DETAILED_COVERAGE_KEY)
+
+    async def get_table_row_counts(self) -> dict[str, int]:
+        """Get the trigger-maintained row counts of the large tables.
+
+        Returns:
+            dict[str, int]: Row count keyed by table name
+        """
+        result = await self.session.execute(
+            text("SELECT table_name, row_count FROM table_row_counts")
+        )
+        return {row.table_name: int(row.row_count) for row in result.fetchall()}
+
+    async def _get_snapshot(self, metric_key: str) -> MetricsSnapshot | None:
+        """Read a stored snapshot by its key."""
+        result = await self.session.execute(
+            text("""
+                SELECT payload, computed_at
+                FROM metrics_snapshots
+                WHERE metric_key = :metric_key
+            """),
+            {"metric_key": metric_key},
+        )
+        row = result.fetchone()
+        if not row:
+            return None
+
+        computed_at = row.computed_at
+        if not isinstance(computed_at, datetime):
+            computed_at = datetime.fromisoformat(str(computed_at))
+
+        return {"data": json.loads(row.payload), "computed_at": computed_at}
+
     async def get_overall_metrics(self) -> dict[str, Any]:
         """Get overall system metrics."""
         query = text("""
@@ -102,6 +102,30 @@ class PoliticianAffiliationRepositoryImpl(
 
         return [self._row_to_entity(row) for row in rows]
 
+    async def get_by_politicians(
+        self, politician_ids: list[int], active_only: bool = True
+    ) -> list[PoliticianAffiliation]:
+        """Get affiliations for multiple politicians in a single query."""
+        if not politician_ids:
+            return []
+
+        conditions = ["politician_id = ANY(:pol_ids)"]
+        params: dict[str, Any] = {"pol_ids": list(politician_ids)}
+
+        if active_only:
+            conditions.append("end_date IS NULL")
+
+        query = text(f"""
+            SELECT * FROM politician_affiliations
+            WHERE {" AND ".join(conditions)}
+            ORDER BY politician_id, start_date DESC
+        """)
+
+        result = await self.session.execute(query, params)
+        rows = result.fetchall()
+
+        return [self._row_to_entity(row) for row in rows]
+
     async def upsert(
         self,
         politician_id: int,
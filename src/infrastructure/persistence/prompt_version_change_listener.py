@@ -0,0 +1,132 @@
+"""Cross-process invalidation of cached prompt versions via LISTEN/NOTIFY."""
+
+import asyncio
+import logging
+import re
+
+from types import TracebackType
+
+import asyncpg
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.external.prompt_registry import PromptRegistry
+
+
+logger = logging.getLogger(__name__)
+
+# Channel notified by the prompt_versions trigger (alembic revision 011)
+PROMPT_VERSIONS_CHANNEL = "prompt_versions_changed"
+
+_DRIVER_PATTERN = re.compile(r"^postgresql\+\w+://")
+
+
+class PromptVersionChangeListener:
+    """Invalidates a PromptRegistry when prompt_versions changes in any process.
+
+    Holds one dedicated connection that LISTENs on PROMPT_VERSIONS_CHANNEL.
+    If the connection is lost, the registry is invalidated once and then falls
+    back to its TTL until the listener is started again. PromptRegistry starts
+    its listener on the first lookup and restarts it before a reload.
+
+    The connection belongs to the event loop it was opened on. When lookups run
+    on another loop (e.g. one asyncio.run() per Streamlit action), the listener
+    reports that it is not listening, and the next start() reconnects.
+
+    Example:
+        PromptRegistry(repository, change_listener_factory=PromptVersionChangeListener)
+    """
+
+    def __init__(self, registry: PromptRegistry, database_url: str | None = None):
+        """Initialize the listener.
+
+        Args:
+            registry: Registry to invalidate on changes
+            database_url: PostgreSQL URL (defaults to the configured database)
+        """
+        self.registry = registry
+        url = database_url or settings.get_database_url()
+        self._dsn = _DRIVER_PATTERN.sub("postgresql://", url)
+        self._connection: asyncpg.Connection | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether the LISTEN connection is open on the running event loop."""
+        return (
+            self._connection is not None
+            and not self._connection.is_closed()
+            and self._loop is _running_loop()
+        )
+
+    async def start(self) -> None:
+        """Open the connection and start listening for changes."""
+        if self.is_listening:
+            return
+        self._discard_connection()
+        connection = await asyncpg.connect(self._dsn)
+        connection.add_termination_listener(self._on_terminated)
+        await connection.add_listener(PROMPT_VERSIONS_CHANNEL, self._on_notify)
+        self._connection = connection
+        self._loop = asyncio.get_running_loop()
+        # Changes made before LISTEN took effect were not notified
+        self.registry.invalidate()
+        logger.info(
+            f"Listening for prompt version changes on {PROMPT_VERSIONS_CHANNEL}"
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._connection is not None and self._loop is not _running_loop():
+            self._discard_connection()
+            return
+        connection, self._connection = self._connection, None
+        if connection is None or connection.is_closed():
+            return
+        connection.remove_termination_listener(self._on_terminated)
+        try:
+            await connection.remove_listener(PROMPT_VERSIONS_CHANNEL, self._on_notify)
+        finally:
+            await connection.close()
+
+    def _discard_connection(self) -> None:
+        """Drop a connection left on another (possibly closed) event loop."""
+        connection, self._connection = self._connection, None
+        if connection is None or connection.is_closed():
+            return
+        connection.remove_termination_listener(self._on_terminated)
+        try:
+            connection.terminate()
+        except Exception as e:
+            logger.debug(f"Failed to terminate stale listener connection: {e}")
+
+    def _on_notify(
+        self, connection: object, pid: int, channel: str, payload: str
+    ) -> None:
+        logger.info(f"Prompt version changed: {payload} (pid {pid})")
+        self.registry.invalidate()
+
+    def _on_terminated(self, connection: object) -> None:
+        logger.warning(
+            "Prompt version listener connection closed; "
+            "falling back to the registry TTL"
+        )
+        self.registry.invalidate()
+
+    async def __aenter__(self) -> "PromptVersionChangeListener":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
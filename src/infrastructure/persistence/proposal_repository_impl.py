@@ -369,6 +369,55 @@ class ProposalRepositoryImpl(BaseRepositoryImpl[Proposal], ProposalRepository):
             conference_id=data.get("conference_id"),
         )
 
+    async def get_by_ids(self, entity_ids: list[int]) -> list[Proposal]:
+        """Get proposals by IDs in a single query.
+
+        Args:
+            entity_ids: Proposal IDs to fetch
+
+        Returns:
+            List of the proposals found (IDs that do not exist are skipped)
+        """
+        if not entity_ids:
+            return []
+
+        try:
+            query = text("""
+                SELECT
+                    id,
+                    title,
+                    detail_url,
+                    status_url,
+                    votes_url,
+                    meeting_id,
+                    conference_id,
+                    created_at,
+                    updated_at
+                FROM proposals
+                WHERE id = ANY(:ids)
+            """)
+
+            result = await self.session.execute(query, {"ids": list(entity_ids)})
+            rows = result.fetchall()
+
+            results = []
+            for row in rows:
+                if hasattr(row, "_asdict"):
+                    row_dict = row._asdict()  # type: ignore[attr-defined]
+                elif hasattr(row, "_mapping"):
+                    row_dict = dict(row._mapping)  # type: ignore[attr-defined]
+                else:
+                    row_dict = dict(row)
+                results.append(self._dict_to_entity(row_dict))
+            return results
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting proposals by IDs: {e}")
+            raise DatabaseError(
+                "Failed to get proposals by IDs",
+                {"ids": entity_ids, "error": str(e)},
+            ) from e
+
     async def get_by_meeting_id(self, meeting_id: int) -> list[Proposal]:
         """Get proposals by meeting ID.
 
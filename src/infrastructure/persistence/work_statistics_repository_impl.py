@@ -0,0 +1,303 @@
+"""Implementation of work statistics repository using SQLAlchemy."""
+
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.work_statistics import (
+    ContributorWorkStats,
+    DailyWorkCount,
+    UserWorkCount,
+)
+from src.domain.repositories.session_adapter import ISessionAdapter
+from src.domain.repositories.work_statistics_repository import (
+    IWorkStatisticsRepository,
+)
+
+
+SPEAKER_MATCHING_WORK_TYPE = "speaker_politician_matching"
+MEMBERSHIP_CREATION_WORK_TYPE = "parliamentary_group_membership_creation"
+OPERATION_TYPES = ("create", "update", "delete")
+
+
+class WorkStatisticsRepositoryImpl(IWorkStatisticsRepository):
+    """Implementation of IWorkStatisticsRepository using SQLAlchemy.
+
+    Every query aggregates over a ``work`` CTE that projects the source tables
+    onto ``(user_id, work_type, executed_at)`` rows. Only the sources selected
+    by the work type filter are included, and the user/date filters are pushed
+    down into each source so that the existing user_id and timestamp indexes
+    can be used. Only aggregated rows are transferred to the application.
+    """
+
+    def __init__(self, session: AsyncSession | ISessionAdapter):
+        """Initialize repository with database session.
+
+        Args:
+            session: Database session (AsyncSession or ISessionAdapter)
+        """
+        self.session = session
+
+    async def get_counts_by_work_type(
+        self,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, int]:
+        """Count works grouped by work type."""
+        work_sql, params = self._build_work_sql(
+            user_id, work_types, start_date, end_date
+        )
+        if work_sql is None:
+            return {}
+
+        query = f"""
+            WITH work AS ({work_sql})
+            SELECT work_type, COUNT(*) AS count
+            FROM work
+            GROUP BY work_type
+        """
+        rows = await self._fetch_all(query, params)
+        return {row.work_type: int(row.count) for row in rows}
+
+    async def get_daily_counts(
+        self,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[DailyWorkCount]:
+        """Count works grouped by the day they were executed.
+
+        ``DATE(executed_at)`` is equivalent to ``date_trunc('day', executed_at)``
+        but returns a date, which is what the timeline needs.
+        """
+        work_sql, params = self._build_work_sql(
+            user_id, work_types, start_date, end_date
+        )
+        if work_sql is None:
+            return []
+
+        query = f"""
+            WITH work AS ({work_sql})
+            SELECT DATE(executed_at) AS work_date, COUNT(*) AS count
+            FROM work
+            GROUP BY DATE(executed_at)
+            ORDER BY work_date
+        """
+        rows = await self._fetch_all(query, params)
+        return [
+            {"date": self._to_date(row.work_date), "count": int(row.count)}
+            for row in rows
+        ]
+
+    async def get_counts_by_user(
+        self,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[UserWorkCount]:
+        """Count works grouped by user."""
+        work_sql, params = self._build_work_sql(
+            user_id, work_types, start_date, end_date
+        )
+        if work_sql is None:
+            return []
+
+        query = f"""
+            WITH work AS ({work_sql}),
+            user_totals AS (
+                SELECT user_id, COUNT(*) AS total_count
+                FROM work
+                GROUP BY user_id
+            )
+            SELECT
+                t.user_id,
+                u.name AS user_name,
+                u.email AS user_email,
+                t.total_count
+            FROM user_totals t
+            LEFT JOIN users u ON u.user_id = t.user_id
+            ORDER BY t.total_count DESC, t.user_id
+        """
+        rows = await self._fetch_all(query, params)
+        return [
+            {
+                "user_id": self._to_uuid(row.user_id),
+                "user_name": row.user_name,
+                "user_email": row.user_email,
+                "total_count": int(row.total_count),
+            }
+            for row in rows
+        ]
+
+    async def get_top_contributors(
+        self,
+        limit: int,
+        user_id: UUID | None = None,
+        work_types: list[str] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[ContributorWorkStats]:
+        """Get the users with the most works and their per-type breakdown.
+
+        The ranking is computed with ``ORDER BY ... LIMIT`` and the per-type
+        breakdown is only aggregated for the selected users.
+        """
+        if limit <= 0:
+            return []
+
+        work_sql, params = self._build_work_sql(
+            user_id, work_types, start_date, end_date
+        )
+        if work_sql is None:
+            return []
+
+        query = f"""
+            WITH work AS ({work_sql}),
+            top_users AS (
+                SELECT user_id, COUNT(*) AS total_count
+                FROM work
+                GROUP BY user_id
+                ORDER BY total_count DESC, user_id
+                LIMIT :limit
+            )
+            SELECT
+                t.user_id,
+                u.name AS user_name,
+                u.email AS user_email,
+                t.total_count,
+                w.work_type,
+                COUNT(*) AS type_count
+            FROM top_users t
+            JOIN work w ON w.user_id = t.user_id
+            LEFT JOIN users u ON u.user_id = t.user_id
+            GROUP BY t.user_id, u.name, u.email, t.total_count, w.work_type
+            ORDER BY t.total_count DESC, t.user_id, w.work_type
+        """
+        rows = await self._fetch_all(query, {**params, "limit": limit})
+
+        contributors: dict[Any, ContributorWorkStats] = {}
+        for row in rows:
+            contributor = contributors.get(row.user_id)
+            if contributor is None:
+                contributor = ContributorWorkStats(
+                    user_id=self._to_uuid(row.user_id),
+                    user_name=row.user_name,
+                    user_email=row.user_email,
+                    total_count=int(row.total_count),
+                    by_type={},
+                )
+                contributors[row.user_id] = contributor
+            contributor["by_type"][row.work_type] = int(row.type_count)
+
+        return list(contributors.values())
+
+    def _build_work_sql(
+        self,
+        user_id: UUID | None,
+        work_types: list[str] | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> tuple[str | None, dict[str, Any]]:
+        """Build the UNION ALL query of works from the selected sources.
+
+        Returns:
+            tuple: SQL of the work rows (None if no source is selected) and
+                its bind parameters
+        """
+        selected = set(work_types) if work_types is not None else None
+        params: dict[str, Any] = {}
+        if user_id is not None:
+            params["user_id"] = user_id
+        if start_date is not None:
+            params["start_date"] = start_date
+        if end_date is not None:
+            params["end_date"] = end_date
+
+        def filters(user_column: str, time_column: str) -> str:
+            conditions = [f"{user_column} IS NOT NULL", f"{time_column} IS NOT NULL"]
+            if user_id is not None:
+                conditions.append(f"{user_column} = :user_id")
+            if start_date is not None:
+                conditions.append(f"{time_column} >= :start_date")
+            if end_date is not None:
+                conditions.append(f"{time_column} <= :end_date")
+            return " AND ".join(conditions)
+
+        branches: list[str] = []
+
+        if selected is None or SPEAKER_MATCHING_WORK_TYPE in selected:
+            branches.append(f"""
+                SELECT
+                    matched_by_user_id AS user_id,
+                    '{SPEAKER_MATCHING_WORK_TYPE}' AS work_type,
+                    updated_at AS executed_at
+                FROM speakers
+                WHERE {filters("matched_by_user_id", "updated_at")}
+            """)
+
+        if selected is None or MEMBERSHIP_CREATION_WORK_TYPE in selected:
+            branches.append(f"""
+                SELECT
+                    created_by_user_id AS user_id,
+                    '{MEMBERSHIP_CREATION_WORK_TYPE}' AS work_type,
+                    created_at AS executed_at
+                FROM parliamentary_group_memberships
+                WHERE {filters("created_by_user_id", "created_at")}
+            """)
+
+        for entity in ("politician", "proposal"):
+            operation_types = [
+                op
+                for op in OPERATION_TYPES
+                if selected is None or f"{entity}_{op}" in selected
+            ]
+            if not operation_types:
+                continue
+
+            condition = filters("user_id", "operated_at")
+            if len(operation_types) < len(OPERATION_TYPES):
+                placeholders = []
+                for op in operation_types:
+                    key = f"{entity}_operation_{op}"
+                    params[key] = op
+                    placeholders.append(f":{key}")
+                condition += f" AND operation_type IN ({', '.join(placeholders)})"
+
+            branches.append(f"""
+                SELECT
+                    user_id,
+                    '{entity}_' || operation_type AS work_type,
+                    operated_at AS executed_at
+                FROM {entity}_operation_logs
+                WHERE {condition}
+            """)
+
+        if not branches:
+            return None, params
+        return " UNION ALL ".join(branches), params
+
+    async def _fetch_all(self, query: str, params: dict[str, Any]) -> list[Any]:
+        """Execute an aggregation query and return all rows."""
+        result = await self.session.execute(text(query), params)
+        return list(result.fetchall())
+
+    @staticmethod
+    def _to_uuid(value: Any) -> UUID:
+        """Convert a user_id column value to UUID."""
+        return value if isinstance(value, UUID) else UUID(str(value))
+
+    @staticmethod
+    def _to_date(value: Any) -> date:
+        """Convert a DATE column value to date."""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value))
@@ -3,14 +3,22 @@
 リトライポリシーとサーキットブレーカーをエクスポート
 """
 
-from .circuit_breaker import CircuitBreaker, CircuitState
-from .retry import RetryableError, RetryPolicy, with_retry
+from .circuit_breaker import (
+    AsyncCircuitBreaker,
+    CircuitBreaker,
+    CircuitState,
+    get_async_circuit_breaker,
+)
+from .retry import RetryableError, RetryPolicy, retry_async, with_retry
 
 
 __all__ = [
     "RetryPolicy",
     "RetryableError",
     "with_retry",
+    "retry_async",
     "CircuitBreaker",
+    "AsyncCircuitBreaker",
     "CircuitState",
+    "get_async_circuit_breaker",
 ]
@@ -357,6 +357,120 @@ class CircuitBreaker:
             }
 
 
+class AsyncCircuitBreaker(CircuitBreaker):
+    """asyncio向けのサーキットブレーカー
+
+    状態の判定と記録はawaitを挟まずに行うため、イベントループ上のタスクが
+    ロック待ちでブロックされることはない。HALF_OPEN中の試行数を制限し、
+    call_timeoutを超えた呼び出しは失敗として扱う。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig | None = None,
+        call_timeout: float | None = None,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] | None = None,
+    ):
+        """初期化
+
+        Args:
+            name: サーキットブレーカーの名前
+            config: 設定（Noneの場合はデフォルト）
+            call_timeout: 1回の呼び出しのタイムアウト（秒、Noneの場合は無制限）
+            half_open_max_calls: HALF_OPEN中に同時に通す試行の数
+            is_failure: 例外を障害として数えるか判定する関数
+                （Noneの場合はすべての例外を障害として数える）
+        """
+        super().__init__(name, config)
+        self.call_timeout = call_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure or (lambda _: True)
+        self._half_open_in_flight = 0
+
+    async def async_call(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """非同期関数を実行（サーキットブレーカー経由）
+
+        Args:
+            func: 実行する非同期関数
+            *args: 関数の引数
+            **kwargs: 関数のキーワード引数
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            CircuitBreakerError: サーキットが開いている場合、
+                またはHALF_OPENで試行枠が埋まっている場合
+            TimeoutError: call_timeoutを超えた場合
+        """
+        with self._lock:
+            if self._should_attempt_reset():
+                self._transition_to_half_open()
+
+            if self.state == CircuitState.OPEN:
+                raise CircuitBreakerError(f"Circuit breaker '{self.name}' is OPEN")
+
+            probing = self.state == CircuitState.HALF_OPEN
+            if probing:
+                if self._half_open_in_flight >= self.half_open_max_calls:
+                    raise CircuitBreakerError(
+                        f"Circuit breaker '{self.name}' is HALF_OPEN and busy"
+                    )
+                self._half_open_in_flight += 1
+
+        try:
+            if self.call_timeout is not None:
+                result = await asyncio.wait_for(
+                    func(*args, **kwargs), timeout=self.call_timeout
+                )
+            else:
+                result = await func(*args, **kwargs)
+        except Exception as e:
+            # 入力不正など上流の健全性と無関係なエラーは障害として数えない
+            if self.is_failure(e):
+                self._record_failure()
+            raise
+        else:
+            self._record_success()
+            return result
+        finally:
+            if probing:
+                with self._lock:
+                    self._half_open_in_flight -= 1
+
+
+_async_breakers: dict[str, AsyncCircuitBreaker] = {}
+
+
+def get_async_circuit_breaker(
+    name: str,
+    config: CircuitBreakerConfig | None = None,
+    **kwargs: Any,
+) -> AsyncCircuitBreaker:
+    """名前ごとにプロセス全体で共有される非同期サーキットブレーカーを取得する
+
+    Args:
+        name: サーキットブレーカーの名前（例: "llm:gemini-2.5-flash"）
+        config: 初回作成時に使用する設定
+        **kwargs: 初回作成時にAsyncCircuitBreakerへ渡す追加引数
+
+    Returns:
+        名前に対応するサーキットブレーカー
+    """
+    if name not in _async_breakers:
+        _async_breakers[name] = AsyncCircuitBreaker(name, config, **kwargs)
+    return _async_breakers[name]
+
+
+def reset_async_circuit_breakers() -> None:
+    """共有サーキットブレーカーを破棄する（テスト用）"""
+    _async_breakers.clear()
+
+
 def circuit_breaker(
     name: str | None = None, config: CircuitBreakerConfig | None = None
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
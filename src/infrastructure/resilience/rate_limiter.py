@@ -0,0 +1,403 @@
+"""トークンバケット方式のレートリミッターの実装
+
+LLM呼び出しのリクエスト数/分（RPM）とトークン数/分（TPM）を、
+モデルごとにプロセス全体で共有して制御する。
+
+- 予約（reserve）はロック内で同期的に行い、待機（sleep）はロック外で行うため、
+  1つの呼び出しの待機が他の呼び出しの予約を妨げない
+- 429 / RESOURCE_EXHAUSTED を受けるとレートを縮小し（乗算的減少）、
+  成功が続くと徐々に回復する（加算的増加）
+- 待機時間は統計情報として公開し、メトリクスが初期化されていれば
+  OpenTelemetryのヒストグラムにも記録する
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# BAML関数が使用するクライアント（baml_src/clients.baml の Gemini2Flash）のモデル名
+BAML_DEFAULT_MODEL = "gemini-2.5-flash"
+
+# レート制限エラーを示すメッセージ断片（小文字で比較）
+_RATE_LIMIT_MARKERS = (
+    "429",
+    "resource_exhausted",
+    "resource exhausted",
+    "rate limit",
+    "too many requests",
+    "quota exceeded",
+)
+
+
+@dataclass
+class RateLimiterConfig:
+    """レートリミッターの設定"""
+
+    # 1分あたりの最大リクエスト数
+    requests_per_minute: float = 1000
+
+    # 1分あたりの最大トークン数
+    tokens_per_minute: float = 1_000_000
+
+    # バースト許容量（何秒分のレートを一度に消費できるか）
+    burst_seconds: float = 1.0
+
+    # 429受信時にレートへ掛ける係数（乗算的減少）
+    decrease_factor: float = 0.5
+
+    # 成功1回あたりに回復するレート比率（加算的増加）
+    recovery_step: float = 0.02
+
+    # レートの下限（設定値に対する比率）
+    min_rate_ratio: float = 0.05
+
+    # 連続した429でレートを再縮小するまでの最小間隔（秒）
+    decrease_cooldown: float = 1.0
+
+
+@dataclass
+class RateLimiterStats:
+    """レートリミッターの統計情報"""
+
+    total_acquired: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    waiting: int = 0
+    rate_limited_count: int = 0
+    rate_ratio: float = 1.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """取得1回あたりの平均待機時間（秒）"""
+        if self.total_acquired == 0:
+            return 0.0
+        return self.total_wait_seconds / self.total_acquired
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """例外がレート制限（429 / RESOURCE_EXHAUSTED）によるものか判定する
+
+    Args:
+        error: 判定する例外
+
+    Returns:
+        レート制限エラーの場合True
+    """
+    # 循環importを避けるため遅延import
+    from src.infrastructure.exceptions import RateLimitException
+    from src.infrastructure.external.llm_errors import LLMRateLimitError
+
+    if isinstance(error, LLMRateLimitError | RateLimitException):
+        return True
+
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status_code == 429:
+        return True
+
+    message = str(error).lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+def estimate_tokens(*texts: str | None) -> int:
+    """テキストのおおよそのトークン数を見積もる
+
+    ASCII文字は約4文字で1トークン、日本語などの非ASCII文字は
+    1文字1トークンとして保守的に見積もる。
+
+    Args:
+        *texts: 見積もり対象のテキスト
+
+    Returns:
+        見積もりトークン数
+    """
+    total = 0
+    for text in texts:
+        if not text:
+            continue
+        ascii_chars = sum(1 for ch in text if ch.isascii())
+        total += math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+    return total
+
+
+class TokenBucketRateLimiter:
+    """RPMとTPMの2つのトークンバケットによるレートリミッター
+
+    残量がマイナスになる（負債を抱える）ことを許容し、後続の呼び出しほど
+    長く待機させることで、到着順（FIFO）の公平性を保つ。
+    """
+
+    def __init__(self, name: str, config: RateLimiterConfig | None = None):
+        """初期化
+
+        Args:
+            name: リミッター名（通常はモデル名）
+            config: 設定（Noneの場合はデフォルト）
+        """
+        self.name = name
+        self.config = config or RateLimiterConfig()
+        self.stats = RateLimiterStats()
+
+        self._lock = threading.Lock()
+        self._updated_at = time.monotonic()
+        self._last_decrease_at = 0.0
+        self._request_tokens = self._request_capacity
+        self._token_tokens = self._token_capacity
+
+    @property
+    def _request_rate(self) -> float:
+        """現在のリクエスト補充レート（件/秒）"""
+        return self.config.requests_per_minute / 60 * self.stats.rate_ratio
+
+    @property
+    def _token_rate(self) -> float:
+        """現在のトークン補充レート（トークン/秒）"""
+        return self.config.tokens_per_minute / 60 * self.stats.rate_ratio
+
+    @property
+    def _request_capacity(self) -> float:
+        return max(1.0, self._request_rate * self.config.burst_seconds)
+
+    @property
+    def _token_capacity(self) -> float:
+        return max(1.0, self._token_rate * self.config.burst_seconds)
+
+    def _refill(self, now: float) -> None:
+        """経過時間分のトークンを補充する（ロック内で呼び出すこと）"""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._request_tokens = min(
+                self._request_capacity,
+                self._request_tokens + elapsed * self._request_rate,
+            )
+            self._token_tokens = min(
+                self._token_capacity,
+                self._token_tokens + elapsed * self._token_rate,
+            )
+        self._updated_at = now
+
+    def reserve(self, tokens: int = 0) -> float:
+        """枠を予約し、呼び出し側が待機すべき秒数を返す
+
+        Args:
+            tokens: 消費する見積もりトークン数
+
+        Returns:
+            待機すべき秒数（0なら即時実行可能）
+        """
+        # 1回の呼び出しがバケット容量を超えても永久に待たないよう上限を設ける
+        token_cost = min(max(tokens, 0), self.config.tokens_per_minute)
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._request_tokens -= 1
+            self._token_tokens -= token_cost
+
+            wait = 0.0
+            if self._request_tokens < 0:
+                wait = max(wait, -self._request_tokens / self._request_rate)
+            if self._token_tokens < 0:
+                wait = max(wait, -self._token_tokens / self._token_rate)
+
+            self.stats.total_acquired += 1
+            self.stats.total_wait_seconds += wait
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+
+        _record_wait_metric(self.name, wait)
+        if wait > 1.0:
+            logger.debug(f"Rate limiter '{self.name}': waiting {wait:.2f}s")
+        return wait
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """枠を取得する（必要に応じて非同期に待機する）
+
+        Args:
+            tokens: 消費する見積もりトークン数
+
+        Returns:
+            実際に待機した秒数
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self.stats.waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self.stats.waiting -= 1
+        return wait
+
+    def acquire_blocking(self, tokens: int = 0) -> float:
+        """枠を取得する（同期呼び出し用、スレッドをブロックして待機する）
+
+        Args:
+            tokens: 消費する見積もりトークン数
+
+        Returns:
+            実際に待機した秒数
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """枠を取得して処理を実行し、結果に応じてレートを調整する
+
+        Examples:
+            async with limiter.limit(estimate_tokens(prompt)):
+                result = await b.DivideSpeech(prompt)
+        """
+        await self.acquire(tokens)
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.record_rate_limited()
+            raise
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        """成功を記録し、縮小していたレートを徐々に回復する"""
+        if self.stats.rate_ratio >= 1.0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.stats.rate_ratio = min(
+                1.0, self.stats.rate_ratio + self.config.recovery_step
+            )
+
+    def record_rate_limited(self, retry_after: float | None = None) -> None:
+        """レート制限エラーを記録し、レートを縮小する
+
+        Args:
+            retry_after: サーバーから指示された待機秒数（あれば）
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.stats.rate_limited_count += 1
+
+            if now - self._last_decrease_at >= self.config.decrease_cooldown:
+                self._last_decrease_at = now
+                self.stats.rate_ratio = max(
+                    self.config.min_rate_ratio,
+                    self.stats.rate_ratio * self.config.decrease_factor,
+                )
+                # 溜まっていたバーストを捨て、新しいレートで再スタートする
+                self._request_tokens = min(self._request_tokens, 0.0)
+                self._token_tokens = min(self._token_tokens, 0.0)
+
+            if retry_after:
+                # retry_after 秒間は新規リクエストを通さない
+                self._request_tokens = min(
+                    self._request_tokens, -retry_after * self._request_rate
+                )
+
+        logger.warning(
+            f"Rate limiter '{self.name}': rate limited by upstream, "
+            f"rate reduced to {self.stats.rate_ratio:.0%}"
+        )
+
+    def get_status(self) -> dict[str, Any]:
+        """現在のステータスを取得"""
+        return {
+            "name": self.name,
+            "requests_per_minute": self.config.requests_per_minute
+            * self.stats.rate_ratio,
+            "tokens_per_minute": self.config.tokens_per_minute * self.stats.rate_ratio,
+            "rate_ratio": self.stats.rate_ratio,
+            "total_acquired": self.stats.total_acquired,
+            "waiting": self.stats.waiting,
+            "average_wait_seconds": self.stats.average_wait_seconds,
+            "max_wait_seconds": self.stats.max_wait_seconds,
+            "rate_limited_count": self.stats.rate_limited_count,
+        }
+
+
+def _record_wait_metric(name: str, wait_seconds: float) -> None:
+    """待機時間をOpenTelemetryヒストグラムに記録する（未初期化なら何もしない）"""
+    try:
+        from src.common.metrics import CommonMetrics
+
+        CommonMetrics.llm_rate_limit_wait().record(
+            wait_seconds, attributes={"model": name}
+        )
+    except RuntimeError:
+        # メトリクス未初期化（CLIやテスト）
+        pass
+
+
+_llm_limiters: dict[str, TokenBucketRateLimiter] = {}
+_llm_limiters_lock = threading.Lock()
+
+
+def _default_llm_config() -> RateLimiterConfig:
+    """環境設定からLLM用のデフォルト設定を作成する"""
+    from src.infrastructure.config.settings import settings
+
+    # 上流のクォータは分単位で計測されるため、10秒分のバーストを許容する
+    return RateLimiterConfig(
+        requests_per_minute=settings.llm_rate_limit_rpm,
+        tokens_per_minute=settings.llm_rate_limit_tpm,
+        burst_seconds=10.0,
+    )
+
+
+def get_llm_rate_limiter(
+    model_name: str, config: RateLimiterConfig | None = None
+) -> TokenBucketRateLimiter:
+    """モデルごとにプロセス全体で共有されるレートリミッターを取得する
+
+    Args:
+        model_name: モデル名（例: "gemini-2.5-flash"）
+        config: 初回作成時に使用する設定（Noneの場合は環境設定から作成）
+
+    Returns:
+        モデルに対応するレートリミッター
+    """
+    limiter = _llm_limiters.get(model_name)
+    if limiter is not None:
+        return limiter
+
+    with _llm_limiters_lock:
+        if model_name not in _llm_limiters:
+            _llm_limiters[model_name] = TokenBucketRateLimiter(
+                model_name, config or _default_llm_config()
+            )
+        return _llm_limiters[model_name]
+
+
+def reset_llm_rate_limiters() -> None:
+    """共有レートリミッターを破棄する（テスト用）"""
+    with _llm_limiters_lock:
+        _llm_limiters.clear()
+
+
+@asynccontextmanager
+async def llm_rate_limit(
+    model_name: str, *prompt_texts: str | None
+) -> AsyncIterator[TokenBucketRateLimiter]:
+    """モデルの共有レートリミッターで呼び出しを制御するコンテキストマネージャ
+
+    Args:
+        model_name: モデル名
+        *prompt_texts: トークン数見積もりに使うプロンプト入力
+
+    Examples:
+        async with llm_rate_limit(BAML_DEFAULT_MODEL, section_text):
+            result = await b.DivideSpeech(section_text)
+    """
+    limiter = get_llm_rate_limiter(model_name)
+    async with limiter.limit(estimate_tokens(*prompt_texts)):
+        yield limiter
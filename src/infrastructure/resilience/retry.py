@@ -6,8 +6,9 @@
 import asyncio
 import functools
 import logging
+import random
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from tenacity import (
@@ -36,6 +37,14 @@ from src.infrastructure.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 一時的な障害を示すメッセージ断片（小文字で比較）
+_TRANSIENT_ERROR_MARKERS = (
+    "503",
+    "unavailable",
+    "deadline exceeded",
+    "internal error",
+)
+
 
 class RetryableError(Exception):
     """リトライ可能なエラーの基底クラス"""
@@ -325,3 +334,117 @@ def with_retry(
             return sync_wrapper
 
     return decorator
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """例外が時間をおけば回復しうる一時的な障害か判定する
+
+    レート制限、タイムアウト、接続エラー、5xx系のエラーを一時的とみなす。
+    入力不正やパースエラーなど、再試行しても結果が変わらないものは含まない。
+
+    Args:
+        error: 判定する例外
+
+    Returns:
+        一時的な障害の場合True
+    """
+    # 循環importを避けるため遅延import
+    from src.infrastructure.external.llm_errors import LLMTimeoutError
+    from src.infrastructure.resilience.rate_limiter import is_rate_limit_error
+
+    if isinstance(
+        error,
+        RetryPolicy.DEFAULT_RETRYABLE_EXCEPTIONS
+        + (TimeoutError, ConnectionError, LLMTimeoutError),
+    ):
+        return True
+    if is_rate_limit_error(error):
+        return True
+
+    if isinstance(error, ExternalServiceException):
+        status_code = error.details.get("status_code")
+        return bool(status_code and 500 <= status_code < 600)
+
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int) and 500 <= status_code < 600:
+        return True
+
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_ERROR_MARKERS)
+
+
+def full_jitter_backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    """フルジッター付き指数バックオフの待機秒数を計算する
+
+    0〜min(max_delay, base_delay * 2^(attempt-1)) の一様乱数を返すため、
+    同時に失敗した呼び出しのリトライが同じ時刻に集中しない。
+
+    Args:
+        attempt: 失敗した試行の番号（1始まり）
+        base_delay: 基準待機時間（秒）
+        max_delay: 最大待機時間（秒）
+
+    Returns:
+        待機秒数
+    """
+    ceiling = min(max_delay, base_delay * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling)
+
+
+async def retry_async[T](
+    operation: Callable[[], Awaitable[T]],
+    *,
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    should_retry: Callable[[BaseException], bool] | None = None,
+) -> T:
+    """非同期処理をジッター付き指数バックオフでリトライする
+
+    待機はasyncio.sleepで行うため、リトライ中も同じイベントループ上の
+    他のタスクは処理を続けられる。例外にretry_afterが指定されていれば
+    （LLMRateLimitError / RateLimitException）、少なくともその秒数は待機する。
+
+    Args:
+        operation: 試行ごとに呼び出される、コルーチンを返す関数
+        max_attempts: 最大試行回数
+        base_delay: バックオフの基準待機時間（秒）
+        max_delay: バックオフの最大待機時間（秒）
+        should_retry: リトライ判定関数（Noneの場合はis_transient_error）
+
+    Returns:
+        operationの戻り値
+
+    Raises:
+        最後の試行で発生した例外、またはリトライ対象外の例外
+
+    Examples:
+        result = await retry_async(
+            lambda: breaker.async_call(chain.ainvoke, inputs), max_attempts=5
+        )
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+    retryable = should_retry or is_transient_error
+
+    attempt = 1
+    while True:
+        try:
+            return await operation()
+        except Exception as e:
+            if attempt >= max_attempts or not retryable(e):
+                raise
+
+            delay = full_jitter_backoff(attempt, base_delay, max_delay)
+            retry_after = getattr(e, "retry_after", None)
+            if isinstance(e, RateLimitException):
+                retry_after = e.details.get("retry_after")
+            if retry_after:
+                delay = max(delay, float(retry_after))
+
+            logger.warning(
+                f"Attempt {attempt}/{max_attempts} failed: {e}. "
+                f"Retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -16,7 +16,7 @@ def get_coverage_commands() -> list[click.Command]:
     Returns:
         List of Click commands
     """
-    return [coverage, coverage_stats]
+    return [coverage, coverage_stats, refresh_metrics, monitoring_metrics]
 
 
 @click.command()
@@ -224,3 +224,105 @@ def coverage_stats():
         click.echo("\n" + "=" * 70)
 
     asyncio.run(run_stats())
+
+
+@click.command("refresh-metrics")
+def refresh_metrics():
+    """Recompute the monitoring metrics snapshot (モニタリング用メトリクスの再計算).
+
+    monitoring-metricsは保存済みのスナップショットを表示するため、
+    cronなどで定期的に実行してください。
+    """
+    # Initialize and get dependencies from DI container
+    try:
+        container = get_container()
+    except RuntimeError:
+        container = init_container()
+
+    monitoring_repo = container.repositories.monitoring_repository()
+
+    async def run_refresh():
+        computed_at = await monitoring_repo.refresh_metrics_snapshot()
+        row_counts = await monitoring_repo.get_table_row_counts()
+
+        click.echo(f"✓ メトリクスを再計算しました ({computed_at:%Y-%m-%d %H:%M:%S})")
+        for table_name, row_count in sorted(row_counts.items()):
+            click.echo(f"  {table_name}: {row_count:,}")
+
+    asyncio.run(run_refresh())
+
+
+@click.command("monitoring-metrics")
+def monitoring_metrics():
+    """Show the stored monitoring metrics (保存済みモニタリング指標の表示).
+
+    集計はrefresh-metricsで保存したスナップショットと、トリガーで更新される
+    行数カウンタから読み込むため、元のテーブルは走査しません。
+    """
+    # Initialize and get dependencies from DI container
+    try:
+        container = get_container()
+    except RuntimeError:
+        container = init_container()
+
+    monitoring_repo = container.repositories.monitoring_repository()
+
+    async def run_show():
+        snapshot = await monitoring_repo.get_overall_metrics_snapshot()
+        conference_snapshot = await monitoring_repo.get_conference_coverage_snapshot()
+        row_counts = await monitoring_repo.get_table_row_counts()
+
+        click.echo("=" * 70)
+        click.echo("📊 Monitoring Metrics")
+        click.echo("=" * 70)
+
+        if snapshot is None:
+            click.echo(
+                "スナップショットがありません。"
+                "先に 'sagebase refresh-metrics' を実行してください。"
+            )
+        else:
+            metrics = snapshot["data"]
+            click.echo(f"集計日時: {snapshot['computed_at']:%Y-%m-%d %H:%M:%S}")
+            click.echo("-" * 70)
+            for label, key, rate_key in (
+                ("自治体", "governing_bodies", "coverage"),
+                ("会議体", "conferences", "coverage"),
+                ("政治家", "politicians", "utilization"),
+                ("政党", "parties", "coverage"),
+            ):
+                item = metrics[key]
+                click.echo(
+                    f"{label}: {item['total']:,} "
+                    f"(データあり: {item['active']:,}, {item[rate_key]:.1f}%)"
+                )
+            click.echo(f"会議: {metrics['meetings']['total']:,}")
+            for label, key in (("発言", "conversations"), ("発言者", "speakers")):
+                item = metrics[key]
+                click.echo(
+                    f"{label}: {item['total']:,} "
+                    f"(紐付け済み: {item['linked']:,}, {item['linkage_rate']:.1f}%)"
+                )
+
+        if conference_snapshot is not None:
+            conferences = conference_snapshot["data"]
+            click.echo("\n🏛️  会議体別カバレッジ（発言数の多い順）")
+            click.echo("-" * 70)
+            for conference in sorted(
+                conferences, key=lambda c: c["conversations"], reverse=True
+            )[:10]:
+                click.echo(
+                    f"{conference['governing_body']} {conference['name']}: "
+                    f"会議 {conference['meetings']:,} / "
+                    f"発言 {conference['conversations']:,}"
+                )
+
+        if row_counts:
+            click.echo("\n📦 テーブル行数（リアルタイム）")
+            click.echo("-" * 70)
+            for table_name, row_count in sorted(row_counts.items()):
+                click.echo(f"{table_name}: {row_count:,}")
+
+        click.echo("=" * 70)
+
+    asyncio.run(run_show())
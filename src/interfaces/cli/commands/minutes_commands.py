@@ -1,5 +1,9 @@
 """CLI commands for processing meeting minutes"""
 
+import asyncio
+
+from datetime import datetime
+
 import click
 
 from ..base import BaseCommand, with_error_handling
@@ -89,6 +93,91 @@ class MinutesCommands(BaseCommand):
         )
         MinutesCommands.success("Speaker links updated successfully")
 
+    @staticmethod
+    @click.command()
+    @click.option(
+        "--meeting-id",
+        "meeting_ids",
+        type=int,
+        multiple=True,
+        help="Meeting ID to process (repeatable)",
+    )
+    @click.option("--conference-id", type=int, help="Process meetings of a conference")
+    @click.option(
+        "--start-date",
+        type=click.DateTime(formats=["%Y-%m-%d"]),
+        help="Only meetings on or after this date (YYYY-MM-DD)",
+    )
+    @click.option(
+        "--end-date",
+        type=click.DateTime(formats=["%Y-%m-%d"]),
+        help="Only meetings on or before this date (YYYY-MM-DD)",
+    )
+    @click.option("--force", is_flag=True, help="Reprocess meetings with conversations")
+    @click.option("--fetch-concurrency", type=int, default=8, show_default=True)
+    @click.option("--llm-concurrency", type=int, default=4, show_default=True)
+    @click.option("--persist-concurrency", type=int, default=2, show_default=True)
+    @with_error_handling
+    def process_minutes_batch(
+        meeting_ids: tuple[int, ...],
+        conference_id: int | None,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        force: bool,
+        fetch_concurrency: int,
+        llm_concurrency: int,
+        persist_concurrency: int,
+    ):
+        """Process minutes of many meetings concurrently (議事録一括処理)
+
+        Runs GCS fetch, role mapping/division and persistence as a bounded
+        pipeline with an independent unit of work per meeting.
+        """
+        from src.application.dtos.minutes_processing_dto import (
+            BatchMinutesProcessingDTO,
+        )
+        from src.application.usecases.batch_execute_minutes_processing_usecase import (  # noqa: E501
+            BatchExecuteMinutesProcessingUseCase,
+        )
+        from src.interfaces.factories.minutes_processing_factory import (
+            create_minutes_processing_scope,
+        )
+
+        if not meeting_ids and conference_id is None:
+            MinutesCommands.error(
+                "Specify --meeting-id or --conference-id", exit_code=1
+            )
+
+        usecase = BatchExecuteMinutesProcessingUseCase(
+            processing_scope=create_minutes_processing_scope(),
+            fetch_concurrency=fetch_concurrency,
+            llm_concurrency=llm_concurrency,
+            persist_concurrency=persist_concurrency,
+        )
+        request = BatchMinutesProcessingDTO(
+            meeting_ids=list(meeting_ids) or None,
+            conference_id=conference_id,
+            start_date=start_date.date() if start_date else None,
+            end_date=end_date.date() if end_date else None,
+            force_reprocess=force,
+        )
+        result = asyncio.run(usecase.execute(request))
+
+        for stage, metrics in result.stage_metrics.items():
+            MinutesCommands.show_progress(
+                f"[{stage}] processed={metrics.processed} failed={metrics.failed} "
+                f"busy={metrics.busy_seconds:.1f}s "
+                f"backpressure_wait={metrics.wait_seconds:.1f}s "
+                f"throughput={metrics.throughput_per_minute:.1f}/min"
+            )
+        for meeting_id, reason in sorted(result.failures.items()):
+            MinutesCommands.warning(f"Meeting {meeting_id}: {reason}")
+
+        MinutesCommands.success(
+            f"Processed {len(result.results)}/{result.total_meetings} meetings "
+            f"in {result.total_seconds:.1f}s"
+        )
+
 
 def get_minutes_commands():
     """Get all minutes-related commands"""
@@ -99,5 +188,6 @@ def get_minutes_commands():
     return [
         MinutesCommands.process_minutes,
         MinutesCommands.update_speakers,
+        MinutesCommands.process_minutes_batch,
         get_analyze_matching_history_command(),
     ]
@@ -23,6 +23,9 @@ from src.infrastructure.external.llm_service import GeminiLLMService
 from src.infrastructure.external.parliamentary_group_member_extractor.factory import (
     ParliamentaryGroupMemberExtractorFactory,
 )
+from src.infrastructure.external.politician_matching import (
+    BAMLPoliticianMatchingService,
+)
 from src.infrastructure.persistence.extracted_parliamentary_group_member_repository_impl import (  # noqa: E501
     ExtractedParliamentaryGroupMemberRepositoryImpl,
 )
@@ -36,7 +39,6 @@ from src.infrastructure.persistence.politician_repository_impl import (
     PoliticianRepositoryImpl,
 )
 from src.infrastructure.persistence.repository_adapter import RepositoryAdapter
-from src.infrastructure.persistence.speaker_repository_impl import SpeakerRepositoryImpl
 from src.interfaces.cli.base import BaseCommand
 from src.interfaces.cli.progress import ProgressTracker
 
@@ -78,15 +80,18 @@ class ParliamentaryGroupMemberCommands(BaseCommand):
         # リポジトリの初期化（非同期セッション化: See Issue #980）
         member_repo = ExtractedParliamentaryGroupMemberRepositoryImpl(session)  # type: ignore
         politician_repo = PoliticianRepositoryImpl(session)  # type: ignore
-        speaker_repo = SpeakerRepositoryImpl(session)  # type: ignore
 
         # サービスの初期化
         llm_service = GeminiLLMService()
-        speaker_service = SpeakerDomainService(speaker_repo)
+        speaker_service = SpeakerDomainService()
         matching_service = PGMemberMatchingDomainService(
             politician_repository=politician_repo,
             llm_service=llm_service,
             speaker_service=speaker_service,
+            politician_matching_service=BAMLPoliticianMatchingService(
+                llm_service=llm_service,
+                politician_repository=politician_repo,
+            ),
         )
 
         return MatchParliamentaryGroupMembersUseCase(
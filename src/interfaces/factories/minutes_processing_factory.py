@@ -0,0 +1,95 @@
+"""議事録処理ユースケースのファクトリー
+
+一括処理パイプラインの各ステージに、独立したセッション・Unit of Workに
+束縛されたExecuteMinutesProcessingUseCaseを提供します。
+LLMやGCSなどのステートレスなサービスはスコープ間で共有されます。
+"""
+
+import os
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.application.usecases.batch_execute_minutes_processing_usecase import (
+    MinutesProcessingScope,
+)
+from src.application.usecases.execute_minutes_processing_usecase import (
+    ExecuteMinutesProcessingUseCase,
+)
+from src.application.usecases.update_statement_from_extraction_usecase import (
+    UpdateStatementFromExtractionUseCase,
+)
+from src.domain.services.speaker_domain_service import SpeakerDomainService
+
+
+def create_minutes_processing_scope(
+    bucket_name: str | None = None,
+) -> MinutesProcessingScope:
+    """会議ごとに独立したUnit of Workを持つユースケースのスコープを作成する
+
+    Args:
+        bucket_name: GCSバケット名（省略時は環境変数GCS_BUCKET_NAME）
+
+    Returns:
+        MinutesProcessingScope: 呼び出すたびに新しいセッションを開く
+            非同期コンテキストマネージャのファクトリ
+    """
+    from src.infrastructure.config.async_database import get_async_session
+    from src.infrastructure.external.gcs_storage_service import GCSStorageService
+    from src.infrastructure.external.kokkai_speech_source import KokkaiSpeechSource
+    from src.infrastructure.external.llm_service import GeminiLLMService
+    from src.infrastructure.external.minutes_divider.baml_minutes_divider import (
+        BAMLMinutesDivider,
+    )
+    from src.infrastructure.external.minutes_processing_service import (
+        MinutesProcessAgentService,
+    )
+    from src.infrastructure.external.role_name_mapping.baml_role_name_mapping_service import (  # noqa: E501
+        BAMLRoleNameMappingService,
+    )
+    from src.infrastructure.persistence.conversation_repository_impl import (
+        ConversationRepositoryImpl,
+    )
+    from src.infrastructure.persistence.extraction_log_repository_impl import (
+        ExtractionLogRepositoryImpl,
+    )
+    from src.infrastructure.persistence.sqlalchemy_session_adapter import (
+        SQLAlchemySessionAdapter,
+    )
+    from src.infrastructure.persistence.unit_of_work_impl import UnitOfWorkImpl
+
+    # ステートレスなサービスは全スコープで共有する
+    storage_service = GCSStorageService(
+        bucket_name=bucket_name or os.getenv("GCS_BUCKET_NAME", "sagebase-bucket")
+    )
+    minutes_processing_service = MinutesProcessAgentService(
+        llm_service=GeminiLLMService()
+    )
+    speaker_domain_service = SpeakerDomainService()
+    role_name_mapping_service = BAMLRoleNameMappingService()
+    minutes_divider_service = BAMLMinutesDivider()
+    structured_minutes_source = KokkaiSpeechSource()
+
+    @asynccontextmanager
+    async def scope() -> AsyncIterator[ExecuteMinutesProcessingUseCase]:
+        async with get_async_session() as session:
+            session_adapter = SQLAlchemySessionAdapter(session)
+            update_statement_usecase = UpdateStatementFromExtractionUseCase(
+                conversation_repo=ConversationRepositoryImpl(session=session_adapter),
+                extraction_log_repo=ExtractionLogRepositoryImpl(
+                    session=session_adapter
+                ),
+                session_adapter=session_adapter,
+            )
+            yield ExecuteMinutesProcessingUseCase(
+                speaker_domain_service=speaker_domain_service,
+                minutes_processing_service=minutes_processing_service,
+                storage_service=storage_service,
+                unit_of_work=UnitOfWorkImpl(session=session_adapter),
+                update_statement_usecase=update_statement_usecase,
+                role_name_mapping_service=role_name_mapping_service,
+                minutes_divider_service=minutes_divider_service,
+                structured_minutes_source=structured_minutes_source,
+            )
+
+    return scope
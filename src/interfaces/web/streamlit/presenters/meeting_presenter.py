@@ -6,6 +6,7 @@ handling UI state and coordinating with repositories.
 
 import builtins
 
+from dataclasses import asdict
 from typing import Any
 
 import pandas as pd
@@ -101,90 +102,57 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
         return self.meeting_repo.get_all()
 
     def load_meetings_with_filters(
-        self, governing_body_id: int | None = None, conference_id: int | None = None
+        self,
+        governing_body_id: int | None = None,
+        conference_id: int | None = None,
+        processing_status: str | None = None,
     ) -> list[dict[str, Any]]:
         """Load meetings with optional filters.
 
         Args:
             governing_body_id: Optional governing body filter
             conference_id: Optional conference filter
+            processing_status: Optional processing status filter
 
         Returns:
             List of meeting dictionaries with additional info
         """
-        from src.infrastructure.persistence.conversation_repository_impl import (
-            ConversationRepositoryImpl,
+        meetings, _ = self.load_meetings_page(
+            governing_body_id, conference_id, processing_status
         )
-        from src.infrastructure.persistence.minutes_repository_impl import (
-            MinutesRepositoryImpl,
-        )
-        from src.infrastructure.persistence.repository_adapter import RepositoryAdapter
-
-        # Get all meetings
-        meetings = self.meeting_repo.get_all()
-
-        # Convert to dictionaries with additional info
-        result = []
-        for meeting in meetings:
-            # Get conference and governing body info
-            conference = self.conference_repo.get_by_id(meeting.conference_id)
-            if conference:
-                governing_body = self.governing_body_repo.get_by_id(
-                    conference.governing_body_id
-                )
+        return meetings
 
-                # Apply filters
-                if (
-                    governing_body_id
-                    and conference.governing_body_id != governing_body_id
-                ):
-                    continue
-                if conference_id and meeting.conference_id != conference_id:
-                    continue
-
-                # Get conversation and speaker counts
-                conversation_count = 0
-                speaker_count = 0
-                try:
-                    minutes_repo = RepositoryAdapter(MinutesRepositoryImpl)
-                    minutes = minutes_repo.get_by_meeting(meeting.id)
-                    if minutes and minutes.id:
-                        conversation_repo = RepositoryAdapter(
-                            ConversationRepositoryImpl
-                        )
-                        conversations = conversation_repo.get_by_minutes(minutes.id)
-                        conversation_count = len(conversations)
-                        # Count unique speakers
-                        speaker_ids = {
-                            c.speaker_id for c in conversations if c.speaker_id
-                        }
-                        speaker_count = len(speaker_ids)
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed to get counts for meeting {meeting.id}: {e}"
-                    )
+    def load_meetings_page(
+        self,
+        governing_body_id: int | None = None,
+        conference_id: int | None = None,
+        processing_status: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[builtins.list[dict[str, Any]], int]:
+        """Load one page of meetings with conference info and counters.
 
-                result.append(
-                    {
-                        "id": meeting.id,
-                        "conference_id": meeting.conference_id,
-                        "date": meeting.date,
-                        "url": meeting.url,
-                        "gcs_pdf_uri": meeting.gcs_pdf_uri,
-                        "gcs_text_uri": meeting.gcs_text_uri,
-                        "conference_name": conference.name,
-                        "governing_body_name": governing_body.name
-                        if governing_body
-                        else "",
-                        "governing_body_type": governing_body.type
-                        if governing_body
-                        else "",
-                        "conversation_count": conversation_count,
-                        "speaker_count": speaker_count,
-                    }
-                )
+        Filtering, counting and pagination are done by a single query on
+        the meeting summary read model.
 
-        return result
+        Args:
+            governing_body_id: Optional governing body filter
+            conference_id: Optional conference filter
+            processing_status: Optional processing status filter
+            offset: Number of meetings to skip
+            limit: Maximum number of meetings to return (None for all)
+
+        Returns:
+            Tuple of (meeting dictionaries, total count matching the filters)
+        """
+        summaries, total_count = self.meeting_repo.get_meeting_summaries(
+            conference_id=conference_id,
+            governing_body_id=governing_body_id,
+            processing_status=processing_status,
+            offset=offset,
+            limit=limit,
+        )
+        return [asdict(summary) for summary in summaries], total_count
 
     def get_governing_bodies(self) -> list[dict[str, Any]]:
         """Get all governing bodies.
@@ -403,9 +371,9 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
 
         # Check GCS status
         df["GCS"] = df.apply(
-            lambda row: "✓"
-            if row.get("gcs_pdf_uri") or row.get("gcs_text_uri")
-            else "",
+            lambda row: (
+                "✓" if row.get("gcs_pdf_uri") or row.get("gcs_text_uri") else ""
+            ),
             axis=1,
         )
 
@@ -558,6 +526,9 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
             speaker_domain_service = SpeakerDomainService()
 
             # Initialize role name mapping services
+            from src.infrastructure.external.kokkai_speech_source import (
+                KokkaiSpeechSource,
+            )
             from src.infrastructure.external.minutes_divider.baml_minutes_divider import (  # noqa: E501
                 BAMLMinutesDivider,
             )
@@ -567,6 +538,7 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
 
             role_name_mapping_service = BAMLRoleNameMappingService()
             minutes_divider_service = BAMLMinutesDivider()
+            structured_minutes_source = KokkaiSpeechSource()
 
             # Initialize Unit of Work
             from src.infrastructure.config.async_database import get_async_session
@@ -603,6 +575,7 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
                     update_statement_usecase=update_statement_usecase,
                     role_name_mapping_service=role_name_mapping_service,
                     minutes_divider_service=minutes_divider_service,
+                    structured_minutes_source=structured_minutes_source,
                 )
 
                 # Execute processing
@@ -700,6 +673,27 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
             )
             return WebResponseDTO.error_response(f"発言者抽出に失敗しました: {str(e)}")
 
+    @staticmethod
+    def meeting_status_from_summary(meeting: dict[str, Any]) -> dict[str, bool]:
+        """Derive processing status flags from a meeting summary row.
+
+        Uses the counters already loaded by load_meetings_page, so no
+        additional queries are issued per meeting.
+
+        Args:
+            meeting: Meeting dictionary returned by load_meetings_page
+
+        Returns:
+            Dictionary with the same flags as check_meeting_status
+        """
+        return {
+            "is_scraped": bool(
+                meeting.get("gcs_text_uri") or meeting.get("gcs_pdf_uri")
+            ),
+            "has_conversations": meeting.get("conversation_count", 0) > 0,
+            "has_speakers_linked": meeting.get("speaker_count", 0) > 0,
+        }
+
     async def check_meeting_status(self, meeting_id: int) -> dict[str, bool]:
         """Check processing status for a meeting.
 
@@ -733,13 +727,17 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
 
             if minutes and minutes.id:
                 conversation_repo = RepositoryAdapter(ConversationRepositoryImpl)
-                conversations = await conversation_repo.get_by_minutes(minutes.id)
-                has_conversations = len(conversations) > 0
+                has_conversations = await conversation_repo.exists_by_minutes(
+                    minutes.id
+                )
 
                 # Check if any conversation has speaker_id linked
-                if conversations:
-                    has_speakers_linked = any(
-                        conv.speaker_id is not None for conv in conversations
+                if has_conversations:
+                    has_speakers_linked = (
+                        await conversation_repo.count_distinct_speakers_by_minutes(
+                            minutes.id
+                        )
+                        > 0
                     )
 
             return {
@@ -29,9 +29,13 @@ from src.domain.entities.politician import Politician
 from src.domain.services.parliamentary_group_member_matching_service import (
     ParliamentaryGroupMemberMatchingService,
 )
+from src.domain.services.party_id_resolver import PartyIdResolver
 from src.domain.services.speaker_domain_service import SpeakerDomainService
 from src.infrastructure.di.container import Container
 from src.infrastructure.external.llm_service import GeminiLLMService
+from src.infrastructure.external.politician_matching import (
+    BAMLPoliticianMatchingService,
+)
 from src.infrastructure.persistence.extracted_parliamentary_group_member_repository_impl import (  # noqa: E501
     ExtractedParliamentaryGroupMemberRepositoryImpl,
 )
@@ -90,6 +94,13 @@ class ParliamentaryGroupMemberPresenter(
             politician_repository=self.politician_repo,  # type: ignore
             llm_service=self.llm_service,
             speaker_service=self.speaker_service,
+            politician_matching_service=BAMLPoliticianMatchingService(
+                llm_service=self.llm_service,
+                politician_repository=self.politician_repo,  # type: ignore
+            ),
+            party_id_resolver=PartyIdResolver(
+                self.political_party_repo  # type: ignore
+            ),
         )
 
         # Initialize use cases
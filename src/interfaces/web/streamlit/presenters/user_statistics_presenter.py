@@ -19,7 +19,6 @@ from src.application.dtos.work_history_dto import WorkType
 from src.application.usecases.get_user_statistics_usecase import (
     GetUserStatisticsUseCase,
 )
-from src.application.usecases.get_work_history_usecase import GetWorkHistoryUseCase
 from src.infrastructure.di.container import Container
 
 
@@ -35,13 +34,8 @@ class UserStatisticsPresenter:
     def __init__(self) -> None:
         """プレゼンターを初期化する"""
         container = Container()
-        work_history_usecase = GetWorkHistoryUseCase(
-            speaker_repository=container.repositories.speaker_repository(),
-            parliamentary_group_membership_repository=container.repositories.parliamentary_group_membership_repository(),
-            user_repository=container.repositories.user_repository(),
-        )
         self.user_statistics_usecase = GetUserStatisticsUseCase(
-            work_history_usecase=work_history_usecase
+            work_statistics_repository=container.repositories.work_statistics_repository()
         )
         self.logger = logger
 
@@ -165,6 +159,12 @@ class UserStatisticsPresenter:
         return {
             WorkType.SPEAKER_POLITICIAN_MATCHING: "発言者-政治家紐付け",
             WorkType.PARLIAMENTARY_GROUP_MEMBERSHIP_CREATION: "議員団メンバー作成",
+            WorkType.POLITICIAN_CREATE: "政治家作成",
+            WorkType.POLITICIAN_UPDATE: "政治家更新",
+            WorkType.POLITICIAN_DELETE: "政治家削除",
+            WorkType.PROPOSAL_CREATE: "議案作成",
+            WorkType.PROPOSAL_UPDATE: "議案更新",
+            WorkType.PROPOSAL_DELETE: "議案削除",
         }
 
     def _get_work_type_display_name(self, work_type: str) -> str:
@@ -1,6 +1,6 @@
 """Agent testing module for politician matching.
 
-政治家マッチングAgentのテスト機能を提供します。
+政治家マッチングパイプラインのテスト機能を提供します。
 """
 
 from .agent_tab import render_politician_matching_agent_tab
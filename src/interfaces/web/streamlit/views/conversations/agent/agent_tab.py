@@ -1,6 +1,6 @@
 """Agent tab for politician matching.
 
-政治家マッチングAgentタブのUI実装を提供します。
+政治家マッチングパイプラインタブのUI実装を提供します。
 """
 
 import streamlit as st
@@ -10,27 +10,28 @@ from .tools_test import render_politician_matching_tools_test
 
 
 def render_politician_matching_agent_tab() -> None:
-    """Test PoliticianMatchingAgent (Issue #904).
+    """Test PoliticianMatchingPipeline (Issue #904).
 
-    政治家マッチングAgentのテストタブをレンダリングします。
-    ツール個別テストとAgentテストの2つのサブタブを提供します。
+    政治家マッチングパイプラインのテストタブをレンダリングします。
+    ツール個別テストとパイプラインテストの2つのサブタブを提供します。
     """
-    st.subheader("政治家マッチングAgentテスト")
+    st.subheader("政治家マッチングパイプラインテスト")
 
     st.markdown("""
-    ### PoliticianMatchingAgent の動作確認 (Issue #904)
+    ### PoliticianMatchingPipeline の動作確認 (Issue #904)
 
-    LangGraphのReActエージェントを使用した政治家マッチングをテストします。
-    BAMLをLLM通信層として使用し、反復的推論で高精度なマッチングを実現します。
+    固定手順のパイプラインによる政治家マッチングをテストします。
+    LLMに手順を計画させず、次の処理を決まった順序で1回ずつ実行します。
 
-    **使用するツール:**
-    1. `search_politician_candidates`: 候補検索・スコアリング
-    2. `verify_politician_affiliation`: 所属情報検証
-    3. `match_politician_with_baml`: BAMLマッチング実行
+    **処理の流れ:**
+    1. 候補検索・スコアリング
+    2. 正規化後の名前が一致する候補が1名ならLLMなしで確定
+    3. 上位候補の所属情報をまとめて取得
+    4. BAML（MatchPolitician）で最終判定（LLM呼び出しは最大1回）
     """)
 
-    # Create sub-tabs for tools and agent test
-    sub_tabs = st.tabs(["ツール個別テスト", "Agentテスト"])
+    # Create sub-tabs for tools and pipeline test
+    sub_tabs = st.tabs(["ツール個別テスト", "パイプラインテスト"])
 
     with sub_tabs[0]:
         render_politician_matching_tools_test()
@@ -1,6 +1,6 @@
 """Agent test module for politician matching.
 
-PoliticianMatchingAgentのテスト機能を提供します。
+PoliticianMatchingPipelineのテスト機能を提供します。
 """
 
 import asyncio
@@ -13,16 +13,16 @@ from src.infrastructure.di.container import Container
 
 
 def render_politician_matching_agent_test() -> None:
-    """Test PoliticianMatchingAgent.
+    """Test PoliticianMatchingPipeline.
 
-    PoliticianMatchingAgentのテスト画面をレンダリングします。
-    ReActパターンで動作し、3つのツールを使って反復的にマッチングを行います。
+    PoliticianMatchingPipelineのテスト画面をレンダリングします。
+    候補検索→所属情報の取得→BAML判定の固定手順でマッチングを行います。
     """
-    st.markdown("### PoliticianMatchingAgent の実行")
+    st.markdown("### PoliticianMatchingPipeline の実行")
 
     st.info(
-        "このエージェントはReActパターンで動作し、"
-        "3つのツールを使って反復的にマッチングを行います。"
+        "候補検索→所属情報の取得→BAML判定の固定手順でマッチングを行います。"
+        "名前が一致する候補が1名に定まる場合はLLMを呼び出しません。"
     )
 
     speaker_name = st.text_input(
@@ -50,12 +50,12 @@ def render_politician_matching_agent_test() -> None:
 
     with st.expander("詳細設定"):
         st.info(
-            "エージェントの設定（現在は固定値）\n\n"
-            "- MAX_REACT_STEPS: 10\n"
-            "- 信頼度閾値: 0.7"
+            "パイプラインの設定（現在は固定値）\n\n- 最大候補数: 20\n- 信頼度閾値: 0.7"
         )
 
-    if st.button("政治家マッチングAgentを実行", type="primary", key="pol_agent_btn"):
+    if st.button(
+        "政治家マッチングパイプラインを実行", type="primary", key="pol_agent_btn"
+    ):
         if not speaker_name:
             st.warning("発言者名を入力してください")
             return
@@ -70,16 +70,16 @@ def _execute_agent(
     speaker_type: str,
     speaker_party: str,
 ) -> None:
-    """Execute the politician matching agent.
+    """Execute the politician matching pipeline.
 
     Args:
         speaker_name: 発言者名
         speaker_type: 発言者種別
         speaker_party: 発言者政党
     """
-    with st.spinner("エージェントを実行中..."):
+    with st.spinner("パイプラインを実行中..."):
         try:
-            # DIコンテナからエージェントを取得（Clean Architecture準拠）
+            # DIコンテナからパイプラインを取得（Clean Architecture準拠）
             container = Container.create_for_environment()
             agent = container.use_cases.politician_matching_agent()
 
@@ -102,10 +102,10 @@ def _execute_agent(
 
 
 def _display_agent_results(result: dict[str, Any]) -> None:
-    """Display agent execution results.
+    """Display pipeline execution results.
 
     Args:
-        result: エージェント実行結果
+        result: パイプライン実行結果
     """
     st.markdown("### マッチング結果")
 
@@ -152,15 +152,16 @@ def _display_usage_guide() -> None:
 
     1. **発言者名** を入力（例: 田中太郎）
     2. 必要に応じて **発言者種別** と **発言者政党** を入力
-    3. **「政治家マッチングAgentを実行」** ボタンをクリック
+    3. **「政治家マッチングパイプラインを実行」** ボタンをクリック
 
     **動作の流れ:**
-    1. エージェントが候補検索ツールで政治家候補を取得
-    2. 上位候補の所属情報を検証
-    3. BAMLを使用して最終的なマッチング判定
-    4. 信頼度0.7以上ならマッチング成功
+    1. 名前の類似度と政党で政治家候補を検索
+    2. 名前が一致する候補が1名ならLLMを使わずに確定
+    3. 上位候補の所属情報をまとめて取得
+    4. BAMLを使用して最終的なマッチング判定（LLM呼び出しは最大1回）
+    5. 信頼度0.7以上ならマッチング成功
 
     **注意:**
-    - エージェントの実行には数秒〜十数秒かかることがあります
+    - LLMを呼び出す場合は数秒かかることがあります
     - LLM API（Gemini）を使用するため、API キーが必要です
     """)
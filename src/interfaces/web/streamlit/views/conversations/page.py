@@ -18,7 +18,7 @@ def render_conversations_page() -> None:
 
     発言・発言者管理のメインページをレンダリングします。
     6つのタブ（発言一覧、検索・フィルタ、発言者一覧、発言マッチング、
-    統計情報、政治家マッチングAgent）を提供します。
+    統計情報、政治家マッチングパイプライン）を提供します。
     """
     st.header("発言・発言者管理")
     st.markdown("発言記録と発言者の情報を管理します")
@@ -31,7 +31,7 @@ def render_conversations_page() -> None:
             "発言者一覧",
             "発言マッチング",
             "統計情報",
-            "政治家マッチングAgent",
+            "政治家マッチングパイプライン",
         ]
     )
 
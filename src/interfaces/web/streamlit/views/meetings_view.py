@@ -13,6 +13,9 @@ from src.interfaces.web.streamlit.presenters.meeting_presenter import MeetingPre
 from src.interfaces.web.streamlit.utils.error_handler import handle_ui_error
 
 
+MEETINGS_PAGE_SIZE = 50
+
+
 def render_meetings_page() -> None:
     """Render the meetings management page."""
     st.title("会議管理")
@@ -86,10 +89,28 @@ def render_meetings_list_tab(presenter: MeetingPresenter) -> None:
             if st.button("検索", type="primary"):
                 st.rerun()
 
-        # Load and display meetings
-        meetings = presenter.load_meetings_with_filters(
-            selected_gb_id, selected_conf_id
+        # Go back to the first page whenever the filters change
+        filters = (selected_gb_id, selected_conf_id)
+        if st.session_state.get("meetings_filters") != filters:
+            st.session_state["meetings_filters"] = filters
+            st.session_state["meetings_page"] = 1
+
+        # Load one page of meetings (filtering and paging are done in SQL)
+        page = st.session_state.get("meetings_page", 1)
+        meetings, total_count = presenter.load_meetings_page(
+            selected_gb_id,
+            selected_conf_id,
+            offset=(page - 1) * MEETINGS_PAGE_SIZE,
+            limit=MEETINGS_PAGE_SIZE,
         )
+        total_pages = max(1, -(-total_count // MEETINGS_PAGE_SIZE))
+        if total_pages > 1:
+            st.number_input(
+                f"ページ（全{total_pages}ページ・{total_count}件）",
+                min_value=1,
+                max_value=total_pages,
+                key="meetings_page",
+            )
 
         if meetings:
             # Convert to DataFrame for display
@@ -172,11 +193,8 @@ def render_meeting_row(
 
     with col8:
         # Get processing status for action labels
-        import asyncio
-
         meeting_id = display_row["ID"]
-        loop = asyncio.get_event_loop()
-        status = loop.run_until_complete(presenter.check_meeting_status(meeting_id))
+        status = presenter.meeting_status_from_summary(meeting_data)
 
         # Create popover menu for all actions
         with st.popover("⚙️ 操作", use_container_width=True):
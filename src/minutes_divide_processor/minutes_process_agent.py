@@ -18,9 +18,17 @@ from .models import (
 )
 
 from src.domain.services.interfaces.llm_service import ILLMService
-from src.infrastructure.config.settings import get_settings
+from src.domain.services.name_normalizer import get_name_normalizer
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
 from src.infrastructure.external.minutes_divider.factory import MinutesDividerFactory
+from src.infrastructure.external.minutes_divider.speech_boundary_extractor import (
+    BoundaryExtractionResult,
+    SpeechBoundaryExtractor,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    BAML_DEFAULT_MODEL,
+    llm_rate_limit,
+)
 
 
 logger = structlog.get_logger(__name__)
@@ -50,30 +58,24 @@ class MinutesProcessAgent:
             llm_service=llm_service, k=k or 5
         )
 
-        # SpeechExtractionAgentの初期化（LangGraphサブグラフとして使用）
-        # 循環インポートを避けるため、ここでインポート
-        from langchain_google_genai import ChatGoogleGenerativeAI
-
-        from src.infrastructure.external.langgraph_speech_extraction_agent import (
-            SpeechExtractionAgent,
-        )
-
-        llm = ChatGoogleGenerativeAI(model=get_settings().llm_model)
-        self.speech_extraction_agent = SpeechExtractionAgent(llm)
+        # 発言境界の抽出（ルールベースで候補を採点し、曖昧な場合のみLLMを1回呼ぶ）
+        self.speech_boundary_extractor = SpeechBoundaryExtractor(self.minutes_divider)
 
         self.in_memory_store = InMemoryStore()
         self.graph = self._create_graph()
 
     def _create_graph(self) -> Any:
-        """グラフの初期化（SpeechExtractionAgentサブグラフを統合）
+        """グラフの初期化
 
         新しいフロー:
         process_minutes → extract_speech_boundary → divide_minutes_to_keyword
-        → divide_minutes_to_string → check_length → divide_speech (loop)
+        → divide_minutes_to_string → plan_chunks → divide_speech (loop)
         → normalize_speaker_names → END
 
-        extract_speech_boundaryノードでSpeechExtractionAgentサブグラフを実行し、
+        extract_speech_boundaryノードでSpeechBoundaryExtractorを実行し、
         議事録から出席者部分と発言部分を分離します。
+        plan_chunksノードで、見積もりトークン数に基づいてセクションを
+        DivideSpeechの呼び出し単位に分割・結合します。
         normalize_speaker_namesノードでLLMを使用して発言者名を正規化します
         （Issue #946）。
         """
@@ -86,7 +88,7 @@ class MinutesProcessAgent:
         workflow.add_node("extract_speech_boundary", self._extract_speech_boundary)  # type: ignore[arg-type]  # 新規追加
         workflow.add_node("divide_minutes_to_keyword", self._divide_minutes_to_keyword)  # type: ignore[arg-type]
         workflow.add_node("divide_minutes_to_string", self._divide_minutes_to_string)  # type: ignore[arg-type]
-        workflow.add_node("check_length", self._check_length)  # type: ignore[arg-type]
+        workflow.add_node("plan_chunks", self._plan_chunks)  # type: ignore[arg-type]
         workflow.add_node("divide_speech", self._divide_speech)  # type: ignore[arg-type]
         workflow.add_node("normalize_speaker_names", self._normalize_speaker_names)  # type: ignore[arg-type]  # Issue #946
 
@@ -97,8 +99,8 @@ class MinutesProcessAgent:
         # 境界抽出後にキーワード分割
         workflow.add_edge("extract_speech_boundary", "divide_minutes_to_keyword")
         workflow.add_edge("divide_minutes_to_keyword", "divide_minutes_to_string")
-        workflow.add_edge("divide_minutes_to_string", "check_length")
-        workflow.add_edge("check_length", "divide_speech")
+        workflow.add_edge("divide_minutes_to_string", "plan_chunks")
+        workflow.add_edge("plan_chunks", "divide_speech")
         workflow.add_conditional_edges(
             "divide_speech",
             # indexは1から始まるので、<= で比較する必要がある
@@ -130,9 +132,20 @@ class MinutesProcessAgent:
         return memory_id
 
     async def _process_minutes(self, state: MinutesProcessState) -> dict[str, str]:
-        """議事録の前処理のみを行う（境界検出はextract_speech_boundaryサブグラフに移譲）"""
+        """議事録の前処理を行う
+
+        境界が検出済みの場合は、前処理で位置がずれる前に元のテキストを境界で分割し、
+        発言部分のみを前処理する。未検出の場合の境界検出は
+        extract_speech_boundaryノードに移譲する。
+        """
+        original_minutes = state.original_minutes
+        if state.attendee_boundary is not None:
+            _, original_minutes = self.minutes_divider.split_minutes_by_boundary(
+                original_minutes, state.attendee_boundary
+            )
+
         # 議事録の文字列に対する前処理を行う
-        processed_minutes = self.minutes_divider.pre_process(state.original_minutes)
+        processed_minutes = self.minutes_divider.pre_process(original_minutes)
 
         # 前処理済み議事録をメモリに保存
         memory = {"processed_minutes": processed_minutes}
@@ -142,12 +155,10 @@ class MinutesProcessAgent:
     async def _extract_speech_boundary(
         self, state: MinutesProcessState
     ) -> dict[str, str]:
-        """発言境界を抽出（SpeechExtractionAgentサブグラフを使用）
+        """発言境界を抽出（SpeechBoundaryExtractorを使用）
 
-        LangGraphのサブグラフ統合パターンに従い、以下を実行：
-        1. 親グラフの状態からサブグラフの入力を構築
-        2. サブグラフを invoke() で実行
-        3. サブグラフの出力を親グラフの状態に変換
+        境界の候補をルールベースで採点し、曖昧な場合のみLLMを1回呼び出します。
+        抽出結果をMinutesBoundaryに変換し、前処理済み議事録を分割します。
         """
         # 前処理済み議事録を取得
         memory_data = self._get_from_memory(
@@ -160,37 +171,26 @@ class MinutesProcessAgent:
         if not isinstance(processed_minutes, str):
             raise TypeError("processed_minutes must be a string")
 
-        # ReActエージェントには初期メッセージが必要
-        from langchain_core.messages import HumanMessage
-
-        initial_message = HumanMessage(
-            content=(
-                f"この議事録から発言部分の開始境界を検出してください。"
-                f"テキスト長: {len(processed_minutes)}文字"
+        if state.attendee_boundary is not None:
+            # 境界は検出済みで、前処理済み議事録は既に発言部分のみ
+            logger.info(
+                "検出済みの境界を使用するため境界抽出をスキップ",
+                boundary_type=state.attendee_boundary.boundary_type,
+                confidence=state.attendee_boundary.confidence,
             )
-        )
-
-        # サブグラフを実行（状態変換: MinutesProcessState → SpeechExtractionAgentState）
-        # SpeechExtractionAgent.compile()で取得したサブグラフを invoke
-        compiled_subgraph = self.speech_extraction_agent.compile()
-        raw_result = await compiled_subgraph.ainvoke(
-            {
-                "minutes_text": processed_minutes,
-                "boundary_candidates": [],
-                "verified_boundaries": [],
-                "current_position": 0,
-                "messages": [initial_message],
-                "remaining_steps": 10,  # MAX_REACT_STEPS
-                "error_message": None,
+            memory = {
+                "boundary_result": None,
+                "boundary": state.attendee_boundary,
+                "speech_part": processed_minutes,
             }
+            memory_id = self._put_to_memory("boundary_extraction", memory)
+            return {"boundary_extraction_result_memory_id": memory_id}
+
+        boundary_result = await self.speech_boundary_extractor.extract_boundaries(
+            processed_minutes
         )
-        # ainvoke()の戻り値は辞書型なので、必要なフィールドを抽出
-        boundary_result = {
-            "verified_boundaries": raw_result.get("verified_boundaries", []),
-            "error_message": raw_result.get("error_message"),
-        }
 
-        # サブグラフの出力をMinutesBoundaryに変換
+        # 抽出結果をMinutesBoundaryに変換
         boundary = self._convert_boundary_result(boundary_result)
 
         # 境界で議事録を分割
@@ -209,15 +209,15 @@ class MinutesProcessAgent:
         return {"boundary_extraction_result_memory_id": memory_id}
 
     def _convert_boundary_result(
-        self, boundary_result: dict[str, Any]
+        self, boundary_result: BoundaryExtractionResult
     ) -> MinutesBoundary:
         """BoundaryExtractionResultをMinutesBoundaryに変換
 
-        SpeechExtractionAgentの出力形式を、
+        SpeechBoundaryExtractorの出力形式を、
         既存のMinutesDividerが期待する形式に変換します。
 
         Args:
-            boundary_result: SpeechExtractionAgentからの境界抽出結果
+            boundary_result: SpeechBoundaryExtractorからの境界抽出結果
 
         Returns:
             MinutesBoundary: 変換された境界情報
@@ -236,8 +236,7 @@ class MinutesProcessAgent:
             boundary_result["verified_boundaries"], key=lambda b: b["confidence"]
         )
 
-        # 境界位置の前後のテキストを構築（｜境界｜マーカー形式）
-        # Note: 実際の位置情報が必要な場合は、元のテキストから抽出する必要がある
+        # 分割はboundary_positionで行う（boundary_textは表示用）
         boundary_text = f"｜境界｜ (position: {best_boundary['position']})"
 
         return MinutesBoundary(
@@ -245,7 +244,8 @@ class MinutesProcessAgent:
             boundary_text=boundary_text,
             boundary_type=best_boundary["boundary_type"],  # type: ignore[arg-type]
             confidence=best_boundary["confidence"],
-            reason=f"SpeechExtractionAgent検出: {best_boundary['boundary_type']}",
+            reason=f"境界抽出: {best_boundary['boundary_type']}",
+            boundary_position=best_boundary["position"],
         )
 
     async def _divide_minutes_to_keyword(
@@ -292,7 +292,13 @@ class MinutesProcessAgent:
         memory_id = self._put_to_memory(namespace="section_string_list", memory=memory)
         return {"section_string_list_memory_id": memory_id}
 
-    def _check_length(self, state: MinutesProcessState) -> dict[str, str]:
+    def _plan_chunks(self, state: MinutesProcessState) -> dict[str, Any]:
+        """セクションをDivideSpeechの呼び出し単位に分割・結合する
+
+        長すぎるセクションはトークン数の上限内に収まるように分割し、
+        LLMで処理する小さなセクションは連続するものをまとめます。
+        divide_speechのループ回数は計画後のセクション数になります。
+        """
         memory_id = state.section_string_list_memory_id
         memory_data = self._get_from_memory("section_string_list", memory_id)
         if memory_data is None or "section_string_list" not in memory_data:
@@ -302,16 +308,21 @@ class MinutesProcessAgent:
         if not isinstance(section_string_list, SectionStringList):
             raise TypeError("section_string_list must be a SectionStringList instance")
 
-        # 文字列のバイト数をチェックする
-        redivide_section_string_list = self.minutes_divider.check_length(
+        planned_section_string_list = self.minutes_divider.plan_chunks(
             section_string_list
         )
-        memory = {"redivide_section_string_list": redivide_section_string_list}
-        memory_id = self._put_to_memory(
-            namespace="redivide_section_string_list", memory=memory
+        memory = {"section_string_list": planned_section_string_list}
+        memory_id = self._put_to_memory(namespace="section_string_list", memory=memory)
+        section_list_length = len(planned_section_string_list.section_string_list)
+        logger.debug(
+            "チャンク計画完了",
+            section_count=len(section_string_list.section_string_list),
+            chunk_count=section_list_length,
         )
-        logger.debug("セクション長チェック完了")
-        return {"redivide_section_string_list_memory_id": memory_id}
+        return {
+            "section_string_list_memory_id": memory_id,
+            "section_list_length": section_list_length,
+        }
 
     async def _divide_speech(self, state: MinutesProcessState) -> dict[str, Any]:
         memory_id = state.section_string_list_memory_id
@@ -382,7 +393,21 @@ class MinutesProcessAgent:
             )
         incremented_index = state.index + 1
         logger.debug("発言分割インデックス更新", next_index=incremented_index)
-        return {"divided_speech_list_memory_id": memory_id, "index": incremented_index}
+
+        # 分割方法ごとのセクション数を集計（LLMを使わずに処理できた割合の算出用）
+        divide_method = (
+            speaker_and_speech_content_list.divide_method
+            if speaker_and_speech_content_list is not None
+            else "skipped"
+        )
+        return {
+            "divided_speech_list_memory_id": memory_id,
+            "index": incremented_index,
+            "rule_based_section_count": state.rule_based_section_count
+            + (1 if divide_method == "rule_based" else 0),
+            "llm_section_count": state.llm_section_count
+            + (1 if divide_method == "llm" else 0),
+        }
 
     def _normalize_speaker_name_rule_based(
         self,
@@ -402,7 +427,7 @@ class MinutesProcessAgent:
             return ("", False, "empty")
 
         # 先頭の記号を除去（○◆◇■□●など）
-        cleaned = re.sub(r"^[○◆◇■□●◎△▲▽▼☆★]+", "", speaker).strip()
+        cleaned = get_name_normalizer().strip_speaker_markers(speaker)
 
         # 括弧内の人名を抽出（全角・半角両対応）
         # パターン: 役職（人名）、役職(人名)
@@ -477,29 +502,7 @@ class MinutesProcessAgent:
 
     def _remove_honorifics(self, name: str) -> str:
         """敬称を除去する（複数の敬称にも対応）。"""
-        honorifics = [
-            "君",
-            "氏",
-            "議員",
-            "委員",
-            "参考人",
-            "証人",
-            "説明員",
-            "さん",
-            "様",
-            "先生",
-        ]
-        result = name
-        # 複数の敬称がネストしている場合にも対応（例: 「山田太郎議員先生」）
-        changed = True
-        while changed:
-            changed = False
-            for h in honorifics:
-                if result.endswith(h):
-                    result = result[: -len(h)]
-                    changed = True
-                    break
-        return result.strip()
+        return get_name_normalizer().strip_honorifics(name)
 
     async def _normalize_speaker_names(
         self, state: MinutesProcessState
@@ -548,10 +551,11 @@ class MinutesProcessAgent:
         # まずLLMで正規化を試みる
         try:
             logger.debug("LLMベース正規化を試行")
-            normalized_results = await b.NormalizeSpeakerNames(
-                speakers=unique_speakers,
-                role_name_mappings=state.role_name_mappings,
-            )
+            async with llm_rate_limit(BAML_DEFAULT_MODEL, *unique_speakers):
+                normalized_results = await b.NormalizeSpeakerNames(
+                    speakers=unique_speakers,
+                    role_name_mappings=state.role_name_mappings,
+                )
             logger.debug("LLM正規化結果", result_count=len(normalized_results))
 
             if len(normalized_results) == len(unique_speakers):
@@ -662,6 +666,7 @@ class MinutesProcessAgent:
         self,
         original_minutes: str,
         role_name_mappings: dict[str, str] | None = None,
+        attendee_boundary: MinutesBoundary | None = None,
     ) -> list[SpeakerAndSpeechContent]:
         """議事録を処理し、発言者名を正規化した発言リストを返す。
 
@@ -669,6 +674,8 @@ class MinutesProcessAgent:
             original_minutes: 元の議事録テキスト
             role_name_mappings: 役職-人名マッピング（例: {"議長": "伊藤条一"}）
                 発言者名が役職のみの場合に実名に変換（Issue #946）
+            attendee_boundary: original_minutesで検出済みの出席者/発言境界。
+                指定した場合はSpeechBoundaryExtractorによる境界抽出を行わない
 
         Returns:
             list[SpeakerAndSpeechContent]: 正規化された発言リスト
@@ -677,12 +684,27 @@ class MinutesProcessAgent:
         initial_state = MinutesProcessState(
             original_minutes=original_minutes,
             role_name_mappings=role_name_mappings,
+            attendee_boundary=attendee_boundary,
         )
         # グラフの実行
         final_state = await self.graph.ainvoke(
             initial_state, config={"recursion_limit": 300, "thread_id": "example-1"}
         )
 
+        rule_based_sections = final_state.get("rule_based_section_count", 0)
+        llm_sections = final_state.get("llm_section_count", 0)
+        divided_sections = rule_based_sections + llm_sections
+        logger.info(
+            "発言分割統計",
+            rule_based_sections=rule_based_sections,
+            llm_sections=llm_sections,
+            rule_based_ratio=(
+                round(rule_based_sections / divided_sections, 3)
+                if divided_sections
+                else 0.0
+            ),
+        )
+
         # 正規化済み発言リストを取得（Issue #946）
         memory_id = final_state["normalized_speech_list_memory_id"]
         memory_data = self._get_from_memory("normalized_speech_list", memory_id)
@@ -20,12 +20,28 @@ class SectionInfoList(BaseModel):
     )
 
 
+class PackedSection(BaseModel):
+    chapter_number: int = Field(..., description="まとめる前のセクションの番号")
+    sub_chapter_number: int = Field(
+        ..., description="まとめる前のセクションの再分割番号"
+    )
+    start: int = Field(..., description="まとめた文字列内でのセクションの開始位置")
+
+
 class SectionString(BaseModel):
     chapter_number: int = Field(
         default=1, description="分割した文字列を前から順に割り振った番号"
     )
     sub_chapter_number: int = Field(default=1, description="再分割した場合の文字列番号")
     section_string: str = Field(..., description="分割した文字列")
+    packed_sections: list[PackedSection] = Field(
+        default_factory=lambda: [],
+        description="複数のセクションをまとめた場合の各セクションの番号と開始位置",
+    )
+    context_length: int = Field(
+        default=0,
+        description="先頭に付けた直前のチャンクの文脈の文字数（この範囲の発言は出力しない）",
+    )
 
 
 class SectionStringList(BaseModel):
@@ -42,6 +58,9 @@ class RedivideSectionString(BaseModel):
         ..., description="再分割対象の文字列のバイト数"
     )
     original_index: int = Field(default=1, description="元のindex")
+    divide_count: int = Field(
+        default=2, description="トークン数の上限内に収めるために必要な分割数"
+    )
 
 
 class RedivideSectionStringList(BaseModel):
@@ -80,6 +99,10 @@ class SpeakerAndSpeechContentList(BaseModel):
     speaker_and_speech_content_list: list[SpeakerAndSpeechContent] = Field(
         default_factory=lambda: [], description="各発言者と発言内容のリスト"
     )
+    divide_method: Literal["rule_based", "llm", "skipped"] = Field(
+        default="llm",
+        description="分割方法（rule_based: ルールベース, llm: LLM, skipped: 対象外）",
+    )
 
 
 class MinutesBoundary(BaseModel):
@@ -96,6 +119,12 @@ class MinutesBoundary(BaseModel):
         0.0, description="境界検出の信頼度（0.0-1.0）", ge=0.0, le=1.0
     )
     reason: str = Field("", description="境界判定の理由")
+    boundary_position: int | None = Field(
+        None, description="発言部分の開始位置（文字インデックス、特定できた場合のみ）"
+    )
+    detection_method: Literal["rule_based", "llm", "cached"] = Field(
+        "llm", description="境界の検出方法"
+    )
 
 
 class AttendeesMapping(BaseModel):
@@ -118,6 +147,10 @@ class MinutesProcessState(BaseModel):
     role_name_mappings: dict[str, str] | None = Field(
         default=None, description="役職-人名マッピング（例: {'議長': '伊藤条一'}）"
     )
+    attendee_boundary: MinutesBoundary | None = Field(
+        default=None,
+        description="検出済みの出席者/発言境界（指定時は境界抽出をスキップ）",
+    )
     processed_minutes_memory_id: str = Field(
         default="", description="LLMに渡す前処理を施した議事録を保存したメモリID"
     )
@@ -139,7 +172,11 @@ class MinutesProcessState(BaseModel):
     )
     section_list_length: int = Field(default=0, description="分割できたsectionnの数")
     index: int = Field(default=1, description="現在処理しているsection数")
+    rule_based_section_count: int = Field(
+        default=0, description="LLMを使わずルールベースで分割できたsection数"
+    )
+    llm_section_count: int = Field(default=0, description="LLMで分割したsection数")
     boundary_extraction_result_memory_id: str = Field(
         default="",
-        description="発言境界抽出結果（SpeechExtractionAgent）を保存したメモリID",
+        description="発言境界抽出結果（SpeechBoundaryExtractor）を保存したメモリID",
     )
@@ -29,6 +29,16 @@ from src.infrastructure.external.llm_errors import (
 )
 from src.infrastructure.external.prompt_loader import PromptLoader
 from src.infrastructure.external.prompt_manager import PromptManager
+from src.infrastructure.resilience.circuit_breaker import (
+    AsyncCircuitBreaker,
+    CircuitBreakerConfig,
+    get_async_circuit_breaker,
+)
+from src.infrastructure.resilience.rate_limiter import (
+    get_llm_rate_limiter,
+    llm_rate_limit,
+)
+from src.infrastructure.resilience.retry import is_transient_error, retry_async
 
 
 logger = logging.getLogger(__name__)
@@ -80,8 +90,7 @@ class LLMService:
         self._llm = None
         self._structured_llms: dict[str, Any] = {}
         self._request_count = 0
-        self._last_request_time = 0
-        self._rate_limit_delay = 1.0  # Minimum seconds between requests
+        self._last_request_time = 0.0
 
         # Prompt management
         self.prompt_loader = prompt_loader or PromptLoader.get_default_instance()
@@ -128,15 +137,25 @@ class LLMService:
 
         return self._structured_llms[schema_name]
 
+    @property
+    def circuit_breaker(self) -> AsyncCircuitBreaker:
+        """Circuit breaker shared by every async caller of this model"""
+        return get_async_circuit_breaker(
+            f"llm:{self.model_name}",
+            CircuitBreakerConfig(failure_threshold=5, timeout=30),
+            is_failure=is_transient_error,
+        )
+
     def _handle_rate_limit(self):
-        """Handle rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """Handle rate limiting for synchronous calls
 
-        if time_since_last < self._rate_limit_delay:
-            sleep_time = self._rate_limit_delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        Waits on the per-model limiter shared with async callers instead of
+        enforcing a fixed per-instance delay. Async code must not call this;
+        it uses llm_rate_limit, which waits without blocking the event loop.
+        """
+        wait = get_llm_rate_limiter(self.model_name).acquire_blocking()
+        if wait > 0:
+            logger.debug(f"Rate limiting: waited {wait:.2f}s")
 
         self._last_request_time = time.time()
         self._request_count += 1
@@ -353,12 +372,52 @@ class LLMService:
         chain = self.create_simple_chain(
             prompt_key=prompt_key, output_schema=output_schema, use_passthrough=False
         )
+        return await self.ainvoke_with_retry(chain, variables)
 
-        self._handle_rate_limit()
+    async def ainvoke_with_retry(
+        self,
+        chain: Runnable[dict[str, Any], Any],
+        input_data: dict[str, Any],
+        max_retries: int = 3,
+    ) -> Any:
+        """
+        Async invoke a chain with retry logic, rate limiting and circuit breaking
+
+        Backoff uses asyncio.sleep with full jitter, so a slow or throttled
+        upstream never blocks other tasks on the event loop.
+
+        Args:
+            chain: The chain to invoke
+            input_data: Input data for the chain
+            max_retries: Maximum number of attempts
+
+        Returns:
+            Result from the chain
+        """
+
+        async def invoke() -> Any:
+            try:
+                async with llm_rate_limit(
+                    self.model_name, *(str(value) for value in input_data.values())
+                ):
+                    self._request_count += 1
+                    return await chain.ainvoke(input_data)
+            except Exception as e:
+                raise self._convert_exception(e) from e
 
         try:
-            result = await chain.ainvoke(variables)
-            return result
+            return await retry_async(
+                lambda: self.circuit_breaker.async_call(invoke),
+                max_attempts=max_retries,
+                base_delay=4.0,
+                max_delay=60.0,
+                should_retry=lambda e: isinstance(
+                    e, LLMRateLimitError | LLMTimeoutError
+                ),
+            )
+        except LLMError as e:
+            logger.error(f"Error invoking chain: {e}")
+            raise
         except Exception as e:
             llm_error = self._convert_exception(e)
             logger.error(f"Error invoking chain: {llm_error}")
@@ -0,0 +1,112 @@
+"""国会会議録検索システムAPI用スクレイパー
+
+国会会議録検索システムの発言APIから、発言単位の構造化レコードで議事録を取得します。
+KokkaiScraperと違いブラウザを起動せず、発言の順序と区切りをそのまま
+SpeakerDataに保持します。URLに会議録ID（minId）が含まれる場合に使用します。
+"""
+
+import logging
+
+from datetime import datetime
+
+from .base_scraper import BaseScraper
+from .exceptions import ScraperParseError
+from .models import MinutesData, SpeakerData
+
+from src.infrastructure.external.kokkai_speech_client import (
+    KokkaiMeetingRecord,
+    KokkaiSpeechClient,
+    extract_issue_id,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class KokkaiApiScraper(BaseScraper):
+    """国会会議録検索システムAPI用スクレイパー"""
+
+    def __init__(self, client: KokkaiSpeechClient | None = None):
+        """
+        Args:
+            client: 発言APIクライアント（並列数の上限を共有するため使い回す）
+        """
+        super().__init__()
+        self.client = client or KokkaiSpeechClient()
+
+    async def fetch_minutes(self, url: str) -> MinutesData | None:
+        """議事録を取得"""
+        issue_id = extract_issue_id(url)
+        if not issue_id:
+            raise ScraperParseError(f"No minutes ID found in URL: {url}")
+
+        try:
+            meeting = await self.client.fetch_meeting(issue_id)
+        except Exception as e:
+            logger.error(f"Error fetching minutes from API: {e}")
+            raise ScraperParseError(
+                f"Failed to fetch minutes from kokkai.ndl.go.jp API: {url} - {str(e)}"
+            ) from e
+
+        return self.to_minutes_data(meeting, url)
+
+    def to_minutes_data(self, meeting: KokkaiMeetingRecord, url: str) -> MinutesData:
+        """発言APIの会議録をMinutesDataに変換
+
+        本文は会議録情報を含む全発言を発言順につなげたもので、
+        SpeakerDataは発言ごとに1件（発言順つき）作成します。
+        """
+        speakers = [
+            SpeakerData(
+                name=record.speaker,
+                content=record.text,
+                role=record.speaker_position or record.speaker_role,
+                speech_order=record.speech_order,
+            )
+            for record in meeting.speeches
+            if record.speech_order >= 1 and record.speaker and record.text
+        ]
+        content = "\n\n".join(
+            record.speech.strip() for record in meeting.speeches if record.speech
+        )
+
+        metadata = {
+            "title": meeting.title,
+            "issue_id": meeting.issue_id,
+            "院": meeting.name_of_house,
+            "委員会": meeting.name_of_meeting,
+            "号数": meeting.issue,
+        }
+        if meeting.session:
+            metadata["国会"] = f"第{meeting.session}回国会"
+
+        # KokkaiScraperと同じく会議録IDを council_id と schedule_id に分割
+        # 例: 121705253X00320250423 -> kokkai_121705253, X00320250423
+        issue_id = meeting.issue_id
+        return MinutesData(
+            url=url,
+            title=meeting.title or "国会議事録",
+            date=(
+                datetime.combine(meeting.date, datetime.min.time())
+                if meeting.date
+                else None
+            ),
+            content=content,
+            speakers=speakers,
+            council_id=f"kokkai_{issue_id[:9]}",
+            schedule_id=issue_id[9:],
+            scraped_at=datetime.now(),
+            pdf_url=meeting.pdf_url,
+            text_view_url=meeting.meeting_url,
+            metadata=metadata,
+        )
+
+    async def extract_minutes_text(self, html_content: str) -> str:
+        """HTMLから議事録テキストを抽出（BaseScraper abstract method）"""
+        # この実装はAPIのJSONを使用するため、fetch_minutesメソッド内で処理
+        return ""
+
+    async def extract_speakers(self, html_content: str) -> list[SpeakerData]:
+        """HTMLから発言者情報を抽出（BaseScraper abstract method）"""
+        # この実装はAPIのJSONを使用するため、fetch_minutesメソッド内で処理
+        return []
@@ -1,15 +1,22 @@
 """国会会議録検索システム用スクレイパー
 
 国会会議録検索システム（kokkai.ndl.go.jp）から議事録を取得するスクレイパー
+
+検索システムはSPAのためPlaywrightで描画しますが、ブラウザからは描画済みのHTMLを
+1回取得するだけで、表・発言者・会議情報の抽出はBeautifulSoupで行います。
+発言数が多い会議でもブラウザとの通信回数は増えません。
 """
 
 import asyncio
+import copy
 import logging
 import re
 
 from datetime import datetime
 from typing import Any
 
+from bs4 import BeautifulSoup, Tag
+from bs4.element import NavigableString
 from playwright.async_api import Page, async_playwright
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
@@ -17,11 +24,47 @@ from .base_scraper import BaseScraper
 from .exceptions import ScraperConnectionError, ScraperParseError
 from .models import MinutesData, SpeakerData
 
+from src.domain.services.name_normalizer import get_name_normalizer
 from src.infrastructure.config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+# 発言者名の括弧内の役職: 例「山田太郎君（内閣総理大臣）」
+_ROLE_IN_PARENTHESES_PATTERN = re.compile(r"[（(](.+?)[）)]")
+
+# ブラウザが前後で改行するブロック要素
+_BLOCK_TAGS = [
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "footer",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "li",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tr",
+    "ul",
+]
+
+# HTMLで1つの空白にまとめられる空白文字（全角スペースは含まない）
+_HTML_WHITESPACE_PATTERN = re.compile(r"[ \t\r\n\f]+")
+
 
 class KokkaiScraper(BaseScraper):
     """国会会議録検索システム用スクレイパー"""
@@ -81,7 +124,11 @@ class KokkaiScraper(BaseScraper):
                 raise
 
     async def fetch_minutes(self, url: str) -> MinutesData | None:
-        """議事録を取得"""
+        """議事録を取得
+
+        ブラウザは描画済みのDOMを1回取得するためだけに使い、
+        抽出はすべて取得したHTMLに対して行います。
+        """
         browser = None
         try:
             browser = await self._create_browser()
@@ -90,8 +137,13 @@ class KokkaiScraper(BaseScraper):
             # ページを読み込み
             await self._load_page_with_retry(page, url)
 
+            # 描画済みのDOMを1回で取得（要素ごとのブラウザ呼び出しを避ける）
+            html = await page.content()
+            await browser.close()
+            browser = None
+
             # 議事録データを抽出
-            minutes_data = await self._extract_minutes_data(page, url)
+            minutes_data = self._parse_minutes_html(html, url)
 
             if not minutes_data:
                 logger.warning(f"No minutes data found for URL: {url}")
@@ -108,220 +160,175 @@ class KokkaiScraper(BaseScraper):
             if browser:
                 await browser.close()
 
-    async def _extract_minutes_data(self, page: Page, url: str) -> MinutesData | None:
-        """議事録データを抽出"""
-        try:
-            # 会議情報を取得
-            meeting_info = await self._extract_meeting_info(page)
+    def _parse_minutes_html(self, html: str, url: str) -> MinutesData | None:
+        """描画済みのHTMLから議事録データを抽出"""
+        soup = BeautifulSoup(html, "html.parser")
 
-            # タイトルを取得
-            title = await self._extract_title(page)
-            if not title:
-                title = meeting_info.get("title", "国会議事録")
+        # 会議情報を取得
+        meeting_info = self._extract_meeting_info(soup)
 
-            # 日付を取得
-            date = self._parse_date(meeting_info.get("date", ""))
+        # タイトルを取得
+        title = self._extract_title(soup)
+        if not title:
+            title = meeting_info.get("title", "国会議事録")
 
-            # 本文を取得
-            content = await self._extract_content(page)
-            if not content:
-                logger.warning("No content found")
-                return None
-
-            # 発言者情報を抽出
-            speakers = await self._extract_speakers(page)
+        # 日付を取得
+        date = self._parse_date(meeting_info.get("date", ""))
 
-            # MinId から council_id と schedule_id を生成
-            council_id, schedule_id = self._extract_ids_from_url(url)
-
-            return MinutesData(
-                url=url,
-                title=title,
-                date=date,
-                content=content,
-                speakers=speakers,
-                council_id=council_id,
-                schedule_id=schedule_id,
-                scraped_at=datetime.now(),
-                metadata=meeting_info,
-            )
+        # 本文を取得
+        content = self._extract_content(soup)
+        if not content:
+            logger.warning("No content found")
+            return None
 
-        except Exception as e:
-            logger.error(f"Error extracting minutes data: {e}")
-            raise
+        # 発言者情報を抽出
+        speakers = self._extract_speakers(soup)
+
+        # MinId から council_id と schedule_id を生成
+        council_id, schedule_id = self._extract_ids_from_url(url)
+
+        return MinutesData(
+            url=url,
+            title=title,
+            date=date,
+            content=content,
+            speakers=speakers,
+            council_id=council_id,
+            schedule_id=schedule_id,
+            scraped_at=datetime.now(),
+            metadata=meeting_info,
+        )
 
-    async def _extract_meeting_info(self, page: Page) -> dict[str, Any]:
+    def _extract_meeting_info(self, soup: BeautifulSoup) -> dict[str, Any]:
         """会議情報を抽出"""
         meeting_info: dict[str, Any] = {}
 
-        try:
-            # h2タグから会議情報を取得
-            h2_element = await page.query_selector("h2")
-
-            if h2_element:
-                # h2タグのテキストから会議情報を抽出
-                h2_text = await h2_element.inner_text()
-                meeting_info["title"] = h2_text.strip()
-
-                # テキストから情報をパース
-                # 例: "第217回国会　衆議院　北朝鮮による拉致問題等に関する特別委員会
-                # 第3号　令和7年4月23日"
-                parts = h2_text.split("　")
-                for part in parts:
-                    if "国会" in part:
-                        meeting_info["国会"] = part
-                    elif "院" in part:
-                        meeting_info["院"] = part
-                    elif "委員会" in part:
-                        meeting_info["委員会"] = part
-                    elif "第" in part and "号" in part:
-                        meeting_info["号数"] = part
-                    elif "年" in part and "月" in part and "日" in part:
-                        meeting_info["date"] = part
-
-            logger.info(f"Extracted meeting info: {meeting_info}")
-
-        except Exception as e:
-            logger.warning(f"Error extracting meeting info: {e}")
-
+        # h2タグから会議情報を取得
+        h2_element = soup.find("h2")
+        if h2_element:
+            # h2タグのテキストから会議情報を抽出
+            h2_text = h2_element.get_text()
+            meeting_info["title"] = h2_text.strip()
+
+            # テキストから情報をパース
+            # 例: "第217回国会　衆議院　北朝鮮による拉致問題等に関する特別委員会
+            # 第3号　令和7年4月23日"
+            parts = h2_text.split("　")
+            for part in parts:
+                if "国会" in part:
+                    meeting_info["国会"] = part
+                elif "院" in part:
+                    meeting_info["院"] = part
+                elif "委員会" in part:
+                    meeting_info["委員会"] = part
+                elif "第" in part and "号" in part:
+                    meeting_info["号数"] = part
+                elif "年" in part and "月" in part and "日" in part:
+                    meeting_info["date"] = part
+
+        logger.info(f"Extracted meeting info: {meeting_info}")
         return meeting_info
 
-    async def _extract_title(self, page: Page) -> str:
+    def _extract_title(self, soup: BeautifulSoup) -> str:
         """タイトルを抽出"""
-        try:
-            # h2タグからタイトルを取得
-            h2_element = await page.query_selector("h2")
-            if h2_element:
-                title = await h2_element.inner_text()
-                if title and title.strip():
-                    return title.strip()
-
-            # ページタイトルから取得
-            page_title = await page.title()
-            if page_title:
-                # " | テキスト表示 | 国会会議録検索システム" を削除
-                if " | " in page_title:
-                    return page_title.split(" | ")[0].strip()
-                return page_title
-
-        except Exception as e:
-            logger.warning(f"Error extracting title: {e}")
-
-        return ""
-
-    async def _extract_content(self, page: Page) -> str:
+        # h2タグからタイトルを取得
+        h2_element = soup.find("h2")
+        if h2_element:
+            title = h2_element.get_text().strip()
+            if title:
+                return title
+
+        # ページタイトルから取得
+        page_title = soup.title.get_text().strip() if soup.title else ""
+        # " | テキスト表示 | 国会会議録検索システム" を削除
+        if " | " in page_title:
+            return page_title.split(" | ")[0].strip()
+        return page_title
+
+    def _extract_content(self, soup: BeautifulSoup) -> str:
         """本文を抽出"""
         content_parts: list[str] = []
 
-        try:
-            # テーブル内の発言データを取得
-            tables = await page.query_selector_all("table")
-
-            for table in tables:
-                # テーブル内の行を取得
-                rows = await table.query_selector_all("tr")
-                for row in rows:
-                    # 発言者情報と発言内容を含む行を探す
-                    cells = await row.query_selector_all("td")
-                    if len(cells) >= 2:
-                        # 最初のセルが発言者、二番目が内容の可能性
-                        content_cell = cells[1] if len(cells) > 1 else None
-
-                        if content_cell:
-                            content_text = await content_cell.inner_text()
-                            if (
-                                content_text
-                                and content_text.strip()
-                                and len(content_text.strip()) > 20
-                            ):
-                                content_parts.append(content_text.strip())
-
-            # テーブルからコンテンツが取得できない場合
-            if not content_parts:
-                logger.warning(
-                    "No content found in tables, trying alternative approach"
-                )
-                # 全体のテキストを取得
-                body_text = await page.inner_text("body")
-                if body_text:
-                    # 不要な部分を除去
-                    lines = body_text.split("\n")
-                    for line in lines:
-                        line = line.strip()
-                        # 長いテキストで、ナビゲーションやヘッダーでないもの
-                        skip_words = [
-                            "シンプル表示",
-                            "ヘルプ",
-                            "検索",
-                            "ダウンロード",
-                        ]
-                        if len(line) > 50 and not any(
-                            skip in line for skip in skip_words
-                        ):
-                            content_parts.append(line)
-
-        except Exception as e:
-            logger.error(f"Error extracting content: {e}")
+        # テーブル内の発言データを取得
+        for table in soup.find_all("table"):
+            # テーブル内の行を取得
+            for row in table.find_all("tr"):
+                # 最初のセルが発言者、二番目が内容
+                cells = row.find_all("td")
+                if len(cells) >= 2:
+                    content_text = _inner_text(cells[1])
+                    if len(content_text) > 20:
+                        content_parts.append(content_text)
+
+        # テーブルからコンテンツが取得できない場合
+        if not content_parts:
+            logger.warning("No content found in tables, trying alternative approach")
+            body = soup.body or soup
+            for tag in body.find_all(["script", "style", "noscript"]):
+                tag.decompose()
+            # 長いテキストで、ナビゲーションやヘッダーでないもの
+            skip_words = ["シンプル表示", "ヘルプ", "検索", "ダウンロード"]
+            for line in _inner_text(body).split("\n"):
+                line = line.strip()
+                if len(line) > 50 and not any(skip in line for skip in skip_words):
+                    content_parts.append(line)
 
         return "\n\n".join(content_parts)
 
-    async def _extract_speakers(self, page: Page) -> list[SpeakerData]:
+    def _extract_speakers(self, soup: BeautifulSoup) -> list[SpeakerData]:
         """発言者情報を抽出"""
         speakers: list[SpeakerData] = []
         seen_speakers: set[str] = set()
 
-        try:
-            # div[class*="speaker"] 要素から発言者情報を取得
-            speaker_divs = await page.query_selector_all('div[class*="speaker"]')
-
-            if speaker_divs:
-                logger.info(f"Found {len(speaker_divs)} speaker divs")
-                for div in speaker_divs:
-                    # 発言者名を取得
-                    text = await div.inner_text()
-                    if text and text.strip():
-                        # 発言番号と発言者名を分離
-                        # 例: "001　牧義夫　発言者情報"
-                        parts = text.split()
-                        if len(parts) >= 2:
-                            # 数字で始まる部分をスキップ
-                            name_parts: list[str] = []
-                            skip_terms = ["発言者情報", "会議録情報"]
-                            for part in parts:
-                                if not part[0].isdigit() and part not in skip_terms:
-                                    name_parts.append(part)
-
-                            if name_parts:
-                                name = " ".join(name_parts)
-                                if name not in seen_speakers and name != "会議録情報":
-                                    seen_speakers.add(name)
-                                    speakers.append(
-                                        SpeakerData(
-                                            name=self._normalize_speaker_name(name),
-                                            role=self._extract_role(name),
-                                            content="",
-                                        )
-                                    )
-
-            logger.info(f"Extracted {len(speakers)} speakers")
+        # classにspeakerを含むdiv要素から発言者情報を取得
+        speaker_divs = soup.select('div[class*="speaker"]')
+        if speaker_divs:
+            logger.info(f"Found {len(speaker_divs)} speaker divs")
+
+        skip_terms = ["発言者情報", "会議録情報"]
+        for div in speaker_divs:
+            # 発言番号と発言者名を分離
+            # 例: "001　牧義夫　発言者情報"
+            parts = div.get_text(" ").split()
+            if len(parts) < 2:
+                continue
 
-        except Exception as e:
-            logger.warning(f"Error extracting speakers: {e}")
+            # 数字で始まる部分をスキップ
+            name_parts = [
+                part
+                for part in parts
+                if not part[0].isdigit() and part not in skip_terms
+            ]
+            if not name_parts:
+                continue
 
+            name = " ".join(name_parts)
+            if name not in seen_speakers:
+                seen_speakers.add(name)
+                speakers.append(
+                    SpeakerData(
+                        name=self._normalize_speaker_name(name),
+                        role=self._extract_role(name),
+                        content="",
+                    )
+                )
+
+        logger.info(f"Extracted {len(speakers)} speakers")
         return speakers
 
     def _normalize_speaker_name(self, name: str) -> str:
         """発言者名を正規化"""
         # 役職や記号を除去
-        name = re.sub(r"[（(].+?[）)]", "", name)
-        name = re.sub(r"○|◯|●|◎|△|▲|□|■", "", name)
-        name = name.replace("君", "").replace("議員", "")
-        return name.strip()
+        name = _ROLE_IN_PARENTHESES_PATTERN.sub("", name)
+        name_normalizer = get_name_normalizer()
+        return name_normalizer.strip_honorifics(
+            name_normalizer.strip_speaker_markers(name)
+        )
 
     def _extract_role(self, name: str) -> str:
         """役職を抽出"""
         # 括弧内の役職を抽出
-        match = re.search(r"[（(](.+?)[）)]", name)
+        match = _ROLE_IN_PARENTHESES_PATTERN.search(name)
         if match:
             return match.group(1)
 
@@ -398,11 +405,30 @@ class KokkaiScraper(BaseScraper):
         return "kokkai_unknown", "1"
 
     async def extract_minutes_text(self, html_content: str) -> str:
-        """HTMLから議事録テキストを抽出（BaseScraper abstract method）"""
-        # この実装はPlaywrightを使用するため、fetch_minutesメソッド内で処理
-        return ""
+        """HTMLから議事録テキストを抽出"""
+        return self._extract_content(BeautifulSoup(html_content, "html.parser"))
 
     async def extract_speakers(self, html_content: str) -> list[SpeakerData]:
-        """HTMLから発言者情報を抽出（BaseScraper abstract method）"""
-        # この実装はPlaywrightを使用するため、fetch_minutesメソッド内で処理
-        return []
+        """HTMLから発言者情報を抽出"""
+        return self._extract_speakers(BeautifulSoup(html_content, "html.parser"))
+
+
+def _inner_text(element: Tag | BeautifulSoup) -> str:
+    """要素のテキストを取得（<br>とブロック要素の区切りを改行にする）
+
+    <span>や<a>などのインライン要素では改行せず、ブラウザの表示と同じく
+    前後のテキストとつなげます。元の要素は変更しません。
+    """
+    element = copy.copy(element)
+    # ソース上の改行・インデントはブラウザと同じく1つの空白として扱う
+    for text in element.find_all(string=True):
+        if type(text) is NavigableString:
+            text.replace_with(_HTML_WHITESPACE_PATTERN.sub(" ", text))
+    for br in element.find_all("br"):
+        br.replace_with("\n")
+    for block in element.find_all(_BLOCK_TAGS):
+        block.insert_before("\n")
+        block.insert_after("\n")
+
+    lines = (line.strip() for line in element.get_text("").split("\n"))
+    return "\n".join(line for line in lines if line)
@@ -12,15 +12,28 @@ class SpeakerData:
     name: str
     content: str
     role: str | None = None  # 議員、委員、市長、局長など
+    speech_order: int | None = None  # 議事録内の発言順（発言単位のデータの場合）
 
     def to_dict(self) -> dict[str, Any]:
         """辞書形式に変換"""
-        return {"name": self.name, "content": self.content, "role": self.role}
+        data: dict[str, Any] = {
+            "name": self.name,
+            "content": self.content,
+            "role": self.role,
+        }
+        if self.speech_order is not None:
+            data["speech_order"] = self.speech_order
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SpeakerData":
         """辞書からインスタンスを生成"""
-        return cls(name=data["name"], content=data["content"], role=data.get("role"))
+        return cls(
+            name=data["name"],
+            content=data["content"],
+            role=data.get("role"),
+            speech_order=data.get("speech_order"),
+        )
 
 
 @dataclass
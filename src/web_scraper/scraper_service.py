@@ -10,10 +10,15 @@ from ..infrastructure.persistence.meeting_repository_impl import MeetingReposito
 from ..infrastructure.persistence.repository_adapter import RepositoryAdapter
 from .base_scraper import BaseScraper
 from .kaigiroku_net_scraper import KaigirokuNetScraper
+from .kokkai_api_scraper import KokkaiApiScraper
 from .kokkai_scraper import KokkaiScraper
 from .models import MinutesData
 
 from src.infrastructure.config import config
+from src.infrastructure.external.kokkai_speech_client import (
+    KokkaiSpeechClient,
+    extract_issue_id,
+)
 from src.infrastructure.storage.gcs_client import GCSStorage
 
 
@@ -26,6 +31,8 @@ class ScraperService:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger(__name__)
+        # 国会会議録APIへの同時リクエスト数の上限をスクレーパー間で共有する
+        self.kokkai_client = KokkaiSpeechClient()
 
         # GCS設定
         self.enable_gcs = (
@@ -130,8 +137,10 @@ class ScraperService:
         if "kaigiroku.net/tenant/" in url:
             return KaigirokuNetScraper()
 
-        # 国会会議録検索システムの場合
+        # 国会会議録検索システムの場合（会議録IDがあればAPIで発言単位に取得）
         if "kokkai.ndl.go.jp" in url:
+            if extract_issue_id(url):
+                return KokkaiApiScraper(client=self.kokkai_client)
             return KokkaiScraper()
 
         # 今後、他の議事録システムのスクレーパーをここに追加
@@ -231,7 +240,9 @@ class ScraperService:
         lines.append("\n" + "=" * 50 + "\n")
         lines.append(minutes.content)
 
-        if minutes.speakers:
+        # 発言単位のデータ（国会会議録API）は本文に全発言が含まれるため一覧を出力しない
+        per_speech = any(s.speech_order is not None for s in minutes.speakers)
+        if minutes.speakers and not per_speech:
             lines.append("\n" + "=" * 50)
             lines.append("発言者一覧:\n")
             for speaker in minutes.speakers:
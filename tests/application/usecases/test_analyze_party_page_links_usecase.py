@@ -0,0 +1,97 @@
+"""Tests for AnalyzePartyPageLinksUseCase."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.dtos.link_analysis_dto import AnalyzeLinksInputDTO
+from src.application.usecases.analyze_party_page_links_usecase import (
+    AnalyzePartyPageLinksUseCase,
+)
+from src.domain.services.interfaces.llm_link_classifier_service import (
+    LinkClassification,
+    LinkClassificationResult,
+    LinkType,
+)
+from src.domain.services.link_analysis_domain_service import LinkAnalysisDomainService
+from src.domain.value_objects.link import Link
+
+
+CURRENT_URL = "https://example.com/members"
+
+
+class TestAnalyzePartyPageLinksUseCase:
+    """Test cases for AnalyzePartyPageLinksUseCase."""
+
+    @pytest.fixture
+    def links(self):
+        return [
+            Link(url="https://example.com/members/tokyo", text="東京都"),
+            Link(url="https://example.com/members/123.html", text="山田太郎"),
+            Link(url="https://example.com/members/special", text="特別党員"),
+        ]
+
+    @pytest.fixture
+    def mock_html_extractor(self, links):
+        extractor = MagicMock()
+        extractor.extract_links.return_value = links
+        return extractor
+
+    @pytest.fixture
+    def mock_link_classifier(self):
+        classifier = AsyncMock()
+        classifier.classify_links.return_value = (
+            LinkClassificationResult.from_classifications(
+                [
+                    LinkClassification(
+                        url="https://example.com/members/special",
+                        link_type=LinkType.MEMBER_LIST,
+                        confidence=0.8,
+                        reason="特別党員の一覧",
+                    )
+                ]
+            )
+        )
+        return classifier
+
+    @pytest.fixture
+    def use_case(self, mock_html_extractor, mock_link_classifier):
+        return AnalyzePartyPageLinksUseCase(
+            html_extractor=mock_html_extractor,
+            link_classifier=mock_link_classifier,
+            link_analysis_service=LinkAnalysisDomainService(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_undecided_links_go_to_llm(self, use_case, mock_link_classifier):
+        result = await use_case.execute(
+            AnalyzeLinksInputDTO(html_content="<html></html>", current_url=CURRENT_URL)
+        )
+
+        [sent_links] = mock_link_classifier.classify_links.await_args.args
+        assert [link.url for link in sent_links] == [
+            "https://example.com/members/special"
+        ]
+        assert sorted(result.member_list_urls) == [
+            "https://example.com/members/special",
+            "https://example.com/members/tokyo",
+        ]
+        assert result.profile_urls == ["https://example.com/members/123.html"]
+        assert result.summary == {
+            "prefecture_list": 1,
+            "member_profile": 1,
+            "member_list": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_llm_is_skipped_when_rules_decide_everything(
+        self, use_case, mock_html_extractor, mock_link_classifier, links
+    ):
+        mock_html_extractor.extract_links.return_value = links[:2]
+
+        result = await use_case.execute(
+            AnalyzeLinksInputDTO(html_content="<html></html>", current_url=CURRENT_URL)
+        )
+
+        mock_link_classifier.classify_links.assert_not_called()
+        assert len(result.classifications) == 2
@@ -0,0 +1,234 @@
+"""BatchExecuteMinutesProcessingUseCaseのテスト"""
+
+import asyncio
+
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.dtos.minutes_processing_dto import (
+    BatchMinutesProcessingDTO,
+    MinutesProcessingResultDTO,
+)
+from src.application.usecases.batch_execute_minutes_processing_usecase import (
+    BatchExecuteMinutesProcessingUseCase,
+)
+from src.domain.entities.meeting import Meeting
+from src.domain.value_objects.speaker_speech import SpeakerSpeech
+
+
+def _meeting(meeting_id: int, meeting_date: date | None = None) -> Meeting:
+    return Meeting(
+        id=meeting_id,
+        conference_id=1,
+        date=meeting_date or date(2024, 1, 1),
+        url=f"https://example.com/{meeting_id}",
+        gcs_text_uri=f"gs://bucket/{meeting_id}.txt",
+    )
+
+
+class FakeProcessingScope:
+    """会議ごとに新しいモックUoWを持つユースケースを返すスコープ"""
+
+    def __init__(
+        self,
+        failing_meeting_ids: set[int] | None = None,
+        structured_meeting_ids: set[int] | None = None,
+    ):
+        self.failing_meeting_ids = failing_meeting_ids or set()
+        self.structured_meeting_ids = structured_meeting_ids or set()
+        self.scopes_opened = 0
+        self.active_analyses = 0
+        self.max_active_analyses = 0
+        self.committed_meeting_ids: list[int] = []
+        self.analyzed_meeting_ids: list[int] = []
+        self.pipeline_versions: dict[int, str] = {}
+        self.rollbacks = 0
+
+    def _build_usecase(self) -> MagicMock:
+        usecase = MagicMock()
+        usecase.uow = AsyncMock()
+        usecase.uow.meeting_repository.get_by_conference.return_value = [
+            _meeting(1, date(2023, 12, 31)),
+            _meeting(2, date(2024, 1, 15)),
+            _meeting(3, date(2024, 2, 1)),
+        ]
+
+        async def prepare_meeting(request):
+            return _meeting(request.meeting_id), None
+
+        async def fetch_structured_speeches(meeting):
+            if meeting.id not in self.structured_meeting_ids:
+                return None
+            return [
+                SpeakerSpeech(speaker="安住淳", speech_content="開会します。"),
+                SpeakerSpeech(
+                    speaker="石破茂", speech_content="お答えします。", speech_order=2
+                ),
+            ]
+
+        async def fetch_minutes_text(meeting):
+            if meeting.id in self.failing_meeting_ids:
+                raise ValueError(f"No valid source found for meeting {meeting.id}")
+            return f"議事録{meeting.id}"
+
+        async def analyze_minutes(text, meeting, existing_minutes=None):
+            self.analyzed_meeting_ids.append(meeting.id)
+            self.active_analyses += 1
+            self.max_active_analyses = max(
+                self.max_active_analyses, self.active_analyses
+            )
+            await asyncio.sleep(0.01)
+            self.active_analyses -= 1
+            return (
+                {"議長": "山田太郎"},
+                [SpeakerSpeech(speaker="山田太郎", speech_content=text)],
+                None,
+            )
+
+        async def persist_results(meeting, existing_minutes, mappings, results, **kw):
+            self.committed_meeting_ids.append(meeting.id)
+            self.pipeline_versions[meeting.id] = kw["pipeline_version"]
+            return MinutesProcessingResultDTO(
+                minutes_id=meeting.id,
+                meeting_id=meeting.id,
+                total_conversations=len(results),
+                unique_speakers=1,
+                processing_time_seconds=0.1,
+                processed_at=datetime.now(),
+                role_name_mappings=mappings,
+            )
+
+        async def rollback():
+            self.rollbacks += 1
+
+        usecase.prepare_meeting = prepare_meeting
+        usecase.fetch_structured_speeches = fetch_structured_speeches
+        usecase.fetch_minutes_text = fetch_minutes_text
+        usecase.analyze_minutes = analyze_minutes
+        usecase.persist_results = persist_results
+        usecase.uow.rollback = rollback
+        return usecase
+
+    def __call__(self):
+        @asynccontextmanager
+        async def scope():
+            self.scopes_opened += 1
+            yield self._build_usecase()
+
+        return scope()
+
+
+@pytest.mark.asyncio
+async def test_execute_processes_all_meetings_through_stages():
+    """全会議がfetch→analyze→persistを通過することをテスト"""
+    scope = FakeProcessingScope()
+    usecase = BatchExecuteMinutesProcessingUseCase(
+        processing_scope=scope, fetch_concurrency=3, llm_concurrency=2
+    )
+
+    result = await usecase.execute(
+        BatchMinutesProcessingDTO(meeting_ids=[1, 2, 3, 4, 5, 5])
+    )
+
+    assert sorted(r.meeting_id for r in result.results) == [1, 2, 3, 4, 5]
+    assert result.failures == {}
+    assert sorted(scope.committed_meeting_ids) == [1, 2, 3, 4, 5]
+    # 1会議あたりステージごとに独立したスコープを使用する
+    assert scope.scopes_opened == 15
+    for stage in ("fetch", "analyze", "persist"):
+        assert result.stage_metrics[stage].processed == 5
+        assert result.stage_metrics[stage].failed == 0
+    assert result.stage_metrics["analyze"].throughput_per_minute > 0
+
+
+@pytest.mark.asyncio
+async def test_execute_bounds_llm_concurrency():
+    """LLMステージの並行数が上限を超えないことをテスト"""
+    scope = FakeProcessingScope()
+    usecase = BatchExecuteMinutesProcessingUseCase(
+        processing_scope=scope,
+        fetch_concurrency=10,
+        llm_concurrency=2,
+        queue_size_per_worker=1,
+    )
+
+    result = await usecase.execute(
+        BatchMinutesProcessingDTO(meeting_ids=list(range(1, 11)))
+    )
+
+    assert len(result.results) == 10
+    assert scope.max_active_analyses == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_isolates_failures_per_meeting():
+    """1会議の失敗が他の会議の処理を止めないことをテスト"""
+    scope = FakeProcessingScope(failing_meeting_ids={2})
+    usecase = BatchExecuteMinutesProcessingUseCase(processing_scope=scope)
+
+    result = await usecase.execute(BatchMinutesProcessingDTO(meeting_ids=[1, 2, 3]))
+
+    assert sorted(r.meeting_id for r in result.results) == [1, 3]
+    assert list(result.failures) == [2]
+    assert result.failures[2].startswith("fetch:")
+    assert result.stage_metrics["fetch"].failed == 1
+    assert result.stage_metrics["analyze"].processed == 2
+    assert result.total_meetings == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_skips_llm_for_structured_speeches():
+    """構造化された発言を取得できた会議はLLMを呼ばずに保存することをテスト"""
+    scope = FakeProcessingScope(structured_meeting_ids={2})
+    usecase = BatchExecuteMinutesProcessingUseCase(processing_scope=scope)
+
+    result = await usecase.execute(BatchMinutesProcessingDTO(meeting_ids=[1, 2, 3]))
+
+    assert sorted(r.meeting_id for r in result.results) == [1, 2, 3]
+    assert sorted(scope.analyzed_meeting_ids) == [1, 3]
+    structured = next(r for r in result.results if r.meeting_id == 2)
+    assert structured.total_conversations == 2
+    assert scope.pipeline_versions == {
+        1: "minutes-divider-v1",
+        2: "structured-source-v1",
+        3: "minutes-divider-v1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_resolves_meetings_by_conference_and_date():
+    """会議体と日付範囲で対象会議を絞り込むことをテスト"""
+    scope = FakeProcessingScope()
+    usecase = BatchExecuteMinutesProcessingUseCase(processing_scope=scope)
+
+    result = await usecase.execute(
+        BatchMinutesProcessingDTO(
+            conference_id=1,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+        )
+    )
+
+    assert [r.meeting_id for r in result.results] == [2]
+
+
+@pytest.mark.asyncio
+async def test_execute_requires_target():
+    """対象の指定がない場合はエラーになることをテスト"""
+    usecase = BatchExecuteMinutesProcessingUseCase(
+        processing_scope=FakeProcessingScope()
+    )
+
+    with pytest.raises(ValueError, match="meeting_ids or conference_id"):
+        await usecase.execute(BatchMinutesProcessingDTO())
+
+
+def test_init_rejects_invalid_concurrency():
+    """並行数が1未満の場合はエラーになることをテスト"""
+    with pytest.raises(ValueError):
+        BatchExecuteMinutesProcessingUseCase(
+            processing_scope=FakeProcessingScope(), llm_concurrency=0
+        )
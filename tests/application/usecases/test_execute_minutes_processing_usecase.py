@@ -16,6 +16,7 @@ from src.application.usecases.execute_minutes_processing_usecase import (
 from src.domain.entities.conversation import Conversation
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 from src.infrastructure.exceptions import APIKeyError
 from src.minutes_divide_processor.models import MinutesBoundary
@@ -184,15 +185,7 @@ async def test_execute_already_has_conversations(
     # モックの設定
     mock_unit_of_work.meeting_repository.get_by_id.return_value = sample_meeting
     mock_unit_of_work.minutes_repository.get_by_meeting.return_value = sample_minutes
-    mock_unit_of_work.conversation_repository.get_by_minutes.return_value = [
-        Conversation(
-            id=1,
-            minutes_id=1,
-            speaker_name="既存の発言者",
-            comment="既存の発言",
-            sequence_number=1,
-        )
-    ]
+    mock_unit_of_work.conversation_repository.exists_by_minutes.return_value = True
 
     # 実行と検証
     request = ExecuteMinutesProcessingDTO(meeting_id=1, force_reprocess=False)
@@ -208,15 +201,8 @@ async def test_execute_force_reprocess(
     # モックの設定
     mock_unit_of_work.meeting_repository.get_by_id.return_value = sample_meeting
     mock_unit_of_work.minutes_repository.get_by_meeting.return_value = sample_minutes
-    mock_unit_of_work.conversation_repository.get_by_minutes.return_value = [
-        Conversation(
-            id=1,
-            minutes_id=1,
-            speaker_name="既存の発言者",
-            comment="既存の発言",
-            sequence_number=1,
-        )
-    ]
+    mock_unit_of_work.conversation_repository.exists_by_minutes.return_value = True
+    mock_unit_of_work.conversation_repository.delete_by_minutes.return_value = [1]
 
     # Storage serviceをモック - download_file returns bytes
     mock_services[
@@ -235,6 +221,12 @@ async def test_execute_force_reprocess(
     # 検証
     assert result.meeting_id == 1
     assert result.total_conversations == 0
+    # 既存のConversationsは1回の一括削除で削除される
+    mock_unit_of_work.conversation_repository.delete_by_minutes.assert_awaited_once_with(
+        sample_minutes.id
+    )
+    mock_unit_of_work.conversation_repository.exists_by_minutes.assert_not_awaited()
+    mock_unit_of_work.conversation_repository.delete.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -505,3 +497,249 @@ async def test_execute_with_role_name_mappings(
     created_call = mock_unit_of_work.minutes_repository.create.call_args
     created_entity = created_call[0][0]
     assert created_entity.role_name_mappings == {"議長": "伊藤条一"}
+
+
+@pytest.mark.asyncio
+async def test_analyze_minutes_detects_boundary_once(
+    use_case_with_role_mapping, mock_services, sample_meeting
+):
+    """境界検出は1回だけ行い、マッピング抽出と発言抽出で共有することをテスト"""
+    text = "出席議員 山田太郎\n○議長（山田太郎君） 開会します。"
+    position = text.index("○議長")
+    divider = use_case_with_role_mapping.minutes_divider_service
+    divider.detect_attendee_boundary.return_value = MinutesBoundary(
+        boundary_found=True,
+        boundary_type="speech_start",
+        confidence=0.85,
+        boundary_position=position,
+        detection_method="rule_based",
+    )
+    mapping_svc = use_case_with_role_mapping.role_name_mapping_service
+    mapping_svc.extract_role_name_mapping.return_value = RoleNameMappingResultDTO(
+        mappings=[], attendee_section_found=False, confidence=0.0
+    )
+    mock_services["minutes_processing_service"].process_minutes.return_value = []
+
+    _, _, boundary = await use_case_with_role_mapping.analyze_minutes(
+        text, sample_meeting
+    )
+
+    divider.detect_attendee_boundary.assert_called_once_with(text)
+    assert boundary == AttendeeBoundary(
+        text_hash=AttendeeBoundary.compute_text_hash(text),
+        position=position,
+        boundary_type="speech_start",
+        confidence=0.85,
+        detection_method="rule_based",
+    )
+    mapping_svc.extract_role_name_mapping.assert_called_once_with("出席議員 山田太郎")
+    process_call = mock_services["minutes_processing_service"].process_minutes
+    assert process_call.call_args.kwargs["attendee_boundary"] == boundary
+
+
+@pytest.mark.asyncio
+async def test_analyze_minutes_does_not_retry_failed_boundary_detection(
+    use_case_with_role_mapping, mock_services, sample_meeting
+):
+    """境界検出に失敗しても、マッピング抽出と発言抽出で再検出しないことをテスト"""
+    text = "○議長（山田太郎君） 開会します。"
+    divider = use_case_with_role_mapping.minutes_divider_service
+    divider.detect_attendee_boundary.return_value = MinutesBoundary(
+        boundary_found=False, confidence=0.0, reason="境界が見つからない"
+    )
+    mapping_svc = use_case_with_role_mapping.role_name_mapping_service
+    mapping_svc.extract_role_name_mapping.return_value = RoleNameMappingResultDTO(
+        mappings=[], attendee_section_found=False, confidence=0.0
+    )
+    mock_services["minutes_processing_service"].process_minutes.return_value = []
+
+    _, _, boundary = await use_case_with_role_mapping.analyze_minutes(
+        text, sample_meeting
+    )
+
+    divider.detect_attendee_boundary.assert_called_once_with(text)
+    mapping_svc.extract_role_name_mapping.assert_called_once_with(text)
+    # 失敗した結果を渡し、エージェントにも境界検出を省略させる
+    process_call = mock_services["minutes_processing_service"].process_minutes
+    passed = process_call.call_args.kwargs["attendee_boundary"]
+    assert passed is not None
+    assert passed.position is None
+    assert passed.detection_method == "failed"
+    # 失敗した結果は議事録にキャッシュしない
+    assert boundary is None
+
+
+@pytest.mark.asyncio
+async def test_analyze_minutes_reuses_cached_boundary(
+    use_case_with_role_mapping, mock_services, sample_meeting
+):
+    """議事録にキャッシュされた境界があれば境界検出を行わないことをテスト"""
+    text = "議事録テキスト"
+    cached = AttendeeBoundary(
+        text_hash=AttendeeBoundary.compute_text_hash(text), position=None
+    )
+    existing_minutes = Minutes(id=1, meeting_id=1, attendee_boundary=cached)
+    mapping_svc = use_case_with_role_mapping.role_name_mapping_service
+    mapping_svc.extract_role_name_mapping.return_value = RoleNameMappingResultDTO(
+        mappings=[], attendee_section_found=False, confidence=0.0
+    )
+    mock_services["minutes_processing_service"].process_minutes.return_value = []
+
+    _, _, boundary = await use_case_with_role_mapping.analyze_minutes(
+        text, sample_meeting, existing_minutes
+    )
+
+    assert boundary is cached
+    divider = use_case_with_role_mapping.minutes_divider_service
+    divider.detect_attendee_boundary.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_analyze_minutes_ignores_stale_cached_boundary(
+    use_case_with_role_mapping, mock_services, sample_meeting
+):
+    """テキストが変わった場合はキャッシュを使わず再検出することをテスト"""
+    stale = AttendeeBoundary(
+        text_hash=AttendeeBoundary.compute_text_hash("古いテキスト"), position=3
+    )
+    existing_minutes = Minutes(id=1, meeting_id=1, attendee_boundary=stale)
+    divider = use_case_with_role_mapping.minutes_divider_service
+    divider.detect_attendee_boundary.return_value = MinutesBoundary(
+        boundary_found=False, confidence=0.9, detection_method="rule_based"
+    )
+    mapping_svc = use_case_with_role_mapping.role_name_mapping_service
+    mapping_svc.extract_role_name_mapping.return_value = RoleNameMappingResultDTO(
+        mappings=[], attendee_section_found=False, confidence=0.0
+    )
+    mock_services["minutes_processing_service"].process_minutes.return_value = []
+
+    _, _, boundary = await use_case_with_role_mapping.analyze_minutes(
+        "新しいテキスト", sample_meeting, existing_minutes
+    )
+
+    divider.detect_attendee_boundary.assert_called_once()
+    assert boundary is not None
+    assert boundary.position is None
+    assert boundary.matches("新しいテキスト")
+
+
+@pytest.mark.asyncio
+async def test_persist_results_caches_attendee_boundary(
+    use_case, mock_unit_of_work, sample_meeting, sample_minutes
+):
+    """既存の議事録に新しく検出した境界を保存することをテスト"""
+    mock_unit_of_work.conversation_repository.bulk_create.return_value = []
+    boundary = AttendeeBoundary(text_hash="abc", position=10)
+
+    await use_case.persist_results(
+        sample_meeting, sample_minutes, None, [], attendee_boundary=boundary
+    )
+
+    mock_unit_of_work.minutes_repository.update_attendee_boundary.assert_called_once_with(
+        sample_minutes.id, boundary
+    )
+
+
+@pytest.fixture
+def structured_source():
+    """構造化議事録ソースのモック"""
+    source = MagicMock()
+    source.supports.return_value = True
+    source.fetch_speeches = AsyncMock(
+        return_value=[
+            SpeakerSpeech(speaker="安住淳", speech_content="これより会議を開きます。"),
+            SpeakerSpeech(
+                speaker="石破茂", speech_content="お答えいたします。", speech_order=2
+            ),
+        ]
+    )
+    return source
+
+
+@pytest.fixture
+def use_case_with_structured_source(
+    mock_unit_of_work, mock_services, structured_source
+):
+    """構造化議事録ソース付きのユースケースのフィクスチャ"""
+    return ExecuteMinutesProcessingUseCase(
+        speaker_domain_service=mock_services["speaker_service"],
+        minutes_processing_service=mock_services["minutes_processing_service"],
+        storage_service=mock_services["storage_service"],
+        unit_of_work=mock_unit_of_work,
+        update_statement_usecase=AsyncMock(),
+        structured_minutes_source=structured_source,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_structured_source_skips_llm(
+    use_case_with_structured_source,
+    mock_unit_of_work,
+    mock_services,
+    sample_meeting,
+    sample_minutes,
+):
+    """構造化された発言を取得できる会議はLLMで分割せずに保存することをテスト"""
+    mock_unit_of_work.meeting_repository.get_by_id.return_value = sample_meeting
+    mock_unit_of_work.minutes_repository.get_by_meeting.return_value = None
+    mock_unit_of_work.minutes_repository.create.return_value = sample_minutes
+    mock_unit_of_work.conversation_repository.bulk_create.side_effect = (
+        lambda conversations: [
+            Conversation(
+                id=i,
+                minutes_id=c.minutes_id,
+                speaker_name=c.speaker_name,
+                comment=c.comment,
+                sequence_number=c.sequence_number,
+            )
+            for i, c in enumerate(conversations, start=1)
+        ]
+    )
+    mock_unit_of_work.speaker_repository.get_by_name_party_position.return_value = None
+
+    result = await use_case_with_structured_source.execute(
+        ExecuteMinutesProcessingDTO(meeting_id=1)
+    )
+
+    assert result.total_conversations == 2
+    mock_services["storage_service"].download_file.assert_not_called()
+    mock_services["minutes_processing_service"].process_minutes.assert_not_called()
+    saved = mock_unit_of_work.conversation_repository.bulk_create.call_args.args[0]
+    assert [(c.speaker_name, c.sequence_number) for c in saved] == [
+        ("安住淳", 1),
+        ("石破茂", 2),
+    ]
+    update_statement = use_case_with_structured_source.update_statement_usecase
+    assert {
+        call.kwargs["pipeline_version"] for call in update_statement.execute.mock_calls
+    } == {"structured-source-v1"}
+    mock_unit_of_work.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_structured_speeches_unsupported_url(
+    use_case_with_structured_source, structured_source, sample_meeting
+):
+    """ソースが対応していないURLの会議ではNoneを返すことをテスト"""
+    structured_source.supports.return_value = False
+
+    result = await use_case_with_structured_source.fetch_structured_speeches(
+        sample_meeting
+    )
+
+    assert result is None
+    structured_source.fetch_speeches.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_structured_speeches_falls_back_on_error(
+    use_case_with_structured_source, structured_source, sample_meeting
+):
+    """構造化された発言の取得に失敗した場合はNoneを返すことをテスト"""
+    structured_source.fetch_speeches.side_effect = ValueError("No speeches found")
+
+    result = await use_case_with_structured_source.fetch_structured_speeches(
+        sample_meeting
+    )
+
+    assert result is None
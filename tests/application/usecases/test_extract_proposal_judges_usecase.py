@@ -1,5 +1,6 @@
 """Tests for ExtractProposalJudgesUseCase"""
 
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -13,8 +14,23 @@ from src.application.usecases.extract_proposal_judges_usecase import (
     ExtractProposalJudgesUseCase,
 )
 from src.domain.entities.extracted_proposal_judge import ExtractedProposalJudge
+from src.domain.entities.meeting import Meeting
 from src.domain.entities.politician import Politician
+from src.domain.entities.politician_affiliation import PoliticianAffiliation
+from src.domain.entities.proposal import Proposal
 from src.domain.entities.proposal_judge import ProposalJudge
+from src.domain.value_objects.politician_match import PoliticianMatch
+
+
+def _politician_row(id: int, name: str, party_name: str | None) -> dict:
+    """Build a politician in the get_all_for_matching format"""
+    return {
+        "id": id,
+        "name": name,
+        "party_position": None,
+        "district": None,
+        "party_name": party_name,
+    }
 
 
 class TestExtractProposalJudgesUseCase:
@@ -167,15 +183,15 @@ class TestExtractProposalJudgesUseCase:
     ):
         """Test successful matching of judges with politicians"""
         # Arrange
-        _, politician_repo, extracted_repo, _ = mock_repositories
+        proposal_repo, politician_repo, extracted_repo, _ = mock_repositories
         _, llm_service = mock_services
 
-        # Mock pending judges
+        # Surname only, so the roster cannot resolve it without the LLM
         pending_judges = [
             ExtractedProposalJudge(
                 id=1,
                 proposal_id=1,
-                extracted_politician_name="山田太郎",
+                extracted_politician_name="山田",
                 extracted_party_name="○○党",
                 extracted_judgment="APPROVE",
                 source_url="http://example.com",
@@ -183,17 +199,11 @@ class TestExtractProposalJudgesUseCase:
             )
         ]
         extracted_repo.get_pending_by_proposal.return_value = pending_judges
-
-        # Mock politician search
-        politician = Politician(
-            id=10,
-            name="山田太郎",
-            prefecture="東京都",
-            district="東京1区",
-            political_party_id=1,
-        )
-        politician_repo.search_by_name.return_value = [politician]
-        politician_repo.get_by_id.return_value = politician
+        proposal_repo.get_by_ids.return_value = []
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(10, "山田太郎", "○○党"),
+            _politician_row(11, "田中花子", "△△党"),
+        ]
 
         # Mock LLM matching
         llm_service.match_conference_member.return_value = {
@@ -213,14 +223,29 @@ class TestExtractProposalJudgesUseCase:
         assert result.no_match_count == 0
         assert len(result.results) == 1
         assert result.results[0].matched_politician_id == 10
+        assert result.results[0].matched_politician_name == "山田太郎"
         assert result.results[0].confidence_score == 0.95
         assert result.results[0].matching_status == "matched"
 
+        # Only the partially matching politician is offered to the LLM
+        candidates = llm_service.match_conference_member.call_args.args[2]
+        assert [c["id"] for c in candidates] == [10]
+
+        extracted_repo.bulk_update_matching_results.assert_awaited_once_with(
+            pending_judges
+        )
+        assert pending_judges[0].matched_politician_id == 10
+        assert pending_judges[0].matching_status == "matched"
+        extracted_repo.update_matching_result.assert_not_called()
+
     @pytest.mark.asyncio
-    async def test_match_judges_no_candidates(self, use_case, mock_repositories):
+    async def test_match_judges_no_candidates(
+        self, use_case, mock_repositories, mock_services
+    ):
         """Test matching when no politician candidates are found"""
         # Arrange
-        _, politician_repo, extracted_repo, _ = mock_repositories
+        proposal_repo, politician_repo, extracted_repo, _ = mock_repositories
+        _, llm_service = mock_services
 
         pending_judges = [
             ExtractedProposalJudge(
@@ -233,9 +258,12 @@ class TestExtractProposalJudgesUseCase:
             )
         ]
         extracted_repo.get_all_pending.return_value = pending_judges
+        proposal_repo.get_by_ids.return_value = []
 
         # No politicians found
-        politician_repo.search_by_name.return_value = []
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(10, "山田太郎", "○○党")
+        ]
 
         input_dto = MatchProposalJudgesInputDTO()
 
@@ -247,6 +275,442 @@ class TestExtractProposalJudgesUseCase:
         assert result.no_match_count == 1
         assert result.results[0].matching_status == "no_match"
         assert result.results[0].confidence_score == 0.0
+        llm_service.match_conference_member.assert_not_called()
+        extracted_repo.bulk_update_matching_results.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_match_judges_resolves_roster_names_without_llm(
+        self, use_case, mock_repositories, mock_services
+    ):
+        """Exact and normalized names are matched in memory in one pass"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, _ = mock_repositories
+        _, llm_service = mock_services
+
+        pending_judges = [
+            ExtractedProposalJudge(
+                id=1,
+                proposal_id=1,
+                extracted_politician_name="山田太郎",
+                extracted_judgment="APPROVE",
+            ),
+            ExtractedProposalJudge(
+                id=2,
+                proposal_id=1,
+                extracted_politician_name="髙橋　一郎議員",
+                extracted_judgment="OPPOSE",
+            ),
+            ExtractedProposalJudge(
+                id=3,
+                proposal_id=1,
+                extracted_politician_name=None,
+                extracted_judgment="APPROVE",
+            ),
+        ]
+        extracted_repo.get_pending_by_proposal.return_value = pending_judges
+        proposal_repo.get_by_ids.return_value = []
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(10, "山田太郎", "○○党"),
+            _politician_row(20, "高橋一郎", "△△党"),
+        ]
+
+        # Act
+        result = await use_case.match_judges(MatchProposalJudgesInputDTO(proposal_id=1))
+
+        # Assert
+        assert [r.matched_politician_id for r in result.results] == [10, 20, None]
+        assert [r.confidence_score for r in result.results] == [1.0, 0.95, 0.0]
+        assert [r.matching_status for r in result.results] == [
+            "matched",
+            "matched",
+            "no_match",
+        ]
+        llm_service.match_conference_member.assert_not_called()
+        politician_repo.get_all_for_matching.assert_awaited_once()
+        politician_repo.search_by_name.assert_not_called()
+        extracted_repo.bulk_update_matching_results.assert_awaited_once_with(
+            pending_judges
+        )
+
+    @pytest.mark.asyncio
+    async def test_match_judges_uses_conference_roster_for_homonyms(
+        self, mock_repositories, mock_services
+    ):
+        """The conference roster narrows homonyms down to its member"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, judge_repo = mock_repositories
+        scraper_service, llm_service = mock_services
+        affiliation_repo = AsyncMock()
+        use_case = ExtractProposalJudgesUseCase(
+            proposal_repository=proposal_repo,
+            politician_repository=politician_repo,
+            extracted_proposal_judge_repository=extracted_repo,
+            proposal_judge_repository=judge_repo,
+            web_scraper_service=scraper_service,
+            llm_service=llm_service,
+            politician_affiliation_repository=affiliation_repo,
+        )
+
+        pending_judges = [
+            ExtractedProposalJudge(
+                id=i,
+                proposal_id=proposal_id,
+                extracted_politician_name="佐藤一郎",
+                extracted_judgment="APPROVE",
+            )
+            for i, proposal_id in ((1, 100), (2, 101))
+        ]
+        extracted_repo.get_all_pending.return_value = pending_judges
+        proposal_repo.get_by_ids.side_effect = lambda proposal_ids: [
+            Proposal(id=proposal_id, title="議案", conference_id=5)
+            for proposal_id in proposal_ids
+        ]
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(30, "佐藤一郎", "○○党"),
+            _politician_row(31, "佐藤一郎", "△△党"),
+        ]
+        affiliation_repo.get_by_conference.return_value = [
+            PoliticianAffiliation(
+                politician_id=31, conference_id=5, start_date=date(2023, 5, 1)
+            )
+        ]
+
+        # Act
+        result = await use_case.match_judges(MatchProposalJudgesInputDTO())
+
+        # Assert
+        assert [r.matched_politician_id for r in result.results] == [31, 31]
+        assert result.matched_count == 2
+        # Proposals are loaded in one query, and their shared conference's
+        # roster is read once
+        proposal_repo.get_by_ids.assert_awaited_once_with([100, 101])
+        proposal_repo.get_by_id.assert_not_called()
+        affiliation_repo.get_by_conference.assert_awaited_once_with(
+            5, active_only=False
+        )
+        llm_service.match_conference_member.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_match_judges_uses_roster_as_of_meeting_date(
+        self, mock_repositories, mock_services
+    ):
+        """An ended affiliation still resolves votes from its term"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, judge_repo = mock_repositories
+        scraper_service, llm_service = mock_services
+        affiliation_repo = AsyncMock()
+        meeting_repo = AsyncMock()
+        use_case = ExtractProposalJudgesUseCase(
+            proposal_repository=proposal_repo,
+            politician_repository=politician_repo,
+            extracted_proposal_judge_repository=extracted_repo,
+            proposal_judge_repository=judge_repo,
+            web_scraper_service=scraper_service,
+            llm_service=llm_service,
+            politician_affiliation_repository=affiliation_repo,
+            meeting_repository=meeting_repo,
+        )
+
+        extracted_repo.get_all_pending.return_value = [
+            ExtractedProposalJudge(
+                id=i,
+                proposal_id=proposal_id,
+                extracted_politician_name="佐藤一郎",
+                extracted_judgment="APPROVE",
+            )
+            for i, proposal_id in ((1, 100), (2, 101))
+        ]
+        proposal_repo.get_by_ids.return_value = [
+            Proposal(id=100, title="議案", meeting_id=10, conference_id=5),
+            Proposal(id=101, title="議案", meeting_id=11, conference_id=5),
+        ]
+        meeting_repo.get_by_ids.return_value = [
+            Meeting(id=10, conference_id=5, date=date(2022, 6, 1)),
+            Meeting(id=11, conference_id=5, date=date(2024, 6, 1)),
+        ]
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(30, "佐藤一郎", "○○党"),
+            _politician_row(31, "佐藤一郎", "△△党"),
+        ]
+        affiliation_repo.get_by_conference.return_value = [
+            PoliticianAffiliation(
+                politician_id=30,
+                conference_id=5,
+                start_date=date(2019, 5, 1),
+                end_date=date(2023, 4, 30),
+            ),
+            PoliticianAffiliation(
+                politician_id=31, conference_id=5, start_date=date(2023, 5, 1)
+            ),
+        ]
+
+        # Act
+        result = await use_case.match_judges(MatchProposalJudgesInputDTO())
+
+        # Assert
+        assert [r.matched_politician_id for r in result.results] == [30, 31]
+        meeting_repo.get_by_ids.assert_awaited_once_with([10, 11])
+        affiliation_repo.get_by_conference.assert_awaited_once_with(
+            5, active_only=False
+        )
+        llm_service.match_conference_member.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_match_judges_falls_back_to_all_politicians(
+        self, mock_repositories, mock_services
+    ):
+        """Judges missing from the conference roster are matched against everyone"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, judge_repo = mock_repositories
+        scraper_service, llm_service = mock_services
+        affiliation_repo = AsyncMock()
+        matching_service = AsyncMock()
+        use_case = ExtractProposalJudgesUseCase(
+            proposal_repository=proposal_repo,
+            politician_repository=politician_repo,
+            extracted_proposal_judge_repository=extracted_repo,
+            proposal_judge_repository=judge_repo,
+            web_scraper_service=scraper_service,
+            llm_service=llm_service,
+            politician_affiliation_repository=affiliation_repo,
+            politician_matching_service=matching_service,
+        )
+
+        extracted_repo.get_pending_by_proposal.return_value = [
+            ExtractedProposalJudge(
+                id=1, proposal_id=100, extracted_politician_name="鈴木花子"
+            ),
+            ExtractedProposalJudge(
+                id=2, proposal_id=100, extracted_politician_name="すずき"
+            ),
+        ]
+        proposal_repo.get_by_ids.return_value = [
+            Proposal(id=100, title="議案", conference_id=5)
+        ]
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(31, "佐藤次郎", "△△党"),
+            _politician_row(40, "鈴木花子", "○○党"),
+        ]
+        # The affiliation data has not caught up with 鈴木花子 yet
+        affiliation_repo.get_by_conference.return_value = [
+            PoliticianAffiliation(
+                politician_id=31, conference_id=5, start_date=date(2023, 5, 1)
+            )
+        ]
+
+        async def find_best_matches(requests, available_politicians=None):
+            candidates = {c["id"]: c for c in available_politicians or []}
+            if 40 in candidates:
+                return [
+                    PoliticianMatch(
+                        matched=True,
+                        politician_id=40,
+                        politician_name="鈴木花子",
+                        confidence=0.8,
+                        reason="読みが一致",
+                    )
+                ]
+            return [PoliticianMatch(matched=False, confidence=0.0, reason="該当なし")]
+
+        matching_service.find_best_matches.side_effect = find_best_matches
+
+        # Act
+        result = await use_case.match_judges(
+            MatchProposalJudgesInputDTO(proposal_id=100)
+        )
+
+        # Assert
+        assert [r.matched_politician_id for r in result.results] == [40, 40]
+        assert result.results[0].matching_notes == "Exact name match in roster"
+        candidate_ids = [
+            [c["id"] for c in call.kwargs["available_politicians"]]
+            for call in matching_service.find_best_matches.call_args_list
+        ]
+        assert candidate_ids == [[31], [31, 40]]
+
+    @pytest.mark.asyncio
+    async def test_match_judges_sends_unresolved_names_in_one_batch(
+        self, mock_repositories, mock_services
+    ):
+        """Unresolved judges go to the politician matching service together"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, judge_repo = mock_repositories
+        scraper_service, llm_service = mock_services
+        matching_service = AsyncMock()
+        use_case = ExtractProposalJudgesUseCase(
+            proposal_repository=proposal_repo,
+            politician_repository=politician_repo,
+            extracted_proposal_judge_repository=extracted_repo,
+            proposal_judge_repository=judge_repo,
+            web_scraper_service=scraper_service,
+            llm_service=llm_service,
+            politician_matching_service=matching_service,
+        )
+
+        pending_judges = [
+            ExtractedProposalJudge(
+                id=1, proposal_id=1, extracted_politician_name="山田太郎"
+            ),
+            ExtractedProposalJudge(
+                id=2,
+                proposal_id=1,
+                extracted_politician_name="やまだ花子",
+                extracted_party_name="○○党",
+            ),
+            ExtractedProposalJudge(
+                id=3, proposal_id=1, extracted_politician_name="不明な議員"
+            ),
+        ]
+        extracted_repo.get_pending_by_proposal.return_value = pending_judges
+        proposal_repo.get_by_ids.return_value = []
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(10, "山田太郎", "○○党"),
+            _politician_row(12, "山田花子", "○○党"),
+        ]
+        matching_service.find_best_matches.return_value = [
+            PoliticianMatch(
+                matched=True,
+                politician_id=12,
+                politician_name="山田花子",
+                confidence=0.6,
+                reason="読みが一致",
+            ),
+            PoliticianMatch(matched=False, confidence=0.0, reason="該当なし"),
+        ]
+
+        # Act
+        result = await use_case.match_judges(MatchProposalJudgesInputDTO(proposal_id=1))
+
+        # Assert
+        matching_service.find_best_matches.assert_awaited_once()
+        requests = matching_service.find_best_matches.call_args.args[0]
+        assert [r.speaker_name for r in requests] == ["やまだ花子", "不明な議員"]
+        assert requests[0].speaker_party == "○○党"
+
+        assert [r.matching_status for r in result.results] == [
+            "matched",
+            "needs_review",
+            "no_match",
+        ]
+        assert result.results[1].matched_politician_name == "山田花子"
+        assert result.results[2].matching_notes == "該当なし"
+        llm_service.match_conference_member.assert_not_called()
+        extracted_repo.bulk_update_matching_results.assert_awaited_once_with(
+            pending_judges
+        )
+
+    @pytest.mark.asyncio
+    async def test_match_judges_batch_excludes_out_of_conference_homonym(
+        self, mock_repositories, mock_services
+    ):
+        """Batch matching only offers the conference roster as candidates"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, judge_repo = mock_repositories
+        scraper_service, llm_service = mock_services
+        affiliation_repo = AsyncMock()
+        matching_service = AsyncMock()
+        use_case = ExtractProposalJudgesUseCase(
+            proposal_repository=proposal_repo,
+            politician_repository=politician_repo,
+            extracted_proposal_judge_repository=extracted_repo,
+            proposal_judge_repository=judge_repo,
+            web_scraper_service=scraper_service,
+            llm_service=llm_service,
+            politician_affiliation_repository=affiliation_repo,
+            politician_matching_service=matching_service,
+        )
+
+        extracted_repo.get_pending_by_proposal.return_value = [
+            ExtractedProposalJudge(
+                id=1,
+                proposal_id=100,
+                extracted_politician_name="佐藤",
+                extracted_party_name="○○党",
+            )
+        ]
+        proposal_repo.get_by_ids.return_value = [
+            Proposal(id=100, title="議案", conference_id=5)
+        ]
+        all_politicians = [
+            # Same surname and party, but not a member of the conference
+            _politician_row(30, "佐藤一郎", "○○党"),
+            _politician_row(31, "佐藤次郎", "△△党"),
+        ]
+        politician_repo.get_all_for_matching.return_value = all_politicians
+        affiliation_repo.get_by_conference.return_value = [
+            PoliticianAffiliation(
+                politician_id=31, conference_id=5, start_date=date(2023, 5, 1)
+            )
+        ]
+
+        async def find_best_matches(requests, available_politicians=None):
+            # Prefers a candidate of the same party, as the LLM would
+            candidates = (
+                all_politicians
+                if available_politicians is None
+                else available_politicians
+            )
+            best = sorted(
+                candidates,
+                key=lambda c: c["party_name"] != requests[0].speaker_party,
+            )[0]
+            return [
+                PoliticianMatch(
+                    matched=True,
+                    politician_id=best["id"],
+                    politician_name=best["name"],
+                    confidence=0.8,
+                    reason="姓が一致",
+                )
+            ]
+
+        matching_service.find_best_matches.side_effect = find_best_matches
+
+        # Act
+        result = await use_case.match_judges(
+            MatchProposalJudgesInputDTO(proposal_id=100)
+        )
+
+        # Assert
+        assert result.results[0].matched_politician_id == 31
+        candidates = matching_service.find_best_matches.call_args.kwargs[
+            "available_politicians"
+        ]
+        assert [c["id"] for c in candidates] == [31]
+
+    @pytest.mark.asyncio
+    async def test_match_judges_keeps_unresolved_pending_when_llm_fails(
+        self, use_case, mock_repositories, mock_services
+    ):
+        """A failed LLM stage leaves unresolved judges pending for a retry"""
+        # Arrange
+        proposal_repo, politician_repo, extracted_repo, _ = mock_repositories
+        _, llm_service = mock_services
+
+        pending_judges = [
+            ExtractedProposalJudge(
+                id=1, proposal_id=1, extracted_politician_name="山田太郎"
+            ),
+            ExtractedProposalJudge(
+                id=2, proposal_id=1, extracted_politician_name="山田"
+            ),
+        ]
+        extracted_repo.get_pending_by_proposal.return_value = pending_judges
+        proposal_repo.get_by_ids.return_value = []
+        politician_repo.get_all_for_matching.return_value = [
+            _politician_row(10, "山田太郎", "○○党")
+        ]
+        llm_service.match_conference_member.side_effect = RuntimeError("timeout")
+
+        # Act
+        result = await use_case.match_judges(MatchProposalJudgesInputDTO(proposal_id=1))
+
+        # Assert
+        assert result.matched_count == 1
+        assert result.results[1].matching_status == "pending"
+        extracted_repo.bulk_update_matching_results.assert_awaited_once_with(
+            [pending_judges[0]]
+        )
 
     @pytest.mark.asyncio
     async def test_create_judges_success(self, use_case, mock_repositories):
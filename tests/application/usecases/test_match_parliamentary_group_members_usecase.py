@@ -61,7 +61,7 @@ class TestMatchParliamentaryGroupMembersUseCase:
         mock_member_repo.get_pending_members.return_value = [member1, member2]
 
         # Mock matching service responses
-        mock_matching_service.find_matching_politician.side_effect = [
+        mock_matching_service.find_matching_politicians.return_value = [
             (100, 0.9, "Matched with high confidence"),
             (200, 0.6, "Matched with medium confidence"),
         ]
@@ -84,6 +84,10 @@ class TestMatchParliamentaryGroupMembersUseCase:
         assert results[1]["matched_politician_id"] == 200
         assert results[1]["status"] == "needs_review"
 
+        # Verify members are matched in a single batch
+        mock_matching_service.find_matching_politicians.assert_awaited_once_with(
+            [member1, member2]
+        )
         # Verify repository calls
         assert mock_member_repo.update_matching_result.call_count == 2
 
@@ -101,11 +105,9 @@ class TestMatchParliamentaryGroupMembersUseCase:
         )
 
         mock_member_repo.get_pending_members.return_value = [member]
-        mock_matching_service.find_matching_politician.return_value = (
-            None,
-            0.0,
-            "No match found",
-        )
+        mock_matching_service.find_matching_politicians.return_value = [
+            (None, 0.0, "No match found")
+        ]
         mock_matching_service.determine_matching_status.return_value = "no_match"
 
         # Act
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.application.usecases.match_speakers_usecase import MatchSpeakersUseCase
+from src.domain.entities.political_party import PoliticalParty
 from src.domain.entities.politician import Politician
 from src.domain.entities.speaker import Speaker
 
@@ -236,18 +237,63 @@ class TestMatchSpeakersUseCase:
         assert len(results) == 1
         assert results[0].speaker_id == 1
 
+    @pytest.fixture
+    def mock_political_party_repo(self):
+        """Create mock political party repository."""
+        repo = AsyncMock()
+        repo.get_all.return_value = [
+            PoliticalParty(name="自由民主党", id=1),
+            PoliticalParty(name="立憲民主党", id=2),
+        ]
+        return repo
+
+    @pytest.fixture
+    def use_case_with_parties(
+        self,
+        mock_speaker_repo,
+        mock_politician_repo,
+        mock_conversation_repo,
+        mock_speaker_service,
+        mock_llm_service,
+        mock_update_speaker_usecase,
+        mock_political_party_repo,
+    ):
+        """Create MatchSpeakersUseCase instance with party resolution."""
+        return MatchSpeakersUseCase(
+            speaker_repository=mock_speaker_repo,
+            politician_repository=mock_politician_repo,
+            conversation_repository=mock_conversation_repo,
+            speaker_domain_service=mock_speaker_service,
+            llm_service=mock_llm_service,
+            update_speaker_usecase=mock_update_speaker_usecase,
+            political_party_repository=mock_political_party_repo,
+        )
+
     @pytest.mark.asyncio
     async def test_rule_based_matching_with_party_boost(
-        self, use_case, mock_speaker_repo, mock_politician_repo, mock_speaker_service
+        self,
+        use_case_with_parties,
+        mock_speaker_repo,
+        mock_politician_repo,
+        mock_speaker_service,
+        mock_political_party_repo,
     ):
-        """Test rule-based matching with party information boost."""
+        """Test rule-based matching boosted by the resolved party ID."""
         # Setup
-        speaker = Speaker(
-            id=5,
-            name="高橋四郎",
-            is_politician=True,
-            political_party_name="自民党",
-        )
+        speakers = [
+            Speaker(
+                id=5,
+                name="高橋四郎",
+                is_politician=True,
+                political_party_name="自由民主党",
+            ),
+            Speaker(
+                id=6,
+                name="高橋四郎",
+                is_politician=True,
+                political_party_name="自民",
+            ),
+        ]
         politician = Politician(
             id=50,
             name="高橋四郎",
@@ -256,19 +302,50 @@ class TestMatchSpeakersUseCase:
             political_party_id=1,
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.get_politicians.return_value = speakers
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = [politician]
-        mock_speaker_service.calculate_name_similarity.return_value = 0.75
+        mock_speaker_service.calculate_name_similarity.return_value = 0.78
 
         # Execute
-        results = await use_case.execute(use_llm=False)
+        results = await use_case_with_parties.execute(use_llm=False)
 
         # Verify
-        assert len(results) == 1
         assert results[0].matched_politician_id == 50
-        # Score should be boosted by 0.1 for party match
-        assert results[0].confidence_score == 0.85
+        # Score is boosted only when the party name resolves to the same ID
+        assert results[0].confidence_score == pytest.approx(0.83)
+        # "自民" cannot be resolved, so no boost is applied
+        assert results[1].matched_politician_id is None
+        # The party list is loaded once and cached
+        mock_political_party_repo.get_all.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rule_based_matching_with_party_mismatch(
+        self,
+        use_case_with_parties,
+        mock_speaker_repo,
+        mock_politician_repo,
+        mock_speaker_service,
+    ):
+        """Test rule-based matching penalized by a different party."""
+        speaker = Speaker(
+            id=5, name="高橋四郎", is_politician=True, political_party_name="立憲"
+        )
+        politician = Politician(
+            id=50,
+            name="高橋四郎",
+            prefecture="東京都",
+            district="東京5区",
+            political_party_id=1,
+        )
+        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_politician_repo.search_by_name.return_value = [politician]
+        mock_speaker_service.calculate_name_similarity.return_value = 0.9
+
+        results = await use_case_with_parties.execute(use_llm=False)
+
+        # "立憲" resolves to 立憲民主党 (ID 2), which differs from the candidate
+        assert results[0].matched_politician_id is None
 
     @pytest.mark.asyncio
     async def test_baml_matching_no_service_configured(
@@ -3,7 +3,9 @@
 Issue #885, #906: BAML is now the only LLM matching method.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,6 +13,10 @@ from src.application.usecases.match_speakers_usecase import MatchSpeakersUseCase
 from src.domain.entities.politician import Politician
 from src.domain.entities.speaker import Speaker
 from src.domain.value_objects.politician_match import PoliticianMatch
+from src.infrastructure.external.cached_llm_service import SingleFlight
+from src.infrastructure.external.politician_matching import (
+    BAMLPoliticianMatchingService,
+)
 
 
 class TestMatchSpeakersUseCaseBAML:
@@ -312,3 +318,76 @@ class TestMatchSpeakersUseCaseBAML:
 
         # BAMLサービスは呼び出されない
         mock_baml_matching_service.find_best_match.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_speakers_share_one_baml_call(
+        self,
+        mock_speaker_repo,
+        mock_politician_repo,
+        mock_conversation_repo,
+        mock_speaker_service,
+        mock_llm_service,
+        mock_update_speaker_usecase,
+    ):
+        """同時に処理される同名の発言者はBAMLを1回だけ呼び出す"""
+        # Setup - DIと同様にBAMLサービスのSingleFlightをユースケース間で共有する
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def match_politician(**kwargs):
+            await release.wait()
+            return MagicMock(
+                matched=True,
+                politician_id=100,
+                politician_name="山田太郎",
+                political_party_name="自由民主党",
+                confidence=0.9,
+                reason="BAMLマッチング",
+            )
+
+        mock_politician_repo.search_by_name.return_value = []
+        mock_politician_repo.get_all_for_matching.return_value = [
+            {"id": 100, "name": "山田太郎", "party_name": "自由民主党"},
+        ]
+
+        def create_use_case() -> MatchSpeakersUseCase:
+            return MatchSpeakersUseCase(
+                speaker_repository=mock_speaker_repo,
+                politician_repository=mock_politician_repo,
+                conversation_repository=mock_conversation_repo,
+                speaker_domain_service=mock_speaker_service,
+                llm_service=mock_llm_service,
+                update_speaker_usecase=mock_update_speaker_usecase,
+                baml_matching_service=BAMLPoliticianMatchingService(
+                    mock_llm_service,
+                    mock_politician_repo,
+                    single_flight=single_flight,
+                ),
+            )
+
+        speakers = {
+            1: Speaker(id=1, name="ヤマダタロウ", is_politician=True),
+            2: Speaker(id=2, name="ヤマダタロウ", is_politician=True),
+        }
+        mock_speaker_repo.get_by_id.side_effect = lambda speaker_id: speakers[
+            speaker_id
+        ]
+
+        with patch(
+            "src.infrastructure.external.politician_matching."
+            "baml_politician_matching_service.b"
+        ) as mock_b:
+            mock_b.MatchPolitician = AsyncMock(side_effect=match_politician)
+
+            # Execute - 別々のユースケースで同名の発言者を並行して処理
+            tasks = [
+                asyncio.create_task(create_use_case().execute(speaker_ids=[i]))
+                for i in speakers
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        # Verify
+        assert [r[0].matched_politician_id for r in results] == [100, 100]
+        mock_b.MatchPolitician.assert_awaited_once()
@@ -54,6 +54,12 @@ from tests.fixtures.entity_factories import (  # noqa: E402
 )
 
 from src.common.metrics import setup_metrics  # noqa: E402
+from src.infrastructure.resilience.circuit_breaker import (  # noqa: E402
+    reset_async_circuit_breakers,
+)
+from src.infrastructure.resilience.rate_limiter import (  # noqa: E402
+    reset_llm_rate_limiters,
+)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -71,6 +77,18 @@ def setup_test_metrics():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_llm_resilience():
+    """Reset process-wide LLM rate limiters and circuit breakers per test.
+
+    Prevents a test that simulates 429s or outages from slowing down or
+    tripping the breaker for later tests using the same model.
+    """
+    yield
+    reset_llm_rate_limiters()
+    reset_async_circuit_breakers()
+
+
 # Entity fixtures
 @pytest.fixture
 def sample_governing_body():
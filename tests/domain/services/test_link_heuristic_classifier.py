@@ -0,0 +1,85 @@
+"""Tests for LinkHeuristicClassifier."""
+
+import pytest
+
+from src.domain.services.interfaces.llm_link_classifier_service import LinkType
+from src.domain.services.link_heuristic_classifier import LinkHeuristicClassifier
+from src.domain.value_objects.link import Link
+
+
+@pytest.fixture
+def classifier():
+    return LinkHeuristicClassifier()
+
+
+class TestLinkHeuristicClassifier:
+    """Test cases for LinkHeuristicClassifier."""
+
+    @pytest.mark.parametrize(
+        ("url", "text", "rel", "expected"),
+        [
+            # Non-page links
+            ("mailto:info@example.com", "お問い合わせ", "", LinkType.OTHER),
+            ("https://twitter.com/party", "X", "", LinkType.OTHER),
+            ("https://www.facebook.com/party", "Facebook", "", LinkType.OTHER),
+            ("https://example.com/files/list.pdf", "議員一覧", "", LinkType.OTHER),
+            # Pagination
+            ("https://example.com/members?page=2", "2", "", LinkType.MEMBER_LIST),
+            ("https://example.com/members/page/3/", "3", "", LinkType.MEMBER_LIST),
+            ("https://example.com/members/2", "次へ", "", LinkType.MEMBER_LIST),
+            ("https://example.com/members/b", "B", "next", LinkType.MEMBER_LIST),
+            # Prefectures
+            ("https://example.com/a/1", "東京都", "", LinkType.PREFECTURE_LIST),
+            ("https://example.com/a/2", "大阪", "", LinkType.PREFECTURE_LIST),
+            ("https://example.com/a/3", "北海道", "", LinkType.PREFECTURE_LIST),
+            (
+                "https://example.com/members/hokkaido/",
+                "Hokkaido",
+                "",
+                LinkType.PREFECTURE_LIST,
+            ),
+            ("https://www.jcp.or.jp/list/pref/13", "", "", LinkType.PREFECTURE_LIST),
+            # Member lists
+            ("https://example.com/about/giin", "所属議員", "", LinkType.MEMBER_LIST),
+            ("https://example.com/x", "地方議員一覧", "", LinkType.MEMBER_LIST),
+            ("https://example.com/members/", "Members", "", LinkType.MEMBER_LIST),
+            ("https://example.com/member/index.html", "", "", LinkType.MEMBER_LIST),
+            # Profiles
+            (
+                "https://example.com/profile/yamada-taro",
+                "山田太郎",
+                "",
+                LinkType.MEMBER_PROFILE,
+            ),
+            ("https://example.com/member/123.html", "", "", LinkType.MEMBER_PROFILE),
+        ],
+    )
+    def test_classify(self, classifier, url, text, rel, expected):
+        result = classifier.classify(Link(url=url, text=text, rel=rel))
+
+        assert result is not None
+        assert result.link_type == expected
+        assert result.url == url
+        assert result.confidence >= 0.7
+        assert result.reason
+
+    @pytest.mark.parametrize(
+        ("url", "text"),
+        [
+            ("https://example.com/members/yamada", "山田太郎"),
+            ("https://example.com/news/2024", "2024"),
+            ("https://example.com/city/sapporo", "札幌市"),
+            ("https://example.com/about", "党について"),
+        ],
+    )
+    def test_undecided_links_are_left_for_llm(self, classifier, url, text):
+        assert classifier.classify(Link(url=url, text=text)) is None
+
+    def test_partition(self, classifier):
+        decided = Link(url="https://example.com/a", text="東京都")
+        undecided = Link(url="https://example.com/members/yamada", text="山田太郎")
+
+        classifications, residue = classifier.partition([decided, undecided])
+
+        assert [c.url for c in classifications] == [decided.url]
+        assert residue == [undecided]
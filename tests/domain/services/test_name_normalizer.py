@@ -0,0 +1,91 @@
+"""Tests for NameNormalizer"""
+
+import pytest
+
+from src.domain.services.name_normalizer import NameNormalizer, get_name_normalizer
+
+
+@pytest.fixture
+def normalizer() -> NameNormalizer:
+    return NameNormalizer()
+
+
+class TestNormalize:
+    """Test cases for NameNormalizer.normalize"""
+
+    def test_removes_honorifics_titles_markers_and_spaces(self, normalizer):
+        assert normalizer.normalize("○山田　太郎議員") == "山田太郎"
+        assert normalizer.normalize("田中花子副委員長") == "田中花子"
+        assert normalizer.normalize("佐藤一郎議員先生") == "佐藤一郎"
+
+    def test_folds_width_and_kanji_variants(self, normalizer):
+        """全角・半角と旧字体・異体字の違いを吸収する"""
+        assert normalizer.normalize("髙橋　一郎") == normalizer.normalize("高橋一郎")
+        assert normalizer.normalize("渡邉") == normalizer.normalize("渡辺")
+        assert normalizer.normalize("山﨑") == "山崎"
+        assert normalizer.normalize("ﾀﾅｶ ｲﾁﾛｳ") == "タナカイチロウ"
+        assert normalizer.normalize("ＡＢＣ") == "ABC"
+
+    def test_keeps_title_only_name(self, normalizer):
+        """役職だけの名前は空にしない"""
+        assert normalizer.normalize("議長") == "議長"
+
+    def test_honorific_inside_name_is_kept(self, normalizer):
+        """名前の途中にある敬称と同じ文字は除去しない"""
+        assert normalizer.normalize("君島太郎") == "君島太郎"
+
+    def test_normalize_many(self, normalizer):
+        assert normalizer.normalize_many(["山田太郎君", "髙木氏", "山田太郎君"]) == [
+            "山田太郎",
+            "高木",
+            "山田太郎",
+        ]
+
+    def test_results_are_memoized(self, normalizer):
+        normalizer.normalize("山田太郎君")
+        normalizer.normalize("山田太郎君")
+
+        assert normalizer._normalize_cached.cache_info().hits == 1
+
+
+class TestStripHonorifics:
+    """Test cases for NameNormalizer.strip_honorifics"""
+
+    def test_keeps_notation(self, normalizer):
+        """表記（全角空白など）は変えずに末尾の敬称だけを除去する"""
+        assert normalizer.strip_honorifics(" 山田　太郎君 ") == "山田　太郎"
+        assert normalizer.strip_honorifics("山田太郎委員様") == "山田太郎"
+
+    def test_titles_are_removed_only_when_requested(self, normalizer):
+        assert normalizer.strip_honorifics("高橋三郎市長") == "高橋三郎市長"
+        assert (
+            normalizer.strip_honorifics("高橋三郎市長", include_titles=True)
+            == "高橋三郎"
+        )
+
+
+class TestSpeakerPatterns:
+    """Test cases for title extraction and non-person detection"""
+
+    def test_extract_person_name_from_title(self, normalizer):
+        assert normalizer.extract_person_name_from_title("議長 (西村義直)") == (
+            "西村義直"
+        )
+        assert normalizer.extract_person_name_from_title("市長 （田中太郎）") == (
+            "田中太郎"
+        )
+        assert normalizer.extract_person_name_from_title("山田 (太郎)") == (
+            "山田 (太郎)"
+        )
+        assert normalizer.extract_person_name_from_title("議長 (拍手)") == (
+            "議長 (拍手)"
+        )
+
+    def test_is_non_person(self, normalizer):
+        assert normalizer.is_non_person("(「異議なし」と呼ぶ者あり)")
+        assert normalizer.is_non_person("拍手")
+        assert not normalizer.is_non_person("山田太郎")
+
+
+def test_get_name_normalizer_is_shared():
+    assert get_name_normalizer() is get_name_normalizer()
@@ -0,0 +1,145 @@
+"""Tests for NameSimilarityScorer and the batched similarity kernels"""
+
+import pytest
+
+from src.domain.services.name_similarity import (
+    BATCH_MIN_CANDIDATES,
+    NAME_MATCH_THRESHOLD,
+    PARTY_MATCH_BONUS,
+    PARTY_MISMATCH_PENALTY,
+    NameSimilarityScorer,
+    adjust_for_party,
+    bigram_jaccard_similarities,
+    edit_similarities,
+    jaro_winkler_similarities,
+)
+
+
+@pytest.fixture
+def scorer() -> NameSimilarityScorer:
+    return NameSimilarityScorer()
+
+
+class TestSimilarityKernels:
+    """Test cases for the 1 × N similarity kernels"""
+
+    def test_jaro_winkler(self):
+        scores = jaro_winkler_similarities(
+            "MARTHA", ["MARHTA", "MARTHA", "DIXON", "", "ZZZZ"]
+        )
+        assert scores[0] == pytest.approx(0.9611, abs=1e-4)
+        assert scores[1] == pytest.approx(1.0)
+        assert scores[2] == pytest.approx(0.0)
+        assert scores[3] == 0.0
+        assert scores[4] == 0.0
+        assert jaro_winkler_similarities("DWAYNE", ["DUANE"])[0] == pytest.approx(
+            0.84, abs=1e-4
+        )
+
+    def test_edit_similarity(self):
+        scores = edit_similarities("kitten", ["sitting", "kitten", "", "kit"])
+        assert scores[0] == pytest.approx(1 - 3 / 7)
+        assert scores[1] == pytest.approx(1.0)
+        assert scores[2] == pytest.approx(0.0)
+        assert scores[3] == pytest.approx(0.5)
+
+    def test_bigram_jaccard(self):
+        scores = bigram_jaccard_similarities("山田太郎", ["山田次郎", "山田太郎", "山"])
+        # {山田, 田太, 太郎} と {山田, 田次, 次郎} の共通は1つ
+        assert scores[0] == pytest.approx(1 / 5)
+        assert scores[1] == pytest.approx(1.0)
+        assert scores[2] == 0.0
+
+    def test_empty_candidates(self):
+        assert len(jaro_winkler_similarities("山田", [])) == 0
+        assert len(edit_similarities("山田", [])) == 0
+        assert len(bigram_jaccard_similarities("山田", [])) == 0
+
+
+class TestNameSimilarityScorer:
+    """Test cases for NameSimilarityScorer"""
+
+    def test_identical_after_normalization(self, scorer):
+        assert scorer.score("山田太郎議員", "山田　太郎") == 1.0
+        assert scorer.score("髙橋一郎", "高橋一郎") == 1.0
+
+    def test_permutation_is_not_a_match(self, scorer):
+        """同じ文字の並べ替えは一致とみなさない"""
+        assert scorer.score("山田太郎", "田山太郎") < NAME_MATCH_THRESHOLD
+        assert scorer.score("山田太郎", "太郎山田") < NAME_MATCH_THRESHOLD
+
+    def test_one_character_difference_is_not_a_match(self, scorer):
+        assert 0 < scorer.score("山田太郎", "山田次郎") < NAME_MATCH_THRESHOLD
+
+    def test_unrelated_names(self, scorer):
+        assert scorer.score("山田太郎", "佐藤花子") == 0.0
+
+    def test_score_many_matches_pairwise_scores(self, scorer):
+        candidates = ["山田太郎", "山田次郎", "田中花子", "山田", "ヤマダタロウ"]
+
+        scores = scorer.score_many("山田太郎君", candidates)
+
+        assert scores == pytest.approx(
+            [scorer.score("山田太郎君", candidate) for candidate in candidates]
+        )
+        assert scores[0] == 1.0
+        assert scores[1] > scores[3] > scores[2]
+
+    def test_batched_and_pairwise_paths_agree(self, scorer):
+        """候補数によらず同じ類似度になる"""
+        candidates = [
+            f"{surname}{given}"
+            for surname in ["山田", "田中", "佐藤", "鈴木", "高橋"]
+            for given in [
+                "太郎",
+                "花子",
+                "次郎",
+                "一郎",
+                "はなこ",
+                "タロウ",
+                "",
+            ]
+        ]
+        assert len(candidates) >= BATCH_MIN_CANDIDATES
+
+        batched = scorer.details_many("山田　太郎君", candidates)
+        pairwise = [
+            scorer.details_many("山田　太郎君", [candidate])[0]
+            for candidate in candidates
+        ]
+
+        for batch_result, pair_result in zip(batched, pairwise, strict=True):
+            assert batch_result.jaro_winkler == pytest.approx(pair_result.jaro_winkler)
+            assert batch_result.edit == pytest.approx(pair_result.edit)
+            assert batch_result.bigram_jaccard == pytest.approx(
+                pair_result.bigram_jaccard
+            )
+            assert batch_result.score == pytest.approx(pair_result.score)
+
+    def test_details_many(self, scorer):
+        [details] = scorer.details_many("山田太郎", ["山田次郎"])
+
+        assert details.edit == pytest.approx(0.75)
+        assert details.bigram_jaccard == pytest.approx(0.2)
+        assert 0 < details.score < details.jaro_winkler
+
+    def test_invalid_weights(self):
+        with pytest.raises(ValueError):
+            NameSimilarityScorer(weights=(0.0, 0.0, 0.0))
+
+
+class TestAdjustForParty:
+    """Test cases for adjust_for_party"""
+
+    def test_same_party(self):
+        assert adjust_for_party(0.8, 1, 1) == pytest.approx(0.8 + PARTY_MATCH_BONUS)
+        assert adjust_for_party(1.0, 1, 1) == 1.0
+
+    def test_different_party(self):
+        assert adjust_for_party(0.9, 1, 2) == pytest.approx(
+            0.9 - PARTY_MISMATCH_PENALTY
+        )
+
+    def test_unknown_party(self):
+        assert adjust_for_party(0.8, None, 1) == 0.8
+        assert adjust_for_party(0.8, 1, None) == 0.8
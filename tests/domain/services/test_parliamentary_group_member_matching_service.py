@@ -12,6 +12,10 @@ from src.domain.services.parliamentary_group_member_matching_service import (
     ParliamentaryGroupMemberMatchingService,
 )
 from src.domain.types import LLMMatchResult
+from src.domain.value_objects.politician_match import (
+    PoliticianMatch,
+    PoliticianMatchRequest,
+)
 
 
 class TestParliamentaryGroupMemberMatchingService:
@@ -156,6 +160,93 @@ class TestParliamentaryGroupMemberMatchingService:
         assert confidence == 0.0
         assert "No matching" in reason
 
+    @pytest.mark.asyncio
+    async def test_find_matching_politicians_batches_unresolved_members(
+        self, mock_politician_repo, mock_llm_service, mock_speaker_service
+    ):
+        """Test unresolved members are sent to the matcher in a single batch."""
+        # Arrange
+        batch_matcher = AsyncMock()
+        batch_matcher.find_best_matches.return_value = [
+            PoliticianMatch(
+                matched=True, politician_id=200, confidence=0.85, reason="表記ゆれ"
+            ),
+            PoliticianMatch(matched=False, confidence=0.2, reason="候補なし"),
+        ]
+        service = ParliamentaryGroupMemberMatchingService(
+            politician_repository=mock_politician_repo,
+            llm_service=mock_llm_service,
+            speaker_service=mock_speaker_service,
+            politician_matching_service=batch_matcher,
+        )
+        members = [
+            ExtractedParliamentaryGroupMember(
+                parliamentary_group_id=1,
+                extracted_name=name,
+                source_url="http://example.com",
+                extracted_party_name=party,
+            )
+            for name, party in [
+                ("田中太郎議員", None),
+                ("佐藤花子", "立憲民主党"),
+                ("山田次郎", None),
+            ]
+        ]
+        mock_politician_repo.search_by_name.side_effect = lambda name: (
+            [Politician(name="田中太郎", prefecture="東京都", district="", id=100)]
+            if name == "田中太郎"
+            else []
+        )
+
+        # Act
+        results = await service.find_matching_politicians(members)
+
+        # Assert
+        assert results[0][0] == 100
+        assert results[1] == (200, 0.85, "表記ゆれ")
+        assert results[2] == (None, 0.0, "No matching politician found")
+        batch_matcher.find_best_matches.assert_awaited_once_with(
+            [
+                PoliticianMatchRequest(
+                    speaker_name="佐藤花子",
+                    speaker_type="議員",
+                    speaker_party="立憲民主党",
+                ),
+                PoliticianMatchRequest(speaker_name="山田次郎", speaker_type="議員"),
+            ]
+        )
+        mock_llm_service.match_conference_member.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_matching_politicians_without_batch_matcher(
+        self, matching_service, mock_politician_repo, mock_llm_service
+    ):
+        """Test members fall back to per-member LLM matching."""
+        # Arrange
+        member = ExtractedParliamentaryGroupMember(
+            parliamentary_group_id=1,
+            extracted_name="山田次郎",
+            source_url="http://example.com",
+        )
+        mock_politician_repo.search_by_name.return_value = []
+        mock_politician_repo.get_all.return_value = [
+            Politician(name="山田二郎", prefecture="東京都", district="", id=300)
+        ]
+        mock_llm_service.match_conference_member.return_value = LLMMatchResult(
+            matched=True,
+            matched_id=300,
+            confidence=0.8,
+            reason="表記ゆれ",
+            metadata={},
+        )
+
+        # Act
+        results = await matching_service.find_matching_politicians([member])
+
+        # Assert
+        assert results == [(300, 0.8, "表記ゆれ")]
+        mock_llm_service.match_conference_member.assert_awaited_once()
+
     def test_determine_matching_status_matched(self, matching_service):
         """Test status determination for matched (≥0.7)."""
         assert matching_service.determine_matching_status(0.9) == "matched"
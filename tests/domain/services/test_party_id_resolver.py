@@ -0,0 +1,68 @@
+"""Tests for PartyIdResolver"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.political_party import PoliticalParty
+from src.domain.services.party_id_resolver import PartyIdResolver, is_same_party_name
+
+
+@pytest.fixture
+def party_repository():
+    repository = AsyncMock()
+    repository.get_all.return_value = [
+        PoliticalParty(name="自由民主党", id=1),
+        PoliticalParty(name="立憲民主党", id=2),
+        PoliticalParty(name="国民民主党", id=3),
+        PoliticalParty(name="公明党", id=4),
+    ]
+    return repository
+
+
+class TestPartyIdResolver:
+    """Test cases for PartyIdResolver"""
+
+    @pytest.mark.asyncio
+    async def test_resolves_exact_and_normalized_names(self, party_repository):
+        resolver = PartyIdResolver(party_repository)
+
+        assert await resolver.resolve("自由民主党") == 1
+        assert await resolver.resolve(" 公明党 ") == 4
+
+    @pytest.mark.asyncio
+    async def test_resolves_unique_abbreviation(self, party_repository):
+        resolver = PartyIdResolver(party_repository)
+
+        assert await resolver.resolve("立憲") == 2
+        assert await resolver.resolve("公明") == 4
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_names(self, party_repository):
+        resolver = PartyIdResolver(party_repository)
+
+        assert await resolver.resolve(None) is None
+        assert await resolver.resolve("") is None
+        # 略称が一意に決まらない・前方一致しない場合は解決しない
+        assert await resolver.resolve("自民") is None
+        assert await resolver.resolve("国") is None
+        assert await resolver.resolve("無所属") is None
+
+    @pytest.mark.asyncio
+    async def test_party_list_is_cached(self, party_repository):
+        resolver = PartyIdResolver(party_repository)
+
+        await resolver.resolve("公明党")
+        await resolver.resolve("立憲民主党")
+        party_repository.get_all.assert_awaited_once()
+
+        resolver.invalidate()
+        await resolver.resolve("公明党")
+        assert party_repository.get_all.await_count == 2
+
+
+def test_is_same_party_name():
+    assert is_same_party_name("立憲", "立憲民主党")
+    assert is_same_party_name("公明党", "公明党")
+    assert not is_same_party_name("自民", "自由民主党")
+    assert not is_same_party_name("", "公明党")
@@ -11,6 +11,14 @@ from src.domain.services.meeting_processing_status_service import (
 )
 
 
+def _stub_conversations(repo, conversations: list[Conversation]) -> None:
+    """Stub the count/existence queries of a conversation repository mock."""
+    speaker_ids = {c.speaker_id for c in conversations if c.speaker_id is not None}
+    repo.exists_by_minutes.return_value = bool(conversations)
+    repo.count_by_minutes.return_value = len(conversations)
+    repo.count_distinct_speakers_by_minutes.return_value = len(speaker_ids)
+
+
 class TestMeetingProcessingStatusService:
     """Test cases for MeetingProcessingStatusService."""
 
@@ -111,15 +119,16 @@ class TestMeetingProcessingStatusService:
     ):
         """Test has_conversations returns True when conversations exist."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
+        _stub_conversations(
+            mock_conversation_repository, sample_conversations_with_speakers
         )
 
         result = await service.has_conversations(meeting_id=1)
 
         assert result is True
         mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
+        mock_conversation_repository.exists_by_minutes.assert_awaited_once_with(1)
+        mock_conversation_repository.get_by_minutes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_has_conversations_false_no_minutes(
@@ -145,13 +154,13 @@ class TestMeetingProcessingStatusService:
     ):
         """Test has_conversations returns False when no conversations exist."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = []
+        _stub_conversations(mock_conversation_repository, [])
 
         result = await service.has_conversations(meeting_id=1)
 
         assert result is False
         mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
+        mock_conversation_repository.exists_by_minutes.assert_awaited_once_with(1)
 
     @pytest.mark.asyncio
     async def test_has_speakers_true(
@@ -164,15 +173,16 @@ class TestMeetingProcessingStatusService:
     ):
         """Test has_speakers returns True when speakers exist."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
+        _stub_conversations(
+            mock_conversation_repository, sample_conversations_with_speakers
         )
 
         result = await service.has_speakers(meeting_id=1)
 
         assert result is True
         mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
+        mock_conversation_repository.count_distinct_speakers_by_minutes.assert_awaited()
+        mock_conversation_repository.get_by_minutes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_has_speakers_false_no_speaker_ids(
@@ -185,15 +195,16 @@ class TestMeetingProcessingStatusService:
     ):
         """Test has_speakers returns False when no speaker_ids exist."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_without_speakers
+        _stub_conversations(
+            mock_conversation_repository, sample_conversations_without_speakers
         )
 
         result = await service.has_speakers(meeting_id=1)
 
         assert result is False
         mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
+        mock_conversation_repository.count_distinct_speakers_by_minutes.assert_awaited()
+        mock_conversation_repository.get_by_minutes.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_processing_status_full(
@@ -206,8 +217,8 @@ class TestMeetingProcessingStatusService:
     ):
         """Test get_processing_status with full processing."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
+        _stub_conversations(
+            mock_conversation_repository, sample_conversations_with_speakers
         )
 
         result = await service.get_processing_status(meeting_id=1)
@@ -246,8 +257,8 @@ class TestMeetingProcessingStatusService:
     ):
         """Test get_processing_status with conversations but no speakers."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_without_speakers
+        _stub_conversations(
+            mock_conversation_repository, sample_conversations_without_speakers
         )
 
         result = await service.get_processing_status(meeting_id=1)
@@ -269,8 +280,8 @@ class TestMeetingProcessingStatusService:
     ):
         """Test cache functionality."""
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
+        _stub_conversations(
+            mock_conversation_repository, sample_conversations_with_speakers
         )
 
         # First call - should hit repositories
@@ -116,3 +116,18 @@ class TestSpeakerDomainService:
         # Test invalid link (different names)
         politician.name = "佐藤花子"
         assert service.validate_speaker_politician_link(speaker, politician) is False
+
+    def test_validate_speaker_politician_link_rejects_same_surname(self, service):
+        """Test that a shared surname alone does not validate a link."""
+        speaker = Speaker(name="田中太郎")
+
+        for name in ["田中花子", "田中一郎"]:
+            politician = Politician(name=name, prefecture="東京都", district="東京1区")
+            assert (
+                service.validate_speaker_politician_link(speaker, politician) is False
+            )
+
+        politician = Politician(
+            name="田中 太郎君", prefecture="東京都", district="東京1区"
+        )
+        assert service.validate_speaker_politician_link(speaker, politician) is True
@@ -16,6 +16,8 @@ class TestScrapingConfigDefaults:
         assert config.recursion_limit == 100
         assert config.min_confidence_threshold == 0.7
         assert config.max_pages == 1000
+        assert config.max_concurrency == 6
+        assert config.per_host_concurrency == 3
 
 
 class TestScrapingConfigValidation:
@@ -50,6 +52,13 @@ class TestScrapingConfigValidation:
         with pytest.raises(ValueError, match="max_pages must be >= 1"):
             ScrapingConfig(max_pages=0)
 
+    def test_zero_concurrency_raises_error(self) -> None:
+        """Test that concurrency limits < 1 raise ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            ScrapingConfig(max_concurrency=0)
+        with pytest.raises(ValueError, match="per_host_concurrency must be >= 1"):
+            ScrapingConfig(per_host_concurrency=0)
+
     def test_valid_edge_case_values(self) -> None:
         """Test that edge case values are accepted."""
         # These should not raise any errors
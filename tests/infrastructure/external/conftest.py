@@ -0,0 +1,190 @@
+"""Shared fixtures for external service tests."""
+
+import asyncio
+import gzip
+import json
+
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from aiohttp import web
+
+from src.infrastructure.external.static_first_page_fetcher import (
+    get_render_host_registry,
+)
+
+
+KOKKAI_FIXTURE_DIR = Path(__file__).parents[2] / "fixtures" / "kokkai_api"
+
+SPA_SHELL = (
+    "<html><head><script src='/app.js'></script></head>"
+    "<body><div id='app'></div></body></html>"
+)
+
+
+def _member_table(rows: int = 30) -> str:
+    cells = "".join(
+        f"<tr><td>議員{i}</td><td>所属会派{i}</td></tr>" for i in range(rows)
+    )
+    return f"<table>{cells}</table>"
+
+
+def _fixture_app() -> web.Application:
+    """Small site with the page shapes found on council and party sites."""
+    members = _member_table()
+    routes = web.RouteTableDef()
+
+    @routes.get("/utf8")
+    async def utf8(request: web.Request) -> web.Response:
+        return web.Response(
+            text=f"<html><body><h1>議員一覧</h1>{members}</body></html>",
+            content_type="text/html",
+        )
+
+    @routes.get("/sjis")
+    async def sjis(request: web.Request) -> web.Response:
+        # Charset only declared in <meta>, as on many municipal sites
+        html = (
+            "<html><head><meta http-equiv='Content-Type' "
+            "content='text/html; charset=Shift_JIS'></head>"
+            f"<body><h1>議員名簿（髙橋）</h1>{members}</body></html>"
+        )
+        return web.Response(
+            body=html.encode("cp932"), headers={"Content-Type": "text/html"}
+        )
+
+    @routes.get("/eucjp")
+    async def eucjp(request: web.Request) -> web.Response:
+        html = f"<html><body><h1>委員会名簿</h1>{members}</body></html>"
+        return web.Response(
+            body=html.encode("euc_jp"),
+            headers={"Content-Type": "text/html; charset=EUC-JP"},
+        )
+
+    @routes.get("/gzip")
+    async def gzipped(request: web.Request) -> web.Response:
+        html = f"<html><body><h1>圧縮</h1>{members}</body></html>"
+        return web.Response(
+            body=gzip.compress(html.encode("utf-8")),
+            headers={
+                "Content-Type": "text/html; charset=utf-8",
+                "Content-Encoding": "gzip",
+            },
+        )
+
+    @routes.get("/redirect")
+    async def redirect(request: web.Request) -> web.Response:
+        raise web.HTTPFound("/utf8")
+
+    @routes.get("/spa")
+    @routes.get("/spa/{page}")
+    async def spa(request: web.Request) -> web.Response:
+        return web.Response(text=SPA_SHELL, content_type="text/html")
+
+    @routes.get("/forbidden")
+    async def forbidden(request: web.Request) -> web.Response:
+        return web.Response(status=403, text="Forbidden", content_type="text/html")
+
+    @routes.get("/list.pdf")
+    async def pdf(request: web.Request) -> web.Response:
+        return web.Response(body=b"%PDF-1.4", content_type="application/pdf")
+
+    app = web.Application()
+    app.add_routes(routes)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def isolated_render_hosts():
+    """Keep hosts that one test marks as needing rendering out of the next."""
+    get_render_host_registry.cache_clear()
+    yield
+    get_render_host_registry.cache_clear()
+
+
+@pytest_asyncio.fixture
+async def fixture_server():
+    """Serve the fixture site on localhost and yield its base URL."""
+    runner = web.AppRunner(_fixture_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+class KokkaiApiStub:
+    """Replays recorded speech API responses, paged like the real API.
+
+    Attributes:
+        requests: startRecord of every request received, in order
+        fail_starts: startRecord values answered with HTTP 503
+        delay: seconds to wait before answering (to observe concurrency)
+        max_in_flight: largest number of requests handled at the same time
+    """
+
+    def __init__(self):
+        self.base_url = ""
+        self.requests: list[int] = []
+        self.fail_starts: set[int] = set()
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _records(self, issue_id: str) -> list[dict]:
+        path = KOKKAI_FIXTURE_DIR / f"speech_{issue_id}.json"
+        if not path.exists():
+            return []
+        return json.loads(path.read_text(encoding="utf-8"))["speechRecord"]
+
+    async def handle_speech(self, request: web.Request) -> web.Response:
+        start = int(request.query.get("startRecord", "1"))
+        maximum = int(request.query.get("maximumRecords", "30"))
+        self.requests.append(start)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if start in self.fail_starts:
+                return web.Response(status=503, text="Service Unavailable")
+            if not request.query.get("issueID"):
+                return web.json_response({"message": "検索条件が入力されていません。"})
+
+            records = self._records(request.query["issueID"])
+            page = records[start - 1 : start - 1 + maximum]
+            next_position = start + len(page)
+            return web.json_response(
+                {
+                    "numberOfRecords": len(records),
+                    "numberOfReturn": len(page),
+                    "startRecord": start,
+                    "nextRecordPosition": (
+                        next_position if next_position <= len(records) else None
+                    ),
+                    "speechRecord": page,
+                }
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest_asyncio.fixture
+async def kokkai_api_stub():
+    """Serve the recorded Diet minutes speech API on localhost."""
+    stub = KokkaiApiStub()
+    app = web.Application()
+    app.router.add_get("/api/speech", stub.handle_speech)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    stub.base_url = f"http://127.0.0.1:{runner.addresses[0][1]}/api"
+    try:
+        yield stub
+    finally:
+        await runner.cleanup()
@@ -0,0 +1 @@
+"""クローラーのテストパッケージ"""
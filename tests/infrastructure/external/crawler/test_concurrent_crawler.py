@@ -0,0 +1,136 @@
+"""Tests for ConcurrentCrawler."""
+
+import asyncio
+
+import pytest
+
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
+from src.domain.value_objects.scraping_config import ScrapingConfig
+from src.infrastructure.external.crawler.concurrent_crawler import ConcurrentCrawler
+
+
+# prefecture -> city -> member pages
+SITE = {
+    "https://party.example.com/": [
+        "https://party.example.com/tokyo",
+        "https://party.example.com/osaka",
+    ],
+    "https://party.example.com/tokyo": [
+        "https://party.example.com/tokyo/shibuya",
+        "https://party.example.com/tokyo/minato",
+        # Pagination back to an already queued page
+        "https://party.example.com/tokyo/",
+    ],
+    "https://party.example.com/osaka": ["https://party.example.com/osaka/kita"],
+}
+
+
+class FakeFetcher:
+    """Fetcher that records how many pages are fetched at once."""
+
+    def __init__(self, delay: float = 0.01, fail_urls: set[str] | None = None):
+        self.delay = delay
+        self.fail_urls = fail_urls or set()
+        self.fetched: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def fetch_single_page(self, url: str) -> WebPageContentDTO | None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            self.fetched.append(url)
+            if url in self.fail_urls:
+                raise RuntimeError("fetch failed")
+            return WebPageContentDTO(url=url, html_content=f"<html>{url}</html>")
+        finally:
+            self.active -= 1
+
+
+async def follow_site(request, page):
+    return [(url, 0) for url in SITE.get(request.url, [])]
+
+
+class TestConcurrentCrawler:
+    """Test cases for ConcurrentCrawler."""
+
+    @pytest.mark.asyncio
+    async def test_crawls_tree_once_per_page(self):
+        fetcher = FakeFetcher()
+        crawler = ConcurrentCrawler(fetcher, ScrapingConfig(max_depth=2))
+
+        results = await crawler.crawl(["https://party.example.com/"], follow_site)
+
+        assert sorted(fetcher.fetched) == sorted(
+            [
+                "https://party.example.com/",
+                "https://party.example.com/tokyo",
+                "https://party.example.com/osaka",
+                "https://party.example.com/tokyo/shibuya",
+                "https://party.example.com/tokyo/minato",
+                "https://party.example.com/osaka/kita",
+            ]
+        )
+        assert len(results) == 6
+        depths = {r.page.url: r.request.depth for r in results}
+        assert depths["https://party.example.com/osaka/kita"] == 2
+        parents = {r.page.url: r.request.parent_url for r in results}
+        assert parents["https://party.example.com/osaka/kita"] == (
+            "https://party.example.com/osaka"
+        )
+
+    @pytest.mark.asyncio
+    async def test_respects_depth_limit(self):
+        fetcher = FakeFetcher()
+        crawler = ConcurrentCrawler(fetcher, ScrapingConfig(max_depth=1))
+
+        await crawler.crawl(["https://party.example.com/"], follow_site)
+
+        assert len(fetcher.fetched) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetches_in_parallel_within_host_limit(self):
+        fetcher = FakeFetcher(delay=0.05)
+        crawler = ConcurrentCrawler(
+            fetcher, ScrapingConfig(max_concurrency=6, per_host_concurrency=2)
+        )
+
+        await crawler.crawl(["https://party.example.com/"], follow_site)
+
+        assert fetcher.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_stop_crawl(self):
+        fetcher = FakeFetcher(fail_urls={"https://party.example.com/tokyo"})
+
+        async def handle(request, page):
+            if request.url == "https://party.example.com/osaka":
+                raise ValueError("analysis failed")
+            return await follow_site(request, page)
+
+        crawler = ConcurrentCrawler(fetcher, ScrapingConfig(max_depth=2))
+        results = await crawler.crawl(["https://party.example.com/"], handle)
+
+        assert [r.page.url for r in results] == [
+            "https://party.example.com/",
+            "https://party.example.com/osaka",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_saved_state(self, tmp_path):
+        state_path = tmp_path / "crawl.json"
+        config = ScrapingConfig(max_depth=2)
+        first = FakeFetcher()
+        await ConcurrentCrawler(first, config, state_path=state_path).crawl(
+            ["https://party.example.com/"], follow_site
+        )
+
+        second = FakeFetcher()
+        results = await ConcurrentCrawler(second, config, state_path=state_path).crawl(
+            ["https://party.example.com/"], follow_site
+        )
+
+        assert state_path.exists()
+        assert second.fetched == []
+        assert results == []
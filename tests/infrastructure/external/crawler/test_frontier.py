@@ -0,0 +1,104 @@
+"""Tests for CrawlFrontier."""
+
+import pytest
+
+from src.domain.value_objects.scraping_config import ScrapingConfig
+from src.infrastructure.external.crawler.frontier import CrawlFrontier, CrawlRequest
+
+
+@pytest.fixture
+def frontier():
+    return CrawlFrontier(max_depth=2, max_pages=10)
+
+
+class TestCrawlFrontier:
+    """Test cases for CrawlFrontier."""
+
+    def test_pops_by_priority_then_insertion_order(self, frontier):
+        frontier.add("https://example.com/a", depth=1)
+        frontier.add("https://example.com/b", depth=1)
+        frontier.add("https://example.com/top", depth=0)
+        frontier.add("https://example.com/urgent", depth=2, priority=-1)
+
+        urls = [frontier.pop().url for _ in range(4)]
+
+        assert urls == [
+            "https://example.com/urgent",
+            "https://example.com/top",
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert frontier.pop() is None
+
+    def test_deduplicates_canonical_urls(self, frontier):
+        assert frontier.add("https://example.com/members")
+        assert not frontier.add("https://www.example.com/members/")
+        assert not frontier.add("https://example.com/members#top")
+        assert frontier.pending_count == 1
+
+    def test_rejects_too_deep_and_non_http_urls(self, frontier):
+        assert not frontier.add("https://example.com/deep", depth=3)
+        assert not frontier.add("mailto:info@example.com")
+        assert frontier.pending_count == 0
+
+    def test_page_limit(self):
+        frontier = CrawlFrontier(max_depth=2, max_pages=2)
+
+        assert frontier.add("https://example.com/1")
+        assert frontier.add("https://example.com/2")
+        assert not frontier.add("https://example.com/3")
+
+    def test_from_config(self):
+        frontier = CrawlFrontier.from_config(ScrapingConfig.for_testing())
+
+        assert frontier.max_depth == 1
+        assert frontier.max_pages == 10
+
+    def test_tracks_in_flight_and_done(self, frontier):
+        frontier.add("https://example.com/a")
+        request = frontier.pop()
+
+        assert frontier.in_flight_count == 1
+        assert not frontier.is_finished
+        assert not frontier.add("https://example.com/a")
+
+        frontier.mark_done(request)
+
+        assert frontier.is_finished
+        assert frontier.is_done("https://example.com/a/")
+
+    def test_save_and_load_resumes_crawl(self, frontier, tmp_path):
+        path = tmp_path / "state.json"
+        frontier.add("https://example.com/done")
+        frontier.add("https://example.com/in-flight", depth=1)
+        frontier.add(
+            "https://example.com/pending",
+            depth=2,
+            parent_url="https://example.com/in-flight",
+        )
+        frontier.mark_done(frontier.pop())
+        frontier.pop()
+
+        frontier.save(path)
+        resumed = CrawlFrontier.load(path, max_depth=2, max_pages=10)
+
+        assert resumed.is_done("https://example.com/done")
+        assert not resumed.add("https://example.com/done")
+        # In-flight requests are fetched again after resuming
+        assert [resumed.pop(), resumed.pop()] == [
+            CrawlRequest(url="https://example.com/in-flight", depth=1, priority=1),
+            CrawlRequest(
+                url="https://example.com/pending",
+                depth=2,
+                priority=2,
+                parent_url="https://example.com/in-flight",
+            ),
+        ]
+
+    def test_load_missing_or_corrupt_state(self, tmp_path):
+        assert CrawlFrontier.load(tmp_path / "missing.json").is_finished
+
+        path = tmp_path / "corrupt.json"
+        path.write_text("{not json")
+
+        assert CrawlFrontier.load(path).is_finished
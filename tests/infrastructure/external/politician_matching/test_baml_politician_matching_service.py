@@ -3,10 +3,13 @@
 These tests are marked with @pytest.mark.baml and should run in separate BAML CI.
 """
 
+import asyncio
+
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.domain.value_objects.politician_match import PoliticianMatchRequest
 from src.infrastructure.external.politician_matching import (
     BAMLPoliticianMatchingService,
 )
@@ -44,6 +47,7 @@ def mock_baml_client():
     ) as mock_b:
         mock_match_politician = AsyncMock()
         mock_b.MatchPolitician = mock_match_politician
+        mock_b.MatchPoliticiansBatch = AsyncMock()
         yield mock_b
 
 
@@ -150,6 +154,47 @@ class TestBAMLPoliticianMatchingService:
         # BAMLが呼ばれたことを確認
         mock_baml_client.MatchPolitician.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_baml_call(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """同時に実行中の同一発言者のマッチングは1回のBAML呼び出しにまとめるテスト"""
+        release = asyncio.Event()
+
+        async def match_politician(**kwargs):
+            await release.wait()
+            return MagicMock(
+                matched=True,
+                politician_id=3,
+                politician_name="鈴木一郎",
+                political_party_name="公明党",
+                confidence=0.8,
+                reason="表記ゆれマッチング",
+            )
+
+        mock_baml_client.MatchPolitician.side_effect = match_politician
+
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+
+        # 敬称・空白の違いは正規化して同一の要求とみなす
+        first = asyncio.create_task(service.find_best_match("スズキイチロウ"))
+        second = asyncio.create_task(service.find_best_match("スズキ イチロウ君"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+        assert [r.politician_id for r in results] == [3, 3]
+        mock_baml_client.MatchPolitician.assert_awaited_once()
+
+        # 完了後の呼び出しは新たにBAMLを呼び出す
+        await service.find_best_match("スズキイチロウ")
+        assert mock_baml_client.MatchPolitician.await_count == 2
+
     @pytest.mark.asyncio
     async def test_baml_low_confidence_returns_no_match(
         self,
@@ -287,3 +332,223 @@ class TestBAMLPoliticianMatchingService:
         # 空文字・空白のみ（エッジケース）
         assert service._is_title_only_speaker("") is False  # 空文字
         assert service._is_title_only_speaker("   ") is False  # 空白のみ
+
+
+def _batch_result(key, politician_id=None, confidence=0.0, name=None, party=None):
+    """MatchPoliticiansBatchの結果1件を作成する"""
+    return MagicMock(
+        key=key,
+        matched=politician_id is not None,
+        politician_id=politician_id,
+        politician_name=name,
+        political_party_name=party,
+        confidence=confidence,
+        reason="一括マッチング",
+    )
+
+
+class TestBAMLPoliticianBatchMatching:
+    """find_best_matches（一括マッチング）のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_batch_resolves_multiple_speakers_in_one_call(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """ルールベースで確定しない発言者を1回のBAML呼び出しで解決するテスト"""
+        mock_baml_client.MatchPoliticiansBatch.return_value = [
+            _batch_result("1", 2, 0.8, "佐藤花子", "立憲民主党"),
+            _batch_result("0", 3, 0.85, "鈴木一郎", "公明党"),
+        ]
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+
+        results = await service.find_best_matches(
+            [
+                PoliticianMatchRequest(speaker_name="スズキイチロウ"),
+                PoliticianMatchRequest(speaker_name="山田太郎"),
+                PoliticianMatchRequest(speaker_name="サトウハナコ"),
+                PoliticianMatchRequest(speaker_name="スズキイチロウ"),
+                PoliticianMatchRequest(speaker_name="議長"),
+            ]
+        )
+
+        assert [r.politician_id for r in results] == [3, 1, 2, 3, None]
+        assert "役職名のみ" in results[4].reason
+        mock_baml_client.MatchPoliticiansBatch.assert_awaited_once()
+        speakers = mock_baml_client.MatchPoliticiansBatch.call_args.kwargs["speakers"]
+        # 同じ発言者は重複排除して問い合わせる
+        assert [s.speaker_name for s in speakers] == ["スズキイチロウ", "サトウハナコ"]
+        mock_baml_client.MatchPolitician.assert_not_awaited()
+        mock_politician_repository.get_all_for_matching.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_given_candidates_only(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """候補を指定した場合は全政治家を読み込まず、指定した候補だけで照合するテスト"""
+        mock_baml_client.MatchPoliticiansBatch.return_value = [
+            _batch_result("0", 4, 0.8, "山田太朗", "公明党"),
+            _batch_result("1", None),
+        ]
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+        roster = [
+            {"id": 4, "name": "山田太朗", "party_name": "公明党"},
+            {"id": 5, "name": "佐藤次郎", "party_name": "公明党"},
+        ]
+
+        results = await service.find_best_matches(
+            [
+                PoliticianMatchRequest(speaker_name="山田太郎"),
+                PoliticianMatchRequest(speaker_name="ヤマダタロウ"),
+            ],
+            available_politicians=roster,
+        )
+
+        # 名簿外の同姓同名（id=1の山田太郎）は候補にならない
+        assert [r.politician_id for r in results] == [4, None]
+        formatted = mock_baml_client.MatchPoliticiansBatch.call_args.kwargs[
+            "available_politicians"
+        ]
+        assert "山田太朗" in formatted
+        assert "自由民主党" not in formatted
+        mock_politician_repository.get_all_for_matching.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_groups_speakers_by_party(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """所属政党ごとに分けてbatch_size単位で呼び出すテスト"""
+        mock_baml_client.MatchPoliticiansBatch.side_effect = lambda speakers, **_: [
+            _batch_result(s.key) for s in speakers
+        ]
+        mock_baml_client.MatchPolitician.return_value = _batch_result("0")
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+
+        await service.find_best_matches(
+            [
+                PoliticianMatchRequest(speaker_name=f"議員{i}", speaker_party=party)
+                for i, party in enumerate(["公明党"] * 3 + ["自由民主党"] * 2)
+            ],
+            batch_size=2,
+        )
+
+        batches = [
+            [s.speaker_party for s in call.kwargs["speakers"]]
+            for call in mock_baml_client.MatchPoliticiansBatch.await_args_list
+        ]
+        assert sorted(batches) == [["公明党", "公明党"], ["自由民主党", "自由民主党"]]
+        # 端数の1名は個別呼び出しで処理する
+        mock_baml_client.MatchPolitician.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_for_missing_or_invalid_results(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """欠落・候補外IDの結果は個別呼び出しにフォールバックするテスト"""
+        mock_baml_client.MatchPoliticiansBatch.return_value = [
+            _batch_result("0", 2, 0.9, "佐藤花子", "立憲民主党"),
+            # 候補リストに存在しないID
+            _batch_result("1", 999, 0.9, "架空人物", "無所属"),
+            # 存在しないkey
+            _batch_result("5", 3, 0.9, "鈴木一郎", "公明党"),
+        ]
+        mock_baml_client.MatchPolitician.return_value = MagicMock(
+            matched=True,
+            politician_id=3,
+            politician_name="鈴木一郎",
+            political_party_name="公明党",
+            confidence=0.8,
+            reason="個別マッチング",
+        )
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+
+        results = await service.find_best_matches(
+            [
+                PoliticianMatchRequest(speaker_name="サトウハナコ"),
+                PoliticianMatchRequest(speaker_name="スズキイチロウ"),
+                PoliticianMatchRequest(speaker_name="ヤマダタロウ"),
+            ]
+        )
+
+        assert results[0].politician_id == 2
+        assert results[1].reason == "個別マッチング"
+        assert results[2].reason == "個別マッチング"
+        assert mock_baml_client.MatchPolitician.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_single_calls(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """一括呼び出し自体が失敗した場合は全員を個別呼び出しで処理するテスト"""
+        mock_baml_client.MatchPoliticiansBatch.side_effect = RuntimeError("boom")
+        mock_baml_client.MatchPolitician.return_value = MagicMock(
+            matched=False,
+            politician_id=None,
+            politician_name=None,
+            political_party_name=None,
+            confidence=0.3,
+            reason="該当なし",
+        )
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+
+        results = await service.find_best_matches(
+            [
+                PoliticianMatchRequest(speaker_name="未知の人物A"),
+                PoliticianMatchRequest(speaker_name="未知の人物B"),
+            ]
+        )
+
+        assert [r.matched for r in results] == [False, False]
+        assert mock_baml_client.MatchPolitician.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_low_confidence_returns_no_match(
+        self,
+        mock_llm_service,
+        mock_politician_repository,
+        mock_baml_client,
+    ):
+        """一括結果でも信頼度0.7未満はマッチなしとして扱うテスト"""
+        mock_baml_client.MatchPoliticiansBatch.return_value = [
+            _batch_result("0", 2, 0.5, "佐藤花子", "立憲民主党"),
+            _batch_result("1"),
+        ]
+        service = BAMLPoliticianMatchingService(
+            mock_llm_service, mock_politician_repository
+        )
+
+        results = await service.find_best_matches(
+            [
+                PoliticianMatchRequest(speaker_name="サトウハナコ"),
+                PoliticianMatchRequest(speaker_name="未知の人物"),
+            ]
+        )
+
+        assert results[0].matched is False
+        assert results[0].politician_id is None
+        assert results[0].confidence == 0.5
+        mock_baml_client.MatchPolitician.assert_not_awaited()
@@ -0,0 +1,279 @@
+"""Tests for PoliticianMatchingPipeline
+
+These tests are marked with @pytest.mark.baml and should run in separate BAML CI.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.domain.entities.politician_affiliation import PoliticianAffiliation
+from src.domain.interfaces.politician_matching_agent import IPoliticianMatchingAgent
+from src.infrastructure.external.politician_matching import PoliticianMatchingPipeline
+
+
+pytestmark = pytest.mark.baml
+
+
+@pytest.fixture
+def mock_politician_repo():
+    """Mock politician repository"""
+    repo = AsyncMock()
+    repo.get_all_for_matching.return_value = [
+        {"id": 1, "name": "山田太郎", "party_name": "自由民主党"},
+        {"id": 2, "name": "佐藤花子", "party_name": "立憲民主党"},
+        {"id": 3, "name": "鈴木一郎", "party_name": "公明党"},
+        {"id": 4, "name": "田中次郎", "party_name": "自由民主党"},
+        {"id": 5, "name": "田中次郎", "party_name": "立憲民主党"},
+    ]
+    return repo
+
+
+@pytest.fixture
+def mock_affiliation_repo():
+    """Mock politician affiliation repository"""
+    repo = AsyncMock()
+    repo.get_by_politicians.return_value = [
+        PoliticianAffiliation(
+            id=1,
+            politician_id=1,
+            conference_id=10,
+            start_date=date(2023, 5, 1),
+            role="議員",
+        )
+    ]
+    return repo
+
+
+@pytest.fixture
+def pipeline(mock_politician_repo, mock_affiliation_repo):
+    return PoliticianMatchingPipeline(
+        politician_repo=mock_politician_repo,
+        affiliation_repo=mock_affiliation_repo,
+    )
+
+
+@pytest.fixture
+def mock_baml_client():
+    """Mock BAML client"""
+    with patch(
+        "src.infrastructure.external.politician_matching.politician_matching_pipeline.b"
+    ) as mock_b:
+        mock_b.MatchPolitician = AsyncMock()
+        yield mock_b
+
+
+def baml_result(**kwargs):
+    defaults = {
+        "matched": True,
+        "politician_id": 1,
+        "politician_name": "山田太郎",
+        "political_party_name": "自由民主党",
+        "confidence": 0.85,
+        "reason": "表記ゆれを考慮して一致",
+    }
+    return SimpleNamespace(**{**defaults, **kwargs})
+
+
+class TestPoliticianMatchingPipeline:
+    """Test cases for PoliticianMatchingPipeline"""
+
+    def test_implements_interface(self, pipeline):
+        assert isinstance(pipeline, IPoliticianMatchingAgent)
+
+    def test_requires_repositories(self, mock_politician_repo):
+        with pytest.raises(ValueError, match="affiliation_repo is required"):
+            PoliticianMatchingPipeline(
+                politician_repo=mock_politician_repo,
+                affiliation_repo=None,  # type: ignore[arg-type]
+            )
+
+    @pytest.mark.asyncio
+    async def test_exact_name_match_skips_llm(
+        self, pipeline, mock_affiliation_repo, mock_baml_client
+    ):
+        """正規化後の名前が一致する候補が1名ならLLMも所属検索も使わない"""
+        result = await pipeline.match_politician("山田　太郎君")
+
+        assert result["matched"] is True
+        assert result["politician_id"] == 1
+        assert result["confidence"] == 0.9
+        assert result["error_message"] is None
+        mock_baml_client.MatchPolitician.assert_not_called()
+        mock_affiliation_repo.get_by_politicians.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exact_name_and_party_match(self, pipeline, mock_baml_client):
+        result = await pipeline.match_politician("山田太郎", speaker_party="自由民主党")
+
+        assert result["matched"] is True
+        assert result["politician_id"] == 1
+        assert result["confidence"] == 1.0
+        mock_baml_client.MatchPolitician.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_homonyms_are_resolved_by_party(self, pipeline, mock_baml_client):
+        """同姓同名は政党（略称を含む）が一致する候補が1名なら確定する"""
+        result = await pipeline.match_politician("田中次郎", speaker_party="立憲")
+
+        assert result["matched"] is True
+        assert result["politician_id"] == 5
+        mock_baml_client.MatchPolitician.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_homonyms_without_party_use_baml(
+        self, pipeline, mock_affiliation_repo, mock_baml_client
+    ):
+        mock_baml_client.MatchPolitician.return_value = baml_result(
+            matched=False, politician_id=None, confidence=0.3, reason="特定できない"
+        )
+
+        result = await pipeline.match_politician("田中次郎")
+
+        assert result["matched"] is False
+        assert result["reason"] == "特定できない"
+        mock_baml_client.MatchPolitician.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_party_conflict_uses_baml(self, pipeline, mock_baml_client):
+        """名前が一致しても政党が食い違う場合はBAMLで判定する"""
+        mock_baml_client.MatchPolitician.return_value = baml_result()
+
+        result = await pipeline.match_politician("山田太郎", speaker_party="公明党")
+
+        assert result["matched"] is True
+        mock_baml_client.MatchPolitician.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_baml_receives_candidates_with_affiliations(
+        self, pipeline, mock_affiliation_repo, mock_baml_client
+    ):
+        """所属情報は候補集合ごとに1回のクエリで取得してBAMLに渡す"""
+        mock_baml_client.MatchPolitician.return_value = baml_result()
+
+        result = await pipeline.match_politician("山田太朗", speaker_type="議員")
+
+        assert result["matched"] is True
+        assert result["politician_id"] == 1
+        assert result["politician_name"] == "山田太郎"
+        assert result["confidence"] == 0.85
+
+        mock_affiliation_repo.get_by_politicians.assert_awaited_once()
+        [candidate_ids] = mock_affiliation_repo.get_by_politicians.await_args.args
+        assert sorted(candidate_ids) == [1, 2, 3, 4, 5]
+
+        kwargs = mock_baml_client.MatchPolitician.await_args.kwargs
+        assert kwargs["speaker_type"] == "議員"
+        assert kwargs["speaker_party"] == "不明"
+        first_line = kwargs["available_politicians"].splitlines()[0]
+        assert first_line == (
+            "ID: 1, 名前: 山田太郎, 政党: 自由民主党, "
+            "所属会議体: 会議体ID 10（議員、2023-05-01〜）"
+        )
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_is_no_match(self, pipeline, mock_baml_client):
+        mock_baml_client.MatchPolitician.return_value = baml_result(confidence=0.5)
+
+        result = await pipeline.match_politician("山田太朗")
+
+        assert result["matched"] is False
+        assert result["politician_id"] is None
+        assert result["confidence"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_politician_outside_candidates_is_no_match(
+        self, pipeline, mock_baml_client
+    ):
+        mock_baml_client.MatchPolitician.return_value = baml_result(
+            politician_id=999, confidence=0.95
+        )
+
+        result = await pipeline.match_politician("山田太朗")
+
+        assert result["matched"] is False
+        assert result["politician_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_affiliation_failure_does_not_stop_matching(
+        self, pipeline, mock_affiliation_repo, mock_baml_client
+    ):
+        mock_affiliation_repo.get_by_politicians.side_effect = Exception("DB error")
+        mock_baml_client.MatchPolitician.return_value = baml_result()
+
+        result = await pipeline.match_politician("山田太朗")
+
+        assert result["matched"] is True
+        assert (
+            "所属会議体"
+            not in (
+                mock_baml_client.MatchPolitician.await_args.kwargs[
+                    "available_politicians"
+                ]
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_title_only_speaker(
+        self, pipeline, mock_politician_repo, mock_baml_client
+    ):
+        result = await pipeline.match_politician("委員長")
+
+        assert result["matched"] is False
+        mock_politician_repo.get_all_for_matching.assert_not_called()
+        mock_baml_client.MatchPolitician.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_politician_list(
+        self, pipeline, mock_politician_repo, mock_baml_client
+    ):
+        mock_politician_repo.get_all_for_matching.return_value = []
+
+        result = await pipeline.match_politician("山田太郎")
+
+        assert result["matched"] is False
+        assert result["reason"] == "利用可能な政治家リストが空です"
+        mock_baml_client.MatchPolitician.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_politician_list_is_cached(
+        self, pipeline, mock_politician_repo, mock_baml_client
+    ):
+        mock_baml_client.MatchPolitician.return_value = baml_result()
+
+        await pipeline.match_politician("山田太郎")
+        await pipeline.match_politician("山田太朗")
+
+        mock_politician_repo.get_all_for_matching.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_baml_error_is_reported(self, pipeline, mock_baml_client):
+        mock_baml_client.MatchPolitician.side_effect = Exception("API error")
+
+        result = await pipeline.match_politician("山田太朗")
+
+        assert result["matched"] is False
+        assert result["error_message"] is not None
+        assert "API error" in result["error_message"]
+
+    @pytest.mark.asyncio
+    async def test_max_candidates(self, mock_politician_repo, mock_affiliation_repo):
+        pipeline = PoliticianMatchingPipeline(
+            politician_repo=mock_politician_repo,
+            affiliation_repo=mock_affiliation_repo,
+            max_candidates=2,
+        )
+        with patch(
+            "src.infrastructure.external.politician_matching.politician_matching_pipeline.b"
+        ) as mock_b:
+            mock_b.MatchPolitician = AsyncMock(return_value=baml_result())
+
+            await pipeline.match_politician("山田太朗")
+
+            available = mock_b.MatchPolitician.await_args.kwargs[
+                "available_politicians"
+            ]
+            assert len(available.splitlines()) == 2
+            assert available.startswith("ID: 1, 名前: 山田太郎")
@@ -0,0 +1,159 @@
+"""Tests for cached LLM service request coalescing."""
+
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.external.cached_llm_service import (
+    CachedLLMService,
+    SingleFlight,
+)
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """同一キーの同時呼び出しは1回の実行にまとめられる"""
+        flight = SingleFlight()
+        executions = 0
+
+        async def work() -> str:
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert executions == 1
+        stats = flight.stats()
+        assert stats["calls"] == 5
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+        assert stats["keys"]["key"] == {"calls": 5, "executions": 1, "coalesced": 4}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """異なるキーはそれぞれ実行される"""
+        flight = SingleFlight()
+        work = AsyncMock(return_value="ok")
+
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+
+        assert work.await_count == 2
+        assert flight.stats()["keys"] == {}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        """完了後の呼び出しは新たに実行される"""
+        flight = SingleFlight()
+        work = AsyncMock(return_value="ok")
+
+        await flight.do("key", work)
+        await flight.do("key", work)
+
+        assert work.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_by_waiters(self):
+        """実行中の例外は待機中の全呼び出し元に伝わる"""
+        flight = SingleFlight()
+
+        async def failing() -> str:
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream error")
+
+        results = await asyncio.gather(
+            flight.do("key", failing), flight.do("key", failing), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """1つの呼び出し元のキャンセルは共有中の呼び出しを止めない"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("key", work))
+        second = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+
+class TestCachedLLMServiceCoalescing:
+    """Test cases for CachedLLMService single-flight behavior."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_matches_hit_base_service_once(self):
+        """同じ議員の同時マッチングはベースサービスを1回だけ呼ぶ"""
+        base_service = MagicMock()
+
+        async def match(member_name, party_name, candidates):
+            await asyncio.sleep(0.01)
+            return {"matched": True, "matched_id": 1, "confidence": 0.9}
+
+        base_service.match_conference_member = AsyncMock(side_effect=match)
+        cached_service = CachedLLMService(base_service)
+        candidates = [{"id": 1, "name": "山田太郎"}]
+
+        results = await asyncio.gather(
+            *(
+                cached_service.match_conference_member("山田太郎", "自民党", candidates)
+                for _ in range(3)
+            )
+        )
+
+        assert all(r == results[0] for r in results)
+        base_service.match_conference_member.assert_awaited_once()
+
+        stats = cached_service.get_coalescing_stats()
+        assert stats["coalesced"] == 2
+        (key,) = stats["keys"]
+        assert key.startswith("match_conference_member:山田太郎:")
+
+        # 完了後はキャッシュから返る
+        await cached_service.match_conference_member("山田太郎", "自民党", candidates)
+        base_service.match_conference_member.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached(self):
+        """失敗した呼び出しの結果はキャッシュされない"""
+        base_service = MagicMock()
+        base_service.extract_speeches_from_text = AsyncMock(
+            side_effect=[RuntimeError("boom"), [{"speaker": "A", "content": "B"}]]
+        )
+        cached_service = CachedLLMService(base_service)
+
+        with pytest.raises(RuntimeError):
+            await cached_service.extract_speeches_from_text("text")
+
+        result = await cached_service.extract_speeches_from_text("text")
+        assert result == [{"speaker": "A", "content": "B"}]
+
+    @pytest.mark.asyncio
+    async def test_delegates_ainvoke_llm(self):
+        """キャッシュ対象外のメソッドはベースサービスに委譲される"""
+        base_service = MagicMock()
+        base_service.ainvoke_llm = AsyncMock(return_value="response")
+        cached_service = CachedLLMService(base_service)
+
+        assert await cached_service.ainvoke_llm([{"role": "user", "content": "x"}]) == (
+            "response"
+        )
@@ -0,0 +1,200 @@
+"""Tests for HtmlCompactor"""
+
+import re
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.external.html_compactor import (
+    CompactLine,
+    HtmlCompactor,
+    extract_from_chunks,
+)
+from src.infrastructure.resilience.rate_limiter import estimate_tokens
+
+
+FIXTURE_DIR = Path(__file__).parents[2] / "fixtures" / "council_pages"
+
+
+@pytest.fixture
+def compactor():
+    return HtmlCompactor()
+
+
+class TestHtmlCompactor:
+    """Test cases for HtmlCompactor"""
+
+    def test_table_rows(self, compactor):
+        html = """
+        <table class="list" border="1">
+          <caption>総務委員会委員</caption>
+          <thead><tr><th scope="col">役職</th><th>氏名</th><th>会派</th></tr></thead>
+          <tbody>
+            <tr><td style="width: 20%">委員長</td><td><a href="/1">山田 太郎</a></td>
+                <td>自民党</td></tr>
+            <tr><td>委員</td><td>鈴木<span>花子</span></td><td></td></tr>
+          </tbody>
+        </table>
+        """
+
+        assert compactor.compact(html).splitlines() == [
+            "総務委員会委員",
+            "役職 | 氏名 | 会派",
+            "委員長 | 山田 太郎 | 自民党",
+            "委員 | 鈴木 花子 |",
+        ]
+
+    def test_lists_and_definition_lists(self, compactor):
+        html = """
+        <h2>会派</h2>
+        <ul>
+          <li>自民党
+            <ul><li>山田太郎</li><li><img src="a.jpg" alt="佐藤一郎"></li></ul>
+          </li>
+          <li>公明党</li>
+        </ul>
+        <dl><dt>氏名</dt><dd>田中次郎</dd><dt>会派</dt><dd>無所属</dd><dt>備考</dt></dl>
+        """
+
+        assert compactor.compact(html).splitlines() == [
+            "## 会派",
+            "- 自民党",
+            "  - 山田太郎",
+            "  - 佐藤一郎",
+            "- 公明党",
+            "氏名: 田中次郎",
+            "会派: 無所属",
+            "備考",
+        ]
+
+    def test_drops_boilerplate_and_attributes(self, compactor):
+        html = """
+        <!DOCTYPE html>
+        <html><head><title>議員名簿</title><style>.a {}</style></head>
+        <body class="page">
+          <header>サンプル市</header>
+          <nav><ul><li><a href="/">トップページ</a></li></ul></nav>
+          <!-- 更新履歴 -->
+          <div id="contents"><p class="lead">令和6年4月1日現在</p></div>
+          <script>gtag('config', 'G-XXXX');</script>
+          <footer>Copyright</footer>
+        </body></html>
+        """
+
+        assert compactor.compact(html) == "令和6年4月1日現在"
+
+    def test_prefers_main_content(self, compactor):
+        html = "<body><p>お知らせ</p><main><p>議員一覧</p></main></body>"
+
+        assert compactor.compact(html) == "議員一覧"
+
+    def test_heading_context(self, compactor):
+        lines = compactor.compact_lines(
+            "<h1>委員会名簿</h1><h2>総務委員会</h2><p>所管</p>"
+            "<h2>文教委員会</h2><table><tr><th>氏名</th></tr><tr><td>山田</td></tr>"
+            "</table>"
+        )
+
+        assert lines[-1] == CompactLine(
+            text="山田", context=("# 委員会名簿", "## 文教委員会", "氏名")
+        )
+        assert lines[2] == CompactLine(
+            text="所管", context=("# 委員会名簿", "## 総務委員会")
+        )
+
+    def test_empty_page(self, compactor):
+        assert compactor.split("<html><script>x()</script></html>") == []
+
+    def test_split_repeats_heading_and_table_header(self):
+        rows = "".join(
+            f"<tr><td>議員{i:02d}</td><td>自民党</td></tr>" for i in range(30)
+        )
+        html = (
+            "<h2>総務委員会</h2>"
+            f"<table><tr><th>氏名</th><th>会派</th></tr>{rows}</table>"
+        )
+
+        chunks = HtmlCompactor(max_chunk_chars=80).split(html)
+
+        assert len(chunks) > 1
+        body_rows = []
+        for chunk in chunks:
+            assert len(chunk) <= 80
+            lines = chunk.splitlines()
+            assert lines[:2] == ["## 総務委員会", "氏名 | 会派"]
+            body_rows.extend(lines[2:])
+        # 行の途中で分割せず、すべての行がちょうど1回ずつ含まれる
+        assert body_rows == [f"議員{i:02d} | 自民党" for i in range(30)]
+
+    def test_split_long_line(self):
+        chunks = HtmlCompactor(max_chunk_chars=100).split("<p>" + "x" * 250 + "</p>")
+
+        assert "".join(chunks) == "x" * 250
+        assert all(len(chunk) <= 100 for chunk in chunks)
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            HtmlCompactor(max_chunk_chars=0)
+
+    @pytest.mark.parametrize(
+        "path", sorted(FIXTURE_DIR.glob("*.html")), ids=lambda path: path.name
+    )
+    def test_council_pages(self, compactor, path):
+        """保存した議会ページで、議員名を残したままトークン数を大幅に減らす"""
+        html = path.read_text(encoding="utf-8")
+        names = set(re.findall(r'class="(?:name|member_name)">([^<]+)<', html))
+        names |= set(re.findall(r'alt="([^"]+)"[^>]*class="photo"', html))
+
+        compact = compactor.compact(html)
+
+        assert names
+        assert all(name in compact for name in names)
+        assert "<" not in compact
+        assert estimate_tokens(compact) < estimate_tokens(html) * 0.25
+
+
+class TestExtractFromChunks:
+    """Test cases for extract_from_chunks"""
+
+    @pytest.mark.asyncio
+    async def test_merges_in_order_and_deduplicates(self):
+        async def extract(chunk):
+            return [SimpleNamespace(name=name) for name in chunk.split(",")]
+
+        members = await extract_from_chunks(
+            ["山田太郎,鈴木花子", "鈴木 花子議員,佐藤一郎"], extract
+        )
+
+        assert [member.name for member in members] == [
+            "山田太郎",
+            "鈴木花子",
+            "佐藤一郎",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_partial_failure(self):
+        async def extract(chunk):
+            if chunk == "error":
+                raise RuntimeError("BAML error")
+            return [SimpleNamespace(name=chunk)]
+
+        members = await extract_from_chunks(["山田太郎", "error"], extract)
+
+        assert [member.name for member in members] == ["山田太郎"]
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_fail(self):
+        async def extract(chunk):
+            raise RuntimeError("BAML error")
+
+        with pytest.raises(RuntimeError, match="BAML error"):
+            await extract_from_chunks(["a", "b"], extract)
+
+    @pytest.mark.asyncio
+    async def test_no_chunks(self):
+        async def extract(chunk):
+            raise AssertionError("not called")
+
+        assert await extract_from_chunks([], extract) == []
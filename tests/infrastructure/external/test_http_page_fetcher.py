@@ -0,0 +1,89 @@
+"""Tests for HttpPageFetcher."""
+
+import pytest
+
+from src.infrastructure.external.http_page_fetcher import (
+    HttpPage,
+    HttpPageFetcher,
+    decode_html,
+    detect_declared_charset,
+)
+
+
+class TestDecodeHtml:
+    """Test cases for charset detection and decoding."""
+
+    def test_content_type_charset(self):
+        body = "議員".encode("euc_jp")
+
+        assert detect_declared_charset(body, "text/html; charset=EUC-JP") == "euc_jp"
+        assert decode_html(body, "text/html; charset=EUC-JP") == "議員"
+
+    def test_meta_charset_shift_jis_reads_as_cp932(self):
+        # 髙 and ① only exist in the CP932 extension of Shift_JIS
+        html = "<meta charset='Shift_JIS'>髙橋①"
+
+        assert decode_html(html.encode("cp932")) == html
+
+    def test_wrong_declaration_falls_back(self):
+        html = "<meta charset='Shift_JIS'>議員一覧（令和6年）"
+
+        assert decode_html(html.encode("utf-8")) == html
+
+    def test_undeclared_encodings_are_detected(self):
+        assert decode_html("議員一覧".encode("cp932")) == "議員一覧"
+        assert decode_html("議員一覧".encode()) == "議員一覧"
+
+    def test_utf8_bom(self):
+        assert decode_html(b"\xef\xbb\xbf<html>") == "<html>"
+
+
+class TestHttpPage:
+    """Test cases for HttpPage."""
+
+    @pytest.mark.parametrize(
+        ("content_type", "expected"),
+        [
+            ("text/html; charset=utf-8", True),
+            ("application/xhtml+xml", True),
+            ("", True),
+            ("application/pdf", False),
+        ],
+    )
+    def test_is_html(self, content_type, expected):
+        page = HttpPage(url="", status=200, content_type=content_type, html="")
+
+        assert page.is_html is expected
+
+
+class TestHttpPageFetcher:
+    """Test cases for HttpPageFetcher against a local fixture server."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("path", "heading"),
+        [
+            ("/utf8", "議員一覧"),
+            ("/sjis", "議員名簿（髙橋）"),
+            ("/eucjp", "委員会名簿"),
+            ("/gzip", "圧縮"),
+        ],
+    )
+    async def test_fetch_decodes_pages(self, fixture_server, path, heading):
+        async with HttpPageFetcher() as fetcher:
+            page = await fetcher.fetch(fixture_server + path)
+
+        assert page.status == 200
+        assert f"<h1>{heading}</h1>" in page.html
+
+    @pytest.mark.asyncio
+    async def test_fetch_follows_redirects(self, fixture_server):
+        async with HttpPageFetcher() as fetcher:
+            page = await fetcher.fetch(fixture_server + "/redirect")
+
+        assert page.url == fixture_server + "/utf8"
+
+    @pytest.mark.asyncio
+    async def test_fetch_requires_session(self):
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await HttpPageFetcher().fetch("http://127.0.0.1/")
@@ -0,0 +1,124 @@
+"""Tests for KokkaiSpeechClient."""
+
+from datetime import date
+
+import pytest
+
+from src.infrastructure.exceptions import ExternalServiceException
+from src.infrastructure.external.kokkai_speech_client import (
+    KokkaiSpeechClient,
+    KokkaiSpeechRecord,
+    extract_issue_id,
+)
+
+
+ISSUE_ID = "121705261X00320250204"
+
+
+@pytest.fixture
+def client_factory(kokkai_api_stub, tmp_path):
+    def create(**kwargs) -> KokkaiSpeechClient:
+        kwargs.setdefault("records_per_page", 2)
+        kwargs.setdefault("state_dir", tmp_path / "state")
+        return KokkaiSpeechClient(base_url=kokkai_api_stub.base_url, **kwargs)
+
+    return create
+
+
+class TestHelpers:
+    """Test cases for URL and record helpers."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            f"https://kokkai.ndl.go.jp/txt/{ISSUE_ID}/0",
+            f"https://kokkai.ndl.go.jp/#/detail?minId={ISSUE_ID}&current=1",
+            f"https://kokkai.ndl.go.jp/minutes?minId={ISSUE_ID}",
+        ],
+    )
+    def test_extract_issue_id(self, url):
+        assert extract_issue_id(url) == ISSUE_ID
+
+    def test_extract_issue_id_missing(self):
+        assert extract_issue_id("https://kokkai.ndl.go.jp/#/result") is None
+
+    def test_record_text_strips_speaker_mark(self):
+        record = KokkaiSpeechRecord(
+            speech_id="1",
+            speech_order=1,
+            speaker="安住淳",
+            speech="○安住委員長　これより会議を開きます。\n以上です。",
+        )
+
+        assert record.text == "これより会議を開きます。\n以上です。"
+
+    def test_init_rejects_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            KokkaiSpeechClient(records_per_page=101)
+
+
+class TestFetchMeeting:
+    """Test cases for fetching a meeting from the stub API."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_pages_in_order(self, client_factory, kokkai_api_stub):
+        meeting = await client_factory().fetch_meeting(ISSUE_ID)
+
+        assert sorted(kokkai_api_stub.requests) == [1, 3, 5]
+        assert [s.speech_order for s in meeting.speeches] == [0, 1, 2, 3, 4]
+        assert meeting.title == "第217回国会　衆議院　予算委員会　第3号"
+        assert meeting.date == date(2025, 2, 4)
+        assert meeting.meeting_url == f"https://kokkai.ndl.go.jp/txt/{ISSUE_ID}"
+        prime_minister = meeting.speeches[3]
+        assert prime_minister.speaker == "石破茂"
+        assert prime_minister.speaker_position == "内閣総理大臣"
+        assert prime_minister.speaker_group == "自由民主党・無所属の会"
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_requests(self, client_factory, kokkai_api_stub):
+        kokkai_api_stub.delay = 0.05
+
+        await client_factory(records_per_page=1, max_concurrency=2).fetch_meeting(
+            ISSUE_ID
+        )
+
+        assert len(kokkai_api_stub.requests) == 5
+        assert kokkai_api_stub.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_saved_pages(
+        self, client_factory, kokkai_api_stub, tmp_path
+    ):
+        kokkai_api_stub.fail_starts = {3}
+        client = client_factory(max_concurrency=1)
+
+        with pytest.raises(ExternalServiceException):
+            await client.fetch_meeting(ISSUE_ID)
+
+        kokkai_api_stub.fail_starts = set()
+        kokkai_api_stub.requests.clear()
+        meeting = await client.fetch_meeting(ISSUE_ID)
+
+        # The first page was saved before the failure and is not requested again
+        assert 1 not in kokkai_api_stub.requests
+        assert 3 in kokkai_api_stub.requests
+        assert len(meeting.speeches) == 5
+        # Saved pages are removed once the meeting is complete
+        assert not (tmp_path / "state" / ISSUE_ID).exists()
+
+    @pytest.mark.asyncio
+    async def test_without_state_dir(self, client_factory, kokkai_api_stub):
+        meeting = await client_factory(state_dir=None).fetch_meeting(ISSUE_ID)
+
+        assert len(meeting.speeches) == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_minutes(self, client_factory):
+        with pytest.raises(ValueError, match="No speech records"):
+            await client_factory().fetch_meeting("999999999X99999999999")
+
+    @pytest.mark.asyncio
+    async def test_api_error_message(self, client_factory):
+        # The API answers invalid conditions with HTTP 200 and a message
+        with pytest.raises(ExternalServiceException, match="検索条件"):
+            await client_factory().fetch_meeting("")
@@ -0,0 +1,50 @@
+"""Tests for KokkaiSpeechSource."""
+
+import pytest
+
+from src.infrastructure.external.kokkai_speech_client import KokkaiSpeechClient
+from src.infrastructure.external.kokkai_speech_source import KokkaiSpeechSource
+
+
+MINUTES_URL = "https://kokkai.ndl.go.jp/txt/121705261X00320250204/0"
+
+
+@pytest.fixture
+def source(kokkai_api_stub):
+    return KokkaiSpeechSource(
+        KokkaiSpeechClient(base_url=kokkai_api_stub.base_url, state_dir=None)
+    )
+
+
+class TestKokkaiSpeechSource:
+    """Test cases for KokkaiSpeechSource."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (MINUTES_URL, True),
+            ("https://kokkai.ndl.go.jp/#/result", False),
+            ("https://example.com/txt/121705261X00320250204", False),
+            ("https://ssp.kaigiroku.net/tenant/kyoto/MinuteView.html", False),
+        ],
+    )
+    def test_supports(self, url, expected):
+        assert KokkaiSpeechSource(KokkaiSpeechClient()).supports(url) is expected
+
+    @pytest.mark.asyncio
+    async def test_fetch_speeches(self, source):
+        speeches = await source.fetch_speeches(MINUTES_URL)
+
+        # The minutes header (speech order 0) is not a speech
+        assert [(s.speaker, s.speech_order) for s in speeches] == [
+            ("安住淳", 1),
+            ("井上信治", 2),
+            ("石破茂", 3),
+            ("安住淳", 4),
+        ]
+        assert speeches[2].speech_content.startswith("お答えいたします。")
+
+    @pytest.mark.asyncio
+    async def test_fetch_speeches_unsupported_url(self, source):
+        with pytest.raises(ValueError, match="Not a Diet minutes URL"):
+            await source.fetch_speeches("https://example.com/minutes")
@@ -0,0 +1,75 @@
+"""Tests for LinkClassificationCache."""
+
+import json
+
+from datetime import datetime, timedelta
+
+from src.domain.services.interfaces.llm_link_classifier_service import (
+    LinkClassification,
+    LinkType,
+)
+from src.infrastructure.external.link_classification_cache import (
+    LinkClassificationCache,
+)
+
+
+def make_classification(url: str) -> LinkClassification:
+    return LinkClassification(
+        url=url, link_type=LinkType.MEMBER_LIST, confidence=0.9, reason="議員一覧"
+    )
+
+
+class TestLinkClassificationCache:
+    """Test cases for LinkClassificationCache."""
+
+    def test_persists_across_instances(self, tmp_path):
+        cache = LinkClassificationCache(cache_dir=str(tmp_path))
+        cache.put(make_classification("https://example.com/members"))
+        cache.flush()
+
+        reloaded = LinkClassificationCache(cache_dir=str(tmp_path))
+        result = reloaded.get("https://www.example.com/members/")
+
+        assert result is not None
+        assert result.url == "https://www.example.com/members/"
+        assert result.link_type == LinkType.MEMBER_LIST
+        assert (tmp_path / "example.com.json").exists()
+
+    def test_miss(self, tmp_path):
+        cache = LinkClassificationCache(cache_dir=str(tmp_path))
+
+        assert cache.get("https://example.com/unknown") is None
+
+    def test_put_is_not_written_until_flush(self, tmp_path):
+        cache = LinkClassificationCache(cache_dir=str(tmp_path))
+        cache.put(make_classification("https://example.com/members"))
+
+        assert not list(tmp_path.iterdir())
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        old = (datetime.now() - timedelta(days=31)).isoformat()
+        (tmp_path / "example.com.json").write_text(
+            json.dumps(
+                {
+                    "https://example.com/members": {
+                        "link_type": "member_list",
+                        "confidence": 0.9,
+                        "reason": "old",
+                        "classified_at": old,
+                    }
+                }
+            )
+        )
+        cache = LinkClassificationCache(cache_dir=str(tmp_path), ttl_days=30)
+
+        assert cache.get("https://example.com/members") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        (tmp_path / "example.com.json").write_text("{not json")
+        cache = LinkClassificationCache(cache_dir=str(tmp_path))
+
+        assert cache.get("https://example.com/members") is None
+
+        cache.put(make_classification("https://example.com/members"))
+        cache.flush()
+        assert LinkClassificationCache(str(tmp_path)).get("https://example.com/members")
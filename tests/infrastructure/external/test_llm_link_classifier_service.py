@@ -136,6 +136,75 @@ class TestLLMLinkClassifierService:
             assert len(result.classifications) == 1
             assert result.classifications[0].link_type == LinkType.OTHER
 
+    @pytest.mark.asyncio
+    async def test_classify_links_in_concurrent_chunks(self):
+        """Links are sent in chunks and results from all chunks are merged."""
+        links = [
+            Link(url=f"https://example.com/p/{i}", text=f"Page {i}") for i in range(5)
+        ]
+
+        async def classify(links, party_name, context):
+            urls = [
+                line.split("URL: ")[1] for line in links.splitlines() if "URL: " in line
+            ]
+            if "https://example.com/p/4" in urls:
+                raise Exception("BAML API error")
+            return [
+                Mock(url=url, link_type="member_list", confidence=0.9, reason="")
+                for url in urls
+            ]
+
+        with patch(
+            "src.infrastructure.external.llm_link_classifier_service.b.ClassifyLinks",
+            new_callable=AsyncMock,
+            side_effect=classify,
+        ) as mock_classify_links:
+            classifier = LLMLinkClassifierService(chunk_size=2)
+            result = await classifier.classify_links(links)
+
+        # 3 chunks; the failing chunk is skipped without losing the others
+        assert mock_classify_links.await_count == 3
+        assert [c.url for c in result.classifications] == [
+            link.url for link in links[:4]
+        ]
+        assert result.summary == {"member_list": 4}
+
+    @pytest.mark.asyncio
+    async def test_classify_links_reuses_cache(self, sample_links, tmp_path):
+        """Cached links are not sent to the LLM again."""
+        from src.infrastructure.external.link_classification_cache import (
+            LinkClassificationCache,
+        )
+
+        mock_result = Mock()
+        # The LLM may reformat the URL; the requested URL is reported and cached
+        mock_result.url = "https://example.com/members/tokyo/"
+        mock_result.link_type = "prefecture_list"
+        mock_result.confidence = 0.95
+        mock_result.reason = "Tokyo"
+
+        with patch(
+            "src.infrastructure.external.llm_link_classifier_service.b.ClassifyLinks",
+            new_callable=AsyncMock,
+            return_value=[mock_result],
+        ) as mock_classify_links:
+            classifier = LLMLinkClassifierService(
+                cache=LinkClassificationCache(cache_dir=str(tmp_path))
+            )
+            await classifier.classify_links([sample_links[0]])
+
+            # A new instance reads the persisted classification
+            classifier = LLMLinkClassifierService(
+                cache=LinkClassificationCache(cache_dir=str(tmp_path))
+            )
+            result = await classifier.classify_links(sample_links[:2])
+
+        assert mock_classify_links.await_count == 2
+        second_prompt = mock_classify_links.await_args.kwargs["links"]
+        assert sample_links[0].url not in second_prompt
+        assert result.classifications[0].url == sample_links[0].url
+        assert result.classifications[0].link_type == LinkType.PREFECTURE_LIST
+
     def test_filter_by_type_basic(self):
         """Test filtering by link type."""
         from src.domain.services.interfaces.llm_link_classifier_service import (
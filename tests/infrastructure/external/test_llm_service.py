@@ -288,3 +288,39 @@ class TestGeminiLLMServiceErrorHandling:
         assert exc_info.value.details["operation"] == "invoke_llm"
         # エラーチェーンが保持されていることを確認
         assert exc_info.value.__cause__ is not None
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_llm_returns_content(self, service):
+        """ainvoke_llmがレスポンスの本文を返す"""
+        service._llm.ainvoke = AsyncMock(return_value=MagicMock(content="結果"))
+
+        result = await service.ainvoke_llm([{"role": "user", "content": "test"}])
+
+        assert result == "結果"
+        service._llm.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.resilience.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_ainvoke_llm_retries_transient_errors(self, mock_sleep, service):
+        """ainvoke_llmが一時的な障害を非同期にリトライする"""
+        service._llm.ainvoke = AsyncMock(
+            side_effect=[Exception("429 RESOURCE_EXHAUSTED"), MagicMock(content="OK")]
+        )
+
+        result = await service.ainvoke_llm([{"role": "user", "content": "test"}])
+
+        assert result == "OK"
+        assert service._llm.ainvoke.await_count == 2
+        mock_sleep.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_llm_raises_llm_service_exception(self, service):
+        """ainvoke_llmエラー時にLLMServiceExceptionがスローされる"""
+        service._llm.ainvoke = AsyncMock(side_effect=Exception("Invocation error"))
+
+        with pytest.raises(LLMServiceException) as exc_info:
+            await service.ainvoke_llm([{"role": "user", "content": "test"}])
+
+        assert exc_info.value.details["operation"] == "ainvoke_llm"
+        # リトライ対象外のエラーは1回で終わる
+        service._llm.ainvoke.assert_awaited_once()
@@ -189,6 +189,7 @@ class TestMinutesProcessAgentService:
             mock_run.assert_called_once_with(
                 "議事録テキスト",
                 role_name_mappings=role_name_mappings,
+                attendee_boundary=None,
             )
             assert len(result) == 1
             assert result[0].speaker == "伊藤条一"
@@ -264,6 +265,7 @@ class TestMinutesProcessAgentService:
             mock_run.assert_called_once_with(
                 "議事録テキスト",
                 role_name_mappings=None,
+                attendee_boundary=None,
             )
             assert len(result) == 1
             assert result[0].speaker == "西村義直"
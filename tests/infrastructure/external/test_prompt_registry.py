@@ -0,0 +1,258 @@
+"""Tests for PromptRegistry."""
+
+import asyncio
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.prompt_version import PromptVersion
+from src.infrastructure.external.prompt_registry import (
+    RETRY_SECONDS,
+    CompiledPrompt,
+    PromptRegistry,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_version(prompt_key: str = "test", template: str = "Hello {name}!"):
+    return PromptVersion(prompt_key=prompt_key, template=template, version="1.0.0")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def repository():
+    repository = AsyncMock()
+    repository.get_all_active_versions.return_value = [make_version()]
+    return repository
+
+
+@pytest.fixture
+def registry(repository, clock):
+    return PromptRegistry(repository, ttl_seconds=300, clock=clock)
+
+
+class TestCompiledPrompt:
+    """Test cases for CompiledPrompt."""
+
+    def test_format(self):
+        compiled = CompiledPrompt.compile(make_version(template="{a} and {b.c}"))
+
+        assert compiled.required_variables == frozenset({"a", "b"})
+        assert compiled.format({"a": 1, "b": type("B", (), {"c": 2})}) == "1 and 2"
+
+    def test_escaped_braces_are_not_variables(self):
+        compiled = CompiledPrompt.compile(
+            make_version(template='{name}: {{"matched": true}}')
+        )
+
+        assert compiled.required_variables == frozenset({"name"})
+        assert compiled.format({"name": "x"}) == 'x: {"matched": true}'
+
+    def test_missing_variables(self):
+        compiled = CompiledPrompt.compile(make_version(template="{a} {b}"))
+
+        with pytest.raises(ValueError, match=r"Missing required variables: \['b'\]"):
+            compiled.format({"a": 1})
+
+    def test_invalid_template(self):
+        with pytest.raises(ValueError):
+            CompiledPrompt.compile(make_version(template="{unclosed"))
+
+
+class TestPromptRegistry:
+    """Test cases for PromptRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_loads_all_active_versions_once(self, registry, repository):
+        assert (await registry.get("test")).format({"name": "A"}) == "Hello A!"
+        assert await registry.get("unknown") is None
+        assert await registry.get("test") is not None
+
+        repository.get_all_active_versions.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_ttl_counts_from_fetch_time(self, registry, repository, clock):
+        await registry.get("test")
+
+        clock.now += 299
+        await registry.get("test")
+        assert repository.get_all_active_versions.call_count == 1
+
+        clock.now += 2
+        await registry.get("test")
+        assert repository.get_all_active_versions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self, registry, repository):
+        await registry.get("test")
+        repository.get_all_active_versions.return_value = [
+            make_version(template="Bye {name}!")
+        ]
+
+        registry.invalidate()
+
+        assert (await registry.get("test")).format({"name": "A"}) == "Bye A!"
+
+    @pytest.mark.asyncio
+    async def test_put_serves_without_reload(self, registry, repository):
+        await registry.get("test")
+
+        registry.put(make_version(prompt_key="new", template="New"))
+
+        assert (await registry.get("new")).format({}) == "New"
+        repository.get_all_active_versions.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_load_once(self, registry, repository):
+        async def slow_load():
+            await asyncio.sleep(0.01)
+            return [make_version()]
+
+        repository.get_all_active_versions.side_effect = slow_load
+
+        results = await asyncio.gather(*(registry.get("test") for _ in range(5)))
+
+        assert all(results)
+        repository.get_all_active_versions.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_keeps_cache_stale(
+        self, registry, repository
+    ):
+        async def load_then_change():
+            # A version changes while this load is in flight
+            registry.invalidate()
+            return [make_version()]
+
+        repository.get_all_active_versions.side_effect = load_then_change
+
+        await registry.get("test")
+
+        assert not registry.is_fresh
+
+    @pytest.mark.asyncio
+    async def test_put_during_load_reloads_next_lookup(self, registry, repository):
+        async def load_then_put():
+            # Loaded before the new version was saved
+            registry.put(make_version(prompt_key="new", template="New"))
+            return [make_version()]
+
+        repository.get_all_active_versions.side_effect = load_then_put
+        await registry.get("test")
+        assert not registry.is_fresh
+
+        repository.get_all_active_versions.side_effect = None
+        repository.get_all_active_versions.return_value = [
+            make_version(),
+            make_version(prompt_key="new", template="New"),
+        ]
+
+        assert (await registry.get("new")).format({}) == "New"
+
+    @pytest.mark.asyncio
+    async def test_load_failure_keeps_previous_prompts(
+        self, registry, repository, clock
+    ):
+        await registry.get("test")
+        registry.invalidate()
+        repository.get_all_active_versions.side_effect = Exception("DB Error")
+
+        assert await registry.get("test") is not None
+
+        # Retries after RETRY_SECONDS, not on every lookup
+        await registry.get("test")
+        assert repository.get_all_active_versions.call_count == 2
+        clock.now += RETRY_SECONDS
+        await registry.get("test")
+        assert repository.get_all_active_versions.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_template_is_skipped(self, registry, repository):
+        repository.get_all_active_versions.return_value = [
+            make_version(prompt_key="broken", template="{unclosed"),
+            make_version(),
+        ]
+
+        assert await registry.get("broken") is None
+        assert await registry.get("test") is not None
+
+    @pytest.mark.asyncio
+    async def test_clear(self, registry, repository):
+        await registry.get("test")
+        repository.get_all_active_versions.return_value = []
+
+        registry.clear()
+
+        assert await registry.get("test") is None
+
+
+class FakeListener:
+    """Change listener that records how often it was started."""
+
+    def __init__(self, registry: PromptRegistry, fail: bool = False) -> None:
+        self.registry = registry
+        self.fail = fail
+        self.is_listening = False
+        self.start_count = 0
+
+    async def start(self) -> None:
+        self.start_count += 1
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        self.is_listening = True
+
+
+class TestPromptRegistryChangeListener:
+    """Test cases for starting the change listener from PromptRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_listener_starts_on_first_lookup(self, repository, clock):
+        registry = PromptRegistry(
+            repository, clock=clock, change_listener_factory=FakeListener
+        )
+        listener = registry.change_listener
+        assert listener.start_count == 0
+
+        await registry.get("test")
+        registry.invalidate()
+        await registry.get("test")
+
+        assert listener.start_count == 1
+
+    @pytest.mark.asyncio
+    async def test_listener_restarts_after_connection_loss(self, repository, clock):
+        registry = PromptRegistry(
+            repository, clock=clock, change_listener_factory=FakeListener
+        )
+        await registry.get("test")
+
+        registry.change_listener.is_listening = False
+        registry.invalidate()
+        await registry.get("test")
+
+        assert registry.change_listener.start_count == 2
+
+    @pytest.mark.asyncio
+    async def test_listener_failure_falls_back_to_ttl(self, repository, clock):
+        registry = PromptRegistry(
+            repository,
+            clock=clock,
+            change_listener_factory=lambda r: FakeListener(r, fail=True),
+        )
+
+        assert await registry.get("test") is not None
+        assert registry.is_fresh
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
 
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.types.scraper_types import ScrapedProposal
 from src.infrastructure.external.proposal_scraper_service import ProposalScraperService
@@ -21,9 +22,22 @@ class TestProposalScraperService:
         return create_autospec(ILLMService, spec_set=True)
 
     @pytest.fixture
-    def scraper(self, mock_llm_service: MagicMock) -> ProposalScraperService:
+    def mock_fetcher(self) -> MagicMock:
+        """Create a page fetcher that is used as an async context manager."""
+        fetcher = MagicMock()
+        fetcher.__aenter__ = AsyncMock(return_value=fetcher)
+        fetcher.__aexit__ = AsyncMock(return_value=None)
+        fetcher.fetch_single_page = AsyncMock()
+        return fetcher
+
+    @pytest.fixture
+    def scraper(
+        self, mock_llm_service: MagicMock, mock_fetcher: MagicMock
+    ) -> ProposalScraperService:
         """Create a ProposalScraperService instance."""
-        return ProposalScraperService(llm_service=mock_llm_service, headless=True)
+        return ProposalScraperService(
+            llm_service=mock_llm_service, headless=True, page_fetcher=mock_fetcher
+        )
 
     def test_is_supported_url_valid_urls(self, scraper: ProposalScraperService) -> None:
         """Test that any valid HTTP/HTTPS URLs are supported."""
@@ -60,10 +74,9 @@ class TestProposalScraperService:
             await scraper.scrape_proposal(url)
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
     async def test_scrape_proposal_with_llm(
         self,
-        mock_playwright: MagicMock,
+        mock_fetcher: MagicMock,
         scraper: ProposalScraperService,
         mock_llm_service: MagicMock,
     ) -> None:
@@ -81,24 +94,13 @@ class TestProposalScraperService:
         """
 
         # Set up mocks
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
-        mock_page.content.return_value = html_content
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
+        mock_fetcher.fetch_single_page.return_value = WebPageContentDTO(
+            url="https://example.com", html_content=html_content
+        )
 
         # Mock LLM response
         llm_response = json.dumps({"title": "環境基本法改正案"})
-        mock_llm_service.invoke_llm.return_value = llm_response
+        mock_llm_service.ainvoke_llm.return_value = llm_response
 
         # Execute
         url = "https://www.shugiin.go.jp/test"
@@ -110,13 +112,12 @@ class TestProposalScraperService:
         assert result.title == "環境基本法改正案"
 
         # Verify LLM was called
-        mock_llm_service.invoke_llm.assert_called_once()
+        mock_llm_service.ainvoke_llm.assert_awaited_once()
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
     async def test_scrape_different_council_proposal(
         self,
-        mock_playwright: MagicMock,
+        mock_fetcher: MagicMock,
         scraper: ProposalScraperService,
         mock_llm_service: MagicMock,
     ) -> None:
@@ -137,24 +138,13 @@ class TestProposalScraperService:
         """
 
         # Set up mocks
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
-        mock_page.content.return_value = html_content
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
+        mock_fetcher.fetch_single_page.return_value = WebPageContentDTO(
+            url="https://example.com", html_content=html_content
+        )
 
         # Mock LLM response
         llm_response = json.dumps({"title": "大阪府デジタル化推進条例案"})
-        mock_llm_service.invoke_llm.return_value = llm_response
+        mock_llm_service.ainvoke_llm.return_value = llm_response
 
         # Execute
         url = "https://www.pref.osaka.lg.jp/test"
@@ -166,26 +156,34 @@ class TestProposalScraperService:
         assert result.title == "大阪府デジタル化推進条例案"
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
-    async def test_scrape_proposal_runtime_error(
-        self, mock_playwright: MagicMock, scraper: ProposalScraperService
+    async def test_scrape_proposal_reuses_page_fetcher(
+        self,
+        mock_fetcher: MagicMock,
+        scraper: ProposalScraperService,
+        mock_llm_service: MagicMock,
     ) -> None:
-        """Test that scraping errors are properly handled."""
-        # Set up mocks to raise an exception
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
-        mock_page.goto.side_effect = Exception("Network error")
-        mock_browser.new_page.return_value = mock_page
+        """Test that every scrape goes through the service's one fetcher."""
+        mock_fetcher.fetch_single_page.return_value = WebPageContentDTO(
+            url="https://example.com", html_content="<html><h1>議案</h1></html>"
+        )
+        mock_llm_service.ainvoke_llm.return_value = json.dumps({"title": "議案"})
 
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
+        with patch(
+            "src.infrastructure.external.proposal_scraper_service.StaticFirstPageFetcher"
+        ) as mock_fetcher_class:
+            await scraper.scrape_proposal("https://example.com/1")
+            await scraper.scrape_proposal("https://example.com/2")
 
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
+        mock_fetcher_class.assert_not_called()
+        assert mock_fetcher.fetch_single_page.await_count == 2
 
-        mock_playwright.return_value = mock_p
+    @pytest.mark.asyncio
+    async def test_scrape_proposal_runtime_error(
+        self, mock_fetcher: MagicMock, scraper: ProposalScraperService
+    ) -> None:
+        """Test that scraping errors are properly handled."""
+        # Set up mocks to raise an exception
+        mock_fetcher.fetch_single_page.side_effect = Exception("Network error")
 
         # Execute and assert
         url = "https://www.shugiin.go.jp/test"
@@ -193,10 +191,19 @@ class TestProposalScraperService:
             await scraper.scrape_proposal(url)
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
+    async def test_scrape_proposal_page_not_found(
+        self, mock_fetcher: MagicMock, scraper: ProposalScraperService
+    ) -> None:
+        """Test that a page that cannot be fetched raises RuntimeError."""
+        mock_fetcher.fetch_single_page.return_value = None
+
+        with pytest.raises(RuntimeError, match="Failed to scrape proposal from"):
+            await scraper.scrape_proposal("https://www.shugiin.go.jp/missing")
+
+    @pytest.mark.asyncio
     async def test_scrape_proposal_with_invalid_json_response(
         self,
-        mock_playwright: MagicMock,
+        mock_fetcher: MagicMock,
         scraper: ProposalScraperService,
         mock_llm_service: MagicMock,
     ) -> None:
@@ -205,23 +212,12 @@ class TestProposalScraperService:
         html_content = "<html><body><h1>Test</h1></body></html>"
 
         # Set up mocks
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
-        mock_page.content.return_value = html_content
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
+        mock_fetcher.fetch_single_page.return_value = WebPageContentDTO(
+            url="https://example.com", html_content=html_content
+        )
 
         # Mock LLM response with invalid JSON
-        mock_llm_service.invoke_llm.return_value = "This is not valid JSON"
+        mock_llm_service.ainvoke_llm.return_value = "This is not valid JSON"
 
         # Execute
         url = "https://www.city.tokyo.lg.jp/test"
@@ -0,0 +1,164 @@
+"""Tests for StaticFirstPageFetcher."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
+from src.infrastructure.external.static_first_page_fetcher import (
+    RenderHostRegistry,
+    StaticFirstPageFetcher,
+    get_render_host_registry,
+    needs_rendering,
+)
+
+
+@pytest.fixture
+def browser_fetcher():
+    browser = AsyncMock()
+
+    async def render(url):
+        return WebPageContentDTO(url=url, html_content="<html>rendered</html>")
+
+    browser.fetch_single_page.side_effect = render
+    return browser
+
+
+class TestNeedsRendering:
+    """Test cases for the rendering heuristic."""
+
+    def test_server_rendered_page(self):
+        rows = "".join(f"<li>議員{i} 所属会派{i}</li>" for i in range(40))
+        html = f"<html><body><script>track()</script><ul>{rows}</ul></body></html>"
+
+        assert not needs_rendering(html)
+
+    def test_empty_spa_root(self):
+        assert needs_rendering("<html><body><div id='root'></div></body></html>")
+
+    def test_script_built_page(self):
+        html = (
+            "<html><body><h1>議員一覧</h1><div class='list'></div>"
+            "<script src='/members.js'></script></body></html>"
+        )
+
+        assert needs_rendering(html)
+
+    def test_noscript_warning(self):
+        html = (
+            "<html><body><noscript>JavaScriptを有効にしてください。"
+            "Please enable JavaScript.</noscript></body></html>"
+        )
+
+        assert needs_rendering(html)
+
+    def test_short_static_page(self):
+        assert not needs_rendering("<html><body><p>準備中です</p></body></html>")
+
+    def test_frameset(self):
+        html = "<html><frameset><frame src='menu.html'></frameset></html>"
+
+        assert not needs_rendering(html)
+
+
+class TestStaticFirstPageFetcher:
+    """Test cases for StaticFirstPageFetcher against a local fixture server."""
+
+    @pytest.mark.asyncio
+    async def test_static_page_does_not_use_browser(
+        self, fixture_server, browser_fetcher
+    ):
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            page = await fetcher.fetch_single_page(fixture_server + "/sjis")
+
+        assert page is not None
+        assert "議員名簿（髙橋）" in page.html_content
+        browser_fetcher.fetch_single_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_escalates_and_remembers_host(self, fixture_server, browser_fetcher):
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            fetcher.http_fetcher.fetch = AsyncMock(wraps=fetcher.http_fetcher.fetch)
+
+            first = await fetcher.fetch_single_page(fixture_server + "/spa")
+            second = await fetcher.fetch_single_page(fixture_server + "/utf8")
+
+        assert first is not None
+        assert first.html_content == "<html>rendered</html>"
+        assert second is not None
+        assert second.html_content == "<html>rendered</html>"
+        assert fetcher.render_hosts == {"127.0.0.1"}
+        # The second page on the same host skips the HTTP attempt
+        fetcher.http_fetcher.fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_later_fetchers_remember_host(self, fixture_server, browser_fetcher):
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            await fetcher.fetch_single_page(fixture_server + "/spa")
+
+        # A fetcher created later for another extraction skips the HTTP attempt
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            fetcher.http_fetcher.fetch = AsyncMock()
+            page = await fetcher.fetch_single_page(fixture_server + "/utf8")
+
+        assert page is not None
+        assert page.html_content == "<html>rendered</html>"
+        fetcher.http_fetcher.fetch.assert_not_called()
+        assert get_render_host_registry().hosts == {"127.0.0.1"}
+
+    @pytest.mark.asyncio
+    async def test_injected_registry_is_not_shared(
+        self, fixture_server, browser_fetcher
+    ):
+        registry = RenderHostRegistry()
+        async with StaticFirstPageFetcher(
+            browser_fetcher=browser_fetcher, render_host_registry=registry
+        ) as fetcher:
+            await fetcher.fetch_single_page(fixture_server + "/spa")
+
+        assert registry.hosts == {"127.0.0.1"}
+        assert get_render_host_registry().hosts == frozenset()
+
+    @pytest.mark.asyncio
+    async def test_reused_across_contexts(self, fixture_server, browser_fetcher):
+        fetcher = StaticFirstPageFetcher(browser_fetcher=browser_fetcher)
+
+        async with fetcher:
+            # Nested use keeps the session open until the outer context exits
+            async with fetcher:
+                await fetcher.fetch_single_page(fixture_server + "/sjis")
+            assert fetcher.http_fetcher.session is not None
+        assert fetcher.http_fetcher.session is None
+
+        async with fetcher:
+            page = await fetcher.fetch_single_page(fixture_server + "/utf8")
+
+        assert page is not None
+        browser_fetcher.fetch_single_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_http_error_uses_browser_without_remembering(
+        self, fixture_server, browser_fetcher
+    ):
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            page = await fetcher.fetch_single_page(fixture_server + "/forbidden")
+
+        assert page is not None
+        assert page.html_content == "<html>rendered</html>"
+        assert fetcher.render_hosts == frozenset()
+
+    @pytest.mark.asyncio
+    async def test_missing_and_non_html_pages(self, fixture_server, browser_fetcher):
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            assert await fetcher.fetch_single_page(fixture_server + "/missing") is None
+            assert await fetcher.fetch_single_page(fixture_server + "/list.pdf") is None
+
+        browser_fetcher.fetch_single_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reports_final_url(self, fixture_server, browser_fetcher):
+        async with StaticFirstPageFetcher(browser_fetcher=browser_fetcher) as fetcher:
+            page = await fetcher.fetch_single_page(fixture_server + "/redirect")
+
+        assert page is not None
+        assert page.url == fixture_server + "/utf8"
@@ -0,0 +1,31 @@
+"""Tests for URL normalization."""
+
+import pytest
+
+from src.infrastructure.external.url_normalizer import normalize_url
+
+
+class TestNormalizeUrl:
+    """Test cases for normalize_url."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://example.com/members",
+            "https://example.com/members/",
+            "HTTPS://WWW.Example.com:443/members#top",
+            "https://example.com/members?utm_source=x&fbclid=y",
+        ],
+    )
+    def test_equivalent_urls(self, url):
+        assert normalize_url(url) == ("example.com", "https://example.com/members")
+
+    def test_query_is_sorted_and_kept(self):
+        assert normalize_url("https://example.com/m?b=2&a=1")[1] == (
+            "https://example.com/m?a=1&b=2"
+        )
+
+    def test_path_case_is_kept(self):
+        assert normalize_url("https://example.com/Members")[1] == (
+            "https://example.com/Members"
+        )
@@ -77,6 +77,56 @@ async def test_get_by_minutes_async(conversation_repo_async, mock_async_session)
     mock_async_session.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_exists_by_minutes_async(conversation_repo_async, mock_async_session):
+    """Test exists_by_minutes issues a single EXISTS query."""
+    mock_result = MagicMock()
+    mock_result.scalar.return_value = True
+    mock_async_session.execute.return_value = mock_result
+
+    assert await conversation_repo_async.exists_by_minutes(100) is True
+
+    mock_async_session.execute.assert_called_once()
+    query, params = mock_async_session.execute.call_args[0]
+    assert "EXISTS" in str(query)
+    assert params == {"minutes_id": 100}
+
+
+@pytest.mark.asyncio
+async def test_count_queries_by_minutes_async(
+    conversation_repo_async, mock_async_session
+):
+    """Test count_by_minutes and count_distinct_speakers_by_minutes."""
+    count_result = MagicMock()
+    count_result.scalar.return_value = 42
+    speaker_result = MagicMock()
+    speaker_result.scalar.return_value = 7
+    mock_async_session.execute.side_effect = [count_result, speaker_result]
+
+    assert await conversation_repo_async.count_by_minutes(100) == 42
+    assert await conversation_repo_async.count_distinct_speakers_by_minutes(100) == 7
+
+    speaker_query = mock_async_session.execute.call_args_list[1][0][0]
+    assert "COUNT(DISTINCT speaker_id)" in str(speaker_query)
+
+
+@pytest.mark.asyncio
+async def test_delete_by_minutes_async(conversation_repo_async, mock_async_session):
+    """Test delete_by_minutes deletes conversations and logs in one statement."""
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [MagicMock(id=1), MagicMock(id=2)]
+    mock_async_session.execute.return_value = mock_result
+
+    deleted_ids = await conversation_repo_async.delete_by_minutes(100)
+
+    assert deleted_ids == [1, 2]
+    mock_async_session.execute.assert_called_once()
+    sql = str(mock_async_session.execute.call_args[0][0])
+    assert "DELETE FROM conversations" in sql
+    assert "RETURNING id" in sql
+    assert "DELETE FROM extraction_logs" in sql
+
+
 @pytest.mark.asyncio
 async def test_get_by_speaker_async(conversation_repo_async, mock_async_session):
     """Test get_by_speaker with async session."""
@@ -261,6 +261,62 @@ class TestExtractedProposalJudgeRepositoryImpl:
         mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_matching_results(
+        self,
+        repository: ExtractedProposalJudgeRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """Test bulk_update_matching_results writes all judges in one statement."""
+        judges = [
+            ExtractedProposalJudge(
+                id=1,
+                proposal_id=10,
+                extracted_politician_name="山田太郎",
+                matched_politician_id=20,
+                matching_confidence=1.0,
+                matching_status="matched",
+            ),
+            ExtractedProposalJudge(
+                id=2,
+                proposal_id=10,
+                extracted_politician_name="不明な議員",
+                matching_confidence=0.0,
+                matching_status="no_match",
+            ),
+            # Judges that were never saved are skipped
+            ExtractedProposalJudge(proposal_id=10, matching_status="matched"),
+        ]
+        mock_result = MagicMock()
+        mock_result.rowcount = 2
+        mock_session.execute.return_value = mock_result
+
+        # Execute
+        result = await repository.bulk_update_matching_results(judges)
+
+        # Assert
+        assert result == 2
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args.args[1]
+        assert params["judge_ids"] == [1, 2]
+        assert params["pol_ids"] == [20, None]
+        assert params["confidences"] == [1.0, 0.0]
+        assert params["statuses"] == ["matched", "no_match"]
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_matching_results_empty(
+        self,
+        repository: ExtractedProposalJudgeRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """Test bulk_update_matching_results does nothing for an empty list."""
+        result = await repository.bulk_update_matching_results([])
+
+        assert result == 0
+        mock_session.execute.assert_not_called()
+        mock_session.commit.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_by_proposal(
         self,
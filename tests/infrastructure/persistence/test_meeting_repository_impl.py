@@ -280,6 +280,72 @@ class TestMeetingRepositoryImpl:
         assert total == 1
         assert mock_session.execute.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_get_meeting_summaries(
+        self, repository: MeetingRepositoryImpl, mock_session: MagicMock
+    ) -> None:
+        """Test get_meeting_summaries returns a page and total in one query."""
+        mock_row = MagicMock()
+        mock_row._mapping = {
+            "id": 1,
+            "conference_id": 10,
+            "date": date(2024, 1, 15),
+            "url": "https://example.com/meeting",
+            "name": "本会議",
+            "gcs_pdf_uri": None,
+            "gcs_text_uri": "gs://bucket/meeting.txt",
+            "conference_name": "東京都議会",
+            "governing_body_name": "東京都",
+            "governing_body_type": "都道府県",
+            "conversation_count": 42,
+            "speaker_count": 7,
+            "processing_status": "speakers_linked",
+            "total_count": 25,
+        }
+        mock_result = MagicMock()
+        mock_result.__iter__ = MagicMock(return_value=iter([mock_row]))
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        summaries, total = await repository.get_meeting_summaries(
+            governing_body_id=1,
+            processing_status="speakers_linked",
+            offset=20,
+            limit=10,
+        )
+
+        assert total == 25
+        assert summaries[0].conversation_count == 42
+        assert summaries[0].speaker_count == 7
+        assert summaries[0].processing_status == "speakers_linked"
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0])
+        params = mock_session.execute.call_args[0][1]
+        assert "meeting_conversation_stats" in sql
+        assert "COUNT(*) OVER ()" in sql
+        assert params == {
+            "offset": 20,
+            "limit": 10,
+            "governing_body_id": 1,
+            "processing_status": "speakers_linked",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_meeting_summaries_counts_when_page_is_empty(
+        self, repository: MeetingRepositoryImpl, mock_session: MagicMock
+    ) -> None:
+        """Test total is counted separately when the page is out of range."""
+        empty_result = MagicMock()
+        empty_result.__iter__ = MagicMock(return_value=iter([]))
+        count_result = MagicMock()
+        count_result.scalar = MagicMock(return_value=5)
+        mock_session.execute = AsyncMock(side_effect=[empty_result, count_result])
+
+        summaries, total = await repository.get_meeting_summaries(offset=100, limit=10)
+
+        assert summaries == []
+        assert total == 5
+        assert mock_session.execute.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_meeting_by_id_with_info_found(
         self, repository: MeetingRepositoryImpl, mock_session: MagicMock
@@ -463,6 +529,37 @@ class TestMeetingRepositoryImpl:
         assert result is None
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_by_ids(
+        self,
+        repository: MeetingRepositoryImpl,
+        mock_session: MagicMock,
+        sample_meeting_dict: dict[str, Any],
+    ) -> None:
+        """Test get_by_ids fetches all meetings in one query."""
+        mock_row = MagicMock()
+        mock_row._mapping = sample_meeting_dict
+        mock_result = MagicMock()
+        mock_result.__iter__ = MagicMock(return_value=iter([mock_row]))
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_by_ids([1, 999])
+
+        assert [meeting.id for meeting in result] == [1]
+        mock_session.execute.assert_called_once()
+        assert "ANY(:ids)" in str(mock_session.execute.call_args[0][0])
+        assert mock_session.execute.call_args[0][1] == {"ids": [1, 999]}
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_empty(
+        self, repository: MeetingRepositoryImpl, mock_session: MagicMock
+    ) -> None:
+        """Test get_by_ids skips the query for an empty ID list."""
+        result = await repository.get_by_ids([])
+
+        assert result == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_all(
         self,
@@ -8,6 +8,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.minutes import Minutes
+from src.domain.value_objects.attendee_boundary import AttendeeBoundary
 from src.infrastructure.persistence.minutes_repository_impl import (
     MinutesModel,
     MinutesRepositoryImpl,
@@ -185,6 +186,24 @@ class TestMinutesRepositoryImpl:
         mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_attendee_boundary(
+        self, repository: MinutesRepositoryImpl, mock_session: MagicMock
+    ) -> None:
+        """Test update_attendee_boundary stores the boundary as JSON."""
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_session.execute.return_value = mock_result
+        boundary = AttendeeBoundary(
+            text_hash="abc", position=120, detection_method="rule_based"
+        )
+
+        result = await repository.update_attendee_boundary(1, boundary)
+
+        assert result is True
+        stmt = mock_session.execute.call_args[0][0]
+        assert stmt.compile().params["attendee_boundary"] == boundary.to_dict()
+
     @pytest.mark.asyncio
     async def test_count(
         self, repository: MinutesRepositoryImpl, mock_session: MagicMock
@@ -322,3 +341,21 @@ class TestMinutesRepositoryImpl:
         repository._update_model(sample_minutes_model, entity)
 
         assert sample_minutes_model.processed_at == processed_time
+
+    def test_attendee_boundary_round_trip(
+        self, repository: MinutesRepositoryImpl
+    ) -> None:
+        """Test attendee_boundary is converted between entity and model."""
+        boundary = AttendeeBoundary(
+            text_hash="abc",
+            position=120,
+            boundary_type="time_marker",
+            confidence=0.95,
+            detection_method="rule_based",
+        )
+        entity = Minutes(meeting_id=10, attendee_boundary=boundary)
+
+        model = repository._to_model(entity)
+        assert model.attendee_boundary == boundary.to_dict()
+
+        assert repository._to_entity(model).attendee_boundary == boundary
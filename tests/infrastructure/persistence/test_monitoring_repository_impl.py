@@ -1,6 +1,7 @@
 """Tests for MonitoringRepositoryImpl."""
 
 from collections.abc import AsyncGenerator
+from datetime import datetime
 
 import pytest
 import pytest_asyncio
@@ -108,6 +109,23 @@ async def async_session() -> AsyncGenerator[AsyncSession]:
             )
         """)
         )
+        await conn.execute(
+            text("""
+            CREATE TABLE metrics_snapshots (
+                metric_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                computed_at TIMESTAMP NOT NULL
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE table_row_counts (
+                table_name TEXT PRIMARY KEY,
+                row_count INTEGER NOT NULL
+            )
+        """)
+        )
 
     async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -178,3 +196,74 @@ async def test_get_prefecture_coverage_empty(async_session: AsyncSession) -> Non
     assert isinstance(coverage, dict)
     assert "prefectures" in coverage
     assert "municipalities" in coverage
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_before_refresh(async_session: AsyncSession) -> None:
+    """Test that snapshots are None until they are refreshed."""
+    repo = MonitoringRepositoryImpl(async_session)
+
+    assert await repo.get_overall_metrics_snapshot() is None
+    assert await repo.get_conference_coverage_snapshot() is None
+    assert await repo.get_prefecture_detailed_coverage_snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_metrics_snapshot(async_session: AsyncSession) -> None:
+    """Test refreshing and reading the metrics snapshots."""
+    await async_session.execute(
+        text("""
+        INSERT INTO governing_bodies (id, name, type) VALUES (1, '東京都', '都道府県')
+    """)
+    )
+    await async_session.execute(
+        text("""
+        INSERT INTO conferences (id, name, governing_body_id)
+        VALUES (1, '東京都議会', 1)
+    """)
+    )
+    repo = MonitoringRepositoryImpl(async_session)
+
+    computed_at = await repo.refresh_metrics_snapshot()
+
+    overall = await repo.get_overall_metrics_snapshot()
+    assert overall is not None
+    assert overall["computed_at"] == computed_at
+    assert overall["data"]["governing_bodies"]["total"] == 1
+    assert overall["data"]["conferences"]["total"] == 1
+
+    conference_coverage = await repo.get_conference_coverage_snapshot()
+    assert conference_coverage is not None
+    assert conference_coverage["data"][0]["name"] == "東京都議会"
+
+    prefecture_coverage = await repo.get_prefecture_detailed_coverage_snapshot()
+    assert prefecture_coverage is not None
+    assert prefecture_coverage["data"][0]["status"] == "partial"
+
+    # 再計算すると計算日時が更新される
+    await async_session.execute(
+        text("INSERT INTO governing_bodies (id, name, type) VALUES (2, 'a', 'b')")
+    )
+    refreshed_at = await repo.refresh_metrics_snapshot()
+    overall = await repo.get_overall_metrics_snapshot()
+    assert overall is not None
+    assert overall["computed_at"] == refreshed_at
+    assert overall["data"]["governing_bodies"]["total"] == 2
+    assert isinstance(overall["computed_at"], datetime)
+
+
+@pytest.mark.asyncio
+async def test_get_table_row_counts(async_session: AsyncSession) -> None:
+    """Test reading the trigger-maintained row counts."""
+    await async_session.execute(
+        text("""
+        INSERT INTO table_row_counts (table_name, row_count) VALUES
+            ('conversations', 12000000),
+            ('speakers', 3500)
+    """)
+    )
+    repo = MonitoringRepositoryImpl(async_session)
+
+    counts = await repo.get_table_row_counts()
+
+    assert counts == {"conversations": 12000000, "speakers": 3500}
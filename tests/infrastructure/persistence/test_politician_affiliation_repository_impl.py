@@ -136,6 +136,46 @@ class TestPoliticianAffiliationRepositoryImpl:
         assert result[0].politician_id == 100
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_by_politicians(
+        self,
+        repository: PoliticianAffiliationRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """Test get_by_politicians fetches all politicians in one query."""
+        mock_rows = []
+        for row_id, politician_id in [(1, 100), (2, 100), (3, 200)]:
+            mock_row = MagicMock()
+            mock_row.id = row_id
+            mock_row.politician_id = politician_id
+            mock_row.conference_id = 10
+            mock_rows.append(mock_row)
+
+        mock_result = MagicMock()
+        mock_result.fetchall = MagicMock(return_value=mock_rows)
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_by_politicians([100, 200])
+
+        assert [a.politician_id for a in result] == [100, 100, 200]
+        mock_session.execute.assert_called_once()
+        query, params = mock_session.execute.call_args[0]
+        assert "ANY(:pol_ids)" in str(query)
+        assert "end_date IS NULL" in str(query)
+        assert params == {"pol_ids": [100, 200]}
+
+    @pytest.mark.asyncio
+    async def test_get_by_politicians_empty(
+        self,
+        repository: PoliticianAffiliationRepositoryImpl,
+        mock_session: MagicMock,
+    ) -> None:
+        """Test get_by_politicians skips the query for an empty id list."""
+        result = await repository.get_by_politicians([])
+
+        assert result == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_upsert_create_new(
         self,
@@ -0,0 +1,143 @@
+"""Tests for PromptVersionChangeListener."""
+
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.domain.entities.prompt_version import PromptVersion
+from src.infrastructure.external.prompt_registry import PromptRegistry
+from src.infrastructure.persistence.prompt_version_change_listener import (
+    PROMPT_VERSIONS_CHANNEL,
+    PromptVersionChangeListener,
+)
+
+
+@pytest.fixture
+def registry():
+    return MagicMock()
+
+
+@pytest.fixture
+def connection():
+    connection = MagicMock()
+    connection.is_closed.return_value = False
+    connection.add_listener = AsyncMock()
+    connection.remove_listener = AsyncMock()
+    connection.close = AsyncMock()
+    return connection
+
+
+@pytest.fixture
+def mock_connect(connection):
+    with patch(
+        "src.infrastructure.persistence.prompt_version_change_listener.asyncpg.connect",
+        new_callable=AsyncMock,
+        return_value=connection,
+    ) as mock_connect:
+        yield mock_connect
+
+
+class TestPromptVersionChangeListener:
+    """Test cases for PromptVersionChangeListener."""
+
+    @pytest.mark.asyncio
+    async def test_listens_and_invalidates_on_notify(
+        self, registry, connection, mock_connect
+    ):
+        listener = PromptVersionChangeListener(
+            registry, database_url="postgresql+asyncpg://user:pass@db:5432/sagebase"
+        )
+
+        async with listener:
+            mock_connect.assert_awaited_once_with(
+                "postgresql://user:pass@db:5432/sagebase"
+            )
+            channel, callback = connection.add_listener.await_args.args
+            assert channel == PROMPT_VERSIONS_CHANNEL
+            registry.invalidate.reset_mock()
+
+            callback(connection, 123, PROMPT_VERSIONS_CHANNEL, "minutes_divide")
+
+            registry.invalidate.assert_called_once_with()
+
+        connection.remove_listener.assert_awaited_once()
+        connection.close.assert_awaited_once()
+        assert not listener.is_listening
+
+    @pytest.mark.asyncio
+    async def test_start_invalidates_registry(self, registry, mock_connect):
+        """Changes made before LISTEN took effect must not be missed."""
+        listener = PromptVersionChangeListener(registry, database_url="postgresql://")
+
+        await listener.start()
+
+        registry.invalidate.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self, registry, mock_connect):
+        listener = PromptVersionChangeListener(registry, database_url="postgresql://")
+
+        await listener.start()
+        await listener.start()
+
+        mock_connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_invalidates_registry(
+        self, registry, connection, mock_connect
+    ):
+        listener = PromptVersionChangeListener(registry, database_url="postgresql://")
+        await listener.start()
+        [on_terminated] = connection.add_termination_listener.call_args.args
+        registry.invalidate.reset_mock()
+
+        on_terminated(connection)
+
+        registry.invalidate.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_notification_invalidates_registry_started_on_lookup(
+        self, connection, mock_connect
+    ):
+        repository = AsyncMock()
+        repository.get_all_active_versions.return_value = [
+            PromptVersion(prompt_key="test", template="Old", version="1.0.0")
+        ]
+        registry = PromptRegistry(
+            repository,
+            change_listener_factory=lambda r: PromptVersionChangeListener(
+                r, database_url="postgresql://"
+            ),
+        )
+
+        assert (await registry.get("test")).format({}) == "Old"
+        mock_connect.assert_awaited_once()
+        _, callback = connection.add_listener.await_args.args
+
+        # Another process activates a new version
+        repository.get_all_active_versions.return_value = [
+            PromptVersion(prompt_key="test", template="New", version="1.0.1")
+        ]
+        callback(connection, 123, PROMPT_VERSIONS_CHANNEL, "test")
+
+        assert not registry.is_fresh
+        assert (await registry.get("test")).format({}) == "New"
+        mock_connect.assert_awaited_once()
+
+    def test_reconnects_on_another_event_loop(self, registry, mock_connect):
+        """A connection opened on a finished event loop is replaced."""
+        stale = MagicMock()
+        stale.is_closed.return_value = False
+        stale.add_listener = AsyncMock()
+        fresh = mock_connect.return_value
+        mock_connect.return_value = stale
+        listener = PromptVersionChangeListener(registry, database_url="postgresql://")
+
+        asyncio.run(listener.start())
+        mock_connect.return_value = fresh
+        asyncio.run(listener.start())
+
+        assert mock_connect.await_count == 2
+        stale.terminate.assert_called_once_with()
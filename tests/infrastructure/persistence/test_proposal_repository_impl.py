@@ -357,6 +357,37 @@ class TestProposalRepositoryImpl:
         assert result[0].meeting_id == 100
         mock_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_by_ids(
+        self,
+        repository: ProposalRepositoryImpl,
+        mock_session: MagicMock,
+        sample_proposal_dict: dict[str, Any],
+    ) -> None:
+        """Test get_by_ids loads all proposals in one query."""
+        mock_row = MagicMock()
+        mock_row._mapping = sample_proposal_dict
+        mock_row._asdict = MagicMock(return_value=sample_proposal_dict)
+        mock_result = MagicMock()
+        mock_result.fetchall = MagicMock(return_value=[mock_row])
+        mock_session.execute.return_value = mock_result
+
+        result = await repository.get_by_ids([1, 2])
+
+        assert [p.id for p in result] == [1]
+        mock_session.execute.assert_called_once()
+        query, params = mock_session.execute.call_args.args
+        assert "ANY(:ids)" in str(query)
+        assert params == {"ids": [1, 2]}
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_empty(
+        self, repository: ProposalRepositoryImpl, mock_session: MagicMock
+    ) -> None:
+        """Test get_by_ids does not query without IDs."""
+        assert await repository.get_by_ids([]) == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_by_conference_id(
         self,
@@ -0,0 +1,209 @@
+"""Tests for WorkStatisticsRepositoryImpl."""
+
+from collections.abc import AsyncGenerator
+from datetime import date, datetime
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.infrastructure.persistence.work_statistics_repository_impl import (
+    WorkStatisticsRepositoryImpl,
+)
+
+
+USER_1 = UUID("00000000-0000-0000-0000-000000000001")
+USER_2 = UUID("00000000-0000-0000-0000-000000000002")
+USER_3 = UUID("00000000-0000-0000-0000-000000000003")
+
+
+@pytest_asyncio.fixture
+async def async_session() -> AsyncGenerator[AsyncSession]:
+    """Create an async session with work history for testing."""
+    # Use SQLite in-memory database for testing
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("CREATE TABLE users (user_id TEXT PRIMARY KEY, name TEXT, email TEXT)")
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE speakers (
+                id INTEGER PRIMARY KEY,
+                matched_by_user_id TEXT,
+                updated_at TIMESTAMP
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE parliamentary_group_memberships (
+                id INTEGER PRIMARY KEY,
+                created_by_user_id TEXT,
+                created_at TIMESTAMP
+            )
+        """)
+        )
+        for entity in ("politician", "proposal"):
+            await conn.execute(
+                text(f"""
+                CREATE TABLE {entity}_operation_logs (
+                    id INTEGER PRIMARY KEY,
+                    user_id TEXT,
+                    operation_type TEXT,
+                    operated_at TIMESTAMP
+                )
+            """)
+            )
+
+        await conn.execute(
+            text("""
+            INSERT INTO users (user_id, name, email) VALUES
+                (:user_1, 'User 1', 'user1@example.com'),
+                (:user_2, 'User 2', 'user2@example.com')
+        """),
+            {"user_1": str(USER_1), "user_2": str(USER_2)},
+        )
+        await conn.execute(
+            text("""
+            INSERT INTO speakers (matched_by_user_id, updated_at) VALUES
+                (:user_1, '2024-01-01 10:00:00'),
+                (:user_1, '2024-01-01 15:00:00'),
+                (:user_2, '2024-01-02 09:00:00'),
+                (NULL, '2024-01-02 09:00:00')
+        """),
+            {"user_1": str(USER_1), "user_2": str(USER_2)},
+        )
+        await conn.execute(
+            text("""
+            INSERT INTO parliamentary_group_memberships
+                (created_by_user_id, created_at)
+            VALUES (:user_1, '2024-01-02 11:00:00')
+        """),
+            {"user_1": str(USER_1)},
+        )
+        await conn.execute(
+            text("""
+            INSERT INTO politician_operation_logs
+                (user_id, operation_type, operated_at)
+            VALUES
+                (:user_2, 'create', '2024-01-03 10:00:00'),
+                (:user_3, 'update', '2024-01-03 11:00:00')
+        """),
+            {"user_2": str(USER_2), "user_3": str(USER_3)},
+        )
+        await conn.execute(
+            text("""
+            INSERT INTO proposal_operation_logs (user_id, operation_type, operated_at)
+            VALUES (:user_1, 'delete', '2024-01-03 12:00:00')
+        """),
+            {"user_1": str(USER_1)},
+        )
+
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def repository(async_session: AsyncSession) -> WorkStatisticsRepositoryImpl:
+    """Create repository instance for testing."""
+    return WorkStatisticsRepositoryImpl(async_session)
+
+
+@pytest.mark.asyncio
+async def test_get_counts_by_work_type(repository: WorkStatisticsRepositoryImpl):
+    """Test counting works of every source grouped by work type."""
+    counts = await repository.get_counts_by_work_type()
+
+    assert counts == {
+        "speaker_politician_matching": 3,
+        "parliamentary_group_membership_creation": 1,
+        "politician_create": 1,
+        "politician_update": 1,
+        "proposal_delete": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_counts_by_work_type_with_filters(
+    repository: WorkStatisticsRepositoryImpl,
+):
+    """Test that work type and date filters are applied to the sources."""
+    counts = await repository.get_counts_by_work_type(
+        work_types=["speaker_politician_matching", "politician_update"],
+        start_date=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+    assert counts == {"speaker_politician_matching": 2, "politician_update": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_counts_by_work_type_without_sources(
+    repository: WorkStatisticsRepositoryImpl,
+):
+    """Test that no query is needed when no work type is selected."""
+    assert await repository.get_counts_by_work_type(work_types=[]) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_daily_counts(repository: WorkStatisticsRepositoryImpl):
+    """Test counting works grouped by day."""
+    daily = await repository.get_daily_counts()
+
+    assert daily == [
+        {"date": date(2024, 1, 1), "count": 2},
+        {"date": date(2024, 1, 2), "count": 2},
+        {"date": date(2024, 1, 3), "count": 3},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_counts_by_user(repository: WorkStatisticsRepositoryImpl):
+    """Test counting works grouped by user with user details."""
+    counts = await repository.get_counts_by_user()
+
+    assert counts == [
+        {
+            "user_id": USER_1,
+            "user_name": "User 1",
+            "user_email": "user1@example.com",
+            "total_count": 4,
+        },
+        {
+            "user_id": USER_2,
+            "user_name": "User 2",
+            "user_email": "user2@example.com",
+            "total_count": 2,
+        },
+        {
+            "user_id": USER_3,
+            "user_name": None,
+            "user_email": None,
+            "total_count": 1,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_top_contributors(repository: WorkStatisticsRepositoryImpl):
+    """Test ranking top contributors with per-type breakdown."""
+    contributors = await repository.get_top_contributors(limit=2)
+
+    assert [c["user_id"] for c in contributors] == [USER_1, USER_2]
+    assert contributors[0]["total_count"] == 4
+    assert contributors[0]["by_type"] == {
+        "parliamentary_group_membership_creation": 1,
+        "proposal_delete": 1,
+        "speaker_politician_matching": 2,
+    }
+    assert contributors[1]["by_type"] == {
+        "politician_create": 1,
+        "speaker_politician_matching": 1,
+    }
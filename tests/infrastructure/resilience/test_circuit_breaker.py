@@ -8,12 +8,15 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.infrastructure.resilience.circuit_breaker import (
+    AsyncCircuitBreaker,
     CircuitBreaker,
     CircuitBreakerConfig,
     CircuitBreakerError,
     CircuitBreakerStats,
     CircuitState,
     circuit_breaker,
+    get_async_circuit_breaker,
+    reset_async_circuit_breakers,
 )
 
 
@@ -689,3 +692,89 @@ class TestCircuitBreakerEdgeCases:
 
         assert circuit_breaker_instance.stats.consecutive_failures == 0
         assert circuit_breaker_instance.stats.consecutive_successes == 0
+
+
+class TestAsyncCircuitBreaker:
+    """Test AsyncCircuitBreaker."""
+
+    @pytest.fixture
+    def async_breaker(self, breaker_config):
+        """Create async circuit breaker instance."""
+        return AsyncCircuitBreaker("async_breaker", breaker_config)
+
+    @pytest.mark.asyncio
+    async def test_opens_after_failures(self, async_breaker):
+        """Test breaker opens after consecutive failures."""
+
+        async def failing():
+            raise ConnectionError("down")
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await async_breaker.async_call(failing)
+
+        assert async_breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            await async_breaker.async_call(failing)
+
+    @pytest.mark.asyncio
+    async def test_ignores_non_failure_errors(self, breaker_config):
+        """Test errors rejected by is_failure do not count as failures."""
+        breaker = AsyncCircuitBreaker(
+            "selective",
+            breaker_config,
+            is_failure=lambda e: isinstance(e, ConnectionError),
+        )
+
+        async def bad_input():
+            raise ValueError("invalid")
+
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                await breaker.async_call(bad_input)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats.total_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_call_timeout_counts_as_failure(self, breaker_config):
+        """Test slow calls are cancelled and recorded as failures."""
+        breaker = AsyncCircuitBreaker("slow", breaker_config, call_timeout=0.01)
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        with pytest.raises(TimeoutError):
+            await breaker.async_call(slow)
+
+        assert breaker.stats.total_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_limits_concurrent_probes(self, async_breaker):
+        """Test only one probe passes while HALF_OPEN."""
+        async_breaker._transition_to_open()
+        async_breaker.stats.state_changed_at = datetime.now() - timedelta(seconds=2)
+        release = asyncio.Event()
+
+        async def probe():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.create_task(async_breaker.async_call(probe))
+        await asyncio.sleep(0)
+
+        with pytest.raises(CircuitBreakerError, match="busy"):
+            await async_breaker.async_call(probe)
+
+        release.set()
+        assert await first == "ok"
+        assert async_breaker._half_open_in_flight == 0
+
+    def test_shared_registry(self):
+        """Test breakers are shared by name."""
+        reset_async_circuit_breakers()
+        breaker = get_async_circuit_breaker("llm:test")
+
+        assert get_async_circuit_breaker("llm:test") is breaker
+        reset_async_circuit_breakers()
+        assert get_async_circuit_breaker("llm:test") is not breaker
@@ -0,0 +1,201 @@
+"""Tests for token bucket rate limiter implementation."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.external.llm_errors import LLMRateLimitError
+from src.infrastructure.resilience.rate_limiter import (
+    RateLimiterConfig,
+    TokenBucketRateLimiter,
+    estimate_tokens,
+    get_llm_rate_limiter,
+    is_rate_limit_error,
+    llm_rate_limit,
+    reset_llm_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_limiters():
+    """Reset process-wide limiters between tests."""
+    reset_llm_rate_limiters()
+    yield
+    reset_llm_rate_limiters()
+
+
+@pytest.fixture
+def limiter():
+    """Create a limiter allowing 60 requests/minute with a burst of 2."""
+    return TokenBucketRateLimiter(
+        "test-model",
+        RateLimiterConfig(
+            requests_per_minute=60,
+            tokens_per_minute=6000,
+            burst_seconds=2.0,
+            decrease_cooldown=0.0,
+        ),
+    )
+
+
+class TestEstimateTokens:
+    """Test token estimation."""
+
+    def test_ascii_text(self):
+        assert estimate_tokens("abcdefgh") == 2
+
+    def test_japanese_text_counts_per_character(self):
+        assert estimate_tokens("議事録") == 3
+
+    def test_multiple_texts_and_none(self):
+        assert estimate_tokens("abcd", None, "", "議長") == 3
+
+
+class TestIsRateLimitError:
+    """Test rate limit error detection."""
+
+    def test_llm_rate_limit_error(self):
+        assert is_rate_limit_error(LLMRateLimitError())
+
+    def test_status_code_attribute(self):
+        error = Exception("failed")
+        error.status_code = 429  # type: ignore[attr-defined]
+        assert is_rate_limit_error(error)
+
+    def test_resource_exhausted_message(self):
+        assert is_rate_limit_error(Exception("RESOURCE_EXHAUSTED: quota"))
+
+    def test_other_error(self):
+        assert not is_rate_limit_error(ValueError("invalid response"))
+
+
+class TestTokenBucketRateLimiter:
+    """Test TokenBucketRateLimiter."""
+
+    def test_burst_is_not_delayed(self, limiter):
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == 0.0
+
+    def test_wait_grows_in_arrival_order(self, limiter):
+        limiter.reserve()
+        limiter.reserve()
+
+        first = limiter.reserve()
+        second = limiter.reserve()
+
+        assert first == pytest.approx(1.0, abs=0.05)
+        assert second == pytest.approx(2.0, abs=0.05)
+        assert limiter.stats.total_acquired == 4
+        assert limiter.stats.max_wait_seconds == second
+
+    def test_token_budget_limits_large_prompts(self, limiter):
+        # TPMバケット容量は200トークン（100トークン/秒 × 2秒）
+        assert limiter.reserve(tokens=200) == 0.0
+        assert limiter.reserve(tokens=100) == pytest.approx(1.0, abs=0.05)
+
+    def test_oversized_request_waits_bounded_time(self, limiter):
+        wait = limiter.reserve(tokens=10**9)
+        assert wait <= 60.0
+
+    def test_rate_limited_reduces_rate_and_success_recovers(self, limiter):
+        limiter.record_rate_limited()
+        assert limiter.stats.rate_ratio == pytest.approx(0.5)
+        assert limiter.stats.rate_limited_count == 1
+
+        limiter.record_success()
+        assert limiter.stats.rate_ratio == pytest.approx(0.52)
+
+    def test_rate_never_drops_below_minimum(self, limiter):
+        for _ in range(20):
+            limiter.record_rate_limited()
+        assert limiter.stats.rate_ratio == pytest.approx(limiter.config.min_rate_ratio)
+
+    def test_decrease_cooldown_ignores_bursts_of_429(self):
+        limiter = TokenBucketRateLimiter(
+            "cooldown", RateLimiterConfig(decrease_cooldown=60.0)
+        )
+        limiter.record_rate_limited()
+        limiter.record_rate_limited()
+
+        assert limiter.stats.rate_ratio == pytest.approx(0.5)
+        assert limiter.stats.rate_limited_count == 2
+
+    def test_retry_after_blocks_new_requests(self, limiter):
+        limiter.record_rate_limited(retry_after=3.0)
+        # レート半減（0.5件/秒）で3秒間分の負債
+        assert limiter.reserve() >= 3.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_sleeps_for_reserved_wait(self):
+        limiter = TokenBucketRateLimiter(
+            "fast", RateLimiterConfig(requests_per_minute=600, burst_seconds=0.1)
+        )
+        await limiter.acquire()
+
+        waited = await limiter.acquire()
+
+        assert waited == pytest.approx(0.1, abs=0.02)
+        assert limiter.stats.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_records_rate_limit_and_reraises(self, limiter):
+        with pytest.raises(LLMRateLimitError):
+            async with limiter.limit():
+                raise LLMRateLimitError()
+
+        assert limiter.stats.rate_limited_count == 1
+        assert limiter.stats.rate_ratio < 1.0
+
+    @pytest.mark.asyncio
+    async def test_limit_ignores_other_errors(self, limiter):
+        with pytest.raises(ValueError):
+            async with limiter.limit():
+                raise ValueError("bad output")
+
+        assert limiter.stats.rate_limited_count == 0
+        assert limiter.stats.rate_ratio == 1.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_is_rate_limited(self):
+        limiter = TokenBucketRateLimiter(
+            "concurrent",
+            RateLimiterConfig(requests_per_minute=1200, burst_seconds=0.05),
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+
+        # 20件/秒、バースト1件 → 残り4件で約0.2秒
+        assert loop.time() - started >= 0.15
+
+    def test_get_status(self, limiter):
+        limiter.reserve()
+        status = limiter.get_status()
+
+        assert status["name"] == "test-model"
+        assert status["requests_per_minute"] == 60
+        assert status["total_acquired"] == 1
+
+
+class TestSharedLimiters:
+    """Test process-wide limiter registry."""
+
+    def test_same_model_shares_limiter(self):
+        assert get_llm_rate_limiter("model-a") is get_llm_rate_limiter("model-a")
+        assert get_llm_rate_limiter("model-a") is not get_llm_rate_limiter("model-b")
+
+    def test_config_only_applies_on_creation(self):
+        config = RateLimiterConfig(requests_per_minute=10)
+        limiter = get_llm_rate_limiter("model-c", config)
+
+        assert get_llm_rate_limiter("model-c", RateLimiterConfig()) is limiter
+        assert limiter.config.requests_per_minute == 10
+
+    @pytest.mark.asyncio
+    async def test_llm_rate_limit_context(self):
+        async with llm_rate_limit("model-d", "abcd", "議長") as limiter:
+            pass
+
+        assert limiter is get_llm_rate_limiter("model-d")
+        assert limiter.stats.total_acquired == 1
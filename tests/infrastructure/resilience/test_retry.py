@@ -1,6 +1,6 @@
 """リトライ機構のテスト"""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -10,7 +10,14 @@ from src.infrastructure.exceptions import (
     ExternalServiceException,
     RateLimitException,
 )
-from src.infrastructure.resilience.retry import RetryPolicy, with_retry
+from src.infrastructure.external.llm_errors import LLMRateLimitError
+from src.infrastructure.resilience.retry import (
+    RetryPolicy,
+    full_jitter_backoff,
+    is_transient_error,
+    retry_async,
+    with_retry,
+)
 
 
 class TestRetryPolicy:
@@ -362,3 +369,84 @@ class TestRetryIntegration:
 
         # ログが出力されることを確認（before_sleep_logとafter_log）
         assert mock_logger.warning.called or mock_logger.info.called
+
+
+class TestRetryAsync:
+    """retry_asyncのテスト"""
+
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.resilience.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_transient_errors(self, mock_sleep: AsyncMock) -> None:
+        """一時的な障害はリトライされ、asyncio.sleepで待機する"""
+        operation = AsyncMock(side_effect=[ConnectionException("api"), "success"])
+
+        result = await retry_async(operation, max_attempts=3)
+
+        assert result == "success"
+        assert operation.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.resilience.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_does_not_retry_permanent_errors(self, mock_sleep: AsyncMock) -> None:
+        """リトライ対象外の例外は即座に再送出される"""
+        operation = AsyncMock(side_effect=ValueError("invalid"))
+
+        with pytest.raises(ValueError):
+            await retry_async(operation, max_attempts=3)
+
+        operation.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.resilience.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_raises_last_error_after_max_attempts(
+        self, mock_sleep: AsyncMock
+    ) -> None:
+        """最大試行回数に達したら最後の例外を送出する"""
+        operation = AsyncMock(side_effect=TimeoutError("timed out"))
+
+        with pytest.raises(TimeoutError):
+            await retry_async(operation, max_attempts=3)
+
+        assert operation.await_count == 3
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.resilience.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_waits_at_least_retry_after(self, mock_sleep: AsyncMock) -> None:
+        """retry_afterが指定されていればその秒数以上待機する"""
+        operation = AsyncMock(side_effect=[LLMRateLimitError(retry_after=7), "success"])
+
+        await retry_async(operation, base_delay=0.1, max_delay=0.1)
+
+        assert mock_sleep.await_args.args[0] >= 7
+
+    @pytest.mark.asyncio
+    async def test_custom_should_retry(self) -> None:
+        """should_retryで判定を差し替えられる"""
+        operation = AsyncMock(side_effect=[KeyError("x"), "success"])
+
+        result = await retry_async(
+            operation, base_delay=0, should_retry=lambda e: isinstance(e, KeyError)
+        )
+
+        assert result == "success"
+
+    def test_full_jitter_backoff_is_bounded(self) -> None:
+        """バックオフは0〜上限の範囲に収まる"""
+        for attempt in range(1, 10):
+            delay = full_jitter_backoff(attempt, base_delay=1.0, max_delay=8.0)
+            assert 0 <= delay <= min(8.0, 2 ** (attempt - 1))
+
+    def test_is_transient_error(self) -> None:
+        """一時的な障害の判定"""
+        assert is_transient_error(RateLimitException("api", 10))
+        assert is_transient_error(Exception("503 Service Unavailable"))
+        assert is_transient_error(
+            ExternalServiceException("api", "op", status_code=502)
+        )
+        assert not is_transient_error(
+            ExternalServiceException("api", "op", status_code=400)
+        )
+        assert not is_transient_error(ValueError("invalid JSON"))
@@ -10,6 +10,7 @@ from src.domain.entities.meeting import Meeting
 from src.domain.repositories.conference_repository import ConferenceRepository
 from src.domain.repositories.governing_body_repository import GoverningBodyRepository
 from src.domain.repositories.meeting_repository import MeetingRepository
+from src.domain.value_objects.meeting_summary import MeetingSummary
 
 
 @pytest.fixture
@@ -162,6 +163,68 @@ class TestLoadData:
         assert result == []
 
 
+class TestLoadMeetingsPage:
+    """load_meetings_pageメソッドのテスト"""
+
+    def test_load_meetings_page_uses_summary_query(self, presenter, mock_meeting_repo):
+        """会議一覧を集計済みリードモデルの1クエリで取得することを確認"""
+        # Arrange
+        summary = MeetingSummary(
+            id=1,
+            conference_id=100,
+            date=date(2024, 1, 15),
+            url="https://example.com/meeting1",
+            name="本会議",
+            gcs_pdf_uri=None,
+            gcs_text_uri="gs://bucket/meeting1.txt",
+            conference_name="本会議",
+            governing_body_name="東京都",
+            governing_body_type="都道府県",
+            conversation_count=120,
+            speaker_count=15,
+            processing_status="speakers_linked",
+        )
+        mock_meeting_repo.get_meeting_summaries = MagicMock(
+            return_value=([summary], 31)
+        )
+
+        # Act
+        meetings, total = presenter.load_meetings_page(
+            governing_body_id=1, offset=30, limit=30
+        )
+
+        # Assert
+        assert total == 31
+        assert meetings[0]["conference_name"] == "本会議"
+        assert meetings[0]["conversation_count"] == 120
+        assert meetings[0]["speaker_count"] == 15
+        mock_meeting_repo.get_meeting_summaries.assert_called_once_with(
+            conference_id=None,
+            governing_body_id=1,
+            processing_status=None,
+            offset=30,
+            limit=30,
+        )
+        presenter.conference_repo.get_by_id.assert_not_called()
+
+    def test_meeting_status_from_summary(self, presenter):
+        """集計値から処理状況フラグを導出できることを確認"""
+        status = presenter.meeting_status_from_summary(
+            {
+                "gcs_pdf_uri": "gs://bucket/meeting1.pdf",
+                "gcs_text_uri": None,
+                "conversation_count": 10,
+                "speaker_count": 0,
+            }
+        )
+
+        assert status == {
+            "is_scraped": True,
+            "has_conversations": True,
+            "has_speakers_linked": False,
+        }
+
+
 class TestGetGoverningBodies:
     """get_governing_bodiesメソッドのテスト"""
 
@@ -1,9 +1,9 @@
-"""MinutesProcessAgentのサブグラフ統合テスト
+"""MinutesProcessAgentの発言境界抽出ノードの統合テスト
 
 Issue #797の受入条件を検証：
-- MinutesProcessAgentに発言抽出Agentノードが追加されている
+- MinutesProcessAgentに発言境界抽出ノードが追加されている
 - エッジとフロー制御が適切に設定されている
-- 既存のdetect_attendee_boundaryとsplit_minutes_by_boundaryがAgent化されている
+- 境界抽出はルールベースの候補採点で行い、曖昧な場合のみLLMを呼び出す
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,14 +15,7 @@ from src.minutes_divide_processor.models import MinutesProcessState
 
 
 class TestMinutesProcessAgentSubgraphIntegration:
-    """SpeechExtractionAgentサブグラフ統合のテスト"""
-
-    @pytest.fixture
-    def mock_llm(self):
-        """モックLLMの作成"""
-        mock = MagicMock()
-        mock.model_name = "gemini-2.0-flash-exp"
-        return mock
+    """発言境界抽出ノード統合のテスト"""
 
     @pytest.fixture
     def sample_minutes_text(self):
@@ -41,34 +34,8 @@ class TestMinutesProcessAgentSubgraphIntegration:
 """
 
     @pytest.mark.asyncio
-    @patch("langchain_google_genai.ChatGoogleGenerativeAI")
-    @patch(
-        "src.infrastructure.external.langgraph_speech_extraction_agent.SpeechExtractionAgent"
-    )
-    async def test_subgraph_node_exists(
-        self, mock_speech_agent_class, mock_chat_model, sample_minutes_text
-    ):
-        """サブグラフノードが追加されていることを確認"""
-        # Arrange
-        mock_speech_agent = MagicMock()
-        mock_speech_agent_class.return_value = mock_speech_agent
-
-        # モックのサブグラフを設定
-        mock_compiled_subgraph = AsyncMock()
-        mock_compiled_subgraph.ainvoke = AsyncMock(
-            return_value={
-                "verified_boundaries": [
-                    {
-                        "position": 100,
-                        "boundary_type": "separator_line",
-                        "confidence": 0.9,
-                    }
-                ],
-                "error_message": None,
-            }
-        )
-        mock_speech_agent.compile.return_value = mock_compiled_subgraph
-
+    async def test_subgraph_node_exists(self, sample_minutes_text):
+        """境界抽出ノードが追加されていることを確認"""
         # Act
         agent = MinutesProcessAgent()
 
@@ -84,19 +51,8 @@ class TestMinutesProcessAgentSubgraphIntegration:
         )
 
     @pytest.mark.asyncio
-    @patch("langchain_google_genai.ChatGoogleGenerativeAI")
-    @patch(
-        "src.infrastructure.external.langgraph_speech_extraction_agent.SpeechExtractionAgent"
-    )
-    async def test_graph_edges_configured_correctly(
-        self, mock_speech_agent_class, mock_chat_model
-    ):
+    async def test_graph_edges_configured_correctly(self):
         """エッジが正しく設定されていることを確認"""
-        # Arrange
-        mock_speech_agent = MagicMock()
-        mock_speech_agent_class.return_value = mock_speech_agent
-        mock_speech_agent.compile.return_value = AsyncMock()
-
         # Act
         agent = MinutesProcessAgent()
         graph_dict = agent.graph.get_graph()
@@ -120,43 +76,16 @@ class TestMinutesProcessAgentSubgraphIntegration:
         )
 
     @pytest.mark.asyncio
-    @patch("langchain_google_genai.ChatGoogleGenerativeAI")
-    @patch(
-        "src.infrastructure.external.langgraph_speech_extraction_agent.SpeechExtractionAgent"
-    )
-    @patch("src.infrastructure.external.minutes_divider.factory.MinutesDividerFactory")
+    @patch("src.minutes_divide_processor.minutes_process_agent.MinutesDividerFactory")
     async def test_extract_speech_boundary_node_execution(
-        self,
-        mock_divider_factory,
-        mock_speech_agent_class,
-        mock_chat_model,
-        sample_minutes_text,
+        self, mock_divider_factory, sample_minutes_text
     ):
         """_extract_speech_boundaryノードが正しく実行されることを確認"""
         # Arrange
-        # SpeechExtractionAgentのモック
-        mock_speech_agent = MagicMock()
-        mock_speech_agent_class.return_value = mock_speech_agent
-
-        # サブグラフの実行結果をモック
-        mock_compiled_subgraph = AsyncMock()
-        mock_compiled_subgraph.ainvoke = AsyncMock(
-            return_value={
-                "verified_boundaries": [
-                    {
-                        "position": 150,
-                        "boundary_type": "separator_line",
-                        "confidence": 0.95,
-                    }
-                ],
-                "error_message": None,
-            }
-        )
-        mock_speech_agent.compile.return_value = mock_compiled_subgraph
-
         # MinutesDividerのモック
         mock_divider = MagicMock()
         mock_divider.pre_process.return_value = sample_minutes_text
+        mock_divider.detect_attendee_boundary = AsyncMock()
         mock_divider.split_minutes_by_boundary.return_value = (
             "出席者部分",
             "○委員長（山田太郎） ただいまから会議を開催いたします。\n"
@@ -191,26 +120,22 @@ class TestMinutesProcessAgentSubgraphIntegration:
         assert "boundary" in memory_data
         assert "boundary_result" in memory_data
 
-        # サブグラフが呼び出されたことを確認
-        mock_compiled_subgraph.ainvoke.assert_called_once()
+        # 出席者の見出しと区切り線があるためルールベースで確定し、LLMは呼ばない
+        boundary = memory_data["boundary"]
+        assert boundary.boundary_found is True
+        assert boundary.boundary_type == "separator_line"
+        assert sample_minutes_text[boundary.boundary_position :].startswith("○委員長")
+        mock_divider.detect_attendee_boundary.assert_not_called()
+        mock_divider.split_minutes_by_boundary.assert_called_once_with(
+            sample_minutes_text, boundary
+        )
 
     @pytest.mark.asyncio
-    @patch("langchain_google_genai.ChatGoogleGenerativeAI")
-    @patch(
-        "src.infrastructure.external.langgraph_speech_extraction_agent.SpeechExtractionAgent"
-    )
-    @patch("src.infrastructure.external.minutes_divider.factory.MinutesDividerFactory")
-    async def test_boundary_result_conversion(
-        self, mock_divider_factory, mock_speech_agent_class, mock_chat_model
-    ):
+    @patch("src.minutes_divide_processor.minutes_process_agent.MinutesDividerFactory")
+    async def test_boundary_result_conversion(self, mock_divider_factory):
         """BoundaryExtractionResultからMinutesBoundaryへの変換をテスト"""
         # Arrange
-        mock_speech_agent = MagicMock()
-        mock_speech_agent_class.return_value = mock_speech_agent
-        mock_speech_agent.compile.return_value = AsyncMock()
-
-        mock_divider = MagicMock()
-        mock_divider_factory.create.return_value = mock_divider
+        mock_divider_factory.create.return_value = MagicMock()
 
         agent = MinutesProcessAgent()
 
@@ -232,25 +157,15 @@ class TestMinutesProcessAgentSubgraphIntegration:
         assert boundary.boundary_found is True
         assert boundary.boundary_type == "separator_line"  # 最高信頼度の境界
         assert boundary.confidence == 0.92
-        assert "SpeechExtractionAgent検出" in boundary.reason
+        assert boundary.boundary_position == 200
+        assert "境界抽出" in boundary.reason
 
     @pytest.mark.asyncio
-    @patch("langchain_google_genai.ChatGoogleGenerativeAI")
-    @patch(
-        "src.infrastructure.external.langgraph_speech_extraction_agent.SpeechExtractionAgent"
-    )
-    @patch("src.infrastructure.external.minutes_divider.factory.MinutesDividerFactory")
-    async def test_no_boundary_found_handling(
-        self, mock_divider_factory, mock_speech_agent_class, mock_chat_model
-    ):
+    @patch("src.minutes_divide_processor.minutes_process_agent.MinutesDividerFactory")
+    async def test_no_boundary_found_handling(self, mock_divider_factory):
         """境界が見つからない場合のハンドリングをテスト"""
         # Arrange
-        mock_speech_agent = MagicMock()
-        mock_speech_agent_class.return_value = mock_speech_agent
-        mock_speech_agent.compile.return_value = AsyncMock()
-
-        mock_divider = MagicMock()
-        mock_divider_factory.create.return_value = mock_divider
+        mock_divider_factory.create.return_value = MagicMock()
 
         agent = MinutesProcessAgent()
 
@@ -19,14 +19,7 @@ from src.minutes_divide_processor.models import (
 @pytest.fixture
 def mocked_agent() -> MinutesProcessAgent:
     """モックを適用したMinutesProcessAgentのインスタンスを作成。"""
-    with (
-        patch("langchain_google_genai.ChatGoogleGenerativeAI"),
-        patch(
-            "src.infrastructure.external.langgraph_speech_extraction_agent"
-            ".SpeechExtractionAgent"
-        ),
-    ):
-        return MinutesProcessAgent()
+    return MinutesProcessAgent()
 
 
 class TestRemoveHonorifics:
@@ -1,6 +1,6 @@
 """Unit tests for LLMService"""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -136,29 +136,26 @@ class TestLLMService:
         converted = service._convert_exception(generic_error)
         assert isinstance(converted, LLMError)
 
+    @patch("src.services.llm_service.get_llm_rate_limiter")
     @patch("src.services.llm_service.time")
-    def test_handle_rate_limit(self, mock_time, mock_api_key):
-        """Test rate limit handling"""
+    def test_handle_rate_limit(self, mock_time, mock_get_limiter, mock_api_key):
+        """Test rate limit handling uses the shared per-model limiter"""
         service = LLMService()
-
-        # Setup mock times
-        mock_time.time.side_effect = [
-            100.0,  # First request - current_time
-            100.0,  # First request - _last_request_time update
-            100.5,  # Second request - current_time
-            101.0,  # Second request - _last_request_time update after sleep
-        ]
+        mock_time.time.side_effect = [100.0, 100.5]
+        mock_get_limiter.return_value.acquire_blocking.side_effect = [0.0, 0.5]
 
         # First request
         service._handle_rate_limit()
         assert service._request_count == 1
         assert service._last_request_time == 100.0
 
-        # Second request too soon - should sleep
+        # Second request too soon - the shared limiter decides the wait
         service._handle_rate_limit()
-        mock_time.sleep.assert_called_once_with(0.5)  # 1.0 - 0.5 = 0.5s sleep
+        mock_get_limiter.assert_called_with(service.model_name)
+        assert mock_get_limiter.return_value.acquire_blocking.call_count == 2
+        mock_time.sleep.assert_not_called()
         assert service._request_count == 2
-        assert service._last_request_time == 101.0
+        assert service._last_request_time == 100.5
 
     @patch("src.services.llm_service.ChatGoogleGenerativeAI")
     def test_invoke_with_prompt(self, mock_llm_class, mock_api_key):
@@ -212,6 +209,28 @@ class TestLLMService:
         # Verify it was called 3 times (original + 2 retries)
         assert mock_chain.invoke.call_count == 3
 
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.resilience.retry.asyncio.sleep", new_callable=AsyncMock)
+    async def test_ainvoke_with_retry(self, mock_sleep, mock_api_key):
+        """Test ainvoke_with_retry retries rate limits without blocking"""
+        mock_chain = MagicMock()
+        mock_chain.ainvoke = AsyncMock(
+            side_effect=[Exception("Rate limit exceeded"), "Success"]
+        )
+        service = LLMService()
+
+        result = await service.ainvoke_with_retry(mock_chain, {"param": "value"})
+
+        assert result == "Success"
+        assert mock_chain.ainvoke.await_count == 2
+        mock_sleep.assert_awaited()
+
+        # Non-retryable errors are converted and raised immediately
+        mock_chain.ainvoke = AsyncMock(side_effect=Exception("Invalid API key"))
+        with pytest.raises(LLMAuthenticationError):
+            await service.ainvoke_with_retry(mock_chain, {"param": "value"})
+        mock_chain.ainvoke.assert_awaited_once()
+
     def test_create_chain(self, mock_api_key):
         """Test chain creation methods"""
         service = LLMService()
@@ -13,11 +13,27 @@ from src.infrastructure.external.versioned_prompt_manager import VersionedPrompt
 @pytest.fixture
 def mock_repository():
     """Create a mock prompt version repository."""
-    return AsyncMock()
+    repository = AsyncMock()
+    repository.get_all_active_versions.return_value = []
+    return repository
 
 
 @pytest.fixture
-def manager_with_repo(mock_repository):
+def mock_connect():
+    """Stub the LISTEN connection opened on the first prompt lookup."""
+    connection = Mock()
+    connection.is_closed.return_value = False
+    connection.add_listener = AsyncMock()
+    with patch(
+        "src.infrastructure.persistence.prompt_version_change_listener.asyncpg.connect",
+        new_callable=AsyncMock,
+        return_value=connection,
+    ) as mock_connect:
+        yield mock_connect
+
+
+@pytest.fixture
+def manager_with_repo(mock_repository, mock_connect):
     """Create a versioned prompt manager with repository."""
     return VersionedPromptManager(repository=mock_repository)
 
@@ -45,7 +61,7 @@ class TestVersionedPromptManager:
             is_active=True,
             id=1,
         )
-        mock_repository.get_active_version.return_value = prompt_version
+        mock_repository.get_all_active_versions.return_value = [prompt_version]
 
         # Execute
         result, version = await manager_with_repo.get_versioned_prompt(
@@ -55,16 +71,25 @@ class TestVersionedPromptManager:
         # Assert
         assert result == "Hello Alice!"
         assert version == "1.0.0"
-        mock_repository.get_active_version.assert_called_once_with("test_prompt")
+        mock_repository.get_all_active_versions.assert_called_once_with()
+        mock_repository.get_active_version.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_lookup_listens_for_changes(
+        self, manager_with_repo, mock_connect
+    ):
+        """Test that the registry listens for changes from other processes."""
+        await manager_with_repo.get_versioned_prompt("minutes_divide", {"minutes": ""})
+        await manager_with_repo.get_versioned_prompt("minutes_divide", {"minutes": ""})
+
+        mock_connect.assert_awaited_once()
+        assert manager_with_repo.registry.change_listener.is_listening
 
     @pytest.mark.asyncio
     async def test_get_versioned_prompt_fallback_to_legacy(
         self, manager_with_repo, mock_repository
     ):
         """Test falling back to legacy prompt when versioned not found."""
-        # Setup
-        mock_repository.get_active_version.return_value = None
-
         # Execute
         result, version = await manager_with_repo.get_versioned_prompt(
             "minutes_divide", {"minutes": "Test minutes"}
@@ -100,7 +125,7 @@ class TestVersionedPromptManager:
             variables=["name", "city"],
             is_active=True,
         )
-        mock_repository.get_active_version.return_value = prompt_version
+        mock_repository.get_all_active_versions.return_value = [prompt_version]
 
         # Execute & Assert
         with pytest.raises(ValueError, match="Missing required variables"):
@@ -109,35 +134,10 @@ class TestVersionedPromptManager:
             )
 
     @pytest.mark.asyncio
-    async def test_get_active_version_with_cache(
-        self, manager_with_repo, mock_repository
-    ):
-        """Test getting active version uses cache."""
-        # Setup
-        prompt_version = PromptVersion(
-            prompt_key="test_prompt",
-            template="Test",
-            version="1.0.0",
-            is_active=True,
-        )
-        prompt_version.updated_at = datetime.now()
-        mock_repository.get_active_version.return_value = prompt_version
-
-        # First call - should hit repository
-        result1 = await manager_with_repo._get_active_version("test_prompt")
-        assert result1 == prompt_version
-        assert mock_repository.get_active_version.call_count == 1
-
-        # Second call - should use cache
-        result2 = await manager_with_repo._get_active_version("test_prompt")
-        assert result2 == prompt_version
-        assert mock_repository.get_active_version.call_count == 1  # No additional calls
-
-    @pytest.mark.asyncio
-    async def test_get_active_version_cache_expiry(
+    async def test_get_versioned_prompt_uses_registry_cache(
         self, manager_with_repo, mock_repository
     ):
-        """Test cache expires after 5 minutes."""
+        """Test active versions are loaded once and then served from memory."""
         # Setup
         prompt_version = PromptVersion(
             prompt_key="test_prompt",
@@ -145,33 +145,34 @@ class TestVersionedPromptManager:
             version="1.0.0",
             is_active=True,
         )
-        # Set updated_at to more than 5 minutes ago
-        prompt_version.updated_at = datetime.now() - timedelta(minutes=6)
+        # Versions last edited long ago are cached too
+        prompt_version.updated_at = datetime.now() - timedelta(days=30)
+        mock_repository.get_all_active_versions.return_value = [prompt_version]
 
-        # Add to cache
-        manager_with_repo._version_cache["test_prompt"] = prompt_version
-        mock_repository.get_active_version.return_value = prompt_version
-
-        # Execute - should hit repository due to cache expiry
-        result = await manager_with_repo._get_active_version("test_prompt")
+        # Execute
+        for _ in range(3):
+            await manager_with_repo.get_versioned_prompt("test_prompt")
+        await manager_with_repo.get_versioned_prompt("minutes_divide", {"minutes": ""})
 
         # Assert
-        assert result == prompt_version
-        mock_repository.get_active_version.assert_called_once_with("test_prompt")
+        mock_repository.get_all_active_versions.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_active_version_error_handling(
+    async def test_get_versioned_prompt_repository_error_falls_back(
         self, manager_with_repo, mock_repository
     ):
-        """Test error handling when fetching active version."""
+        """Test falling back to legacy prompts when loading versions fails."""
         # Setup
-        mock_repository.get_active_version.side_effect = Exception("DB Error")
+        mock_repository.get_all_active_versions.side_effect = Exception("DB Error")
 
         # Execute
-        result = await manager_with_repo._get_active_version("test_prompt")
+        result, version = await manager_with_repo.get_versioned_prompt(
+            "minutes_divide", {"minutes": "Test minutes"}
+        )
 
         # Assert
-        assert result is None
+        assert "Test minutes" in result
+        assert version == "legacy"
 
     @pytest.mark.asyncio
     async def test_save_prompt_version_success(
@@ -186,6 +187,7 @@ class TestVersionedPromptManager:
             is_active=True,
         )
         mock_repository.create_version.return_value = created_version
+        await manager_with_repo.registry.refresh()
 
         # Execute
         result = await manager_with_repo.save_new_version(
@@ -199,7 +201,10 @@ class TestVersionedPromptManager:
         # Assert
         assert result == created_version
         mock_repository.create_version.assert_called_once()
-        assert manager_with_repo._version_cache.get("new_prompt") == created_version
+        # Served from the registry without reloading
+        result, version = await manager_with_repo.get_versioned_prompt("new_prompt")
+        assert (result, version) == ("New template", "2.0.0")
+        mock_repository.get_all_active_versions.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_save_prompt_version_auto_version(
@@ -288,7 +293,7 @@ class TestVersionedPromptManager:
         """Test activating a specific version."""
         # Setup
         mock_repository.activate_version.return_value = True
-        manager_with_repo._version_cache["test"] = Mock()  # Add to cache
+        await manager_with_repo.registry.refresh()
 
         # Execute
         result = await manager_with_repo.activate_version("test", "2.0.0")
@@ -296,7 +301,7 @@ class TestVersionedPromptManager:
         # Assert
         assert result is True
         mock_repository.activate_version.assert_called_once_with("test", "2.0.0")
-        assert "test" not in manager_with_repo._version_cache  # Cache cleared
+        assert not manager_with_repo.registry.is_fresh  # Cache invalidated
 
     @pytest.mark.asyncio
     async def test_activate_version_failure(self, manager_with_repo, mock_repository):
@@ -370,16 +375,18 @@ class TestVersionedPromptManager:
         # Assert
         assert count == len(manager_with_repo.PROMPTS) - 1  # One less due to failure
 
-    def test_clear_cache(self, manager_with_repo):
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, manager_with_repo, mock_repository):
         """Test clearing the version cache."""
         # Setup
-        manager_with_repo._version_cache = {
-            "test1": Mock(),
-            "test2": Mock(),
-        }
+        mock_repository.get_all_active_versions.return_value = [
+            PromptVersion(prompt_key="test1", template="v1", version="1.0.0")
+        ]
+        await manager_with_repo.get_versioned_prompt("test1")
 
         # Execute
         manager_with_repo.clear_cache()
 
         # Assert
-        assert manager_with_repo._version_cache == {}
+        await manager_with_repo.get_versioned_prompt("test1")
+        assert mock_repository.get_all_active_versions.call_count == 2
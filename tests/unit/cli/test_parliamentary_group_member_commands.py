@@ -335,6 +335,18 @@ class TestParliamentaryGroupMemberCommands:
             assert "⚠️  要確認: 1件" in result.output
             assert "❌ 該当なし: 1件" in result.output
 
+    def test_create_match_members_usecase_uses_default_name_normalizer(self):
+        """Test that the speaker service is built with its default name normalizer"""
+        module = "src.interfaces.cli.commands.parliamentary_group_member_commands"
+        with (
+            patch(f"{module}.get_db_session", return_value=MagicMock()),
+            patch(f"{module}.GeminiLLMService"),
+        ):
+            usecase = ParliamentaryGroupMemberCommands._create_match_members_usecase()
+
+        speaker_service = usecase.matching_service.speaker_service
+        assert speaker_service.normalize_speaker_name("山田太郎君") == "山田太郎"
+
     def test_match_parliamentary_group_members_no_group_id(self, runner, mock_progress):
         """Test matching without group ID (process all)"""
         with patch(
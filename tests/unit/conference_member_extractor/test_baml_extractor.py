@@ -7,6 +7,14 @@ import pytest
 from src.infrastructure.external.conference_member_extractor.baml_extractor import (
     BAMLMemberExtractor,
 )
+from src.infrastructure.external.html_compactor import HtmlCompactor
+
+
+MEMBER_HTML = (
+    "<html><body><nav><a href='/'>トップ</a></nav>"
+    "<table class='list'><tr><th>役職</th><th>氏名</th></tr>"
+    "<tr><td>委員長</td><td>山田太郎</td></tr></table></body></html>"
+)
 
 
 class TestBAMLMemberExtractor:
@@ -42,7 +50,7 @@ class TestBAMLMemberExtractor:
             mock_baml.return_value = mock_result
 
             # Execute
-            result = await extractor.extract_members("<html></html>", "本会議")
+            result = await extractor.extract_members(MEMBER_HTML, "本会議")
 
             # Assert
             assert len(result) == 3
@@ -52,8 +60,10 @@ class TestBAMLMemberExtractor:
             assert result[1].name == "田中花子"
             assert result[2].name == "佐藤次郎"
 
-            # Verify BAML was called with correct arguments
-            mock_baml.assert_called_once_with("<html></html>", "本会議")
+            # Verify BAML was called with the compacted HTML
+            mock_baml.assert_called_once_with(
+                "役職 | 氏名\n委員長 | 山田太郎", "本会議"
+            )
 
     @pytest.mark.asyncio
     async def test_extract_members_empty_result(self, extractor):
@@ -80,41 +90,92 @@ class TestBAMLMemberExtractor:
             mock_baml.side_effect = Exception("BAML error")
 
             # Execute
-            result = await extractor.extract_members("<html></html>", "本会議")
+            result = await extractor.extract_members(MEMBER_HTML, "本会議")
 
             # Assert - should return empty list on error
             assert result == []
 
     @pytest.mark.asyncio
-    async def test_extract_members_truncates_long_html(self, extractor, caplog):
-        """Test that long HTML content is truncated"""
-        # Create very long HTML content
-        long_html = "x" * 60000  # More than 50000 chars
+    async def test_extract_members_without_content_skips_baml(self, extractor):
+        """Test that BAML is not called when the page has no content"""
+        with patch(
+            "src.infrastructure.external.conference_member_extractor.baml_extractor.b.ExtractMembers",
+            new_callable=AsyncMock,
+        ) as mock_baml:
+            result = await extractor.extract_members(
+                "<html><script>x()</script></html>", "本会議"
+            )
+
+            assert result == []
+            mock_baml.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_members_splits_long_html_into_chunks(self):
+        """Test that long HTML is split into row-aligned chunks and merged"""
+        rows = "".join(f"<tr><td>委員</td><td>議員{i:02d}</td></tr>" for i in range(20))
+        html = (
+            "<h2>総務委員会</h2>"
+            f"<table><tr><th>役職</th><th>氏名</th></tr>{rows}</table>"
+        )
+        extractor = BAMLMemberExtractor(HtmlCompactor(max_chunk_chars=100))
 
         class MockMember:
-            def __init__(self, name, role, party_name, additional_info):
+            def __init__(self, name):
                 self.name = name
-                self.role = role
-                self.party_name = party_name
-                self.additional_info = additional_info
+                self.role = "委員"
+                self.party_name = None
+                self.additional_info = None
+
+        async def extract(chunk, conference_name):
+            names = [line.split(" | ")[1] for line in chunk.splitlines()[2:]]
+            # 委員長は各チャンクで重複して返される
+            return [MockMember("委員長 山田太郎"), *map(MockMember, names)]
 
         with patch(
             "src.infrastructure.external.conference_member_extractor.baml_extractor.b.ExtractMembers",
             new_callable=AsyncMock,
+            side_effect=extract,
         ) as mock_baml:
-            mock_baml.return_value = [MockMember("山田太郎", "委員", None, None)]
+            result = await extractor.extract_members(html, "総務委員会")
+
+            assert mock_baml.await_count > 1
+            for call in mock_baml.await_args_list:
+                chunk = call.args[0]
+                assert len(chunk) <= 100
+                assert chunk.startswith("## 総務委員会\n役職 | 氏名\n")
+            assert [m.name for m in result] == [
+                "委員長 山田太郎",
+                *(f"議員{i:02d}" for i in range(20)),
+            ]
 
-            # Execute
-            await extractor.extract_members(long_html, "本会議")
+    @pytest.mark.asyncio
+    async def test_extract_members_keeps_successful_chunks(self):
+        """Test that a failed chunk does not discard the other chunks"""
+        rows = "".join(f"<li>議員{i:02d}</li>" for i in range(10))
+        extractor = BAMLMemberExtractor(HtmlCompactor(max_chunk_chars=30))
 
-            # Assert - should log warning about truncation
-            assert "HTML content too long" in caplog.text
-            assert "truncating to 50000 chars" in caplog.text
+        class MockMember:
+            def __init__(self, name):
+                self.name = name
+                self.role = None
+                self.party_name = None
+                self.additional_info = None
+
+        async def extract(chunk, conference_name):
+            if "議員00" in chunk:
+                raise Exception("BAML error")
+            return [MockMember(line[2:]) for line in chunk.splitlines()]
+
+        with patch(
+            "src.infrastructure.external.conference_member_extractor.baml_extractor.b.ExtractMembers",
+            new_callable=AsyncMock,
+            side_effect=extract,
+        ):
+            result = await extractor.extract_members(f"<ul>{rows}</ul>", "本会議")
 
-            # Assert - BAML should be called with truncated HTML
-            call_args = mock_baml.call_args[0]
-            assert len(call_args[0]) <= 50003  # 50000 + "..."
-            assert call_args[0].endswith("...")
+            assert result
+            assert "議員00" not in [m.name for m in result]
+            assert "議員09" in [m.name for m in result]
 
     @pytest.mark.asyncio
     async def test_extract_members_with_optional_fields(self, extractor):
@@ -140,7 +201,7 @@ class TestBAMLMemberExtractor:
             mock_baml.return_value = mock_result
 
             # Execute
-            result = await extractor.extract_members("<html></html>", "委員会")
+            result = await extractor.extract_members(MEMBER_HTML, "委員会")
 
             # Assert
             assert len(result) == 2
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from src.application.dtos.conference_member_extraction_dto import ExtractedMemberDTO
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
 from src.infrastructure.external.conference_member_extractor.extractor import (
     ConferenceMemberExtractor,
 )
@@ -29,7 +30,15 @@ class TestConferenceMemberExtractor:
         return repo
 
     @pytest.fixture
-    def extractor(self, mock_llm_service, mock_repo):
+    def mock_fetcher(self):
+        """Create a page fetcher that is used as an async context manager"""
+        fetcher = Mock()
+        fetcher.__aenter__ = AsyncMock(return_value=fetcher)
+        fetcher.__aexit__ = AsyncMock(return_value=None)
+        return fetcher
+
+    @pytest.fixture
+    def extractor(self, mock_llm_service, mock_repo, mock_fetcher):
         """Create a ConferenceMemberExtractor instance"""
         with patch(
             "src.infrastructure.external.conference_member_extractor.extractor.MemberExtractorFactory.create_agent"
@@ -38,7 +47,7 @@ class TestConferenceMemberExtractor:
                 "src.infrastructure.external.conference_member_extractor.extractor.RepositoryAdapter",
                 return_value=mock_repo,
             ):
-                return ConferenceMemberExtractor()
+                return ConferenceMemberExtractor(page_fetcher=mock_fetcher)
 
     @pytest.mark.asyncio
     async def test_extract_members_with_llm_success(self, extractor, mock_llm_service):
@@ -163,37 +172,36 @@ class TestConferenceMemberExtractor:
 
     @pytest.mark.asyncio
     @patch(
-        "src.infrastructure.external.conference_member_extractor.extractor.async_playwright"
+        "src.infrastructure.external.conference_member_extractor.extractor.StaticFirstPageFetcher"
     )
-    async def test_fetch_html_success(self, mock_playwright, extractor):
-        """Test successful HTML fetching"""
-        # Mock Playwright
-        mock_page = AsyncMock()
-        mock_page.goto = AsyncMock()
-        mock_page.wait_for_timeout = AsyncMock()
-        mock_page.content = AsyncMock(return_value="<html>Test Content</html>")
-
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        mock_browser.close = AsyncMock()
-
-        mock_playwright_instance = AsyncMock()
-        mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_playwright_instance.__aenter__ = AsyncMock(
-            return_value=mock_playwright_instance
+    async def test_fetch_html_success(
+        self, mock_fetcher_class, extractor, mock_fetcher
+    ):
+        """Test successful HTML fetching with the extractor's own fetcher"""
+        mock_fetcher.fetch_single_page = AsyncMock(
+            return_value=WebPageContentDTO(
+                url="https://example.com", html_content="<html>Test Content</html>"
+            )
         )
-        mock_playwright_instance.__aexit__ = AsyncMock(return_value=None)
-
-        mock_playwright.return_value = mock_playwright_instance
 
         # Execute
         result = await extractor.fetch_html("https://example.com")
+        await extractor.fetch_html("https://example.com/2")
 
         # Assert
         assert result == "<html>Test Content</html>"
-        mock_page.goto.assert_called_once_with(
-            "https://example.com", wait_until="networkidle", timeout=30000
-        )
+        mock_fetcher.fetch_single_page.assert_any_await("https://example.com")
+        assert mock_fetcher.__aenter__.await_count == 2
+        # No fetcher is created per URL
+        mock_fetcher_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_failure(self, extractor, mock_fetcher):
+        """Test that a page that cannot be fetched raises an error"""
+        mock_fetcher.fetch_single_page = AsyncMock(return_value=None)
+
+        with pytest.raises(RuntimeError, match="Failed to fetch"):
+            await extractor.fetch_html("https://example.com")
 
     @pytest.mark.asyncio
     async def test_extract_and_save_members_full_flow(self, extractor, mock_repo):
@@ -60,6 +60,43 @@ class TestBAMLMinutesDivider:
             # Verify BAML was called
             mock_baml.assert_called_once_with("議事録テキスト")
 
+    @pytest.mark.asyncio
+    async def test_section_divide_run_windows_long_minutes(self):
+        """Test that long minutes are sent in windows and chapters are renumbered"""
+        from src.infrastructure.external.minutes_divider.chunk_planner import (
+            ChunkPlanner,
+            ChunkPlannerConfig,
+        )
+
+        class MockSectionInfo:
+            def __init__(self, chapter_number, keyword):
+                self.chapter_number = chapter_number
+                self.keyword = keyword
+
+        divider = BAMLMinutesDivider(
+            chunk_planner=ChunkPlanner(ChunkPlannerConfig(keyword_window_tokens=30))
+        )
+        minutes = (
+            "○議長(山田太郎君)開会します。" * 2 + "◆3番(鈴木花子議員)質問します。" * 2
+        )
+
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideMinutesToKeywords"
+        ) as mock_baml:
+            mock_baml.side_effect = lambda window: [
+                MockSectionInfo(1, window[:10]),
+                MockSectionInfo(2, window[10:20]),
+            ]
+
+            result = await divider.section_divide_run(minutes)
+
+            windows = [call.args[0] for call in mock_baml.call_args_list]
+            assert len(windows) > 1
+            assert "".join(windows) == minutes
+            assert [s.chapter_number for s in result.section_info_list] == list(
+                range(1, len(windows) * 2 + 1)
+            )
+
     @pytest.mark.asyncio
     async def test_section_divide_run_empty_result(self, divider):
         """Test section division with empty result"""
@@ -332,6 +369,27 @@ class TestBAMLMinutesDivider:
             assert result.boundary_found is False
             assert result.boundary_type == "none"
 
+    @pytest.mark.asyncio
+    async def test_detect_attendee_boundary_uses_rule_based_detection(self, divider):
+        """Test that a clear attendee section is detected without calling the LLM"""
+        text = (
+            "○出席議員（2名）\n1番 山田太郎君\n2番 田中一郎君\n"
+            "午前10時開議\n"
+            "○議長（山田太郎君） ただいまから会議を開きます。\n"
+        )
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DetectBoundary"
+        ) as mock_baml:
+            result = await divider.detect_attendee_boundary(text)
+
+            mock_baml.assert_not_called()
+            assert result.detection_method == "rule_based"
+            assert result.boundary_type == "time_marker"
+
+            attendee_part, speech_part = divider.split_minutes_by_boundary(text, result)
+            assert attendee_part.endswith("2番 田中一郎君")
+            assert speech_part.startswith("午前10時開議")
+
     @pytest.mark.asyncio
     async def test_detect_attendee_boundary_error_handling(self, divider):
         """Test error handling in boundary detection"""
@@ -463,6 +521,147 @@ class TestBAMLMinutesDivider:
                 )
                 assert result.speaker_and_speech_content_list[1].speaker == "田中議員"
 
+    @pytest.mark.asyncio
+    async def test_speech_divide_run_uses_rule_based_split(self, divider):
+        """Test that well-formed sections are divided without calling the LLM"""
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideSpeech"
+        ) as mock_speech:
+            section = SectionString(
+                chapter_number=1,
+                sub_chapter_number=1,
+                section_string=(
+                    "○議長(山田太郎君)会議を開きます。◆3番(田中一郎議員)質問があります。"
+                ),
+            )
+            result = await divider.speech_divide_run(section)
+
+            mock_speech.assert_not_called()
+            assert result.divide_method == "rule_based"
+            assert [s.speaker for s in result.speaker_and_speech_content_list] == [
+                "議長(山田太郎君)",
+                "3番(田中一郎議員)",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_speech_divide_run_falls_back_to_llm(self, divider):
+        """Test that sections failing structural validation are sent to the LLM"""
+
+        class MockSpeech:
+            speaker = "山田議長"
+            speech_content = "会議を開きます"
+            chapter_number = 1
+            sub_chapter_number = 1
+            speech_order = 1
+
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideSpeech"
+        ) as mock_speech:
+            mock_speech.return_value = [MockSpeech()]
+            section = SectionString(
+                chapter_number=1,
+                sub_chapter_number=1,
+                section_string="○山田議長 会議を開きます。",
+            )
+            result = await divider.speech_divide_run(section)
+
+            mock_speech.assert_called_once()
+            assert result.divide_method == "llm"
+            assert result.speaker_and_speech_content_list[0].speaker == "山田議長"
+
+    @pytest.mark.asyncio
+    async def test_speech_divide_run_llm_uses_section_numbers(self, divider):
+        """Test that LLM results get the chapter numbers of the planned section"""
+
+        class MockSpeech:
+            speaker = "山田議長"
+            speech_content = "会議を開きます"
+            chapter_number = 1
+            sub_chapter_number = 1
+            speech_order = 1
+
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideSpeech"
+        ) as mock_speech:
+            mock_speech.return_value = [MockSpeech()]
+            section = SectionString(
+                chapter_number=4,
+                sub_chapter_number=2,
+                section_string="○山田議長 会議を開きます。",
+            )
+            result = await divider.speech_divide_run(section)
+
+            speech = result.speaker_and_speech_content_list[0]
+            assert (speech.chapter_number, speech.sub_chapter_number) == (4, 2)
+
+    @pytest.mark.asyncio
+    async def test_speech_divide_run_packed_chunk_keeps_section_numbers(self, divider):
+        """Test that speeches of a packed chunk get their own section numbers"""
+        from src.minutes_divide_processor.models import PackedSection
+
+        class MockSpeech:
+            def __init__(self, speaker, speech_content, speech_order):
+                self.speaker = speaker
+                self.speech_content = speech_content
+                self.speech_order = speech_order
+
+        context = "○田中議員 前回の質問です。"
+        first = "○山田議長 会議を開きます。議事に入ります。"
+        second = "○田中議員 質問します。よろしくお願いします。"
+        section = SectionString(
+            chapter_number=1,
+            sub_chapter_number=1,
+            section_string=context + first + second,
+            packed_sections=[
+                PackedSection(
+                    chapter_number=1, sub_chapter_number=1, start=len(context)
+                ),
+                PackedSection(
+                    chapter_number=2,
+                    sub_chapter_number=1,
+                    start=len(context) + len(first),
+                ),
+            ],
+            context_length=len(context),
+        )
+
+        with patch(
+            "src.infrastructure.external.minutes_divider.baml_minutes_divider.b.DivideSpeech"
+        ) as mock_speech:
+            mock_speech.return_value = [
+                MockSpeech("田中議員", "前回の質問です。", 1),
+                MockSpeech("山田議長", "会議を開きます。議事に入ります。", 2),
+                MockSpeech("田中議員", "質問します。よろしくお願いします。", 3),
+            ]
+            result = await divider.speech_divide_run(section)
+
+        # 文脈として重ねた発言は直前のチャンクで出力済みのため含まれない
+        assert [
+            (s.speaker, s.chapter_number, s.sub_chapter_number, s.speech_order)
+            for s in result.speaker_and_speech_content_list
+        ] == [("山田議長", 1, 1, 1), ("田中議員", 2, 1, 1)]
+
+    @pytest.mark.asyncio
+    async def test_speech_divide_run_reuses_rule_based_split_from_plan(self, divider):
+        """Test that the rule-based split done in plan_chunks is not repeated"""
+        from src.minutes_divide_processor.models import SectionStringList
+
+        section = SectionString(
+            chapter_number=1,
+            sub_chapter_number=1,
+            section_string="○議長(山田太郎君)会議を開きます。",
+        )
+        with patch.object(
+            divider.speech_splitter, "split", wraps=divider.speech_splitter.split
+        ) as mock_split:
+            planned = divider.plan_chunks(
+                SectionStringList(section_string_list=[section])
+            )
+            result = await divider.speech_divide_run(planned.section_string_list[0])
+
+        assert result.divide_method == "rule_based"
+        assert mock_split.call_count == 1
+
     @pytest.mark.asyncio
     async def test_speech_divide_run_empty_section(self, divider):
         """Test speech division with empty section"""
@@ -570,24 +769,109 @@ class TestBAMLMinutesDivider:
         assert len(result.section_string_list) == 2
         assert result.section_string_list[0].chapter_number == 1
 
+    def test_do_divide_skips_missing_keywords_and_keeps_original_offsets(self, divider):
+        """Test that missing keywords are skipped and slices follow the original text
+
+        正規化で文字数が変わる文字（㈱）があっても、元のテキストの位置で分割する
+        """
+        from src.minutes_divide_processor.models import SectionInfo, SectionInfoList
+
+        processed_minutes = (
+            "○議長（山田太郎君）㈱山田の件を議題とします。"
+            "◆1番（田中花子議員）質問します。"
+            "◎市長（佐藤一郎君）お答えします。"
+        )
+        section_info_list = SectionInfoList(
+            section_info_list=[
+                SectionInfo(chapter_number=1, keyword="○議長(山田太郎君)"),
+                SectionInfo(chapter_number=2, keyword="◆存在しない発言者"),
+                SectionInfo(chapter_number=3, keyword="◆1番(田中花子議員)"),
+                SectionInfo(chapter_number=4, keyword="◎市長(佐藤一郎君)"),
+            ]
+        )
+
+        result = divider.do_divide(processed_minutes, section_info_list)
+
+        assert [
+            (s.chapter_number, s.section_string) for s in result.section_string_list
+        ] == [
+            (1, "○議長（山田太郎君）㈱山田の件を議題とします。"),
+            (3, "◆1番（田中花子議員）質問します。"),
+            (4, "◎市長（佐藤一郎君）お答えします。"),
+        ]
+
     def test_check_length(self, divider):
         """Test length checking of sections"""
         from src.minutes_divide_processor.models import SectionStringList
 
-        # Create a section with long text (>6000 bytes)
-        long_text = "あ" * 3000  # 日本語文字は複数バイト
+        # Create a section longer than the DivideSpeech token budget
+        max_tokens = divider.chunk_planner.speech_chunk_tokens
+        long_text = "あ" * (max_tokens * 2 + 1)  # 日本語は1文字1トークンと見積もる
         section_list = SectionStringList(
             section_string_list=[
                 SectionString(
-                    chapter_number=1, sub_chapter_number=1, section_string=long_text
-                )
+                    chapter_number=1, sub_chapter_number=1, section_string="あ" * 100
+                ),
+                SectionString(
+                    chapter_number=2, sub_chapter_number=1, section_string=long_text
+                ),
             ]
         )
 
         result = divider.check_length(section_list)
 
-        # Assert - should detect long section
-        assert len(result.redivide_section_string_list) > 0
+        # Assert - should detect only the long section with the needed split count
+        assert len(result.redivide_section_string_list) == 1
+        assert result.redivide_section_string_list[0].original_index == 1
+        assert result.redivide_section_string_list[0].divide_count == 3
+
+    def test_plan_chunks_splits_long_and_packs_small_llm_sections(self, divider):
+        """Test that plan_chunks splits long sections and packs small LLM sections"""
+        from src.minutes_divide_processor.models import SectionStringList
+
+        max_tokens = divider.chunk_planner.speech_chunk_tokens
+        utterance = "○議長(山田太郎君)" + "あ" * (max_tokens // 3)
+        section_list = SectionStringList(
+            section_string_list=[
+                # ルールベースで分割できないため、LLMで処理される小さなセクション
+                SectionString(
+                    chapter_number=1,
+                    sub_chapter_number=1,
+                    section_string="○山田議長 会議を開きます。議事に入ります。",
+                ),
+                SectionString(
+                    chapter_number=2,
+                    sub_chapter_number=1,
+                    section_string="○田中議員 質問します。よろしくお願いします。",
+                ),
+                # ルールベースで分割できるセクションはまとめない
+                SectionString(
+                    chapter_number=3,
+                    sub_chapter_number=1,
+                    section_string="○議長(山田太郎君)休憩します。",
+                ),
+                SectionString(
+                    chapter_number=4,
+                    sub_chapter_number=1,
+                    section_string=utterance * 3,
+                ),
+            ]
+        )
+
+        result = divider.plan_chunks(section_list)
+
+        chunks = result.section_string_list
+        assert [(c.chapter_number, c.sub_chapter_number) for c in chunks] == [
+            (1, 1),
+            (3, 1),
+            (4, 1),
+            (4, 2),
+        ]
+        assert chunks[0].section_string == (
+            "○山田議長 会議を開きます。議事に入ります。"
+            "○田中議員 質問します。よろしくお願いします。"
+        )
+        assert chunks[2].section_string + chunks[3].section_string == utterance * 3
 
     # ========================================
     # Issue #953: 区切り線を無視するテスト
@@ -0,0 +1,163 @@
+"""Tests for ChunkPlanner"""
+
+from src.infrastructure.external.minutes_divider.chunk_planner import (
+    ChunkPlanner,
+    ChunkPlannerConfig,
+)
+from src.minutes_divide_processor.models import SectionString
+
+
+def _section(chapter_number: int, text: str) -> SectionString:
+    return SectionString(
+        chapter_number=chapter_number, sub_chapter_number=1, section_string=text
+    )
+
+
+class TestChunkPlanner:
+    """Test cases for ChunkPlanner"""
+
+    def test_speech_chunk_tokens_is_derived_from_output_limit(self):
+        """DivideSpeechの入力上限は出力上限・出力比率・安全率から決まる"""
+        planner = ChunkPlanner(
+            ChunkPlannerConfig(
+                max_output_tokens=1000, speech_output_ratio=2.0, safety_ratio=0.5
+            )
+        )
+
+        assert planner.speech_chunk_tokens == 250
+
+    def test_split_text_within_budget_returns_whole_text(self):
+        """上限内のテキストは分割しない"""
+        text = "○議長(山田太郎君)開会します。"
+
+        assert ChunkPlanner().split_text(text, 1000) == [text]
+
+    def test_split_text_splits_on_speaker_markers_into_balanced_chunks(self):
+        """必要な数だけ、発言者記号の位置でほぼ均等に分割する"""
+        utterances = [f"○議員(議員{i}君){'あ' * 40}" for i in range(6)]
+        text = "".join(utterances)
+
+        chunks = ChunkPlanner().split_text(text, 120)
+
+        assert len(chunks) == 3
+        assert "".join(chunks) == text
+        assert all(chunk.startswith("○") for chunk in chunks)
+        assert [chunk.count("○") for chunk in chunks] == [2, 2, 2]
+
+    def test_split_text_keeps_speaker_header_on_long_utterance(self):
+        """上限を超える1つの発言は文末で分割し、続きに発言者表記を付ける"""
+        header = "◎市長(佐藤一郎君)"
+        sentences = ["い" * 30 + "。" for _ in range(4)]
+        text = header + "".join(sentences)
+
+        chunks = ChunkPlanner().split_text(text, 80)
+
+        assert len(chunks) == 2
+        assert all(chunk.startswith(header) for chunk in chunks)
+        assert "".join(chunk[len(header) :] for chunk in chunks) == "".join(sentences)
+
+    def test_split_text_overlaps_hard_cut_without_sentence_end(self):
+        """文末がない場合は前後を重ねて強制的に分割する"""
+        planner = ChunkPlanner(ChunkPlannerConfig(overlap_chars=5))
+        text = "う" * 100
+
+        chunks = planner.split_text(text, 40)
+
+        assert all(len(chunk) <= 40 for chunk in chunks)
+        assert chunks[1].startswith(chunks[0][-5:])
+        assert chunks[-1].endswith("う")
+
+    def test_plan_sections_splits_oversized_section(self):
+        """上限を超えるセクションを分割し、sub_chapter_numberを振り直す"""
+        planner = ChunkPlanner(
+            ChunkPlannerConfig(
+                max_output_tokens=100, speech_output_ratio=1.0, safety_ratio=1.0
+            )
+        )
+        text = "".join(f"○議員(議員{i}君){'あ' * 40}" for i in range(4))
+
+        planned = planner.plan_sections([_section(3, text)])
+
+        assert [(s.chapter_number, s.sub_chapter_number) for s in planned] == [
+            (3, 1),
+            (3, 2),
+        ]
+        assert "".join(s.section_string for s in planned) == text
+
+    def test_plan_sections_packs_consecutive_small_llm_sections(self):
+        """LLMで処理する小さなセクションが連続する場合だけまとめる"""
+        planner = ChunkPlanner(
+            ChunkPlannerConfig(pack_threshold_tokens=50, pack_target_tokens=100)
+        )
+        sections = [
+            _section(1, "小" * 30),
+            _section(2, "小" * 30),
+            _section(3, "規" * 30),
+            _section(4, "小" * 30),
+            _section(5, "大" * 60),
+            _section(6, "小" * 30),
+        ]
+
+        planned = planner.plan_sections(
+            sections, needs_llm=lambda s: not s.section_string.startswith("規")
+        )
+
+        assert [s.chapter_number for s in planned] == [1, 3, 4, 5, 6]
+        assert planned[0].section_string == "小" * 60
+
+    def test_plan_sections_respects_pack_target(self):
+        """まとめたセクションの合計は文脈を含めても上限を超えない"""
+        planner = ChunkPlanner(
+            ChunkPlannerConfig(pack_threshold_tokens=50, pack_target_tokens=70)
+        )
+        sections = [_section(i, "小" * 30) for i in range(1, 6)]
+
+        planned = planner.plan_sections(sections)
+
+        assert all(planner.estimate(s.section_string) <= 70 for s in planned)
+        assert "".join(s.section_string[s.context_length :] for s in planned) == (
+            "小" * 150
+        )
+
+    def test_plan_sections_keeps_numbers_of_packed_sections(self):
+        """まとめたチャンクは元のセクションごとの番号と開始位置を持つ"""
+        planner = ChunkPlanner(
+            ChunkPlannerConfig(pack_threshold_tokens=50, pack_target_tokens=100)
+        )
+        sections = [
+            _section(1, "○議長（田中太郎）開会します。"),
+            SectionString(
+                chapter_number=2,
+                sub_chapter_number=3,
+                section_string="○市長（山田花子）答弁します。",
+            ),
+        ]
+
+        planned = planner.plan_sections(sections)
+
+        assert len(planned) == 1
+        assert planned[0].context_length == 0
+        assert [
+            (p.chapter_number, p.sub_chapter_number, p.start)
+            for p in planned[0].packed_sections
+        ] == [(1, 1, 0), (2, 3, 15)]
+
+    def test_plan_sections_overlaps_last_utterance_at_pack_limit(self):
+        """上限で区切った次のチャンクには直前の発言を文脈として付ける"""
+        planner = ChunkPlanner(
+            ChunkPlannerConfig(pack_threshold_tokens=60, pack_target_tokens=70)
+        )
+        sections = [
+            _section(1, "○議員（佐藤）" + "質" * 20 + "○市長（山田）" + "答" * 20),
+            _section(2, "○議員（佐藤）" + "再" * 20),
+        ]
+
+        planned = planner.plan_sections(sections)
+
+        assert len(planned) == 2
+        assert planned[0].packed_sections == []
+        context = "○市長（山田）" + "答" * 20
+        assert planned[1].section_string == context + sections[1].section_string
+        assert planned[1].context_length == len(context)
+        assert planned[1].packed_sections[0].chapter_number == 2
+        assert planned[1].packed_sections[0].start == len(context)
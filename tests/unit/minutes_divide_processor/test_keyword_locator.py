@@ -0,0 +1,86 @@
+"""Tests for KeywordLocator"""
+
+from src.infrastructure.external.minutes_divider.keyword_locator import (
+    KeywordLocator,
+    normalize_keyword_text,
+    normalize_with_offsets,
+)
+
+
+class TestNormalizeWithOffsets:
+    """Test cases for normalize_with_offsets"""
+
+    def test_same_result_as_normalize_keyword_text(self):
+        """文字ごとの正規化でも全体の正規化と同じ結果になる"""
+        text = "◯議長（山田太郎君）\t\t㈱ＡＢＣ　　ｶﾞｽ事業について●"
+
+        normalized = normalize_with_offsets(text)
+
+        assert normalized.text == normalize_keyword_text(text)
+        assert len(normalized.offsets) == len(normalized.text) + 1
+
+    def test_offsets_point_to_original_text(self):
+        """文字数が変わる正規化の後も元のテキストでの位置を求められる"""
+        text = "㈱山田  ○議長(田中君)"
+
+        normalized = normalize_with_offsets(text)
+        position = normalized.text.index("○")
+
+        assert text[normalized.original_index(position) :] == "○議長(田中君)"
+        assert normalized.original_index(len(normalized.text)) == len(text)
+
+
+class TestKeywordLocator:
+    """Test cases for KeywordLocator"""
+
+    def test_locates_all_keywords_in_one_pass(self):
+        """すべてのキーワードの出現位置を求め、start以降の最初の位置を返す"""
+        text = "○議長(山田君)開会。◆1番(田中君)質問。○議長(山田君)閉会。"
+        positions = KeywordLocator(["○議長(山田君)", "◆1番(田中君)"]).locate(text)
+
+        first = positions.find(0)
+        assert first is not None
+        assert first.start == 0
+        assert not first.partial
+
+        second = positions.find(0, 1)
+        assert second is not None
+        assert second.start == text.rindex("○議長")
+        assert positions.find(1, second.start) is None
+
+    def test_overlapping_keywords(self):
+        """他のキーワードの一部になっているキーワードも検出する"""
+        positions = KeywordLocator(["議長", "副議長", "長"]).locate("副議長")
+
+        assert [positions.find(i).start for i in range(3)] == [1, 0, 2]  # type: ignore[union-attr]
+
+    def test_partial_match_for_long_keyword(self):
+        """長いキーワード全体が見つからない場合は先頭部分の位置を返す"""
+        keyword = "○委員長(佐藤一郎君)ただいまから委員会を開きます"
+        text = "前置き○委員長(佐藤一郎君)ただいまより委員会を開会します"
+
+        match = KeywordLocator([keyword]).locate(text).find(0)
+
+        assert match is not None
+        assert match.partial
+        assert match.start == 3
+
+    def test_full_match_preferred_over_earlier_partial_match(self):
+        """先頭部分がより前に出現しても、キーワード全体の一致を優先する"""
+        keyword = "○委員長(佐藤一郎君)開会します"
+        text = "○委員長(佐藤一郎君)休憩します。" + keyword
+
+        match = KeywordLocator([keyword]).locate(text).find(0)
+
+        assert match is not None
+        assert not match.partial
+        assert match.start == text.index(keyword)
+
+    def test_keywords_are_normalized(self):
+        """キーワードとテキストを同じ規則で正規化して照合する"""
+        text = "○議長（山田太郎君）開会します。"
+
+        match = KeywordLocator(["●議長(山田太郎君)"]).locate(text).find(0)
+
+        assert match is not None
+        assert match.original_start == 0
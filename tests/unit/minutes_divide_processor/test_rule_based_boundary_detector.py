@@ -0,0 +1,96 @@
+"""Tests for RuleBasedBoundaryDetector"""
+
+from src.infrastructure.external.minutes_divider.rule_based_boundary_detector import (
+    RuleBasedBoundaryDetector,
+)
+
+
+ATTENDEES = (
+    "令和5年第1回定例会会議録（第1日）\n"
+    "○出席議員（3名）\n"
+    "1番 山田太郎君\n"
+    "2番 鈴木花子君\n"
+    "3番 佐藤一郎君\n"
+    "○説明のため出席した者\n"
+    "市長 田中次郎君\n"
+)
+
+SPEECHES = (
+    "○議長（山田太郎君） ただいまから本日の会議を開きます。\n"
+    "◆3番（佐藤一郎議員） 質問します。\n"
+)
+
+
+class TestRuleBasedBoundaryDetector:
+    """Test cases for RuleBasedBoundaryDetector"""
+
+    def test_detect_opening_time_marker(self):
+        """出席者の見出しの後の開議時刻を境界とする"""
+        text = ATTENDEES + "――――――――――\n" + "午前10時開議\n" + SPEECHES
+
+        result = RuleBasedBoundaryDetector().detect(text)
+
+        assert result.boundary_found is True
+        assert result.boundary_type == "time_marker"
+        assert result.confidence >= 0.9
+        assert result.detection_method == "rule_based"
+        assert text[result.boundary_position :].startswith("午前10時開議")
+        assert "｜境界｜午前10時開議" in result.boundary_text
+
+    def test_detect_separator_line(self):
+        """開議時刻がない場合は区切り線の直後を境界とする"""
+        text = ATTENDEES + "――――――――――\n" + SPEECHES
+
+        result = RuleBasedBoundaryDetector().detect(text)
+
+        assert result.boundary_type == "separator_line"
+        assert text[result.boundary_position :].startswith("○議長")
+
+    def test_detect_speech_start(self):
+        """見出しの記号（○出席議員（3名））は発言として扱わない"""
+        text = ATTENDEES + SPEECHES
+
+        result = RuleBasedBoundaryDetector().detect(text)
+
+        assert result.boundary_type == "speech_start"
+        assert result.confidence >= 0.8
+        assert text[result.boundary_position :].startswith("○議長")
+
+    def test_detect_without_attendee_section(self):
+        """出席者の見出しがなく冒頭から発言が始まる場合は境界なし"""
+        result = RuleBasedBoundaryDetector().detect("本会議\n" + SPEECHES)
+
+        assert result.boundary_found is False
+        assert result.confidence >= 0.8
+
+    def test_low_confidence_without_headers(self):
+        """見出しのない長い前置きがある場合は信頼度を下げる"""
+        text = "議事の経過について記録する。" * 20 + SPEECHES
+
+        result = RuleBasedBoundaryDetector().detect(text)
+
+        assert result.confidence < 0.8
+
+    def test_no_speech_markers(self):
+        """発言者の表記がない場合は信頼度0"""
+        result = RuleBasedBoundaryDetector().detect("議事録テキスト")
+
+        assert result.boundary_found is False
+        assert result.confidence == 0.0
+
+    def test_find_candidates(self):
+        """見出しの後の開議時刻・区切り線・最初の発言をすべて候補とする"""
+        text = ATTENDEES + "――――――――――\n" + "午前10時開議\n" + SPEECHES
+
+        candidates = RuleBasedBoundaryDetector().find_candidates(text)
+
+        assert [c.boundary_type for c in candidates] == [
+            "time_marker",
+            "separator_line",
+            "speech_start",
+        ]
+        assert candidates == sorted(candidates, key=lambda c: -c.confidence)
+        assert text[candidates[-1].boundary_position :].startswith("○議長")
+
+    def test_find_candidates_without_speech_markers(self):
+        assert RuleBasedBoundaryDetector().find_candidates("議事録テキスト") == []
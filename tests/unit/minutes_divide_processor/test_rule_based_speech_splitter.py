@@ -0,0 +1,87 @@
+"""Tests for RuleBasedSpeechSplitter"""
+
+from src.infrastructure.external.minutes_divider.rule_based_speech_splitter import (
+    RuleBasedSpeechSplitter,
+)
+from src.minutes_divide_processor.models import SectionString
+
+
+def _section(text: str) -> SectionString:
+    return SectionString(chapter_number=2, sub_chapter_number=3, section_string=text)
+
+
+class TestRuleBasedSpeechSplitter:
+    """Test cases for RuleBasedSpeechSplitter"""
+
+    def test_split_preprocessed_section(self):
+        """前処理済み（空白・改行なし）のセクションを分割できる"""
+        result = RuleBasedSpeechSplitter().split(
+            _section(
+                "○議長(山田太郎君)ただいまから会議を開きます。"
+                "◆3番(鈴木花子議員)質問します。(「異議なし」と呼ぶ者あり)"
+                "◎市長(佐藤一郎君)お答えします。"
+            )
+        )
+
+        assert result.confidence == 1.0
+        speeches = result.speeches
+        assert [s.speaker for s in speeches] == [
+            "議長(山田太郎君)",
+            "3番(鈴木花子議員)",
+            "市長(佐藤一郎君)",
+        ]
+        assert speeches[0].speech_content == "ただいまから会議を開きます。"
+        assert speeches[1].speech_content == "質問します。(「異議なし」と呼ぶ者あり)"
+        assert [s.speech_order for s in speeches] == [1, 2, 3]
+        assert all(s.chapter_number == 2 for s in speeches)
+        assert all(s.sub_chapter_number == 3 for s in speeches)
+
+    def test_split_raw_section_with_fullwidth_brackets(self):
+        """全角括弧や改行を含む未加工のセクションも分割できる"""
+        result = RuleBasedSpeechSplitter().split(
+            _section(
+                "○委員長（田中次郎君）　これより委員会を開きます。\n"
+                "本日の議題は…\n"
+                "○委員（高橋三郎君）　質疑を行います。"
+            )
+        )
+
+        assert result.confidence == 1.0
+        assert result.speeches[0].speaker == "委員長(田中次郎君)"
+        assert result.speeches[0].speech_content == (
+            "これより委員会を開きます。\n本日の議題は…"
+        )
+
+    def test_marker_without_identifiable_speaker_fails_validation(self):
+        """役職（名前）形式でない記号がある場合は信頼度0になる"""
+        result = RuleBasedSpeechSplitter().split(
+            _section("○議長(山田太郎君)○○地区の件について議題とします。")
+        )
+
+        assert result.confidence == 0.0
+        assert result.speeches == []
+
+    def test_section_without_markers_fails_validation(self):
+        """発言者記号がない場合は信頼度0になる"""
+        result = RuleBasedSpeechSplitter().split(
+            _section("山田議長 会議を開きます。田中議員 質問があります。")
+        )
+
+        assert result.confidence == 0.0
+
+    def test_empty_speech_fails_validation(self):
+        """発言内容が空の発言者がある場合は信頼度0になる"""
+        result = RuleBasedSpeechSplitter().split(
+            _section("○議長(山田太郎君)◆3番(鈴木花子議員)質問します。")
+        )
+
+        assert result.confidence == 0.0
+
+    def test_leading_text_lowers_confidence(self):
+        """発言者のいない先頭テキストの割合だけ信頼度が下がる"""
+        result = RuleBasedSpeechSplitter().split(
+            _section("議事日程第1号について" + "○議長(山田太郎君)開会します。")
+        )
+
+        assert len(result.speeches) == 1
+        assert 0.0 < result.confidence < 0.9
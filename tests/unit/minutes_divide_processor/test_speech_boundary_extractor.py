@@ -0,0 +1,114 @@
+"""Tests for SpeechBoundaryExtractor"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.external.minutes_divider.speech_boundary_extractor import (
+    LLM_CONTEXT_LENGTH,
+    SpeechBoundaryExtractor,
+)
+from src.minutes_divide_processor.models import MinutesBoundary
+
+
+ATTENDEES = (
+    "令和5年第1回定例会会議録（第1日）\n"
+    "○出席議員（3名）\n"
+    "1番 山田太郎君\n"
+    "2番 鈴木花子君\n"
+    "○説明のため出席した者\n"
+    "市長 田中次郎君\n"
+)
+
+SPEECHES = (
+    "○議長（山田太郎君） ただいまから本日の会議を開きます。\n"
+    "◆3番（佐藤一郎議員） 質問します。\n"
+) * 20
+
+
+@pytest.fixture
+def minutes_divider():
+    divider = MagicMock()
+    divider.detect_attendee_boundary = AsyncMock()
+    return divider
+
+
+class TestSpeechBoundaryExtractor:
+    """Test cases for SpeechBoundaryExtractor"""
+
+    @pytest.mark.asyncio
+    async def test_confident_candidates_skip_llm(self, minutes_divider):
+        """信頼度の高い候補がある場合はLLMを呼び出さない"""
+        text = ATTENDEES + "――――――――――\n" + "午前10時開議\n" + SPEECHES
+
+        result = await SpeechBoundaryExtractor(minutes_divider).extract_boundaries(text)
+
+        assert result["error_message"] is None
+        assert [b["boundary_type"] for b in result["verified_boundaries"]] == [
+            "time_marker",
+            "separator_line",
+            "speech_start",
+        ]
+        best = result["verified_boundaries"][0]
+        assert text[best["position"] :].startswith("午前10時開議")
+        minutes_divider.detect_attendee_boundary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_minutes_without_attendee_section(self, minutes_divider):
+        """冒頭から発言が始まる場合は境界なしで確定し、LLMを呼び出さない"""
+        result = await SpeechBoundaryExtractor(minutes_divider).extract_boundaries(
+            "本会議\n" + SPEECHES
+        )
+
+        assert result["verified_boundaries"] == []
+        minutes_divider.detect_attendee_boundary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_minutes_call_llm_once_with_head(self, minutes_divider):
+        """曖昧な場合は冒頭部分だけでLLMを1回呼び出す"""
+        preamble = "議事の経過について記録する。" * 20
+        text = preamble + SPEECHES
+        minutes_divider.detect_attendee_boundary.return_value = MinutesBoundary(
+            boundary_found=True,
+            boundary_type="speech_start",
+            confidence=0.9,
+            boundary_position=len(preamble),
+        )
+
+        result = await SpeechBoundaryExtractor(minutes_divider).extract_boundaries(text)
+
+        minutes_divider.detect_attendee_boundary.assert_awaited_once()
+        [llm_text] = minutes_divider.detect_attendee_boundary.await_args.args
+        assert llm_text == text[: len(preamble) + LLM_CONTEXT_LENGTH]
+        # ルールベースの候補（信頼度0.4）は採用しない
+        assert result["verified_boundaries"] == [
+            {
+                "position": len(preamble),
+                "boundary_type": "speech_start",
+                "confidence": 0.9,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_llm_boundary_without_position_is_ignored(self, minutes_divider):
+        minutes_divider.detect_attendee_boundary.return_value = MinutesBoundary(
+            boundary_found=True, boundary_type="separator_line", confidence=0.9
+        )
+
+        result = await SpeechBoundaryExtractor(minutes_divider).extract_boundaries(
+            "議事録テキスト"
+        )
+
+        assert result["verified_boundaries"] == []
+        assert result["error_message"] is None
+
+    @pytest.mark.asyncio
+    async def test_error_is_reported(self, minutes_divider):
+        minutes_divider.detect_attendee_boundary.side_effect = Exception("API error")
+
+        result = await SpeechBoundaryExtractor(minutes_divider).extract_boundaries(
+            "議事録テキスト"
+        )
+
+        assert result["verified_boundaries"] == []
+        assert "API error" in result["error_message"]
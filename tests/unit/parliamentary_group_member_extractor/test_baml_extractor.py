@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.application.dtos.web_page_content_dto import WebPageContentDTO
+from src.infrastructure.external.html_compactor import HtmlCompactor
 from src.infrastructure.external.parliamentary_group_member_extractor.baml_extractor import (  # noqa: E501
     BAMLParliamentaryGroupMemberExtractor,
 )
@@ -117,39 +119,47 @@ class TestBAMLParliamentaryGroupMemberExtractor:
                 )  # Internal errors don't propagate to error field
 
     @pytest.mark.asyncio
-    async def test_extract_members_truncates_long_content(self, extractor, caplog):
-        """Test that long HTML/text content is truncated"""
-        # Create very long HTML content
-        long_html = "<html>" + ("x" * 15000) + "</html>"
+    async def test_extract_members_splits_long_content_into_chunks(self):
+        """Test that long member lists are split into chunks and merged"""
+        items = "".join(f"<li>議員{i:02d}</li>" for i in range(30))
+        long_html = f"<html><body><h3>市民クラブ</h3><ul>{items}</ul></body></html>"
+        extractor = BAMLParliamentaryGroupMemberExtractor(
+            HtmlCompactor(max_chunk_chars=60)
+        )
 
         class MockMember:
-            def __init__(self, name, role, party_name, district, additional_info):
+            def __init__(self, name):
                 self.name = name
-                self.role = role
-                self.party_name = party_name
-                self.district = district
-                self.additional_info = additional_info
+                self.role = None
+                self.party_name = None
+                self.district = None
+                self.additional_info = None
+
+        async def extract(html, text_content):
+            return [
+                MockMember(line[2:])
+                for line in text_content.splitlines()
+                if line.startswith("- ")
+            ]
 
         with patch.object(extractor, "_fetch_html", return_value=long_html):
             with patch(
                 "src.infrastructure.external.parliamentary_group_member_extractor.baml_extractor.b.ExtractParliamentaryGroupMembers",
                 create=True,
                 new_callable=AsyncMock,
+                side_effect=extract,
             ) as mock_baml:
-                mock_baml.return_value = [
-                    MockMember("山田太郎", "団長", None, None, None)
-                ]
-
-                # Execute
-                await extractor.extract_members(1, "https://example.com/members")
-
-                # Assert - should log warning about truncation
-                assert "HTML content too long" in caplog.text
-                assert "truncating to 10000 chars" in caplog.text
+                result = await extractor.extract_members(
+                    1, "https://example.com/members"
+                )
 
-                # Assert - BAML should be called with truncated HTML
-                call_args = mock_baml.call_args[0]
-                assert len(call_args[0]) <= 10000
+                assert mock_baml.await_count > 1
+                for call in mock_baml.await_args_list:
+                    assert len(call.args[1]) <= 60
+                    assert call.args[1].startswith("### 市民クラブ\n")
+                assert [m.name for m in result.extracted_members] == [
+                    f"議員{i:02d}" for i in range(30)
+                ]
 
     @pytest.mark.asyncio
     async def test_extract_members_with_optional_fields(self, extractor):
@@ -324,42 +334,48 @@ class TestBAMLParliamentaryGroupMemberExtractor:
 
             # Call the private method directly
             result = await extractor._extract_members_with_baml(
-                "テキストコンテンツ", "<html>HTMLコンテンツ</html>"
+                "<html>HTMLコンテンツ</html>"
             )
 
             # Should return empty list on error
             assert result == []
 
     @pytest.mark.asyncio
-    async def test_extract_members_truncates_text_content(self, extractor, caplog):
-        """Test that long text content is also truncated"""
-        # Create normal HTML but very long text
-        mock_html = "<html><body>議員一覧</body></html>"
-
-        class MockMember:
-            def __init__(self, name, role, party_name, district, additional_info):
-                self.name = name
-                self.role = role
-                self.party_name = party_name
-                self.district = district
-                self.additional_info = additional_info
-
-        # We need to test the internal method to check text truncation
-        long_text = "議員名簿\n" + (
-            "議員氏名\n" * 3000
-        )  # Make it longer than 5000 chars
+    async def test_extract_members_passes_compacted_text(self, extractor):
+        """Test that BAML receives the compacted text instead of raw HTML"""
+        mock_html = (
+            "<html><head><style>td { color: red; }</style></head><body>"
+            "<nav><a href='/'>トップ</a></nav>"
+            "<table class='members'><tr><th>役職</th><th>氏名</th></tr>"
+            "<tr><td style='width: 50%'>団長</td>"
+            "<td><a href='/1'>山田太郎</a></td></tr>"
+            "</table></body></html>"
+        )
 
         with patch(
             "src.infrastructure.external.parliamentary_group_member_extractor.baml_extractor.b.ExtractParliamentaryGroupMembers",
             create=True,
             new_callable=AsyncMock,
         ) as mock_baml:
-            mock_baml.return_value = [MockMember("山田太郎", "団長", None, None, None)]
+            mock_baml.return_value = []
+
+            await extractor.extract_members_from_html(mock_html, "市民クラブ")
+
+            mock_baml.assert_awaited_once_with("", "役職 | 氏名\n団長 | 山田太郎")
 
-            # Call internal method
-            await extractor._extract_members_with_baml(long_text, mock_html)
+    @pytest.mark.asyncio
+    async def test_fetch_html_uses_shared_fetcher(self):
+        """Test that an injected fetcher is reused instead of launching a browser"""
+        page = WebPageContentDTO(url="https://example.com", html_content="<html/>")
+        fetcher = AsyncMock()
+        fetcher.fetch_single_page.return_value = page
+        extractor = BAMLParliamentaryGroupMemberExtractor(page_fetcher=fetcher)
+
+        with patch(
+            "src.infrastructure.external.parliamentary_group_member_extractor.baml_extractor.StaticFirstPageFetcher"
+        ) as mock_fetcher_class:
+            html = await extractor._fetch_html("https://example.com")
 
-            # Check that text was truncated
-            call_args = mock_baml.call_args[0]
-            # Second argument is text_content
-            assert len(call_args[1]) <= 5000
+        assert html == "<html/>"
+        fetcher.fetch_single_page.assert_awaited_once_with("https://example.com")
+        mock_fetcher_class.assert_not_called()
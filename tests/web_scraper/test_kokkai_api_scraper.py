@@ -0,0 +1,119 @@
+"""Tests for KokkaiApiScraper
+
+Converts recorded speech API responses into MinutesData without making
+real HTTP requests.
+"""
+
+import json
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.external.kokkai_speech_client import KokkaiSpeechClient
+from src.web_scraper.exceptions import ScraperParseError
+from src.web_scraper.kokkai_api_scraper import KokkaiApiScraper
+from src.web_scraper.kokkai_scraper import KokkaiScraper
+from src.web_scraper.scraper_service import ScraperService
+
+
+ISSUE_ID = "121705261X00320250204"
+MINUTES_URL = f"https://kokkai.ndl.go.jp/txt/{ISSUE_ID}/0"
+FIXTURE_PATH = (
+    Path(__file__).parents[1] / "fixtures" / "kokkai_api" / f"speech_{ISSUE_ID}.json"
+)
+
+
+@pytest.fixture
+def meeting():
+    records = json.loads(FIXTURE_PATH.read_text(encoding="utf-8"))["speechRecord"]
+    return KokkaiSpeechClient(state_dir=None)._build_meeting(ISSUE_ID, records)
+
+
+@pytest.fixture
+def scraper(meeting):
+    client = AsyncMock()
+    client.fetch_meeting.return_value = meeting
+    return KokkaiApiScraper(client=client)
+
+
+class TestKokkaiApiScraper:
+    """Test conversion of speech records into MinutesData"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_minutes(self, scraper):
+        minutes = await scraper.fetch_minutes(MINUTES_URL)
+
+        scraper.client.fetch_meeting.assert_awaited_once_with(ISSUE_ID)
+        assert minutes is not None
+        assert minutes.title == "第217回国会　衆議院　予算委員会　第3号"
+        assert minutes.date == datetime(2025, 2, 4)
+        assert minutes.council_id == "kokkai_121705261"
+        assert minutes.schedule_id == "X00320250204"
+        assert minutes.metadata["委員会"] == "予算委員会"
+        assert minutes.text_view_url == f"https://kokkai.ndl.go.jp/txt/{ISSUE_ID}"
+
+    @pytest.mark.asyncio
+    async def test_speakers_keep_order_and_boundaries(self, scraper):
+        minutes = await scraper.fetch_minutes(MINUTES_URL)
+
+        assert [(s.speech_order, s.name, s.role) for s in minutes.speakers] == [
+            (1, "安住淳", "予算委員長"),
+            (2, "井上信治", None),
+            (3, "石破茂", "内閣総理大臣"),
+            (4, "安住淳", "予算委員長"),
+        ]
+        assert minutes.speakers[2].content.startswith("お答えいたします。")
+        # The body keeps the minutes header for text-based processing
+        assert minutes.content.startswith("令和七年二月四日")
+        assert "○石破内閣総理大臣　お答えいたします。" in minutes.content
+
+    @pytest.mark.asyncio
+    async def test_fetch_minutes_without_issue_id(self, scraper):
+        with pytest.raises(ScraperParseError, match="No minutes ID"):
+            await scraper.fetch_minutes("https://kokkai.ndl.go.jp/#/result")
+
+    @pytest.mark.asyncio
+    async def test_fetch_minutes_api_error(self, scraper):
+        scraper.client.fetch_meeting.side_effect = ValueError("No speech records")
+
+        with pytest.raises(ScraperParseError, match="Failed to fetch minutes"):
+            await scraper.fetch_minutes(MINUTES_URL)
+
+    def test_speakers_round_trip(self, scraper, meeting):
+        minutes = scraper.to_minutes_data(meeting, MINUTES_URL)
+
+        restored = type(minutes).from_dict(minutes.to_dict())
+
+        assert restored.speakers == minutes.speakers
+
+
+class TestScraperSelection:
+    """Test which scraper ScraperService uses for Diet minutes"""
+
+    def test_api_scraper_for_minutes_id(self, tmp_path):
+        service = ScraperService(cache_dir=str(tmp_path), enable_gcs=False)
+
+        scraper = service._get_scraper_for_url(MINUTES_URL)
+
+        assert isinstance(scraper, KokkaiApiScraper)
+        assert scraper.client is service.kokkai_client
+
+    def test_browser_scraper_without_minutes_id(self, tmp_path):
+        service = ScraperService(cache_dir=str(tmp_path), enable_gcs=False)
+
+        scraper = service._get_scraper_for_url("https://kokkai.ndl.go.jp/#/detail")
+
+        assert isinstance(scraper, KokkaiScraper)
+
+    def test_text_export_does_not_repeat_speeches(self, tmp_path, meeting):
+        service = ScraperService(cache_dir=str(tmp_path), enable_gcs=False)
+        minutes = KokkaiApiScraper(client=AsyncMock()).to_minutes_data(
+            meeting, MINUTES_URL
+        )
+
+        text = service._format_minutes_as_text(minutes)
+
+        assert text.count("お答えいたします。") == 1